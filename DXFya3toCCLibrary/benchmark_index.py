@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark the enhanced indexer against a synthetic Creative Cloud Libraries folder.
+Generates fake library manifests in a temporary folder, then times full rebuilds (serial
+and with parallel manifest parsing), a no-change update and an update after one library changed.
+"""
+
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import build_library_index_enhanced as indexer
+
+def make_libraries(base_path, element_count, library_count, seed=1):
+    """Write library_count manifests holding element_count elements in total."""
+    rnd = random.Random(seed)
+    per_library = max(1, element_count // library_count)
+    for li in range(library_count):
+        sub_path = "creative_cloud/dcx" if li % 2 == 0 else "collaborated/dcx"
+        library_dir = base_path / sub_path / f"library-{li:04d}"
+        (library_dir / "components").mkdir(parents=True, exist_ok=True)
+        elements = []
+        for ei in range(per_library):
+            element_id = f"element-{li}-{ei}"
+            stamp = 1700000000000 + rnd.randrange(10 ** 10)
+            user = {'userId': f"USER{rnd.randrange(12)}@AdobeID", 'device': 'Mac',
+                    'deviceId': f"device-{rnd.randrange(4)}", 'app': 'Illustrator'}
+            elements.append({
+                'id': element_id,
+                'name': f"RT{rnd.randrange(1, 10 ** 6):06d}_cut",
+                'type': 'application/vnd.adobe.element.image+dcx',
+                'path': f"/{element_id}",
+                'library#created': stamp,
+                'library#modified': stamp + rnd.randrange(10 ** 8),
+                'library#createdData': user,
+                'library#modifiedData': user,
+                'components': [{
+                    'rel': 'primary',
+                    'id': f"component-{li}-{ei}",
+                    'path': f"component-{li}-{ei}.ai",
+                    'type': 'application/illustrator',
+                    'length': rnd.randrange(10 ** 4, 10 ** 7),
+                    'library#sha256': f"{rnd.getrandbits(256):064x}",
+                    'md5': f"{rnd.getrandbits(128):032x}",
+                    'etag': f"{rnd.getrandbits(64):016x}",
+                    'version': str(rnd.randrange(1, 9)),
+                    'state': 'unmodified',
+                    'library#isFullSize': True
+                }],
+                # About 3.6 history entries per element, as in the production libraries
+                'library#history': [{
+                    'modified': stamp + k,
+                    'modifiedBy': user['userId'],
+                    'thumbnailComponentId': f"thumb-{k}",
+                    'reference': {'repo:assetId': f"asset-{li}-{ei}", 'repo:version': str(k)}
+                } for k in range(rnd.randint(1, 6))]
+            })
+        manifest = {
+            'id': f"library-id-{li}",
+            'name': f"Synthetic Library {li}",
+            'library#created': 1700000000000,
+            'library#modified': 1700000000000,
+            'children': [{'name': 'elements', 'children': elements}]
+        }
+        with open(library_dir / "manifest", 'w') as f:
+            json.dump(manifest, f)
+
+def timed(label, func):
+    """Run func with its output captured and print the elapsed time."""
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<28} {elapsed:8.3f}s")
+    return elapsed
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
+        print("Usage:")
+        print("  python3 benchmark_index.py [<elements>] [<libraries>]")
+        print()
+        print("Defaults: 100000 elements across 40 libraries.")
+        return
+
+    element_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    library_count = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+
+    work_dir = Path(tempfile.mkdtemp(prefix="cclib-bench-"))
+    try:
+        base_path = work_dir / "LIBS"
+        db_path = work_dir / "bench.db"
+        print(f"📦 Generating {element_count} elements in {library_count} libraries...")
+        make_libraries(base_path, element_count, library_count)
+
+        workers = os.cpu_count() or 1
+        print("⏱️  Enhanced indexer:")
+        timed("full rebuild (1 worker)", lambda: indexer.build_index(True, base_path, db_path, workers=1))
+        full = timed(f"full rebuild ({workers} worker{'s' if workers != 1 else ''})",
+                     lambda: indexer.build_index(True, base_path, db_path, workers=workers))
+        timed("no-change update", lambda: indexer.build_index(False, base_path, db_path))
+
+        # Touch one library's contents so exactly one manifest is re-read
+        manifest = base_path / "creative_cloud/dcx/library-0000/manifest"
+        with open(manifest) as f:
+            data = json.load(f)
+        data['children'][0]['children'].pop()
+        with open(manifest, 'w') as f:
+            json.dump(data, f)
+        timed("one-library update", lambda: indexer.build_index(False, base_path, db_path))
+
+        conn = sqlite3.connect(db_path)
+        elements = conn.execute('SELECT COUNT(*) FROM elements').fetchone()[0]
+        history = conn.execute('SELECT COUNT(*) FROM version_history').fetchone()[0]
+        conn.close()
+        print(f"📊 {elements} elements, {history} history rows, "
+              f"{elements / full:,.0f} elements/s on full rebuild")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
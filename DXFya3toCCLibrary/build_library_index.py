@@ -3,21 +3,31 @@
 Build an SQLite index of all Creative Cloud Libraries for fast lookups.
 """
 
-import json
 import os
 import sqlite3
+import sys
+import time
 from pathlib import Path
 from datetime import datetime
 
+from fts_sync import check_fts, create_fts, create_fts_triggers, drop_fts_triggers, optimize_fts, rebuild_fts
+from index_generation import publish_generation, publish_shadow, start_shadow, writer_lock
+from part_keys import add_part_key_column, normalize_part_key
+from manifest_state import (add_manifest_columns, library_dirs, manifest_stat, prune_elements,
+                            read_manifest, remove_library, stored_signatures)
+
 # Path to CC Libraries
 BASE_PATH = Path.home() / "Library/Application Support/Adobe/Creative Cloud Libraries/LIBS/6D27744844570B5D992016E5_AdobeID"
 
 # Database path
 DB_PATH = Path(__file__).parent / "cc_libraries.db"
 
-def create_database():
+# Searchable columns mirrored into elements_fts
+FTS_COLUMNS = ['element_id', 'element_name', 'file_name', 'library_name']
+
+def create_database(db_path=None):
     """Create the SQLite database schema."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(db_path or DB_PATH)
     cursor = conn.cursor()
     
     # Libraries table
@@ -29,9 +39,13 @@ def create_database():
             library_path TEXT NOT NULL,
             created_at INTEGER,
             modified_at INTEGER,
-            indexed_at INTEGER NOT NULL
+            indexed_at INTEGER NOT NULL,
+            manifest_mtime INTEGER,
+            manifest_size INTEGER,
+            manifest_sha256 TEXT
         )
     ''')
+    add_manifest_columns(cursor)
     
     # Elements table
     cursor.execute('''
@@ -47,27 +61,26 @@ def create_database():
             component_path TEXT,
             created_at INTEGER,
             modified_at INTEGER,
+            part_key TEXT,
             FOREIGN KEY (library_id) REFERENCES libraries (library_id)
         )
     ''')
     
+    add_part_key_column(cursor)
+    
     # Create indexes for fast searches
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_library_name ON libraries(library_name)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_element_name ON elements(element_name)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_file_name ON elements(file_name)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_library_elements ON elements(library_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_part_key ON elements(part_key, modified_at)')
     
-    # Full-text search virtual table
-    cursor.execute('''
-        CREATE VIRTUAL TABLE IF NOT EXISTS elements_fts USING fts5(
-            element_id UNINDEXED,
-            element_name,
-            file_name,
-            library_name
-        )
-    ''')
+    # Full-text search, kept current by triggers
+    needs_rebuild = create_fts(cursor, FTS_COLUMNS)
     
     conn.commit()
+    if needs_rebuild:
+        rebuild_fts(conn)
     return conn
 
 def get_component_path(library_path, components):
@@ -108,19 +121,12 @@ def get_component_path(library_path, components):
     
     return None
 
-def index_library(conn, library_path, library_type):
-    """Index a single library."""
-    manifest_file = library_path / "manifest"
-    
-    if not manifest_file.exists():
-        return 0
-    
-    try:
-        with open(manifest_file, 'r') as f:
-            data = json.load(f)
-    except json.JSONDecodeError:
-        return 0
+def index_library(conn, library_path, library_type, data, signature):
+    """Index a single library from its parsed manifest.
     
+    signature is the manifest's (mtime, size, sha256). Elements no longer in the
+    manifest are removed. Returns (library_name, element_count, removed_count).
+    """
     library_id = data.get('id')
     library_name = data.get('name', 'Untitled')
     created = data.get('library#created')
@@ -128,16 +134,23 @@ def index_library(conn, library_path, library_type):
     
     cursor = conn.cursor()
     
-    # Insert/update library
+    # Insert/update library (an upsert, so the FTS triggers see renames)
     cursor.execute('''
-        INSERT OR REPLACE INTO libraries 
-        (library_id, library_name, library_type, library_path, created_at, modified_at, indexed_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
+        INSERT INTO libraries 
+        (library_id, library_name, library_type, library_path, created_at, modified_at, indexed_at,
+         manifest_mtime, manifest_size, manifest_sha256)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(library_id) DO UPDATE SET
+        library_name = excluded.library_name, library_type = excluded.library_type,
+        library_path = excluded.library_path, created_at = excluded.created_at,
+        modified_at = excluded.modified_at, indexed_at = excluded.indexed_at,
+        manifest_mtime = excluded.manifest_mtime, manifest_size = excluded.manifest_size,
+        manifest_sha256 = excluded.manifest_sha256
     ''', (library_id, library_name, library_type, str(library_path), 
-          created, modified, int(datetime.now().timestamp() * 1000)))
+          created, modified, int(datetime.now().timestamp() * 1000)) + tuple(signature))
     
     # Process elements
-    element_count = 0
+    element_ids = set()
     children = data.get('children', [])
     
     for child in children:
@@ -169,104 +182,150 @@ def index_library(conn, library_path, library_type):
                 
                 # Insert/update element
                 cursor.execute('''
-                    INSERT OR REPLACE INTO elements
+                    INSERT INTO elements
                     (element_id, library_id, element_name, element_type, element_path,
-                     file_type, file_name, file_size, component_path, created_at, modified_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                     file_type, file_name, file_size, component_path, created_at, modified_at, part_key)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(element_id) DO UPDATE SET
+                    library_id = excluded.library_id, element_name = excluded.element_name,
+                    element_type = excluded.element_type, element_path = excluded.element_path,
+                    file_type = excluded.file_type, file_name = excluded.file_name,
+                    file_size = excluded.file_size, component_path = excluded.component_path,
+                    created_at = excluded.created_at, modified_at = excluded.modified_at,
+                    part_key = excluded.part_key
                 ''', (element_id, library_id, element_name, element_type, element_path,
-                      file_type, file_name, file_size, component_path, created, modified))
+                      file_type, file_name, file_size, component_path, created, modified,
+                      normalize_part_key(element_name)))
                 
-                element_count += 1
+                element_ids.add(element_id)
+    
+    # Elements deleted from the library since the last index
+    removed = prune_elements(cursor, library_id, element_ids)
     
     conn.commit()
-    return element_count
+    return library_name, len(element_ids), removed
 
-def rebuild_fts(conn):
-    """Rebuild the full-text search table from elements."""
-    cursor = conn.cursor()
-    
-    # Clear the FTS table
-    cursor.execute('DELETE FROM elements_fts')
-    
-    # Repopulate from elements table
-    cursor.execute('''
-        INSERT INTO elements_fts (element_id, element_name, file_name, library_name)
-        SELECT e.element_id, e.element_name, e.file_name, l.library_name
-        FROM elements e
-        JOIN libraries l ON e.library_id = l.library_id
-    ''')
+def build_index(full=False):
+    """Update the index, re-reading only libraries whose manifest changed.
     
-    conn.commit()
+    With full=True (or an empty database) every library is re-read into a shadow
+    file that is swapped in atomically once complete. Waits for any other writer
+    (the index watcher, another `cclib update`) to finish first.
+    """
+    with writer_lock(DB_PATH):
+        update_index(full)
 
-def build_index():
-    """Build the complete index of all libraries."""
+def update_index(full=False):
+    """build_index() body; the caller holds the writer lock."""
+    started = time.monotonic()
     print("Building Creative Cloud Libraries index...")
     print(f"Database: {DB_PATH}")
     print()
     
     # Create database
     conn = create_database()
+    stored = stored_signatures(conn)
+    rebuild = full or not stored
+    if rebuild:
+        # Lookups keep using the live database until the shadow is swapped in
+        conn.close()
+        shadow = start_shadow(DB_PATH)
+        conn = create_database(shadow)
+        with conn:
+            drop_fts_triggers(conn.cursor())
+        stored = {}
     
-    total_libraries = 0
-    total_elements = 0
+    seen = set()
+    changed = 0
+    unchanged = 0
+    current_type = None
     
-    # Index private libraries
-    private_path = BASE_PATH / "creative_cloud/dcx"
-    if private_path.exists():
-        print("Indexing private libraries...")
-        for library_dir in private_path.iterdir():
-            if library_dir.is_dir():
-                count = index_library(conn, library_dir, 'private')
-                if count > 0:
-                    total_libraries += 1
-                    total_elements += count
-                    # Get library name
-                    manifest = library_dir / "manifest"
-                    if manifest.exists():
-                        try:
-                            with open(manifest, 'r') as f:
-                                data = json.load(f)
-                                lib_name = data.get('name', 'Unknown')
-                                print(f"  ✓ {lib_name}: {count} elements")
-                        except:
-                            print(f"  ✓ {library_dir.name}: {count} elements")
+    for library_dir, library_type in library_dirs(BASE_PATH):
+        if library_type != current_type:
+            current_type = library_type
+            print("Indexing private libraries..." if library_type == 'private' else "\nIndexing shared libraries...")
+        
+        manifest_file = library_dir / "manifest"
+        stat = manifest_stat(manifest_file)
+        if stat is None:
+            continue
+        path_key = str(library_dir)
+        seen.add(path_key)
+        known = stored.get(path_key)
+        
+        # Same mtime and size: the manifest has not been touched
+        if known and (known[1], known[2]) == stat:
+            unchanged += 1
+            continue
+        
+        data, sha256 = read_manifest(manifest_file)
+        if data is None:
+            continue
+        
+        # Touched but byte-identical: only remember the new mtime
+        if known and known[3] == sha256:
+            conn.execute('UPDATE libraries SET manifest_mtime = ? WHERE library_path = ?', (stat[0], path_key))
+            conn.commit()
+            unchanged += 1
+            continue
+        
+        if known and known[0] != data.get('id'):
+            remove_library(conn.cursor(), known[0])
+        lib_name, count, removed = index_library(conn, library_dir, library_type, data, stat + (sha256,))
+        changed += 1
+        if count > 0 or removed:
+            note = f", {removed} removed" if removed else ""
+            print(f"  ✓ {lib_name}: {count} elements{note}")
     
-    # Index shared/collaborated libraries
-    collab_path = BASE_PATH / "collaborated/dcx"
-    if collab_path.exists():
-        print("\nIndexing shared libraries...")
-        for library_dir in collab_path.iterdir():
-            if library_dir.is_dir():
-                count = index_library(conn, library_dir, 'shared')
-                if count > 0:
-                    total_libraries += 1
-                    total_elements += count
-                    # Get library name
-                    manifest = library_dir / "manifest"
-                    if manifest.exists():
-                        try:
-                            with open(manifest, 'r') as f:
-                                data = json.load(f)
-                                lib_name = data.get('name', 'Unknown')
-                                print(f"  ✓ {lib_name}: {count} elements")
-                        except:
-                            print(f"  ✓ {library_dir.name}: {count} elements")
+    # Libraries deleted or unsynced since the last index
+    for path_key, (library_id, *_) in stored.items():
+        if path_key not in seen:
+            remove_library(conn.cursor(), library_id)
+            changed += 1
+            print(f"  ✗ Removed library: {Path(path_key).name}")
+    conn.commit()
     
-    # Rebuild full-text search index (removes duplicates)
-    print("\n🔄 Rebuilding search index...")
-    rebuild_fts(conn)
-    print("✅ Search index rebuilt")
+    total_libraries = conn.execute('SELECT COUNT(*) FROM libraries').fetchone()[0]
+    total_elements = conn.execute('SELECT COUNT(*) FROM elements').fetchone()[0]
     
-    conn.close()
+    if rebuild:
+        with conn:
+            create_fts_triggers(conn.cursor(), FTS_COLUMNS)
+        print("\n🔄 Compacting and swapping in the new index...")
+        generation = publish_shadow(conn, shadow, DB_PATH, finish=rebuild_fts)
+        print(f"✅ Search index rebuilt (generation {generation})")
+    else:
+        conn.close()
+        if changed:
+            # The triggers have already applied each change to elements_fts
+            generation = publish_generation(DB_PATH, 'incremental')
+            print(f"\n✅ Search index updated by triggers (generation {generation})")
+        else:
+            print("✅ No library changes since the last index")
     
     print()
     print("=" * 60)
     print(f"✅ Index complete!")
     print(f"   Total libraries: {total_libraries}")
     print(f"   Total elements: {total_elements}")
+    print(f"   Changed libraries: {changed} ({unchanged} unchanged) in {time.monotonic() - started:.2f}s")
     print(f"   Database: {DB_PATH}")
     print("=" * 60)
 
-if __name__ == '__main__':
-    build_index()
+def maintain_fts(command):
+    """Run the 'optimize' or 'check' maintenance command on the search index."""
+    conn = create_database()
+    if command == 'optimize':
+        optimize_fts(conn)
+        print("✅ Search index optimized")
+        ok = True
+    else:
+        ok, message = check_fts(conn)
+        print(f"{'✅' if ok else '❌'} {message}")
+    conn.close()
+    return ok
 
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] in ('optimize', 'check'):
+        sys.exit(0 if maintain_fts(sys.argv[1]) else 1)
+    build_index(full='--full' in sys.argv)
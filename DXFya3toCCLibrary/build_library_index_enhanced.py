@@ -6,20 +6,107 @@ Build an enhanced SQLite index with full metadata from Creative Cloud Libraries.
 import json
 import os
 import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+from fts_sync import check_fts, create_fts, create_fts_triggers, drop_fts_triggers, optimize_fts, rebuild_fts
+from index_generation import (publish_generation, publish_geometry, publish_shadow, retire_plain_logs,
+                              start_shadow, writer_lock)
+from latest_by_name import (create_latest_by_name, create_latest_triggers, drop_latest_triggers,
+                            rebuild_latest_by_name)
+from part_geometry import copy_late_geometry, copy_part_geometry, create_part_geometry, open_retiring
+from part_keys import add_part_key_column, normalize_part_key
+from manifest_state import (add_manifest_columns, library_dirs, manifest_stat, prune_elements,
+                            read_manifest, remove_library, stored_signatures)
+
 # Path to CC Libraries
 BASE_PATH = Path.home() / "Library/Application Support/Adobe/Creative Cloud Libraries/LIBS/6D27744844570B5D992016E5_AdobeID"
 
 # Database path
 DB_PATH = Path(__file__).parent / "cc_libraries_enhanced.db"
 
-def create_database():
+# Secondary indexes; full rebuilds create them after the bulk load
+INDEXES = [
+    ('idx_library_name', 'libraries(library_name)'),
+    ('idx_element_name', 'elements(element_name)'),
+    ('idx_part_key', 'elements(part_key, modified_at)'),
+    ('idx_file_name', 'elements(file_name)'),
+    ('idx_library_elements', 'elements(library_id)'),
+    ('idx_created_by', 'elements(created_by_user)'),
+    ('idx_modified_by', 'elements(modified_by_user)'),
+    # Export modified_since filters
+    ('idx_modified_at', 'elements(modified_at)'),
+    # Exports page by the change sequence
+    ('idx_change_seq', 'elements(change_seq)'),
+    # Web searches walk elements newest first, a name at a time
+    ('idx_recent', 'elements(COALESCE(modified_at, 0) DESC, element_name DESC)'),
+    # Copies of the same component file are grouped by content hash (duplicates.py)
+    ('idx_component_sha256', 'elements(component_sha256)'),
+    ('idx_version_element', 'version_history(element_id)')
+]
+
+# Searchable columns mirrored into elements_fts
+FTS_COLUMNS = ['element_id', 'element_name', 'file_name', 'library_name', 'created_by_user', 'modified_by_user']
+
+# Columns of the trigram index behind substring search in library_search_server.py
+TRIGRAM_COLUMNS = ['element_name', 'file_name', 'library_name']
+
+ELEMENT_COLUMNS = [
+    'element_id', 'library_id', 'element_name', 'element_type', 'element_path',
+    'file_type', 'file_name', 'file_size', 'component_path',
+    'created_at', 'modified_at',
+    'created_by_user', 'created_by_device', 'created_by_device_id', 'created_by_app',
+    'modified_by_user', 'modified_by_device', 'modified_by_device_id', 'modified_by_app',
+    'component_id', 'component_sha256', 'component_md5', 'component_etag',
+    'component_version', 'component_state', 'component_is_full_size',
+    'version_count', 'asset_id', 'latest_version', 'groups', 'part_key'
+]
+
+# Upserts (not INSERT OR REPLACE) keep rowids stable and fire the FTS update triggers. Rows
+# that did not change are left alone; changed and new rows get a NULL change_seq, numbered by
+# stamp_changes() in the same transaction.
+ELEMENT_INSERT = f'''
+    INSERT INTO elements ({', '.join(ELEMENT_COLUMNS)})
+    VALUES ({', '.join('?' for _ in ELEMENT_COLUMNS)})
+    ON CONFLICT(element_id) DO UPDATE SET
+    {', '.join(f"{c} = excluded.{c}" for c in ELEMENT_COLUMNS[1:])}, change_seq = NULL
+    WHERE ({', '.join(f"elements.{c}" for c in ELEMENT_COLUMNS[1:])})
+          IS NOT ({', '.join(f"excluded.{c}" for c in ELEMENT_COLUMNS[1:])})
+'''
+
+LIBRARY_INSERT = '''
+    INSERT INTO libraries
+    (library_id, library_name, library_type, library_path, created_at, modified_at, indexed_at,
+     manifest_mtime, manifest_size, manifest_sha256)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(library_id) DO UPDATE SET
+    library_name = excluded.library_name, library_type = excluded.library_type,
+    library_path = excluded.library_path, created_at = excluded.created_at,
+    modified_at = excluded.modified_at, indexed_at = excluded.indexed_at,
+    manifest_mtime = excluded.manifest_mtime, manifest_size = excluded.manifest_size,
+    manifest_sha256 = excluded.manifest_sha256
+'''
+
+HISTORY_INSERT = '''
+    INSERT INTO version_history
+    (element_id, version_number, modified_at, modified_by,
+     thumbnail_component_id, asset_id, asset_version)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+def create_database(db_path=None):
     """Create the enhanced SQLite database schema."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(db_path or DB_PATH)
     cursor = conn.cursor()
     
+    # WAL keeps searches readable while the indexer writes
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    
     # Libraries table
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS libraries (
@@ -29,9 +116,13 @@ def create_database():
             library_path TEXT NOT NULL,
             created_at INTEGER,
             modified_at INTEGER,
-            indexed_at INTEGER NOT NULL
+            indexed_at INTEGER NOT NULL,
+            manifest_mtime INTEGER,
+            manifest_size INTEGER,
+            manifest_sha256 TEXT
         )
     ''')
+    add_manifest_columns(cursor)
     
     # Enhanced elements table with full metadata
     cursor.execute('''
@@ -81,10 +172,19 @@ def create_database():
             -- Groups/organization
             groups TEXT,
             
+            -- Normalized part number for matching file names (part_keys.py)
+            part_key TEXT,
+            
+            -- Position in the order the indexer wrote changes (the /api/export cursor)
+            change_seq INTEGER,
+            
             FOREIGN KEY (library_id) REFERENCES libraries (library_id)
         )
     ''')
     
+    add_part_key_column(cursor)
+    add_change_seq_column(cursor)
+    
     # Version history table
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS version_history (
@@ -100,30 +200,55 @@ def create_database():
         )
     ''')
     
+    # Converter-measured part sizes with their R-tree (part_geometry.py)
+    create_part_geometry(cursor)
+    
     # Create indexes
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_library_name ON libraries(library_name)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_element_name ON elements(element_name)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_file_name ON elements(file_name)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_library_elements ON elements(library_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_created_by ON elements(created_by_user)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_modified_by ON elements(modified_by_user)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_version_element ON version_history(element_id)')
-    
-    # Full-text search
-    cursor.execute('''
-        CREATE VIRTUAL TABLE IF NOT EXISTS elements_fts USING fts5(
-            element_id UNINDEXED,
-            element_name,
-            file_name,
-            library_name,
-            created_by_user,
-            modified_by_user
-        )
-    ''')
+    create_indexes(cursor)
+    
+    # Full-text search, kept current by triggers
+    needs_rebuild = create_fts(cursor, FTS_COLUMNS, TRIGRAM_COLUMNS)
+    
+    # Newest version per name for the web search, also kept current by triggers
+    needs_latest = create_latest_by_name(cursor)
     
     conn.commit()
+    if needs_rebuild:
+        rebuild_fts(conn)
+    if needs_latest:
+        rebuild_latest_by_name(conn)
     return conn
 
+def add_change_seq_column(cursor):
+    """Add and number elements.change_seq on a database indexed before it existed."""
+    existing = {row[1] for row in cursor.execute('PRAGMA table_info(elements)')}
+    if 'change_seq' not in existing:
+        cursor.execute('ALTER TABLE elements ADD COLUMN change_seq INTEGER')
+        stamp_changes(cursor)
+
+def stamp_changes(cursor, floor=0):
+    """Number the rows written since the last call (change_seq NULL) after every earlier change.
+
+    floor keeps the numbers of a rebuilt index above those of the index it replaces.
+    """
+    top = max(cursor.execute('SELECT MAX(change_seq) FROM elements').fetchone()[0] or 0, floor)
+    cursor.execute('''
+        UPDATE elements SET change_seq = ? + fresh.n
+        FROM (SELECT rowid AS id, ROW_NUMBER() OVER (ORDER BY rowid) AS n
+              FROM elements WHERE change_seq IS NULL) AS fresh
+        WHERE elements.rowid = fresh.id
+    ''', (top,))
+
+def create_indexes(cursor):
+    """Create the secondary indexes."""
+    for name, target in INDEXES:
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {target}')
+
+def drop_indexes(cursor):
+    """Drop the secondary indexes before a bulk load."""
+    for name, _ in INDEXES:
+        cursor.execute(f'DROP INDEX IF EXISTS {name}')
+
 def get_component_path(library_path, components):
     """Extract the actual file path from components."""
     if not components:
@@ -172,36 +297,23 @@ def get_component_path(library_path, components):
     
     return None, component_info
 
-def index_library(conn, library_path, library_type):
-    """Index a single library with enhanced metadata."""
-    manifest_file = library_path / "manifest"
-    
-    if not manifest_file.exists():
-        return 0
-    
-    try:
-        with open(manifest_file, 'r') as f:
-            data = json.load(f)
-    except json.JSONDecodeError:
-        return 0
+def library_rows(library_path, library_type, data, signature):
+    """Turn a parsed manifest into plain row tuples without touching the database.
     
+    signature is the manifest's (mtime, size, sha256).
+    Returns (library_row, element_rows, history_rows).
+    """
     library_id = data.get('id')
     library_name = data.get('name', 'Untitled')
     created = data.get('library#created')
     modified = data.get('library#modified')
     
-    cursor = conn.cursor()
-    
-    # Insert/update library
-    cursor.execute('''
-        INSERT OR REPLACE INTO libraries 
-        (library_id, library_name, library_type, library_path, created_at, modified_at, indexed_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (library_id, library_name, library_type, str(library_path), 
-          created, modified, int(datetime.now().timestamp() * 1000)))
+    library_row = (library_id, library_name, library_type, str(library_path),
+                   created, modified, int(datetime.now().timestamp() * 1000)) + tuple(signature)
     
     # Process elements
-    element_count = 0
+    element_rows = []
+    history_rows = []
     children = data.get('children', [])
     
     for child in children:
@@ -218,17 +330,9 @@ def index_library(conn, library_path, library_type):
                 
                 # Extract created by metadata
                 created_data = element.get('library#createdData', {})
-                created_by_user = created_data.get('userId')
-                created_by_device = created_data.get('device')
-                created_by_device_id = created_data.get('deviceId')
-                created_by_app = created_data.get('app')
                 
                 # Extract modified by metadata
                 modified_data = element.get('library#modifiedData', {})
-                modified_by_user = modified_data.get('userId')
-                modified_by_device = modified_data.get('device')
-                modified_by_device_id = modified_data.get('deviceId')
-                modified_by_app = modified_data.get('app')
                 
                 # Get component info
                 components = element.get('components', [])
@@ -250,7 +354,6 @@ def index_library(conn, library_path, library_type):
                 
                 # Version history
                 history = element.get('library#history', [])
-                version_count = len(history)
                 asset_id = None
                 latest_version = None
                 
@@ -263,129 +366,233 @@ def index_library(conn, library_path, library_type):
                 # Groups
                 groups = json.dumps(element.get('library#groups', {})) if element.get('library#groups') else None
                 
-                # Insert/update element with full metadata
-                cursor.execute('''
-                    INSERT OR REPLACE INTO elements
-                    (element_id, library_id, element_name, element_type, element_path,
-                     file_type, file_name, file_size, component_path,
-                     created_at, modified_at,
-                     created_by_user, created_by_device, created_by_device_id, created_by_app,
-                     modified_by_user, modified_by_device, modified_by_device_id, modified_by_app,
-                     component_id, component_sha256, component_md5, component_etag,
-                     component_version, component_state, component_is_full_size,
-                     version_count, asset_id, latest_version, groups)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (element_id, library_id, element_name, element_type, element_path,
-                      file_type, file_name, file_size, component_path,
-                      created_at, modified_at,
-                      created_by_user, created_by_device, created_by_device_id, created_by_app,
-                      modified_by_user, modified_by_device, modified_by_device_id, modified_by_app,
-                      component_info['id'] if component_info else None,
-                      component_info['sha256'] if component_info else None,
-                      component_info['md5'] if component_info else None,
-                      component_info['etag'] if component_info else None,
-                      component_info['version'] if component_info else None,
-                      component_info['state'] if component_info else None,
-                      component_info['is_full_size'] if component_info else 0,
-                      version_count, asset_id, latest_version, groups))
+                component_info = component_info or {}
+                element_rows.append((
+                    element_id, library_id, element_name, element_type, element_path,
+                    file_type, file_name, file_size, component_path,
+                    created_at, modified_at,
+                    created_data.get('userId'), created_data.get('device'),
+                    created_data.get('deviceId'), created_data.get('app'),
+                    modified_data.get('userId'), modified_data.get('device'),
+                    modified_data.get('deviceId'), modified_data.get('app'),
+                    component_info.get('id'), component_info.get('sha256'),
+                    component_info.get('md5'), component_info.get('etag'),
+                    component_info.get('version'), component_info.get('state'),
+                    component_info.get('is_full_size', 0),
+                    len(history), asset_id, latest_version, groups,
+                    normalize_part_key(element_name)))
                 
-                # Insert version history
-                cursor.execute('DELETE FROM version_history WHERE element_id = ?', (element_id,))
                 for idx, hist in enumerate(history):
                     ref = hist.get('reference', {})
-                    cursor.execute('''
-                        INSERT INTO version_history
-                        (element_id, version_number, modified_at, modified_by,
-                         thumbnail_component_id, asset_id, asset_version)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ''', (element_id, idx + 1, hist.get('modified'),
-                          hist.get('modifiedBy'), hist.get('thumbnailComponentId'),
-                          ref.get('repo:assetId'), ref.get('repo:version')))
-                
-                element_count += 1
+                    history_rows.append((element_id, idx + 1, hist.get('modified'),
+                                         hist.get('modifiedBy'), hist.get('thumbnailComponentId'),
+                                         ref.get('repo:assetId'), ref.get('repo:version')))
     
-    conn.commit()
-    return element_count
+    return library_row, element_rows, history_rows
 
-def rebuild_fts(conn):
-    """Rebuild the full-text search table."""
-    cursor = conn.cursor()
-    cursor.execute('DELETE FROM elements_fts')
-    cursor.execute('''
-        INSERT INTO elements_fts 
-        (element_id, element_name, file_name, library_name, created_by_user, modified_by_user)
-        SELECT e.element_id, e.element_name, e.file_name, l.library_name,
-               e.created_by_user, e.modified_by_user
-        FROM elements e
-        JOIN libraries l ON e.library_id = l.library_id
-    ''')
-    conn.commit()
+def write_library(conn, library_row, element_rows, history_rows, prune=True):
+    """Write one library's rows in a single transaction; returns the removed element count.
+    
+    With prune=False (full rebuilds into empty tables) existing rows are not consulted.
+    """
+    library_id = library_row[0]
+    removed = 0
+    with conn:
+        cursor = conn.cursor()
+        cursor.execute(LIBRARY_INSERT, library_row)
+        
+        if prune:
+            # Elements deleted from the library since the last index
+            keep_ids = {row[0] for row in element_rows}
+            removed = prune_elements(cursor, library_id, keep_ids, child_tables=('version_history',))
+            cursor.execute('''
+                DELETE FROM version_history
+                WHERE element_id IN (SELECT element_id FROM elements WHERE library_id = ?)
+            ''', (library_id,))
+        
+        cursor.executemany(ELEMENT_INSERT, element_rows)
+        cursor.executemany(HISTORY_INSERT, history_rows)
+        if prune:
+            # Full rebuilds number every row once, after the bulk load
+            stamp_changes(cursor)
+    return removed
+
+def index_library(conn, library_path, library_type, data, signature, prune=True):
+    """Index a single library with enhanced metadata from its parsed manifest.
+    
+    signature is the manifest's (mtime, size, sha256). Elements no longer in the
+    manifest are removed. Returns (library_name, element_count, removed_count).
+    """
+    library_row, element_rows, history_rows = library_rows(library_path, library_type, data, signature)
+    removed = write_library(conn, library_row, element_rows, history_rows, prune)
+    return library_row[1], len(element_rows), removed
+
+def parse_library(job):
+    """Worker: read one manifest once and turn it into row tuples.
+    
+    job is (library_dir, library_type, stat, stored_sha256). Returns
+    (library_dir, status, rows) where status is 'parsed', 'touched' (byte-identical
+    to the indexed manifest) or 'invalid'; rows is set only when parsed.
+    """
+    library_dir, library_type, stat, stored_sha256 = job
+    library_path = Path(library_dir)
+    try:
+        data, sha256 = read_manifest(library_path / "manifest")
+    except OSError:
+        return library_dir, 'invalid', None
+    if data is None:
+        return library_dir, 'invalid', None
+    if sha256 == stored_sha256:
+        return library_dir, 'touched', None
+    return library_dir, 'parsed', library_rows(library_path, library_type, data, tuple(stat) + (sha256,))
 
-def build_index():
-    """Build the enhanced index."""
+def parse_libraries(jobs, workers):
+    """Yield parse_library results, in completion order, from a process pool."""
+    if workers <= 1 or len(jobs) <= 1:
+        yield from map(parse_library, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        for future in as_completed([pool.submit(parse_library, job) for job in jobs]):
+            yield future.result()
+
+def build_index(full=False, base_path=None, db_path=None, workers=None):
+    """Update the enhanced index, re-reading only libraries whose manifest changed.
+    
+    Changed manifests are parsed by a pool of worker processes; this process is the
+    only writer. With full=True (or an empty database) the index is bulk-loaded into
+    a shadow file, with the secondary indexes built once at the end, and swapped in
+    atomically so searches never see a half-built index. Waits for any other writer
+    (the index watcher, another update) to finish first.
+    """
+    db_path = db_path or DB_PATH
+    with writer_lock(db_path):
+        update_index(full, base_path, db_path, workers)
+
+def update_index(full=False, base_path=None, db_path=None, workers=None):
+    """build_index() body; the caller holds the writer lock."""
+    base_path = Path(base_path) if base_path else BASE_PATH
+    db_path = db_path or DB_PATH
+    workers = workers or os.cpu_count() or 1
+    started = time.monotonic()
     print("Building Enhanced Creative Cloud Libraries Index")
     print("=" * 60)
-    print(f"Database: {DB_PATH}")
+    print(f"Database: {db_path}")
     print()
     
-    conn = create_database()
-    
-    total_libraries = 0
-    total_elements = 0
-    
-    # Index private libraries
-    private_path = BASE_PATH / "creative_cloud/dcx"
-    if private_path.exists():
-        print("Indexing private libraries...")
-        for library_dir in private_path.iterdir():
-            if library_dir.is_dir():
-                count = index_library(conn, library_dir, 'private')
-                if count > 0:
-                    total_libraries += 1
-                    total_elements += count
-                    manifest = library_dir / "manifest"
-                    if manifest.exists():
-                        try:
-                            with open(manifest, 'r') as f:
-                                data = json.load(f)
-                                lib_name = data.get('name', 'Unknown')
-                                print(f"  ✓ {lib_name}: {count} elements")
-                        except:
-                            print(f"  ✓ {library_dir.name}: {count} elements")
-    
-    # Index shared libraries
-    collab_path = BASE_PATH / "collaborated/dcx"
-    if collab_path.exists():
-        print("\nIndexing shared libraries...")
-        for library_dir in collab_path.iterdir():
-            if library_dir.is_dir():
-                count = index_library(conn, library_dir, 'shared')
-                if count > 0:
-                    total_libraries += 1
-                    total_elements += count
-                    manifest = library_dir / "manifest"
-                    if manifest.exists():
-                        try:
-                            with open(manifest, 'r') as f:
-                                data = json.load(f)
-                                lib_name = data.get('name', 'Unknown')
-                                print(f"  ✓ {lib_name}: {count} elements")
-                        except:
-                            print(f"  ✓ {library_dir.name}: {count} elements")
-    
-    # Rebuild FTS
-    print("\n🔄 Rebuilding search index...")
-    rebuild_fts(conn)
-    print("✅ Search index rebuilt")
+    conn = create_database(db_path)
+    stored = stored_signatures(conn)
+    rebuild = full or not stored
+    if rebuild:
+        # The live database stays readable until the shadow is swapped in; the rebuilt rows
+        # are numbered after its changes, so export cursors stay valid
+        floor = conn.execute('SELECT MAX(change_seq) FROM elements').fetchone()[0] or 0
+        conn.close()
+        shadow = start_shadow(db_path)
+        conn = create_database(shadow)
+        conn.execute('PRAGMA synchronous=OFF')
+        with conn:
+            cursor = conn.cursor()
+            drop_indexes(cursor)
+            drop_fts_triggers(cursor)
+            drop_latest_triggers(cursor)
+        stored = {}
     
-    conn.close()
+    seen = set()
+    jobs = []
+    changed = 0
+    unchanged = 0
+    
+    for library_dir, library_type in library_dirs(base_path):
+        stat = manifest_stat(library_dir / "manifest")
+        if stat is None:
+            continue
+        path_key = str(library_dir)
+        seen.add(path_key)
+        known = stored.get(path_key)
+        
+        # Same mtime and size: the manifest has not been touched
+        if known and (known[1], known[2]) == stat:
+            unchanged += 1
+            continue
+        jobs.append((path_key, library_type, stat, known[3] if known else None))
+    
+    if jobs:
+        pool_size = min(workers, len(jobs))
+        print(f"Indexing {len(jobs)} libraries ({pool_size} worker{'s' if pool_size != 1 else ''})...")
+    for path_key, status, rows in parse_libraries(jobs, workers):
+        known = stored.get(path_key)
+        
+        # Touched but byte-identical: only remember the new mtime
+        if status == 'touched':
+            mtime = manifest_stat(Path(path_key) / "manifest")[0]
+            conn.execute('UPDATE libraries SET manifest_mtime = ? WHERE library_path = ?', (mtime, path_key))
+            conn.commit()
+            unchanged += 1
+            continue
+        if status != 'parsed':
+            continue
+        
+        library_row, element_rows, history_rows = rows
+        if known and known[0] != library_row[0]:
+            remove_library(conn.cursor(), known[0], child_tables=('version_history',))
+        removed = write_library(conn, library_row, element_rows, history_rows, prune=not rebuild)
+        changed += 1
+        if element_rows or removed:
+            note = f", {removed} removed" if removed else ""
+            print(f"  ✓ {library_row[1]} ({library_row[2]}): {len(element_rows)} elements{note}")
+    
+    # Libraries deleted or unsynced since the last index
+    for path_key, (library_id, *_) in stored.items():
+        if path_key not in seen:
+            remove_library(conn.cursor(), library_id, child_tables=('version_history',))
+            changed += 1
+            print(f"  ✗ Removed library: {Path(path_key).name}")
+    conn.commit()
+    
+    total_libraries = conn.execute('SELECT COUNT(*) FROM libraries').fetchone()[0]
+    total_elements = conn.execute('SELECT COUNT(*) FROM elements').fetchone()[0]
+    
+    if rebuild:
+        print("\n🔄 Creating indexes...")
+        with conn:
+            create_indexes(conn.cursor())
+            # Before the FTS triggers: the search index is only filled when the shadow is published
+            stamp_changes(conn.cursor(), floor)
+            create_fts_triggers(conn.cursor(), FTS_COLUMNS, TRIGRAM_COLUMNS)
+            create_latest_triggers(conn.cursor())
+        rebuild_latest_by_name(conn)
+        copied_at = int(time.time() * 1000)
+        measured = copy_part_geometry(conn, db_path)
+        if measured:
+            print(f"📏 Carried over {measured} measured parts")
+        # Held through the swap: the first rebuild unlinks a plain live file
+        previous = open_retiring(db_path)
+        print("🔄 Compacting and swapping in the new index...")
+        generation = publish_shadow(conn, shadow, db_path, finish=rebuild_fts)
+        print(f"✅ Search index rebuilt (generation {generation})")
+        if previous is not None:
+            # Parts the converter recorded in the old file while the new one was finished
+            late = copy_late_geometry(previous, db_path, copied_at)
+            previous.close()
+            retire_plain_logs(db_path)
+            if late:
+                publish_geometry(db_path)
+                print(f"📏 Carried over {late} parts measured during the swap")
+    else:
+        conn.close()
+        if changed:
+            generation = publish_generation(db_path, 'incremental')
+            print(f"\n✅ Search index updated by triggers (generation {generation})")
+        else:
+            print("✅ No library changes since the last index")
     
     print()
     print("=" * 60)
     print(f"✅ Enhanced index complete!")
     print(f"   Total libraries: {total_libraries}")
     print(f"   Total elements: {total_elements}")
-    print(f"   Database: {DB_PATH}")
+    print(f"   Changed libraries: {changed} ({unchanged} unchanged) in {time.monotonic() - started:.2f}s")
+    print(f"   Database: {db_path}")
     print()
     print("📊 Enhanced metadata captured:")
     print("   • Created by (user, device, app)")
@@ -395,6 +602,23 @@ def build_index():
     print("   • Asset references (Creative Cloud)")
     print("=" * 60)
 
-if __name__ == '__main__':
-    build_index()
+def maintain_fts(command, db_path=None):
+    """Run the 'optimize' or 'check' maintenance command on the search index."""
+    conn = create_database(db_path)
+    if command == 'optimize':
+        optimize_fts(conn)
+        print("✅ Search index optimized")
+        ok = True
+    else:
+        ok, message = check_fts(conn)
+        print(f"{'✅' if ok else '❌'} {message}")
+    conn.close()
+    return ok
 
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] in ('optimize', 'check'):
+        sys.exit(0 if maintain_fts(sys.argv[1]) else 1)
+    workers = None
+    if '--workers' in sys.argv:
+        workers = int(sys.argv[sys.argv.index('--workers') + 1])
+    build_index(full='--full' in sys.argv, workers=workers)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Duplicate components across the CC Libraries, found by content hash.
+Elements whose primary component has the same component_sha256 are copies of one file;
+each group reports how many separately stored copies there are, in which libraries, and
+the bytes spent on all but one. The verify pass hashes the local component files in
+parallel and flags caches that are missing, stale (holding another known component) or
+corrupt (matching nothing in the index).
+"""
+
+import base64
+import hashlib
+import json
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from index_generation import connect_read_only
+
+# Database path
+DB_PATH = Path(__file__).parent / "cc_libraries_enhanced.db"
+
+# Groups returned by default, and the most a request may ask for
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+# Verify statuses other than 'ok', in report order
+PROBLEMS = ('missing', 'stale', 'corrupt')
+
+# Copies are separately stored components; versions of one element share a component id
+_COPIES = 'COUNT(DISTINCT COALESCE(e.component_id, e.element_id))'
+
+def _groups_sql(across):
+    return f'''
+        SELECT e.component_sha256, {_COPIES} AS copies, COUNT(DISTINCT e.library_id) AS libraries,
+               MAX(e.file_size) AS size
+        FROM elements e
+        WHERE e.component_sha256 IS NOT NULL
+        GROUP BY e.component_sha256
+        HAVING copies > 1{' AND libraries > 1' if across else ''}
+    '''
+
+def duplicate_totals(conn, across=False):
+    """(groups, copies, wasted bytes) over every duplicate group."""
+    groups, copies, wasted = conn.execute(f'''
+        SELECT COUNT(*), COALESCE(SUM(copies), 0), COALESCE(SUM(COALESCE(size, 0) * (copies - 1)), 0)
+        FROM ({_groups_sql(across)})
+    ''').fetchone()
+    return groups, copies, wasted
+
+def duplicate_groups(conn, across=False, limit=DEFAULT_LIMIT, offset=0):
+    """Groups of elements sharing a component hash, most wasted bytes first.
+
+    across=True keeps only groups spread over more than one library.
+    """
+    rows = conn.execute(f'''
+        {_groups_sql(across)}
+        ORDER BY COALESCE(size, 0) * (copies - 1) DESC, e.component_sha256
+        LIMIT ? OFFSET ?
+    ''', (limit, offset)).fetchall()
+    groups = []
+    for sha256, copies, libraries, size in rows:
+        members = conn.execute('''
+            SELECT e.element_id, e.element_name, e.component_id, e.file_size, e.modified_at,
+                   e.component_path, l.library_name, l.library_type
+            FROM elements e
+            JOIN libraries l ON e.library_id = l.library_id
+            WHERE e.component_sha256 = ?
+            ORDER BY l.library_name, e.modified_at DESC
+        ''', (sha256,)).fetchall()
+        groups.append({
+            'sha256': sha256,
+            'copies': copies,
+            'libraries': libraries,
+            'file_size': size,
+            'wasted_bytes': (size or 0) * (copies - 1),
+            'elements': [dict(zip(('element_id', 'element_name', 'component_id', 'file_size',
+                                   'modified_at', 'component_path', 'library_name', 'library_type'),
+                                  member)) for member in members]
+        })
+    return groups
+
+def hash_file(path, md5=False):
+    """(sha256 hex, md5 base64 or None) of a file, read through a memory map; None if unreadable.
+
+    hashlib releases the GIL while it digests the mapped pages, so threads hash in parallel.
+    """
+    sha256 = hashlib.sha256()
+    md5_hash = hashlib.md5() if md5 else None
+    try:
+        with open(path, 'rb') as f:
+            # An empty file cannot be mapped; its digests are those of no bytes
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    sha256.update(view)
+                    if md5_hash:
+                        md5_hash.update(view)
+    except OSError:
+        return None
+    return sha256.hexdigest(), base64.b64encode(md5_hash.digest()).decode() if md5_hash else None
+
+def verify_components(conn, workers=None):
+    """Hash each element's local component file; returns [(status, element, found sha256)].
+
+    status is 'ok', 'missing', 'stale' (the file is another component known to the index,
+    such as an older revision) or 'corrupt' (it matches no component). Elements without a
+    hash or a local path are skipped. Each file is hashed once however many elements use it.
+    """
+    elements = conn.execute('''
+        SELECT e.element_id, e.element_name, e.component_path, e.component_sha256, e.component_md5,
+               l.library_name
+        FROM elements e
+        JOIN libraries l ON e.library_id = l.library_id
+        WHERE e.component_path IS NOT NULL
+          AND (e.component_sha256 IS NOT NULL OR e.component_md5 IS NOT NULL)
+        ORDER BY l.library_name, e.element_name
+    ''').fetchall()
+    known_sha256 = {row[0] for row in conn.execute(
+        'SELECT DISTINCT component_sha256 FROM elements WHERE component_sha256 IS NOT NULL')}
+    known_md5 = {row[0] for row in conn.execute(
+        'SELECT DISTINCT component_md5 FROM elements WHERE component_md5 IS NOT NULL')}
+
+    # md5 only for files some element can be checked against by md5 alone
+    paths = {}
+    for _, _, path, sha256, _, _ in elements:
+        paths[path] = paths.get(path, False) or sha256 is None
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        digests = dict(zip(paths, pool.map(hash_file, paths, paths.values())))
+
+    results = []
+    for element_id, name, path, sha256, md5, library in elements:
+        element = {'element_id': element_id, 'element_name': name, 'library_name': library,
+                   'component_path': path}
+        digest = digests[path]
+        if digest is None:
+            results.append(('missing', element, None))
+            continue
+        found_sha256, found_md5 = digest
+        if (found_sha256 == sha256) if sha256 else (found_md5 == md5):
+            status = 'ok'
+        elif found_sha256 in known_sha256 or found_md5 in known_md5:
+            status = 'stale'
+        else:
+            status = 'corrupt'
+        results.append((status, element, found_sha256))
+    return results
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+def main():
+    """Command-line interface."""
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print("Usage:")
+        print("  python3 duplicates.py [report] [--across] [--limit N] [--json] [--db PATH]")
+        print("                                     # Components stored more than once")
+        print("  python3 duplicates.py verify [--workers N] [--db PATH]")
+        print("                                     # Hash local component files against the index")
+        return
+    db_path = Path(args[args.index('--db') + 1]) if '--db' in args else DB_PATH
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        sys.exit(1)
+
+    conn = connect_read_only(db_path)
+    try:
+        if 'verify' not in args:
+            across = '--across' in args
+            limit = int(args[args.index('--limit') + 1]) if '--limit' in args else DEFAULT_LIMIT
+            groups, copies, wasted = duplicate_totals(conn, across)
+            duplicates = duplicate_groups(conn, across, limit)
+            if '--json' in args:
+                print(json.dumps({'groups': groups, 'copies': copies, 'wasted_bytes': wasted,
+                                  'duplicates': duplicates}, indent=2))
+                return
+            print(f"🧬 {groups:,} components stored {copies:,} times, {format_bytes(wasted)} in extra copies"
+                  f"{' (across libraries)' if across else ''}")
+            for group in duplicates:
+                print(f"\n  {group['sha256'][:16]}  {group['copies']} copies in {group['libraries']} "
+                      f"{'library' if group['libraries'] == 1 else 'libraries'}, "
+                      f"{format_bytes(group['wasted_bytes'])} extra")
+                for element in group['elements']:
+                    print(f"    {element['element_name']:<40} {element['library_name']}")
+            return
+
+        workers = int(args[args.index('--workers') + 1]) if '--workers' in args else None
+        started = time.perf_counter()
+        results = verify_components(conn, workers)
+        elapsed = time.perf_counter() - started
+    finally:
+        conn.close()
+
+    counts = dict.fromkeys(('ok',) + PROBLEMS, 0)
+    for status, _, _ in results:
+        counts[status] += 1
+    print(f"🔍 {len(results):,} components checked in {elapsed:.1f}s: "
+          + ", ".join(f"{counts[status]:,} {status}" for status in counts))
+    for problem in PROBLEMS:
+        for status, element, _ in results:
+            if status == problem:
+                print(f"  {status:<8} {element['element_name']:<40} {element['library_name']}")
+    if any(counts[problem] for problem in PROBLEMS):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
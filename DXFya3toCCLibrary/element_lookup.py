@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Long-lived element lookup service for the CC Library index.
+Keeps an in-memory element name map loaded from cc_libraries.db, reloads it when the indexer
+publishes a new generation, and answers single or batched name lookups over a Unix socket.
+Clients fall back to a direct database query when the service is not running.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+from index_generation import generation_path, read_generation
+from part_keys import normalize_part_key
+from search_libraries import DB_PATH, get_element_by_name, get_element_by_part_key
+
+# Unix socket the service listens on
+SOCKET_PATH = Path(__file__).parent / "element_lookup.sock"
+
+# Same fields as search_libraries.get_element_by_name, plus part_key and modified_at
+FIELDS = ['element_id', 'element_name', 'file_name', 'file_type', 'component_path', 'file_size',
+          'library_name', 'library_type', 'library_path', 'element_path', 'part_key', 'modified_at']
+
+class NameMap:
+    """Element name and part key → newest element, reloaded when the index generation changes."""
+
+    def __init__(self, db_path=None):
+        self.db_path = Path(db_path or DB_PATH)
+        self.generation = None
+        self.by_name = {}
+        self.by_library = {}
+        self.by_part_key = {}
+        self.loaded_in = 0.0
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def _sidecar_stamp(self):
+        try:
+            st = generation_path(self.db_path).stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def load(self):
+        """Read every element; the newest element (then the first library by name) wins a tie."""
+        started = time.perf_counter()
+        stamp = self._sidecar_stamp()
+        generation = read_generation(self.db_path).get('generation', 0)
+        by_name = {}
+        by_library = {}
+        by_part_key = {}
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.execute('''
+                SELECT e.element_id, e.element_name, e.file_name, e.file_type,
+                       e.component_path, e.file_size, l.library_name, l.library_type,
+                       l.library_path, e.element_path, e.part_key, e.modified_at
+                FROM elements e
+                JOIN libraries l ON e.library_id = l.library_id
+                ORDER BY e.modified_at, l.library_name DESC
+            ''')
+            # Later rows overwrite earlier ones, so the winner is the last in this order
+            for row in cursor:
+                entry = dict(zip(FIELDS, row))
+                by_name[row[1]] = entry
+                by_library[(row[1], row[6])] = entry
+                if row[10]:
+                    by_part_key[row[10]] = entry
+                    by_part_key[(row[10], row[6])] = entry
+        finally:
+            conn.close()
+        # Swap in whole dicts so concurrent lookups never see a half-loaded map
+        self.by_name, self.by_library, self.by_part_key = by_name, by_library, by_part_key
+        self.generation = generation
+        self._stamp = stamp
+        self.loaded_in = time.perf_counter() - started
+
+    def refresh(self):
+        """Reload when a new generation has been published since the last load."""
+        if self._stamp is not None and self._sidecar_stamp() == self._stamp:
+            return
+        with self._lock:
+            if self._sidecar_stamp() != self._stamp or self.generation is None:
+                self.load()
+
+    def lookup(self, name, library_name=None):
+        """Exact element name first, then the name's part key."""
+        if library_name:
+            entry = self.by_library.get((name, library_name))
+            return entry or self.by_part_key.get((normalize_part_key(name), library_name))
+        return self.by_name.get(name) or self.by_part_key.get(normalize_part_key(name))
+
+    def lookup_many(self, names, library_name=None):
+        self.refresh()
+        return [self.lookup(name, library_name) for name in names]
+
+class LookupHandler(socketserver.StreamRequestHandler):
+    """One JSON request per line: {"names": [...], "library": null} → {"generation", "results"}."""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                names = request.get('names', [])
+                results = self.server.names.lookup_many(names, request.get('library'))
+                response = {'generation': self.server.names.generation, 'results': results}
+            except (ValueError, AttributeError, sqlite3.Error) as e:
+                response = {'error': str(e)}
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+            self.wfile.flush()
+
+class LookupServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path, names):
+        self.names = names
+        super().__init__(str(socket_path), LookupHandler)
+
+def lookup_elements(names, library_name=None, socket_path=None, timeout=2.0):
+    """Look up many names through the running service.
+
+    Returns a list of element dicts (None where nothing matched) in the order of names,
+    or None when the service is not reachable.
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path or SOCKET_PATH))
+            sock.sendall(json.dumps({'names': list(names), 'library': library_name}).encode() + b'\n')
+            with sock.makefile('rb') as reader:
+                response = json.loads(reader.readline())
+    except (OSError, ValueError):
+        return None
+    return response.get('results')
+
+def find_element(name, library_name=None):
+    """Exact name, else part-key match; answered by the service when it is running."""
+    results = lookup_elements([name], library_name)
+    if results is not None:
+        return results[0]
+    return get_element_by_name(name, library_name) or get_element_by_part_key(name, library_name)
+
+def serve(socket_path=None, db_path=None):
+    """Load the name map and answer lookups until interrupted."""
+    socket_path = Path(socket_path or SOCKET_PATH)
+    if socket_path.exists():
+        if lookup_elements([], socket_path=socket_path) is not None:
+            print(f"ℹ️  Lookup service already running on {socket_path}")
+            return
+        os.remove(socket_path)
+
+    names = NameMap(db_path)
+    names.load()
+    print(f"📇 Loaded {len(names.by_name)} element names (generation {names.generation}) "
+          f"in {names.loaded_in * 1000:.0f}ms")
+    server = LookupServer(socket_path, names)
+    print(f"🔌 Listening on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path.exists():
+            os.remove(socket_path)
+        print("👋 Lookup service stopped")
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) < 2 or sys.argv[1] not in ('serve', 'get'):
+        print("Usage:")
+        print("  python3 element_lookup.py serve            # Run the lookup service")
+        print("  python3 element_lookup.py get <name>...    # Look up names (use - to read them from stdin)")
+        return
+
+    if sys.argv[1] == 'serve':
+        serve()
+        return
+
+    names = sys.argv[2:]
+    if names == ['-']:
+        names = [line.strip() for line in sys.stdin if line.strip()]
+    started = time.perf_counter()
+    results = lookup_elements(names)
+    source = "lookup service"
+    if results is None:
+        results = [get_element_by_name(name) or get_element_by_part_key(name) for name in names]
+        source = "database"
+    elapsed = time.perf_counter() - started
+    for name, result in zip(names, results):
+        if result:
+            print(f"✅ {name}  →  {result['library_name']}: {result['component_path'] or '(no component)'}")
+        else:
+            print(f"❌ {name}  →  not found")
+    print(f"⚡ {len(names)} lookups via {source} in {elapsed * 1000:.1f}ms")
+
+if __name__ == '__main__':
+    main()
@@ -1,115 +1,253 @@
 #!/usr/bin/env python3
+"""
+Element feed for cc-library-search-enhanced.html.
+Manifests are read one library at a time and their elements written as columnar,
+dictionary-encoded chunks named by content hash, plus a small index (library_feed/index.js)
+listing each chunk's libraries and a trigram Bloom filter of its searchable text. The page
+loads the index, then only the chunks that can match a search.
+"""
+
+import base64
+import hashlib
 import json
 import os
+import sys
+import time
 from pathlib import Path
 
+from manifest_state import library_dirs, read_manifest
+
 # Path to CC Libraries
-base_path = Path.home() / "Library/Application Support/Adobe/Creative Cloud Libraries/LIBS/6D27744844570B5D992016E5_AdobeID"
-
-def extract_elements():
-    all_elements = []
-    
-    # Process private libraries
-    private_path = base_path / "creative_cloud/dcx"
-    if private_path.exists():
-        for library_dir in private_path.iterdir():
-            if library_dir.is_dir():
-                manifest_file = library_dir / "manifest"
-                if manifest_file.exists():
-                    try:
-                        with open(manifest_file, 'r') as f:
-                            data = json.load(f)
-                            library_id = data.get('id')
-                            library_name = data.get('name')
-                            
-                            # Extract elements
-                            children = data.get('children', [])
-                            for child in children:
-                                if child.get('name') == 'elements':
-                                    for element in child.get('children', []):
-                                        # Get file type from components
-                                        file_type = 'unknown'
-                                        file_name = ''
-                                        file_size = 0
-                                        
-                                        components = element.get('components', [])
-                                        if components:
-                                            comp = components[0]
-                                            file_type = comp.get('type', 'unknown')
-                                            file_name = comp.get('name', '')
-                                            file_size = comp.get('length', 0)
-                                        
-                                        all_elements.append({
-                                            'library_id': library_id,
-                                            'library_name': library_name,
-                                            'library_type': 'private',
-                                            'element_id': element.get('id'),
-                                            'element_name': element.get('name', 'Untitled'),
-                                            'element_type': element.get('type', ''),
-                                            'file_type': file_type,
-                                            'file_name': file_name,
-                                            'file_size': file_size,
-                                            'path': element.get('path', ''),
-                                            'created': element.get('library#created'),
-                                            'modified': element.get('library#modified')
-                                        })
-                    except (json.JSONDecodeError, IOError) as e:
-                        print(f"// Error reading {manifest_file}: {e}", file=sys.stderr)
-                        continue
-    
-    # Process shared libraries
-    collab_path = base_path / "collaborated/dcx"
-    if collab_path.exists():
-        for library_dir in collab_path.iterdir():
-            if library_dir.is_dir():
-                manifest_file = library_dir / "manifest"
-                if manifest_file.exists():
-                    try:
-                        with open(manifest_file, 'r') as f:
-                            data = json.load(f)
-                            library_id = data.get('id')
-                            library_name = data.get('name')
-                            
-                            # Extract elements
-                            children = data.get('children', [])
-                            for child in children:
-                                if child.get('name') == 'elements':
-                                    for element in child.get('children', []):
-                                        # Get file type from components
-                                        file_type = 'unknown'
-                                        file_name = ''
-                                        file_size = 0
-                                        
-                                        components = element.get('components', [])
-                                        if components:
-                                            comp = components[0]
-                                            file_type = comp.get('type', 'unknown')
-                                            file_name = comp.get('name', '')
-                                            file_size = comp.get('length', 0)
-                                        
-                                        all_elements.append({
-                                            'library_id': library_id,
-                                            'library_name': library_name,
-                                            'library_type': 'shared',
-                                            'element_id': element.get('id'),
-                                            'element_name': element.get('name', 'Untitled'),
-                                            'element_type': element.get('type', ''),
-                                            'file_type': file_type,
-                                            'file_name': file_name,
-                                            'file_size': file_size,
-                                            'path': element.get('path', ''),
-                                            'created': element.get('library#created'),
-                                            'modified': element.get('library#modified')
-                                        })
-                    except (json.JSONDecodeError, IOError) as e:
-                        print(f"// Error reading {manifest_file}: {e}", file=sys.stderr)
-                        continue
-    
-    # Output as JavaScript
-    print("// Auto-generated library elements data")
-    print(f"const libraryElements = {json.dumps(all_elements, indent=2)};")
+BASE_PATH = Path.home() / "Library/Application Support/Adobe/Creative Cloud Libraries/LIBS/6D27744844570B5D992016E5_AdobeID"
 
-if __name__ == '__main__':
-    import sys
-    extract_elements()
+# Feed directory loaded by cc-library-search-enhanced.html
+FEED_DIR = Path(__file__).parent / "library_feed"
+
+# Elements per chunk
+CHUNK_ROWS = 500
+
+# Bloom filter per chunk: bits per distinct trigram and hash functions. About 8% false
+# positives per trigram; a query must hit on all of its trigrams to load a chunk
+BLOOM_BITS_PER_TRIGRAM = 6
+BLOOM_HASHES = 2
+
+FEED_VERSION = 1
+
+def read_library(manifest_file, library_type):
+    """Yield the elements of one library manifest as dicts (the page's row format)."""
+    data, _ = read_manifest(manifest_file)
+    if data is None:
+        raise ValueError("not valid JSON")
+    library_id = data.get('id')
+    library_name = data.get('name')
+    for child in data.get('children', []):
+        if child.get('name') != 'elements':
+            continue
+        for element in child.get('children', []):
+            # File details come from the first component
+            file_type = 'unknown'
+            file_name = ''
+            file_size = 0
+            components = element.get('components', [])
+            if components:
+                comp = components[0]
+                file_type = comp.get('type', 'unknown')
+                file_name = comp.get('name', '')
+                file_size = comp.get('length', 0)
+
+            yield {
+                'library_id': library_id,
+                'library_name': library_name,
+                'library_type': library_type,
+                'element_id': element.get('id'),
+                'element_name': element.get('name', 'Untitled'),
+                'element_type': element.get('type', ''),
+                'file_type': file_type,
+                'file_name': file_name,
+                'file_size': file_size,
+                'path': element.get('path', ''),
+                'created': element.get('library#created'),
+                'modified': element.get('library#modified')
+            }
+
+def iter_elements(base_path=BASE_PATH):
+    """Yield elements of every library, reading one manifest at a time."""
+    for library_dir, library_type in library_dirs(base_path):
+        manifest_file = library_dir / "manifest"
+        if not manifest_file.exists():
+            continue
+        try:
+            elements = list(read_library(manifest_file, library_type))
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Error reading {manifest_file}: {e}", file=sys.stderr)
+            continue
+        yield from elements
+
+def iter_snapshot(snapshot_file):
+    """Yield elements from an old library_elements.js snapshot."""
+    with open(snapshot_file) as f:
+        text = f.read()
+    yield from json.loads(text[text.index('['):text.rindex(']') + 1])
+
+def search_text(element):
+    """Lowercased text the page searches, joined as its searchElements() does."""
+    fields = ('element_name', 'file_name', 'library_name', 'element_type', 'file_type')
+    return ' '.join(str(element.get(field) or '') for field in fields).lower()
+
+def trigram_hash(gram):
+    """32-bit FNV-1a over code points (mirrored by trigramHash() in the page)."""
+    h = 2166136261
+    for char in gram:
+        h = ((h ^ ord(char)) * 16777619) & 0xFFFFFFFF
+    return h
+
+def bloom_positions(h, bits):
+    """Bit positions of a trigram hash by double hashing (mirrored by bloomHas() in the page)."""
+    h2 = (((h ^ (h >> 15)) * 0x2C1B3C6D) & 0xFFFFFFFF) | 1
+    return [((h + i * h2) & 0xFFFFFFFF) % bits for i in range(BLOOM_HASHES)]
+
+def build_bloom(hashes):
+    """Base64 Bloom filter of trigram hashes."""
+    bits = max(64, -(-len(hashes) * BLOOM_BITS_PER_TRIGRAM // 8) * 8)
+    bloom = bytearray(bits // 8)
+    for h in hashes:
+        for p in bloom_positions(h, bits):
+            bloom[p >> 3] |= 1 << (p & 7)
+    return base64.b64encode(bloom).decode()
 
+def compact_json(value):
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+class FeedWriter:
+    """Collects elements into columnar chunks and writes them, then the index."""
+
+    def __init__(self, out_dir=FEED_DIR, chunk_rows=CHUNK_ROWS):
+        self.out_dir = Path(out_dir)
+        self.chunk_rows = chunk_rows
+        self.libraries = []
+        self.element_types = []
+        self.file_types = []
+        self.chunks = []
+        self.total = 0
+        self.bytes = 0
+        self._codes = {}
+        self._start_chunk()
+
+    def _start_chunk(self):
+        self.columns = {name: [] for name in
+                        ('lib', 'id', 'name', 'type', 'file_type', 'file_name', 'size', 'path', 'created', 'modified')}
+        self.chunk_libraries = set()
+        self.chunk_trigrams = set()
+
+    def _code(self, table, value):
+        # Position of value in the named table, appended when new
+        key = (table, value)
+        if key not in self._codes:
+            values = getattr(self, table)
+            self._codes[key] = len(values)
+            values.append(value)
+        return self._codes[key]
+
+    def add(self, element):
+        library = self._code('libraries', (element.get('library_id'), element.get('library_name'),
+                                              element.get('library_type')))
+        element_id = element.get('element_id')
+        columns = self.columns
+        columns['lib'].append(library)
+        columns['id'].append(element_id)
+        columns['name'].append(element.get('element_name'))
+        columns['type'].append(self._code('element_types', element.get('element_type') or ''))
+        columns['file_type'].append(self._code('file_types', element.get('file_type') or ''))
+        columns['file_name'].append(element.get('file_name') or '')
+        columns['size'].append(element.get('file_size') or 0)
+        # The path is almost always the element ID
+        path = element.get('path', '')
+        columns['path'].append(None if path == element_id else path)
+        columns['created'].append(element.get('created'))
+        columns['modified'].append(element.get('modified'))
+        self.chunk_libraries.add(library)
+        text = search_text(element)
+        self.chunk_trigrams.update(trigram_hash(text[i:i + 3]) for i in range(len(text) - 2))
+        self.total += 1
+        if len(columns['id']) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        """Write the current chunk under its content hash."""
+        count = len(self.columns['id'])
+        if not count:
+            return
+        payload = compact_json(self.columns)
+        digest = hashlib.sha256(payload.encode()).hexdigest()[:16]
+        name = f"chunk-{digest}.js"
+        path = self.out_dir / name
+        if not path.exists():
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            write_atomic(path, f'ccFeed.chunk("{digest}",{payload});\n')
+        self.bytes += path.stat().st_size
+        self.chunks.append({
+            'hash': digest,
+            'file': name,
+            'count': count,
+            'libraries': sorted(self.chunk_libraries),
+            'bloom': build_bloom(self.chunk_trigrams)
+        })
+        self._start_chunk()
+
+    def finish(self):
+        """Write the index and remove chunks it no longer lists; returns the index dict."""
+        self.flush()
+        index = {
+            'version': FEED_VERSION,
+            'generated_at': int(time.time() * 1000),
+            'total': self.total,
+            'bloom_hashes': BLOOM_HASHES,
+            'libraries': [{'id': i, 'name': n, 'type': t} for i, n, t in self.libraries],
+            'element_types': self.element_types,
+            'file_types': self.file_types,
+            'chunks': self.chunks
+        }
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.out_dir / "index.js", f"ccFeed.index({compact_json(index)});\n")
+        live = {chunk['file'] for chunk in self.chunks}
+        for stale in self.out_dir.glob("chunk-*.js"):
+            if stale.name not in live:
+                stale.unlink()
+        return index
+
+def write_atomic(path, text):
+    temp = path.with_name(path.name + '.tmp')
+    with open(temp, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp, path)
+
+def main():
+    """Command-line interface."""
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print("Usage:")
+        print("  python3 extract_library_elements.py [--out DIR]                       # Feed from the CC Library manifests")
+        print("  python3 extract_library_elements.py --from-snapshot FILE [--out DIR]  # Convert an old library_elements.js")
+        return
+
+    out_dir = Path(args[args.index('--out') + 1]) if '--out' in args else FEED_DIR
+    if '--from-snapshot' in args:
+        source = Path(args[args.index('--from-snapshot') + 1])
+        elements = iter_snapshot(source)
+    else:
+        source = BASE_PATH
+        if not source.exists():
+            print(f"❌ CC Libraries not found: {source}")
+            sys.exit(1)
+        elements = iter_elements(source)
+
+    writer = FeedWriter(out_dir)
+    for element in elements:
+        writer.add(element)
+    index = writer.finish()
+    index_size = (out_dir / "index.js").stat().st_size
+    print(f"📦 {writer.total:,} elements from {len(index['libraries'])} libraries → {out_dir}")
+    print(f"   {len(index['chunks'])} chunks, {writer.bytes / 1024:,.0f} KB; index {index_size / 1024:,.1f} KB")
+
+if __name__ == '__main__':
+    main()
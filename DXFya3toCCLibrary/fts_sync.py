@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+External-content FTS5 indexes over elements, kept in sync by triggers.
+elements_fts (word tokens) and the optional elements_trigram (substring search) read their
+text from the elements_fts_source view (elements joined with libraries), so an element or
+library change only touches its own FTS rows.
+"""
+
+import sqlite3
+
+# Columns come from elements unless listed here
+LIBRARY_COLUMNS = {'library_name'}
+
+# FTS tables maintained by this module, in trigger order
+FTS_TABLES = ('elements_fts', 'elements_trigram')
+
+def _library_lookup(row):
+    return f"(SELECT library_name FROM libraries WHERE library_id = {row}.library_id)"
+
+def _values(columns, row, library_name):
+    """SQL value list for columns, reading element columns from row."""
+    return ', '.join(library_name if c in LIBRARY_COLUMNS else f"{row}.{c}" for c in columns)
+
+def _tables(columns, trigram_columns):
+    tables = [('elements_fts', columns)]
+    if trigram_columns:
+        tables.append(('elements_trigram', trigram_columns))
+    return tables
+
+def _delete_statements(tables, row, library_name):
+    return ''.join(f'''
+            INSERT INTO {table} ({table}, rowid, {', '.join(cols)})
+            VALUES ('delete', {row}.rowid, {_values(cols, row, library_name)});''' for table, cols in tables)
+
+def _insert_statements(tables, row, library_name):
+    return ''.join(f'''
+            INSERT INTO {table} (rowid, {', '.join(cols)})
+            VALUES ({row}.rowid, {_values(cols, row, library_name)});''' for table, cols in tables)
+
+def create_fts_triggers(cursor, columns, trigram_columns=()):
+    """Create the triggers that mirror elements and libraries into the FTS tables."""
+    tables = _tables(columns, trigram_columns)
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS elements_fts_insert AFTER INSERT ON elements BEGIN
+            {_insert_statements(tables, 'new', _library_lookup('new'))}
+        END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS elements_fts_delete AFTER DELETE ON elements BEGIN
+            {_delete_statements(tables, 'old', _library_lookup('old'))}
+        END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS elements_fts_update AFTER UPDATE ON elements BEGIN
+            {_delete_statements(tables, 'old', _library_lookup('old'))}
+            {_insert_statements(tables, 'new', _library_lookup('new'))}
+        END
+    ''')
+    # A renamed library re-indexes only its own elements; upserts that keep the name do not
+    renamed = ''.join(f'''
+            INSERT INTO {table} ({table}, rowid, {', '.join(cols)})
+            SELECT 'delete', e.rowid, {_values(cols, 'e', 'old.library_name')}
+            FROM elements e WHERE e.library_id = old.library_id;
+            INSERT INTO {table} (rowid, {', '.join(cols)})
+            SELECT e.rowid, {_values(cols, 'e', 'new.library_name')}
+            FROM elements e WHERE e.library_id = new.library_id;''' for table, cols in tables)
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS libraries_fts_update AFTER UPDATE OF library_name ON libraries
+        WHEN old.library_name IS NOT new.library_name BEGIN
+            {renamed}
+        END
+    ''')
+
+def drop_fts_triggers(cursor):
+    """Drop the sync triggers before a bulk load (rebuild_fts afterwards)."""
+    for name in ('elements_fts_insert', 'elements_fts_delete', 'elements_fts_update', 'libraries_fts_update'):
+        cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+
+def create_fts(cursor, columns, trigram_columns=()):
+    """Create the external-content FTS tables, their source view and triggers.
+
+    trigram_columns (a subset of columns) adds the elements_trigram substring index.
+    An older standalone elements_fts table is dropped; returns True when the
+    indexes must be filled with rebuild_fts.
+    """
+    row = cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'elements_fts'").fetchone()
+    needs_rebuild = row is None
+    if row and 'content=' not in row[0].replace(' ', ''):
+        cursor.execute('DROP TABLE elements_fts')
+        needs_rebuild = True
+    if trigram_columns and not cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'elements_trigram'").fetchone():
+        needs_rebuild = True
+
+    select = ', '.join(f"l.{c}" if c in LIBRARY_COLUMNS else f"e.{c}" for c in columns)
+    cursor.execute(f'''
+        CREATE VIEW IF NOT EXISTS elements_fts_source AS
+        SELECT e.rowid AS rowid, {select}
+        FROM elements e
+        LEFT JOIN libraries l ON l.library_id = e.library_id
+    ''')
+    declared = ', '.join(f"{c} UNINDEXED" if c == 'element_id' else c for c in columns)
+    cursor.execute(f'''
+        CREATE VIRTUAL TABLE IF NOT EXISTS elements_fts USING fts5(
+            {declared},
+            content='elements_fts_source',
+            content_rowid='rowid'
+        )
+    ''')
+    if trigram_columns:
+        cursor.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS elements_trigram USING fts5(
+                {', '.join(trigram_columns)},
+                content='elements_fts_source',
+                content_rowid='rowid',
+                tokenize='trigram'
+            )
+        ''')
+    if needs_rebuild:
+        # Triggers written for an earlier set of tables must be replaced
+        drop_fts_triggers(cursor)
+    else:
+        # Earlier versions re-indexed a library on every upsert, renamed or not
+        row = cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'libraries_fts_update'").fetchone()
+        if row and 'WHEN' not in row[0]:
+            cursor.execute('DROP TRIGGER libraries_fts_update')
+    create_fts_triggers(cursor, columns, trigram_columns)
+    return needs_rebuild
+
+def _existing_tables(conn):
+    names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    return [table for table in FTS_TABLES if table in names]
+
+def rebuild_fts(conn):
+    """Re-read every element into the FTS tables (after migrations and bulk loads)."""
+    with conn:
+        for table in _existing_tables(conn):
+            conn.execute(f"INSERT INTO {table} ({table}) VALUES ('rebuild')")
+
+def optimize_fts(conn):
+    """Merge each FTS index's b-trees into one for faster queries."""
+    with conn:
+        for table in _existing_tables(conn):
+            conn.execute(f"INSERT INTO {table} ({table}) VALUES ('optimize')")
+
+def check_fts(conn):
+    """Verify the FTS tables against the elements table; returns (ok, message)."""
+    tables = _existing_tables(conn)
+    for table in tables:
+        try:
+            conn.execute(f"INSERT INTO {table} ({table}, rank) VALUES ('integrity-check', 1)")
+        except sqlite3.DatabaseError as e:
+            return False, f"{table} is out of sync with elements: {e}"
+    conn.commit()
+    count = conn.execute('SELECT COUNT(*) FROM elements').fetchone()[0]
+    verb = 'are' if len(tables) > 1 else 'is'
+    return True, f"{' and '.join(tables)} {verb} consistent with {count} elements"
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Index generations and shadow-database swaps for the CC Library indexes.
+Full rebuilds are written to a shadow file, compacted with VACUUM INTO a new generation file,
+and published by atomically repointing the database path, a symlink, at that file. Every
+published change bumps a generation number kept next to the database, so long-lived readers
+know when to reopen their connections. Part geometry recorded by the converter bumps its own
+number instead, so only what shows geometry is refreshed.
+"""
+
+import contextlib
+import fcntl
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import weakref
+from pathlib import Path
+
+# Settings for read-only connections serving searches: memory-mapped reads, a 64 MB page
+# cache and no writes
+READ_PRAGMAS = [
+    'PRAGMA mmap_size = 268435456',
+    'PRAGMA cache_size = -65536',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA query_only = ON'
+]
+
+# Prepared statements kept per read-only connection
+READ_CACHED_STATEMENTS = 256
+
+def generation_path(db_path):
+    """Sidecar file holding the database's generation number."""
+    return Path(f"{db_path}.generation")
+
+def geometry_path(db_path):
+    """Sidecar file holding the number of part geometry changes."""
+    return Path(f"{db_path}.geometry")
+
+def shadow_path(db_path):
+    """Scratch file a full rebuild is written to."""
+    return Path(f"{db_path}.shadow")
+
+def generation_file(db_path, number):
+    """File a full rebuild publishes; db_path links to the newest."""
+    return Path(f"{db_path}.gen{number}")
+
+def lock_path(db_path):
+    """Lock file held by whichever process is writing db_path."""
+    return Path(f"{db_path}.lock")
+
+@contextlib.contextmanager
+def _exclusive(path):
+    """Hold an flock on path; released when the file closes, so a dead holder cannot keep it."""
+    with open(path, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+@contextlib.contextmanager
+def writer_lock(db_path):
+    """Hold the exclusive writer lock of db_path, waiting for any other writer to finish."""
+    with _exclusive(lock_path(db_path)):
+        yield
+
+def remove_database(path):
+    """Delete a database file together with its journal files."""
+    for suffix in ('', '-journal', '-wal', '-shm'):
+        try:
+            os.remove(f"{path}{suffix}")
+        except FileNotFoundError:
+            pass
+
+def _read_sidecar(path, field):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {field: 0}
+
+def _bump_sidecar(path, field, **extra):
+    """Increment field in a sidecar file; the read and the replace happen under one lock."""
+    with _exclusive(path.with_name(path.name + '.lock')):
+        info = {
+            field: _read_sidecar(path, field).get(field, 0) + 1,
+            **extra,
+            'published_at': int(time.time() * 1000)
+        }
+        temp = path.with_name(path.name + '.tmp')
+        with open(temp, 'w') as f:
+            json.dump(info, f)
+        os.replace(temp, path)
+    return info[field]
+
+def read_generation(db_path):
+    """Return the published generation info dict ({'generation': 0} when none was published)."""
+    return _read_sidecar(generation_path(db_path), 'generation')
+
+def publish_generation(db_path, kind):
+    """Bump the generation after a change to the database; returns the new number."""
+    return _bump_sidecar(generation_path(db_path), 'generation', kind=kind)
+
+def read_geometry(db_path):
+    """Number of part geometry changes published ({'geometry': 0} when none was)."""
+    return _read_sidecar(geometry_path(db_path), 'geometry')
+
+def publish_geometry(db_path):
+    """Bump the geometry number after part geometry was recorded; returns the new number.
+
+    Connections see the rows without reopening, so the generation is left alone and only
+    caches of sizes and shapes are refreshed.
+    """
+    return _bump_sidecar(geometry_path(db_path), 'geometry')
+
+def start_shadow(db_path):
+    """Return a fresh shadow path for a full rebuild of db_path."""
+    shadow = shadow_path(db_path)
+    remove_database(shadow)
+    return shadow
+
+def retire_generations(db_path, keep):
+    """Delete generation files not in keep, and the journal files of a replaced plain file.
+
+    Connections still holding a deleted file keep reading it until they reopen.
+    """
+    db_path = Path(db_path)
+    pattern = re.compile(re.escape(db_path.name) + r'\.gen\d+$')
+    for path in db_path.parent.iterdir():
+        if pattern.match(path.name) and path not in keep:
+            remove_database(path)
+    if db_path not in keep:
+        retire_plain_logs(db_path)
+
+def retire_plain_logs(db_path):
+    """Delete the journal files of the plain file db_path was before its first full rebuild.
+
+    SQLite names them after the path it opened, so they outlive the swap to a symlink.
+    """
+    if not Path(db_path).is_symlink():
+        return
+    for suffix in ('-journal', '-wal', '-shm'):
+        try:
+            os.remove(f"{db_path}{suffix}")
+        except FileNotFoundError:
+            pass
+
+def publish_shadow(conn, shadow, db_path, finish=None):
+    """Compact a finished shadow build and publish it as the live database.
+
+    The shadow is copied with VACUUM INTO a new generation file, finish(conn) runs on the copy
+    (VACUUM may renumber rowids, so external-content FTS tables are rebuilt there), then
+    ANALYZE. db_path is then replaced by a symlink to the copy in one rename. SQLite names a
+    database's write-ahead log after the file a link resolves to, so the new file never meets
+    the old file's log; connections holding the old file keep it until they reopen. Files
+    older than the previous generation are deleted.
+    """
+    db_path = Path(db_path)
+    number = read_generation(db_path).get('generation', 0) + 1
+    while generation_file(db_path, number).exists():
+        number += 1
+    target = generation_file(db_path, number)
+    conn.commit()
+    conn.execute('VACUUM INTO ?', (str(target),))
+    conn.close()
+    remove_database(shadow)
+
+    conn = sqlite3.connect(target)
+    if finish:
+        finish(conn)
+    conn.execute('ANALYZE')
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.commit()
+    conn.close()
+
+    previous = Path(os.path.realpath(db_path)) if db_path.exists() else None
+    link = Path(f"{db_path}.link")
+    try:
+        os.remove(link)
+    except FileNotFoundError:
+        pass
+    os.symlink(target.name, link)
+    os.replace(link, db_path)
+    retire_generations(db_path, {target, previous})
+    return publish_generation(db_path, 'full')
+
+def connect_read_only(db_path):
+    """Open db_path read-only (mode=ro) with READ_PRAGMAS applied."""
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    # Only the owning thread uses it; check_same_thread=False lets ReaderPool.close() close it
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                           cached_statements=READ_CACHED_STATEMENTS)
+    for pragma in READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+class IndexReader:
+    """Read connection that is reopened when a new generation of the database is published."""
+
+    def __init__(self, db_path, read_only=False):
+        self.db_path = Path(db_path)
+        self.read_only = read_only
+        self.conn = None
+        self.generation = None
+        self._stamp = None
+
+    def _sidecar_stamp(self):
+        try:
+            st = generation_path(self.db_path).stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def connection(self):
+        """Return the open connection, reopening it after a swap."""
+        stamp = self._sidecar_stamp()
+        if self.conn is None or stamp != self._stamp:
+            generation = read_generation(self.db_path).get('generation', 0)
+            if self.conn is None or generation != self.generation:
+                self.close()
+                self.conn = connect_read_only(self.db_path) if self.read_only else sqlite3.connect(self.db_path)
+                self.generation = generation
+            self._stamp = stamp
+        return self.conn
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+class _Lease:
+    """A thread's hold on a pooled reader; collected when the thread exits."""
+    __slots__ = ('reader', '__weakref__')
+
+class ReaderPool:
+    """One read-only IndexReader per thread, so each keeps its page cache and prepared statements.
+
+    A thread keeps its reader while it lives; readers of finished threads are handed to new
+    ones, so servers that start a thread per request still reuse connections. Every
+    connection is reopened on its next use after a new generation is published.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self._readers = []
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def connection(self):
+        """Return the calling thread's connection."""
+        lease = getattr(self._local, 'lease', None)
+        if lease is None:
+            with self._lock:
+                reader = self._idle.pop() if self._idle else None
+            if reader is None:
+                reader = IndexReader(self.db_path, read_only=True)
+                with self._lock:
+                    self._readers.append(reader)
+            lease = _Lease()
+            lease.reader = reader
+            weakref.finalize(lease, self._release, reader)
+            self._local.lease = lease
+        return lease.reader.connection()
+
+    def _release(self, reader):
+        with self._lock:
+            if reader in self._readers:
+                self._idle.append(reader)
+
+    def size(self):
+        """Readers opened so far (in use or idle)."""
+        return len(self._readers)
+
+    def close(self):
+        """Close every connection (at shutdown)."""
+        with self._lock:
+            readers, self._readers, self._idle = self._readers, [], []
+        for reader in readers:
+            reader.close()
+        self._local = threading.local()
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  python3 index_generation.py <database.db>   # Show the published generation")
+        return
+    info = read_generation(sys.argv[1])
+    if not info.get('published_at'):
+        print(f"ℹ️  No generation published for {sys.argv[1]}")
+        return
+    when = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(info['published_at'] / 1000))
+    print(f"🔢 Generation {info['generation']} ({info.get('kind', '?')}) published {when}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Background indexer that keeps the CC Library indexes current.
+Watches the library folders under BASE_PATH (FSEvents/inotify through watchdog when it is
+installed, otherwise by polling manifest mtimes), debounces bursts of Creative Cloud sync
+writes and applies incremental updates. Its state file lets the converter skip the
+synchronous `cclib update` while the watcher is running.
+"""
+
+import contextlib
+import io
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+
+import build_library_index
+import build_library_index_enhanced
+from index_generation import read_generation
+from manifest_state import library_dirs, manifest_stat
+
+# watchdog wraps FSEvents on macOS and inotify on Linux; polling is the fallback
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+# Heartbeat and status, read by the converter and `cclib status`
+STATE_PATH = Path(__file__).parent / "index_watcher.json"
+
+DEFAULT_SETTINGS = {
+    'debounce': 2.0,     # seconds of quiet before an update runs
+    'max_delay': 30.0,   # update at the latest this long after the first change of a burst
+    'interval': 2.0,     # polling period without watchdog
+    'heartbeat': 5.0     # state file refresh period; stale after three missed beats
+}
+
+def scan_manifests(base_path):
+    """Return {manifest path: (mtime_ns, size)} for every library under base_path."""
+    signatures = {}
+    for library_dir, _ in library_dirs(base_path):
+        manifest = library_dir / "manifest"
+        stat = manifest_stat(manifest)
+        if stat is not None:
+            signatures[str(manifest)] = stat
+    return signatures
+
+def read_state(path=None):
+    """Return the watcher state, or None when no watcher is running or its heartbeat is stale."""
+    try:
+        with open(path or STATE_PATH) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() * 1000 - state.get('heartbeat_at', 0) > state.get('stale_after_ms', 0):
+        return None
+    return state
+
+class IndexWatcher:
+    """Debounces manifest changes and runs incremental index updates."""
+
+    def __init__(self, base_path=None, targets=('simple', 'enhanced'), settings=None,
+                 use_polling=False, state_path=None):
+        self.base_path = Path(base_path or build_library_index.BASE_PATH)
+        self.targets = targets
+        self.settings = dict(DEFAULT_SETTINGS, **(settings or {}))
+        self.use_polling = use_polling or Observer is None
+        self.state_path = Path(state_path or STATE_PATH)
+        self.started_at = int(time.time() * 1000)
+        self.first_change = None
+        self.last_change = None
+        self.last_update = None
+        self.updates = 0
+        self.published_pending = None
+        self.lock = threading.Lock()
+        self.updating = threading.Event()
+        self.stopping = threading.Event()
+
+    def note_change(self):
+        """Record a change; called from the watchdog thread or the polling loop."""
+        now = time.monotonic()
+        with self.lock:
+            if self.first_change is None:
+                self.first_change = now
+            self.last_change = now
+
+    def due(self):
+        """True when a pending burst has been quiet for the debounce period (or waited too long)."""
+        with self.lock:
+            if self.first_change is None:
+                return False
+            now = time.monotonic()
+            return (now - self.last_change >= self.settings['debounce']
+                    or now - self.first_change >= self.settings['max_delay'])
+
+    def update(self):
+        """Apply an incremental update to each target index.
+
+        The state file stays pending and keeps its heartbeat while the update runs, so the
+        converter waits for it instead of taking the watcher for dead.
+        """
+        with self.lock:
+            self.first_change = None
+            self.last_change = None
+        self.updating.set()
+        self.write_state()
+        done = threading.Event()
+        beat = threading.Thread(target=self._beat_until, args=(done,), daemon=True)
+        beat.start()
+        try:
+            self._update_targets()
+        finally:
+            done.set()
+            beat.join()
+            self.updating.clear()
+        self.last_update = int(time.time() * 1000)
+        self.updates += 1
+        self.write_state()
+
+    def _beat_until(self, done):
+        while not done.wait(self.settings['heartbeat']):
+            self.write_state()
+
+    def _update_targets(self):
+        for target in self.targets:
+            output = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(output):
+                    if target == 'simple':
+                        build_library_index.BASE_PATH = self.base_path
+                        build_library_index.build_index()
+                    else:
+                        build_library_index_enhanced.build_index(base_path=self.base_path)
+            except Exception as e:
+                print(f"⚠️  {target} index update failed: {e}")
+                continue
+            for line in output.getvalue().splitlines():
+                if 'Changed libraries:' in line:
+                    print(f"🔄 {target}: {line.strip()}")
+
+    def generation(self):
+        """Generation of the index the converter reads."""
+        return read_generation(build_library_index.DB_PATH).get('generation', 0)
+
+    def write_state(self):
+        with self.lock:
+            pending = self.first_change is not None
+        updating = self.updating.is_set()
+        state = {
+            'pid': os.getpid(),
+            'backend': 'polling' if self.use_polling else 'watchdog',
+            'base_path': str(self.base_path),
+            'started_at': self.started_at,
+            'heartbeat_at': int(time.time() * 1000),
+            'stale_after_ms': int(self.settings['heartbeat'] * 3000),
+            'pending': pending or updating,
+            'updating': updating,
+            'last_update_at': self.last_update,
+            'updates': self.updates,
+            'generation': self.generation()
+        }
+        self.published_pending = pending
+        temp = self.state_path.with_name(self.state_path.name + '.tmp')
+        with open(temp, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(temp, self.state_path)
+
+    def _start_observer(self):
+        watcher = self
+
+        class ManifestHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # Manifest writes (CC sync renames them into place) and library folders coming and going
+                paths = (event.src_path, getattr(event, 'dest_path', ''))
+                if event.is_directory or any(os.path.basename(p) == 'manifest' for p in paths):
+                    watcher.note_change()
+
+        roots = [self.base_path / sub_path for sub_path in ("creative_cloud/dcx", "collaborated/dcx")]
+        roots = [root for root in roots if root.exists()]
+        if not roots:
+            return None
+        observer = Observer()
+        for root in roots:
+            observer.schedule(ManifestHandler(), str(root), recursive=True)
+        observer.start()
+        return observer
+
+    def run(self):
+        """Run until stop() or SIGINT/SIGTERM."""
+        print(f"👀 Watching {self.base_path} ({'polling' if self.use_polling else 'watchdog'})")
+        self.update()
+        observer = None if self.use_polling else self._start_observer()
+        if observer is None and not self.use_polling:
+            print("⚠️  No library folders to watch yet, polling instead")
+            self.use_polling = True
+        signatures = scan_manifests(self.base_path) if self.use_polling else None
+        next_poll = next_beat = time.monotonic()
+        try:
+            while not self.stopping.is_set():
+                now = time.monotonic()
+                if self.use_polling and now >= next_poll:
+                    current = scan_manifests(self.base_path)
+                    if current != signatures:
+                        signatures = current
+                        self.note_change()
+                    next_poll = now + self.settings['interval']
+                if self.due():
+                    self.update()
+                    next_beat = time.monotonic() + self.settings['heartbeat']
+                elif now >= next_beat or (self.first_change is not None) != self.published_pending:
+                    # Also publish a new burst right away so the converter waits for it
+                    self.write_state()
+                    next_beat = now + self.settings['heartbeat']
+                self.stopping.wait(0.25)
+        finally:
+            if observer:
+                observer.stop()
+                observer.join()
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.state_path)
+            print("👋 Index watcher stopped")
+
+    def stop(self, *_):
+        self.stopping.set()
+
+def print_status():
+    state = read_state()
+    if state is None:
+        print("ℹ️  Index watcher is not running (the converter runs `cclib update` itself)")
+        return False
+    when = time.strftime('%H:%M:%S', time.localtime((state['last_update_at'] or state['started_at']) / 1000))
+    print(f"👀 Index watcher running (pid {state['pid']}, {state['backend']})")
+    print(f"   Generation: {state['generation']}")
+    print(f"   Last update: {when} ({state['updates']} updates)")
+    print(f"   Pending changes: {'updating now' if state.get('updating') else 'yes' if state['pending'] else 'no'}")
+    return True
+
+def main():
+    """Command-line interface."""
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print("Usage:")
+        print("  python3 index_watcher.py [--poll] [--debounce S] [--interval S] [--simple-only|--enhanced-only]")
+        print("  python3 index_watcher.py status")
+        return
+    if args and args[0] == 'status':
+        sys.exit(0 if print_status() else 1)
+
+    settings = {}
+    for name in ('debounce', 'interval', 'max_delay'):
+        flag = f"--{name.replace('_', '-')}"
+        if flag in args:
+            settings[name] = float(args[args.index(flag) + 1])
+    targets = ('simple', 'enhanced')
+    if '--simple-only' in args:
+        targets = ('simple',)
+    elif '--enhanced-only' in args:
+        targets = ('enhanced',)
+
+    watcher = IndexWatcher(targets=targets, settings=settings, use_polling='--poll' in args)
+    signal.signal(signal.SIGTERM, watcher.stop)
+    signal.signal(signal.SIGINT, watcher.stop)
+    watcher.run()
+
+if __name__ == '__main__':
+    main()
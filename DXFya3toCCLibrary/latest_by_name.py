@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Precomputed newest version per element name for the web search.
+latest_by_name holds one row per element_name (its newest element and version count),
+kept current by triggers on elements, so search suggestions read one row per name instead
+of every version.
+"""
+
+# Refresh the row of one element name from elements
+_REFRESH = '''
+            DELETE FROM latest_by_name WHERE element_name = {name};
+            INSERT INTO latest_by_name (element_name, element_id, modified_at, version_count)
+            SELECT element_name, element_id, MAX(COALESCE(modified_at, 0)), COUNT(*)
+            FROM elements WHERE element_name = {name}
+            GROUP BY element_name;'''
+
+TRIGGERS = ('latest_by_name_insert', 'latest_by_name_delete', 'latest_by_name_update')
+
+def create_latest_triggers(cursor):
+    """Create the triggers that keep latest_by_name in step with elements."""
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS latest_by_name_insert AFTER INSERT ON elements BEGIN
+            {_REFRESH.format(name='new.element_name')}
+        END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS latest_by_name_delete AFTER DELETE ON elements BEGIN
+            {_REFRESH.format(name='old.element_name')}
+        END
+    ''')
+    # A rename moves the element between two names
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS latest_by_name_update
+        AFTER UPDATE OF element_name, element_id, modified_at ON elements BEGIN
+            {_REFRESH.format(name='old.element_name')}
+            {_REFRESH.format(name='new.element_name')}
+        END
+    ''')
+
+def drop_latest_triggers(cursor):
+    """Drop the triggers before a bulk load (rebuild_latest_by_name afterwards)."""
+    for name in TRIGGERS:
+        cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+
+def create_latest_by_name(cursor):
+    """Create latest_by_name and its triggers; returns True when it must be filled."""
+    exists = cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'latest_by_name'").fetchone()
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS latest_by_name (
+            element_name TEXT PRIMARY KEY,
+            element_id TEXT NOT NULL,
+            modified_at INTEGER NOT NULL,
+            version_count INTEGER NOT NULL
+        )
+    ''')
+    # Keyset pagination walks this index newest first
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_latest_modified ON latest_by_name(modified_at, element_name)
+    ''')
+    create_latest_triggers(cursor)
+    return exists is None
+
+def rebuild_latest_by_name(conn):
+    """Recompute every row from elements (after migrations and bulk loads)."""
+    with conn:
+        conn.execute('DELETE FROM latest_by_name')
+        conn.execute('''
+            INSERT INTO latest_by_name (element_name, element_id, modified_at, version_count)
+            SELECT element_name, element_id, MAX(COALESCE(modified_at, 0)), COUNT(*)
+            FROM elements
+            GROUP BY element_name
+        ''')
@@ -1,20891 +0,0 @@
-// Auto-generated library elements data
-const libraryElements = [
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "62e804f2-59df-4144-bc9e-7a199ce06328",
-    "element_name": "Untitled",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "62e804f2-59df-4144-bc9e-7a199ce06328",
-    "created": 1443748595133,
-    "modified": 1443748679661
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1d51bc46-f219-40e4-b3a7-08dbee926682",
-    "element_name": "Untitled",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "1d51bc46-f219-40e4-b3a7-08dbee926682",
-    "created": 1443748680577,
-    "modified": 1443748680607
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "74237d5b-be7a-4ade-9e40-282e3157c3e3",
-    "element_name": "C=78 M=13 Y=38 K=0",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "74237d5b-be7a-4ade-9e40-282e3157c3e3",
-    "created": 1460603902491,
-    "modified": 1460603902493
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "98a72920-06c6-4242-b191-eaa8f9542535",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp109280619487.ai",
-    "file_size": 892220,
-    "path": "98a72920-06c6-4242-b191-eaa8f9542535",
-    "created": 1478735869755,
-    "modified": 1478735869800
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "eb1c08fe-a53e-4f6e-a6ac-95606237c804",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp109527009487.ai",
-    "file_size": 34736,
-    "path": "eb1c08fe-a53e-4f6e-a6ac-95606237c804",
-    "created": 1478736280420,
-    "modified": 1478736280462
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "dd324e57-6a31-4a77-b3bc-aa235efea3ef",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp109602519487.ai",
-    "file_size": 886869,
-    "path": "dd324e57-6a31-4a77-b3bc-aa235efea3ef",
-    "created": 1478736406175,
-    "modified": 1478736406197
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "cc57436c-dbaf-4853-b47d-72a8c45c83ae",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp113487299487.ai",
-    "file_size": 34820,
-    "path": "cc57436c-dbaf-4853-b47d-72a8c45c83ae",
-    "created": 1478746962533,
-    "modified": 1478746962562
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "56856bd9-8118-44ee-8bb7-549b2b44912d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp115430909487.ai",
-    "file_size": 34449,
-    "path": "56856bd9-8118-44ee-8bb7-549b2b44912d",
-    "created": 1478750201760,
-    "modified": 1478750201800
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d776ad7b-53ff-4ff7-b6a2-0dd7fa26385b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp125502309487.ai",
-    "file_size": 10065376,
-    "path": "d776ad7b-53ff-4ff7-b6a2-0dd7fa26385b",
-    "created": 1478815614490,
-    "modified": 1478815614584
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a5c7f386-cfa3-4ee8-8591-8ee3fcb658ef",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp125526439487.ai",
-    "file_size": 895192,
-    "path": "a5c7f386-cfa3-4ee8-8591-8ee3fcb658ef",
-    "created": 1478815653923,
-    "modified": 1478815653979
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6eb02275-cba1-4213-a15d-cc4709b23cf1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp125534629487.ai",
-    "file_size": 883808,
-    "path": "6eb02275-cba1-4213-a15d-cc4709b23cf1",
-    "created": 1478815667509,
-    "modified": 1478815667533
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "38be9d0b-cacf-4769-a658-b4d49a6942c8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp145901159487.ai",
-    "file_size": 35395,
-    "path": "38be9d0b-cacf-4769-a658-b4d49a6942c8",
-    "created": 1479169566319,
-    "modified": 1479169566416
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "34771ff8-ac6b-413e-87d2-2d0891465531",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp146367279487.ai",
-    "file_size": 893257,
-    "path": "34771ff8-ac6b-413e-87d2-2d0891465531",
-    "created": 1479170343143,
-    "modified": 1479170343185
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a93a5325-fa58-448c-922f-7e306ffaecbf",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp148522029487.ai",
-    "file_size": 897792,
-    "path": "a93a5325-fa58-448c-922f-7e306ffaecbf",
-    "created": 1479173934273,
-    "modified": 1479173934327
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "bdb59717-f8cb-440e-8fd4-d07d92c43d68",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2037367143733.ai",
-    "file_size": 36947,
-    "path": "bdb59717-f8cb-440e-8fd4-d07d92c43d68",
-    "created": 1479345674114,
-    "modified": 1479345674184
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f0f313bb-a03f-4ef4-8d88-d524b176a615",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2050575943733.ai",
-    "file_size": 38459,
-    "path": "f0f313bb-a03f-4ef4-8d88-d524b176a615",
-    "created": 1479347873410,
-    "modified": 1479347873451
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b47e1866-90dc-46da-8d7b-5dbf5c1eb368",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2050988143733.ai",
-    "file_size": 41536,
-    "path": "b47e1866-90dc-46da-8d7b-5dbf5c1eb368",
-    "created": 1479347942115,
-    "modified": 1479347942156
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a300180e-06b7-4162-88f9-d3723a8b6467",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp31418691479.ai",
-    "file_size": 915921,
-    "path": "a300180e-06b7-4162-88f9-d3723a8b6467",
-    "created": 1481085482230,
-    "modified": 1481085482282
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7e63725e-651f-4125-bec5-e7d5421ad53a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp33436243143.ai",
-    "file_size": 15284137,
-    "path": "7e63725e-651f-4125-bec5-e7d5421ad53a",
-    "created": 1481088842990,
-    "modified": 1481088843054
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e0a9bac6-7f21-4521-a866-f0c16be1a32f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp36321223143.ai",
-    "file_size": 891124,
-    "path": "e0a9bac6-7f21-4521-a866-f0c16be1a32f",
-    "created": 1481093649346,
-    "modified": 1481093649381
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b222bd2b-eb22-4e89-a23d-a55e3f35a552",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp36326583143.ai",
-    "file_size": 886299,
-    "path": "b222bd2b-eb22-4e89-a23d-a55e3f35a552",
-    "created": 1481093658257,
-    "modified": 1481093658279
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "df576617-aef2-42b7-b2ed-718fdfdd933f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp36339233143.ai",
-    "file_size": 892461,
-    "path": "df576617-aef2-42b7-b2ed-718fdfdd933f",
-    "created": 1481093679353,
-    "modified": 1481093679371
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "fe0f7d49-94e7-43d3-bf6e-5c3b6ec80777",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp979931229823.ai",
-    "file_size": 35607,
-    "path": "fe0f7d49-94e7-43d3-bf6e-5c3b6ec80777",
-    "created": 1486607295410,
-    "modified": 1486607295448
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "902bebc5-5e84-4de0-b161-b9deb538aa79",
-    "element_name": "R=13 G=85 B=128",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "902bebc5-5e84-4de0-b161-b9deb538aa79",
-    "created": 1487881387207,
-    "modified": 1487881387208
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "42f42462-bc03-4d22-8580-7fb18ba7444d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp12824404083.ai",
-    "file_size": 909466,
-    "path": "42f42462-bc03-4d22-8580-7fb18ba7444d",
-    "created": 1491287120326,
-    "modified": 1491287120370
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2fa101a7-f4ad-4c89-af95-6b4b1f34e6f7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp13156694083.ai",
-    "file_size": 911302,
-    "path": "2fa101a7-f4ad-4c89-af95-6b4b1f34e6f7",
-    "created": 1491287672231,
-    "modified": 1491287672271
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a343b97c-3cc9-40ae-8791-59929d2aa06b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp13243364083.ai",
-    "file_size": 914024,
-    "path": "a343b97c-3cc9-40ae-8791-59929d2aa06b",
-    "created": 1491287816684,
-    "modified": 1491287816701
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b54993dd-3939-4cfa-9e28-3ebcfbd1c7e5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp23267704083.ai",
-    "file_size": 889027,
-    "path": "b54993dd-3939-4cfa-9e28-3ebcfbd1c7e5",
-    "created": 1491304523211,
-    "modified": 1491304523244
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "55527c3c-ffc6-4727-8634-bcfb95a5f820",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp40487454083.ai",
-    "file_size": 891262,
-    "path": "55527c3c-ffc6-4727-8634-bcfb95a5f820",
-    "created": 1491448731019,
-    "modified": 1491448731082
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c960b1db-a1cb-4dcc-9f77-77834651ba47",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp48491694083.ai",
-    "file_size": 919299,
-    "path": "c960b1db-a1cb-4dcc-9f77-77834651ba47",
-    "created": 1491464249574,
-    "modified": 1491464249648
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "edc4bd6e-4928-4207-8da9-bb03d21e29aa",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp9831212762.ai",
-    "file_size": 920395,
-    "path": "edc4bd6e-4928-4207-8da9-bb03d21e29aa",
-    "created": 1491544866999,
-    "modified": 1491544867052
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "04cbef6c-f49f-4029-9846-561832fbf80e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp9902022762.ai",
-    "file_size": 912801,
-    "path": "04cbef6c-f49f-4029-9846-561832fbf80e",
-    "created": 1491544984907,
-    "modified": 1491544984959
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a81c3689-be27-4404-9411-62ed4845c0b3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp9913542762.ai",
-    "file_size": 912460,
-    "path": "a81c3689-be27-4404-9411-62ed4845c0b3",
-    "created": 1491545004108,
-    "modified": 1491545004165
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1aaa0ded-aabc-48bc-a338-8615d4efa7f0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp11753022762.ai",
-    "file_size": 920728,
-    "path": "1aaa0ded-aabc-48bc-a338-8615d4efa7f0",
-    "created": 1491548069856,
-    "modified": 1491548069889
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "195ee0fc-288d-450d-a553-330c4743420c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp11770682762.ai",
-    "file_size": 903566,
-    "path": "195ee0fc-288d-450d-a553-330c4743420c",
-    "created": 1491548099270,
-    "modified": 1491548099305
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a2dd09c9-8827-45e9-a1c9-62fdf6a1b0e0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp13392632762.ai",
-    "file_size": 58039,
-    "path": "a2dd09c9-8827-45e9-a1c9-62fdf6a1b0e0",
-    "created": 1491805268312,
-    "modified": 1491805268351
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4ca25b6b-6bac-43d3-b5f4-798990f5aca3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp22036444661.ai",
-    "file_size": 55734,
-    "path": "4ca25b6b-6bac-43d3-b5f4-798990f5aca3",
-    "created": 1491875996650,
-    "modified": 1491875996703
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d93f4f1c-69fd-4970-bcf7-0ae639a419f7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp22302824661.ai",
-    "file_size": 54972,
-    "path": "d93f4f1c-69fd-4970-bcf7-0ae639a419f7",
-    "created": 1491876440567,
-    "modified": 1491876440606
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2e9fadf4-59b1-44f7-b02f-ad3edf3392a3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp22389784661.ai",
-    "file_size": 56068,
-    "path": "2e9fadf4-59b1-44f7-b02f-ad3edf3392a3",
-    "created": 1491876585529,
-    "modified": 1491876585575
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ca156636-9a63-4070-814e-52f94a743088",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp22445144661.ai",
-    "file_size": 57295,
-    "path": "ca156636-9a63-4070-814e-52f94a743088",
-    "created": 1491876677820,
-    "modified": 1491876677865
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b48a51b1-f82e-46d2-99a0-a57108faa818",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp22500274661.ai",
-    "file_size": 55506,
-    "path": "b48a51b1-f82e-46d2-99a0-a57108faa818",
-    "created": 1491876769676,
-    "modified": 1491876769691
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "80b05de7-b41a-4e02-b85f-b6e71a97520f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp22593204661.ai",
-    "file_size": 56676,
-    "path": "80b05de7-b41a-4e02-b85f-b6e71a97520f",
-    "created": 1491876924552,
-    "modified": 1491876924584
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ea8fd957-7873-4542-b307-23d75360cf77",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp22632614661.ai",
-    "file_size": 56085,
-    "path": "ea8fd957-7873-4542-b307-23d75360cf77",
-    "created": 1491876990217,
-    "modified": 1491876990256
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4bbb1db3-36e9-4439-bc78-810f6c50a377",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2021791236570.ai",
-    "file_size": 888907,
-    "path": "4bbb1db3-36e9-4439-bc78-810f6c50a377",
-    "created": 1492667550345,
-    "modified": 1492667550382
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d0957152-c3e4-4648-a782-dd887453870d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2145769536570.ai",
-    "file_size": 3255118,
-    "path": "d0957152-c3e4-4648-a782-dd887453870d",
-    "created": 1492741344497,
-    "modified": 1492741344600
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "01e7d3e1-eabc-4d14-ad53-44cd85f17859",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2146429736570.ai",
-    "file_size": 889071,
-    "path": "01e7d3e1-eabc-4d14-ad53-44cd85f17859",
-    "created": 1492741453902,
-    "modified": 1492741453936
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "69a3b824-24c4-4da8-be89-18a3972e344b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2148993136570.ai",
-    "file_size": 908179,
-    "path": "69a3b824-24c4-4da8-be89-18a3972e344b",
-    "created": 1492741881207,
-    "modified": 1492741881243
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "356147ab-28b4-4051-abab-f13cdae5cbfe",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2150087536570.ai",
-    "file_size": 57784,
-    "path": "356147ab-28b4-4051-abab-f13cdae5cbfe",
-    "created": 1492742063551,
-    "modified": 1492742063587
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "bb4b6c57-a462-48cf-9c82-83c617f5460a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2151695836570.ai",
-    "file_size": 3304838,
-    "path": "bb4b6c57-a462-48cf-9c82-83c617f5460a",
-    "created": 1492742332433,
-    "modified": 1492742332487
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "46ed5d5e-cfe8-4f6c-9635-6e0cc28a1bfd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2152069036570.ai",
-    "file_size": 892674,
-    "path": "46ed5d5e-cfe8-4f6c-9635-6e0cc28a1bfd",
-    "created": 1492742393769,
-    "modified": 1492742393799
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1424d46e-79fc-4dfd-8a5f-0ba73521ef72",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3619193036570.ai",
-    "file_size": 1303326,
-    "path": "1424d46e-79fc-4dfd-8a5f-0ba73521ef72",
-    "created": 1493161533173,
-    "modified": 1493161533350
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "23f7ee93-eaa8-4b94-8d30-3ce3afdad250",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3689275836570.ai",
-    "file_size": 2513897,
-    "path": "23f7ee93-eaa8-4b94-8d30-3ce3afdad250",
-    "created": 1493176418024,
-    "modified": 1493176418163
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f30ccb8b-bfae-46be-8240-f8431ad220bd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4720742093944.ai",
-    "file_size": 885240,
-    "path": "f30ccb8b-bfae-46be-8240-f8431ad220bd",
-    "created": 1493671385838,
-    "modified": 1493671385899
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9633aab1-9c87-49df-9774-f55afbb380c3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4721836293944.ai",
-    "file_size": 886288,
-    "path": "9633aab1-9c87-49df-9774-f55afbb380c3",
-    "created": 1493671567547,
-    "modified": 1493671567574
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "94067e9b-5168-46c7-867d-a6df21967769",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5005056093944.ai",
-    "file_size": 886302,
-    "path": "94067e9b-5168-46c7-867d-a6df21967769",
-    "created": 1493763594350,
-    "modified": 1493763594432
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "38c76723-628d-459c-999b-45ae9ba53dc0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7506861380.ai",
-    "file_size": 48521,
-    "path": "38c76723-628d-459c-999b-45ae9ba53dc0",
-    "created": 1494220840942,
-    "modified": 1494220840972
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "68d499f1-c58e-472d-9931-861b69034bb9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp228368305825.ai",
-    "file_size": 894001,
-    "path": "68d499f1-c58e-472d-9931-861b69034bb9",
-    "created": 1494979503556,
-    "modified": 1494979503623
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5860dff0-0779-43e4-8fc4-06981f4d03d0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp228374785825.ai",
-    "file_size": 878821,
-    "path": "5860dff0-0779-43e4-8fc4-06981f4d03d0",
-    "created": 1494979514333,
-    "modified": 1494979514362
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b7b26fee-bfcf-4f37-aece-08f6431ec144",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp228380845825.ai",
-    "file_size": 3960086,
-    "path": "b7b26fee-bfcf-4f37-aece-08f6431ec144",
-    "created": 1494979524593,
-    "modified": 1494979524639
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5f743e88-41a9-4386-b0f8-03ee930e0771",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp228450475825.ai",
-    "file_size": 908248,
-    "path": "5f743e88-41a9-4386-b0f8-03ee930e0771",
-    "created": 1494979640496,
-    "modified": 1494979640536
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9fa79815-c6c2-42b0-917b-0c297227289e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp228521955825.ai",
-    "file_size": 904786,
-    "path": "9fa79815-c6c2-42b0-917b-0c297227289e",
-    "created": 1494979759618,
-    "modified": 1494979759642
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2f72b8a7-4e8c-498c-b8b5-333307d59e7a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp283376695825.ai",
-    "file_size": 907910,
-    "path": "2f72b8a7-4e8c-498c-b8b5-333307d59e7a",
-    "created": 1495083435527,
-    "modified": 1495083435581
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d72cf26f-f6b8-4cb1-b63b-784b593bfbbe",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3755460520325.ai",
-    "file_size": 915453,
-    "path": "d72cf26f-f6b8-4cb1-b63b-784b593bfbbe",
-    "created": 1495413652650,
-    "modified": 1495413652733
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d65a6b09-749d-4455-bb7e-6960bff5518c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4553352020325.ai",
-    "file_size": 890308,
-    "path": "d65a6b09-749d-4455-bb7e-6960bff5518c",
-    "created": 1495601017256,
-    "modified": 1495601017324
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "43a26517-cd22-43c1-8045-84119f22483c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2720873224307.ai",
-    "file_size": 24623994,
-    "path": "43a26517-cd22-43c1-8045-84119f22483c",
-    "created": 1498445358270,
-    "modified": 1498445358407
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4a86ff54-a444-43ab-a1b6-a15755c799e3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2720953924307.ai",
-    "file_size": 914508,
-    "path": "4a86ff54-a444-43ab-a1b6-a15755c799e3",
-    "created": 1498445368854,
-    "modified": 1498445368882
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e447ef82-c751-4017-be78-09a084b77e01",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2796812724307.ai",
-    "file_size": 889699,
-    "path": "e447ef82-c751-4017-be78-09a084b77e01",
-    "created": 1498460837148,
-    "modified": 1498460837192
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f1f93c4b-12bd-432b-925c-a4ad57a83162",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4399817460555.ai",
-    "file_size": 881233,
-    "path": "f1f93c4b-12bd-432b-925c-a4ad57a83162",
-    "created": 1498958631528,
-    "modified": 1498958631631
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "69c7fb3f-9aad-4aa6-803f-ef3839479161",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4401682560555.ai",
-    "file_size": 886120,
-    "path": "69c7fb3f-9aad-4aa6-803f-ef3839479161",
-    "created": 1498958942263,
-    "modified": 1498958942297
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b3ce556f-4dbb-47ee-8c21-a284dd9e6a1f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4414272260555.ai",
-    "file_size": 915026,
-    "path": "b3ce556f-4dbb-47ee-8c21-a284dd9e6a1f",
-    "created": 1498961040602,
-    "modified": 1498961040650
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "559da75a-9579-4021-9f7f-dd9397f595b5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4415866760555.ai",
-    "file_size": 912610,
-    "path": "559da75a-9579-4021-9f7f-dd9397f595b5",
-    "created": 1498961306321,
-    "modified": 1498961306353
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d4526f9f-4210-4a67-9be2-4578c20b66c8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4416478360555.ai",
-    "file_size": 912610,
-    "path": "d4526f9f-4210-4a67-9be2-4578c20b66c8",
-    "created": 1498961408305,
-    "modified": 1498961408334
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "eff00405-2865-4359-afed-b63d66d01e79",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4419734360555.ai",
-    "file_size": 884915,
-    "path": "eff00405-2865-4359-afed-b63d66d01e79",
-    "created": 1498961950760,
-    "modified": 1498961950802
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "58ba67f3-b647-4a91-96c5-7ac7be1840b5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4428026660555.ai",
-    "file_size": 976371,
-    "path": "58ba67f3-b647-4a91-96c5-7ac7be1840b5",
-    "created": 1498963333080,
-    "modified": 1498963333135
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ec98ec12-48b9-4bea-8056-a42551cc2263",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4463944260555.ai",
-    "file_size": 969787,
-    "path": "ec98ec12-48b9-4bea-8056-a42551cc2263",
-    "created": 1499055985242,
-    "modified": 1499055985334
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9a10eb92-46e8-44cc-816f-bd489ce508e5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp236514006807.ai",
-    "file_size": 899564,
-    "path": "9a10eb92-46e8-44cc-816f-bd489ce508e5",
-    "created": 1500386591378,
-    "modified": 1500386591428
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d75a59d4-f858-4782-b34d-f3fa87e42ad3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp236517036807.ai",
-    "file_size": 905665,
-    "path": "d75a59d4-f858-4782-b34d-f3fa87e42ad3",
-    "created": 1500386596400,
-    "modified": 1500386596440
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3f8d722c-14a8-4d9a-87f3-694f9ccb8ba8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp236575556807.ai",
-    "file_size": 891109,
-    "path": "3f8d722c-14a8-4d9a-87f3-694f9ccb8ba8",
-    "created": 1500386693883,
-    "modified": 1500386693948
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "251cb3c3-ba34-46e4-9a1a-47a0a15efdea",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp239068546807.ai",
-    "file_size": 897997,
-    "path": "251cb3c3-ba34-46e4-9a1a-47a0a15efdea",
-    "created": 1500409528424,
-    "modified": 1500409528478
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1ff66256-2a74-491b-9a8f-43a2e9bf901a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp239361986807.ai",
-    "file_size": 888341,
-    "path": "1ff66256-2a74-491b-9a8f-43a2e9bf901a",
-    "created": 1500410017520,
-    "modified": 1500410017566
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "22860dcd-1690-4a1e-ba03-168dd1926dcc",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp239762076807.ai",
-    "file_size": 888338,
-    "path": "22860dcd-1690-4a1e-ba03-168dd1926dcc",
-    "created": 1500410684308,
-    "modified": 1500410684365
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8ccacf4d-8ad5-4f80-979e-bf8c5304a906",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp247834856807.ai",
-    "file_size": 1116343,
-    "path": "8ccacf4d-8ad5-4f80-979e-bf8c5304a906",
-    "created": 1500424138939,
-    "modified": 1500424138992
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "07571bea-6fa2-46f3-9f8c-923186ac23b0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp247878286807.ai",
-    "file_size": 1071392,
-    "path": "07571bea-6fa2-46f3-9f8c-923186ac23b0",
-    "created": 1500424211251,
-    "modified": 1500424211314
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "eb851110-71d5-4f56-93ef-b2de91576380",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp247899866807.ai",
-    "file_size": 909012,
-    "path": "eb851110-71d5-4f56-93ef-b2de91576380",
-    "created": 1500424247202,
-    "modified": 1500424247265
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7162d351-e8fa-4ed3-b439-f1f414481a36",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp253406516807.ai",
-    "file_size": 895124,
-    "path": "7162d351-e8fa-4ed3-b439-f1f414481a36",
-    "created": 1500441396423,
-    "modified": 1500441396465
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "228d4d27-fd59-49ca-971d-4a072de84042",
-    "element_name": "C=88 M=60 Y=38 K=18",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "228d4d27-fd59-49ca-971d-4a072de84042",
-    "created": 1501030984559,
-    "modified": 1501030984586
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "96f8640d-c31a-4b95-8226-655cfd7a06cc",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp86441424672.ai",
-    "file_size": 57111,
-    "path": "96f8640d-c31a-4b95-8226-655cfd7a06cc",
-    "created": 1510018898754,
-    "modified": 1510018898845
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6568432a-22e7-4032-8228-bb73b4a57418",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp86739594672.ai",
-    "file_size": 93063,
-    "path": "6568432a-22e7-4032-8228-bb73b4a57418",
-    "created": 1510019395552,
-    "modified": 1510019395582
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a55caf85-5b29-456d-ad90-50fe2e94d504",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp86781594672.ai",
-    "file_size": 58194,
-    "path": "a55caf85-5b29-456d-ad90-50fe2e94d504",
-    "created": 1510019465522,
-    "modified": 1510019465559
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "dc751dac-9803-4d84-8283-686fb010526f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp96315374672.ai",
-    "file_size": 899840,
-    "path": "dc751dac-9803-4d84-8283-686fb010526f",
-    "created": 1510035354775,
-    "modified": 1510035354834
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "bfb08370-a2e8-4235-8ae1-b6dac271685b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp96372134672.ai",
-    "file_size": 894065,
-    "path": "bfb08370-a2e8-4235-8ae1-b6dac271685b",
-    "created": 1510035449185,
-    "modified": 1510035449238
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7bbac55d-9fb3-4ae2-b768-a28b1c317591",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp96420444672.ai",
-    "file_size": 906239,
-    "path": "7bbac55d-9fb3-4ae2-b768-a28b1c317591",
-    "created": 1510035529683,
-    "modified": 1510035529724
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "64b341e2-6f38-40ef-a17c-922e295eea22",
-    "element_name": "C=0 M=0 Y=0 K=0",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "64b341e2-6f38-40ef-a17c-922e295eea22",
-    "created": 1525838678445,
-    "modified": 1525838678449
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6cd7482a-922e-4094-ba18-31734f2f9920",
-    "element_name": "R=3 G=147 B=71",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "6cd7482a-922e-4094-ba18-31734f2f9920",
-    "created": 1527578898621,
-    "modified": 1527578898624
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6f7a8575-a35e-4f7f-b869-a5b67bb8ad1c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8224300466397.ai",
-    "file_size": 952397,
-    "path": "6f7a8575-a35e-4f7f-b869-a5b67bb8ad1c",
-    "created": 1554293379850,
-    "modified": 1554293379896
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e4544a7a-a57b-4b43-aee9-f6be8bb50a46",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp31071896226.ai",
-    "file_size": 1134864,
-    "path": "e4544a7a-a57b-4b43-aee9-f6be8bb50a46",
-    "created": 1555456869338,
-    "modified": 1555456869371
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "acdf0236-f9f8-438e-8484-df3bd6569cb2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp31105396226.ai",
-    "file_size": 3529580,
-    "path": "acdf0236-f9f8-438e-8484-df3bd6569cb2",
-    "created": 1555456925587,
-    "modified": 1555456925622
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b995c6f4-b0fe-466c-8104-140f99bca848",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp31132786226.ai",
-    "file_size": 38670,
-    "path": "b995c6f4-b0fe-466c-8104-140f99bca848",
-    "created": 1555456970474,
-    "modified": 1555456970500
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d74b0d45-e18d-46dc-a2a3-5309c3b9b7e1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp536251041823.ai",
-    "file_size": 4459096,
-    "path": "d74b0d45-e18d-46dc-a2a3-5309c3b9b7e1",
-    "created": 1556542338702,
-    "modified": 1556542338732
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "fcbbbd36-8673-4488-a6bc-e3bf8ca57e1c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp29198704113.ai",
-    "file_size": 50971,
-    "path": "fcbbbd36-8673-4488-a6bc-e3bf8ca57e1c",
-    "created": 1557432405746,
-    "modified": 1557432405771
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4d226377-fbfb-44ad-b8f2-eee1a77c298a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp31629234113.ai",
-    "file_size": 43033,
-    "path": "4d226377-fbfb-44ad-b8f2-eee1a77c298a",
-    "created": 1557436456579,
-    "modified": 1557436456593
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "68dbff7f-be43-425b-bd7c-ceca0d175de6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp31702944113.ai",
-    "file_size": 42658,
-    "path": "68dbff7f-be43-425b-bd7c-ceca0d175de6",
-    "created": 1557436579418,
-    "modified": 1557436579447
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "fe8706c5-fd97-4ea7-961d-911536e98f59",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp31726024113.ai",
-    "file_size": 49159,
-    "path": "fe8706c5-fd97-4ea7-961d-911536e98f59",
-    "created": 1557436617843,
-    "modified": 1557436617865
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e3c143ac-a396-4e88-b993-2ce2995c644c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp31847294113.ai",
-    "file_size": 38816,
-    "path": "e3c143ac-a396-4e88-b993-2ce2995c644c",
-    "created": 1557436820010,
-    "modified": 1557436820033
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0bfbd335-177e-4dc9-aff7-08f1dcb4ae36",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp31917004113.ai",
-    "file_size": 48458,
-    "path": "0bfbd335-177e-4dc9-aff7-08f1dcb4ae36",
-    "created": 1557436936177,
-    "modified": 1557436936200
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "53d17c01-39c0-4137-a0bc-768df4392a08",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp31928024113.ai",
-    "file_size": 52422,
-    "path": "53d17c01-39c0-4137-a0bc-768df4392a08",
-    "created": 1557436954563,
-    "modified": 1557436954571
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7f4ad751-505d-4e06-8d79-40567da8590c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp64774879324.ai",
-    "file_size": 1366410,
-    "path": "7f4ad751-505d-4e06-8d79-40567da8590c",
-    "created": 1557891710214,
-    "modified": 1557891710249
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "773b3752-7b8d-4eee-b992-b0b8c3b2d47b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp64794099324.ai",
-    "file_size": 895640,
-    "path": "773b3752-7b8d-4eee-b992-b0b8c3b2d47b",
-    "created": 1557891742156,
-    "modified": 1557891742184
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "fb147ecd-e49e-4596-880f-1bd3a879b8ae",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp67748019324.ai",
-    "file_size": 1454419,
-    "path": "fb147ecd-e49e-4596-880f-1bd3a879b8ae",
-    "created": 1557896665518,
-    "modified": 1557896665543
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5f8b1fbe-5fb8-43c1-96df-13446d427ae8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp67998369324.ai",
-    "file_size": 908250,
-    "path": "5f8b1fbe-5fb8-43c1-96df-13446d427ae8",
-    "created": 1557897082684,
-    "modified": 1557897082710
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b26945e9-c27a-4d72-8884-1f3c01162a71",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp68007149324.ai",
-    "file_size": 1824723,
-    "path": "b26945e9-c27a-4d72-8884-1f3c01162a71",
-    "created": 1557897097431,
-    "modified": 1557897097457
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "786a5fc3-7fbb-44c3-8cc7-37a7599013ac",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp68012419324.ai",
-    "file_size": 1824723,
-    "path": "786a5fc3-7fbb-44c3-8cc7-37a7599013ac",
-    "created": 1557897106269,
-    "modified": 1557897106299
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f5818533-2e0b-41da-9590-e3e775557647",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp68066949324.ai",
-    "file_size": 2214298,
-    "path": "f5818533-2e0b-41da-9590-e3e775557647",
-    "created": 1557897197159,
-    "modified": 1557897197193
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d206afa4-9dd8-4700-87a8-0a6465725776",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp68726829324.ai",
-    "file_size": 1421980,
-    "path": "d206afa4-9dd8-4700-87a8-0a6465725776",
-    "created": 1557898296891,
-    "modified": 1557898296901
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "04c95f82-bab9-42cb-bacb-c5fd68bee7b2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2354875639983.ai",
-    "file_size": 885513,
-    "path": "04c95f82-bab9-42cb-bacb-c5fd68bee7b2",
-    "created": 1559127661188,
-    "modified": 1559127661215
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1c0c6e3e-7a48-4afb-b412-8ff274fdcc89",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2394049739983.ai",
-    "file_size": 889115,
-    "path": "1c0c6e3e-7a48-4afb-b412-8ff274fdcc89",
-    "created": 1559192398864,
-    "modified": 1559192398907
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "90d13257-ce52-4fe7-9802-b5b549ce78f6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2408996139983.ai",
-    "file_size": 882322,
-    "path": "90d13257-ce52-4fe7-9802-b5b549ce78f6",
-    "created": 1559197592790,
-    "modified": 1559197592806
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "652bc745-e62e-42c5-9bdc-ec3dfc82ba2c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2409127739983.ai",
-    "file_size": 880890,
-    "path": "652bc745-e62e-42c5-9bdc-ec3dfc82ba2c",
-    "created": 1559197614719,
-    "modified": 1559197614744
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0fbb051f-0a1a-441a-8d6e-90650edbfb1e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2409290939983.ai",
-    "file_size": 880161,
-    "path": "0fbb051f-0a1a-441a-8d6e-90650edbfb1e",
-    "created": 1559197641948,
-    "modified": 1559197641978
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8b739a3b-2f4e-4f0c-8100-9f1b69bfaaa8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2416341939983.ai",
-    "file_size": 919954,
-    "path": "8b739a3b-2f4e-4f0c-8100-9f1b69bfaaa8",
-    "created": 1559198817147,
-    "modified": 1559198817159
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ca29cdea-1c32-47c6-bdda-6c493cbaba86",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2487476439983.ai",
-    "file_size": 911013,
-    "path": "ca29cdea-1c32-47c6-bdda-6c493cbaba86",
-    "created": 1559249092018,
-    "modified": 1559249092050
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "70de1706-66b8-4146-93fb-cbe0d2f5368e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2487854239983.ai",
-    "file_size": 894506,
-    "path": "70de1706-66b8-4146-93fb-cbe0d2f5368e",
-    "created": 1559249154723,
-    "modified": 1559249154753
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e94d46a0-304a-44e7-b2b9-501cd0250956",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2490897539983.ai",
-    "file_size": 6510619,
-    "path": "e94d46a0-304a-44e7-b2b9-501cd0250956",
-    "created": 1559249662606,
-    "modified": 1559249662649
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f12fcb8a-df0e-44fb-beb6-50f2937e3476",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2492317139983.ai",
-    "file_size": 904894,
-    "path": "f12fcb8a-df0e-44fb-beb6-50f2937e3476",
-    "created": 1559249898601,
-    "modified": 1559249898629
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "729d84ea-8895-4211-ad3d-0e65c7988b27",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp76402002900.ai",
-    "file_size": 42831,
-    "path": "729d84ea-8895-4211-ad3d-0e65c7988b27",
-    "created": 1559621478597,
-    "modified": 1559621478626
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "726c6dfd-371b-4da2-991f-b7225f90bd6f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp930629614370.ai",
-    "file_size": 53342,
-    "path": "726c6dfd-371b-4da2-991f-b7225f90bd6f",
-    "created": 1559649247487,
-    "modified": 1559649247519
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b2ecdf02-f4f2-4fa2-84ee-753dec600db0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1083903816046.ai",
-    "file_size": 1261389,
-    "path": "b2ecdf02-f4f2-4fa2-84ee-753dec600db0",
-    "created": 1559714690913,
-    "modified": 1559714690935
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4a89c28a-3813-4e45-aebb-a21f50ac245b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1084011216046.ai",
-    "file_size": 1181365,
-    "path": "4a89c28a-3813-4e45-aebb-a21f50ac245b",
-    "created": 1559714708791,
-    "modified": 1559714708799
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "100a9663-8d97-41c8-bc9d-f35ac4e3f6b4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1084119416046.ai",
-    "file_size": 1138083,
-    "path": "100a9663-8d97-41c8-bc9d-f35ac4e3f6b4",
-    "created": 1559714726821,
-    "modified": 1559714726828
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f6e2145b-50b6-43ce-afc6-6eacbf1e2da4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1085064216046.ai",
-    "file_size": 842997,
-    "path": "f6e2145b-50b6-43ce-afc6-6eacbf1e2da4",
-    "created": 1559714884239,
-    "modified": 1559714884246
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2edddc89-4fd9-467b-8ea1-7c508a84d8a6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1085748516046.ai",
-    "file_size": 57482,
-    "path": "2edddc89-4fd9-467b-8ea1-7c508a84d8a6",
-    "created": 1559714998228,
-    "modified": 1559714998242
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "fea7a4fc-bf46-4a5c-94f5-4bca5afaae1d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1088580616046.ai",
-    "file_size": 857803,
-    "path": "fea7a4fc-bf46-4a5c-94f5-4bca5afaae1d",
-    "created": 1559715471419,
-    "modified": 1559715471431
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6a4791a8-d19d-462e-9cd0-020de7963760",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1089329416046.ai",
-    "file_size": 3510795,
-    "path": "6a4791a8-d19d-462e-9cd0-020de7963760",
-    "created": 1559715595373,
-    "modified": 1559715595386
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a65805f8-f4de-4bf4-a1a6-751c1a03e9fb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp52704264.ai",
-    "file_size": 48233,
-    "path": "a65805f8-f4de-4bf4-a1a6-751c1a03e9fb",
-    "created": 1559765062057,
-    "modified": 1559765062072
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "cbf56ecd-9fe5-462d-bd43-35592f12b447",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp70629264.ai",
-    "file_size": 48233,
-    "path": "cbf56ecd-9fe5-462d-bd43-35592f12b447",
-    "created": 1559765360679,
-    "modified": 1559765360684
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4e23cc8b-2aa9-4460-9ffc-c2330741f19b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2621842264.ai",
-    "file_size": 367611,
-    "path": "4e23cc8b-2aa9-4460-9ffc-c2330741f19b",
-    "created": 1559823878175,
-    "modified": 1559823878203
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6cc13eca-2f9d-4b9c-9fd4-c55098e58e4f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3598237264.ai",
-    "file_size": 38673,
-    "path": "6cc13eca-2f9d-4b9c-9fd4-c55098e58e4f",
-    "created": 1559878848572,
-    "modified": 1559878848595
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6dff0eec-52a9-4c09-a3a5-4419e106cdc0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3635260264.ai",
-    "file_size": 38674,
-    "path": "6dff0eec-52a9-4c09-a3a5-4419e106cdc0",
-    "created": 1559879465554,
-    "modified": 1559879465560
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6f4aaf0c-da1d-495a-be17-93489a9f13ab",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3659669264.ai",
-    "file_size": 956093,
-    "path": "6f4aaf0c-da1d-495a-be17-93489a9f13ab",
-    "created": 1559879872401,
-    "modified": 1559879872409
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "681c2497-258c-4211-b2a6-407bcb0ca1a0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3831841264.ai",
-    "file_size": 38673,
-    "path": "681c2497-258c-4211-b2a6-407bcb0ca1a0",
-    "created": 1559882741946,
-    "modified": 1559882741968
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c2e8b5e5-6b90-4634-ae23-21309d43ddef",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4381889323.ai",
-    "file_size": 38696,
-    "path": "c2e8b5e5-6b90-4634-ae23-21309d43ddef",
-    "created": 1560474723590,
-    "modified": 1560474723694
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7ca27257-cd46-4697-ba0f-2e0a1779a5f8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1228373614113.ai",
-    "file_size": 906526,
-    "path": "7ca27257-cd46-4697-ba0f-2e0a1779a5f8",
-    "created": 1562710296366,
-    "modified": 1562710296394
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "735385ef-a2b5-4ac6-8890-f45394e3112e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1228496514113.ai",
-    "file_size": 906526,
-    "path": "735385ef-a2b5-4ac6-8890-f45394e3112e",
-    "created": 1562710316815,
-    "modified": 1562710316845
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2f261a71-6a4e-4841-86d8-a7cddd0b6dd2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1229099814113.ai",
-    "file_size": 894747,
-    "path": "2f261a71-6a4e-4841-86d8-a7cddd0b6dd2",
-    "created": 1562710417398,
-    "modified": 1562710417421
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d07eeeaa-eb32-4576-8c24-0ea3d882e720",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1250936714113.ai",
-    "file_size": 890486,
-    "path": "d07eeeaa-eb32-4576-8c24-0ea3d882e720",
-    "created": 1562714056839,
-    "modified": 1562714056846
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "12888116-644e-4604-91ba-91b6a646add6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1279048314113.ai",
-    "file_size": 891080,
-    "path": "12888116-644e-4604-91ba-91b6a646add6",
-    "created": 1562718742234,
-    "modified": 1562718742267
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a65b007f-bc71-4112-9461-3317a9227be1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1285862214113.ai",
-    "file_size": 1029371,
-    "path": "a65b007f-bc71-4112-9461-3317a9227be1",
-    "created": 1562719877954,
-    "modified": 1562719877971
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "44847416-f56b-40bc-8602-30e0a8c6ebdb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1286240714113.ai",
-    "file_size": 892290,
-    "path": "44847416-f56b-40bc-8602-30e0a8c6ebdb",
-    "created": 1562719940916,
-    "modified": 1562719940924
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f1f63967-6fdc-48a5-902c-07ed30d21eda",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1286287514113.ai",
-    "file_size": 885672,
-    "path": "f1f63967-6fdc-48a5-902c-07ed30d21eda",
-    "created": 1562719948709,
-    "modified": 1562719948733
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5c61ecdb-6b67-4b13-a720-cf969c4b0b39",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1286501714113.ai",
-    "file_size": 885358,
-    "path": "5c61ecdb-6b67-4b13-a720-cf969c4b0b39",
-    "created": 1562719984419,
-    "modified": 1562719984446
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c4a3e1ad-63cf-4b74-b788-4cf0361a2dd3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1294614014113.ai",
-    "file_size": 1015526,
-    "path": "c4a3e1ad-63cf-4b74-b788-4cf0361a2dd3",
-    "created": 1562721336595,
-    "modified": 1562721336603
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a23c5c65-0d93-4d91-8a6a-51cb4740f783",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1297142114113.ai",
-    "file_size": 945074,
-    "path": "a23c5c65-0d93-4d91-8a6a-51cb4740f783",
-    "created": 1562721757870,
-    "modified": 1562721757893
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a0d07ab4-9503-47f7-ab57-0d35a009b41f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1530082314113.ai",
-    "file_size": 894197,
-    "path": "a0d07ab4-9503-47f7-ab57-0d35a009b41f",
-    "created": 1562877822667,
-    "modified": 1562877822757
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3d84881b-bb2a-480a-866f-12d77714e2a6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1538516414113.ai",
-    "file_size": 904587,
-    "path": "3d84881b-bb2a-480a-866f-12d77714e2a6",
-    "created": 1562879228434,
-    "modified": 1562879228444
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c180b665-343d-45a5-8b3a-912c220c52f0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1541196014113.ai",
-    "file_size": 908549,
-    "path": "c180b665-343d-45a5-8b3a-912c220c52f0",
-    "created": 1562879674977,
-    "modified": 1562879674992
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "df11089f-43f8-4b97-953a-b211be714274",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1576025614113.ai",
-    "file_size": 890995,
-    "path": "df11089f-43f8-4b97-953a-b211be714274",
-    "created": 1562893202766,
-    "modified": 1562893202801
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9c5d5206-dbcd-41b8-a84d-c0911bb94863",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1584892514113.ai",
-    "file_size": 905347,
-    "path": "9c5d5206-dbcd-41b8-a84d-c0911bb94863",
-    "created": 1562894680649,
-    "modified": 1562894680662
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "49807b63-e922-4b3a-ab37-7bda8cddf64b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1587203914113.ai",
-    "file_size": 905347,
-    "path": "49807b63-e922-4b3a-ab37-7bda8cddf64b",
-    "created": 1562895065886,
-    "modified": 1562895065922
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a227826c-dc38-4cf7-b419-a1885b34a58d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1768805124179.ai",
-    "file_size": 942226,
-    "path": "a227826c-dc38-4cf7-b419-a1885b34a58d",
-    "created": 1563162192183,
-    "modified": 1563162192198
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "83b81c24-6fde-4915-b6aa-ee95caa3a0b3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1770361924179.ai",
-    "file_size": 952069,
-    "path": "83b81c24-6fde-4915-b6aa-ee95caa3a0b3",
-    "created": 1563162451672,
-    "modified": 1563162451697
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b53791fb-4891-4721-be7b-078dcccff86d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1770510924179.ai",
-    "file_size": 883621,
-    "path": "b53791fb-4891-4721-be7b-078dcccff86d",
-    "created": 1563162476458,
-    "modified": 1563162476487
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c2625867-7eb1-4a91-b4d8-8339ad0498a8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1770616824179.ai",
-    "file_size": 883625,
-    "path": "c2625867-7eb1-4a91-b4d8-8339ad0498a8",
-    "created": 1563162494090,
-    "modified": 1563162494117
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5e0d8e5c-8dc5-4f06-99b1-7b58b69f18bb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1770640024179.ai",
-    "file_size": 883625,
-    "path": "5e0d8e5c-8dc5-4f06-99b1-7b58b69f18bb",
-    "created": 1563162497958,
-    "modified": 1563162497986
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2f46a6ed-e4b0-4571-bf9a-8db83957dc82",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1771268224179.ai",
-    "file_size": 942226,
-    "path": "2f46a6ed-e4b0-4571-bf9a-8db83957dc82",
-    "created": 1563162602716,
-    "modified": 1563162602723
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d2a4f401-84a1-4b81-9aaa-82f66ce8b143",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1771435524179.ai",
-    "file_size": 884633,
-    "path": "d2a4f401-84a1-4b81-9aaa-82f66ce8b143",
-    "created": 1563162630572,
-    "modified": 1563162630599
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0f79a830-ff50-494e-b2ab-e77314be31df",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1785145424179.ai",
-    "file_size": 941333,
-    "path": "0f79a830-ff50-494e-b2ab-e77314be31df",
-    "created": 1563164915522,
-    "modified": 1563164915552
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4f48266b-669c-46d3-aea9-f9c302d5c5f1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1785219724179.ai",
-    "file_size": 943216,
-    "path": "4f48266b-669c-46d3-aea9-f9c302d5c5f1",
-    "created": 1563164927933,
-    "modified": 1563164927960
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0f52b4ca-d5b9-461b-9aa7-849aba58f0fc",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2198321130250.ai",
-    "file_size": 889792,
-    "path": "0f52b4ca-d5b9-461b-9aa7-849aba58f0fc",
-    "created": 1563240791929,
-    "modified": 1563240791956
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "50751330-dbee-4888-abec-02f783dc7324",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2352552030250.ai",
-    "file_size": 888405,
-    "path": "50751330-dbee-4888-abec-02f783dc7324",
-    "created": 1563307870634,
-    "modified": 1563307870644
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "20a00064-e0b6-486c-afbb-80f923d28a87",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2352865630250.ai",
-    "file_size": 888709,
-    "path": "20a00064-e0b6-486c-afbb-80f923d28a87",
-    "created": 1563307922944,
-    "modified": 1563307922950
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b123d72d-5035-4e0b-a65c-6aaf9729901c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2386090230250.ai",
-    "file_size": 888396,
-    "path": "b123d72d-5035-4e0b-a65c-6aaf9729901c",
-    "created": 1563313460431,
-    "modified": 1563313460448
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "412a986f-257e-424d-8d78-da8bacb8ea7d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2508630030250.ai",
-    "file_size": 928973,
-    "path": "412a986f-257e-424d-8d78-da8bacb8ea7d",
-    "created": 1563344024852,
-    "modified": 1563344024867
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "57fa4154-5386-43bf-8b07-16279af34f0f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2512476930250.ai",
-    "file_size": 928973,
-    "path": "57fa4154-5386-43bf-8b07-16279af34f0f",
-    "created": 1563344665978,
-    "modified": 1563344665984
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1dcf3f1c-f704-45df-8fed-3569ad29e699",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2686617930250.ai",
-    "file_size": 911472,
-    "path": "1dcf3f1c-f704-45df-8fed-3569ad29e699",
-    "created": 1563411281579,
-    "modified": 1563411281593
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ab9099a6-f3ec-4b81-ac82-314e2c3d9e7c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp511668210032.ai",
-    "file_size": 76714912,
-    "path": "ab9099a6-f3ec-4b81-ac82-314e2c3d9e7c",
-    "created": 1563914043043,
-    "modified": 1563914043189
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "516867d1-3473-4788-a866-205329581067",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp512093410032.ai",
-    "file_size": 1214682,
-    "path": "516867d1-3473-4788-a866-205329581067",
-    "created": 1563914113099,
-    "modified": 1563914113125
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "26a22bca-9743-4ef0-bbd2-c2ece3f16350",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp512167910032.ai",
-    "file_size": 910448,
-    "path": "26a22bca-9743-4ef0-bbd2-c2ece3f16350",
-    "created": 1563914125243,
-    "modified": 1563914125266
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b336ebb6-3ebd-4504-b0b0-e696f7600711",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp512229210032.ai",
-    "file_size": 883692,
-    "path": "b336ebb6-3ebd-4504-b0b0-e696f7600711",
-    "created": 1563914135448,
-    "modified": 1563914135474
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "327f8dd2-d30d-4575-afe5-030c24ede888",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp556911810032.ai",
-    "file_size": 76714920,
-    "path": "327f8dd2-d30d-4575-afe5-030c24ede888",
-    "created": 1563921583484,
-    "modified": 1563921583634
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "58127ab7-7eee-46ab-85e9-c8e9ac8063c4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp633883510032.ai",
-    "file_size": 912655,
-    "path": "58127ab7-7eee-46ab-85e9-c8e9ac8063c4",
-    "created": 1563947750724,
-    "modified": 1563947750735
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1f9c7c8d-0cd7-4438-9410-c943ba8c5499",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp633947410032.ai",
-    "file_size": 882308,
-    "path": "1f9c7c8d-0cd7-4438-9410-c943ba8c5499",
-    "created": 1563947761391,
-    "modified": 1563947761423
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "dfca05b1-0888-4208-b077-5eb689355e03",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp874398216218.ai",
-    "file_size": 907083,
-    "path": "dfca05b1-0888-4208-b077-5eb689355e03",
-    "created": 1564099950434,
-    "modified": 1564099950459
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a997f9c6-af55-4898-ada2-2af4467d7a66",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp874730016218.ai",
-    "file_size": 907055,
-    "path": "a997f9c6-af55-4898-ada2-2af4467d7a66",
-    "created": 1564100005754,
-    "modified": 1564100005794
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c853d0a3-21f7-4e9d-8e25-c2b3de49b32b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp874870716218.ai",
-    "file_size": 883786,
-    "path": "c853d0a3-21f7-4e9d-8e25-c2b3de49b32b",
-    "created": 1564100029179,
-    "modified": 1564100029209
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "96c5dde4-9f3d-4a14-9250-4954dda64ab2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp876011316218.ai",
-    "file_size": 884691,
-    "path": "96c5dde4-9f3d-4a14-9250-4954dda64ab2",
-    "created": 1564100219226,
-    "modified": 1564100219254
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7e22ac87-cf06-41dd-9868-121d8a10dea9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp877595016218.ai",
-    "file_size": 907043,
-    "path": "7e22ac87-cf06-41dd-9868-121d8a10dea9",
-    "created": 1564100483173,
-    "modified": 1564100483186
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1dac1f39-f3f6-4245-88e5-0d689dd60377",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp877652916218.ai",
-    "file_size": 892832,
-    "path": "1dac1f39-f3f6-4245-88e5-0d689dd60377",
-    "created": 1564100492821,
-    "modified": 1564100492845
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "68d74240-b082-42e0-b3a9-a9834aeaa7b6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp877757616218.ai",
-    "file_size": 886043,
-    "path": "68d74240-b082-42e0-b3a9-a9834aeaa7b6",
-    "created": 1564100510323,
-    "modified": 1564100510331
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7f64890b-aeab-420c-a192-7cb007fa6567",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp877871816218.ai",
-    "file_size": 907082,
-    "path": "7f64890b-aeab-420c-a192-7cb007fa6567",
-    "created": 1564100529355,
-    "modified": 1564100529368
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4f8d2c4a-7a94-431c-baa6-90e368f3289a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp887875516218.ai",
-    "file_size": 889534,
-    "path": "4f8d2c4a-7a94-431c-baa6-90e368f3289a",
-    "created": 1564102196589,
-    "modified": 1564102196611
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "461eff2a-7d46-45f3-87f5-11204095a5d2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp40629758446.ai",
-    "file_size": 883656,
-    "path": "461eff2a-7d46-45f3-87f5-11204095a5d2",
-    "created": 1564923552869,
-    "modified": 1564923552896
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "219a2e40-0d63-4fd5-85de-4dd4bcaa4d51",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp931624915156.ai",
-    "file_size": 1010397,
-    "path": "219a2e40-0d63-4fd5-85de-4dd4bcaa4d51",
-    "created": 1565092286097,
-    "modified": 1565092286126
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "50545347-2840-4933-b9c6-153f61ac8fbb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp954842215156.ai",
-    "file_size": 882712,
-    "path": "50545347-2840-4933-b9c6-153f61ac8fbb",
-    "created": 1565096155547,
-    "modified": 1565096155573
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "55ad70e8-b0a6-43c6-9f58-f481bc32c5cd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp954876515156.ai",
-    "file_size": 930452,
-    "path": "55ad70e8-b0a6-43c6-9f58-f481bc32c5cd",
-    "created": 1565096161018,
-    "modified": 1565096161043
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c7df34ce-7a58-4e2e-8661-e5b09e828044",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp956925415156.ai",
-    "file_size": 6562677,
-    "path": "c7df34ce-7a58-4e2e-8661-e5b09e828044",
-    "created": 1565096503977,
-    "modified": 1565096504015
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "53f6ae42-f950-43d1-9732-97b0592c3ea3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1150922115156.ai",
-    "file_size": 976066,
-    "path": "53f6ae42-f950-43d1-9732-97b0592c3ea3",
-    "created": 1565152907683,
-    "modified": 1565152907711
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "172a9d84-5afa-4722-873f-135b40d40b68",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1150964615156.ai",
-    "file_size": 976066,
-    "path": "172a9d84-5afa-4722-873f-135b40d40b68",
-    "created": 1565152914751,
-    "modified": 1565152914788
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5687fdb5-9860-4ba4-b8ea-d2aad316944e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1155615215156.ai",
-    "file_size": 6533058,
-    "path": "5687fdb5-9860-4ba4-b8ea-d2aad316944e",
-    "created": 1565153690929,
-    "modified": 1565153690949
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "fe727ddd-d7b5-45ca-bbf7-48f75c32e4ed",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1156621915156.ai",
-    "file_size": 2265799,
-    "path": "fe727ddd-d7b5-45ca-bbf7-48f75c32e4ed",
-    "created": 1565153857802,
-    "modified": 1565153857835
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8f9ea1d6-597a-4465-bfe1-baee99eebb96",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1157631615156.ai",
-    "file_size": 882600,
-    "path": "8f9ea1d6-597a-4465-bfe1-baee99eebb96",
-    "created": 1565154026103,
-    "modified": 1565154026120
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "893fc324-8ff7-4ed3-af41-3d9d8d14c7ab",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1157667615156.ai",
-    "file_size": 882250,
-    "path": "893fc324-8ff7-4ed3-af41-3d9d8d14c7ab",
-    "created": 1565154031805,
-    "modified": 1565154031828
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "27934b80-77d2-4c3b-a736-98f76b810b68",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2527116315156.ai",
-    "file_size": 884491,
-    "path": "27934b80-77d2-4c3b-a736-98f76b810b68",
-    "created": 1565728517849,
-    "modified": 1565728517896
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e82ce899-9197-4cbb-b42f-10a032e6c9e2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2533608415156.ai",
-    "file_size": 882695,
-    "path": "e82ce899-9197-4cbb-b42f-10a032e6c9e2",
-    "created": 1565729599576,
-    "modified": 1565729599599
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ae23a1b0-b270-498b-b3bf-573d025f6ccb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2663003815156.ai",
-    "file_size": 908322,
-    "path": "ae23a1b0-b270-498b-b3bf-573d025f6ccb",
-    "created": 1565830203407,
-    "modified": 1565830203452
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3b016cbf-5ad9-48ab-aacc-4dac7955b869",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp337459014699.ai",
-    "file_size": 2064362,
-    "path": "3b016cbf-5ad9-48ab-aacc-4dac7955b869",
-    "created": 1566246506046,
-    "modified": 1566246506075
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "dc44232a-d15c-4e94-856f-9d12c4ee2ad8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1119340414699.ai",
-    "file_size": 886930,
-    "path": "dc44232a-d15c-4e94-856f-9d12c4ee2ad8",
-    "created": 1566703260505,
-    "modified": 1566703260602
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7b206306-066e-4c98-a091-4d8da2e56711",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1120129414699.ai",
-    "file_size": 2291948,
-    "path": "7b206306-066e-4c98-a091-4d8da2e56711",
-    "created": 1566703392444,
-    "modified": 1566703392456
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e82493aa-32ff-40a9-8516-41fb8d0eb822",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2301128626497.ai",
-    "file_size": 911148,
-    "path": "e82493aa-32ff-40a9-8516-41fb8d0eb822",
-    "created": 1567111205246,
-    "modified": 1567111205348
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d571cc2a-b72f-4bc4-b136-bc80a03db848",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2302949826497.ai",
-    "file_size": 911217,
-    "path": "d571cc2a-b72f-4bc4-b136-bc80a03db848",
-    "created": 1567111508518,
-    "modified": 1567111508580
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6880a70e-66d9-41b1-8106-fa6636e4f0ed",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2303178526497.ai",
-    "file_size": 910647,
-    "path": "6880a70e-66d9-41b1-8106-fa6636e4f0ed",
-    "created": 1567111546656,
-    "modified": 1567111546664
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "26e2ed34-e5d7-40aa-9556-5cb7699a19c0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2303472426497.ai",
-    "file_size": 911225,
-    "path": "26e2ed34-e5d7-40aa-9556-5cb7699a19c0",
-    "created": 1567111595628,
-    "modified": 1567111595637
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8978846e-ccb5-46f2-afa0-528456a0e2dc",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2304024226497.ai",
-    "file_size": 883428,
-    "path": "8978846e-ccb5-46f2-afa0-528456a0e2dc",
-    "created": 1567111687259,
-    "modified": 1567111687267
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5fb407c2-363e-4f0a-983f-f1f455454124",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2306110026497.ai",
-    "file_size": 883428,
-    "path": "5fb407c2-363e-4f0a-983f-f1f455454124",
-    "created": 1567112034915,
-    "modified": 1567112034972
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "49a3759f-76ae-443b-ad11-470a5e43e7c9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2383220626497.ai",
-    "file_size": 2334524,
-    "path": "49a3759f-76ae-443b-ad11-470a5e43e7c9",
-    "created": 1567130727032,
-    "modified": 1567130727049
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8e927e38-797f-4fa0-8b5a-75876c50a868",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2493616026497.ai",
-    "file_size": 904955,
-    "path": "8e927e38-797f-4fa0-8b5a-75876c50a868",
-    "created": 1567154498047,
-    "modified": 1567154498123
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "52eb0883-44ee-4960-9f8c-bcec347f9129",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2493925426497.ai",
-    "file_size": 2356774,
-    "path": "52eb0883-44ee-4960-9f8c-bcec347f9129",
-    "created": 1567154549651,
-    "modified": 1567154549733
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e9877441-0931-4de9-9f0d-4aca5887c1e6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2811126643577.ai",
-    "file_size": 888977,
-    "path": "e9877441-0931-4de9-9f0d-4aca5887c1e6",
-    "created": 1567287398745,
-    "modified": 1567287398798
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0e248238-1525-458c-a8d1-dc1bef9da9f9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2944792943577.ai",
-    "file_size": 2345131,
-    "path": "0e248238-1525-458c-a8d1-dc1bef9da9f9",
-    "created": 1567311965763,
-    "modified": 1567311965801
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "bc696916-1580-473b-93b7-4887b85d5919",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2944863443577.ai",
-    "file_size": 882030,
-    "path": "bc696916-1580-473b-93b7-4887b85d5919",
-    "created": 1567311977124,
-    "modified": 1567311977159
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b494576e-d2b6-47d6-9540-654344ec12b0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2945632843577.ai",
-    "file_size": 878676,
-    "path": "b494576e-d2b6-47d6-9540-654344ec12b0",
-    "created": 1567312105337,
-    "modified": 1567312105390
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a49b8417-db15-4918-870f-d9128e031cf0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2945988243577.ai",
-    "file_size": 915499,
-    "path": "a49b8417-db15-4918-870f-d9128e031cf0",
-    "created": 1567312164593,
-    "modified": 1567312164647
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8da08962-ab05-4ab3-b6be-12f14b96034f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp126339073182.ai",
-    "file_size": 885534,
-    "path": "8da08962-ab05-4ab3-b6be-12f14b96034f",
-    "created": 1567986124331,
-    "modified": 1567986124376
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "fe8e3fd3-24e1-491e-a9dd-2e075efb7abc",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp126347613182.ai",
-    "file_size": 885534,
-    "path": "fe8e3fd3-24e1-491e-a9dd-2e075efb7abc",
-    "created": 1567986138498,
-    "modified": 1567986138518
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5b436b1b-a35d-45cd-99c9-9b1b603be56c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1927416520194.ai",
-    "file_size": 5484253,
-    "path": "5b436b1b-a35d-45cd-99c9-9b1b603be56c",
-    "created": 1568101281456,
-    "modified": 1568101281512
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "69dc7a27-dcc0-4909-8eb0-a0243b839d00",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3236158823795.ai",
-    "file_size": 1105890,
-    "path": "69dc7a27-dcc0-4909-8eb0-a0243b839d00",
-    "created": 1568757078276,
-    "modified": 1568757078333
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9f0afba7-0169-4c19-9717-8621c56e7c66",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp18190234560.ai",
-    "file_size": 951494,
-    "path": "9f0afba7-0169-4c19-9717-8621c56e7c66",
-    "created": 1569189553305,
-    "modified": 1569189553339
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c3bc29be-7130-482f-9aeb-3de028e7b35b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp18201034560.ai",
-    "file_size": 969087,
-    "path": "c3bc29be-7130-482f-9aeb-3de028e7b35b",
-    "created": 1569189571451,
-    "modified": 1569189571478
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "cb662535-8cfd-484f-9ab8-065577d7ba9d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp18289434560.ai",
-    "file_size": 884676,
-    "path": "cb662535-8cfd-484f-9ab8-065577d7ba9d",
-    "created": 1569189718340,
-    "modified": 1569189718387
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6a8e3def-8a93-4a64-b12c-bd21a81810f4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp49395644560.ai",
-    "file_size": 921807,
-    "path": "6a8e3def-8a93-4a64-b12c-bd21a81810f4",
-    "created": 1569280400221,
-    "modified": 1569280400254
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f4d0de0d-f926-45cb-89db-ee38db4c5bfb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp88815247605.ai",
-    "file_size": 915975,
-    "path": "f4d0de0d-f926-45cb-89db-ee38db4c5bfb",
-    "created": 1569755349706,
-    "modified": 1569755349749
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f68cf03a-6f9a-45bd-9194-51ee5a4abb41",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp89994967605.ai",
-    "file_size": 915997,
-    "path": "f68cf03a-6f9a-45bd-9194-51ee5a4abb41",
-    "created": 1569757315874,
-    "modified": 1569757315906
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f991213d-a7b2-4b29-b3ad-b129b8887cdf",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp107978447605.ai",
-    "file_size": 910888,
-    "path": "f991213d-a7b2-4b29-b3ad-b129b8887cdf",
-    "created": 1569787322710,
-    "modified": 1569787322726
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a7697e9e-8d7b-4d92-bdbe-a4796e8fc03e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp111809827605.ai",
-    "file_size": 885468,
-    "path": "a7697e9e-8d7b-4d92-bdbe-a4796e8fc03e",
-    "created": 1569793708329,
-    "modified": 1569793708370
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e6716166-f97f-4ba6-a7af-413cb08ba1a9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp112131787605.ai",
-    "file_size": 885467,
-    "path": "e6716166-f97f-4ba6-a7af-413cb08ba1a9",
-    "created": 1569794244952,
-    "modified": 1569794244979
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a810060b-68e7-41bc-863a-7437a6fa819a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp123143267605.ai",
-    "file_size": 2356661,
-    "path": "a810060b-68e7-41bc-863a-7437a6fa819a",
-    "created": 1569824874603,
-    "modified": 1569824874668
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a6245e99-a77e-4c20-b80f-1abf7858e6e1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp123179187605.ai",
-    "file_size": 886571,
-    "path": "a6245e99-a77e-4c20-b80f-1abf7858e6e1",
-    "created": 1569824934310,
-    "modified": 1569824934353
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "143d10a5-b64e-41b0-8b26-23e77a517570",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp123425177605.ai",
-    "file_size": 886571,
-    "path": "143d10a5-b64e-41b0-8b26-23e77a517570",
-    "created": 1569825344312,
-    "modified": 1569825344330
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2e42463f-4b04-41e9-9aa5-c159bee6d810",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp123456027605.ai",
-    "file_size": 886591,
-    "path": "2e42463f-4b04-41e9-9aa5-c159bee6d810",
-    "created": 1569825395754,
-    "modified": 1569825395784
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c333d092-6d79-437c-b7be-65a5ad1fe5d5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2421511426641.ai",
-    "file_size": 893434,
-    "path": "c333d092-6d79-437c-b7be-65a5ad1fe5d5",
-    "created": 1570415755177,
-    "modified": 1570415755210
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6fd1afb8-4f2e-4c90-93b9-139fc382f088",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2421587626641.ai",
-    "file_size": 895376,
-    "path": "6fd1afb8-4f2e-4c90-93b9-139fc382f088",
-    "created": 1570415767840,
-    "modified": 1570415767878
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "17ba539c-e0e3-4734-8221-909ef37f2171",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2421671626641.ai",
-    "file_size": 909198,
-    "path": "17ba539c-e0e3-4734-8221-909ef37f2171",
-    "created": 1570415781821,
-    "modified": 1570415781857
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3bf36a95-3e5b-414e-b9fa-f51d57c23e7d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2421763726641.ai",
-    "file_size": 895583,
-    "path": "3bf36a95-3e5b-414e-b9fa-f51d57c23e7d",
-    "created": 1570415797201,
-    "modified": 1570415797237
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8a1e3d8a-3abb-44f5-8e7e-c0f3ca0dfa03",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2421873326641.ai",
-    "file_size": 895233,
-    "path": "8a1e3d8a-3abb-44f5-8e7e-c0f3ca0dfa03",
-    "created": 1570415815432,
-    "modified": 1570415815469
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e4d869bd-29eb-45eb-81ac-d6eacf0515e6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2766512726641.ai",
-    "file_size": 4256049,
-    "path": "e4d869bd-29eb-45eb-81ac-d6eacf0515e6",
-    "created": 1570519921149,
-    "modified": 1570519921186
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "90bc25a8-1a4e-4226-a386-340c7eb5e225",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2766653226641.ai",
-    "file_size": 908661,
-    "path": "90bc25a8-1a4e-4226-a386-340c7eb5e225",
-    "created": 1570519944561,
-    "modified": 1570519944581
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9c94a089-d40f-4ed1-87d7-53200cd2aa09",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2766763826641.ai",
-    "file_size": 882839,
-    "path": "9c94a089-d40f-4ed1-87d7-53200cd2aa09",
-    "created": 1570519962995,
-    "modified": 1570519963014
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0849699b-2496-4015-93fd-5ac486cc4af1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2766843226641.ai",
-    "file_size": 929287,
-    "path": "0849699b-2496-4015-93fd-5ac486cc4af1",
-    "created": 1570519976242,
-    "modified": 1570519976270
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "276c19c9-422d-4a8f-b489-eb10792d5cc7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp37086269.ai",
-    "file_size": 48119,
-    "path": "276c19c9-422d-4a8f-b489-eb10792d5cc7",
-    "created": 1570712617861,
-    "modified": 1570712617949
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a22c0cee-6e90-41f9-b5d2-4fc279c5d390",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp15268823301.ai",
-    "file_size": 53986,
-    "path": "a22c0cee-6e90-41f9-b5d2-4fc279c5d390",
-    "created": 1571722746438,
-    "modified": 1571722746488
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "08b148d6-8ce2-4309-bfcc-7511e3f8cf78",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp36289473301.ai",
-    "file_size": 878425,
-    "path": "08b148d6-8ce2-4309-bfcc-7511e3f8cf78",
-    "created": 1571785577914,
-    "modified": 1571785577934
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "aa4a5694-37a3-4ed2-a170-7c66d01e22dc",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp231945713301.ai",
-    "file_size": 1286751,
-    "path": "aa4a5694-37a3-4ed2-a170-7c66d01e22dc",
-    "created": 1572323757578,
-    "modified": 1572323757650
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "04f8c58d-9277-43a1-8cb5-96280db3dd2f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp231999603301.ai",
-    "file_size": 803023,
-    "path": "04f8c58d-9277-43a1-8cb5-96280db3dd2f",
-    "created": 1572323847367,
-    "modified": 1572323847395
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a95013a1-8b4c-4a53-b269-327c8d1a73eb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp232023013301.ai",
-    "file_size": 938461,
-    "path": "a95013a1-8b4c-4a53-b269-327c8d1a73eb",
-    "created": 1572323886399,
-    "modified": 1572323886428
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "62f4e650-84b0-4125-b5f6-710de01cde58",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234849583301.ai",
-    "file_size": 68090,
-    "path": "62f4e650-84b0-4125-b5f6-710de01cde58",
-    "created": 1572328597316,
-    "modified": 1572328597335
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0c5552b2-b3a1-4429-821d-9616fd600110",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234855213301.ai",
-    "file_size": 69798,
-    "path": "0c5552b2-b3a1-4429-821d-9616fd600110",
-    "created": 1572328606717,
-    "modified": 1572328606743
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "37b93f31-2fd0-454a-8ce2-5fc181c26fb7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234861383301.ai",
-    "file_size": 74176,
-    "path": "37b93f31-2fd0-454a-8ce2-5fc181c26fb7",
-    "created": 1572328617014,
-    "modified": 1572328617039
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "469983bd-5614-4ce3-b51b-2c8b6fba53d9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234865033301.ai",
-    "file_size": 68730,
-    "path": "469983bd-5614-4ce3-b51b-2c8b6fba53d9",
-    "created": 1572328623080,
-    "modified": 1572328623109
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a5321f74-90ad-4fc6-9a1d-4a1f8837cc8e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234867873301.ai",
-    "file_size": 71558,
-    "path": "a5321f74-90ad-4fc6-9a1d-4a1f8837cc8e",
-    "created": 1572328627814,
-    "modified": 1572328627847
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "42a57287-1306-4be2-9091-0cd0b6722c4d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234870743301.ai",
-    "file_size": 71697,
-    "path": "42a57287-1306-4be2-9091-0cd0b6722c4d",
-    "created": 1572328632594,
-    "modified": 1572328632618
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7f8de8fc-7f1e-4be3-bed3-54abba9b0329",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234874153301.ai",
-    "file_size": 74919,
-    "path": "7f8de8fc-7f1e-4be3-bed3-54abba9b0329",
-    "created": 1572328638293,
-    "modified": 1572328638319
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5c1fdddc-3d80-4e33-8089-e6f5f43551c5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234880213301.ai",
-    "file_size": 73459,
-    "path": "5c1fdddc-3d80-4e33-8089-e6f5f43551c5",
-    "created": 1572328648384,
-    "modified": 1572328648412
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ad238c28-87ad-40ad-8936-c9a5901b3eb5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234883103301.ai",
-    "file_size": 74454,
-    "path": "ad238c28-87ad-40ad-8936-c9a5901b3eb5",
-    "created": 1572328653182,
-    "modified": 1572328653211
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c5b54919-29f5-464a-ac32-4894d6cf5038",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234888433301.ai",
-    "file_size": 53197,
-    "path": "c5b54919-29f5-464a-ac32-4894d6cf5038",
-    "created": 1572328662068,
-    "modified": 1572328662075
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "fcca4272-f1c2-4f24-9e9a-cf08aff01198",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234891533301.ai",
-    "file_size": 78284,
-    "path": "fcca4272-f1c2-4f24-9e9a-cf08aff01198",
-    "created": 1572328667235,
-    "modified": 1572328667240
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "cc10d08d-9623-4dfd-a9f1-22c212458e38",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234894683301.ai",
-    "file_size": 77015,
-    "path": "cc10d08d-9623-4dfd-a9f1-22c212458e38",
-    "created": 1572328672484,
-    "modified": 1572328672488
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "810c4ffd-eb28-426d-9292-ea65f49b5eee",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234897433301.ai",
-    "file_size": 74199,
-    "path": "810c4ffd-eb28-426d-9292-ea65f49b5eee",
-    "created": 1572328677091,
-    "modified": 1572328677122
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5576356d-cb77-4f01-ad32-861f60c97ff0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234901423301.ai",
-    "file_size": 65630,
-    "path": "5576356d-cb77-4f01-ad32-861f60c97ff0",
-    "created": 1572328683740,
-    "modified": 1572328683778
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5c9379de-2d71-43d1-890c-89f055cd22b4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234904103301.ai",
-    "file_size": 72366,
-    "path": "5c9379de-2d71-43d1-890c-89f055cd22b4",
-    "created": 1572328688200,
-    "modified": 1572328688232
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0145f8f6-c1af-4a1f-ac31-6390c873edd3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234907633301.ai",
-    "file_size": 74790,
-    "path": "0145f8f6-c1af-4a1f-ac31-6390c873edd3",
-    "created": 1572328694084,
-    "modified": 1572328694095
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5a861c9a-ff62-4d05-8e48-08393eecef94",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234910513301.ai",
-    "file_size": 75931,
-    "path": "5a861c9a-ff62-4d05-8e48-08393eecef94",
-    "created": 1572328698893,
-    "modified": 1572328698924
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "02f8e937-4fbb-42db-9e49-6634fcea7ad9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234913383301.ai",
-    "file_size": 54725,
-    "path": "02f8e937-4fbb-42db-9e49-6634fcea7ad9",
-    "created": 1572328703680,
-    "modified": 1572328703707
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "fcad72ec-662e-447b-8131-5512e43c0f0a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp234929533301.ai",
-    "file_size": 69684,
-    "path": "fcad72ec-662e-447b-8131-5512e43c0f0a",
-    "created": 1572328730586,
-    "modified": 1572328730620
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "61572c81-5a89-434e-b087-704b7aef4eec",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp235290653301.ai",
-    "file_size": 82376,
-    "path": "61572c81-5a89-434e-b087-704b7aef4eec",
-    "created": 1572329332453,
-    "modified": 1572329332479
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4befb980-d2ea-4746-b0a9-b7622fb30ec6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp262429283301.ai",
-    "file_size": 1094507,
-    "path": "4befb980-d2ea-4746-b0a9-b7622fb30ec6",
-    "created": 1572393248128,
-    "modified": 1572393248138
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ebd27d3c-3704-4970-9614-8b4261230f9a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2937186531083.ai",
-    "file_size": 189716,
-    "path": "ebd27d3c-3704-4970-9614-8b4261230f9a",
-    "created": 1572494858955,
-    "modified": 1572494859057
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "78a321db-e87f-45e9-b82e-50950d524c30",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2966996331083.ai",
-    "file_size": 883786,
-    "path": "78a321db-e87f-45e9-b82e-50950d524c30",
-    "created": 1572499867009,
-    "modified": 1572499867038
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "42c32e76-e43f-4b57-9619-aee8b9d41fe7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2967065631083.ai",
-    "file_size": 887636,
-    "path": "42c32e76-e43f-4b57-9619-aee8b9d41fe7",
-    "created": 1572499878508,
-    "modified": 1572499878534
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f95b897e-23cc-4230-aa69-7ed5d25ece0e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2967192131083.ai",
-    "file_size": 885656,
-    "path": "f95b897e-23cc-4230-aa69-7ed5d25ece0e",
-    "created": 1572499899625,
-    "modified": 1572499899651
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5addf16e-eacd-41d0-a3f7-57edcfe6aaf3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2967254031083.ai",
-    "file_size": 884219,
-    "path": "5addf16e-eacd-41d0-a3f7-57edcfe6aaf3",
-    "created": 1572499909958,
-    "modified": 1572499909983
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9cd87f68-675d-460a-a2da-b254464fe4ab",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2967589731083.ai",
-    "file_size": 891104,
-    "path": "9cd87f68-675d-460a-a2da-b254464fe4ab",
-    "created": 1572499965893,
-    "modified": 1572499965919
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7d36d325-a81e-47c7-82e2-42c52ff70097",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4425394440936.ai",
-    "file_size": 52357,
-    "path": "7d36d325-a81e-47c7-82e2-42c52ff70097",
-    "created": 1572929151862,
-    "modified": 1572929151916
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "906fae26-1f8e-4878-839f-7270c49ee491",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4768132540936.ai",
-    "file_size": 15723135,
-    "path": "906fae26-1f8e-4878-839f-7270c49ee491",
-    "created": 1573020832841,
-    "modified": 1573020832921
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a6f412ab-7ebb-4718-82d1-138ba7c68543",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4768297440936.ai",
-    "file_size": 884282,
-    "path": "a6f412ab-7ebb-4718-82d1-138ba7c68543",
-    "created": 1573020860094,
-    "modified": 1573020860127
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5e9adbe6-41b8-4092-a945-7e10fcb40bfd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5356277340936.ai",
-    "file_size": 884953,
-    "path": "5e9adbe6-41b8-4092-a945-7e10fcb40bfd",
-    "created": 1573383683361,
-    "modified": 1573383683425
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0ed6909e-0223-4065-bc14-2768b8ae5d67",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6175220240936.ai",
-    "file_size": 894677,
-    "path": "0ed6909e-0223-4065-bc14-2768b8ae5d67",
-    "created": 1573559165962,
-    "modified": 1573559165996
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e44a70ee-7f89-4b49-a63e-fd8dc8b5673d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6175367840936.ai",
-    "file_size": 898229,
-    "path": "e44a70ee-7f89-4b49-a63e-fd8dc8b5673d",
-    "created": 1573559190525,
-    "modified": 1573559190540
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1607efb5-629e-4cb9-bf45-d16010ca549d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6175482740936.ai",
-    "file_size": 927060,
-    "path": "1607efb5-629e-4cb9-bf45-d16010ca549d",
-    "created": 1573559209700,
-    "modified": 1573559209707
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7e83f9bb-77c4-4a94-b4ee-be8cd0fa648c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6175783240936.ai",
-    "file_size": 894525,
-    "path": "7e83f9bb-77c4-4a94-b4ee-be8cd0fa648c",
-    "created": 1573559259766,
-    "modified": 1573559259774
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f0ea948b-286e-4b17-91e0-c19243621c60",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6176527140936.ai",
-    "file_size": 66652,
-    "path": "f0ea948b-286e-4b17-91e0-c19243621c60",
-    "created": 1573559383728,
-    "modified": 1573559383734
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "bf1a1f5d-29a0-455f-bee2-0b42fee563e4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6178465540936.ai",
-    "file_size": 129553,
-    "path": "bf1a1f5d-29a0-455f-bee2-0b42fee563e4",
-    "created": 1573559706847,
-    "modified": 1573559706854
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e704390c-1f57-4fda-b495-2340f06db46a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6178681740936.ai",
-    "file_size": 70227,
-    "path": "e704390c-1f57-4fda-b495-2340f06db46a",
-    "created": 1573559742852,
-    "modified": 1573559742860
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7c967746-c1c9-47b4-ad72-fe43907c5859",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6179441140936.ai",
-    "file_size": 96720,
-    "path": "7c967746-c1c9-47b4-ad72-fe43907c5859",
-    "created": 1573559869430,
-    "modified": 1573559869435
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "650003d6-c9e3-4ab4-8686-5e9728148c1a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6179642340936.ai",
-    "file_size": 85725,
-    "path": "650003d6-c9e3-4ab4-8686-5e9728148c1a",
-    "created": 1573559902939,
-    "modified": 1573559902946
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e7874af2-9d1b-4717-8a2f-8b63b325382f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6179799340936.ai",
-    "file_size": 81262,
-    "path": "e7874af2-9d1b-4717-8a2f-8b63b325382f",
-    "created": 1573559929116,
-    "modified": 1573559929121
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "066973f5-d38d-445d-91f1-f7f7f0b23915",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6179958940936.ai",
-    "file_size": 96384,
-    "path": "066973f5-d38d-445d-91f1-f7f7f0b23915",
-    "created": 1573559955703,
-    "modified": 1573559955708
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "240a930a-55b0-40c5-8bdf-9a9219b24ca3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6180106640936.ai",
-    "file_size": 106866,
-    "path": "240a930a-55b0-40c5-8bdf-9a9219b24ca3",
-    "created": 1573559980376,
-    "modified": 1573559980384
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "00585e69-3a17-41a8-a9ff-1f1265694ed8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6180273440936.ai",
-    "file_size": 109048,
-    "path": "00585e69-3a17-41a8-a9ff-1f1265694ed8",
-    "created": 1573560008153,
-    "modified": 1573560008160
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "44f260c3-47e6-4221-9d5a-70ee7b8e7389",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6180408840936.ai",
-    "file_size": 112916,
-    "path": "44f260c3-47e6-4221-9d5a-70ee7b8e7389",
-    "created": 1573560030750,
-    "modified": 1573560030760
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a87abf74-d855-4b93-b383-9b67bd54ecb0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6180563940936.ai",
-    "file_size": 93630,
-    "path": "a87abf74-d855-4b93-b383-9b67bd54ecb0",
-    "created": 1573560056538,
-    "modified": 1573560056545
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "151ce84e-7c09-4a4f-8d78-635d23864137",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6180702940936.ai",
-    "file_size": 111699,
-    "path": "151ce84e-7c09-4a4f-8d78-635d23864137",
-    "created": 1573560079765,
-    "modified": 1573560079771
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "526e3585-cdb8-4117-bd0d-34349e977f6a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6182923840936.ai",
-    "file_size": 979382,
-    "path": "526e3585-cdb8-4117-bd0d-34349e977f6a",
-    "created": 1573560449908,
-    "modified": 1573560449916
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7b3b2aea-1d5c-41e3-a9fb-84494af80c43",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6184957140936.ai",
-    "file_size": 90309,
-    "path": "7b3b2aea-1d5c-41e3-a9fb-84494af80c43",
-    "created": 1573560788800,
-    "modified": 1573560788807
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "698b3075-4bf9-4079-8063-5f4370892b8d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6191230740936.ai",
-    "file_size": 82874,
-    "path": "698b3075-4bf9-4079-8063-5f4370892b8d",
-    "created": 1573561834381,
-    "modified": 1573561834392
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "707b7231-54a4-41b5-9222-b2c66206f33d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6191599540936.ai",
-    "file_size": 98139,
-    "path": "707b7231-54a4-41b5-9222-b2c66206f33d",
-    "created": 1573561895849,
-    "modified": 1573561895855
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "449b37b0-f065-4689-8c7c-ed82b936d69a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6191817440936.ai",
-    "file_size": 103065,
-    "path": "449b37b0-f065-4689-8c7c-ed82b936d69a",
-    "created": 1573561932188,
-    "modified": 1573561932194
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "352f9446-6ed3-4b56-ae4d-24077ca84e6d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6191980540936.ai",
-    "file_size": 75540,
-    "path": "352f9446-6ed3-4b56-ae4d-24077ca84e6d",
-    "created": 1573561959350,
-    "modified": 1573561959357
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3d32c825-2504-4eef-8ce9-5ac5d62937de",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6192148140936.ai",
-    "file_size": 376785,
-    "path": "3d32c825-2504-4eef-8ce9-5ac5d62937de",
-    "created": 1573561987319,
-    "modified": 1573561987326
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3c2a76f3-fd3a-4210-adaf-f0b072a202e7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6192429740936.ai",
-    "file_size": 76558,
-    "path": "3c2a76f3-fd3a-4210-adaf-f0b072a202e7",
-    "created": 1573562034208,
-    "modified": 1573562034214
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "01659d98-981a-4e8b-8554-3058c236d52c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6192690440936.ai",
-    "file_size": 89507,
-    "path": "01659d98-981a-4e8b-8554-3058c236d52c",
-    "created": 1573562077690,
-    "modified": 1573562077701
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2e05cba4-032a-46ed-ac6f-2b7d89684556",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6192911440936.ai",
-    "file_size": 86936,
-    "path": "2e05cba4-032a-46ed-ac6f-2b7d89684556",
-    "created": 1573562114514,
-    "modified": 1573562114520
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "02f58d35-b98c-435d-813d-d7e3e39b6856",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6193215240936.ai",
-    "file_size": 91692,
-    "path": "02f58d35-b98c-435d-813d-d7e3e39b6856",
-    "created": 1573562165161,
-    "modified": 1573562165168
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b3277426-cb13-4084-82be-d917f468a4ec",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6193370240936.ai",
-    "file_size": 74752,
-    "path": "b3277426-cb13-4084-82be-d917f468a4ec",
-    "created": 1573562190996,
-    "modified": 1573562191003
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c1c5ca42-09b0-478f-a708-a11c1766c087",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6194488640936.ai",
-    "file_size": 80081,
-    "path": "c1c5ca42-09b0-478f-a708-a11c1766c087",
-    "created": 1573562377363,
-    "modified": 1573562377373
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a61e5e8a-a6b4-4248-9e49-14d0dc8879f8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6194621240936.ai",
-    "file_size": 121892,
-    "path": "a61e5e8a-a6b4-4248-9e49-14d0dc8879f8",
-    "created": 1573562399480,
-    "modified": 1573562399491
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "652d948a-31d9-45dd-bc7c-fa3ad4479e06",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6195256340936.ai",
-    "file_size": 78804,
-    "path": "652d948a-31d9-45dd-bc7c-fa3ad4479e06",
-    "created": 1573562505355,
-    "modified": 1573562505365
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "092ac9af-91a7-482e-af9e-862995dceba5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6195923940936.ai",
-    "file_size": 93903,
-    "path": "092ac9af-91a7-482e-af9e-862995dceba5",
-    "created": 1573562616593,
-    "modified": 1573562616600
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "62555d36-a392-4c65-830c-1bcb54dbe4f8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6196077840936.ai",
-    "file_size": 83463,
-    "path": "62555d36-a392-4c65-830c-1bcb54dbe4f8",
-    "created": 1573562642300,
-    "modified": 1573562642308
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "805d5e4f-0167-4309-b2f2-683b50a85185",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6196390240936.ai",
-    "file_size": 98680,
-    "path": "805d5e4f-0167-4309-b2f2-683b50a85185",
-    "created": 1573562694347,
-    "modified": 1573562694354
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "52483dad-0fa7-4296-ba80-c4bccf82e8be",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6196528540936.ai",
-    "file_size": 90585,
-    "path": "52483dad-0fa7-4296-ba80-c4bccf82e8be",
-    "created": 1573562717374,
-    "modified": 1573562717379
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2a5f452a-639e-4dfd-8cdd-0f47f7e098c1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6196858240936.ai",
-    "file_size": 973012,
-    "path": "2a5f452a-639e-4dfd-8cdd-0f47f7e098c1",
-    "created": 1573562772392,
-    "modified": 1573562772400
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "024941e9-9288-4fd3-915d-5c3f1fa2185b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6197164540936.ai",
-    "file_size": 102741,
-    "path": "024941e9-9288-4fd3-915d-5c3f1fa2185b",
-    "created": 1573562823383,
-    "modified": 1573562823389
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "05df709a-a003-4f8f-b409-983eab8519d9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6197306740936.ai",
-    "file_size": 88120,
-    "path": "05df709a-a003-4f8f-b409-983eab8519d9",
-    "created": 1573562847077,
-    "modified": 1573562847084
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6741e059-4221-4880-8a1a-03e3ef86d0ec",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6197433040936.ai",
-    "file_size": 77205,
-    "path": "6741e059-4221-4880-8a1a-03e3ef86d0ec",
-    "created": 1573562868160,
-    "modified": 1573562868167
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "595c0dc2-5702-4bae-b072-fa51656def0a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6197679340936.ai",
-    "file_size": 98117,
-    "path": "595c0dc2-5702-4bae-b072-fa51656def0a",
-    "created": 1573562909213,
-    "modified": 1573562909219
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b4e1b62c-e552-48e2-a21a-5920ac7f49a6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp700264626148.ai",
-    "file_size": 881103,
-    "path": "b4e1b62c-e552-48e2-a21a-5920ac7f49a6",
-    "created": 1574049278489,
-    "modified": 1574049278556
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4a355888-6315-453c-be57-7e792fd2ea34",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp723482646148.ai",
-    "file_size": 881656,
-    "path": "4a355888-6315-453c-be57-7e792fd2ea34",
-    "created": 1574113122036,
-    "modified": 1574113122075
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4381fc5e-fdfc-4b1b-b03c-8498ca242b1f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp723492166148.ai",
-    "file_size": 881308,
-    "path": "4381fc5e-fdfc-4b1b-b03c-8498ca242b1f",
-    "created": 1574113137934,
-    "modified": 1574113137947
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ddf75a5c-800a-4f25-8448-ed09f688a55c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7866033178047.ai",
-    "file_size": 884713,
-    "path": "ddf75a5c-800a-4f25-8448-ed09f688a55c",
-    "created": 1574302001262,
-    "modified": 1574302001325
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "82120bd8-b375-4597-bf10-1b80c8c7bf0c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7895760878047.ai",
-    "file_size": 881656,
-    "path": "82120bd8-b375-4597-bf10-1b80c8c7bf0c",
-    "created": 1574306955897,
-    "modified": 1574306955945
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4bcc6893-b064-4b2b-92d4-46702cbb8f52",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8036529578047.ai",
-    "file_size": 879453,
-    "path": "4bcc6893-b064-4b2b-92d4-46702cbb8f52",
-    "created": 1574379822589,
-    "modified": 1574379822650
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9f0b441d-ee45-4de1-82e5-7ad6c8f4062d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8036680778047.ai",
-    "file_size": 879094,
-    "path": "9f0b441d-ee45-4de1-82e5-7ad6c8f4062d",
-    "created": 1574379847685,
-    "modified": 1574379847709
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7c4c992f-f4cd-4b48-aeb7-0cb466dba413",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp21401488374.ai",
-    "file_size": 2185760,
-    "path": "7c4c992f-f4cd-4b48-aeb7-0cb466dba413",
-    "created": 1576448252673,
-    "modified": 1576448252804
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f29c56b5-1c67-4d18-907c-6f2ce490d2a6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp21401954374.ai",
-    "file_size": 2186173,
-    "path": "f29c56b5-1c67-4d18-907c-6f2ce490d2a6",
-    "created": 1576448260313,
-    "modified": 1576448260349
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "329cf5e4-3c07-44bd-b301-86daad6951c4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp21405602374.ai",
-    "file_size": 2185747,
-    "path": "329cf5e4-3c07-44bd-b301-86daad6951c4",
-    "created": 1576448321136,
-    "modified": 1576448321148
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "abdbdbce-914e-42b8-a2a0-0c36a5021391",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp21406297374.ai",
-    "file_size": 2186155,
-    "path": "abdbdbce-914e-42b8-a2a0-0c36a5021391",
-    "created": 1576448332688,
-    "modified": 1576448332718
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2a35200d-c92e-4340-bb66-2050a2585ddf",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp21491996374.ai",
-    "file_size": 884892,
-    "path": "2a35200d-c92e-4340-bb66-2050a2585ddf",
-    "created": 1576449761072,
-    "modified": 1576449761107
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "926fdf48-6b27-4e50-b3af-0daab54484e8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp21493668374.ai",
-    "file_size": 884810,
-    "path": "926fdf48-6b27-4e50-b3af-0daab54484e8",
-    "created": 1576449788861,
-    "modified": 1576449788890
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "08386219-0f9f-462f-a80a-c3d16b3629d9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4768132540936.ai",
-    "file_size": 15723135,
-    "path": "08386219-0f9f-462f-a80a-c3d16b3629d9",
-    "created": 1573020832841,
-    "modified": 1573020832921
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c3e5fce5-b08a-49a7-bf9f-83d507931033",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4768297440936.ai",
-    "file_size": 884282,
-    "path": "c3e5fce5-b08a-49a7-bf9f-83d507931033",
-    "created": 1573020860094,
-    "modified": 1573020860127
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8af48eb7-7551-4926-82ec-1ffade07cce8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5356277340936.ai",
-    "file_size": 884953,
-    "path": "8af48eb7-7551-4926-82ec-1ffade07cce8",
-    "created": 1573383683361,
-    "modified": 1573383683425
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a98f9236-d85e-4927-9901-317243c2588e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6175220240936.ai",
-    "file_size": 894677,
-    "path": "a98f9236-d85e-4927-9901-317243c2588e",
-    "created": 1573559165962,
-    "modified": 1573559165996
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "dcd70e9c-a305-4167-a79b-7e4971cd19c2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6175367840936.ai",
-    "file_size": 898229,
-    "path": "dcd70e9c-a305-4167-a79b-7e4971cd19c2",
-    "created": 1573559190525,
-    "modified": 1573559190540
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d293225d-31c0-4a75-89c5-d83c53494be3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6175482740936.ai",
-    "file_size": 927060,
-    "path": "d293225d-31c0-4a75-89c5-d83c53494be3",
-    "created": 1573559209700,
-    "modified": 1573559209707
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8517c5c9-2e45-43e5-974b-0f13bb2ded37",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6175783240936.ai",
-    "file_size": 894525,
-    "path": "8517c5c9-2e45-43e5-974b-0f13bb2ded37",
-    "created": 1573559259766,
-    "modified": 1573559259774
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d4522767-d960-410b-a346-f4fd0522c879",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6176527140936.ai",
-    "file_size": 66652,
-    "path": "d4522767-d960-410b-a346-f4fd0522c879",
-    "created": 1573559383728,
-    "modified": 1573559383734
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "cfc9b1c7-79b6-456e-b84f-9519848e213c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6178465540936.ai",
-    "file_size": 129553,
-    "path": "cfc9b1c7-79b6-456e-b84f-9519848e213c",
-    "created": 1573559706847,
-    "modified": 1573559706854
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "671be79b-a4bf-49d4-b40f-a01246e1374f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6178681740936.ai",
-    "file_size": 70227,
-    "path": "671be79b-a4bf-49d4-b40f-a01246e1374f",
-    "created": 1573559742852,
-    "modified": 1573559742860
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f89ccc91-98b0-4197-8ffe-3e1bd354fc43",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6179441140936.ai",
-    "file_size": 96720,
-    "path": "f89ccc91-98b0-4197-8ffe-3e1bd354fc43",
-    "created": 1573559869430,
-    "modified": 1573559869435
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9e6195b9-5d58-40c1-8c78-4b42fc1e0ce9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6179642340936.ai",
-    "file_size": 85725,
-    "path": "9e6195b9-5d58-40c1-8c78-4b42fc1e0ce9",
-    "created": 1573559902939,
-    "modified": 1573559902946
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8368675a-fdea-42dc-b6f9-12c5849999cb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6179799340936.ai",
-    "file_size": 81262,
-    "path": "8368675a-fdea-42dc-b6f9-12c5849999cb",
-    "created": 1573559929116,
-    "modified": 1573559929121
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2371e147-2e37-485f-b693-1d75b480834d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6179958940936.ai",
-    "file_size": 96384,
-    "path": "2371e147-2e37-485f-b693-1d75b480834d",
-    "created": 1573559955703,
-    "modified": 1573559955708
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "290e52aa-2f97-402e-8031-931dc8dd8232",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6180106640936.ai",
-    "file_size": 106866,
-    "path": "290e52aa-2f97-402e-8031-931dc8dd8232",
-    "created": 1573559980376,
-    "modified": 1573559980384
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7d9311d2-2610-4834-8b89-afacfbb57d29",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6180273440936.ai",
-    "file_size": 109048,
-    "path": "7d9311d2-2610-4834-8b89-afacfbb57d29",
-    "created": 1573560008153,
-    "modified": 1573560008160
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "256ccc00-6301-4e35-9ffd-36762697fe41",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6180408840936.ai",
-    "file_size": 112916,
-    "path": "256ccc00-6301-4e35-9ffd-36762697fe41",
-    "created": 1573560030750,
-    "modified": 1573560030760
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "37fc2988-349f-41f3-bba3-9ed31f7059da",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6180563940936.ai",
-    "file_size": 93630,
-    "path": "37fc2988-349f-41f3-bba3-9ed31f7059da",
-    "created": 1573560056538,
-    "modified": 1573560056545
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9f496a59-3c71-4ca8-8e35-ac63f9c9368d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6180702940936.ai",
-    "file_size": 111699,
-    "path": "9f496a59-3c71-4ca8-8e35-ac63f9c9368d",
-    "created": 1573560079765,
-    "modified": 1573560079771
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "31172f8a-7ff1-42a1-ad61-6200b78d5dda",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6182923840936.ai",
-    "file_size": 979382,
-    "path": "31172f8a-7ff1-42a1-ad61-6200b78d5dda",
-    "created": 1573560449908,
-    "modified": 1573560449916
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "30bf68be-b144-490b-8b30-1501af8624ee",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6184957140936.ai",
-    "file_size": 90309,
-    "path": "30bf68be-b144-490b-8b30-1501af8624ee",
-    "created": 1573560788800,
-    "modified": 1573560788807
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "378ef015-4ce5-44c8-b3f2-9bc345f5445a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6191230740936.ai",
-    "file_size": 82874,
-    "path": "378ef015-4ce5-44c8-b3f2-9bc345f5445a",
-    "created": 1573561834381,
-    "modified": 1573561834392
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9eaa2218-0fcc-47a3-8d6f-6e26e793c0cf",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6191599540936.ai",
-    "file_size": 98139,
-    "path": "9eaa2218-0fcc-47a3-8d6f-6e26e793c0cf",
-    "created": 1573561895849,
-    "modified": 1573561895855
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "99eb2cbc-f680-4e92-84f7-ec628a1b32e0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6191817440936.ai",
-    "file_size": 103065,
-    "path": "99eb2cbc-f680-4e92-84f7-ec628a1b32e0",
-    "created": 1573561932188,
-    "modified": 1573561932194
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "353ebe67-26ef-4bf6-835e-fb2f2476f1b4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6191980540936.ai",
-    "file_size": 75540,
-    "path": "353ebe67-26ef-4bf6-835e-fb2f2476f1b4",
-    "created": 1573561959350,
-    "modified": 1573561959357
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "18e29939-6635-4946-a15d-9dd3f3b64f25",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6192148140936.ai",
-    "file_size": 376785,
-    "path": "18e29939-6635-4946-a15d-9dd3f3b64f25",
-    "created": 1573561987319,
-    "modified": 1573561987326
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3697d011-6166-4e81-915d-5fc342fd5de0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6192429740936.ai",
-    "file_size": 76558,
-    "path": "3697d011-6166-4e81-915d-5fc342fd5de0",
-    "created": 1573562034208,
-    "modified": 1573562034214
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7d33d1a9-e3f7-4099-b86e-1d17fb6dd558",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6192690440936.ai",
-    "file_size": 89507,
-    "path": "7d33d1a9-e3f7-4099-b86e-1d17fb6dd558",
-    "created": 1573562077690,
-    "modified": 1573562077701
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6ec4a871-4b3b-4882-abc5-5ff1850ee162",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6192911440936.ai",
-    "file_size": 86936,
-    "path": "6ec4a871-4b3b-4882-abc5-5ff1850ee162",
-    "created": 1573562114514,
-    "modified": 1573562114520
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7d2add00-be22-456c-8de1-d2c9fb263cfe",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6193215240936.ai",
-    "file_size": 91692,
-    "path": "7d2add00-be22-456c-8de1-d2c9fb263cfe",
-    "created": 1573562165161,
-    "modified": 1573562165168
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6633bbca-e70a-4cb9-bdbd-515392a42bd2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6193370240936.ai",
-    "file_size": 74752,
-    "path": "6633bbca-e70a-4cb9-bdbd-515392a42bd2",
-    "created": 1573562190996,
-    "modified": 1573562191003
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d374650b-d4c8-40ca-98ec-e4f7878f2737",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6194488640936.ai",
-    "file_size": 80081,
-    "path": "d374650b-d4c8-40ca-98ec-e4f7878f2737",
-    "created": 1573562377363,
-    "modified": 1573562377373
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "59bb8af2-55e3-4674-a910-1874a6edbc65",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6194621240936.ai",
-    "file_size": 121892,
-    "path": "59bb8af2-55e3-4674-a910-1874a6edbc65",
-    "created": 1573562399480,
-    "modified": 1573562399491
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c8a35ea4-bd56-4ea7-bb16-eccb03f655b8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6195256340936.ai",
-    "file_size": 78804,
-    "path": "c8a35ea4-bd56-4ea7-bb16-eccb03f655b8",
-    "created": 1573562505355,
-    "modified": 1573562505365
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6e1ca6d4-ea0e-4475-8657-a9ab82249fe3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6195923940936.ai",
-    "file_size": 93903,
-    "path": "6e1ca6d4-ea0e-4475-8657-a9ab82249fe3",
-    "created": 1573562616593,
-    "modified": 1573562616600
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d19f531f-0158-4ded-9cd7-07f1d67d7818",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6196077840936.ai",
-    "file_size": 83463,
-    "path": "d19f531f-0158-4ded-9cd7-07f1d67d7818",
-    "created": 1573562642300,
-    "modified": 1573562642308
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c438fd3a-a08e-4a78-ab88-626ad12dacff",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6196390240936.ai",
-    "file_size": 98680,
-    "path": "c438fd3a-a08e-4a78-ab88-626ad12dacff",
-    "created": 1573562694347,
-    "modified": 1573562694354
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b81799d8-dc7c-4028-9eb0-17ab3533722e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6196528540936.ai",
-    "file_size": 90585,
-    "path": "b81799d8-dc7c-4028-9eb0-17ab3533722e",
-    "created": 1573562717374,
-    "modified": 1573562717379
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b15be85a-29a0-4b0b-8e61-c27734ac6e1c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6196858240936.ai",
-    "file_size": 973012,
-    "path": "b15be85a-29a0-4b0b-8e61-c27734ac6e1c",
-    "created": 1573562772392,
-    "modified": 1573562772400
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "55fd9ec1-f2a8-46ca-8035-686a42bcb830",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6197164540936.ai",
-    "file_size": 102741,
-    "path": "55fd9ec1-f2a8-46ca-8035-686a42bcb830",
-    "created": 1573562823383,
-    "modified": 1573562823389
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a8f1c541-1acc-4d0b-94ab-b6d7e8911899",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6197306740936.ai",
-    "file_size": 88120,
-    "path": "a8f1c541-1acc-4d0b-94ab-b6d7e8911899",
-    "created": 1573562847077,
-    "modified": 1573562847084
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ec7c5c1b-ae60-407d-81f6-77ed74f27f4a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6197433040936.ai",
-    "file_size": 77205,
-    "path": "ec7c5c1b-ae60-407d-81f6-77ed74f27f4a",
-    "created": 1573562868160,
-    "modified": 1573562868167
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "35ebde4b-52fb-4b9b-9da4-bbf15f5d3fa2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6197679340936.ai",
-    "file_size": 98117,
-    "path": "35ebde4b-52fb-4b9b-9da4-bbf15f5d3fa2",
-    "created": 1573562909213,
-    "modified": 1573562909219
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0a7a5e56-66d8-44ea-ba51-9a1257d05f02",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp700264626148.ai",
-    "file_size": 881103,
-    "path": "0a7a5e56-66d8-44ea-ba51-9a1257d05f02",
-    "created": 1574049278489,
-    "modified": 1574049278556
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "bfdf7630-43f4-44ff-b917-8ecb9a58596c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp723482646148.ai",
-    "file_size": 881656,
-    "path": "bfdf7630-43f4-44ff-b917-8ecb9a58596c",
-    "created": 1574113122036,
-    "modified": 1574113122075
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6edd0202-ed3f-493d-8dde-3cf2d242efcc",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp723492166148.ai",
-    "file_size": 881308,
-    "path": "6edd0202-ed3f-493d-8dde-3cf2d242efcc",
-    "created": 1574113137934,
-    "modified": 1574113137947
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3ec0869b-a93f-40af-98f5-a9a4a0182653",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7866033178047.ai",
-    "file_size": 884713,
-    "path": "3ec0869b-a93f-40af-98f5-a9a4a0182653",
-    "created": 1574302001262,
-    "modified": 1574302001325
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ebc55338-94b8-427b-9548-7f8399559359",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7895760878047.ai",
-    "file_size": 881656,
-    "path": "ebc55338-94b8-427b-9548-7f8399559359",
-    "created": 1574306955897,
-    "modified": 1574306955945
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1746f253-5e5f-46ff-b140-81c7bf910686",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8036529578047.ai",
-    "file_size": 879453,
-    "path": "1746f253-5e5f-46ff-b140-81c7bf910686",
-    "created": 1574379822589,
-    "modified": 1574379822650
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a3cf9ada-7add-4c0b-9c02-498737783ffa",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8036680778047.ai",
-    "file_size": 879094,
-    "path": "a3cf9ada-7add-4c0b-9c02-498737783ffa",
-    "created": 1574379847685,
-    "modified": 1574379847709
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "125e7770-a99c-458a-91dd-e029a5817422",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp21401488374.ai",
-    "file_size": 2185760,
-    "path": "125e7770-a99c-458a-91dd-e029a5817422",
-    "created": 1576448252673,
-    "modified": 1576448252804
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c6bdd18a-c3c6-4301-8f11-fcc8c4b73845",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp21401954374.ai",
-    "file_size": 2186173,
-    "path": "c6bdd18a-c3c6-4301-8f11-fcc8c4b73845",
-    "created": 1576448260313,
-    "modified": 1576448260349
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "638fdccd-968a-424d-96fe-4a1049cecdd5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp21405602374.ai",
-    "file_size": 2185747,
-    "path": "638fdccd-968a-424d-96fe-4a1049cecdd5",
-    "created": 1576448321136,
-    "modified": 1576448321148
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3537d0ac-d2ee-4555-9651-8cbe21a20f2c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp21406297374.ai",
-    "file_size": 2186155,
-    "path": "3537d0ac-d2ee-4555-9651-8cbe21a20f2c",
-    "created": 1576448332688,
-    "modified": 1576448332718
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "72ee9320-a7f9-495e-86f4-1e91a851b035",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp21491996374.ai",
-    "file_size": 884892,
-    "path": "72ee9320-a7f9-495e-86f4-1e91a851b035",
-    "created": 1576449761072,
-    "modified": 1576449761107
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "be908ca9-d67f-4509-a351-40db1f72052a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp21493668374.ai",
-    "file_size": 884810,
-    "path": "be908ca9-d67f-4509-a351-40db1f72052a",
-    "created": 1576449788861,
-    "modified": 1576449788890
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "311ad7cb-b7b9-489d-944d-9c8568db5c37",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7418042024743.ai",
-    "file_size": 884021,
-    "path": "311ad7cb-b7b9-489d-944d-9c8568db5c37",
-    "created": 1579657478032,
-    "modified": 1579657478168
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "50074ab6-0428-4f15-9ebc-d5f040caba74",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7418084724743.ai",
-    "file_size": 888245,
-    "path": "50074ab6-0428-4f15-9ebc-d5f040caba74",
-    "created": 1579657485043,
-    "modified": 1579657485078
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0b435e7e-50e8-4311-9747-e4e4990e46a3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7418141824743.ai",
-    "file_size": 886062,
-    "path": "0b435e7e-50e8-4311-9747-e4e4990e46a3",
-    "created": 1579657494568,
-    "modified": 1579657494602
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "77600fed-d879-4aad-ba46-a7e50b9fa45f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7418173724743.ai",
-    "file_size": 884500,
-    "path": "77600fed-d879-4aad-ba46-a7e50b9fa45f",
-    "created": 1579657499906,
-    "modified": 1579657499937
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "800966b4-e226-4917-855a-5181a3ce4419",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7418201924743.ai",
-    "file_size": 892530,
-    "path": "800966b4-e226-4917-855a-5181a3ce4419",
-    "created": 1579657504593,
-    "modified": 1579657504625
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "484f9a70-97a2-4d3f-b6c6-a3ed44cde8ef",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7422037824743.ai",
-    "file_size": 913408,
-    "path": "484f9a70-97a2-4d3f-b6c6-a3ed44cde8ef",
-    "created": 1579658143912,
-    "modified": 1579658143940
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "aa385f79-f7f8-40d7-b98c-7580a6d45d58",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7424379124743.ai",
-    "file_size": 15722754,
-    "path": "aa385f79-f7f8-40d7-b98c-7580a6d45d58",
-    "created": 1579658534501,
-    "modified": 1579658534633
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b8b7cee7-2bb3-42c1-9b19-950e35bbc8d3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7424472124743.ai",
-    "file_size": 883906,
-    "path": "b8b7cee7-2bb3-42c1-9b19-950e35bbc8d3",
-    "created": 1579658549637,
-    "modified": 1579658549667
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4e70f8bf-3346-49a5-bde2-6521ce652797",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7426919024743.ai",
-    "file_size": 881244,
-    "path": "4e70f8bf-3346-49a5-bde2-6521ce652797",
-    "created": 1579658957479,
-    "modified": 1579658957509
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "eb5c5bc8-c68a-405a-815d-eff3956cb371",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7427920524743.ai",
-    "file_size": 878155,
-    "path": "eb5c5bc8-c68a-405a-815d-eff3956cb371",
-    "created": 1579659124521,
-    "modified": 1579659124554
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "182e7475-c488-47f8-996d-80cefca23751",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7428835024743.ai",
-    "file_size": 2175386,
-    "path": "182e7475-c488-47f8-996d-80cefca23751",
-    "created": 1579659276953,
-    "modified": 1579659276992
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f7b957c1-9879-41b8-85af-415598c3a3de",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7429121224743.ai",
-    "file_size": 881290,
-    "path": "f7b957c1-9879-41b8-85af-415598c3a3de",
-    "created": 1579659324575,
-    "modified": 1579659324610
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a6627650-9fe3-4482-b1aa-13fb887f173f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8859642424743.ai",
-    "file_size": 2185490,
-    "path": "a6627650-9fe3-4482-b1aa-13fb887f173f",
-    "created": 1580124114795,
-    "modified": 1580124114855
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ee27a2d2-212a-406e-a62c-49ad071963bf",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8859853624743.ai",
-    "file_size": 2185273,
-    "path": "ee27a2d2-212a-406e-a62c-49ad071963bf",
-    "created": 1580124149920,
-    "modified": 1580124149964
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9f1c3f7f-9667-4ac4-8a12-476bfd6f92a6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8860049824743.ai",
-    "file_size": 2185545,
-    "path": "9f1c3f7f-9667-4ac4-8a12-476bfd6f92a6",
-    "created": 1580124182595,
-    "modified": 1580124182639
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "af663635-92eb-478a-9706-b10af6170686",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8860268324743.ai",
-    "file_size": 2185538,
-    "path": "af663635-92eb-478a-9706-b10af6170686",
-    "created": 1580124219010,
-    "modified": 1580124219049
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f62ab11e-6eb5-4089-9c20-f4106b4946b6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8941428224743.ai",
-    "file_size": 2185437,
-    "path": "f62ab11e-6eb5-4089-9c20-f4106b4946b6",
-    "created": 1580137745835,
-    "modified": 1580137745869
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "84ca792c-2476-4a75-9d4b-dcd3de4b4c0a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp9194422124743.ai",
-    "file_size": 35124,
-    "path": "84ca792c-2476-4a75-9d4b-dcd3de4b4c0a",
-    "created": 1580179911936,
-    "modified": 1580179911948
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5e02b1fe-d52d-4d51-823d-64d138642c89",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp9201399424743.ai",
-    "file_size": 34918,
-    "path": "5e02b1fe-d52d-4d51-823d-64d138642c89",
-    "created": 1580181074827,
-    "modified": 1580181074860
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "da510e0b-cf8a-4d8a-8b19-a2b8339da996",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp9202370224743.ai",
-    "file_size": 34701,
-    "path": "da510e0b-cf8a-4d8a-8b19-a2b8339da996",
-    "created": 1580181236631,
-    "modified": 1580181236671
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7f74abf5-4856-4a67-98cb-01f8b006b2eb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp21307800503.ai",
-    "file_size": 908349,
-    "path": "7f74abf5-4856-4a67-98cb-01f8b006b2eb",
-    "created": 1580848066298,
-    "modified": 1580848066358
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ecec33cc-153a-4cc5-9b4f-bfc428e2ccf9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp24191210503.ai",
-    "file_size": 2185566,
-    "path": "ecec33cc-153a-4cc5-9b4f-bfc428e2ccf9",
-    "created": 1580956127781,
-    "modified": 1580956127833
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6a82c7ce-785a-4c30-83b6-f9627eaf066c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp24530026503.ai",
-    "file_size": 1749300,
-    "path": "6a82c7ce-785a-4c30-83b6-f9627eaf066c",
-    "created": 1580968888890,
-    "modified": 1580968888940
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e1d474e4-7364-49bf-8e4b-97956d0cc7b2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp24544619503.ai",
-    "file_size": 896383,
-    "path": "e1d474e4-7364-49bf-8e4b-97956d0cc7b2",
-    "created": 1580969132066,
-    "modified": 1580969132077
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "270e0783-3da0-429e-9a5c-b8c2858a4d67",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp24549378503.ai",
-    "file_size": 881160,
-    "path": "270e0783-3da0-429e-9a5c-b8c2858a4d67",
-    "created": 1580969211411,
-    "modified": 1580969211455
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e34ce870-9ac9-4578-b494-77c532ea4133",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp24670591503.ai",
-    "file_size": 884083,
-    "path": "e34ce870-9ac9-4578-b494-77c532ea4133",
-    "created": 1580971231564,
-    "modified": 1580971231600
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "bc5d1c57-ea67-4a15-a0b8-fbd3bd7df397",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp24703904503.ai",
-    "file_size": 887955,
-    "path": "bc5d1c57-ea67-4a15-a0b8-fbd3bd7df397",
-    "created": 1580971786810,
-    "modified": 1580971786847
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a8f0ea17-a1e2-41a1-9edb-6ec0e2548dab",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp24725052503.ai",
-    "file_size": 881609,
-    "path": "a8f0ea17-a1e2-41a1-9edb-6ec0e2548dab",
-    "created": 1580972139262,
-    "modified": 1580972139303
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d34939cb-36a8-47be-8f0f-6010f3bf0f5a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp24796987503.ai",
-    "file_size": 884564,
-    "path": "d34939cb-36a8-47be-8f0f-6010f3bf0f5a",
-    "created": 1580973338199,
-    "modified": 1580973338245
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1d1c37fe-e8aa-4ded-b6a9-fff9dc9572fe",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp24800473503.ai",
-    "file_size": 884575,
-    "path": "1d1c37fe-e8aa-4ded-b6a9-fff9dc9572fe",
-    "created": 1580973396299,
-    "modified": 1580973396330
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "60d0e4ef-d3e8-4ac7-b966-6556821a3aca",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7097123400.ai",
-    "file_size": 40012,
-    "path": "60d0e4ef-d3e8-4ac7-b966-6556821a3aca",
-    "created": 1581372013873,
-    "modified": 1581372013909
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "dd4d8725-e7f5-42bb-b8b4-0217c70d3e3d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7098853400.ai",
-    "file_size": 40475,
-    "path": "dd4d8725-e7f5-42bb-b8b4-0217c70d3e3d",
-    "created": 1581372042696,
-    "modified": 1581372042732
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ea4b02e6-07b5-426c-b71b-7d566ad1a322",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8668659400.ai",
-    "file_size": 906047,
-    "path": "ea4b02e6-07b5-426c-b71b-7d566ad1a322",
-    "created": 1581450432552,
-    "modified": 1581450432563
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9a20980a-f759-4a84-a0ec-1e6d30e3fc7e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8672178400.ai",
-    "file_size": 1083025,
-    "path": "9a20980a-f759-4a84-a0ec-1e6d30e3fc7e",
-    "created": 1581450491199,
-    "modified": 1581450491213
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d712ca61-9a9c-412a-93c1-4da48d83f360",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8688250400.ai",
-    "file_size": 1085065,
-    "path": "d712ca61-9a9c-412a-93c1-4da48d83f360",
-    "created": 1581450759071,
-    "modified": 1581450759098
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "32eaf427-b83f-4690-b49a-5ab339a67e00",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp10326000400.ai",
-    "file_size": 906139,
-    "path": "32eaf427-b83f-4690-b49a-5ab339a67e00",
-    "created": 1581560171378,
-    "modified": 1581560171419
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "73e63964-b54d-4b40-9fb0-f4cae1db6c95",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp10720277400.ai",
-    "file_size": 44286,
-    "path": "73e63964-b54d-4b40-9fb0-f4cae1db6c95",
-    "created": 1581569932703,
-    "modified": 1581569932714
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "572ce7b5-7d8d-4503-a7fe-1adfb990aac8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp10720867400.ai",
-    "file_size": 40014,
-    "path": "572ce7b5-7d8d-4503-a7fe-1adfb990aac8",
-    "created": 1581569942534,
-    "modified": 1581569942560
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d3c5d669-1a21-41a0-9955-c04f099eb4b2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp10928361400.ai",
-    "file_size": 880331,
-    "path": "d3c5d669-1a21-41a0-9955-c04f099eb4b2",
-    "created": 1581573400805,
-    "modified": 1581573400817
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "04350cd1-c938-4a5e-82ca-c4e7251a13c6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp10995035400.ai",
-    "file_size": 880313,
-    "path": "04350cd1-c938-4a5e-82ca-c4e7251a13c6",
-    "created": 1581574512076,
-    "modified": 1581574512098
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8facdabe-79ce-4825-9b95-2f558f945e77",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp11045546400.ai",
-    "file_size": 40947,
-    "path": "8facdabe-79ce-4825-9b95-2f558f945e77",
-    "created": 1581578339001,
-    "modified": 1581578339051
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7f9dc3b5-a48b-41d6-8a68-2b9a928b2110",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp140235094859.ai",
-    "file_size": 35976,
-    "path": "7f9dc3b5-a48b-41d6-8a68-2b9a928b2110",
-    "created": 1583140151531,
-    "modified": 1583140151608
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7b99cd06-331b-4f18-b3ae-2fd1ebaed641",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp150871434859.ai",
-    "file_size": 881397,
-    "path": "7b99cd06-331b-4f18-b3ae-2fd1ebaed641",
-    "created": 1583157878918,
-    "modified": 1583157878939
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3963ed1c-a1df-48ae-bd19-6176337371dd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp150878374859.ai",
-    "file_size": 883839,
-    "path": "3963ed1c-a1df-48ae-bd19-6176337371dd",
-    "created": 1583157890460,
-    "modified": 1583157890490
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "24755f58-af1b-4823-baf4-af4739fd0a08",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp150886114859.ai",
-    "file_size": 886411,
-    "path": "24755f58-af1b-4823-baf4-af4739fd0a08",
-    "created": 1583157903362,
-    "modified": 1583157903378
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a81bf0cf-6bd3-4a05-ad10-0cd70c03215f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp150891274859.ai",
-    "file_size": 880138,
-    "path": "a81bf0cf-6bd3-4a05-ad10-0cd70c03215f",
-    "created": 1583157911953,
-    "modified": 1583157911968
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9ec328d2-54a5-4889-a646-d069a5b5948e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp150901634859.ai",
-    "file_size": 881008,
-    "path": "9ec328d2-54a5-4889-a646-d069a5b5948e",
-    "created": 1583157929264,
-    "modified": 1583157929277
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5c31fdf1-9eba-456a-bc04-a896cdb7bf51",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp150908034859.ai",
-    "file_size": 882925,
-    "path": "5c31fdf1-9eba-456a-bc04-a896cdb7bf51",
-    "created": 1583157939897,
-    "modified": 1583157939910
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "69c80378-4439-4448-85f0-da6ed02840a1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp150915024859.ai",
-    "file_size": 880097,
-    "path": "69c80378-4439-4448-85f0-da6ed02840a1",
-    "created": 1583157951546,
-    "modified": 1583157951560
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "902f2266-6636-4d08-a610-81cf731b38eb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp161661274859.ai",
-    "file_size": 1377879,
-    "path": "902f2266-6636-4d08-a610-81cf731b38eb",
-    "created": 1583200616679,
-    "modified": 1583200616706
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "72b5f99c-e522-4169-8781-04ef8d1c3a45",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp69103797359.ai",
-    "file_size": 3415316,
-    "path": "72b5f99c-e522-4169-8781-04ef8d1c3a45",
-    "created": 1588895673382,
-    "modified": 1588895673490
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5a7c6e43-cfed-456a-b0f4-1b2b765a7bfa",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1108808713079.ai",
-    "file_size": 3415181,
-    "path": "5a7c6e43-cfed-456a-b0f4-1b2b765a7bfa",
-    "created": 1589243386619,
-    "modified": 1589243386654
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "25f2ce40-1664-4bb1-b7ad-377bb5765c62",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1108976213079.ai",
-    "file_size": 890833,
-    "path": "25f2ce40-1664-4bb1-b7ad-377bb5765c62",
-    "created": 1589243414232,
-    "modified": 1589243414247
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4a686d4d-51e2-4ff3-8286-0b882f88328b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1140435513079.ai",
-    "file_size": 18153132,
-    "path": "4a686d4d-51e2-4ff3-8286-0b882f88328b",
-    "created": 1589248657987,
-    "modified": 1589248658092
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "77327134-de60-460a-9c77-bee238af9179",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1146516413079.ai",
-    "file_size": 878230,
-    "path": "77327134-de60-460a-9c77-bee238af9179",
-    "created": 1589249670944,
-    "modified": 1589249670955
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "cb1c153c-0d2b-4d4c-bfac-1a92fe39f644",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1154692013079.ai",
-    "file_size": 879152,
-    "path": "cb1c153c-0d2b-4d4c-bfac-1a92fe39f644",
-    "created": 1589251033630,
-    "modified": 1589251033645
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "26060c93-8767-4bdf-a351-85b6b1c1b591",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1906628613079.ai",
-    "file_size": 1072151,
-    "path": "26060c93-8767-4bdf-a351-85b6b1c1b591",
-    "created": 1589411570375,
-    "modified": 1589411570409
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a440bd86-9ea9-42a7-9d67-82d2a7b5b573",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1908043213079.ai",
-    "file_size": 18148210,
-    "path": "a440bd86-9ea9-42a7-9d67-82d2a7b5b573",
-    "created": 1589411806334,
-    "modified": 1589411806482
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "110d8d13-a077-4a57-a1c3-eaf6b960963d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1923379413079.ai",
-    "file_size": 17962306,
-    "path": "110d8d13-a077-4a57-a1c3-eaf6b960963d",
-    "created": 1589414362296,
-    "modified": 1589414362437
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "85ccd755-10d7-4498-982b-43a6520b24b2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1942302713079.ai",
-    "file_size": 17964181,
-    "path": "85ccd755-10d7-4498-982b-43a6520b24b2",
-    "created": 1589417516134,
-    "modified": 1589417516255
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5679ab03-4a74-4e4a-92c5-ff32bfa8c34b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1942748113079.ai",
-    "file_size": 17966020,
-    "path": "5679ab03-4a74-4e4a-92c5-ff32bfa8c34b",
-    "created": 1589417590363,
-    "modified": 1589417590484
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "13c1222a-def2-4dd7-b6c4-089167ff1602",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1943828313079.ai",
-    "file_size": 1005483,
-    "path": "13c1222a-def2-4dd7-b6c4-089167ff1602",
-    "created": 1589417770269,
-    "modified": 1589417770284
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e9ec37e5-9cdd-429e-8ce5-b98f32a5c450",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2898796927880.ai",
-    "file_size": 884817,
-    "path": "e9ec37e5-9cdd-429e-8ce5-b98f32a5c450",
-    "created": 1589926230398,
-    "modified": 1589926230429
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "aba5a64e-fca5-4443-ab13-b38b9ba08618",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2900583927880.ai",
-    "file_size": 43869,
-    "path": "aba5a64e-fca5-4443-ab13-b38b9ba08618",
-    "created": 1589926528244,
-    "modified": 1589926528257
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a8ae2bc4-6779-4e94-882d-94f95ffea530",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp88863091505.ai",
-    "file_size": 920445,
-    "path": "a8ae2bc4-6779-4e94-882d-94f95ffea530",
-    "created": 1591233616573,
-    "modified": 1591233616634
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ed9dc324-454d-4699-b53d-f7f1779e4c44",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp175665007392.ai",
-    "file_size": 880901,
-    "path": "ed9dc324-454d-4699-b53d-f7f1779e4c44",
-    "created": 1593516243939,
-    "modified": 1593516243988
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b70d2e6d-1914-4284-8cf6-81c0781ef974",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp91055677348.ai",
-    "file_size": 881811,
-    "path": "b70d2e6d-1914-4284-8cf6-81c0781ef974",
-    "created": 1594162050934,
-    "modified": 1594162050971
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "766a31bf-b0af-4659-bab5-6c983b3dd4a0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp91116487348.ai",
-    "file_size": 881762,
-    "path": "766a31bf-b0af-4659-bab5-6c983b3dd4a0",
-    "created": 1594162152245,
-    "modified": 1594162152267
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6f25d1d6-82cb-46c8-a256-831e7d54f497",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp91695977348.ai",
-    "file_size": 916475,
-    "path": "6f25d1d6-82cb-46c8-a256-831e7d54f497",
-    "created": 1594163118141,
-    "modified": 1594163118159
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b89e0084-0348-412e-acf1-ce9135c35fe6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95557417348.ai",
-    "file_size": 948289,
-    "path": "b89e0084-0348-412e-acf1-ce9135c35fe6",
-    "created": 1594169554085,
-    "modified": 1594169554106
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c12f2975-83da-411e-820a-2c226aa1b3cd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95566517348.ai",
-    "file_size": 923278,
-    "path": "c12f2975-83da-411e-820a-2c226aa1b3cd",
-    "created": 1594169569295,
-    "modified": 1594169569304
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f3397285-da51-41f9-9ac6-0a2e3a51a5d6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95814517348.ai",
-    "file_size": 909004,
-    "path": "f3397285-da51-41f9-9ac6-0a2e3a51a5d6",
-    "created": 1594169982584,
-    "modified": 1594169982605
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7d53ab35-0fb8-4771-8cc8-1e14a87b6289",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95839437348.ai",
-    "file_size": 880427,
-    "path": "7d53ab35-0fb8-4771-8cc8-1e14a87b6289",
-    "created": 1594170024118,
-    "modified": 1594170024133
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2ff7e312-b4cf-47c4-b994-53cfdaab82fc",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95845627348.ai",
-    "file_size": 916953,
-    "path": "2ff7e312-b4cf-47c4-b994-53cfdaab82fc",
-    "created": 1594170034492,
-    "modified": 1594170034508
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "001af4dc-879d-466e-a994-465ee57a9883",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95886567348.ai",
-    "file_size": 907518,
-    "path": "001af4dc-879d-466e-a994-465ee57a9883",
-    "created": 1594170102683,
-    "modified": 1594170102697
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8d24e7ad-6207-44a4-acf7-14f03ed6e028",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95911997348.ai",
-    "file_size": 908214,
-    "path": "8d24e7ad-6207-44a4-acf7-14f03ed6e028",
-    "created": 1594170144918,
-    "modified": 1594170144932
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "21aed0cb-443b-4e5c-8275-73310abd325c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95957237348.ai",
-    "file_size": 882507,
-    "path": "21aed0cb-443b-4e5c-8275-73310abd325c",
-    "created": 1594170220400,
-    "modified": 1594170220421
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "81a9c631-38a9-4975-aa2b-22413f506126",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp99389367348.ai",
-    "file_size": 886790,
-    "path": "81a9c631-38a9-4975-aa2b-22413f506126",
-    "created": 1594188248147,
-    "modified": 1594188248186
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0953cf56-e902-4da4-a522-fc5b18b37c32",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp100825097348.ai",
-    "file_size": 932005,
-    "path": "0953cf56-e902-4da4-a522-fc5b18b37c32",
-    "created": 1594190641145,
-    "modified": 1594190641176
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "47ad1e3d-cd72-48ca-8c36-f1ce51aba8dd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp122660137348.ai",
-    "file_size": 880147,
-    "path": "47ad1e3d-cd72-48ca-8c36-f1ce51aba8dd",
-    "created": 1594344818632,
-    "modified": 1594344818723
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c3e0c75f-1818-400f-ac1a-3bda7b9f6989",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp122689107348.ai",
-    "file_size": 880157,
-    "path": "c3e0c75f-1818-400f-ac1a-3bda7b9f6989",
-    "created": 1594344866839,
-    "modified": 1594344866854
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9c13aa07-048d-474b-8d2c-aeecd733ed89",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp122723767348.ai",
-    "file_size": 881268,
-    "path": "9c13aa07-048d-474b-8d2c-aeecd733ed89",
-    "created": 1594344924608,
-    "modified": 1594344924620
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9f24690e-f074-478f-a398-30953a4c6008",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp270884287348.ai",
-    "file_size": 881696,
-    "path": "9f24690e-f074-478f-a398-30953a4c6008",
-    "created": 1594761709034,
-    "modified": 1594761709054
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1c566247-3e75-4153-9aba-b45da791dfba",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp30067167728.ai",
-    "file_size": 909967,
-    "path": "1c566247-3e75-4153-9aba-b45da791dfba",
-    "created": 1596064491124,
-    "modified": 1596064491154
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2f7f5ae2-edbb-47bc-9b1c-6705784f3f90",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp35818817728.ai",
-    "file_size": 910026,
-    "path": "2f7f5ae2-edbb-47bc-9b1c-6705784f3f90",
-    "created": 1596076698842,
-    "modified": 1596076698858
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0d3514a6-120d-41f1-be90-c56a51c2aabe",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp114131827728.ai",
-    "file_size": 894130,
-    "path": "0d3514a6-120d-41f1-be90-c56a51c2aabe",
-    "created": 1596518277760,
-    "modified": 1596518277790
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "58a7782e-aeb4-471e-80c1-243060e401bf",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp114137317728.ai",
-    "file_size": 894130,
-    "path": "58a7782e-aeb4-471e-80c1-243060e401bf",
-    "created": 1596518286872,
-    "modified": 1596518286898
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f4d004d2-149a-4a7e-8d42-2bf5b2b486df",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp114140637728.ai",
-    "file_size": 894381,
-    "path": "f4d004d2-149a-4a7e-8d42-2bf5b2b486df",
-    "created": 1596518292421,
-    "modified": 1596518292436
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "eb60fdde-c7c2-4b11-99d4-5ae0a16df73f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp117159177728.ai",
-    "file_size": 882458,
-    "path": "eb60fdde-c7c2-4b11-99d4-5ae0a16df73f",
-    "created": 1596523359787,
-    "modified": 1596523359804
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a6009d68-ac81-4859-9dcf-bf9430e5c3d8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp117167347728.ai",
-    "file_size": 880565,
-    "path": "a6009d68-ac81-4859-9dcf-bf9430e5c3d8",
-    "created": 1596523373380,
-    "modified": 1596523373401
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "43a6e36f-8b87-4785-bc7a-71d8751de90e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp117169767728.ai",
-    "file_size": 879653,
-    "path": "43a6e36f-8b87-4785-bc7a-71d8751de90e",
-    "created": 1596523377427,
-    "modified": 1596523377449
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f5345fa8-3c48-4fe8-aa77-59127d70d96d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp117172167728.ai",
-    "file_size": 880222,
-    "path": "f5345fa8-3c48-4fe8-aa77-59127d70d96d",
-    "created": 1596523381410,
-    "modified": 1596523381420
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0d5e9bd3-14fd-40aa-8ad5-be96edb9b8e7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp117174277728.ai",
-    "file_size": 879612,
-    "path": "0d5e9bd3-14fd-40aa-8ad5-be96edb9b8e7",
-    "created": 1596523384928,
-    "modified": 1596523384951
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "84481c23-6cfd-4c4b-b9b8-ab656e53a7d8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp426442987728.ai",
-    "file_size": 894330,
-    "path": "84481c23-6cfd-4c4b-b9b8-ab656e53a7d8",
-    "created": 1597694294237,
-    "modified": 1597694294299
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9f324d2d-2628-44b4-bef5-0b8bde768d94",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp426447047728.ai",
-    "file_size": 894140,
-    "path": "9f324d2d-2628-44b4-bef5-0b8bde768d94",
-    "created": 1597694300933,
-    "modified": 1597694300972
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "26b374eb-41df-4ccc-8647-fd24f7b98053",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4381459776722.ai",
-    "file_size": 38486,
-    "path": "26b374eb-41df-4ccc-8647-fd24f7b98053",
-    "created": 1597713801787,
-    "modified": 1597713801813
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e3a56567-6cdc-473e-bfc9-3b4236d97d34",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4381486376722.ai",
-    "file_size": 38359,
-    "path": "e3a56567-6cdc-473e-bfc9-3b4236d97d34",
-    "created": 1597713803909,
-    "modified": 1597713803920
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7e4a67b5-fc4e-4cd1-8f83-b6b01f2d896a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7086171140190.ai",
-    "file_size": 892455,
-    "path": "7e4a67b5-fc4e-4cd1-8f83-b6b01f2d896a",
-    "created": 1598773766014,
-    "modified": 1598773766099
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3e10425d-2ae4-4672-a73c-f48670324fcc",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7086677840190.ai",
-    "file_size": 896608,
-    "path": "3e10425d-2ae4-4672-a73c-f48670324fcc",
-    "created": 1598773850337,
-    "modified": 1598773850349
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "494152cb-2be1-4fe3-973d-b386c46f72aa",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7087224140190.ai",
-    "file_size": 893437,
-    "path": "494152cb-2be1-4fe3-973d-b386c46f72aa",
-    "created": 1598773941451,
-    "modified": 1598773941463
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "85ef5eb3-3cff-4463-9a51-d1c728546b76",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7087281940190.ai",
-    "file_size": 884151,
-    "path": "85ef5eb3-3cff-4463-9a51-d1c728546b76",
-    "created": 1598773951059,
-    "modified": 1598773951068
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "cdbbf929-2dfd-4f96-a8cc-48c883217a6f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7948113665144.ai",
-    "file_size": 883556,
-    "path": "cdbbf929-2dfd-4f96-a8cc-48c883217a6f",
-    "created": 1598996146140,
-    "modified": 1598996146186
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "50cca46d-3248-46d9-9f2b-123a46f99201",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7948140765144.ai",
-    "file_size": 883523,
-    "path": "50cca46d-3248-46d9-9f2b-123a46f99201",
-    "created": 1598996150610,
-    "modified": 1598996150632
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6066580f-0ff3-4beb-ab9f-72e397da4e64",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7948177365144.ai",
-    "file_size": 880622,
-    "path": "6066580f-0ff3-4beb-ab9f-72e397da4e64",
-    "created": 1598996156715,
-    "modified": 1598996156737
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "82a552fc-2953-41b2-acfc-9bbeb049f8c1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7966866665144.ai",
-    "file_size": 885388,
-    "path": "82a552fc-2953-41b2-acfc-9bbeb049f8c1",
-    "created": 1598999271672,
-    "modified": 1598999271683
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "29ed85f8-b65e-4e99-8acf-0c2542d5812a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7966896065144.ai",
-    "file_size": 882984,
-    "path": "29ed85f8-b65e-4e99-8acf-0c2542d5812a",
-    "created": 1598999276554,
-    "modified": 1598999276578
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2ec9704f-278a-40cf-88d7-23667531f265",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7966937765144.ai",
-    "file_size": 883318,
-    "path": "2ec9704f-278a-40cf-88d7-23667531f265",
-    "created": 1598999283485,
-    "modified": 1598999283502
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8b2e9324-b15b-48b2-9133-06f76f1f9ff8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7966969965144.ai",
-    "file_size": 884136,
-    "path": "8b2e9324-b15b-48b2-9133-06f76f1f9ff8",
-    "created": 1598999288868,
-    "modified": 1598999288893
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "720a4a6d-3c38-419a-9604-f646caed2023",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp69103797359.ai",
-    "file_size": 3415316,
-    "path": "720a4a6d-3c38-419a-9604-f646caed2023",
-    "created": 1588895673382,
-    "modified": 1588895673490
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9cbb0e5f-f43c-4c65-bd4b-de65654742d4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1108808713079.ai",
-    "file_size": 3415181,
-    "path": "9cbb0e5f-f43c-4c65-bd4b-de65654742d4",
-    "created": 1589243386619,
-    "modified": 1589243386654
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "166591b4-ba26-4560-bcf5-55ce3ff8464a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1108976213079.ai",
-    "file_size": 890833,
-    "path": "166591b4-ba26-4560-bcf5-55ce3ff8464a",
-    "created": 1589243414232,
-    "modified": 1589243414247
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "092b5b12-f609-4769-a938-25a91d57c9e9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1140435513079.ai",
-    "file_size": 18153132,
-    "path": "092b5b12-f609-4769-a938-25a91d57c9e9",
-    "created": 1589248657987,
-    "modified": 1589248658092
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2124e85e-2355-4e81-a9bf-ddf82a149652",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1146516413079.ai",
-    "file_size": 878230,
-    "path": "2124e85e-2355-4e81-a9bf-ddf82a149652",
-    "created": 1589249670944,
-    "modified": 1589249670955
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ef6ba0c1-08a7-48e9-a432-7936c7a4edf0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1154692013079.ai",
-    "file_size": 879152,
-    "path": "ef6ba0c1-08a7-48e9-a432-7936c7a4edf0",
-    "created": 1589251033630,
-    "modified": 1589251033645
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ed8d311b-8688-4079-ac03-0f25a4044115",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1906628613079.ai",
-    "file_size": 1072151,
-    "path": "ed8d311b-8688-4079-ac03-0f25a4044115",
-    "created": 1589411570375,
-    "modified": 1589411570409
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "cb33dfa3-22a2-4537-924f-1912cf24e59a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1908043213079.ai",
-    "file_size": 18148210,
-    "path": "cb33dfa3-22a2-4537-924f-1912cf24e59a",
-    "created": 1589411806334,
-    "modified": 1589411806482
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "78a33145-c6b2-472d-8fe0-88a3e28d7fc3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1923379413079.ai",
-    "file_size": 17962306,
-    "path": "78a33145-c6b2-472d-8fe0-88a3e28d7fc3",
-    "created": 1589414362296,
-    "modified": 1589414362437
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4afb99d4-3f87-4324-a150-7eb2375dafd2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1942302713079.ai",
-    "file_size": 17964181,
-    "path": "4afb99d4-3f87-4324-a150-7eb2375dafd2",
-    "created": 1589417516134,
-    "modified": 1589417516255
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4ae7ef10-714a-4003-be91-50d4cc8e07d4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1942748113079.ai",
-    "file_size": 17966020,
-    "path": "4ae7ef10-714a-4003-be91-50d4cc8e07d4",
-    "created": 1589417590363,
-    "modified": 1589417590484
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "fdf8e46f-18f3-4441-b63b-b987eb0d82ab",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1943828313079.ai",
-    "file_size": 1005483,
-    "path": "fdf8e46f-18f3-4441-b63b-b987eb0d82ab",
-    "created": 1589417770269,
-    "modified": 1589417770284
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b64b687e-9bf4-4241-b9d1-3e51ec7bff0e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2898796927880.ai",
-    "file_size": 884817,
-    "path": "b64b687e-9bf4-4241-b9d1-3e51ec7bff0e",
-    "created": 1589926230398,
-    "modified": 1589926230429
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c435700c-634f-4acb-9c84-2b8eb46b2697",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2900583927880.ai",
-    "file_size": 43869,
-    "path": "c435700c-634f-4acb-9c84-2b8eb46b2697",
-    "created": 1589926528244,
-    "modified": 1589926528257
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "708d9791-b0c9-454e-aa43-772acaff44f6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp88863091505.ai",
-    "file_size": 920445,
-    "path": "708d9791-b0c9-454e-aa43-772acaff44f6",
-    "created": 1591233616573,
-    "modified": 1591233616634
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8e68cda9-84d1-474a-9325-ac73b65f83a1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp175665007392.ai",
-    "file_size": 880901,
-    "path": "8e68cda9-84d1-474a-9325-ac73b65f83a1",
-    "created": 1593516243939,
-    "modified": 1593516243988
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "df15180f-06b3-4772-8e99-0075f28a9a3e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp91055677348.ai",
-    "file_size": 881811,
-    "path": "df15180f-06b3-4772-8e99-0075f28a9a3e",
-    "created": 1594162050934,
-    "modified": 1594162050971
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "75c38407-8483-4df9-85bf-290de54772a6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp91116487348.ai",
-    "file_size": 881762,
-    "path": "75c38407-8483-4df9-85bf-290de54772a6",
-    "created": 1594162152245,
-    "modified": 1594162152267
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "843d6361-a020-4f25-a2c6-91785d100a18",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp91695977348.ai",
-    "file_size": 916475,
-    "path": "843d6361-a020-4f25-a2c6-91785d100a18",
-    "created": 1594163118141,
-    "modified": 1594163118159
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d58bf94c-6857-497b-a610-f8784580bc9c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95557417348.ai",
-    "file_size": 948289,
-    "path": "d58bf94c-6857-497b-a610-f8784580bc9c",
-    "created": 1594169554085,
-    "modified": 1594169554106
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a94867c3-fbff-43ff-b6d2-feb945ebd2d5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95566517348.ai",
-    "file_size": 923278,
-    "path": "a94867c3-fbff-43ff-b6d2-feb945ebd2d5",
-    "created": 1594169569295,
-    "modified": 1594169569304
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "41293456-03b3-48f0-861e-9201b9a71886",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95814517348.ai",
-    "file_size": 909004,
-    "path": "41293456-03b3-48f0-861e-9201b9a71886",
-    "created": 1594169982584,
-    "modified": 1594169982605
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "46a97251-6869-428b-b07a-9de19f02056c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95839437348.ai",
-    "file_size": 880427,
-    "path": "46a97251-6869-428b-b07a-9de19f02056c",
-    "created": 1594170024118,
-    "modified": 1594170024133
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4c9f1702-fdbe-47a0-b864-8126afdc39d5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95845627348.ai",
-    "file_size": 916953,
-    "path": "4c9f1702-fdbe-47a0-b864-8126afdc39d5",
-    "created": 1594170034492,
-    "modified": 1594170034508
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d77b665e-af01-4dc4-a0d0-d154e75d1514",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95886567348.ai",
-    "file_size": 907518,
-    "path": "d77b665e-af01-4dc4-a0d0-d154e75d1514",
-    "created": 1594170102683,
-    "modified": 1594170102697
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "43aa2f22-1e50-4b96-b4cc-23ed6ea402d1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95911997348.ai",
-    "file_size": 908214,
-    "path": "43aa2f22-1e50-4b96-b4cc-23ed6ea402d1",
-    "created": 1594170144918,
-    "modified": 1594170144932
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "13a9f3bf-c0d8-407a-b2d9-f9b0dc26e391",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp95957237348.ai",
-    "file_size": 882507,
-    "path": "13a9f3bf-c0d8-407a-b2d9-f9b0dc26e391",
-    "created": 1594170220400,
-    "modified": 1594170220421
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d0a88226-cb13-417e-9c39-12826485321d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp99389367348.ai",
-    "file_size": 886790,
-    "path": "d0a88226-cb13-417e-9c39-12826485321d",
-    "created": 1594188248147,
-    "modified": 1594188248186
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "974a47b4-d1b6-4e6f-97d8-8d930a7784af",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp100825097348.ai",
-    "file_size": 932005,
-    "path": "974a47b4-d1b6-4e6f-97d8-8d930a7784af",
-    "created": 1594190641145,
-    "modified": 1594190641176
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9843ec80-5afa-446d-9d56-3109b19f32a2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp122660137348.ai",
-    "file_size": 880147,
-    "path": "9843ec80-5afa-446d-9d56-3109b19f32a2",
-    "created": 1594344818632,
-    "modified": 1594344818723
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "218ccf9a-fd7a-4e9e-95cd-3cdc6541e9fc",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp122689107348.ai",
-    "file_size": 880157,
-    "path": "218ccf9a-fd7a-4e9e-95cd-3cdc6541e9fc",
-    "created": 1594344866839,
-    "modified": 1594344866854
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2defec67-f4cd-4ca6-ba7f-985c3ccae2eb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp122723767348.ai",
-    "file_size": 881268,
-    "path": "2defec67-f4cd-4ca6-ba7f-985c3ccae2eb",
-    "created": 1594344924608,
-    "modified": 1594344924620
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "702a7a00-4a46-43b7-af3f-9f3065419490",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp270884287348.ai",
-    "file_size": 881696,
-    "path": "702a7a00-4a46-43b7-af3f-9f3065419490",
-    "created": 1594761709034,
-    "modified": 1594761709054
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3a57eaea-e818-48c6-9caf-2e4665185b33",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp30067167728.ai",
-    "file_size": 909967,
-    "path": "3a57eaea-e818-48c6-9caf-2e4665185b33",
-    "created": 1596064491124,
-    "modified": 1596064491154
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "bae25fcf-dcbc-422c-a401-9ab4dbb0e998",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp35818817728.ai",
-    "file_size": 910026,
-    "path": "bae25fcf-dcbc-422c-a401-9ab4dbb0e998",
-    "created": 1596076698842,
-    "modified": 1596076698858
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a20cd5bd-cbc9-4841-b0ac-0d608cd732cb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp114131827728.ai",
-    "file_size": 894130,
-    "path": "a20cd5bd-cbc9-4841-b0ac-0d608cd732cb",
-    "created": 1596518277760,
-    "modified": 1596518277790
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1188e2bc-5d37-4866-9b3d-c4cfa72513c0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp114137317728.ai",
-    "file_size": 894130,
-    "path": "1188e2bc-5d37-4866-9b3d-c4cfa72513c0",
-    "created": 1596518286872,
-    "modified": 1596518286898
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "47433744-e82a-47f6-8631-23458bc787fa",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp114140637728.ai",
-    "file_size": 894381,
-    "path": "47433744-e82a-47f6-8631-23458bc787fa",
-    "created": 1596518292421,
-    "modified": 1596518292436
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d31de0ab-2131-406e-aab7-348f9e982c0f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp117159177728.ai",
-    "file_size": 882458,
-    "path": "d31de0ab-2131-406e-aab7-348f9e982c0f",
-    "created": 1596523359787,
-    "modified": 1596523359804
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "fcae0aa3-3d90-4cae-b5ce-b346ae023b1b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp117167347728.ai",
-    "file_size": 880565,
-    "path": "fcae0aa3-3d90-4cae-b5ce-b346ae023b1b",
-    "created": 1596523373380,
-    "modified": 1596523373401
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8b199426-9c1f-48a1-8993-d7c813914951",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp117169767728.ai",
-    "file_size": 879653,
-    "path": "8b199426-9c1f-48a1-8993-d7c813914951",
-    "created": 1596523377427,
-    "modified": 1596523377449
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3e7b98c8-a1b4-4fd5-95ae-ddcf8a657f73",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp117172167728.ai",
-    "file_size": 880222,
-    "path": "3e7b98c8-a1b4-4fd5-95ae-ddcf8a657f73",
-    "created": 1596523381410,
-    "modified": 1596523381420
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4e9981ee-c127-4377-b70c-855ba985bf65",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp117174277728.ai",
-    "file_size": 879612,
-    "path": "4e9981ee-c127-4377-b70c-855ba985bf65",
-    "created": 1596523384928,
-    "modified": 1596523384951
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e1c12079-e344-4117-abae-6870b4271d6a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp426442987728.ai",
-    "file_size": 894330,
-    "path": "e1c12079-e344-4117-abae-6870b4271d6a",
-    "created": 1597694294237,
-    "modified": 1597694294299
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "60dfa196-3468-4cb0-aadc-acbd775f1332",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp426447047728.ai",
-    "file_size": 894140,
-    "path": "60dfa196-3468-4cb0-aadc-acbd775f1332",
-    "created": 1597694300933,
-    "modified": 1597694300972
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1d9cf6dc-2b51-457c-96cd-25d0777ffd6b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4381459776722.ai",
-    "file_size": 38486,
-    "path": "1d9cf6dc-2b51-457c-96cd-25d0777ffd6b",
-    "created": 1597713801787,
-    "modified": 1597713801813
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8c076c6d-cf0d-4092-b391-2b8a31be118e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4381486376722.ai",
-    "file_size": 38359,
-    "path": "8c076c6d-cf0d-4092-b391-2b8a31be118e",
-    "created": 1597713803909,
-    "modified": 1597713803920
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7f5d16af-8834-4428-8fbb-bf6427515085",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7086171140190.ai",
-    "file_size": 892455,
-    "path": "7f5d16af-8834-4428-8fbb-bf6427515085",
-    "created": 1598773766014,
-    "modified": 1598773766099
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ebfcb2a3-efb7-431e-8838-6e1cfc634888",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7086677840190.ai",
-    "file_size": 896608,
-    "path": "ebfcb2a3-efb7-431e-8838-6e1cfc634888",
-    "created": 1598773850337,
-    "modified": 1598773850349
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "469f1e75-2a7f-4dae-8385-f4b74564bb6a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7087224140190.ai",
-    "file_size": 893437,
-    "path": "469f1e75-2a7f-4dae-8385-f4b74564bb6a",
-    "created": 1598773941451,
-    "modified": 1598773941463
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "736add80-29e1-424e-b01d-7692260394d7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7087281940190.ai",
-    "file_size": 884151,
-    "path": "736add80-29e1-424e-b01d-7692260394d7",
-    "created": 1598773951059,
-    "modified": 1598773951068
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "bcfe9442-8bcd-4499-a3fa-d269b6b7a664",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7948113665144.ai",
-    "file_size": 883556,
-    "path": "bcfe9442-8bcd-4499-a3fa-d269b6b7a664",
-    "created": 1598996146140,
-    "modified": 1598996146186
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9d617c50-5c74-41c3-a1ff-0f9e3b351636",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7948140765144.ai",
-    "file_size": 883523,
-    "path": "9d617c50-5c74-41c3-a1ff-0f9e3b351636",
-    "created": 1598996150610,
-    "modified": 1598996150632
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3cdd5479-7e56-4f9b-a893-ee936ab0a083",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7948177365144.ai",
-    "file_size": 880622,
-    "path": "3cdd5479-7e56-4f9b-a893-ee936ab0a083",
-    "created": 1598996156715,
-    "modified": 1598996156737
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "da16fa3b-a861-4078-8b74-fbda6a55d298",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7966866665144.ai",
-    "file_size": 885388,
-    "path": "da16fa3b-a861-4078-8b74-fbda6a55d298",
-    "created": 1598999271672,
-    "modified": 1598999271683
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a5387be3-9a2c-4d3a-8784-aa37684fa6eb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7966896065144.ai",
-    "file_size": 882984,
-    "path": "a5387be3-9a2c-4d3a-8784-aa37684fa6eb",
-    "created": 1598999276554,
-    "modified": 1598999276578
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "950a7e82-dc79-4b53-9bad-c064604c629d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7966937765144.ai",
-    "file_size": 883318,
-    "path": "950a7e82-dc79-4b53-9bad-c064604c629d",
-    "created": 1598999283485,
-    "modified": 1598999283502
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a61dee56-3701-45c2-aff8-e9648404dd71",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7966969965144.ai",
-    "file_size": 884136,
-    "path": "a61dee56-3701-45c2-aff8-e9648404dd71",
-    "created": 1598999288868,
-    "modified": 1598999288893
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a56bf597-1fed-42c6-b0b0-c78523c90d51",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1298585525381.ai",
-    "file_size": 891024,
-    "path": "a56bf597-1fed-42c6-b0b0-c78523c90d51",
-    "created": 1600043212876,
-    "modified": 1600043212922
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "90011e86-3b39-48aa-b085-2cb84455b571",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1298840725381.ai",
-    "file_size": 890725,
-    "path": "90011e86-3b39-48aa-b085-2cb84455b571",
-    "created": 1600043255325,
-    "modified": 1600043255344
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b7ca0c04-07d7-4578-8545-729a12d9d29e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp18885214095.ai",
-    "file_size": 886786,
-    "path": "b7ca0c04-07d7-4578-8545-729a12d9d29e",
-    "created": 1600207807195,
-    "modified": 1600207807222
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "bc7a0df9-a53d-48c7-adb4-c747121d0b6d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp19045294095.ai",
-    "file_size": 887424,
-    "path": "bc7a0df9-a53d-48c7-adb4-c747121d0b6d",
-    "created": 1600208074035,
-    "modified": 1600208074052
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "596fb68e-c712-4c7c-9cba-825ce97cb595",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp20514114095.ai",
-    "file_size": 886893,
-    "path": "596fb68e-c712-4c7c-9cba-825ce97cb595",
-    "created": 1600210522298,
-    "modified": 1600210522317
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c6ed2751-d038-405a-9c28-eb5bf31d33fd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp20958884095.ai",
-    "file_size": 892966,
-    "path": "c6ed2751-d038-405a-9c28-eb5bf31d33fd",
-    "created": 1600211263389,
-    "modified": 1600211263399
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "180b0593-950f-4b80-a8f5-ef317bbcc5f0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp60790084095.ai",
-    "file_size": 886866,
-    "path": "180b0593-950f-4b80-a8f5-ef317bbcc5f0",
-    "created": 1600379044254,
-    "modified": 1600379044351
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "446acceb-1517-4c12-9d40-96d6bbba65e0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp61146034095.ai",
-    "file_size": 885424,
-    "path": "446acceb-1517-4c12-9d40-96d6bbba65e0",
-    "created": 1600379637469,
-    "modified": 1600379637492
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f8ec55e5-fdd6-40b4-a533-dc3d44b83ee7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp61254374095.ai",
-    "file_size": 885992,
-    "path": "f8ec55e5-fdd6-40b4-a533-dc3d44b83ee7",
-    "created": 1600379818006,
-    "modified": 1600379818023
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9aa086a8-660f-44d5-999f-6eb963220b14",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp69177724095.ai",
-    "file_size": 886023,
-    "path": "9aa086a8-660f-44d5-999f-6eb963220b14",
-    "created": 1600393023844,
-    "modified": 1600393023867
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "adb513b9-ccf1-428e-bc60-446ed26c1f38",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp69188514095.ai",
-    "file_size": 887526,
-    "path": "adb513b9-ccf1-428e-bc60-446ed26c1f38",
-    "created": 1600393041896,
-    "modified": 1600393041932
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "82d47772-5997-4bed-b00f-9522a52e5c1d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp69347064095.ai",
-    "file_size": 52622,
-    "path": "82d47772-5997-4bed-b00f-9522a52e5c1d",
-    "created": 1600393306094,
-    "modified": 1600393306106
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8f72d625-e3ff-41b9-b28b-012a0d673cf7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp77737034095.ai",
-    "file_size": 884273,
-    "path": "8f72d625-e3ff-41b9-b28b-012a0d673cf7",
-    "created": 1600567744175,
-    "modified": 1600567744220
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d4b02648-c706-4d9c-aaa1-92fcad2e4208",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp77741434095.ai",
-    "file_size": 883047,
-    "path": "d4b02648-c706-4d9c-aaa1-92fcad2e4208",
-    "created": 1600567751459,
-    "modified": 1600567751488
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9dfc597b-9f79-4bab-9cc9-d82191f609a9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp77744654095.ai",
-    "file_size": 885537,
-    "path": "9dfc597b-9f79-4bab-9cc9-d82191f609a9",
-    "created": 1600567756844,
-    "modified": 1600567756861
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "83b2cfdd-da5b-43a7-8cdf-58968f72cfa1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp78071334095.ai",
-    "file_size": 885275,
-    "path": "83b2cfdd-da5b-43a7-8cdf-58968f72cfa1",
-    "created": 1600568301323,
-    "modified": 1600568301362
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "970fe094-fa50-460e-9d28-51438c06aa5d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp86515024095.ai",
-    "file_size": 885031,
-    "path": "970fe094-fa50-460e-9d28-51438c06aa5d",
-    "created": 1600582374445,
-    "modified": 1600582374530
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f75ebd47-f2bd-4a5b-8fdd-a68f8d5dd667",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp86520214095.ai",
-    "file_size": 884935,
-    "path": "f75ebd47-f2bd-4a5b-8fdd-a68f8d5dd667",
-    "created": 1600582383085,
-    "modified": 1600582383108
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "dea36daf-b21d-4539-a777-f8e07f41134a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp88290754095.ai",
-    "file_size": 885040,
-    "path": "dea36daf-b21d-4539-a777-f8e07f41134a",
-    "created": 1600585334101,
-    "modified": 1600585334124
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "bff9d9f2-6541-4b4d-9183-9a0efbc3a0c1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1302067724356.ai",
-    "file_size": 883256,
-    "path": "bff9d9f2-6541-4b4d-9183-9a0efbc3a0c1",
-    "created": 1600655195162,
-    "modified": 1600655195215
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ee3072db-34a5-486a-8663-1d0e884dde66",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp15474863658.ai",
-    "file_size": 887286,
-    "path": "ee3072db-34a5-486a-8663-1d0e884dde66",
-    "created": 1600724941061,
-    "modified": 1600724941099
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7144c136-5220-41eb-b2fc-a63b2e1765b8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp15542773658.ai",
-    "file_size": 887429,
-    "path": "7144c136-5220-41eb-b2fc-a63b2e1765b8",
-    "created": 1600725054271,
-    "modified": 1600725054308
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "874a8b9d-1112-4e65-907c-cf5101b76869",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp15877923658.ai",
-    "file_size": 886010,
-    "path": "874a8b9d-1112-4e65-907c-cf5101b76869",
-    "created": 1600725612844,
-    "modified": 1600725612920
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b5bba9e7-9d67-49e6-84dc-1aa19bfbbdf4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp17925773658.ai",
-    "file_size": 894111,
-    "path": "b5bba9e7-9d67-49e6-84dc-1aa19bfbbdf4",
-    "created": 1600733332194,
-    "modified": 1600733332299
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "210ab1aa-7821-40de-83d9-a2b2ed9a8e4c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp30458873658.ai",
-    "file_size": 890134,
-    "path": "210ab1aa-7821-40de-83d9-a2b2ed9a8e4c",
-    "created": 1600754220927,
-    "modified": 1600754221001
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8005919a-9f82-4593-9419-568dca5e57d2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp35688183658.ai",
-    "file_size": 38785,
-    "path": "8005919a-9f82-4593-9419-568dca5e57d2",
-    "created": 1600762936548,
-    "modified": 1600762936566
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e1206014-ac5a-4ea7-9ed4-c105d34427f2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp62614917921.ai",
-    "file_size": 903824,
-    "path": "e1206014-ac5a-4ea7-9ed4-c105d34427f2",
-    "created": 1600822173797,
-    "modified": 1600822173855
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "34ea23ab-875f-4dc3-89c1-f0a68645028b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp20883122384.ai",
-    "file_size": 893383,
-    "path": "34ea23ab-875f-4dc3-89c1-f0a68645028b",
-    "created": 1602130518299,
-    "modified": 1602130518353
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "01220341-3a64-4f48-a5a2-d8541e9abf90",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp20891922384.ai",
-    "file_size": 893314,
-    "path": "01220341-3a64-4f48-a5a2-d8541e9abf90",
-    "created": 1602130663249,
-    "modified": 1602130663280
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "67eb1e21-42cf-4d98-8bfd-049aae4adecd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp20923620384.ai",
-    "file_size": 894133,
-    "path": "67eb1e21-42cf-4d98-8bfd-049aae4adecd",
-    "created": 1602131191695,
-    "modified": 1602131191738
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9f5a33f4-0440-477e-814f-0e86fd337f7f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp20947101384.ai",
-    "file_size": 882982,
-    "path": "9f5a33f4-0440-477e-814f-0e86fd337f7f",
-    "created": 1602131582892,
-    "modified": 1602131582932
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3bd5f8cf-4538-4a9a-8783-bc759f9783ed",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp20948677384.ai",
-    "file_size": 879903,
-    "path": "3bd5f8cf-4538-4a9a-8783-bc759f9783ed",
-    "created": 1602131609076,
-    "modified": 1602131609109
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "02ba4064-c38a-44c0-adaf-0b3018e6473d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp33812785487.ai",
-    "file_size": 883829,
-    "path": "02ba4064-c38a-44c0-adaf-0b3018e6473d",
-    "created": 1602568585712,
-    "modified": 1602568585772
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9a26a895-69e1-4152-8d0d-adb73e7b7cfb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp735989711667.ai",
-    "file_size": 880785,
-    "path": "9a26a895-69e1-4152-8d0d-adb73e7b7cfb",
-    "created": 1602636743346,
-    "modified": 1602636743401
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a29a2f26-dd2c-4ddd-91f2-73dc46b3f6c9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4205613399.ai",
-    "file_size": 882709,
-    "path": "a29a2f26-dd2c-4ddd-91f2-73dc46b3f6c9",
-    "created": 1603155191255,
-    "modified": 1603155191326
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "53594e0c-9fe8-47eb-b80c-43d22d65e9eb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp32173893616.ai",
-    "file_size": 880263,
-    "path": "53594e0c-9fe8-47eb-b80c-43d22d65e9eb",
-    "created": 1603262163285,
-    "modified": 1603262163349
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "337f271a-bfb0-48d8-b7d6-7c8b329cff88",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp32212113616.ai",
-    "file_size": 880379,
-    "path": "337f271a-bfb0-48d8-b7d6-7c8b329cff88",
-    "created": 1603262226800,
-    "modified": 1603262226834
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "aa413b53-ae55-401b-ad47-388f8ce5770b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp167352373616.ai",
-    "file_size": 878453,
-    "path": "aa413b53-ae55-401b-ad47-388f8ce5770b",
-    "created": 1603804031989,
-    "modified": 1603804032054
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f76930ad-1084-483f-8ea6-c1e246adb561",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp167843533616.ai",
-    "file_size": 878408,
-    "path": "f76930ad-1084-483f-8ea6-c1e246adb561",
-    "created": 1603804850572,
-    "modified": 1603804850598
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "dfe2a7a1-aa99-4493-94ae-ed1e3cd40672",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp170337213616.ai",
-    "file_size": 880258,
-    "path": "dfe2a7a1-aa99-4493-94ae-ed1e3cd40672",
-    "created": 1603829057584,
-    "modified": 1603829057619
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b64e9c72-cd9d-4fd0-849a-dc73f9763693",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp171876913616.ai",
-    "file_size": 878449,
-    "path": "b64e9c72-cd9d-4fd0-849a-dc73f9763693",
-    "created": 1603831623960,
-    "modified": 1603831623997
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "39abef13-dd1c-4c0c-b86e-04b9041c6357",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp172257693616.ai",
-    "file_size": 878184,
-    "path": "39abef13-dd1c-4c0c-b86e-04b9041c6357",
-    "created": 1603832258580,
-    "modified": 1603832258611
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b4407f81-fe2c-4a4a-b957-33446fcce770",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp10803491086.ai",
-    "file_size": 884738,
-    "path": "b4407f81-fe2c-4a4a-b957-33446fcce770",
-    "created": 1604642904863,
-    "modified": 1604642904949
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e83d0a34-f334-4c42-bf58-728403539533",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp10902821086.ai",
-    "file_size": 35790,
-    "path": "e83d0a34-f334-4c42-bf58-728403539533",
-    "created": 1604643070052,
-    "modified": 1604643070077
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7401de7b-8e9a-4b7e-a022-26480167986a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp10931051086.ai",
-    "file_size": 35311,
-    "path": "7401de7b-8e9a-4b7e-a022-26480167986a",
-    "created": 1604643117101,
-    "modified": 1604643117127
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "91ffb3c9-4b30-420e-afd1-758230166838",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp28610433235.ai",
-    "file_size": 878412,
-    "path": "91ffb3c9-4b30-420e-afd1-758230166838",
-    "created": 1605937129625,
-    "modified": 1605937129681
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "53dd16a5-e7b9-4a1d-93ff-a4a05d288954",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp28664073235.ai",
-    "file_size": 878435,
-    "path": "53dd16a5-e7b9-4a1d-93ff-a4a05d288954",
-    "created": 1605937217626,
-    "modified": 1605937217637
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0f9c5703-72a1-493c-bbc0-0f0a2a09dcb1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp31017863235.ai",
-    "file_size": 880126,
-    "path": "0f9c5703-72a1-493c-bbc0-0f0a2a09dcb1",
-    "created": 1605941140780,
-    "modified": 1605941140790
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "cbec0fa0-2416-411b-b998-6447e023bdd5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp59020963235.ai",
-    "file_size": 882279,
-    "path": "cbec0fa0-2416-411b-b998-6447e023bdd5",
-    "created": 1606049933399,
-    "modified": 1606049933415
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "88f58b89-7f39-4e96-9a7a-d11fa21616e9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp59054373235.ai",
-    "file_size": 882289,
-    "path": "88f58b89-7f39-4e96-9a7a-d11fa21616e9",
-    "created": 1606049989093,
-    "modified": 1606049989105
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "35d63279-6096-439c-b0f1-6effbf7a6030",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp59062863235.ai",
-    "file_size": 882068,
-    "path": "35d63279-6096-439c-b0f1-6effbf7a6030",
-    "created": 1606050003238,
-    "modified": 1606050003284
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "79baac6c-001e-459f-ab95-3ee85d0e722e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp195426503235.ai",
-    "file_size": 880469,
-    "path": "79baac6c-001e-459f-ab95-3ee85d0e722e",
-    "created": 1606334155944,
-    "modified": 1606334156027
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "97ba7aea-94e9-4685-bafe-dcc5875a610f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp195432413235.ai",
-    "file_size": 881820,
-    "path": "97ba7aea-94e9-4685-bafe-dcc5875a610f",
-    "created": 1606334165858,
-    "modified": 1606334165899
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7d30d2eb-48cd-4c6e-93d0-06244e6800ae",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp195745273235.ai",
-    "file_size": 880479,
-    "path": "7d30d2eb-48cd-4c6e-93d0-06244e6800ae",
-    "created": 1606334687213,
-    "modified": 1606334687254
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2d947f3d-20ce-42c4-ad88-2bf051716389",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7692284474.ai",
-    "file_size": 882879,
-    "path": "2d947f3d-20ce-42c4-ad88-2bf051716389",
-    "created": 1606961287328,
-    "modified": 1606961287385
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "db4be107-92e1-4814-a3d1-840303a4862e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp8033254474.ai",
-    "file_size": 883458,
-    "path": "db4be107-92e1-4814-a3d1-840303a4862e",
-    "created": 1606961854150,
-    "modified": 1606961854183
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2af2ef76-7f7b-4bb8-9058-47fa2edc4fc6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp102300114474.ai",
-    "file_size": 883358,
-    "path": "2af2ef76-7f7b-4bb8-9058-47fa2edc4fc6",
-    "created": 1607398994058,
-    "modified": 1607398994147
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e81d99a9-0c06-4375-b3a2-a548d193c178",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp102320194474.ai",
-    "file_size": 882973,
-    "path": "e81d99a9-0c06-4375-b3a2-a548d193c178",
-    "created": 1607399027481,
-    "modified": 1607399027524
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7fbdf7fc-b811-4d83-8469-29ac875f6b1a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp124403624474.ai",
-    "file_size": 887695,
-    "path": "7fbdf7fc-b811-4d83-8469-29ac875f6b1a",
-    "created": 1607575790597,
-    "modified": 1607575790729
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "714d3ebd-0cdb-4a46-93ab-ba0875aa44b7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp126678584474.ai",
-    "file_size": 883703,
-    "path": "714d3ebd-0cdb-4a46-93ab-ba0875aa44b7",
-    "created": 1607579582156,
-    "modified": 1607579582172
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6ff513d2-0164-4fa3-860c-67b42efef7a9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp127875404474.ai",
-    "file_size": 887706,
-    "path": "6ff513d2-0164-4fa3-860c-67b42efef7a9",
-    "created": 1607581576883,
-    "modified": 1607581576927
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2606fd0c-36e2-45dd-86cc-e18f9b2fec58",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp127949694474.ai",
-    "file_size": 887953,
-    "path": "2606fd0c-36e2-45dd-86cc-e18f9b2fec58",
-    "created": 1607581700683,
-    "modified": 1607581700695
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4ffc3d9e-3130-49dc-a499-3b91dd08cd6a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3133629447421.ai",
-    "file_size": 48382,
-    "path": "4ffc3d9e-3130-49dc-a499-3b91dd08cd6a",
-    "created": 1611811677928,
-    "modified": 1611811677987
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8318a340-708c-4271-bc2b-21f219ee0583",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3253957547421.ai",
-    "file_size": 883580,
-    "path": "8318a340-708c-4271-bc2b-21f219ee0583",
-    "created": 1611881456922,
-    "modified": 1611881457040
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "60b18dab-519a-4fdb-9351-137f106c1080",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3270107947421.ai",
-    "file_size": 880064,
-    "path": "60b18dab-519a-4fdb-9351-137f106c1080",
-    "created": 1611884148678,
-    "modified": 1611884148703
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "60a6dc22-758f-408b-883a-a1ce34be6f90",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3270610847421.ai",
-    "file_size": 880052,
-    "path": "60a6dc22-758f-408b-883a-a1ce34be6f90",
-    "created": 1611884232489,
-    "modified": 1611884232499
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "17e8612d-621d-48b9-8579-28e4300db28a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1648784762297.ai",
-    "file_size": 34987,
-    "path": "17e8612d-621d-48b9-8579-28e4300db28a",
-    "created": 1613456492594,
-    "modified": 1613456492658
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b476194a-393c-4848-9bb8-1fe6bd3417e9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1748774962297.ai",
-    "file_size": 887061,
-    "path": "b476194a-393c-4848-9bb8-1fe6bd3417e9",
-    "created": 1613475655327,
-    "modified": 1613475655346
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d35736f5-7b0a-4e9f-9645-d63dcbdb827c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp17860247380.ai",
-    "file_size": 35399,
-    "path": "d35736f5-7b0a-4e9f-9645-d63dcbdb827c",
-    "created": 1613511853635,
-    "modified": 1613511853711
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5176ab47-6f64-46f7-a44b-baf6d5abb0a8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp17975557380.ai",
-    "file_size": 37304,
-    "path": "5176ab47-6f64-46f7-a44b-baf6d5abb0a8",
-    "created": 1613512044235,
-    "modified": 1613512044254
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0e52f612-50b0-40ac-b22f-803570985af8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp18054747380.ai",
-    "file_size": 36447,
-    "path": "0e52f612-50b0-40ac-b22f-803570985af8",
-    "created": 1613512176214,
-    "modified": 1613512176232
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2df72eef-7c7e-48a4-8f35-742b879fc918",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp18109497380.ai",
-    "file_size": 37595,
-    "path": "2df72eef-7c7e-48a4-8f35-742b879fc918",
-    "created": 1613512267454,
-    "modified": 1613512267463
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2f81eeb3-adb8-4077-b338-234b84382b1c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp18181137380.ai",
-    "file_size": 36619,
-    "path": "2f81eeb3-adb8-4077-b338-234b84382b1c",
-    "created": 1613512386845,
-    "modified": 1613512386862
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e04cad16-acd4-463d-ba8a-5fc5e5b807ff",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp18219857380.ai",
-    "file_size": 36649,
-    "path": "e04cad16-acd4-463d-ba8a-5fc5e5b807ff",
-    "created": 1613512451415,
-    "modified": 1613512451435
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "35a60b5d-2974-4755-92d8-89c1779d45f0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp18285197380.ai",
-    "file_size": 36658,
-    "path": "35a60b5d-2974-4755-92d8-89c1779d45f0",
-    "created": 1613512560309,
-    "modified": 1613512560328
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3eb242fb-edce-457e-943a-6a71db946a21",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp18325627380.ai",
-    "file_size": 37334,
-    "path": "3eb242fb-edce-457e-943a-6a71db946a21",
-    "created": 1613512627669,
-    "modified": 1613512627690
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "305f921d-662b-4270-9ee4-ca2991789a6f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp18380817380.ai",
-    "file_size": 35371,
-    "path": "305f921d-662b-4270-9ee4-ca2991789a6f",
-    "created": 1613512719661,
-    "modified": 1613512719680
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5f37a0f3-4b71-4ba2-b37c-8f0e3124ef48",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp19804937380.ai",
-    "file_size": 887200,
-    "path": "5f37a0f3-4b71-4ba2-b37c-8f0e3124ef48",
-    "created": 1613515093209,
-    "modified": 1613515093223
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "fc6f2d17-586d-4a4c-b759-501e85bc812e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp853148346840.ai",
-    "file_size": 887038,
-    "path": "fc6f2d17-586d-4a4c-b759-501e85bc812e",
-    "created": 1613786825579,
-    "modified": 1613786825626
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "11668382-bf68-4190-8eb8-1dd2fe5dd5c8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1691126646840.ai",
-    "file_size": 908541,
-    "path": "11668382-bf68-4190-8eb8-1dd2fe5dd5c8",
-    "created": 1613970832547,
-    "modified": 1613970832601
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a3ea4d59-084d-48cf-b937-47abe107fafc",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1691865246840.ai",
-    "file_size": 881235,
-    "path": "a3ea4d59-084d-48cf-b937-47abe107fafc",
-    "created": 1613970955492,
-    "modified": 1613970955534
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9ee3cb01-abca-43b8-aed0-6a269f6da7e0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1693544946840.ai",
-    "file_size": 909236,
-    "path": "9ee3cb01-abca-43b8-aed0-6a269f6da7e0",
-    "created": 1613971235415,
-    "modified": 1613971235459
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2951d4f9-8d22-4c8f-8583-654f40346022",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1698894646840.ai",
-    "file_size": 909446,
-    "path": "2951d4f9-8d22-4c8f-8583-654f40346022",
-    "created": 1613972126998,
-    "modified": 1613972127039
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2ccbfbfb-2db2-4aac-a56f-b4898682a2a3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1707118946840.ai",
-    "file_size": 908601,
-    "path": "2ccbfbfb-2db2-4aac-a56f-b4898682a2a3",
-    "created": 1613973497591,
-    "modified": 1613973497611
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "95ef21c9-b317-48b5-aa76-d7351c27117c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1707636446840.ai",
-    "file_size": 908588,
-    "path": "95ef21c9-b317-48b5-aa76-d7351c27117c",
-    "created": 1613973583862,
-    "modified": 1613973583900
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "186851f9-abca-447b-9164-d40fead6856a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1708072246840.ai",
-    "file_size": 879446,
-    "path": "186851f9-abca-447b-9164-d40fead6856a",
-    "created": 1613973656523,
-    "modified": 1613973656592
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c92fb5c9-a929-4f1e-8e63-1b384572c8d3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1709260646840.ai",
-    "file_size": 908357,
-    "path": "c92fb5c9-a929-4f1e-8e63-1b384572c8d3",
-    "created": 1613973854567,
-    "modified": 1613973854604
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f0325e27-bf56-4fd5-bd34-3822f9cd40b2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1731487346840.ai",
-    "file_size": 7831136,
-    "path": "f0325e27-bf56-4fd5-bd34-3822f9cd40b2",
-    "created": 1613977559321,
-    "modified": 1613977559427
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "09814146-266e-406a-a978-4f4767ef793c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1813208146840.ai",
-    "file_size": 36991282,
-    "path": "09814146-266e-406a-a978-4f4767ef793c",
-    "created": 1613991180468,
-    "modified": 1613991180864
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1c10501f-c44d-4c56-8a58-c7cbf3309b50",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1813504546840.ai",
-    "file_size": 909757,
-    "path": "1c10501f-c44d-4c56-8a58-c7cbf3309b50",
-    "created": 1613991229010,
-    "modified": 1613991229065
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1f83ea38-eb0f-48ce-aa39-84e4ca534521",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1813845146840.ai",
-    "file_size": 882821,
-    "path": "1f83ea38-eb0f-48ce-aa39-84e4ca534521",
-    "created": 1613991285924,
-    "modified": 1613991285976
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d018b553-1a12-4945-b06d-594085d2b1ad",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1836799646840.ai",
-    "file_size": 882396,
-    "path": "d018b553-1a12-4945-b06d-594085d2b1ad",
-    "created": 1613995111618,
-    "modified": 1613995111665
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7f6e180c-574c-4cc2-b9d2-09bb32262a6c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1845989746840.ai",
-    "file_size": 888381,
-    "path": "7f6e180c-574c-4cc2-b9d2-09bb32262a6c",
-    "created": 1613996643255,
-    "modified": 1613996643305
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c524ab2d-6dcb-4a44-8176-f0b4ad41863f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1847099246840.ai",
-    "file_size": 888466,
-    "path": "c524ab2d-6dcb-4a44-8176-f0b4ad41863f",
-    "created": 1613996828157,
-    "modified": 1613996828213
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b2ad0ebd-78bb-4bbb-8add-4f4efd4b36ca",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2145547446840.ai",
-    "file_size": 880398,
-    "path": "b2ad0ebd-78bb-4bbb-8add-4f4efd4b36ca",
-    "created": 1614046570386,
-    "modified": 1614046570465
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9d014cf4-c447-4f95-9ca3-226beef8ebb4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2145773846840.ai",
-    "file_size": 880434,
-    "path": "9d014cf4-c447-4f95-9ca3-226beef8ebb4",
-    "created": 1614046607980,
-    "modified": 1614046607991
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e0f6a1a9-fca5-4800-8149-7451f900d300",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2145859746840.ai",
-    "file_size": 880414,
-    "path": "e0f6a1a9-fca5-4800-8149-7451f900d300",
-    "created": 1614046622347,
-    "modified": 1614046622398
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1a78635a-b3fc-41c8-b255-b873ebe8850f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2145993446840.ai",
-    "file_size": 880273,
-    "path": "1a78635a-b3fc-41c8-b255-b873ebe8850f",
-    "created": 1614046644635,
-    "modified": 1614046644685
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "df15139d-f482-40a2-977a-cc3aad084792",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2146098946840.ai",
-    "file_size": 881446,
-    "path": "df15139d-f482-40a2-977a-cc3aad084792",
-    "created": 1614046662167,
-    "modified": 1614046662215
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "865f1e99-87b5-4d04-ab55-32b566f6c04d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2146243246840.ai",
-    "file_size": 883847,
-    "path": "865f1e99-87b5-4d04-ab55-32b566f6c04d",
-    "created": 1614046686176,
-    "modified": 1614046686222
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "85b92327-3d42-4a7e-a98b-254a8b296c9d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3423273746840.ai",
-    "file_size": 881446,
-    "path": "85b92327-3d42-4a7e-a98b-254a8b296c9d",
-    "created": 1614482076824,
-    "modified": 1614482076917
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b9cfc253-fdae-4199-86cd-734eb47770b4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4801964846840.ai",
-    "file_size": 914228,
-    "path": "b9cfc253-fdae-4199-86cd-734eb47770b4",
-    "created": 1614935055626,
-    "modified": 1614935055744
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f689591a-9522-4594-8476-95cff523582d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4847655146840.ai",
-    "file_size": 899495,
-    "path": "f689591a-9522-4594-8476-95cff523582d",
-    "created": 1614942671024,
-    "modified": 1614942671037
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f055f518-cb7a-4b8d-b836-5d1cd5e2b387",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp4847815046840.ai",
-    "file_size": 894800,
-    "path": "f055f518-cb7a-4b8d-b836-5d1cd5e2b387",
-    "created": 1614942697071,
-    "modified": 1614942697123
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d5e31709-cbc4-4095-ac5f-c42bce46fc52",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6045758298044.ai",
-    "file_size": 36671,
-    "path": "d5e31709-cbc4-4095-ac5f-c42bce46fc52",
-    "created": 1615271296719,
-    "modified": 1615271296901
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "387dcf91-3571-4c25-b136-77a96f3f2e47",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6047267398044.ai",
-    "file_size": 37260,
-    "path": "387dcf91-3571-4c25-b136-77a96f3f2e47",
-    "created": 1615271541758,
-    "modified": 1615271541783
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "94a5bff6-4a67-49d3-b43b-bd006a921b9c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6047468598044.ai",
-    "file_size": 38143,
-    "path": "94a5bff6-4a67-49d3-b43b-bd006a921b9c",
-    "created": 1615271575124,
-    "modified": 1615271575147
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7a0a7ce0-62fb-42de-94ee-fcf2494e3e15",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6047569298044.ai",
-    "file_size": 37073,
-    "path": "7a0a7ce0-62fb-42de-94ee-fcf2494e3e15",
-    "created": 1615271591935,
-    "modified": 1615271591957
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "36b94688-25fa-4c0f-83b7-9eb4260cbedb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6049203698044.ai",
-    "file_size": 35988,
-    "path": "36b94688-25fa-4c0f-83b7-9eb4260cbedb",
-    "created": 1615271864454,
-    "modified": 1615271864467
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a517559a-0095-4fec-9846-5f8bd8a38921",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5623871482.ai",
-    "file_size": 79242,
-    "path": "a517559a-0095-4fec-9846-5f8bd8a38921",
-    "created": 1615781191234,
-    "modified": 1615781191309
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8d802b25-81e1-4551-a136-7c20b27e301f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5671878482.ai",
-    "file_size": 78759,
-    "path": "8d802b25-81e1-4551-a136-7c20b27e301f",
-    "created": 1615781984994,
-    "modified": 1615781985025
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8e0cc105-f4d1-4985-93cd-a1cd29b85c8e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5706782482.ai",
-    "file_size": 96161,
-    "path": "8e0cc105-f4d1-4985-93cd-a1cd29b85c8e",
-    "created": 1615782566743,
-    "modified": 1615782566771
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9ffa7b78-c2c6-4513-9980-de5e3408adb0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5908598482.ai",
-    "file_size": 36022,
-    "path": "9ffa7b78-c2c6-4513-9980-de5e3408adb0",
-    "created": 1615785930408,
-    "modified": 1615785930433
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2388bd46-fe92-4afb-8230-761386cc4f54",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5911184482.ai",
-    "file_size": 35928,
-    "path": "2388bd46-fe92-4afb-8230-761386cc4f54",
-    "created": 1615785973511,
-    "modified": 1615785973533
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ff9b9c5e-ea77-4caf-af24-01ef8603ad55",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5916560482.ai",
-    "file_size": 37294,
-    "path": "ff9b9c5e-ea77-4caf-af24-01ef8603ad55",
-    "created": 1615786063142,
-    "modified": 1615786063177
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "129f5200-e93b-4fe7-998d-711466721796",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5919772482.ai",
-    "file_size": 37303,
-    "path": "129f5200-e93b-4fe7-998d-711466721796",
-    "created": 1615786116650,
-    "modified": 1615786116676
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d1552519-5957-402d-afe6-53da72689558",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5924085482.ai",
-    "file_size": 37654,
-    "path": "d1552519-5957-402d-afe6-53da72689558",
-    "created": 1615786188559,
-    "modified": 1615786188581
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7a40c511-438f-4366-bd80-20b56bb6e09a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5935537482.ai",
-    "file_size": 37720,
-    "path": "7a40c511-438f-4366-bd80-20b56bb6e09a",
-    "created": 1615786379445,
-    "modified": 1615786379470
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3652af17-d688-4e5e-ac58-0ff9e13b3174",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5936761482.ai",
-    "file_size": 37397,
-    "path": "3652af17-d688-4e5e-ac58-0ff9e13b3174",
-    "created": 1615786399847,
-    "modified": 1615786399870
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1a7548d1-c243-4e6c-983a-a4711def3cb8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5937993482.ai",
-    "file_size": 37366,
-    "path": "1a7548d1-c243-4e6c-983a-a4711def3cb8",
-    "created": 1615786420382,
-    "modified": 1615786420405
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "64ff2247-a143-4153-9a37-bc55b44a6427",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5940806482.ai",
-    "file_size": 36000,
-    "path": "64ff2247-a143-4153-9a37-bc55b44a6427",
-    "created": 1615786467254,
-    "modified": 1615786467277
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2a497802-1411-4929-ac43-0b2bb9f93248",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5943679482.ai",
-    "file_size": 35623,
-    "path": "2a497802-1411-4929-ac43-0b2bb9f93248",
-    "created": 1615786515146,
-    "modified": 1615786515168
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ef7cac0c-97d1-4cbb-aad3-41a2620230c6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5965532482.ai",
-    "file_size": 36317,
-    "path": "ef7cac0c-97d1-4cbb-aad3-41a2620230c6",
-    "created": 1615786879444,
-    "modified": 1615786879478
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "32fbc59d-8223-438f-ad81-06417d645a30",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp7325051482.ai",
-    "file_size": 68652,
-    "path": "32fbc59d-8223-438f-ad81-06417d645a30",
-    "created": 1615809538389,
-    "modified": 1615809538417
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f821b8f9-3246-441a-acfd-df1e578c489f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp9366540482.ai",
-    "file_size": 78779,
-    "path": "f821b8f9-3246-441a-acfd-df1e578c489f",
-    "created": 1615843563753,
-    "modified": 1615843563791
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ade0ea1b-a287-4ebf-9c1b-5842e3dd9a94",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp9804760482.ai",
-    "file_size": 104672,
-    "path": "ade0ea1b-a287-4ebf-9c1b-5842e3dd9a94",
-    "created": 1615850867358,
-    "modified": 1615850867386
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6075fd64-09b1-464d-a756-ffdc43677c10",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp9903071482.ai",
-    "file_size": 96123,
-    "path": "6075fd64-09b1-464d-a756-ffdc43677c10",
-    "created": 1615852505998,
-    "modified": 1615852506024
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d1f45ae1-5379-4f3a-b706-c3786dece6ea",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp9908086482.ai",
-    "file_size": 96134,
-    "path": "d1f45ae1-5379-4f3a-b706-c3786dece6ea",
-    "created": 1615852589550,
-    "modified": 1615852589574
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8502b0e2-3621-42de-9917-bf9a561d38ae",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp10091748482.ai",
-    "file_size": 78779,
-    "path": "8502b0e2-3621-42de-9917-bf9a561d38ae",
-    "created": 1615855650645,
-    "modified": 1615855650671
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "39d7da68-8868-4bab-ba50-089e9fb8c46f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp10132970482.ai",
-    "file_size": 106552,
-    "path": "39d7da68-8868-4bab-ba50-089e9fb8c46f",
-    "created": 1615856337652,
-    "modified": 1615856337677
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4d19fc16-c6aa-41ae-b479-a92a47cb822d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp11559750482.ai",
-    "file_size": 39637,
-    "path": "4d19fc16-c6aa-41ae-b479-a92a47cb822d",
-    "created": 1615880117714,
-    "modified": 1615880117756
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "67a924c0-9854-4070-8fd9-3f19f96b0d73",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp12417451482.ai",
-    "file_size": 35845,
-    "path": "67a924c0-9854-4070-8fd9-3f19f96b0d73",
-    "created": 1615894412903,
-    "modified": 1615894412935
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "880f46a0-d71a-4964-a695-a609ae42e415",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp12475077482.ai",
-    "file_size": 94582,
-    "path": "880f46a0-d71a-4964-a695-a609ae42e415",
-    "created": 1615895373686,
-    "modified": 1615895373717
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9b838d85-f6e2-471b-84d8-54fad85678c2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1420662344831.ai",
-    "file_size": 35396,
-    "path": "9b838d85-f6e2-471b-84d8-54fad85678c2",
-    "created": 1615924237161,
-    "modified": 1615924237308
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "533c2b45-027e-4c0b-802c-3c0a5070855f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1447014344831.ai",
-    "file_size": 37330,
-    "path": "533c2b45-027e-4c0b-802c-3c0a5070855f",
-    "created": 1615928625368,
-    "modified": 1615928625395
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1313c7b0-3230-4b70-b23e-321ff05857b4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1488598444831.ai",
-    "file_size": 35429,
-    "path": "1313c7b0-3230-4b70-b23e-321ff05857b4",
-    "created": 1615935556159,
-    "modified": 1615935556185
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2ed8defb-c75f-4db7-a7c3-d22ca2ba2077",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1779638994953.ai",
-    "file_size": 77824,
-    "path": "2ed8defb-c75f-4db7-a7c3-d22ca2ba2077",
-    "created": 1616105440700,
-    "modified": 1616105440781
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "bf1ad4a7-c9f5-4369-a295-a5b2c2722ecc",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3002820270463.ai",
-    "file_size": 109906,
-    "path": "bf1ad4a7-c9f5-4369-a295-a5b2c2722ecc",
-    "created": 1616389682326,
-    "modified": 1616389682400
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "9c8ed8ab-689a-4241-956a-97929727be7f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3008819870463.ai",
-    "file_size": 112024,
-    "path": "9c8ed8ab-689a-4241-956a-97929727be7f",
-    "created": 1616390681754,
-    "modified": 1616390681784
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "304705f0-b4cb-45f8-8fe9-a701f1c76e8d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6323816457.ai",
-    "file_size": 60346,
-    "path": "304705f0-b4cb-45f8-8fe9-a701f1c76e8d",
-    "created": 1618107506449,
-    "modified": 1618107506530
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "0617642a-9bff-4437-ad76-7d1f6744f124",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6329048457.ai",
-    "file_size": 43566,
-    "path": "0617642a-9bff-4437-ad76-7d1f6744f124",
-    "created": 1618107587517,
-    "modified": 1618107587545
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f8abdd3c-710f-4d2e-adf6-f6185d526fcd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6332563457.ai",
-    "file_size": 60326,
-    "path": "f8abdd3c-710f-4d2e-adf6-f6185d526fcd",
-    "created": 1618107646109,
-    "modified": 1618107646129
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d0ca6ed4-478c-46e3-9853-b9a425c4cfd5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6336214457.ai",
-    "file_size": 60402,
-    "path": "d0ca6ed4-478c-46e3-9853-b9a425c4cfd5",
-    "created": 1618107706961,
-    "modified": 1618107706985
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "490d81fe-e424-43ef-960e-a39528636f61",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp6345925457.ai",
-    "file_size": 105635,
-    "path": "490d81fe-e424-43ef-960e-a39528636f61",
-    "created": 1618107868842,
-    "modified": 1618107868863
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e59621f2-bb0e-46a3-a539-fc0d7818aa1b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2127536943683.ai",
-    "file_size": 882884,
-    "path": "e59621f2-bb0e-46a3-a539-fc0d7818aa1b",
-    "created": 1618631083346,
-    "modified": 1618631083461
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a2ec6de7-53d1-4bf5-99d6-52362530a134",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2160524943683.ai",
-    "file_size": 881110,
-    "path": "a2ec6de7-53d1-4bf5-99d6-52362530a134",
-    "created": 1618636580806,
-    "modified": 1618636580850
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "593c508f-1760-41a9-b119-1f6ed3ab2113",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2184652043683.ai",
-    "file_size": 887079,
-    "path": "593c508f-1760-41a9-b119-1f6ed3ab2113",
-    "created": 1618640602058,
-    "modified": 1618640602118
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "519aab42-1951-4c72-b8fc-6e016aaf635f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2200497743683.ai",
-    "file_size": 37279,
-    "path": "519aab42-1951-4c72-b8fc-6e016aaf635f",
-    "created": 1618643243005,
-    "modified": 1618643243054
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f28f3a77-e5a9-41f5-a729-f164dc1b07bd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2201047543683.ai",
-    "file_size": 37348,
-    "path": "f28f3a77-e5a9-41f5-a729-f164dc1b07bd",
-    "created": 1618643334618,
-    "modified": 1618643334666
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "67d04c91-9ed9-47ed-ae43-184dc55450a5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2201133343683.ai",
-    "file_size": 36075,
-    "path": "67d04c91-9ed9-47ed-ae43-184dc55450a5",
-    "created": 1618643348924,
-    "modified": 1618643348975
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c17db602-310f-4184-b2f8-a48d43d177ab",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2201193843683.ai",
-    "file_size": 38241,
-    "path": "c17db602-310f-4184-b2f8-a48d43d177ab",
-    "created": 1618643359002,
-    "modified": 1618643359053
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3f9211ba-f4b8-4c3d-a1a0-52f852b8a36c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2846776243683.ai",
-    "file_size": 887142,
-    "path": "3f9211ba-f4b8-4c3d-a1a0-52f852b8a36c",
-    "created": 1618751671629,
-    "modified": 1618751671707
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a7f4b2ba-95b7-4fc5-82a7-e1d800c99a6d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2874820943683.ai",
-    "file_size": 880713,
-    "path": "a7f4b2ba-95b7-4fc5-82a7-e1d800c99a6d",
-    "created": 1618756345846,
-    "modified": 1618756345902
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a1a5333b-7761-45db-83b8-90b9217f270e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3036525443683.ai",
-    "file_size": 881600,
-    "path": "a1a5333b-7761-45db-83b8-90b9217f270e",
-    "created": 1618783296979,
-    "modified": 1618783297038
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "b924a547-0636-4327-ab45-d2ddd5581e54",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3047180643683.ai",
-    "file_size": 35773,
-    "path": "b924a547-0636-4327-ab45-d2ddd5581e54",
-    "created": 1618785072769,
-    "modified": 1618785072780
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "fbb634a9-ff16-4f10-b5c4-12aa2a16295b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3340025676340.ai",
-    "file_size": 879680,
-    "path": "fbb634a9-ff16-4f10-b5c4-12aa2a16295b",
-    "created": 1618836080535,
-    "modified": 1618836080607
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e9b40aa9-dcc4-4e6d-b996-7cd302641b8d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp384920436.ai",
-    "file_size": 42061,
-    "path": "e9b40aa9-dcc4-4e6d-b996-7cd302641b8d",
-    "created": 1619392412295,
-    "modified": 1619392412362
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "5fd35309-0684-4a86-ad33-8ab381702702",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp384920436.ai",
-    "file_size": 42061,
-    "path": "5fd35309-0684-4a86-ad33-8ab381702702",
-    "created": 1619392412295,
-    "modified": 1619392412362
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "253dee8e-94a1-4ee5-bda5-4b17f9e13afe",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1444822536749.ai",
-    "file_size": 884480,
-    "path": "253dee8e-94a1-4ee5-bda5-4b17f9e13afe",
-    "created": 1620348590467,
-    "modified": 1620348590550
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "d9d0e0d6-9eff-4206-85cc-abd91d461d39",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1444967936749.ai",
-    "file_size": 884417,
-    "path": "d9d0e0d6-9eff-4206-85cc-abd91d461d39",
-    "created": 1620348610085,
-    "modified": 1620348610119
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "1fb06246-a013-4371-8334-80a04c9d26bb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1455649453569.ai",
-    "file_size": 884341,
-    "path": "1fb06246-a013-4371-8334-80a04c9d26bb",
-    "created": 1620350390373,
-    "modified": 1620350390441
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f5f0590b-d78e-44cc-9958-d40583630d31",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1455769853569.ai",
-    "file_size": 884270,
-    "path": "f5f0590b-d78e-44cc-9958-d40583630d31",
-    "created": 1620350410224,
-    "modified": 1620350410260
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c15701cb-d357-47ba-a74a-a0bc8e2db7da",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1746434456471.ai",
-    "file_size": 44705,
-    "path": "c15701cb-d357-47ba-a74a-a0bc8e2db7da",
-    "created": 1620796982726,
-    "modified": 1620796982793
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "de58055f-d6f8-470c-84af-25199a611290",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp3820921298.ai",
-    "file_size": 378045,
-    "path": "de58055f-d6f8-470c-84af-25199a611290",
-    "created": 1621301354232,
-    "modified": 1621301354338
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "c5f2873f-6774-474e-b34b-7f87970639a0",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp261577210687.ai",
-    "file_size": 40292,
-    "path": "c5f2873f-6774-474e-b34b-7f87970639a0",
-    "created": 1621385875896,
-    "modified": 1621385875951
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f29103ad-c58b-4890-b7aa-0d61c48d3669",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp261712610687.ai",
-    "file_size": 40534,
-    "path": "f29103ad-c58b-4890-b7aa-0d61c48d3669",
-    "created": 1621385893880,
-    "modified": 1621385893912
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "aa180381-d8c4-4270-a848-bcd8702ba84c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp265840710687.ai",
-    "file_size": 35984,
-    "path": "aa180381-d8c4-4270-a848-bcd8702ba84c",
-    "created": 1621386581878,
-    "modified": 1621386581906
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6a551ef7-d4df-4db4-858e-8c052e93bcde",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp265879510687.ai",
-    "file_size": 40122,
-    "path": "6a551ef7-d4df-4db4-858e-8c052e93bcde",
-    "created": 1621386588323,
-    "modified": 1621386588347
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "eef6c5f2-4073-41b0-92bf-a48bb22832aa",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp282922610687.ai",
-    "file_size": 42507,
-    "path": "eef6c5f2-4073-41b0-92bf-a48bb22832aa",
-    "created": 1621389428725,
-    "modified": 1621389428738
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "86871d75-cd0f-4210-bb14-1ab0a3fc6f70",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp303396210687.ai",
-    "file_size": 911559,
-    "path": "86871d75-cd0f-4210-bb14-1ab0a3fc6f70",
-    "created": 1621392841385,
-    "modified": 1621392841427
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3807748f-a38b-4325-a59a-fc8245113fe2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp303518710687.ai",
-    "file_size": 911562,
-    "path": "3807748f-a38b-4325-a59a-fc8245113fe2",
-    "created": 1621392861786,
-    "modified": 1621392861831
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f205a51d-4bbd-489e-b743-9d10c3cf9a8f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp303553310687.ai",
-    "file_size": 912111,
-    "path": "f205a51d-4bbd-489e-b743-9d10c3cf9a8f",
-    "created": 1621392867541,
-    "modified": 1621392867580
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "eaa0c836-b249-49bd-a562-f7e6250aaf63",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp303599410687.ai",
-    "file_size": 920985,
-    "path": "eaa0c836-b249-49bd-a562-f7e6250aaf63",
-    "created": 1621392875218,
-    "modified": 1621392875243
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "10e6a00b-e87d-4888-b1e7-140ea47c9b8a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp350534110687.ai",
-    "file_size": 913767,
-    "path": "10e6a00b-e87d-4888-b1e7-140ea47c9b8a",
-    "created": 1621401896110,
-    "modified": 1621401896161
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "a5dd0a8d-f952-412d-9c1b-c5022cceb3eb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp360845010687.ai",
-    "file_size": 888849,
-    "path": "a5dd0a8d-f952-412d-9c1b-c5022cceb3eb",
-    "created": 1621403614581,
-    "modified": 1621403614624
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "e855e42a-8484-4c91-879f-af3ddc55e3c8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp362221910687.ai",
-    "file_size": 888834,
-    "path": "e855e42a-8484-4c91-879f-af3ddc55e3c8",
-    "created": 1621403844044,
-    "modified": 1621403844089
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "44f3691d-b714-4d6e-9d88-cc53a7161595",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp375312110687.ai",
-    "file_size": 880702,
-    "path": "44f3691d-b714-4d6e-9d88-cc53a7161595",
-    "created": 1621406025892,
-    "modified": 1621406025951
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "986f0594-1c39-426e-9a58-b1ab6c967ee9",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp375622410687.ai",
-    "file_size": 882965,
-    "path": "986f0594-1c39-426e-9a58-b1ab6c967ee9",
-    "created": 1621406077731,
-    "modified": 1621406077782
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "2a82f44e-b8a3-417f-bfb0-81749d5463f5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2896551593438.ai",
-    "file_size": 2140702,
-    "path": "2a82f44e-b8a3-417f-bfb0-81749d5463f5",
-    "created": 1622614653640,
-    "modified": 1622614653713
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "cfa11ac2-49dc-43ff-8ce4-85893767e54b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2896703493438.ai",
-    "file_size": 2140663,
-    "path": "cfa11ac2-49dc-43ff-8ce4-85893767e54b",
-    "created": 1622614674257,
-    "modified": 1622614674309
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "8c404d25-acb8-4e92-97e8-6c58d6094316",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2896551593438.ai",
-    "file_size": 2140702,
-    "path": "8c404d25-acb8-4e92-97e8-6c58d6094316",
-    "created": 1622614653640,
-    "modified": 1622614653713
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "67406a57-9807-4ed7-b581-806bb55345b1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2896703493438.ai",
-    "file_size": 2140663,
-    "path": "67406a57-9807-4ed7-b581-806bb55345b1",
-    "created": 1622614674257,
-    "modified": 1622614674309
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "4423ee1f-8d3b-41df-8ff2-7d9623ff4e2c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2896551593438.ai",
-    "file_size": 2140702,
-    "path": "4423ee1f-8d3b-41df-8ff2-7d9623ff4e2c",
-    "created": 1622614653640,
-    "modified": 1622614653713
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "f16bed9f-e0e5-4ac8-bd8f-b0bc65075b28",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2896703493438.ai",
-    "file_size": 2140663,
-    "path": "f16bed9f-e0e5-4ac8-bd8f-b0bc65075b28",
-    "created": 1622614674257,
-    "modified": 1622614674309
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "ee618f57-c821-49a1-9499-784c7622d426",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1761601115402.ai",
-    "file_size": 884041,
-    "path": "ee618f57-c821-49a1-9499-784c7622d426",
-    "created": 1624931558523,
-    "modified": 1624931558626
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "3a5567c4-00d3-4f63-8519-68117ca82c03",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp5460110510.ai",
-    "file_size": 44350,
-    "path": "3a5567c4-00d3-4f63-8519-68117ca82c03",
-    "created": 1626267966119,
-    "modified": 1626267966210
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "6206a183-f27b-49c8-ad01-ba994283fd7f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp550216527175.ai",
-    "file_size": 886496,
-    "path": "6206a183-f27b-49c8-ad01-ba994283fd7f",
-    "created": 1626268661842,
-    "modified": 1626268661933
-  },
-  {
-    "library_id": "db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "29510cf2-fb2d-495c-93d9-58bf5fcb630c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp555766427175.ai",
-    "file_size": 36132,
-    "path": "29510cf2-fb2d-495c-93d9-58bf5fcb630c",
-    "created": 1626269586475,
-    "modified": 1626269586509
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "d84b85b5-d5ba-4d66-af03-1603fdbeb515",
-    "element_name": "Garden swimming pool",
-    "element_type": "application/vnd.adobe.element.colortheme+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "d84b85b5-d5ba-4d66-af03-1603fdbeb515",
-    "created": 1446069639165,
-    "modified": 1446069800294
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "c2f5e082-74ba-47b7-9ef2-7e42aea5ecc1",
-    "element_name": "My Color Theme",
-    "element_type": "application/vnd.adobe.element.colortheme+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "c2f5e082-74ba-47b7-9ef2-7e42aea5ecc1",
-    "created": 1446069651808,
-    "modified": 1446069651808
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "c99222e3-baf2-46fa-b909-1078146e71a8",
-    "element_name": "Fluro scheme",
-    "element_type": "application/vnd.adobe.element.colortheme+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "c99222e3-baf2-46fa-b909-1078146e71a8",
-    "created": 1465700681635,
-    "modified": 1465700681635
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "47cc2978-4298-4912-be7e-042b0a2b5a01",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1215035396.ai",
-    "file_size": 2069727,
-    "path": "47cc2978-4298-4912-be7e-042b0a2b5a01",
-    "created": 1479700493696,
-    "modified": 1479700493773
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "248fcbdd-1a94-41ac-9742-34d79b4e21b4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1216641396.ai",
-    "file_size": 891074,
-    "path": "248fcbdd-1a94-41ac-9742-34d79b4e21b4",
-    "created": 1479700520357,
-    "modified": 1479700520408
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "7210ec10-bbe2-414e-a352-5d83a3bb7c8c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1220005396.ai",
-    "file_size": 1601285,
-    "path": "7210ec10-bbe2-414e-a352-5d83a3bb7c8c",
-    "created": 1479700576502,
-    "modified": 1479700576544
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "a58a56ab-d49d-4f6b-a470-dda73b7875c8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1220984396.ai",
-    "file_size": 2215692,
-    "path": "a58a56ab-d49d-4f6b-a470-dda73b7875c8",
-    "created": 1479700592818,
-    "modified": 1479700592877
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "c8da24e0-b961-43dd-8a76-a5cd90a60a04",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1357100396.ai",
-    "file_size": 880004,
-    "path": "c8da24e0-b961-43dd-8a76-a5cd90a60a04",
-    "created": 1479702861253,
-    "modified": 1479702861297
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "dad5bf1e-7205-4368-b9a6-cd6bda31b75b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1659463396.ai",
-    "file_size": 1473197,
-    "path": "dad5bf1e-7205-4368-b9a6-cd6bda31b75b",
-    "created": 1479707900664,
-    "modified": 1479707900727
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "7929a139-7576-4709-ab83-243148bf170c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp77217893449.ai",
-    "file_size": 904608,
-    "path": "7929a139-7576-4709-ab83-243148bf170c",
-    "created": 1480651324972,
-    "modified": 1480651325081
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "28dc7547-9969-41d2-b962-25ae82328f09",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp77224183449.ai",
-    "file_size": 3201414,
-    "path": "28dc7547-9969-41d2-b962-25ae82328f09",
-    "created": 1480651335565,
-    "modified": 1480651335608
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "e608bd0b-744f-481a-9b6f-37ea80920bfa",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp77464153449.ai",
-    "file_size": 2160351,
-    "path": "e608bd0b-744f-481a-9b6f-37ea80920bfa",
-    "created": 1480651735298,
-    "modified": 1480651735336
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "19402acc-807b-4402-9eeb-851268928288",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp77583423449.ai",
-    "file_size": 36412,
-    "path": "19402acc-807b-4402-9eeb-851268928288",
-    "created": 1480651933966,
-    "modified": 1480651933997
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "2330d10e-914b-4a03-acff-fec3ee76a20b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp77619653449.ai",
-    "file_size": 883030,
-    "path": "2330d10e-914b-4a03-acff-fec3ee76a20b",
-    "created": 1480651994464,
-    "modified": 1480651994491
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "06cf5eef-2a59-472d-b7e3-32a50402d672",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp77902173449.ai",
-    "file_size": 905721,
-    "path": "06cf5eef-2a59-472d-b7e3-32a50402d672",
-    "created": 1480652465270,
-    "modified": 1480652465308
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "d895d8f8-7577-41ee-9f7d-e7dccd45b329",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp77906283449.ai",
-    "file_size": 3190612,
-    "path": "d895d8f8-7577-41ee-9f7d-e7dccd45b329",
-    "created": 1480652472400,
-    "modified": 1480652472456
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "ecc2e077-01eb-4a0d-b7b9-bdc576da9209",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp77910803449.ai",
-    "file_size": 879393,
-    "path": "ecc2e077-01eb-4a0d-b7b9-bdc576da9209",
-    "created": 1480652479654,
-    "modified": 1480652479686
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "a5efb67a-aaec-49b1-a305-a39d95b4224a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1057797403.ai",
-    "file_size": 1088631,
-    "path": "a5efb67a-aaec-49b1-a305-a39d95b4224a",
-    "created": 1481509952584,
-    "modified": 1481509952639
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "b68f46f2-98c8-4d13-b391-8c2a501de487",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp102396714588.ai",
-    "file_size": 891389,
-    "path": "b68f46f2-98c8-4d13-b391-8c2a501de487",
-    "created": 1482450120670,
-    "modified": 1482450120748
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "f3ebaef5-f53d-41c1-9ae8-4bd8765ff8d5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp103228194588.ai",
-    "file_size": 897189,
-    "path": "f3ebaef5-f53d-41c1-9ae8-4bd8765ff8d5",
-    "created": 1482451505736,
-    "modified": 1482451505779
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "d3002da3-35d0-4c7d-bd45-b0db9e4ef1cd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp186903159932.ai",
-    "file_size": 884922,
-    "path": "d3002da3-35d0-4c7d-bd45-b0db9e4ef1cd",
-    "created": 1483507067705,
-    "modified": 1483507067754
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "fb90a50c-206a-4e0f-bf36-91707ff0b0b7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp208323429932.ai",
-    "file_size": 6471192,
-    "path": "fb90a50c-206a-4e0f-bf36-91707ff0b0b7",
-    "created": 1483665201511,
-    "modified": 1483665201583
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "ed015159-a331-496b-bbfc-2264acd281f6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp98176785.ai",
-    "file_size": 282960,
-    "path": "ed015159-a331-496b-bbfc-2264acd281f6",
-    "created": 1487557672975,
-    "modified": 1487557673019
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "98871ed3-5d20-4468-a1fa-560dcdd11811",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp891864785.ai",
-    "file_size": 882450,
-    "path": "98871ed3-5d20-4468-a1fa-560dcdd11811",
-    "created": 1487570900562,
-    "modified": 1487570900607
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "05481075-eea8-4101-b753-45785d2aae1f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp894904785.ai",
-    "file_size": 886394,
-    "path": "05481075-eea8-4101-b753-45785d2aae1f",
-    "created": 1487570951227,
-    "modified": 1487570951261
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "bd51dab7-2d75-40b0-9e1f-331f6de5b539",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp895780785.ai",
-    "file_size": 891321,
-    "path": "bd51dab7-2d75-40b0-9e1f-331f6de5b539",
-    "created": 1487570965837,
-    "modified": 1487570965864
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "fce3ddd6-5b46-4df5-8787-d76fce9388fe",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp902167785.ai",
-    "file_size": 882450,
-    "path": "fce3ddd6-5b46-4df5-8787-d76fce9388fe",
-    "created": 1487571072263,
-    "modified": 1487571072288
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "ff306ae2-00c2-4219-84d6-7f34369a15b4",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp529310613998.ai",
-    "file_size": 888946,
-    "path": "ff306ae2-00c2-4219-84d6-7f34369a15b4",
-    "created": 1487651097218,
-    "modified": 1487651097289
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "bd349504-b388-4b30-9404-4d0b2d3b9aea",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp530005513998.ai",
-    "file_size": 883240,
-    "path": "bd349504-b388-4b30-9404-4d0b2d3b9aea",
-    "created": 1487651212979,
-    "modified": 1487651213033
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "c3f05076-da55-4d5b-8152-0d6e70dee599",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp530477413998.ai",
-    "file_size": 879507,
-    "path": "c3f05076-da55-4d5b-8152-0d6e70dee599",
-    "created": 1487651291626,
-    "modified": 1487651291665
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "fea0abea-d29c-4567-90ff-f570fe666eb8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp530915913998.ai",
-    "file_size": 882221,
-    "path": "fea0abea-d29c-4567-90ff-f570fe666eb8",
-    "created": 1487651364727,
-    "modified": 1487651364773
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "9754f8c0-f28e-482c-a4c6-08548d0fbf68",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp531120413998.ai",
-    "file_size": 888947,
-    "path": "9754f8c0-f28e-482c-a4c6-08548d0fbf68",
-    "created": 1487651398804,
-    "modified": 1487651398850
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "45d77f8b-27fe-42b8-9fc2-6c7e7bf0efc8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp531457213998.ai",
-    "file_size": 879507,
-    "path": "45d77f8b-27fe-42b8-9fc2-6c7e7bf0efc8",
-    "created": 1487651454899,
-    "modified": 1487651454931
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "16f5887c-9a70-4563-90e6-b46369a029b3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp532393013998.ai",
-    "file_size": 883261,
-    "path": "16f5887c-9a70-4563-90e6-b46369a029b3",
-    "created": 1487651610937,
-    "modified": 1487651611009
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "3e68ea4c-2752-450a-a68a-e1b5eb182616",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp591773013998.ai",
-    "file_size": 898206,
-    "path": "3e68ea4c-2752-450a-a68a-e1b5eb182616",
-    "created": 1487662787150,
-    "modified": 1487662787212
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "05fb6362-3ae1-483b-a38d-dc8fabfaa3d7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp603941213998.ai",
-    "file_size": 896424,
-    "path": "05fb6362-3ae1-483b-a38d-dc8fabfaa3d7",
-    "created": 1487664815126,
-    "modified": 1487664815215
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "527392c7-5323-40f0-bfb4-478d3e16b8db",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp604315113998.ai",
-    "file_size": 892062,
-    "path": "527392c7-5323-40f0-bfb4-478d3e16b8db",
-    "created": 1487664877380,
-    "modified": 1487664877417
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "d1582ed1-4365-40a1-9ab7-e7bd260052f1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp893569813998.ai",
-    "file_size": 891274,
-    "path": "d1582ed1-4365-40a1-9ab7-e7bd260052f1",
-    "created": 1487719977506,
-    "modified": 1487719977548
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "e2c683e6-7ba3-4a3f-b78e-35defec62746",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp895939313998.ai",
-    "file_size": 896075,
-    "path": "e2c683e6-7ba3-4a3f-b78e-35defec62746",
-    "created": 1487720373035,
-    "modified": 1487720373077
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "4b0c8988-0760-4f2a-abd9-f6b2447c4a00",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1361282838775.ai",
-    "file_size": 884059,
-    "path": "4b0c8988-0760-4f2a-abd9-f6b2447c4a00",
-    "created": 1487912683679,
-    "modified": 1487912683728
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "39e5b12c-1e2a-4f5c-8201-89d57c3f227a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1684232748970.ai",
-    "file_size": 895646,
-    "path": "39e5b12c-1e2a-4f5c-8201-89d57c3f227a",
-    "created": 1487980325716,
-    "modified": 1487980325910
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "2b35b4d9-40fe-43a8-87f7-0e882ab19d71",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1684682648970.ai",
-    "file_size": 885273,
-    "path": "2b35b4d9-40fe-43a8-87f7-0e882ab19d71",
-    "created": 1487980400487,
-    "modified": 1487980400536
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "6d4c68c9-ca50-4516-ad65-a4922388a29f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1684789048970.ai",
-    "file_size": 893488,
-    "path": "6d4c68c9-ca50-4516-ad65-a4922388a29f",
-    "created": 1487980418263,
-    "modified": 1487980418332
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "0962cace-d068-4db4-a60c-89d6cb704508",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1684940748970.ai",
-    "file_size": 883919,
-    "path": "0962cace-d068-4db4-a60c-89d6cb704508",
-    "created": 1487980443605,
-    "modified": 1487980443665
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "d4719d18-6f7d-44da-9608-c93c0ee72602",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1685436048970.ai",
-    "file_size": 893982,
-    "path": "d4719d18-6f7d-44da-9608-c93c0ee72602",
-    "created": 1487980526041,
-    "modified": 1487980526088
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "911b3254-786d-4e92-8a7e-39b109e63cf5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1685686248970.ai",
-    "file_size": 883120,
-    "path": "911b3254-786d-4e92-8a7e-39b109e63cf5",
-    "created": 1487980567726,
-    "modified": 1487980567793
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "20b9ffbb-815c-4bcc-9d06-3f3bffa09dfe",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1687688548970.ai",
-    "file_size": 892340,
-    "path": "20b9ffbb-815c-4bcc-9d06-3f3bffa09dfe",
-    "created": 1487980901444,
-    "modified": 1487980901504
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "255b51ba-7311-491e-9b4c-5378c93d9cab",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1688147848970.ai",
-    "file_size": 891590,
-    "path": "255b51ba-7311-491e-9b4c-5378c93d9cab",
-    "created": 1487980977969,
-    "modified": 1487980978016
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "e961a2b6-97a6-41df-8e16-ceb3c2267cbb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1688795548970.ai",
-    "file_size": 883724,
-    "path": "e961a2b6-97a6-41df-8e16-ceb3c2267cbb",
-    "created": 1487981085936,
-    "modified": 1487981086020
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "1f663bde-53d0-404e-aeb2-e9928f506d8e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1690716948970.ai",
-    "file_size": 895237,
-    "path": "1f663bde-53d0-404e-aeb2-e9928f506d8e",
-    "created": 1487981406159,
-    "modified": 1487981406211
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "d1197868-3e1e-4fa7-bcf3-6dff39aac4f8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1691212748970.ai",
-    "file_size": 893985,
-    "path": "d1197868-3e1e-4fa7-bcf3-6dff39aac4f8",
-    "created": 1487981488783,
-    "modified": 1487981488827
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "7791e13d-f5d9-4864-98d6-3525a1ac413e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1692118948970.ai",
-    "file_size": 41072,
-    "path": "7791e13d-f5d9-4864-98d6-3525a1ac413e",
-    "created": 1487981639730,
-    "modified": 1487981639764
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "550ba964-88b8-4d9c-bdf5-7122e036a8d2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1692289248970.ai",
-    "file_size": 897886,
-    "path": "550ba964-88b8-4d9c-bdf5-7122e036a8d2",
-    "created": 1487981668159,
-    "modified": 1487981668194
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "27093fc6-6ddf-454b-85c7-0db398ad5d24",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1692430148970.ai",
-    "file_size": 891685,
-    "path": "27093fc6-6ddf-454b-85c7-0db398ad5d24",
-    "created": 1487981691629,
-    "modified": 1487981691663
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "3b31f97b-2111-4b83-9913-3f8e0732a881",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1692565748970.ai",
-    "file_size": 897687,
-    "path": "3b31f97b-2111-4b83-9913-3f8e0732a881",
-    "created": 1487981714236,
-    "modified": 1487981714266
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "23a2e6b5-4e4d-452d-8f74-ef6125012ee2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1693051648970.ai",
-    "file_size": 892053,
-    "path": "23a2e6b5-4e4d-452d-8f74-ef6125012ee2",
-    "created": 1487981795211,
-    "modified": 1487981795246
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "8b0df648-778d-4cae-a229-dcc456449e38",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1693300048970.ai",
-    "file_size": 891684,
-    "path": "8b0df648-778d-4cae-a229-dcc456449e38",
-    "created": 1487981836594,
-    "modified": 1487981836633
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "c3525be3-7737-42e8-9d53-a16f9dda1918",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1693423948970.ai",
-    "file_size": 895602,
-    "path": "c3525be3-7737-42e8-9d53-a16f9dda1918",
-    "created": 1487981857261,
-    "modified": 1487981857301
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "78b1ae00-4b30-4ca5-a5ab-c8bf6bfb2268",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1694252748970.ai",
-    "file_size": 894771,
-    "path": "78b1ae00-4b30-4ca5-a5ab-c8bf6bfb2268",
-    "created": 1487981995395,
-    "modified": 1487981995439
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "766af891-fe30-46cf-8ccf-a6474bca5c46",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2840917166156.ai",
-    "file_size": 40917,
-    "path": "766af891-fe30-46cf-8ccf-a6474bca5c46",
-    "created": 1488240672827,
-    "modified": 1488240672862
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "2891b322-204e-4151-a52e-755177785221",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2849884666156.ai",
-    "file_size": 5587500,
-    "path": "2891b322-204e-4151-a52e-755177785221",
-    "created": 1488242176326,
-    "modified": 1488242176369
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "5ca822e8-f3a2-40b1-bdf4-07d5cbba8132",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2866117766156.ai",
-    "file_size": 40257,
-    "path": "5ca822e8-f3a2-40b1-bdf4-07d5cbba8132",
-    "created": 1488244872723,
-    "modified": 1488244872761
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "a3a3a87b-39cd-4092-9743-04cf14066107",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2867971266156.ai",
-    "file_size": 40840,
-    "path": "a3a3a87b-39cd-4092-9743-04cf14066107",
-    "created": 1488245181626,
-    "modified": 1488245181661
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "5be203ae-5813-486c-8073-1c1910d614d7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2868393566156.ai",
-    "file_size": 40863,
-    "path": "5be203ae-5813-486c-8073-1c1910d614d7",
-    "created": 1488245252021,
-    "modified": 1488245252053
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "adbf76f6-517d-4269-995f-dec1703fb2e8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp25331491462.ai",
-    "file_size": 889882,
-    "path": "adbf76f6-517d-4269-995f-dec1703fb2e8",
-    "created": 1489715824802,
-    "modified": 1489715824880
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "0949c03e-4d56-4c72-b6d4-c7b0adf80dd1",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp569212933192.ai",
-    "file_size": 890865,
-    "path": "0949c03e-4d56-4c72-b6d4-c7b0adf80dd1",
-    "created": 1490068222747,
-    "modified": 1490068222799
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "d1f99ac8-29c6-4a8a-b019-feff7b44ff64",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp569394833192.ai",
-    "file_size": 903406,
-    "path": "d1f99ac8-29c6-4a8a-b019-feff7b44ff64",
-    "created": 1490068253121,
-    "modified": 1490068253157
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "03efce05-9753-4fe8-b8cb-4ada41d73d08",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp569531533192.ai",
-    "file_size": 3180617,
-    "path": "03efce05-9753-4fe8-b8cb-4ada41d73d08",
-    "created": 1490068276048,
-    "modified": 1490068276097
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "9910b9a4-e688-494c-abfb-306ec89b4afe",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp583542033192.ai",
-    "file_size": 892138,
-    "path": "9910b9a4-e688-494c-abfb-306ec89b4afe",
-    "created": 1490070610789,
-    "modified": 1490070610827
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "fc54bc47-c5af-430e-afd6-19da2b8c09ec",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp893951433192.ai",
-    "file_size": 922060,
-    "path": "fc54bc47-c5af-430e-afd6-19da2b8c09ec",
-    "created": 1490225488511,
-    "modified": 1490225488582
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "e0162695-d912-4e7b-a3ed-9c12fbbae336",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp894035733192.ai",
-    "file_size": 922060,
-    "path": "e0162695-d912-4e7b-a3ed-9c12fbbae336",
-    "created": 1490225502536,
-    "modified": 1490225502582
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "d2079a9a-cc51-4da5-a3a7-151a2eef182c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp934507233192.ai",
-    "file_size": 45420,
-    "path": "d2079a9a-cc51-4da5-a3a7-151a2eef182c",
-    "created": 1490232247193,
-    "modified": 1490232247223
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "dd0eaaf5-8bda-4d17-a090-1991d3eace71",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp935771733192.ai",
-    "file_size": 35502,
-    "path": "dd0eaaf5-8bda-4d17-a090-1991d3eace71",
-    "created": 1490232458224,
-    "modified": 1490232458261
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "3e1d422a-4235-49f1-a0dc-17534f16808c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp272901803050.ai",
-    "file_size": 891899,
-    "path": "3e1d422a-4235-49f1-a0dc-17534f16808c",
-    "created": 1490674711243,
-    "modified": 1490674711402
-  },
-  {
-    "library_id": "606ca72e-8e3e-4f2d-beb3-6305ef654adc",
-    "library_name": "my colours",
-    "library_type": "private",
-    "element_id": "2f5ef844-4dd7-4574-b00c-5133289c63c8",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp272915223050.ai",
-    "file_size": 890344,
-    "path": "2f5ef844-4dd7-4574-b00c-5133289c63c8",
-    "created": 1490674733482,
-    "modified": 1490674733529
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "7599bac1-8297-47c0-9841-91ad3974f862",
-    "element_name": "9424",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9424_18232f81-c635-4d07-b367-8790684636a5.ai",
-    "file_size": 1266721,
-    "path": "7599bac1-8297-47c0-9841-91ad3974f862",
-    "created": 1747005496974,
-    "modified": 1748313595681
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "aef60c94-c2ce-40c6-863c-5e4853e9252e",
-    "element_name": "9425",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9425_4db9afeb-37d0-42f1-a153-0f0cd7cb3a95.ai",
-    "file_size": 1243842,
-    "path": "aef60c94-c2ce-40c6-863c-5e4853e9252e",
-    "created": 1747005496974,
-    "modified": 1748305738791
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "ff703304-c684-467b-b2e6-022b0fb9611a",
-    "element_name": "9431",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9431_b3731139-6547-43f1-b934-3bd94b2f2d7c.ai",
-    "file_size": 1196338,
-    "path": "ff703304-c684-467b-b2e6-022b0fb9611a",
-    "created": 1747005496974,
-    "modified": 1748924561977
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "c151474d-a9b9-46da-a08c-e29ae3a0272d",
-    "element_name": "9432",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9432_cd7e1043-a008-49f7-9b9d-6230626ef8f1.ai",
-    "file_size": 1223867,
-    "path": "c151474d-a9b9-46da-a08c-e29ae3a0272d",
-    "created": 1747005496974,
-    "modified": 1748574397295
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "41e6c48b-667a-4789-b96b-334b3d0d693c",
-    "element_name": "9434",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9434_4ce1131b-9490-409f-916b-1656d033cebe.ai",
-    "file_size": 1219803,
-    "path": "41e6c48b-667a-4789-b96b-334b3d0d693c",
-    "created": 1747005496974,
-    "modified": 1748318902882
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "b08c097d-fe1f-47a7-b947-fc8610e73a0b",
-    "element_name": "9435",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9435_7acef958-46c6-4b81-96b6-167e9bf58a92.ai",
-    "file_size": 1218599,
-    "path": "b08c097d-fe1f-47a7-b947-fc8610e73a0b",
-    "created": 1747005496974,
-    "modified": 1748305763100
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "fb3e4894-bbe7-41bd-9463-5e948ec5b1e4",
-    "element_name": "9436",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9436_d1892dc0-ad12-4aa9-bfaf-5164b719c843.ai",
-    "file_size": 1210535,
-    "path": "fb3e4894-bbe7-41bd-9463-5e948ec5b1e4",
-    "created": 1747005496974,
-    "modified": 1748301562320
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "3ab84bc4-9b72-4724-9e27-e8a4b745ec79",
-    "element_name": "9437",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9437_a73507bf-e6a7-46cd-97ab-61b565c5b46c.ai",
-    "file_size": 1198164,
-    "path": "3ab84bc4-9b72-4724-9e27-e8a4b745ec79",
-    "created": 1747005496974,
-    "modified": 1748301765066
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "b4ffbead-85ed-472d-8356-0c7c106c0294",
-    "element_name": "9483",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9483_fb6c5b4e-ff72-4210-bd67-1406264f20c3.ai",
-    "file_size": 1223019,
-    "path": "b4ffbead-85ed-472d-8356-0c7c106c0294",
-    "created": 1747005496974,
-    "modified": 1747701564948
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "bee9fd53-c0d6-461d-b598-91efe65146a2",
-    "element_name": "9423",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9423_dbf8469f-7381-42ee-bf51-5ec7c170d50c.ai",
-    "file_size": 1233998,
-    "path": "bee9fd53-c0d6-461d-b598-91efe65146a2",
-    "created": 1747005496974,
-    "modified": 1748566799924
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "7740a785-94e8-4862-9a1c-1cf4d541f0dc",
-    "element_name": "9442",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9442_5a75b63f-5cb5-4d7d-a497-6fa4de4995d9.ai",
-    "file_size": 1215463,
-    "path": "7740a785-94e8-4862-9a1c-1cf4d541f0dc",
-    "created": 1747005496974,
-    "modified": 1749007829641
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "83f3bb22-8572-41bf-96af-ded36e01d49e",
-    "element_name": "9462",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9462_aca0876f-2a04-46af-8103-d88e8886fe93.ai",
-    "file_size": 1211959,
-    "path": "83f3bb22-8572-41bf-96af-ded36e01d49e",
-    "created": 1747005496974,
-    "modified": 1748493775388
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "dbc4a632-45a0-4afd-ab1b-3ccb514d47aa",
-    "element_name": "9440",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9440_1cab8943-768f-4fcd-ae5a-41e3a1303fcf.ai",
-    "file_size": 1251939,
-    "path": "dbc4a632-45a0-4afd-ab1b-3ccb514d47aa",
-    "created": 1747005496974,
-    "modified": 1748499444293
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "c85ac98c-3851-4d82-89bd-4d1b294843d4",
-    "element_name": "9443",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9443_d00e24ed-8943-4e3c-8f85-a08573966ecb.ai",
-    "file_size": 1204416,
-    "path": "c85ac98c-3851-4d82-89bd-4d1b294843d4",
-    "created": 1747005496974,
-    "modified": 1747627683034
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "8d2d0f8b-e192-49fd-828b-d24230c7991e",
-    "element_name": "9441",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9441_9cdc7b2c-88cd-498c-ba83-f90abc917b26.ai",
-    "file_size": 1213293,
-    "path": "8d2d0f8b-e192-49fd-828b-d24230c7991e",
-    "created": 1747005496974,
-    "modified": 1748498792298
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "6ab06290-5fd3-4f61-bd04-b4fffd586b0e",
-    "element_name": "9439",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9439_4f949eed-2f37-4eae-a7bb-a1748aa1aac0.ai",
-    "file_size": 1275343,
-    "path": "6ab06290-5fd3-4f61-bd04-b4fffd586b0e",
-    "created": 1747005496974,
-    "modified": 1748499371039
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "9bb625a7-8cfc-46a3-a4e5-120caeb08934",
-    "element_name": "9438",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9438_252975f6-21b7-4652-b686-b59d74a40f2f.ai",
-    "file_size": 1251318,
-    "path": "9bb625a7-8cfc-46a3-a4e5-120caeb08934",
-    "created": 1747005496974,
-    "modified": 1749002781249
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "c51a5a88-e213-45bb-a3c4-8e30c813fa2e",
-    "element_name": "9469",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9469_40cfed3c-b1eb-4c75-a0b1-b09c0d675c24.ai",
-    "file_size": 1237238,
-    "path": "c51a5a88-e213-45bb-a3c4-8e30c813fa2e",
-    "created": 1747005496974,
-    "modified": 1749002784933
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "6f7c166f-0fa8-4de6-a2ba-f6c6d8a7cc12",
-    "element_name": "9468",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9468_efb2721d-7185-4d83-b192-c5926309e023.ai",
-    "file_size": 1202042,
-    "path": "6f7c166f-0fa8-4de6-a2ba-f6c6d8a7cc12",
-    "created": 1747005496974,
-    "modified": 1748493832657
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "0ad65d38-99f8-457d-9f47-68a8438de0d8",
-    "element_name": "9467",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9467_a6cd7fb7-b928-4d3a-9bee-9c2ca79dae05.ai",
-    "file_size": 1259478,
-    "path": "0ad65d38-99f8-457d-9f47-68a8438de0d8",
-    "created": 1747005496974,
-    "modified": 1748483830682
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "8421afc0-9d61-4bc9-afb9-b0253061ee72",
-    "element_name": "9489",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9489_5d49cd58-1a56-476c-981f-f8d53d8a4164.ai",
-    "file_size": 1221159,
-    "path": "8421afc0-9d61-4bc9-afb9-b0253061ee72",
-    "created": 1747005496974,
-    "modified": 1748589297160
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "89af27ca-b59d-4902-86ae-3936bb296585",
-    "element_name": "9466",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9466_5d95920c-68db-436f-bea2-d8a1540f2744.ai",
-    "file_size": 1200428,
-    "path": "89af27ca-b59d-4902-86ae-3936bb296585",
-    "created": 1747005496974,
-    "modified": 1748493884699
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "7f5a8523-c9ac-4285-81ea-11701bd7ccc7",
-    "element_name": "9464",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9464_be353b28-05e0-4715-a738-b002e7ac39a2.ai",
-    "file_size": 1205945,
-    "path": "7f5a8523-c9ac-4285-81ea-11701bd7ccc7",
-    "created": 1747005496974,
-    "modified": 1748811360296
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "37dd918b-1978-4b46-96cc-b318786b4775",
-    "element_name": "9510",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9510_4f2aab49-7d40-4a39-9253-bb92ec63b2d8.ai",
-    "file_size": 1228753,
-    "path": "37dd918b-1978-4b46-96cc-b318786b4775",
-    "created": 1747005496974,
-    "modified": 1747627947352
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "efdcced6-2f37-4ed9-a501-964190026aed",
-    "element_name": "9444",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9444_e9b3a9b6-a317-4410-b654-8ef24a58c27a.ai",
-    "file_size": 1222339,
-    "path": "efdcced6-2f37-4ed9-a501-964190026aed",
-    "created": 1747005496974,
-    "modified": 1748831113810
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "c529945d-3039-4267-899a-88b05d34c84b",
-    "element_name": "9518",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9518_d40fb61a-84b8-4cad-82d5-c1178c1563c8.ai",
-    "file_size": 1264220,
-    "path": "c529945d-3039-4267-899a-88b05d34c84b",
-    "created": 1747005496974,
-    "modified": 1748474480590
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "b94b09f5-dc8d-42c7-8b1d-cc7dc3ae828d",
-    "element_name": "9351",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9351_33055de3-8ef9-4b8d-93f6-049fb89c5b43.ai",
-    "file_size": 1208000,
-    "path": "b94b09f5-dc8d-42c7-8b1d-cc7dc3ae828d",
-    "created": 1747005496974,
-    "modified": 1748809003526
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "93ad458c-0a7d-4cd5-a6e8-3b43969d6778",
-    "element_name": "9389",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9389_c28a3d77-89f8-4412-82ef-b8d0d5f0a24d.ai",
-    "file_size": 1251286,
-    "path": "93ad458c-0a7d-4cd5-a6e8-3b43969d6778",
-    "created": 1747005496974,
-    "modified": 1747893247929
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "7b83990c-d55c-4228-8c6e-2a21759ff9ee",
-    "element_name": "9399",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9399_2ef56fe7-96ac-43bf-b323-64a599f64657.ai",
-    "file_size": 1206638,
-    "path": "7b83990c-d55c-4228-8c6e-2a21759ff9ee",
-    "created": 1747005496974,
-    "modified": 1747698456713
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "46a12b82-081f-4deb-abb0-f60085d81cbe",
-    "element_name": "9461",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9461_db83c94c-3e9a-49af-99b3-bc6bf36d0a64.ai",
-    "file_size": 1220778,
-    "path": "46a12b82-081f-4deb-abb0-f60085d81cbe",
-    "created": 1747005496974,
-    "modified": 1747898380006
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "641e27e9-b6c8-4baa-8f01-2a26f4e42c00",
-    "element_name": "9470",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9470_4bac7eb1-8243-44da-a17a-2eb10945d275.ai",
-    "file_size": 1218898,
-    "path": "641e27e9-b6c8-4baa-8f01-2a26f4e42c00",
-    "created": 1747005496974,
-    "modified": 1747699666483
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "0683bcc2-f2bb-4e0f-912a-dd305d4dc587",
-    "element_name": "9473",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9473_d8d5f605-44f1-47d4-8218-b22c8a0ea8b7.ai",
-    "file_size": 1228717,
-    "path": "0683bcc2-f2bb-4e0f-912a-dd305d4dc587",
-    "created": 1747005496974,
-    "modified": 1747699649026
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "9655d48d-9169-40a0-a43e-719b2adc0ab1",
-    "element_name": "9474",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9474_62fbc344-21d5-49d1-a72e-a02f77904020.ai",
-    "file_size": 1223104,
-    "path": "9655d48d-9169-40a0-a43e-719b2adc0ab1",
-    "created": 1747005496974,
-    "modified": 1747699928893
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "8b133a31-b64a-4553-89db-9d465b203a39",
-    "element_name": "9475",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9475_6f739428-1552-4773-a73f-8809a36ea284.ai",
-    "file_size": 1221902,
-    "path": "8b133a31-b64a-4553-89db-9d465b203a39",
-    "created": 1747005496974,
-    "modified": 1747805669614
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "9bfc0d3e-9da6-4a22-a4be-41facd6b699a",
-    "element_name": "9476",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9476_c03a26f6-5602-4fdd-aca7-653e9f41f0b8.ai",
-    "file_size": 1212819,
-    "path": "9bfc0d3e-9da6-4a22-a4be-41facd6b699a",
-    "created": 1747005496974,
-    "modified": 1747806033392
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "bcfc1038-869d-4715-aa23-d4971e8f9525",
-    "element_name": "9477",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9477_f231fd6f-2345-4f67-ae78-d695bc6f850e.ai",
-    "file_size": 1216307,
-    "path": "bcfc1038-869d-4715-aa23-d4971e8f9525",
-    "created": 1747005496974,
-    "modified": 1747805688195
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "17bc001e-c26a-4bf7-83ad-30e3f584dd04",
-    "element_name": "9478",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9478_eb7f2b6a-8d90-42b9-af9e-2e4cc822aa14.ai",
-    "file_size": 1209560,
-    "path": "17bc001e-c26a-4bf7-83ad-30e3f584dd04",
-    "created": 1747005496974,
-    "modified": 1747807105663
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "128004cd-4dd5-4086-a456-24b8619281ae",
-    "element_name": "9479",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9479_9c4a842f-09be-490b-a6c2-efc74b0641d3.ai",
-    "file_size": 1227467,
-    "path": "128004cd-4dd5-4086-a456-24b8619281ae",
-    "created": 1747005496974,
-    "modified": 1747700498214
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "0f86cdd3-b3f5-4832-baed-e1b25ee1fd0a",
-    "element_name": "9480",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9480_b5dfaea8-aafe-4a4a-8c0a-bbc517dfb4d1.ai",
-    "file_size": 1221942,
-    "path": "0f86cdd3-b3f5-4832-baed-e1b25ee1fd0a",
-    "created": 1747005496974,
-    "modified": 1747700538295
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "bdc7a37e-227c-49ba-b060-70dfbf6670fe",
-    "element_name": "9484",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9484_ac7e2d05-eac8-4644-b0fd-89dfb7b4a6fd.ai",
-    "file_size": 1223022,
-    "path": "bdc7a37e-227c-49ba-b060-70dfbf6670fe",
-    "created": 1747005496974,
-    "modified": 1747701593111
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "32772ff3-b2ce-4c3a-9981-76cf509fc424",
-    "element_name": "9485",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9485_185a26be-595a-4c05-be58-21cf3eddaee0.ai",
-    "file_size": 1223002,
-    "path": "32772ff3-b2ce-4c3a-9981-76cf509fc424",
-    "created": 1747005496974,
-    "modified": 1747701619653
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "5b5c6562-402a-4f6e-87cc-45dda183768b",
-    "element_name": "9486",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9486_ab1fb04e-2915-442f-9f5d-73bcd75c6643.ai",
-    "file_size": 1223491,
-    "path": "5b5c6562-402a-4f6e-87cc-45dda183768b",
-    "created": 1747005496974,
-    "modified": 1747701642963
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "f94efa16-dba9-4e06-b38e-464a257281a2",
-    "element_name": "9488",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9488_d241b4cb-860c-440c-a0a9-aa71abca3b6c.ai",
-    "file_size": 1220043,
-    "path": "f94efa16-dba9-4e06-b38e-464a257281a2",
-    "created": 1747005496974,
-    "modified": 1747701756584
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "0ee401f1-7745-46ee-8b1b-df454c42f42b",
-    "element_name": "9496",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9496_d6e48c8e-5c2e-4a5d-9421-f0de216630ab.ai",
-    "file_size": 1221861,
-    "path": "0ee401f1-7745-46ee-8b1b-df454c42f42b",
-    "created": 1747005496974,
-    "modified": 1747701943404
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "06041986-02fd-4a4b-aaeb-c26237833e5d",
-    "element_name": "9482",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9482_a2402550-c23e-43a9-87d3-edc1d8c7e42d.ai",
-    "file_size": 1223069,
-    "path": "06041986-02fd-4a4b-aaeb-c26237833e5d",
-    "created": 1747005496974,
-    "modified": 1747701533668
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "f2ffc4f6-2ff2-45b0-9944-3c856c852a8d",
-    "element_name": "9498",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9498_a85ce5f6-37d1-41f6-8a4b-34a4681b492f.ai",
-    "file_size": 1209693,
-    "path": "f2ffc4f6-2ff2-45b0-9944-3c856c852a8d",
-    "created": 1747005496974,
-    "modified": 1747807719138
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "6d9a4faa-f2a1-4bec-8da5-054ddf93f6a4",
-    "element_name": "9491",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9491_03d5206d-0cab-4afe-b571-700c43282e27.ai",
-    "file_size": 1219887,
-    "path": "6d9a4faa-f2a1-4bec-8da5-054ddf93f6a4",
-    "created": 1747005496974,
-    "modified": 1747701801279
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "026b591a-2390-48f5-990b-981c31a60d73",
-    "element_name": "9493",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9493_2531fe6a-17b8-434c-a7d5-86faf29c98e1.ai",
-    "file_size": 1227282,
-    "path": "026b591a-2390-48f5-990b-981c31a60d73",
-    "created": 1747005496974,
-    "modified": 1747701860200
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "46421ff7-ffb5-4b1c-b374-34c5c615841d",
-    "element_name": "9494",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9494_088ab849-80e3-421b-a696-29d6a7791567.ai",
-    "file_size": 1225859,
-    "path": "46421ff7-ffb5-4b1c-b374-34c5c615841d",
-    "created": 1747005496974,
-    "modified": 1747812182168
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "30c2b4dd-2845-4bf4-ae2b-83954a717b2d",
-    "element_name": "9495",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9495_291d7d6b-5fa2-4e99-9d92-4dd8b8914e55.ai",
-    "file_size": 1221389,
-    "path": "30c2b4dd-2845-4bf4-ae2b-83954a717b2d",
-    "created": 1747005496974,
-    "modified": 1747701911992
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "da7523f5-448f-4587-bb42-5892edf24af5",
-    "element_name": "9487",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9487_2b611933-316f-4869-9800-20afeae32266.ai",
-    "file_size": 1219849,
-    "path": "da7523f5-448f-4587-bb42-5892edf24af5",
-    "created": 1747005496974,
-    "modified": 1747701699568
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "5b416251-c812-4ed7-8fd6-5bacd659c398",
-    "element_name": "9497",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9497_690d0436-94aa-4331-9560-3b89bcf2cdfd.ai",
-    "file_size": 1212233,
-    "path": "5b416251-c812-4ed7-8fd6-5bacd659c398",
-    "created": 1747005496974,
-    "modified": 1747807661663
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "cc9e2a34-67a1-4059-bf86-f03e13429088",
-    "element_name": "9490",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9490_4d3f1f0b-d0c2-42cf-8582-90974e1af47a.ai",
-    "file_size": 1219822,
-    "path": "cc9e2a34-67a1-4059-bf86-f03e13429088",
-    "created": 1747005496974,
-    "modified": 1747701780302
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "5f2d86c3-cf3e-475c-a77d-7b1b9e523bda",
-    "element_name": "9515 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9515CUT_78669197-a428-49bd-a409-603101cf99c5.ai",
-    "file_size": 1246961,
-    "path": "5f2d86c3-cf3e-475c-a77d-7b1b9e523bda",
-    "created": 1747005496974,
-    "modified": 1749447628757
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "ff6eb9dd-c4c7-4404-9ad7-8736597bc1d0",
-    "element_name": "9465",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9465_ac92b61a-9180-4e5e-93f5-ca24afc131f5.ai",
-    "file_size": 1198998,
-    "path": "ff6eb9dd-c4c7-4404-9ad7-8736597bc1d0",
-    "created": 1747005496974,
-    "modified": 1749007834262
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "f8a79be2-61c6-4d46-8593-615506bd8b56",
-    "element_name": "9445 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9445CUT_88679a42-5c43-4af3-96c5-0e5e275e2d02.ai",
-    "file_size": 1195928,
-    "path": "f8a79be2-61c6-4d46-8593-615506bd8b56",
-    "created": 1747005496974,
-    "modified": 1748223206138
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "112020c8-7541-47fc-b28f-6fd259910e18",
-    "element_name": "9581",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9581_3f79a32e-251a-4cf0-943a-1c731cc8ff7b.ai",
-    "file_size": 1196234,
-    "path": "112020c8-7541-47fc-b28f-6fd259910e18",
-    "created": 1747005496974,
-    "modified": 1748799555460
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "6fcc7b39-6da6-4987-af1e-4b86049e87f6",
-    "element_name": "9585",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9585_c708c70b-5387-4524-8c4c-687d347964bb.ai",
-    "file_size": 1201959,
-    "path": "6fcc7b39-6da6-4987-af1e-4b86049e87f6",
-    "created": 1747005496974,
-    "modified": 1748303867215
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "49c987a2-ec8a-4d37-a8c2-d8b921da8202",
-    "element_name": "9587",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9587_5a5182db-f1a8-4c48-b81d-0bc31dd4c437.ai",
-    "file_size": 1211414,
-    "path": "49c987a2-ec8a-4d37-a8c2-d8b921da8202",
-    "created": 1747005496974,
-    "modified": 1748808940275
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "35864708-474c-42b2-b224-8c26a4544749",
-    "element_name": "9600",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9600_dde682e9-c677-4b38-9a82-4b24d5bdddb6.ai",
-    "file_size": 1201533,
-    "path": "35864708-474c-42b2-b224-8c26a4544749",
-    "created": 1747005496974,
-    "modified": 1748808962887
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "57e8a9bf-6326-4f5f-ba9f-98247bd196da",
-    "element_name": "9501",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9501_6169e751-b132-4989-adce-17ed53bfe70c.ai",
-    "file_size": 1229739,
-    "path": "57e8a9bf-6326-4f5f-ba9f-98247bd196da",
-    "created": 1747005496974,
-    "modified": 1747887886164
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "29c2ac43-7b9a-42c4-b478-8b9e18c8230c",
-    "element_name": "9576",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9576_3651313a-338b-4404-a498-b76a35ca35ec.ai",
-    "file_size": 1189391,
-    "path": "29c2ac43-7b9a-42c4-b478-8b9e18c8230c",
-    "created": 1747005496974,
-    "modified": 1747887929767
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "39c21881-88e5-4d08-a8b4-8c5668eb2d0a",
-    "element_name": "9410",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9410_167da325-b3ad-4554-9460-7ed7ca4b6ca4.ai",
-    "file_size": 1244485,
-    "path": "39c21881-88e5-4d08-a8b4-8c5668eb2d0a",
-    "created": 1747005496974,
-    "modified": 1750212145600
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "1da38114-3857-4558-99db-5b91cba78211",
-    "element_name": "9593",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9593_4b31325e-d502-4b41-a30c-1a57dcddab3b.ai",
-    "file_size": 1204499,
-    "path": "1da38114-3857-4558-99db-5b91cba78211",
-    "created": 1747005496974,
-    "modified": 1747895980306
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "eb7e36bf-9074-4f5a-8a20-6757f5201d2f",
-    "element_name": "9594",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9594_38d666bb-59da-4618-a301-85681a93c403.ai",
-    "file_size": 1205183,
-    "path": "eb7e36bf-9074-4f5a-8a20-6757f5201d2f",
-    "created": 1747005496974,
-    "modified": 1747895728565
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "751eddcb-c8da-4f94-80fe-4480ba02baaa",
-    "element_name": "9577 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9577CUT_372e6f00-5e85-4d52-beb7-1abae126e3ae.ai",
-    "file_size": 1201452,
-    "path": "751eddcb-c8da-4f94-80fe-4480ba02baaa",
-    "created": 1747005496974,
-    "modified": 1749524433344
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "9ebdb4f4-be97-450f-8c99-1c6512e5f240",
-    "element_name": "9580 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9580CUT_396a93b9-6a6c-4c8b-8cbf-218343165e2b.ai",
-    "file_size": 1198123,
-    "path": "9ebdb4f4-be97-450f-8c99-1c6512e5f240",
-    "created": 1747005496974,
-    "modified": 1749524446891
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "61e99ae9-01d5-4e89-a2b0-325a9fdb059c",
-    "element_name": "9520",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9520_264c916d-a119-437d-9288-fb2ce3be2e2e.ai",
-    "file_size": 1222493,
-    "path": "61e99ae9-01d5-4e89-a2b0-325a9fdb059c",
-    "created": 1747005496974,
-    "modified": 1748474512835
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "5ef57e21-dc30-49e3-a420-20fd12db4f28",
-    "element_name": "9590",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9590_449c5370-e402-4440-b579-3c8bb979bd98.ai",
-    "file_size": 1195032,
-    "path": "5ef57e21-dc30-49e3-a420-20fd12db4f28",
-    "created": 1747005496974,
-    "modified": 1748832675370
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "7ba840f4-0d3a-486c-9482-e10e8eed0d20",
-    "element_name": "9601",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9601_80c16701-5a48-4c16-9207-1707f8b72f2d.ai",
-    "file_size": 1192558,
-    "path": "7ba840f4-0d3a-486c-9482-e10e8eed0d20",
-    "created": 1747005496974,
-    "modified": 1748832475361
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "fe5384e0-ece3-4578-ba5f-1f9362a00795",
-    "element_name": "9463",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9463_896944b4-6812-401d-9a1a-c0e9037e8cb8.ai",
-    "file_size": 1199570,
-    "path": "fe5384e0-ece3-4578-ba5f-1f9362a00795",
-    "created": 1747005496974,
-    "modified": 1748811201401
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "a5951186-e63e-48cb-98b2-c9d6948a9996",
-    "element_name": "9513",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9513_ffa26340-44e8-403a-8f12-cb7420a5b588.ai",
-    "file_size": 1208021,
-    "path": "a5951186-e63e-48cb-98b2-c9d6948a9996",
-    "created": 1747005496974,
-    "modified": 1748302951375
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "712c800a-237d-478e-ba8a-185cd60d8eac",
-    "element_name": "9583",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9583_68c9453f-b8bf-4e5e-a3f2-03d541d086c6.ai",
-    "file_size": 1193818,
-    "path": "712c800a-237d-478e-ba8a-185cd60d8eac",
-    "created": 1747005496974,
-    "modified": 1748303645933
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "6c6603a6-2c67-4d58-9870-f7a2659ee9e4",
-    "element_name": "9609",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9609_d8e64345-5fc6-48bf-b005-f8aedaad9e3f.ai",
-    "file_size": 1198214,
-    "path": "6c6603a6-2c67-4d58-9870-f7a2659ee9e4",
-    "created": 1747005496974,
-    "modified": 1748808985147
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "2be767c9-f493-4f6b-ba8c-dcd2e18af948",
-    "element_name": "9647",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9647_4f7b1bbf-b606-4170-b2b2-e3d8e1ac1310.ai",
-    "file_size": 1203056,
-    "path": "2be767c9-f493-4f6b-ba8c-dcd2e18af948",
-    "created": 1747005496974,
-    "modified": 1748490000949
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "d6e6aa5a-c7bc-4f22-93b3-b41077117e90",
-    "element_name": "9508 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9508CUT_e60137fe-c43e-4b98-9b6f-78b9b696e4ec.ai",
-    "file_size": 1215435,
-    "path": "d6e6aa5a-c7bc-4f22-93b3-b41077117e90",
-    "created": 1747005496974,
-    "modified": 1748800865861
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "8a0b1a4d-dea1-4d2c-9cf9-963e89d28307",
-    "element_name": "9499",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9499_36c94a4f-9a65-42b6-a7f2-0e61b52ec76f.ai",
-    "file_size": 1212842,
-    "path": "8a0b1a4d-dea1-4d2c-9cf9-963e89d28307",
-    "created": 1747005496974,
-    "modified": 1747812161306
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "357db7f7-1c60-414e-9afc-88bac17d01a6",
-    "element_name": "9500",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9500_32dd1a85-a5dc-4138-8cee-be4a1aba6cd7.ai",
-    "file_size": 1211342,
-    "path": "357db7f7-1c60-414e-9afc-88bac17d01a6",
-    "created": 1747005496974,
-    "modified": 1747808429169
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "6be3c725-46e2-438b-978d-0bee292ddc3c",
-    "element_name": "9506",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9506_3fe4a6a2-4349-4249-b7df-9d931a754cbf.ai",
-    "file_size": 1208145,
-    "path": "6be3c725-46e2-438b-978d-0bee292ddc3c",
-    "created": 1747005496974,
-    "modified": 1747702367983
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "8d700c48-a232-4eca-9e30-649eef217a6d",
-    "element_name": "9507",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9507_ee175b11-20cf-45c0-89b3-5bbfc4e0240b.ai",
-    "file_size": 1192829,
-    "path": "8d700c48-a232-4eca-9e30-649eef217a6d",
-    "created": 1747005496974,
-    "modified": 1747702435726
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "63d2c4e8-699d-4c94-ac21-ae5eaa11ca0a",
-    "element_name": "9492",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9492_cf760fee-e1b8-495e-9249-a0355035cd8f.ai",
-    "file_size": 1219737,
-    "path": "63d2c4e8-699d-4c94-ac21-ae5eaa11ca0a",
-    "created": 1747005496974,
-    "modified": 1747701826858
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "9ea2a0e3-1cc5-4bce-bd1e-274920f1a332",
-    "element_name": "9809 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9809CUT_26fd75bc-8517-408e-8da9-4591862fa64a.ai",
-    "file_size": 1195818,
-    "path": "9ea2a0e3-1cc5-4bce-bd1e-274920f1a332",
-    "created": 1747005496974,
-    "modified": 1749490081439
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "4a8d781d-ce67-4d00-926d-1644886df9c4",
-    "element_name": "9614",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9614_84d5af8b-7862-463f-bf3f-1a8369746e81.ai",
-    "file_size": 1193629,
-    "path": "4a8d781d-ce67-4d00-926d-1644886df9c4",
-    "created": 1747005496974,
-    "modified": 1748917471710
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "985da233-554d-4b13-a2cb-c0fb5b558c3f",
-    "element_name": "ID Stencils",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork1_f339ec94-33ad-4ac9-98fc-2ff1fafe8080.ai",
-    "file_size": 1215833,
-    "path": "985da233-554d-4b13-a2cb-c0fb5b558c3f",
-    "created": 1747898352726,
-    "modified": 1747898371546
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "36e58606-4b5f-4317-9b04-9193fd0a6124",
-    "element_name": "9582",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9582_adb196c9-4f81-4408-8ac4-e4b650ff4449.ai",
-    "file_size": 1207223,
-    "path": "36e58606-4b5f-4317-9b04-9193fd0a6124",
-    "created": 1747005496974,
-    "modified": 1748798032979
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "35f59a62-5a88-42b4-83c9-7ed97b2c186c",
-    "element_name": "9589",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9589_277fc9ac-9821-4e9a-8ab1-ac1eca56b653.ai",
-    "file_size": 1207123,
-    "path": "35f59a62-5a88-42b4-83c9-7ed97b2c186c",
-    "created": 1747005496974,
-    "modified": 1748832612482
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "c46c3277-8a37-42c6-b9e4-70ff5d39fd32",
-    "element_name": "9511 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9511CUT_30756e05-2dbc-4596-92a1-ae0427f62aaa.ai",
-    "file_size": 1210915,
-    "path": "c46c3277-8a37-42c6-b9e4-70ff5d39fd32",
-    "created": 1747005496974,
-    "modified": 1748802827907
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "6dd0c08b-06f8-4975-9a57-fb8c496c225d",
-    "element_name": "9591 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9591CUT_6bf88a25-c4db-4560-90c4-4f43a0f05b35.ai",
-    "file_size": 1203932,
-    "path": "6dd0c08b-06f8-4975-9a57-fb8c496c225d",
-    "created": 1747005496974,
-    "modified": 1748832483020
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "1364846d-2bbb-4ef7-bc24-9b3861108a5a",
-    "element_name": "9522",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9522_c72d0ff9-0724-46c9-a782-2b608894cd8b.ai",
-    "file_size": 1220562,
-    "path": "1364846d-2bbb-4ef7-bc24-9b3861108a5a",
-    "created": 1747005496974,
-    "modified": 1749003489622
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "5c0c140a-5f10-49a9-b2c7-e215a023ceef",
-    "element_name": "9686 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9686CUT_6b00284c-f2db-49e9-a761-0c9b9981ffbc.ai",
-    "file_size": 1216224,
-    "path": "5c0c140a-5f10-49a9-b2c7-e215a023ceef",
-    "created": 1747005496974,
-    "modified": 1749181302598
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "2a46e54c-5756-40ea-bf49-1d55bf283afc",
-    "element_name": "9521",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9521_42f9adf3-2226-48f3-870c-3f0982171a21.ai",
-    "file_size": 1218090,
-    "path": "2a46e54c-5756-40ea-bf49-1d55bf283afc",
-    "created": 1747005496974,
-    "modified": 1748391978107
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "19e65766-7b00-4264-9e37-e89a84a40a7c",
-    "element_name": "9523",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9523_cfd8e9ce-0817-48b0-8a67-060378f25252.ai",
-    "file_size": 1216534,
-    "path": "19e65766-7b00-4264-9e37-e89a84a40a7c",
-    "created": 1747005496974,
-    "modified": 1748392024899
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "15e1921c-b264-4f77-abc8-8138c4ea778c",
-    "element_name": "9603",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9603_c542668d-1463-4189-9f50-bbbfd0bc5ef4.ai",
-    "file_size": 1201451,
-    "path": "15e1921c-b264-4f77-abc8-8138c4ea778c",
-    "created": 1747005496974,
-    "modified": 1748392950982
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "b66b5160-4c93-4be7-8f66-817734f482c9",
-    "element_name": "9604",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9604_b6b9526e-731f-4a81-be96-aa04b21e9adc.ai",
-    "file_size": 1185275,
-    "path": "b66b5160-4c93-4be7-8f66-817734f482c9",
-    "created": 1747005496974,
-    "modified": 1748392776062
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "aa28f402-b9bf-4f4e-89aa-f1ede5f70e62",
-    "element_name": "9602",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9602_ff93052a-ae94-460f-872f-f6b6df9620ae.ai",
-    "file_size": 1213219,
-    "path": "aa28f402-b9bf-4f4e-89aa-f1ede5f70e62",
-    "created": 1747005496974,
-    "modified": 1748393042092
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "c25e3cf8-fb93-439c-9b97-559faf293a39",
-    "element_name": "9512 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9512CUT_597ee63a-bd64-4495-b1f1-17064bdffb87.ai",
-    "file_size": 347855,
-    "path": "c25e3cf8-fb93-439c-9b97-559faf293a39",
-    "created": 1747005496974,
-    "modified": 1748809737059
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "6c67d6a8-039e-4028-b6f4-d5dfc0cbcb61",
-    "element_name": "9514 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9514CUT_b443a99f-61d5-4216-a80e-a059195ab3b9.ai",
-    "file_size": 348157,
-    "path": "6c67d6a8-039e-4028-b6f4-d5dfc0cbcb61",
-    "created": 1747005496974,
-    "modified": 1748924336296
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "e3871101-7389-419e-a8f4-19b009d08492",
-    "element_name": "9610",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9610_72249039-4430-47c1-a7ed-baf4d1851e77.ai",
-    "file_size": 1194731,
-    "path": "e3871101-7389-419e-a8f4-19b009d08492",
-    "created": 1747005496974,
-    "modified": 1748474783603
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "e36de139-550a-4c43-bdba-79d3acabe299",
-    "element_name": "9611",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9611_d30ded8b-9c30-4048-96c3-6b264ba91eea.ai",
-    "file_size": 1191003,
-    "path": "e36de139-550a-4c43-bdba-79d3acabe299",
-    "created": 1747005496974,
-    "modified": 1748492277705
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "75e9d55c-d15d-41f4-b1a4-be9e4d3255a0",
-    "element_name": "9612",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9612_079720be-e218-454c-8983-89c677d9c95f.ai",
-    "file_size": 1188740,
-    "path": "75e9d55c-d15d-41f4-b1a4-be9e4d3255a0",
-    "created": 1747005496974,
-    "modified": 1748474882777
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "5cbdbe3c-e706-4881-b3ca-5ca2333f3595",
-    "element_name": "Blank Cut",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BlankCut_7a10b531-027e-4bcc-9937-f81f581f2681.ai",
-    "file_size": 793129,
-    "path": "5cbdbe3c-e706-4881-b3ca-5ca2333f3595",
-    "created": 1747005496974,
-    "modified": 1747109445852
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "65f329f0-fc44-40a0-b823-a51d213e8cc3",
-    "element_name": "9740 CUT multi part",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9740CUTmultipart_ad306bf1-8567-42eb-b079-e8770c673b47.ai",
-    "file_size": 1207774,
-    "path": "65f329f0-fc44-40a0-b823-a51d213e8cc3",
-    "created": 1747005496974,
-    "modified": 1748928250031
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "1f229636-dde2-4906-b9a0-8bb46d4b4dde",
-    "element_name": "9689 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9689CUT_b4af2f87-80f1-480f-8da4-b140acf8a5e7.ai",
-    "file_size": 1220116,
-    "path": "1f229636-dde2-4906-b9a0-8bb46d4b4dde",
-    "created": 1747005496974,
-    "modified": 1749181251098
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "834e8608-d449-42be-812c-5c929dfbe7c3",
-    "element_name": "9508 Art",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9432Art_94926df5-1e4c-48f1-b9d6-66ae3318e467.ai",
-    "file_size": 203621055,
-    "path": "834e8608-d449-42be-812c-5c929dfbe7c3",
-    "created": 1748928147993,
-    "modified": 1749449834344
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "4da8259f-0dfc-41e3-b163-588350a1a1f1",
-    "element_name": "9691 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9691CUT_ccb6863f-a5bb-4dfd-968f-df16a3c958b6.ai",
-    "file_size": 1201807,
-    "path": "4da8259f-0dfc-41e3-b163-588350a1a1f1",
-    "created": 1747005496974,
-    "modified": 1749178623136
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "bd8d9c4a-b1ff-4f75-9f62-02858025b98f",
-    "element_name": "9799",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9799_70fd4a4a-a854-4e0d-b3a5-1d8e4fe89119.ai",
-    "file_size": 1210683,
-    "path": "bd8d9c4a-b1ff-4f75-9f62-02858025b98f",
-    "created": 1747005496974,
-    "modified": 1749426180875
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "bbe70a1e-8f51-4afd-9f3c-a686cb8467a2",
-    "element_name": "9687",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BlankCut_7a10b531-027e-4bcc-9937-f81f581f2681.ai",
-    "file_size": 793129,
-    "path": "bbe70a1e-8f51-4afd-9f3c-a686cb8467a2",
-    "created": 1747005496974,
-    "modified": 1747109445852
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "0e9d33a0-460d-4cf4-81b1-64d347f4cf0f",
-    "element_name": "9681",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BlankCut_7a10b531-027e-4bcc-9937-f81f581f2681.ai",
-    "file_size": 793129,
-    "path": "0e9d33a0-460d-4cf4-81b1-64d347f4cf0f",
-    "created": 1747005496974,
-    "modified": 1747109445852
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "2ae2a510-d0b0-4f2a-9525-e21299508409",
-    "element_name": "9821",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BlankCut_7a10b531-027e-4bcc-9937-f81f581f2681.ai",
-    "file_size": 793129,
-    "path": "2ae2a510-d0b0-4f2a-9525-e21299508409",
-    "created": 1747005496974,
-    "modified": 1747109445852
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "f1ec4fa9-5a36-4997-870a-0d7a397c3775",
-    "element_name": "9679",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9679_1cb39cdb-faff-4d75-b7e7-f38f2864840a.ai",
-    "file_size": 1204724,
-    "path": "f1ec4fa9-5a36-4997-870a-0d7a397c3775",
-    "created": 1747005496974,
-    "modified": 1749435368474
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "1768de6a-8591-4c23-a5b8-154d90248186",
-    "element_name": "9814 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9814CUT_15c0adbc-2322-40ea-8f7d-a9b73e5ce76e.ai",
-    "file_size": 1206317,
-    "path": "1768de6a-8591-4c23-a5b8-154d90248186",
-    "created": 1747005496974,
-    "modified": 1749528701217
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "20f33cd1-1bb2-4ec9-a678-c5ae24a40cdd",
-    "element_name": "9807 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9807CUT_139a899d-160d-42e8-a5e2-24b109072051.ai",
-    "file_size": 1207402,
-    "path": "20f33cd1-1bb2-4ec9-a678-c5ae24a40cdd",
-    "created": 1747005496974,
-    "modified": 1749490042799
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "c639dabf-7ddf-4849-b55b-1202d07f0af0",
-    "element_name": "9815 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9815CUT_fde5b348-275f-43c1-a1f5-44384130e9c4.ai",
-    "file_size": 1217447,
-    "path": "c639dabf-7ddf-4849-b55b-1202d07f0af0",
-    "created": 1747005496974,
-    "modified": 1749513244132
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "461b7260-aa58-42fc-950f-16e818af3d44",
-    "element_name": "9819 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9819CUT_9a8184b7-11d7-4943-829f-133ce16d267a.ai",
-    "file_size": 1193065,
-    "path": "461b7260-aa58-42fc-950f-16e818af3d44",
-    "created": 1747005496974,
-    "modified": 1749512559951
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "eb5ca811-efec-40a6-999c-6af32022d690",
-    "element_name": "9815",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BLANKArt_f022cea7-05b6-4da0-85ee-334136529a58.ai",
-    "file_size": 1199331,
-    "path": "eb5ca811-efec-40a6-999c-6af32022d690",
-    "created": 1748928147993,
-    "modified": 1749088370868
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "1490e2ef-54c9-4a26-8462-bbcf6a0f3cbf",
-    "element_name": "BLANK Art",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BLANKArt_f022cea7-05b6-4da0-85ee-334136529a58.ai",
-    "file_size": 1199331,
-    "path": "1490e2ef-54c9-4a26-8462-bbcf6a0f3cbf",
-    "created": 1748928147993,
-    "modified": 1749088370868
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "8560762d-3afc-47a0-95d3-ab5160e52f8e",
-    "element_name": "9689 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BlankCut_48167394-2852-4f1f-901d-c34ad6d23df2.ai",
-    "file_size": 358763,
-    "path": "8560762d-3afc-47a0-95d3-ab5160e52f8e",
-    "created": 1747005496974,
-    "modified": 1748827536864
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "fd002bef-f57e-4bc7-99db-6fb433317d43",
-    "element_name": "9686 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BlankCut_f785632c-4c8a-476a-a89f-49eaa7150130.ai",
-    "file_size": 362735,
-    "path": "fd002bef-f57e-4bc7-99db-6fb433317d43",
-    "created": 1747005496974,
-    "modified": 1748827611964
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "74ad2ce3-a3e0-4cd1-8ece-42f021178472",
-    "element_name": "Blank Cut",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BlankCut_7a10b531-027e-4bcc-9937-f81f581f2681.ai",
-    "file_size": 793129,
-    "path": "74ad2ce3-a3e0-4cd1-8ece-42f021178472",
-    "created": 1747005496974,
-    "modified": 1747109445852
-  },
-  {
-    "library_id": "5face365-482a-4a38-8d02-3238b4694c70",
-    "library_name": "M-142 HIMARS Cut Files",
-    "library_type": "private",
-    "element_id": "f0a2a826-09e7-45f6-92dd-b7f3a5b06039",
-    "element_name": "Blank Cut",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BlankCut_7a10b531-027e-4bcc-9937-f81f581f2681.ai",
-    "file_size": 793129,
-    "path": "f0a2a826-09e7-45f6-92dd-b7f3a5b06039",
-    "created": 1747005496974,
-    "modified": 1747109445852
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "8adfa272-0299-497b-85bf-9d22f27ce82b",
-    "element_name": "Wedding Invitation Set",
-    "element_type": "application/vnd.adobe.element.template+dcx",
-    "file_type": "image/jpeg",
-    "file_name": "5a11d5f8-a4e7-43b7-95e6-1922d5ed5b80.jpeg",
-    "file_size": 23873,
-    "path": "8adfa272-0299-497b-85bf-9d22f27ce82b",
-    "created": 1501018400609,
-    "modified": 1699771499730
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "10ab83c1-9199-4637-b106-832ad4a1a69a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp59748169018.ai",
-    "file_size": 954983,
-    "path": "10ab83c1-9199-4637-b106-832ad4a1a69a",
-    "created": 1502073000450,
-    "modified": 1502073000502
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "ae9789df-a2ba-4e4e-a1cc-7ab7b0c0967d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp750344711578.ai",
-    "file_size": 954738,
-    "path": "ae9789df-a2ba-4e4e-a1cc-7ab7b0c0967d",
-    "created": 1502098477092,
-    "modified": 1502098477137
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "db34ad1e-0f7c-4afd-ab25-d5eb1ed01549",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1513278411.ai",
-    "file_size": 906308,
-    "path": "db34ad1e-0f7c-4afd-ab25-d5eb1ed01549",
-    "created": 1502163354827,
-    "modified": 1502163354965
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "d126e37a-a6de-4168-abc2-7ed6c0db079e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1513612411.ai",
-    "file_size": 900207,
-    "path": "d126e37a-a6de-4168-abc2-7ed6c0db079e",
-    "created": 1502163360069,
-    "modified": 1502163360165
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "a74ace90-0f79-4279-9ad8-8e40056cbef2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1514664411.ai",
-    "file_size": 887610,
-    "path": "a74ace90-0f79-4279-9ad8-8e40056cbef2",
-    "created": 1502163377704,
-    "modified": 1502163377889
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "e10a27f2-c624-40c7-89a3-a551f17a6448",
-    "element_name": "R=0 G=174 B=239",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "e10a27f2-c624-40c7-89a3-a551f17a6448",
-    "created": 1502413306622,
-    "modified": 1502413306624
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "06bbbddf-60ac-4c5a-b576-3b4a22985158",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp15070612051.ai",
-    "file_size": 886332,
-    "path": "06bbbddf-60ac-4c5a-b576-3b4a22985158",
-    "created": 1502423846389,
-    "modified": 1502423846439
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "a8a1d75f-57aa-4500-bed2-6b0bf2ef8ff3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1191862413223.ai",
-    "file_size": 42910,
-    "path": "a8a1d75f-57aa-4500-bed2-6b0bf2ef8ff3",
-    "created": 1502673422078,
-    "modified": 1502673422129
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "86cb6857-6471-41e7-9cb5-7f49324bd6fd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1236984613223.ai",
-    "file_size": 885726,
-    "path": "86cb6857-6471-41e7-9cb5-7f49324bd6fd",
-    "created": 1502680942274,
-    "modified": 1502680942319
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "42094cad-bc2f-4c8d-b60d-9cf300a458ec",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1238174213223.ai",
-    "file_size": 885726,
-    "path": "42094cad-bc2f-4c8d-b60d-9cf300a458ec",
-    "created": 1502681140565,
-    "modified": 1502681140583
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "0015f1b0-a1c1-4b66-ad7f-f745729f88ee",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1240276613643.ai",
-    "file_size": 885728,
-    "path": "0015f1b0-a1c1-4b66-ad7f-f745729f88ee",
-    "created": 1502681490968,
-    "modified": 1502681491017
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "647e627a-a333-481d-a771-12e00d9aff89",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1241171113643.ai",
-    "file_size": 885728,
-    "path": "647e627a-a333-481d-a771-12e00d9aff89",
-    "created": 1502681640004,
-    "modified": 1502681640048
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "4e063a94-89fc-49ee-9621-9d668bca9c6a",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1246370313643.ai",
-    "file_size": 1029920,
-    "path": "4e063a94-89fc-49ee-9621-9d668bca9c6a",
-    "created": 1502682507651,
-    "modified": 1502682507699
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "11929721-bfb6-4e09-85ef-78a7bda6af22",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1672012913643.ai",
-    "file_size": 1006902,
-    "path": "11929721-bfb6-4e09-85ef-78a7bda6af22",
-    "created": 1502753446841,
-    "modified": 1502753446985
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "10213668-23e8-451d-a9c7-7ed76cb13f1e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1672174313643.ai",
-    "file_size": 17419579,
-    "path": "10213668-23e8-451d-a9c7-7ed76cb13f1e",
-    "created": 1502753472846,
-    "modified": 1502753473003
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "01e1a2a6-3691-49cf-acab-342baf069673",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1705532313643.ai",
-    "file_size": 962058,
-    "path": "01e1a2a6-3691-49cf-acab-342baf069673",
-    "created": 1502759032093,
-    "modified": 1502759032142
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "18616827-e952-4e13-9c21-c57e5e5719af",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1708235013643.ai",
-    "file_size": 24592245,
-    "path": "18616827-e952-4e13-9c21-c57e5e5719af",
-    "created": 1502759483208,
-    "modified": 1502759483370
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "5044a77b-3157-4224-8e8c-38408ecba50b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1708466013643.ai",
-    "file_size": 20644646,
-    "path": "5044a77b-3157-4224-8e8c-38408ecba50b",
-    "created": 1502759521480,
-    "modified": 1502759521578
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "2d310362-a785-43e2-9c2c-b636cb912380",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1709853013643.ai",
-    "file_size": 885643,
-    "path": "2d310362-a785-43e2-9c2c-b636cb912380",
-    "created": 1502759752053,
-    "modified": 1502759752097
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "95bc41a1-146c-46d4-92e3-f6736ffc4f89",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1710061213643.ai",
-    "file_size": 885712,
-    "path": "95bc41a1-146c-46d4-92e3-f6736ffc4f89",
-    "created": 1502759786757,
-    "modified": 1502759786796
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "9f99d748-e6ea-4839-b62a-57530cb26b63",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1712161013643.ai",
-    "file_size": 962088,
-    "path": "9f99d748-e6ea-4839-b62a-57530cb26b63",
-    "created": 1502760136782,
-    "modified": 1502760136824
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "c425de6f-ef0f-434f-845e-72268bb3f34c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1712705713643.ai",
-    "file_size": 26474707,
-    "path": "c425de6f-ef0f-434f-845e-72268bb3f34c",
-    "created": 1502760228068,
-    "modified": 1502760228187
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "118f125e-9dfe-44d9-9729-1cb3898b5754",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1712956313643.ai",
-    "file_size": 26159432,
-    "path": "118f125e-9dfe-44d9-9729-1cb3898b5754",
-    "created": 1502760269962,
-    "modified": 1502760270110
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "607e5f8f-72de-465f-b2b3-c8d823230380",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2166514621013.ai",
-    "file_size": 22696095,
-    "path": "607e5f8f-72de-465f-b2b3-c8d823230380",
-    "created": 1503028193666,
-    "modified": 1503028193863
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "714fed36-e5cd-46ce-880b-7122830ccdc7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2166653121013.ai",
-    "file_size": 903482,
-    "path": "714fed36-e5cd-46ce-880b-7122830ccdc7",
-    "created": 1503028213331,
-    "modified": 1503028213447
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "fc7577dc-4f73-4620-aade-8d434973f0ba",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2168804921013.ai",
-    "file_size": 927988,
-    "path": "fc7577dc-4f73-4620-aade-8d434973f0ba",
-    "created": 1503028572845,
-    "modified": 1503028572963
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "83c6faa3-604b-43c0-83ef-2cb9156808d6",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2173739421013.ai",
-    "file_size": 96208,
-    "path": "83c6faa3-604b-43c0-83ef-2cb9156808d6",
-    "created": 1503029393906,
-    "modified": 1503029394014
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "23c84e39-4a20-47de-bc50-b99e5bd31c30",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2173905921013.ai",
-    "file_size": 96208,
-    "path": "23c84e39-4a20-47de-bc50-b99e5bd31c30",
-    "created": 1503029421567,
-    "modified": 1503029421584
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "fe9acdf4-f09a-4a7d-8a92-21880ea06f4f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp2174053721013.ai",
-    "file_size": 43187,
-    "path": "fe9acdf4-f09a-4a7d-8a92-21880ea06f4f",
-    "created": 1503029446098,
-    "modified": 1503029446204
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "3df5c01d-b910-416e-bccc-2a74eccccf95",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1451991165.ai",
-    "file_size": 888986,
-    "path": "3df5c01d-b910-416e-bccc-2a74eccccf95",
-    "created": 1502330596289,
-    "modified": 1502330596325
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "a261ce24-bfb2-4a53-ac17-960ee927462d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1543111165.ai",
-    "file_size": 4361840,
-    "path": "a261ce24-bfb2-4a53-ac17-960ee927462d",
-    "created": 1502330748490,
-    "modified": 1502330748526
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "a195c056-c5ee-4162-9369-398e08552f56",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1615821165.ai",
-    "file_size": 883827,
-    "path": "a195c056-c5ee-4162-9369-398e08552f56",
-    "created": 1502330869434,
-    "modified": 1502330869462
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "b8047075-d08c-4921-90fd-26ef5db5dc24",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp19957381999.ai",
-    "file_size": 887928,
-    "path": "b8047075-d08c-4921-90fd-26ef5db5dc24",
-    "created": 1502408199009,
-    "modified": 1502408199067
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "219f1d75-e66f-4cac-8ed9-581873a36c09",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp131453945418.ai",
-    "file_size": 163671,
-    "path": "219f1d75-e66f-4cac-8ed9-581873a36c09",
-    "created": 1503625056849,
-    "modified": 1503625056888
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "c20c96da-aeee-4ad9-b9c6-e8e483785332",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp208695118793.ai",
-    "file_size": 899624,
-    "path": "c20c96da-aeee-4ad9-b9c6-e8e483785332",
-    "created": 1503961098255,
-    "modified": 1503961098299
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "ff104c9d-9f0a-4152-b7c3-0e6caabe62c3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp208940318793.ai",
-    "file_size": 36460606,
-    "path": "ff104c9d-9f0a-4152-b7c3-0e6caabe62c3",
-    "created": 1503961507595,
-    "modified": 1503961507722
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "544ef260-f138-4e6a-b8fc-cfa256d04618",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp208956708793.ai",
-    "file_size": 900833,
-    "path": "544ef260-f138-4e6a-b8fc-cfa256d04618",
-    "created": 1503961534060,
-    "modified": 1503961534097
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "69d442f0-8907-49db-8b66-3233f9278d81",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp209294618793.ai",
-    "file_size": 36463750,
-    "path": "69d442f0-8907-49db-8b66-3233f9278d81",
-    "created": 1503962098303,
-    "modified": 1503962098421
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "3b4f933d-f110-4748-90c0-2621af2c9907",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp209298798793.ai",
-    "file_size": 959694,
-    "path": "3b4f933d-f110-4748-90c0-2621af2c9907",
-    "created": 1503962104314,
-    "modified": 1503962104340
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "81feec91-6557-42ff-8dd8-856f8aa952eb",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp209311768793.ai",
-    "file_size": 899614,
-    "path": "81feec91-6557-42ff-8dd8-856f8aa952eb",
-    "created": 1503962125917,
-    "modified": 1503962125964
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "3165d363-652d-4026-94de-5322d8af281b",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp209797238793.ai",
-    "file_size": 900833,
-    "path": "3165d363-652d-4026-94de-5322d8af281b",
-    "created": 1503962934847,
-    "modified": 1503962934892
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "fac66d98-b837-42a8-81c9-bb3fdba6780c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp90792973529.ai",
-    "file_size": 38726,
-    "path": "fac66d98-b837-42a8-81c9-bb3fdba6780c",
-    "created": 1504587412033,
-    "modified": 1504587412113
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "a4fb24bf-6dd5-4749-b67b-48f410f1f694",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp91058183529.ai",
-    "file_size": 38725,
-    "path": "a4fb24bf-6dd5-4749-b67b-48f410f1f694",
-    "created": 1504587853861,
-    "modified": 1504587853885
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "0549b039-2c90-4881-9268-49cb9b63fa39",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp93047173529.ai",
-    "file_size": 900458,
-    "path": "0549b039-2c90-4881-9268-49cb9b63fa39",
-    "created": 1504591168759,
-    "modified": 1504591168813
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "2efc5332-c70a-4f0f-8e8d-ed5860c7f7da",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp57197003576.ai",
-    "file_size": 888073,
-    "path": "2efc5332-c70a-4f0f-8e8d-ed5860c7f7da",
-    "created": 1505265640080,
-    "modified": 1505265640175
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "0fc0053b-2916-4814-a6f1-8127b8e821b2",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp84343505674.ai",
-    "file_size": 58928,
-    "path": "0fc0053b-2916-4814-a6f1-8127b8e821b2",
-    "created": 1505371260459,
-    "modified": 1505371260538
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "3724f152-20ca-401b-a232-47151e11250f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp84357515674.ai",
-    "file_size": 34793,
-    "path": "3724f152-20ca-401b-a232-47151e11250f",
-    "created": 1505371283762,
-    "modified": 1505371283865
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "f4a7d36a-6582-44e2-be0c-44350fabe25f",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1855102717992.ai",
-    "file_size": 55773,
-    "path": "f4a7d36a-6582-44e2-be0c-44350fabe25f",
-    "created": 1505732146016,
-    "modified": 1505732146172
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "303a4540-5b87-4819-9790-14f47f901202",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp208388470.ai",
-    "file_size": 891650,
-    "path": "303a4540-5b87-4819-9790-14f47f901202",
-    "created": 1508294103993,
-    "modified": 1508294104036
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "63f92160-3e7f-4101-97dc-272750e7ebba",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp550061470.ai",
-    "file_size": 891306,
-    "path": "63f92160-3e7f-4101-97dc-272750e7ebba",
-    "created": 1508299798358,
-    "modified": 1508299798403
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "53a97e21-52f0-41c8-946e-cb61259b1773",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp1950724716147.ai",
-    "file_size": 2504006,
-    "path": "53a97e21-52f0-41c8-946e-cb61259b1773",
-    "created": 1511928150886,
-    "modified": 1511928150945
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "1da9b221-485c-47ce-9b1c-a862f902a005",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp142857838.ai",
-    "file_size": 42586,
-    "path": "1da9b221-485c-47ce-9b1c-a862f902a005",
-    "created": 1515561351007,
-    "modified": 1515561351077
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "d0ea19d9-7888-420c-8adc-ff59fda125d5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp24274436416.ai",
-    "file_size": 38932,
-    "path": "d0ea19d9-7888-420c-8adc-ff59fda125d5",
-    "created": 1515974919663,
-    "modified": 1515974920063
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "4d3cc599-dc69-46f1-a541-319617791cfd",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp291532935.ai",
-    "file_size": 115698,
-    "path": "4d3cc599-dc69-46f1-a541-319617791cfd",
-    "created": 1516743414439,
-    "modified": 1516743414537
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "1161a5b1-c611-4e25-b3a8-fab59efe4347",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp293143935.ai",
-    "file_size": 116066,
-    "path": "1161a5b1-c611-4e25-b3a8-fab59efe4347",
-    "created": 1516743438749,
-    "modified": 1516743438873
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "25e36476-bd1b-45f0-93d0-edf229495ee3",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp740642935.ai",
-    "file_size": 263536,
-    "path": "25e36476-bd1b-45f0-93d0-edf229495ee3",
-    "created": 1516750896508,
-    "modified": 1516750896531
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "6476fa0e-ee10-40a2-ad89-6ec5bf0ed4d5",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp866270935.ai",
-    "file_size": 79959,
-    "path": "6476fa0e-ee10-40a2-ad89-6ec5bf0ed4d5",
-    "created": 1516752990235,
-    "modified": 1516752990260
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "d8f12a57-1e6c-4ac9-805d-3a2c4bd5792d",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp715130014289.ai",
-    "file_size": 63713,
-    "path": "d8f12a57-1e6c-4ac9-805d-3a2c4bd5792d",
-    "created": 1517428544695,
-    "modified": 1517428545134
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "be9b7f74-e445-4934-8def-6e6dddbde634",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp715227414289.ai",
-    "file_size": 42305,
-    "path": "be9b7f74-e445-4934-8def-6e6dddbde634",
-    "created": 1517428560868,
-    "modified": 1517428560963
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "c2630055-2011-44cd-a326-dcd7921a3156",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp715664314289.ai",
-    "file_size": 93979,
-    "path": "c2630055-2011-44cd-a326-dcd7921a3156",
-    "created": 1517428633679,
-    "modified": 1517428633770
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "989f028c-6ed2-45bf-a3fd-c75a0779f9b7",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp857217123398.ai",
-    "file_size": 39865,
-    "path": "989f028c-6ed2-45bf-a3fd-c75a0779f9b7",
-    "created": 1517464473144,
-    "modified": 1517464473569
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "a98197cb-bfa5-4a70-8645-a52176472fda",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp857614423398.ai",
-    "file_size": 61254,
-    "path": "a98197cb-bfa5-4a70-8645-a52176472fda",
-    "created": 1517464539295,
-    "modified": 1517464539423
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "90c35000-d9dd-41e1-81a1-11e9cf53e434",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp866447923398.ai",
-    "file_size": 62757,
-    "path": "90c35000-d9dd-41e1-81a1-11e9cf53e434",
-    "created": 1517466011492,
-    "modified": 1517466012177
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "e18a8cd5-c638-4183-97d3-1632565f2c64",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp866811723398.ai",
-    "file_size": 87257,
-    "path": "e18a8cd5-c638-4183-97d3-1632565f2c64",
-    "created": 1517466072117,
-    "modified": 1517466072363
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "c9fd3b91-6d0f-43ed-a767-929062cf6f3c",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp869213223398.ai",
-    "file_size": 32700,
-    "path": "c9fd3b91-6d0f-43ed-a767-929062cf6f3c",
-    "created": 1517466472352,
-    "modified": 1517466472474
-  },
-  {
-    "library_id": "034378ca-4501-4f50-a4c5-e481418dbec6",
-    "library_name": "Stock Templates",
-    "library_type": "private",
-    "element_id": "8432fe2e-5937-48f0-9bfe-6ab86768381e",
-    "element_name": "Vector Smart Object",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Photoshop Temp877644223398.ai",
-    "file_size": 39539,
-    "path": "8432fe2e-5937-48f0-9bfe-6ab86768381e",
-    "created": 1517467877500,
-    "modified": 1517467877664
-  },
-  {
-    "library_id": "1fcdbea3-fe37-4589-adf8-ccec8a1acaf4",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "7b8e5aef-17cb-4b67-823a-b20ec37fd039",
-    "element_name": "Spot-Black copy",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "7b8e5aef-17cb-4b67-823a-b20ec37fd039",
-    "created": 1526204902544,
-    "modified": 1526204902565
-  },
-  {
-    "library_id": "1fcdbea3-fe37-4589-adf8-ccec8a1acaf4",
-    "library_name": "My Library",
-    "library_type": "private",
-    "element_id": "301afcd4-7e30-43d6-8b0b-a98edb18a37c",
-    "element_name": "R=128 G=196 B=28",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "301afcd4-7e30-43d6-8b0b-a98edb18a37c",
-    "created": 1527394323010,
-    "modified": 1527394323036
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3490942d-19a0-463c-bc68-f998902ee9cd",
-    "element_name": "Artwork 291",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "b6ce2951-1b38-4306-a6c3-10fab27ae56c.ai",
-    "file_size": 1207370,
-    "path": "3490942d-19a0-463c-bc68-f998902ee9cd",
-    "created": 1730954227958,
-    "modified": 1730954228001
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d2364bb7-3a73-4ed4-9bfb-fe5d6adbd95f",
-    "element_name": "Artwork 289",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "831116d4-32f4-433a-8797-6de4df06c5d5.ai",
-    "file_size": 1207654,
-    "path": "d2364bb7-3a73-4ed4-9bfb-fe5d6adbd95f",
-    "created": 1730954208327,
-    "modified": 1730954208364
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "37c2e71a-6820-403a-9b7d-854b064c7ca4",
-    "element_name": "Artwork 290",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "50ba8a35-83e0-4992-8505-25a079bac10f.ai",
-    "file_size": 1207120,
-    "path": "37c2e71a-6820-403a-9b7d-854b064c7ca4",
-    "created": 1730954211789,
-    "modified": 1730954211834
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2bbeb5a8-5d6c-4ec7-9b6c-8e3c949d0c4b",
-    "element_name": "Artwork 292",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "3a3bdde5-14c1-4ba6-9eee-812fd4c602a5.ai",
-    "file_size": 1207291,
-    "path": "2bbeb5a8-5d6c-4ec7-9b6c-8e3c949d0c4b",
-    "created": 1730954231589,
-    "modified": 1730954231629
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7c50b7bb-cb8d-43ee-8996-282f0c40850e",
-    "element_name": "Artwork 296",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "3a30c66d-5749-4c3c-8673-1b3613d2dc49.ai",
-    "file_size": 1207437,
-    "path": "7c50b7bb-cb8d-43ee-8996-282f0c40850e",
-    "created": 1730954276203,
-    "modified": 1730954276241
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c71e273b-4ca2-4b96-a70c-c9317245ab9f",
-    "element_name": "Artwork 294",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e67c5a9c-e157-459d-a8f5-d864f657c5a8.ai",
-    "file_size": 1207219,
-    "path": "c71e273b-4ca2-4b96-a70c-c9317245ab9f",
-    "created": 1730954260343,
-    "modified": 1730954260389
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "6f692235-89c0-441f-a50f-73e8ad849bbc",
-    "element_name": "Artwork 295",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "040eb722-e23b-40ea-9d8c-f2ab6aca1c36.ai",
-    "file_size": 1207403,
-    "path": "6f692235-89c0-441f-a50f-73e8ad849bbc",
-    "created": 1730954260344,
-    "modified": 1730954260390
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "8427c619-49d4-4ba0-aeb0-15e11ab64d71",
-    "element_name": "Artwork 293",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "744b8793-aa64-4982-a08c-48f608060009.ai",
-    "file_size": 1208164,
-    "path": "8427c619-49d4-4ba0-aeb0-15e11ab64d71",
-    "created": 1730954247228,
-    "modified": 1730954247282
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "622c86fe-07f1-4a79-860a-9503aa1839d3",
-    "element_name": "Artwork 288",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "72710203-b2fa-479d-9e45-4c7fcbd92748.ai",
-    "file_size": 1207761,
-    "path": "622c86fe-07f1-4a79-860a-9503aa1839d3",
-    "created": 1730954197456,
-    "modified": 1730954197507
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "692fd656-3603-42c0-9557-62fdfba2c3b2",
-    "element_name": "Artwork 287",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "8ff1fc8f-0914-496e-b340-b3a338c40c77.ai",
-    "file_size": 1207096,
-    "path": "692fd656-3603-42c0-9557-62fdfba2c3b2",
-    "created": 1730954178302,
-    "modified": 1730954178351
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1a23c5c1-65e7-494b-ad12-1ebe947584f7",
-    "element_name": "Artwork 299",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "7f7ab615-dc2d-4cfe-926d-5e71357ce2d0.ai",
-    "file_size": 1207251,
-    "path": "1a23c5c1-65e7-494b-ad12-1ebe947584f7",
-    "created": 1730954290391,
-    "modified": 1730954290453
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "49dca1d5-f3e5-4bb4-aef4-f482d6bd98dd",
-    "element_name": "Artwork 297",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "4f0104ab-b3bb-407a-b7cb-f7c5c622bb80.ai",
-    "file_size": 1208740,
-    "path": "49dca1d5-f3e5-4bb4-aef4-f482d6bd98dd",
-    "created": 1730954286900,
-    "modified": 1730954286947
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4cefcdfd-626d-4811-9c2d-ddee07d909b3",
-    "element_name": "Artwork 300",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "8e4104f4-d7ea-492d-8d27-67801b612741.ai",
-    "file_size": 1207473,
-    "path": "4cefcdfd-626d-4811-9c2d-ddee07d909b3",
-    "created": 1730954318919,
-    "modified": 1730954318960
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "711d977d-6ac9-4d15-a14b-620917cf71be",
-    "element_name": "Artwork 301",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "4c5c1968-e669-48fc-b16d-5da3a846fce0.ai",
-    "file_size": 1207047,
-    "path": "711d977d-6ac9-4d15-a14b-620917cf71be",
-    "created": 1730954330598,
-    "modified": 1730954330638
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b14ea8da-9842-465f-85e8-c3ced09e86e2",
-    "element_name": "Artwork 302",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e779c43f-add5-4615-a28b-0579c280f259.ai",
-    "file_size": 1207336,
-    "path": "b14ea8da-9842-465f-85e8-c3ced09e86e2",
-    "created": 1730954341485,
-    "modified": 1730954341525
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2b8cd4cb-2008-44bd-819f-366ff65520bd",
-    "element_name": "Artwork 306",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "ec9ffe0a-cacf-4e7c-9947-672752d74906.ai",
-    "file_size": 1207759,
-    "path": "2b8cd4cb-2008-44bd-819f-366ff65520bd",
-    "created": 1730954390204,
-    "modified": 1730954390241
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "77cd1104-c5e3-40e7-a994-1c2288d0e934",
-    "element_name": "Artwork 304",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9c5f1699-d1e0-4fd3-86ff-569be97dcb39.ai",
-    "file_size": 1207753,
-    "path": "77cd1104-c5e3-40e7-a994-1c2288d0e934",
-    "created": 1730954360145,
-    "modified": 1730954360215
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3be4f807-39f3-4f7b-b6c7-f31bc13a0ba7",
-    "element_name": "Artwork 305",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "f7250fdd-364f-44e1-8e2a-d83c535ff884.ai",
-    "file_size": 1207479,
-    "path": "3be4f807-39f3-4f7b-b6c7-f31bc13a0ba7",
-    "created": 1730954374056,
-    "modified": 1730954374098
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2c6cf6fd-fd67-4086-895c-fdcdae2e2c47",
-    "element_name": "Artwork 307",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "2ec285c6-b605-4b9a-befe-f4e974013ec9.ai",
-    "file_size": 1207333,
-    "path": "2c6cf6fd-fd67-4086-895c-fdcdae2e2c47",
-    "created": 1730954401741,
-    "modified": 1730954401778
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "26a385f1-4ff8-4022-845f-569e239edee6",
-    "element_name": "Artwork 308",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "c8edc29a-9c3c-4907-a682-6c2fef9d9daa.ai",
-    "file_size": 1207560,
-    "path": "26a385f1-4ff8-4022-845f-569e239edee6",
-    "created": 1730954413281,
-    "modified": 1730954413319
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "01cbb19a-0a28-4b51-bfad-0dd7134f668a",
-    "element_name": "Artwork 310",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "d4533232-f153-4294-a823-7ebc455c4a71.ai",
-    "file_size": 1207387,
-    "path": "01cbb19a-0a28-4b51-bfad-0dd7134f668a",
-    "created": 1730954491957,
-    "modified": 1730954492016
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "af6f06e6-9372-4b80-b38d-0edc9294342a",
-    "element_name": "Artwork 309",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e32daf28-d6b3-4f62-a478-e85a8e001b19.ai",
-    "file_size": 1207305,
-    "path": "af6f06e6-9372-4b80-b38d-0edc9294342a",
-    "created": 1730954423998,
-    "modified": 1730954424036
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "26c8f1d3-7977-405e-b727-a615349058c2",
-    "element_name": "Artwork 311",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "3ce09359-281e-4ad6-bdc3-67fd193e9f30.ai",
-    "file_size": 1207462,
-    "path": "26c8f1d3-7977-405e-b727-a615349058c2",
-    "created": 1731381041996,
-    "modified": 1731381042041
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9ac7f4d9-12e0-443c-8b00-6c7da878be31",
-    "element_name": "Artwork 312",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e7f2b77b-9e61-47cd-aaa4-1929bd1dd264.ai",
-    "file_size": 1207626,
-    "path": "9ac7f4d9-12e0-443c-8b00-6c7da878be31",
-    "created": 1731381062958,
-    "modified": 1731381063008
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3f8f9e74-c52a-4a6d-a024-09e21afd1264",
-    "element_name": "Artwork 313",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "dc2b9c90-b2da-4e81-bcd1-1e2ec6484105.ai",
-    "file_size": 1207838,
-    "path": "3f8f9e74-c52a-4a6d-a024-09e21afd1264",
-    "created": 1731381078318,
-    "modified": 1731381078357
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9474680c-77dc-4cb8-b54c-c25dbc04df7a",
-    "element_name": "Artwork 314",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e7673582-3a9c-4c58-aa94-baa3254eca21.ai",
-    "file_size": 1207343,
-    "path": "9474680c-77dc-4cb8-b54c-c25dbc04df7a",
-    "created": 1731381090512,
-    "modified": 1731381090558
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4248d86d-ae25-4c60-852b-3fbb203bf349",
-    "element_name": "Artwork 315",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "f932606a-86e0-43a2-9d1b-b4ae788f9556.ai",
-    "file_size": 1207946,
-    "path": "4248d86d-ae25-4c60-852b-3fbb203bf349",
-    "created": 1731381098398,
-    "modified": 1731381098451
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7bb3fdd4-ff3f-471a-af9c-cc9a309841df",
-    "element_name": "Artwork 316",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "2b3fd768-bbae-4a6a-b223-a3b033d4c9f8.ai",
-    "file_size": 1207050,
-    "path": "7bb3fdd4-ff3f-471a-af9c-cc9a309841df",
-    "created": 1731381119763,
-    "modified": 1731381119802
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "15eb69d5-e1fe-4722-9c88-0a5a77252da7",
-    "element_name": "Artwork 317",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "660d3a69-56f2-414a-a1ee-d60b7134c2d5.ai",
-    "file_size": 1207800,
-    "path": "15eb69d5-e1fe-4722-9c88-0a5a77252da7",
-    "created": 1731381131640,
-    "modified": 1731381131690
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3db803c4-e83d-4bef-97d8-4443e857accd",
-    "element_name": "Artwork 318",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "a835156e-e7eb-4022-b955-f31d0272bd7f.ai",
-    "file_size": 1208051,
-    "path": "3db803c4-e83d-4bef-97d8-4443e857accd",
-    "created": 1731381144338,
-    "modified": 1731381144375
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "78c8f914-4f2f-4c02-ab23-e8ae2835dc42",
-    "element_name": "Artwork 319",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "f69e4269-aa34-48ff-9628-e7d974f714fe.ai",
-    "file_size": 1207153,
-    "path": "78c8f914-4f2f-4c02-ab23-e8ae2835dc42",
-    "created": 1731381157010,
-    "modified": 1731381157055
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ddaff62f-fb00-4db1-9e69-07a14b01ab5a",
-    "element_name": "Artwork 320",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "a09ff93e-adaa-4678-a710-a603695b63d4.ai",
-    "file_size": 1207230,
-    "path": "ddaff62f-fb00-4db1-9e69-07a14b01ab5a",
-    "created": 1731381160737,
-    "modified": 1731381160779
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0bafc884-b5d9-46b2-b393-a1a6efc60723",
-    "element_name": "Artwork 321",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "adfd52f5-ad99-4420-91a8-77507e567a3c.ai",
-    "file_size": 1207302,
-    "path": "0bafc884-b5d9-46b2-b393-a1a6efc60723",
-    "created": 1731381176654,
-    "modified": 1731381176695
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "6f7e3e10-82e9-4c9d-a8d2-7ccf99cced52",
-    "element_name": "Artwork 322",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "c9648c48-660b-4cd1-81bc-169a6efb50ad.ai",
-    "file_size": 1207700,
-    "path": "6f7e3e10-82e9-4c9d-a8d2-7ccf99cced52",
-    "created": 1731381190006,
-    "modified": 1731381190066
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "479da6ef-efa3-4bcc-b584-f6cddc96640a",
-    "element_name": "Artwork 323",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "f130b4e0-86e1-4cb6-b856-55d5d5a0f945.ai",
-    "file_size": 1207923,
-    "path": "479da6ef-efa3-4bcc-b584-f6cddc96640a",
-    "created": 1731381200428,
-    "modified": 1731381200464
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "23960762-afb4-4f04-9636-7cbb4d7aa780",
-    "element_name": "Artwork 324",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "d6fe4dce-0b41-4201-bc97-35c8d8c41d71.ai",
-    "file_size": 1207071,
-    "path": "23960762-afb4-4f04-9636-7cbb4d7aa780",
-    "created": 1731381211033,
-    "modified": 1731381211091
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7e1d1409-c660-4ff8-b444-3940265cdf9a",
-    "element_name": "Artwork 325",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "7a6ce1f1-8c6f-494a-8411-c30322ae6481.ai",
-    "file_size": 1207305,
-    "path": "7e1d1409-c660-4ff8-b444-3940265cdf9a",
-    "created": 1731381225410,
-    "modified": 1731381225452
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4bda7d67-fd32-45ed-a1fd-57bec9d830ac",
-    "element_name": "Artwork 326",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "ad9ea10b-e5d8-41ea-839e-06ca9a69d5f3.ai",
-    "file_size": 1207061,
-    "path": "4bda7d67-fd32-45ed-a1fd-57bec9d830ac",
-    "created": 1731381263283,
-    "modified": 1731381263331
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "33f0cc3c-17aa-40a4-85ba-de642d91cfef",
-    "element_name": "CNTR universal edge RT007544",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "CNTRuniversaledgeRT007544_029650b1-08d7-40a2-80a3-cae153057eaa.ai",
-    "file_size": 205798,
-    "path": "33f0cc3c-17aa-40a4-85ba-de642d91cfef",
-    "created": 1724653291358,
-    "modified": 1724653474908
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4ef1d2aa-2214-46ea-89f0-9a33294ccf11",
-    "element_name": "Artwork 396",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "6f60aade-9d91-40da-aa12-359747162b9c.ai",
-    "file_size": 384294,
-    "path": "4ef1d2aa-2214-46ea-89f0-9a33294ccf11",
-    "created": 1733363206558,
-    "modified": 1733363206562
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d28e55f2-7100-4c23-b9e4-4e5a57084d72",
-    "element_name": "BMP-2 DECOY 9LEFT REAR CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "0f79be46-fca0-44fc-9628-edc95d1114b5.ai",
-    "file_size": 399075,
-    "path": "d28e55f2-7100-4c23-b9e4-4e5a57084d72",
-    "created": 1732147660159,
-    "modified": 1732147660180
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7335c0d9-db41-4fa4-93c8-6bdf9943a22e",
-    "element_name": "P06 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "c610323c-0328-4e99-bf2f-30ccdcf78625.ai",
-    "file_size": 1223322,
-    "path": "7335c0d9-db41-4fa4-93c8-6bdf9943a22e",
-    "created": 1682467360262,
-    "modified": 1682467360281
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b5ed9ca9-b5ae-4878-b4dc-e924fb630a45",
-    "element_name": "P06 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "2c9ce915-eff1-423a-bcbe-4d061fdc75b0.ai",
-    "file_size": 1222572,
-    "path": "b5ed9ca9-b5ae-4878-b4dc-e924fb630a45",
-    "created": 1682467330822,
-    "modified": 1682467330842
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d3c062a4-d37a-4b97-a904-be649e62a531",
-    "element_name": "Artwork 92",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "f14e3f09-d206-4e78-bd11-5e7f6478140e.ai",
-    "file_size": 1222743,
-    "path": "d3c062a4-d37a-4b97-a904-be649e62a531",
-    "created": 1682467438057,
-    "modified": 1682467438075
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a87bfa50-20a9-4962-885b-71bbeb3afd02",
-    "element_name": "MBT_THERMAL_SIDE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork92_eb903cb7-78d5-426d-b282-5de032b38184.ai",
-    "file_size": 1229037,
-    "path": "a87bfa50-20a9-4962-885b-71bbeb3afd02",
-    "created": 1682466786797,
-    "modified": 1682466853273
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "00fc6916-2a7f-4b58-8a0d-fad994c51a63",
-    "element_name": "Artwork 96",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "4cdb9ff8-fe83-423b-9bee-18d87b34f5ca.ai",
-    "file_size": 1221530,
-    "path": "00fc6916-2a7f-4b58-8a0d-fad994c51a63",
-    "created": 1682468475558,
-    "modified": 1682468475575
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4a724604-0a25-4ef3-962a-7b38e5cf1f42",
-    "element_name": "Artwork 93",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "47ee4c0f-63f7-401a-b493-82b67b3ef52b.ai",
-    "file_size": 1224168,
-    "path": "4a724604-0a25-4ef3-962a-7b38e5cf1f42",
-    "created": 1682468259294,
-    "modified": 1682468259316
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "8d5b345a-f6dc-4dfa-bf99-d406f4f5bb9f",
-    "element_name": "MALE 5mm",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork150_426298ae-707c-4d9c-9313-7764470739c4.ai",
-    "file_size": 1211096,
-    "path": "8d5b345a-f6dc-4dfa-bf99-d406f4f5bb9f",
-    "created": 1690422735057,
-    "modified": 1690422837564
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0dfb084a-2246-4c26-8d3c-c4ef50a507f0",
-    "element_name": "Artwork 95",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "8d5344d5-1477-4790-9e7c-935a15feba4f.ai",
-    "file_size": 1224875,
-    "path": "0dfb084a-2246-4c26-8d3c-c4ef50a507f0",
-    "created": 1682468281360,
-    "modified": 1682468281378
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "351035bf-9ec6-49b0-a673-ba738fee1792",
-    "element_name": "v4 MALE 5mm",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "MALE5mm_e85906da-5652-4abe-82a7-b2a0a4ba6db5.ai",
-    "file_size": 1213507,
-    "path": "351035bf-9ec6-49b0-a673-ba738fee1792",
-    "created": 1690422735057,
-    "modified": 1690432576891
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "45e56976-597a-4f69-ab15-312206fecdf5",
-    "element_name": "FEMALE 5mm",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "FEMALE5mm_65f7ff5e-b140-4461-b964-8d04483c5086.ai",
-    "file_size": 1212285,
-    "path": "45e56976-597a-4f69-ab15-312206fecdf5",
-    "created": 1690423237788,
-    "modified": 1690425053048
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "43605ee4-9f68-45a6-aed7-d114d281d807",
-    "element_name": "v4 FEMALE 5mm",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "v4FEMALE5mm_9b200b39-326d-4f2f-ad25-b8ff3702ffbe.ai",
-    "file_size": 1212851,
-    "path": "43605ee4-9f68-45a6-aed7-d114d281d807",
-    "created": 1690423237788,
-    "modified": 1690432851607
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5f6ce3cc-6c01-42ea-8277-a7dde544de44",
-    "element_name": "Little Female",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "1a868a1a-540f-43ed-8d7e-01e77f9a5547.ai",
-    "file_size": 1207609,
-    "path": "5f6ce3cc-6c01-42ea-8277-a7dde544de44",
-    "created": 1692233182989,
-    "modified": 1692233183009
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "fc995a40-e650-45bf-9d85-f293bfdafe7a",
-    "element_name": "8 MM F - dual 5mm MalePoplock",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "0504f912-72da-4e5c-b6f7-ab426a2c0482.ai",
-    "file_size": 1210129,
-    "path": "fc995a40-e650-45bf-9d85-f293bfdafe7a",
-    "created": 1690947661981,
-    "modified": 1690947662008
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "49f61a46-f142-4a23-8217-144d1772b71a",
-    "element_name": "1-3 MINI SHEET CUT REG OVERLAY",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e3cacae2-609c-4098-88d8-f0d5c7ce4ac4.ai",
-    "file_size": 1750453,
-    "path": "49f61a46-f142-4a23-8217-144d1772b71a",
-    "created": 1692078317225,
-    "modified": 1692078317254
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1bec7dda-58e3-4815-8ef8-092d34640fa8",
-    "element_name": "LIttle",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "LIttle_b8774767-f2c5-4362-9a15-cd453b639434.ai",
-    "file_size": 1212071,
-    "path": "1bec7dda-58e3-4815-8ef8-092d34640fa8",
-    "created": 1692232100504,
-    "modified": 1692233827690
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9522dffd-c060-4f95-b2d2-2b41e872a3c9",
-    "element_name": "Big Male",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork158_a5045187-4715-4173-a403-2b9d0f4f1ad3.ai",
-    "file_size": 1213840,
-    "path": "9522dffd-c060-4f95-b2d2-2b41e872a3c9",
-    "created": 1692232100504,
-    "modified": 1692234822976
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ee564dbd-81a7-4711-8401-1f8ba1dbd915",
-    "element_name": "Print Reg CUT PATH ONLY",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "PrintRegCUTPATHONLY_a6c5ed86-b04f-4241-82bf-741a2be12e60.ai",
-    "file_size": 1216467,
-    "path": "ee564dbd-81a7-4711-8401-1f8ba1dbd915",
-    "created": 1691644153655,
-    "modified": 1692598476830
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b8644cff-6a1a-4d19-b5ea-558bb23d1d68",
-    "element_name": "Big Male Long",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BigMaleLong_f5dcf81c-16e9-48b9-80d4-8b1feb2c4c78.ai",
-    "file_size": 1215726,
-    "path": "b8644cff-6a1a-4d19-b5ea-558bb23d1d68",
-    "created": 1692232100504,
-    "modified": 1692243780839
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a8dd19d3-c127-4884-83dc-2d1074afc936",
-    "element_name": "01R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "01R_c93800db-a902-4285-b067-7e9638acb88f.ai",
-    "file_size": 204660,
-    "path": "a8dd19d3-c127-4884-83dc-2d1074afc936",
-    "created": 1695121299695,
-    "modified": 1695121401402
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7bfea5da-4814-4ed7-9dc7-a90a1fb9bfcf",
-    "element_name": "Artwork 159",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork159_83367f55-361c-4a5d-8803-b8ad8891a1b9.ai",
-    "file_size": 1217210,
-    "path": "7bfea5da-4814-4ed7-9dc7-a90a1fb9bfcf",
-    "created": 1693450166512,
-    "modified": 1693450201664
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a0a0a7c7-d7a7-490c-a2f7-8b3b7e77ded4",
-    "element_name": "Plinth CC Taped",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "PlinthCornerCut_d4329b3d-da60-46f1-bfb4-51e025763eb6.ai",
-    "file_size": 1215269,
-    "path": "a0a0a7c7-d7a7-490c-a2f7-8b3b7e77ded4",
-    "created": 1693456301136,
-    "modified": 1693456897988
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1731a3ff-bb26-4b17-9716-a12e5d2fbe5c",
-    "element_name": "02L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "a095fd74-1759-407a-879f-f25bdf4165c1.ai",
-    "file_size": 227051,
-    "path": "1731a3ff-bb26-4b17-9716-a12e5d2fbe5c",
-    "created": 1695121488688,
-    "modified": 1695121488707
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2cb3a9d0-da41-45f7-920c-516e680a4bd8",
-    "element_name": "Plinth Corner Cut",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "PlinthCornerCut_96f8940d-cd99-4a0a-8cd0-054b6ae17523.ai",
-    "file_size": 1215083,
-    "path": "2cb3a9d0-da41-45f7-920c-516e680a4bd8",
-    "created": 1693456301136,
-    "modified": 1693473653430
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f02ab5b8-1c99-4062-8de3-44b88602e2a6",
-    "element_name": "03C",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "03C_0eb7f10b-485c-41e5-b038-31884af909f1.ai",
-    "file_size": 187293,
-    "path": "f02ab5b8-1c99-4062-8de3-44b88602e2a6",
-    "created": 1695121011502,
-    "modified": 1695122553166
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "36338f4a-6e62-49e9-aea7-0edb3534946d",
-    "element_name": "13C",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "13C_c6145b59-e15d-4a1d-942a-6f93d843a8f9.ai",
-    "file_size": 212255,
-    "path": "36338f4a-6e62-49e9-aea7-0edb3534946d",
-    "created": 1695136561229,
-    "modified": 1695136591943
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1ad94c93-40a9-406d-844f-3e19d114863d",
-    "element_name": "02R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork169_de354a5d-2dc5-45fe-9242-19f06c45e25d.ai",
-    "file_size": 203070,
-    "path": "1ad94c93-40a9-406d-844f-3e19d114863d",
-    "created": 1695123014412,
-    "modified": 1695123117357
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0de8343c-04c8-45c6-adc5-558576e4a14a",
-    "element_name": "12C",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "12C_4a8a2624-534f-4712-b154-0234c8b0e9e3.ai",
-    "file_size": 187425,
-    "path": "0de8343c-04c8-45c6-adc5-558576e4a14a",
-    "created": 1695136443217,
-    "modified": 1695136603378
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "795eb994-d134-4059-a76f-dcece9596997",
-    "element_name": "01L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "01L_decdf1a9-23c8-4f85-846d-fd8ca001a558.ai",
-    "file_size": 1211631,
-    "path": "795eb994-d134-4059-a76f-dcece9596997",
-    "created": 1695120826934,
-    "modified": 1695122694815
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c42cfb09-ece2-4cdc-baea-b675467fda1b",
-    "element_name": "5MM FEMALE FLAP",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "13a065b3-b9be-4221-b240-f7e8055b1346.ai",
-    "file_size": 1211354,
-    "path": "c42cfb09-ece2-4cdc-baea-b675467fda1b",
-    "created": 1695141759656,
-    "modified": 1695141759699
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2a5c2a26-a853-49a6-a2de-fd90e7ed701d",
-    "element_name": "04L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "aced9af9-1ef5-47ca-8806-c7d5378679c8.ai",
-    "file_size": 232597,
-    "path": "2a5c2a26-a853-49a6-a2de-fd90e7ed701d",
-    "created": 1695177123903,
-    "modified": 1695177123921
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3a9c3fb1-478c-4231-b028-d4e5fb04f90e",
-    "element_name": "5MM MALE FLAP",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "3bf2739a-b193-482b-96da-ce6cf0de690b.ai",
-    "file_size": 1212129,
-    "path": "3a9c3fb1-478c-4231-b028-d4e5fb04f90e",
-    "created": 1695141799618,
-    "modified": 1695141799661
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "cc6ac299-e491-44f5-b2e6-dfcbb01da1dc",
-    "element_name": "5MM MALE FLAP",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "3bf2739a-b193-482b-96da-ce6cf0de690b.ai",
-    "file_size": 1212129,
-    "path": "cc6ac299-e491-44f5-b2e6-dfcbb01da1dc",
-    "created": 1695141799618,
-    "modified": 1695141799661
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "117db07f-0d2d-4fdc-bf04-bcd8186550f7",
-    "element_name": "05R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "468ad048-dc84-49fc-9265-34de33da3aba.ai",
-    "file_size": 228110,
-    "path": "117db07f-0d2d-4fdc-bf04-bcd8186550f7",
-    "created": 1695179408033,
-    "modified": 1695179408045
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "6db9a2b6-e82a-4ebc-857c-bcf8cfa4e911",
-    "element_name": "05L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "a31ee486-3a98-46d9-8472-2144c791ec7e.ai",
-    "file_size": 221303,
-    "path": "6db9a2b6-e82a-4ebc-857c-bcf8cfa4e911",
-    "created": 1695179639455,
-    "modified": 1695179639467
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "650af434-761b-467f-bc87-ebe954840e69",
-    "element_name": "04R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "b350d2c0-9732-4b6d-8a2c-1ea028cd3520.ai",
-    "file_size": 240222,
-    "path": "650af434-761b-467f-bc87-ebe954840e69",
-    "created": 1695177300624,
-    "modified": 1695177300636
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "abab261a-7c54-4d51-b0a7-33ed3a80f483",
-    "element_name": "07R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "b7c26abe-d39e-419c-81fe-883d01fb1cd1.ai",
-    "file_size": 222621,
-    "path": "abab261a-7c54-4d51-b0a7-33ed3a80f483",
-    "created": 1695180768798,
-    "modified": 1695180768811
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5d7edaba-9607-4931-b4a0-ccf95dc9405d",
-    "element_name": "08L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "68e64908-1d90-4481-b9b9-b7c52bb7e12d.ai",
-    "file_size": 229784,
-    "path": "5d7edaba-9607-4931-b4a0-ccf95dc9405d",
-    "created": 1695191843372,
-    "modified": 1695191843385
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4b0369f3-2f39-4373-befd-350d3db473ee",
-    "element_name": "08R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "a6cd97d3-f085-4d6a-aefa-43ea0de36831.ai",
-    "file_size": 226496,
-    "path": "4b0369f3-2f39-4373-befd-350d3db473ee",
-    "created": 1695191887955,
-    "modified": 1695191887967
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "50c69db4-b4e2-4633-a3d1-75efa9be71aa",
-    "element_name": "07L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "c2a45643-ebdd-46c2-a80a-5aad3aa10b68.ai",
-    "file_size": 213109,
-    "path": "50c69db4-b4e2-4633-a3d1-75efa9be71aa",
-    "created": 1695180858811,
-    "modified": 1695180858823
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0e55f049-4669-4c48-8ccc-bfafdc51ff0b",
-    "element_name": "09R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "1de4ac76-e0f5-4d82-9802-54718b930b96.ai",
-    "file_size": 1225526,
-    "path": "0e55f049-4669-4c48-8ccc-bfafdc51ff0b",
-    "created": 1695192393748,
-    "modified": 1695192393768
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "bbc6980e-2a02-4362-94b5-cee3971710bc",
-    "element_name": "09L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "c413e7ad-c15f-498d-9c1a-9a36ecd55f2e.ai",
-    "file_size": 1229609,
-    "path": "bbc6980e-2a02-4362-94b5-cee3971710bc",
-    "created": 1695192504902,
-    "modified": 1695192504922
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5832c9e4-6cdd-4a18-a82a-6fd3a8429fda",
-    "element_name": "10R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "0a2ec0b8-1750-4b3c-87ee-7b389624e668.ai",
-    "file_size": 223162,
-    "path": "5832c9e4-6cdd-4a18-a82a-6fd3a8429fda",
-    "created": 1695274959752,
-    "modified": 1695274959766
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5d25cd92-3bd9-48ba-9050-c05dd0d1aa2c",
-    "element_name": "06L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e809ffe8-36d2-4d77-b4b7-9e58b12a5857.ai",
-    "file_size": 1217187,
-    "path": "5d25cd92-3bd9-48ba-9050-c05dd0d1aa2c",
-    "created": 1695192920253,
-    "modified": 1695192920273
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b493cf18-bbb1-461d-a865-0611a66f5db2",
-    "element_name": "06R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "2e3c1eaa-402e-470b-8df5-07c83ce325cf.ai",
-    "file_size": 1222315,
-    "path": "b493cf18-bbb1-461d-a865-0611a66f5db2",
-    "created": 1695192754736,
-    "modified": 1695192754758
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b363db6e-d734-4a9a-b5ec-829a5cce022e",
-    "element_name": "10L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "afdfca2d-75f9-42b4-a9bc-44e62818bb36.ai",
-    "file_size": 225343,
-    "path": "b363db6e-d734-4a9a-b5ec-829a5cce022e",
-    "created": 1695275498057,
-    "modified": 1695275498070
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ee59b3b2-0fd2-4905-a828-13b90d45e84f",
-    "element_name": "12R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "be946857-e737-4778-8cb2-d876599ee956.ai",
-    "file_size": 220303,
-    "path": "ee59b3b2-0fd2-4905-a828-13b90d45e84f",
-    "created": 1695276404200,
-    "modified": 1695276404214
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "94405c22-4a22-4b76-8b17-1539df9ed784",
-    "element_name": "12L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "fdd45290-99d9-4362-870a-8bfbdba7ca30.ai",
-    "file_size": 226482,
-    "path": "94405c22-4a22-4b76-8b17-1539df9ed784",
-    "created": 1695276440690,
-    "modified": 1695276440701
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1a11fead-f27f-40e4-875a-abaed6b5bdfc",
-    "element_name": "11R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "32a58fe2-be6f-48bb-aea8-addbce67b493.ai",
-    "file_size": 219389,
-    "path": "1a11fead-f27f-40e4-875a-abaed6b5bdfc",
-    "created": 1695276480746,
-    "modified": 1695276480755
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2c60d980-f13a-4458-98b3-8aba27862105",
-    "element_name": "11L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "bcc93939-fa12-447a-8f2e-27a9ff28d0a8.ai",
-    "file_size": 219678,
-    "path": "2c60d980-f13a-4458-98b3-8aba27862105",
-    "created": 1695276506409,
-    "modified": 1695276506415
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1cc1f068-55a3-48b9-a8c3-1a35ab7014f0",
-    "element_name": "09L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "09L_70db6186-cf6b-4a59-9b80-ea1392621da4.ai",
-    "file_size": 213227,
-    "path": "1cc1f068-55a3-48b9-a8c3-1a35ab7014f0",
-    "created": 1695298329943,
-    "modified": 1695298737730
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5cbeb9a5-f1ea-4338-bdb8-b1f1f8911caf",
-    "element_name": "06L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "5dc7ce10-3b9b-4981-891c-07e6787527bd.ai",
-    "file_size": 216451,
-    "path": "5cbeb9a5-f1ea-4338-bdb8-b1f1f8911caf",
-    "created": 1695295906462,
-    "modified": 1695295906512
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "54b404fb-b373-4c32-b5b1-471eb18cb59c",
-    "element_name": "5R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e90366a3-a9af-4a59-b5be-daead6f81c17.ai",
-    "file_size": 218274,
-    "path": "54b404fb-b373-4c32-b5b1-471eb18cb59c",
-    "created": 1695277091259,
-    "modified": 1695277091272
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "14ed47ca-28e9-4dbe-a8a3-1361e84165c8",
-    "element_name": "06R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "40e0a1a2-be59-49a2-8a46-9089b7d9b505.ai",
-    "file_size": 217224,
-    "path": "14ed47ca-28e9-4dbe-a8a3-1361e84165c8",
-    "created": 1695298871423,
-    "modified": 1695298871446
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9ae32e6e-1685-4838-b60b-610401ac478d",
-    "element_name": "07R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "aeac08e1-4e60-443f-b113-fb30e0c1abb0.ai",
-    "file_size": 216749,
-    "path": "9ae32e6e-1685-4838-b60b-610401ac478d",
-    "created": 1695298970168,
-    "modified": 1695298970189
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "13e3a9c8-21aa-4b7e-8e3d-46926249544d",
-    "element_name": "07L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "24624284-df28-4423-84bd-e5a9672f8523.ai",
-    "file_size": 217095,
-    "path": "13e3a9c8-21aa-4b7e-8e3d-46926249544d",
-    "created": 1695298931302,
-    "modified": 1695298931342
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "759d40ac-5ec5-4b45-b03e-3666e973b802",
-    "element_name": "08L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "1efa238a-0ae2-47cc-905e-7339a411e920.ai",
-    "file_size": 217102,
-    "path": "759d40ac-5ec5-4b45-b03e-3666e973b802",
-    "created": 1695299020881,
-    "modified": 1695299020900
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ac3ecd97-f194-45b6-b0f6-c4aae3cf16ac",
-    "element_name": "08R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e553c442-7842-4b85-857f-398327f86173.ai",
-    "file_size": 216576,
-    "path": "ac3ecd97-f194-45b6-b0f6-c4aae3cf16ac",
-    "created": 1695299056495,
-    "modified": 1695299056520
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b430f113-02b1-402a-bbe8-54defdcc6f55",
-    "element_name": "09R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "09R_d614ad87-9c9d-48ba-8939-125eb962c939.ai",
-    "file_size": 236486,
-    "path": "b430f113-02b1-402a-bbe8-54defdcc6f55",
-    "created": 1695298122731,
-    "modified": 1695299181351
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "85b9a526-78dc-48a3-b4d4-8de610c1b752",
-    "element_name": "03R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "f062f3e0-a931-498f-a7ad-c4143d702003.ai",
-    "file_size": 238893,
-    "path": "85b9a526-78dc-48a3-b4d4-8de610c1b752",
-    "created": 1695329038051,
-    "modified": 1695329038109
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "07b23f35-8bea-4105-b1ba-85ac22e36785",
-    "element_name": "05L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "19efa6a7-12df-41ed-8793-2842ea79f3e0.ai",
-    "file_size": 369600,
-    "path": "07b23f35-8bea-4105-b1ba-85ac22e36785",
-    "created": 1695299645122,
-    "modified": 1695299645143
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4a7bf80d-d2cb-4903-98f8-3522b30af1bd",
-    "element_name": "04L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "ddd42082-36b2-42d9-bf2d-82bc3e936d0f.ai",
-    "file_size": 212116,
-    "path": "4a7bf80d-d2cb-4903-98f8-3522b30af1bd",
-    "created": 1695330863450,
-    "modified": 1695330863479
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a36f645d-242f-46af-b1e2-a88dfa412001",
-    "element_name": "03R v2",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "07dbfb8e-07bb-4765-8ba7-37e366bff2d9.ai",
-    "file_size": 240078,
-    "path": "a36f645d-242f-46af-b1e2-a88dfa412001",
-    "created": 1695604745368,
-    "modified": 1695604745381
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "91ff86b6-993e-4e3e-94a9-8eddf867e1b5",
-    "element_name": "04R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "04R_25258308-c367-4a77-bd5d-2906a9cacf13.ai",
-    "file_size": 191134,
-    "path": "91ff86b6-993e-4e3e-94a9-8eddf867e1b5",
-    "created": 1695279424680,
-    "modified": 1695606497206
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a000f4ca-565d-499f-9833-5c8506a93332",
-    "element_name": "01L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork171_43549222-43c4-45c8-99a0-1bcfb2111b45.ai",
-    "file_size": 337118,
-    "path": "a000f4ca-565d-499f-9833-5c8506a93332",
-    "created": 1695605902929,
-    "modified": 1695605923407
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d7a2f6f0-a323-4616-8f8c-17834519fd94",
-    "element_name": "02C cut path (no locks)",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "98c72b3a-8120-4a8c-b395-f6474e769680.ai",
-    "file_size": 200244,
-    "path": "d7a2f6f0-a323-4616-8f8c-17834519fd94",
-    "created": 1695612729237,
-    "modified": 1695612729249
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0a75a270-86a8-4f67-a5be-ed5209cddee0",
-    "element_name": "01L Path",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork171_47766a89-b15a-4daa-9b3c-66cc65678071.ai",
-    "file_size": 1210823,
-    "path": "0a75a270-86a8-4f67-a5be-ed5209cddee0",
-    "created": 1695611289456,
-    "modified": 1695611321579
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b49729dc-bd09-4565-a0c8-1c094f09c7d7",
-    "element_name": "02C",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "b780c194-b57b-4fd0-9d3f-11ce64763060.ai",
-    "file_size": 386749,
-    "path": "b49729dc-bd09-4565-a0c8-1c094f09c7d7",
-    "created": 1695615318037,
-    "modified": 1695615318051
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4a8922ec-4026-42e6-b760-13fe16bdfe2b",
-    "element_name": "5mm double female",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "5mmdoublefemale_0e51061f-f996-4c18-ba87-1889b6e20dc1.ai",
-    "file_size": 182480,
-    "path": "4a8922ec-4026-42e6-b760-13fe16bdfe2b",
-    "created": 1695139081876,
-    "modified": 1695791955199
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7cef97a1-2314-4f23-a812-95956d676de8",
-    "element_name": "5mm double male",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "5mmdoublemale_35ec9a7d-00bc-4e7e-8497-d2579c323d65.ai",
-    "file_size": 182267,
-    "path": "7cef97a1-2314-4f23-a812-95956d676de8",
-    "created": 1695139104633,
-    "modified": 1695791997325
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b257f14b-4f80-49b6-9f52-f34efaedfbec",
-    "element_name": "5MM FEMALE FLAP",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "5MMFEMALEFLAP_11dc66b7-a17b-4f6c-a85d-b90a7f6ce4a2.ai",
-    "file_size": 1186524,
-    "path": "b257f14b-4f80-49b6-9f52-f34efaedfbec",
-    "created": 1695141759656,
-    "modified": 1695791713755
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a6a1ea1b-787e-4879-80b6-b589f097202c",
-    "element_name": "5MM MALE FLAP",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "5MMMALEFLAP_b9791a15-afee-4d1a-92c5-7d27ba70f14f.ai",
-    "file_size": 1185427,
-    "path": "a6a1ea1b-787e-4879-80b6-b589f097202c",
-    "created": 1695141759656,
-    "modified": 1695791717074
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "abb6a066-f837-44f2-b75a-d67707091b28",
-    "element_name": "FML TOPLOCK",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "FMLTOPLOCK_ec8a3aee-752e-4f43-8556-dfcb46ebeca8.ai",
-    "file_size": 1185225,
-    "path": "abb6a066-f837-44f2-b75a-d67707091b28",
-    "created": 1695799372721,
-    "modified": 1695799423961
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "87bd2fe1-c2e8-4b10-a57b-bb7917735819",
-    "element_name": "Bum Rear Spacer",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BumRearSpacer_7279db75-683f-41cd-930d-da8033947d9b.ai",
-    "file_size": 1179229,
-    "path": "87bd2fe1-c2e8-4b10-a57b-bb7917735819",
-    "created": 1698630639908,
-    "modified": 1698630777926
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f967cc40-c06f-4be2-a01d-cf2cb8a901ba",
-    "element_name": "Female CL",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "85b4bff6-2e65-405a-80b6-6db5882ac197.ai",
-    "file_size": 1211596,
-    "path": "f967cc40-c06f-4be2-a01d-cf2cb8a901ba",
-    "created": 1698204601370,
-    "modified": 1698204601387
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "28df4d96-4c91-4f6c-9f0b-d55c055769ef",
-    "element_name": "Column section Z",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "ColumnsectionZ_18d981df-1407-4f5a-80dc-e316006351e7.ai",
-    "file_size": 1226235,
-    "path": "28df4d96-4c91-4f6c-9f0b-d55c055769ef",
-    "created": 1698710387526,
-    "modified": 1698710560347
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "44cc21dc-0ba7-4102-9ba8-9aeaf9f86afd",
-    "element_name": "8MM DOUBLE F",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "8MMDOUBLEF_9ef3fe5e-59c0-4734-807d-290cd604f03b.ai",
-    "file_size": 178599,
-    "path": "44cc21dc-0ba7-4102-9ba8-9aeaf9f86afd",
-    "created": 1694479471684,
-    "modified": 1698808633965
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "61b771c7-93e7-4401-93c5-2c54e1fb83ab",
-    "element_name": "8mm SINGLE MALE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "8mmSINGLEMALE_51e754db-4b6e-4060-8489-f65f2d614b9d.ai",
-    "file_size": 184184,
-    "path": "61b771c7-93e7-4401-93c5-2c54e1fb83ab",
-    "created": 1698810599419,
-    "modified": 1698811079175
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "91f3dcf8-1300-40c1-9545-92bff99ee78b",
-    "element_name": "C over 100",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Cover100_c735a673-8121-4958-ace7-5dffbdf4b852.ai",
-    "file_size": 1203297,
-    "path": "91f3dcf8-1300-40c1-9545-92bff99ee78b",
-    "created": 1698807435289,
-    "modified": 1698808742835
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7fa4774c-bf68-4eff-b2e1-f54a336ee268",
-    "element_name": "8mm SINGLE F",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "8mmSINGLEF_ae9905a5-e5c2-4ebc-9f88-24cf795832ec.ai",
-    "file_size": 185526,
-    "path": "7fa4774c-bf68-4eff-b2e1-f54a336ee268",
-    "created": 1698810557077,
-    "modified": 1698811095312
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "32c0b65c-360e-4a08-a3e4-2aca82c727f8",
-    "element_name": "C Overlocker 180 200",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "COverlocker180200_25cda7e1-982b-47e2-beff-a0c044ac8bb4.ai",
-    "file_size": 1210133,
-    "path": "32c0b65c-360e-4a08-a3e4-2aca82c727f8",
-    "created": 1698807435289,
-    "modified": 1698811422986
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f03e29b2-d9ef-4766-95ed-428e9491977e",
-    "element_name": "C SINGLE Overlocker 180 200",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "COverlocker180200_25cda7e1-982b-47e2-beff-a0c044ac8bb4.ai",
-    "file_size": 1210133,
-    "path": "f03e29b2-d9ef-4766-95ed-428e9491977e",
-    "created": 1698807435289,
-    "modified": 1698811422986
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7fbf881f-df9f-4e00-b5f5-71648d3f129d",
-    "element_name": "ML TOPLOCKER",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "MLTOPLOCKER_0c6621c3-e854-4a5b-bd4c-6cfb58227b07.ai",
-    "file_size": 182685,
-    "path": "7fbf881f-df9f-4e00-b5f5-71648d3f129d",
-    "created": 1695799901273,
-    "modified": 1698812196514
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d3cb82ce-9d30-4750-97c4-c78774a59d10",
-    "element_name": "C over 75",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Cover75_35089285-bca4-471c-bca9-cb030178c435.ai",
-    "file_size": 1206173,
-    "path": "d3cb82ce-9d30-4750-97c4-c78774a59d10",
-    "created": 1698807435289,
-    "modified": 1698811430961
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1551d03f-6e24-478c-8213-a83a627cafbc",
-    "element_name": "C SINGLE Overlocker 180 200",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "COverlocker180200_25cda7e1-982b-47e2-beff-a0c044ac8bb4.ai",
-    "file_size": 1210133,
-    "path": "1551d03f-6e24-478c-8213-a83a627cafbc",
-    "created": 1698807435289,
-    "modified": 1698811422986
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "83ac21f7-3f3f-4683-a815-d3d9cf1f422e",
-    "element_name": "03 COLUMN FACE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "87caa501-00b4-4ca9-8518-73c1d61d0807.ai",
-    "file_size": 1229233,
-    "path": "83ac21f7-3f3f-4683-a815-d3d9cf1f422e",
-    "created": 1698813008075,
-    "modified": 1698813008102
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "cd60f038-d971-4252-a50d-c2a18e9aabe7",
-    "element_name": "nOSE tRACK LOCKER",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e742e854-894d-45f5-bcce-5a95d3a8f419.ai",
-    "file_size": 1229560,
-    "path": "cd60f038-d971-4252-a50d-c2a18e9aabe7",
-    "created": 1698825360021,
-    "modified": 1698825360046
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "66b1dae8-6c74-489b-ba57-591d5d19a06c",
-    "element_name": "04L FRONT FACE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "3ed1978c-10ca-46fe-a3a4-819f8bc33e80.ai",
-    "file_size": 1227805,
-    "path": "66b1dae8-6c74-489b-ba57-591d5d19a06c",
-    "created": 1698820723822,
-    "modified": 1698820723846
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "63169124-8878-4f6f-98cd-6b15c78df9bb",
-    "element_name": "BLANK 75mm 1:10",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BLANK75mm110_df486482-7de8-4440-bc68-7701a8a19ddc.ai",
-    "file_size": 1205539,
-    "path": "63169124-8878-4f6f-98cd-6b15c78df9bb",
-    "created": 1698807435289,
-    "modified": 1698904190023
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9130fef6-b348-4611-91e1-31fe2b611a5e",
-    "element_name": "BLANK Overlocker 180mm 1:10",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BLANKOverlocker18010percent_1e4f0d64-ce2d-4457-9bbe-08060bad09f9.ai",
-    "file_size": 1199908,
-    "path": "9130fef6-b348-4611-91e1-31fe2b611a5e",
-    "created": 1698807435289,
-    "modified": 1698904479579
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a233da5b-8b52-494e-9a5f-09427c03ae4c",
-    "element_name": "02 ART MECH",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "02ARTMECH_d6767751-5e52-438b-af6d-dc9069a10443.ai",
-    "file_size": 1245249,
-    "path": "a233da5b-8b52-494e-9a5f-09427c03ae4c",
-    "created": 1698817070381,
-    "modified": 1698904492321
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "01973739-4a2b-412e-83b2-e9c2e5a795ef",
-    "element_name": "C SINGLE 100mm 1:10",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "CSINGLE100mm110_4f8550e9-938e-49da-a9b6-b567143badbf.ai",
-    "file_size": 1196551,
-    "path": "01973739-4a2b-412e-83b2-e9c2e5a795ef",
-    "created": 1698807435289,
-    "modified": 1698904594576
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "87f3b91b-7fc8-4fdf-9133-d70c2cde2e31",
-    "element_name": "Tail offset spacer block",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Tailoffsetspacerblock_61a84139-5eb3-49cd-a31c-b64d00cc033d.ai",
-    "file_size": 1225178,
-    "path": "87f3b91b-7fc8-4fdf-9133-d70c2cde2e31",
-    "created": 1699228374118,
-    "modified": 1699229901933
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a2746f8d-851e-4057-a694-9593c2273f8c",
-    "element_name": "Blank Prod Title Cut Reg",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "bb2986b1-8610-476c-ab2d-a6e6deb8e2ba.ai",
-    "file_size": 1302252,
-    "path": "a2746f8d-851e-4057-a694-9593c2273f8c",
-    "created": 1699181532765,
-    "modified": 1699181532802
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e9934785-bc36-4ce1-81f3-65c99f9a8a21",
-    "element_name": "01-02 poplock block",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "01-02poplockblock_0d0520e1-e83c-4fef-ace8-42a395ed85e2.ai",
-    "file_size": 1224433,
-    "path": "e9934785-bc36-4ce1-81f3-65c99f9a8a21",
-    "created": 1698822367563,
-    "modified": 1699331059037
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "6caee83c-d391-433f-a84b-a9c12074c5b5",
-    "element_name": "R2.2 M 8D5",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "R2.2M8D5_cb417903-1e24-4521-8d37-a8f6578d2bd4.ai",
-    "file_size": 224814,
-    "path": "6caee83c-d391-433f-a84b-a9c12074c5b5",
-    "created": 1699416142193,
-    "modified": 1738410101415
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d00bfe79-48cd-4ff3-866c-1496a5c0bd17",
-    "element_name": "R2.1 F 8D5",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "f2a0a4c6-1756-426f-9abe-17ccebc1de5b.ai",
-    "file_size": 203433,
-    "path": "d00bfe79-48cd-4ff3-866c-1496a5c0bd17",
-    "created": 1699416180212,
-    "modified": 1699416180225
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3e251a25-7d63-4183-820d-001a7630f01c",
-    "element_name": "01l art mech",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "01lartmech_39749643-7dc2-493c-a218-e24ef71526b3.ai",
-    "file_size": 1215383,
-    "path": "3e251a25-7d63-4183-820d-001a7630f01c",
-    "created": 1698826316987,
-    "modified": 1699331231029
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "fc0f916a-4450-49a0-8467-810f4d594f86",
-    "element_name": "8MM DOUBLE MALE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "8MMDOUBLEMALE_a34b79a7-1e00-4393-bc2c-b7db3272b66f.ai",
-    "file_size": 183854,
-    "path": "fc0f916a-4450-49a0-8467-810f4d594f86",
-    "created": 1694479517850,
-    "modified": 1699417608365
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "934a4bbf-ea0d-49df-9d67-7038739f5bb9",
-    "element_name": "R2.2 F 8D5",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "4bd007de-3538-40bb-8715-07137ef80bff.ai",
-    "file_size": 203429,
-    "path": "934a4bbf-ea0d-49df-9d67-7038739f5bb9",
-    "created": 1699416353346,
-    "modified": 1699416353358
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0b873044-592b-4b94-83f5-b2e1964c2d96",
-    "element_name": "03L FRONT FACE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "03LFRONTFACE_083d836d-da00-412b-a340-889f0aa0680b.ai",
-    "file_size": 1205885,
-    "path": "0b873044-592b-4b94-83f5-b2e1964c2d96",
-    "created": 1698813143107,
-    "modified": 1699419118274
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "6159660e-893e-4f75-aa5f-cdc63cdd2c12",
-    "element_name": "4L FRONT FACE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "4LFRONTFACE_fb5e4410-6533-4c7d-a8bd-ad9960927706.ai",
-    "file_size": 1234856,
-    "path": "6159660e-893e-4f75-aa5f-cdc63cdd2c12",
-    "created": 1699419054054,
-    "modified": 1699419952052
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "702b5f10-9a68-4b48-a86d-848e6c232c25",
-    "element_name": "5L FRONT FACE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "4LFRONTFACE_fb5e4410-6533-4c7d-a8bd-ad9960927706.ai",
-    "file_size": 1234856,
-    "path": "702b5f10-9a68-4b48-a86d-848e6c232c25",
-    "created": 1699419054054,
-    "modified": 1699419952052
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5b2f1605-3e2d-4ac1-93a1-a1e85fe3541e",
-    "element_name": "8MM D MALE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "cec551a7-2ec6-47de-88d6-319a67c60006.ai",
-    "file_size": 1225342,
-    "path": "5b2f1605-3e2d-4ac1-93a1-a1e85fe3541e",
-    "created": 1699423637780,
-    "modified": 1699423637802
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "8c4e0917-7cb4-4d73-819b-c6d04d7d0318",
-    "element_name": "8mm D-F- to 5mm OUTER",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "8mmD-F-to5mmOUTER_90b3b1f9-597a-4fad-a895-97f1862ce186.ai",
-    "file_size": 182414,
-    "path": "8c4e0917-7cb4-4d73-819b-c6d04d7d0318",
-    "created": 1694479471684,
-    "modified": 1699424018889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "491394bc-60c1-437a-b883-29e1dc8dc755",
-    "element_name": "CutContour",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "491394bc-60c1-437a-b883-29e1dc8dc755",
-    "created": 1695122291221,
-    "modified": 1719794464165
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2e3c0345-72f2-498d-82a6-02f3bc314fdd",
-    "element_name": "06-07 plock",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "06-07plock_f62341e7-dc17-4c1a-9d66-e05c202a77dc.ai",
-    "file_size": 1224772,
-    "path": "2e3c0345-72f2-498d-82a6-02f3bc314fdd",
-    "created": 1698822367563,
-    "modified": 1699430918339
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "054080bf-7190-4612-b75b-2daa654e12ea",
-    "element_name": "8mm Half Cut Bruise profile BETA",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "b8febe37-add9-481e-9fea-063e7bf173ea.ai",
-    "file_size": 372859,
-    "path": "054080bf-7190-4612-b75b-2daa654e12ea",
-    "created": 1699834769245,
-    "modified": 1699834769262
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "da09a297-310c-4e6f-836f-f78f72373317",
-    "element_name": "REAR POP-BLOCK",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "48489563-8695-4d59-895a-fd41fc5a2ad5.ai",
-    "file_size": 1222065,
-    "path": "da09a297-310c-4e6f-836f-f78f72373317",
-    "created": 1699431018234,
-    "modified": 1699431018256
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ed5d853d-4054-4fac-bd9d-0d37474690e4",
-    "element_name": "HULL STRAIGHT 1:10",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "7b7c68b5-69a1-4379-90a8-a9d8e49414fe.ai",
-    "file_size": 1207881,
-    "path": "ed5d853d-4054-4fac-bd9d-0d37474690e4",
-    "created": 1700457525729,
-    "modified": 1700457525756
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "cecee876-0350-42fa-9e4f-02520751094b",
-    "element_name": "Herrignbone laserfold",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Herrignbonelaserfold_5b34530a-7c07-426e-91ae-386cd34914c2.ai",
-    "file_size": 479212,
-    "path": "cecee876-0350-42fa-9e4f-02520751094b",
-    "created": 1699318974731,
-    "modified": 1701141001165
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "fb5c88d8-d1b8-4b1a-b9d8-afb97423cdca",
-    "element_name": "8MM SS DOUBLE MALE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "8MMSSDOUBLEMALE_d65ef8cc-2664-44f5-8d30-bcab23605ce3.ai",
-    "file_size": 184710,
-    "path": "fb5c88d8-d1b8-4b1a-b9d8-afb97423cdca",
-    "created": 1694479517850,
-    "modified": 1701907535413
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c1157350-6836-4478-ba0a-ca44f4364e15",
-    "element_name": "Artwork 193",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork193_87197919-609d-4026-97e9-ad06195d9d1e.ai",
-    "file_size": 1214039,
-    "path": "c1157350-6836-4478-ba0a-ca44f4364e15",
-    "created": 1700717262674,
-    "modified": 1700717392370
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e601db6a-ce9e-49d6-8033-a2bb94aa0620",
-    "element_name": "cuntcunt why are you not a vector",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "c976ba00-43f2-4140-ada5-ef8391f98881.ai",
-    "file_size": 367664,
-    "path": "e601db6a-ce9e-49d6-8033-a2bb94aa0620",
-    "created": 1720519827285,
-    "modified": 1720519827327
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c83eae98-1037-4b26-8954-9de6304c8abe",
-    "element_name": "SpearLocker Male (5mm) 8mm spear T-72B3 Double",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "040ed0dd-aeb3-4ac0-b467-8c9e8daf91d4.ai",
-    "file_size": 1224502,
-    "path": "c83eae98-1037-4b26-8954-9de6304c8abe",
-    "created": 1719700338521,
-    "modified": 1719700338550
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "08d635f8-4313-41a8-9576-434b91f0f438",
-    "element_name": "Artwork 204",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "17682fdc-e88b-470c-9da3-76de07e4eb8f.ai",
-    "file_size": 1221566,
-    "path": "08d635f8-4313-41a8-9576-434b91f0f438",
-    "created": 1719701194185,
-    "modified": 1719701194220
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "61cf270e-4ada-46ee-9a0c-277a69e811a3",
-    "element_name": "Artwork 195",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "ef7bdc6a-f032-467c-bee2-9a156860f099.ai",
-    "file_size": 354753,
-    "path": "61cf270e-4ada-46ee-9a0c-277a69e811a3",
-    "created": 1708985748800,
-    "modified": 1708985748812
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d2c9e377-df93-4fdc-bebf-92d5bbe6c46c",
-    "element_name": "5mm REG WITNESS PRINT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "425c6826-130a-45d9-9130-d141b9bdb8dc.ai",
-    "file_size": 354933,
-    "path": "d2c9e377-df93-4fdc-bebf-92d5bbe6c46c",
-    "created": 1708985859597,
-    "modified": 1708985859607
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f52bf513-4072-4107-90e0-a1cf7bf96d67",
-    "element_name": "Artwork 153",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e1b43a70-11ba-4b67-89b2-f1fa4b14b598.ai",
-    "file_size": 1207542,
-    "path": "f52bf513-4072-4107-90e0-a1cf7bf96d67",
-    "created": 1693358240833,
-    "modified": 1693358240854
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2b5478e9-5a4f-42f5-a9d0-6d48ac7031ef",
-    "element_name": "REGO PRINT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "809cca3f-bb2d-405d-a61e-351ed0fbb984.ai",
-    "file_size": 1208165,
-    "path": "2b5478e9-5a4f-42f5-a9d0-6d48ac7031ef",
-    "created": 1693358197430,
-    "modified": 1693358197469
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4991d89f-c85b-427b-8963-786f60eb4f64",
-    "element_name": "REGO CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e1b43a70-11ba-4b67-89b2-f1fa4b14b598.ai",
-    "file_size": 1207542,
-    "path": "4991d89f-c85b-427b-8963-786f60eb4f64",
-    "created": 1693358240833,
-    "modified": 1693358240854
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "959e5d18-8c26-40b1-88e1-2b4543c5b84c",
-    "element_name": "RT007846",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BLANK_437e9656-802b-4293-84aa-79f2cb7dfe32.ai",
-    "file_size": 335631,
-    "path": "959e5d18-8c26-40b1-88e1-2b4543c5b84c",
-    "created": 1733878697205,
-    "modified": 1734321823889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4fe991d6-90a4-4c47-9f79-aa5c03a74d79",
-    "element_name": "RT007726",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007726_2fba725f-31d0-4306-a727-76dfe43e7471.ai",
-    "file_size": 1207618,
-    "path": "4fe991d6-90a4-4c47-9f79-aa5c03a74d79",
-    "created": 1733878697205,
-    "modified": 1734495050016
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "391fd0c7-86a6-4eb5-9276-dd829d26c9b8",
-    "element_name": "Artwork 397",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "0b239668-0774-40ba-84a6-27321c0f8f75.ai",
-    "file_size": 362003,
-    "path": "391fd0c7-86a6-4eb5-9276-dd829d26c9b8",
-    "created": 1734321698715,
-    "modified": 1734321698737
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "8649be3a-c2a6-4a47-afd7-08be8434af0c",
-    "element_name": "RT007749",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007749_96544c46-cc28-4a8e-a6a1-88e0846a07d9.ai",
-    "file_size": 1197204,
-    "path": "8649be3a-c2a6-4a47-afd7-08be8434af0c",
-    "created": 1733878697205,
-    "modified": 1734495169964
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "74cec3bd-3406-4bcd-8d94-9dd25c691fe9",
-    "element_name": "RT007974",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007974_96a4b005-3272-4d68-807b-7456f1ddd483.ai",
-    "file_size": 1204833,
-    "path": "74cec3bd-3406-4bcd-8d94-9dd25c691fe9",
-    "created": 1733878697205,
-    "modified": 1734495491389
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c404c7b2-1f4e-41d3-815c-1d418116dd1f",
-    "element_name": "RT007950",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "c404c7b2-1f4e-41d3-815c-1d418116dd1f",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e4053f27-d219-4008-b53b-c04b7ff0c198",
-    "element_name": "RT007831",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "e4053f27-d219-4008-b53b-c04b7ff0c198",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "328cd7d3-1e33-4cce-bc18-5a55b7792470",
-    "element_name": "RT007976",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "328cd7d3-1e33-4cce-bc18-5a55b7792470",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c9649234-7d18-42f4-915b-895961c5fef0",
-    "element_name": "RT007975",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "c9649234-7d18-42f4-915b-895961c5fef0",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2b411952-c29f-441c-a4c2-8c4172a67914",
-    "element_name": "RT007973",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007973_ab7576de-cbe6-426b-9802-f8b1dd1af45a.ai",
-    "file_size": 1200437,
-    "path": "2b411952-c29f-441c-a4c2-8c4172a67914",
-    "created": 1733878697205,
-    "modified": 1734496310446
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "26ecfd04-c808-4298-a725-92f53cc2d998",
-    "element_name": "RT007977",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007977_de5144de-33d2-4b55-bc68-09a41b4c23e3.ai",
-    "file_size": 1221230,
-    "path": "26ecfd04-c808-4298-a725-92f53cc2d998",
-    "created": 1733878697205,
-    "modified": 1734496878257
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7008639e-445d-4d0e-8745-5740a0635d7b",
-    "element_name": "RT007988",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007988_d49d20f6-3898-4a95-bf2c-a221726e6e01.ai",
-    "file_size": 380864,
-    "path": "7008639e-445d-4d0e-8745-5740a0635d7b",
-    "created": 1733878697205,
-    "modified": 1736660234863
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9dab3988-a274-4af2-9715-009b51d92bbb",
-    "element_name": "RT007985",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007985_3eacb7eb-a9c6-4997-af5c-7751680c3847.ai",
-    "file_size": 378154,
-    "path": "9dab3988-a274-4af2-9715-009b51d92bbb",
-    "created": 1733878697205,
-    "modified": 1736654014875
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c1039699-501f-4d01-93ad-2507c034b5f4",
-    "element_name": "RT007986",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007986_ee0b238d-322e-40de-acb8-a845425f93d2.ai",
-    "file_size": 374667,
-    "path": "c1039699-501f-4d01-93ad-2507c034b5f4",
-    "created": 1733878697205,
-    "modified": 1736653299036
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2ac753a2-c8e0-401f-9210-7e2418d70d6d",
-    "element_name": "RT007983",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007983_b6ce1be3-dfbd-4f38-9145-9fc2b2edf258.ai",
-    "file_size": 395532,
-    "path": "2ac753a2-c8e0-401f-9210-7e2418d70d6d",
-    "created": 1733878697205,
-    "modified": 1736679069828
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5d056b9f-9556-42b8-9d21-8f3e3ed27594",
-    "element_name": "RT007987",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007987_59b93f29-1222-4ca9-9138-943bc9993e36.ai",
-    "file_size": 380508,
-    "path": "5d056b9f-9556-42b8-9d21-8f3e3ed27594",
-    "created": 1733878697205,
-    "modified": 1736654285402
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "075b68e8-dab5-4a18-b49a-cdb23f29338d",
-    "element_name": "RT007989",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007989_30683342-9ecb-47fb-834e-643af608e19a.ai",
-    "file_size": 1219136,
-    "path": "075b68e8-dab5-4a18-b49a-cdb23f29338d",
-    "created": 1733878697205,
-    "modified": 1736682348398
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a4cd3195-aa14-48f7-a2d3-705f87c2987a",
-    "element_name": "RT007675",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007675_398fae60-51a1-4d54-ae5f-064e91c530c5.ai",
-    "file_size": 1212177,
-    "path": "a4cd3195-aa14-48f7-a2d3-705f87c2987a",
-    "created": 1733878697205,
-    "modified": 1734391622341
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "80be2ca3-80d4-4afb-a2c6-6230d35f5a0d",
-    "element_name": "RT007716",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007716_a72663ad-3729-43a9-a5e0-3ff6e5436b4c.ai",
-    "file_size": 1233555,
-    "path": "80be2ca3-80d4-4afb-a2c6-6230d35f5a0d",
-    "created": 1733878697205,
-    "modified": 1736655572508
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "67595059-9a10-4b5f-8738-066d9789532c",
-    "element_name": "RT007718",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007718_fd5e4fbe-4725-4d76-a250-3b14cf07069d.ai",
-    "file_size": 1203877,
-    "path": "67595059-9a10-4b5f-8738-066d9789532c",
-    "created": 1733878697205,
-    "modified": 1736487443247
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3d49d67b-d941-45e6-9a07-bcb4245eeaab",
-    "element_name": "RT007719",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007719_c237d09a-8364-40ca-b54a-a7d419469d3d.ai",
-    "file_size": 1205503,
-    "path": "3d49d67b-d941-45e6-9a07-bcb4245eeaab",
-    "created": 1733878697205,
-    "modified": 1734392737209
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1752354b-85b7-4ee6-848d-39a839044147",
-    "element_name": "RT007717",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007717_57fa2d69-ec3f-4461-9e24-d69a85312776.ai",
-    "file_size": 1225493,
-    "path": "1752354b-85b7-4ee6-848d-39a839044147",
-    "created": 1733878697205,
-    "modified": 1736476350950
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "af6dc40b-5df5-497c-9b9d-7cf29268f2c9",
-    "element_name": "RT007803",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007803_c149f393-433b-4f84-aef2-8cf83ab90c8a.ai",
-    "file_size": 1203256,
-    "path": "af6dc40b-5df5-497c-9b9d-7cf29268f2c9",
-    "created": 1733878697205,
-    "modified": 1736659028426
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "29510a8f-565a-4991-bddd-345113304d36",
-    "element_name": "RT007720",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007720_3b8ab72d-4833-4af2-931d-00eae6b3d351.ai",
-    "file_size": 1217442,
-    "path": "29510a8f-565a-4991-bddd-345113304d36",
-    "created": 1733878697205,
-    "modified": 1736660528274
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e81385a7-3324-4604-9fb6-87f1b846047e",
-    "element_name": "RT007840",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007840_03112d15-0bbf-4993-8e6e-cbcc3bf3b83f.ai",
-    "file_size": 1206408,
-    "path": "e81385a7-3324-4604-9fb6-87f1b846047e",
-    "created": 1733878697205,
-    "modified": 1736669383269
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3beed89c-85dc-49af-b364-99235af85a4f",
-    "element_name": "RT007837",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007837_dc55fe5b-7b61-43b4-bba8-7447af80e44d.ai",
-    "file_size": 1222017,
-    "path": "3beed89c-85dc-49af-b364-99235af85a4f",
-    "created": 1733878697205,
-    "modified": 1736682352969
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0f0fea08-4fd4-4f8b-8243-781f36f71efd",
-    "element_name": "RT007798",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "0f0fea08-4fd4-4f8b-8243-781f36f71efd",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5d03cf48-f579-4b20-b5d6-86d77e18b647",
-    "element_name": "RT007836",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007836_94864cc0-0df8-4328-9838-fc1836ddf2da.ai",
-    "file_size": 1227446,
-    "path": "5d03cf48-f579-4b20-b5d6-86d77e18b647",
-    "created": 1733878697205,
-    "modified": 1736487313945
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1a57b836-1f2d-4e37-aa49-c9530672c692",
-    "element_name": "RT007713",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007713_e778b54d-0687-4194-a4cf-a6e5b614c1da.ai",
-    "file_size": 379370,
-    "path": "1a57b836-1f2d-4e37-aa49-c9530672c692",
-    "created": 1733878697205,
-    "modified": 1736655604273
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "be5f7b8c-a080-4de4-823f-eddc002d220b",
-    "element_name": "RT007794",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "be5f7b8c-a080-4de4-823f-eddc002d220b",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "895bc4b2-39b5-4b34-9471-6cba14833714",
-    "element_name": "RT007793",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "895bc4b2-39b5-4b34-9471-6cba14833714",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c4189c63-96da-4aae-8fce-d97d79566c7c",
-    "element_name": "RT007721",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "c4189c63-96da-4aae-8fce-d97d79566c7c",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f6042474-b6d4-468d-8bbd-9369c6a2a581",
-    "element_name": "RT007762",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007762_ed3581d8-01ba-410f-b094-fa54c512729a.ai",
-    "file_size": 1197152,
-    "path": "f6042474-b6d4-468d-8bbd-9369c6a2a581",
-    "created": 1733878697205,
-    "modified": 1734497791144
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3dc024f7-88bf-4c3a-8753-646d0a28dd4e",
-    "element_name": "RT007797",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "3dc024f7-88bf-4c3a-8753-646d0a28dd4e",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e2f159b1-ae9f-41ab-b02d-4513e6c2e7b1",
-    "element_name": "RT007795",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "e2f159b1-ae9f-41ab-b02d-4513e6c2e7b1",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f5d6637d-2b83-44d8-8fe2-81a2abbdb452",
-    "element_name": "RT007759",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007759_d8f149f7-351c-4252-a532-afdd23238f21.ai",
-    "file_size": 1224957,
-    "path": "f5d6637d-2b83-44d8-8fe2-81a2abbdb452",
-    "created": 1733878697205,
-    "modified": 1736477864500
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9946deac-9e2b-462a-86a0-4a28d005410f",
-    "element_name": "RT007760",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "9946deac-9e2b-462a-86a0-4a28d005410f",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "cbad9c1c-ef39-4481-8389-4d47998b96f0",
-    "element_name": "RT007805",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "cbad9c1c-ef39-4481-8389-4d47998b96f0",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e8ad13a7-1686-423b-9ebe-665ca17aec31",
-    "element_name": "RT007802",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007802_33510933-c7cf-43d2-bc42-404b97a40ce1.ai",
-    "file_size": 1197955,
-    "path": "e8ad13a7-1686-423b-9ebe-665ca17aec31",
-    "created": 1733878697205,
-    "modified": 1734943142521
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c7896fe6-b210-427f-9d4c-06a4ef4ebb1f",
-    "element_name": "RT007800",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "c7896fe6-b210-427f-9d4c-06a4ef4ebb1f",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "72d11ce1-266e-44b4-8dc5-64d6780f41ca",
-    "element_name": "RT007801",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai",
-    "file_size": 787399,
-    "path": "72d11ce1-266e-44b4-8dc5-64d6780f41ca",
-    "created": 1733878697205,
-    "modified": 1734318904889
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "dc583d1d-4932-4b6c-99bc-9d3ba1cff876",
-    "element_name": "RT007886",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007886_6e31620d-5f20-4cc6-9e10-13eea2d26ba2.ai",
-    "file_size": 357724,
-    "path": "dc583d1d-4932-4b6c-99bc-9d3ba1cff876",
-    "created": 1733878697205,
-    "modified": 1734326836348
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4cef37cd-e17a-4e55-a246-77956daaf221",
-    "element_name": "RT007984",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007984_39e94edb-1584-46f3-8c65-8c3d43464f96.ai",
-    "file_size": 1230127,
-    "path": "4cef37cd-e17a-4e55-a246-77956daaf221",
-    "created": 1733878697205,
-    "modified": 1736654804460
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9fec3325-c8d7-422d-8866-47a6c87689b6",
-    "element_name": "RT007990",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007990_bccc8689-1fe6-4c33-bbdf-e74a9cee1520.ai",
-    "file_size": 1205941,
-    "path": "9fec3325-c8d7-422d-8866-47a6c87689b6",
-    "created": 1733878697205,
-    "modified": 1736680172200
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "77fb00c0-1cf9-4a45-bfc7-782a6777768f",
-    "element_name": "Artwork 398",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "3fdf364f-6a28-40d0-8eed-397cbc514476.ai",
-    "file_size": 213799,
-    "path": "77fb00c0-1cf9-4a45-bfc7-782a6777768f",
-    "created": 1734478110417,
-    "modified": 1734478110436
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "33edc667-968c-40bf-901f-de284e956e2b",
-    "element_name": "Artwork 399",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "c9d7c60f-e3df-4721-9898-132882bf9b92.ai",
-    "file_size": 213813,
-    "path": "33edc667-968c-40bf-901f-de284e956e2b",
-    "created": 1734478811200,
-    "modified": 1734478811216
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9582d5c8-da0b-43d5-9372-1d1b1f62a0ec",
-    "element_name": "RT007991",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007991_367eb8b9-7794-4836-ba14-436efaa3a976.ai",
-    "file_size": 1195885,
-    "path": "9582d5c8-da0b-43d5-9372-1d1b1f62a0ec",
-    "created": 1734479621891,
-    "modified": 1734498051237
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "afc2c656-78b7-47f7-af5e-f810c05231ca",
-    "element_name": "RT007979",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007979_b1ebcd47-6659-4255-bc1a-aa967110b6f6.ai",
-    "file_size": 1213224,
-    "path": "afc2c656-78b7-47f7-af5e-f810c05231ca",
-    "created": 1733878697205,
-    "modified": 1734496172857
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d33ba23f-fd61-4bb9-987c-11bcc0b07633",
-    "element_name": "RT007980",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007980_4d4d3a82-dd58-478e-a74c-396b7f16a632.ai",
-    "file_size": 1210853,
-    "path": "d33ba23f-fd61-4bb9-987c-11bcc0b07633",
-    "created": 1733878697205,
-    "modified": 1734496275395
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "fe255bc2-0af4-4bc3-ae9a-22eef5ac3de3",
-    "element_name": "RT007762",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007762_8977b437-a89c-4d55-9200-265561feef04.ai",
-    "file_size": 1209170,
-    "path": "fe255bc2-0af4-4bc3-ae9a-22eef5ac3de3",
-    "created": 1734497494930,
-    "modified": 1734497558133
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "6259d722-8201-4ebd-ae78-9384a22697fa",
-    "element_name": "RT007710",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007710_2b9307ca-4a2b-488c-a713-433170131511.ai",
-    "file_size": 426690,
-    "path": "6259d722-8201-4ebd-ae78-9384a22697fa",
-    "created": 1734499787611,
-    "modified": 1736652429305
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "8ef0070b-dc03-4c6f-9441-d181df3a73b5",
-    "element_name": "RT007978",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "2e735ade-7d36-47f1-96c4-d6edcc3c9cd5.ai",
-    "file_size": 1235452,
-    "path": "8ef0070b-dc03-4c6f-9441-d181df3a73b5",
-    "created": 1734500003714,
-    "modified": 1734500003749
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "fac0c783-f532-4912-a32a-834702a24903",
-    "element_name": "RT007760 master",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007760master_4d0d3322-5c3a-49e5-8484-25ecb75025ee.ai",
-    "file_size": 215765,
-    "path": "fac0c783-f532-4912-a32a-834702a24903",
-    "created": 1736421312969,
-    "modified": 1736681297884
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a79ddf73-4292-4170-b7e5-0a82b6724117",
-    "element_name": "RT008039 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT008039CUT_3d923578-ef23-4da6-9a86-1024c4a6631f.ai",
-    "file_size": 199726,
-    "path": "a79ddf73-4292-4170-b7e5-0a82b6724117",
-    "created": 1736471002120,
-    "modified": 1736674164734
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ed9f3a11-5b56-4acd-b45a-0588c7a3ed47",
-    "element_name": "AS-90 Side Stitcher MALE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "AS-90SideStitcherMALE_13ad046a-4e89-44fc-b3a8-5b38a39fde71.ai",
-    "file_size": 354820,
-    "path": "ed9f3a11-5b56-4acd-b45a-0588c7a3ed47",
-    "created": 1736482339732,
-    "modified": 1736483163262
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4a0da64c-0817-4cac-b4d1-1ee201d0fa22",
-    "element_name": "AS-90 Side Stitcher FEMALE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "AS-90SideStitcherFEMALE_f43e4da7-9cf8-47f1-a432-6ddfa8f932cc.ai",
-    "file_size": 352838,
-    "path": "4a0da64c-0817-4cac-b4d1-1ee201d0fa22",
-    "created": 1736482392389,
-    "modified": 1736483222776
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7f7f9bca-208d-4ead-b654-b6b45cc88f4a",
-    "element_name": "RT007721",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork400_4d2553b0-f9f7-4049-bedf-eb2355485623.ai",
-    "file_size": 425494,
-    "path": "7f7f9bca-208d-4ead-b654-b6b45cc88f4a",
-    "created": 1736665199353,
-    "modified": 1736665928306
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e22f7ce0-c9ed-44b2-8699-a577b1d852bc",
-    "element_name": "RT007795",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007795_9fc61968-3b65-4ae5-9465-2f332763151e.ai",
-    "file_size": 385774,
-    "path": "e22f7ce0-c9ed-44b2-8699-a577b1d852bc",
-    "created": 1736666141313,
-    "modified": 1736667481443
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "8df413c8-d299-4ff5-9d90-14f733240e78",
-    "element_name": "RT007793",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007793_3d502208-5c94-4ec5-9dbc-2b6fed7b8536.ai",
-    "file_size": 1238958,
-    "path": "8df413c8-d299-4ff5-9d90-14f733240e78",
-    "created": 1736668019978,
-    "modified": 1736668148448
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0243c22c-11dd-4224-9508-40d117afdfd4",
-    "element_name": "RT007794 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007794CUT_14895044-cc4e-4d5d-8ef7-259cb049a42e.ai",
-    "file_size": 1207755,
-    "path": "0243c22c-11dd-4224-9508-40d117afdfd4",
-    "created": 1736671415905,
-    "modified": 1736671817733
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "66ecd1db-51cc-43ac-b3c8-7276790b9f93",
-    "element_name": "RT008040 CUT v2",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "f3a4383e-7f71-4855-b964-efcad7d9f164.ai",
-    "file_size": 1218746,
-    "path": "66ecd1db-51cc-43ac-b3c8-7276790b9f93",
-    "created": 1736674617338,
-    "modified": 1736674617347
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "17b4d964-2e8d-4e7e-8c30-0ead936e6b8d",
-    "element_name": "CT9 F",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "CT9F_8f1d1157-a304-49cc-b0ed-adfffab90013.ai",
-    "file_size": 213137,
-    "path": "17b4d964-2e8d-4e7e-8c30-0ead936e6b8d",
-    "created": 1730173377678,
-    "modified": 1733886000517
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "fab795dc-c8a6-4fcf-8c0e-e8529fd39552",
-    "element_name": "CT9 M",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "CT9M_44b52c11-a6ff-48bd-af19-8a3d762318f7.ai",
-    "file_size": 216751,
-    "path": "fab795dc-c8a6-4fcf-8c0e-e8529fd39552",
-    "created": 1730173533434,
-    "modified": 1733890720898
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "782a4716-1f5d-4ca8-871f-50cffb3939f8",
-    "element_name": "200mm",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "200mm_4dff9dbd-69ba-430b-a6ca-ee4a6d567264.ai",
-    "file_size": 382656,
-    "path": "782a4716-1f5d-4ca8-871f-50cffb3939f8",
-    "created": 1733354438200,
-    "modified": 1733360792773
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "877a3596-90e8-4f2c-835b-3c6a3f8fa63a",
-    "element_name": "200mm slot void",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "200mmslotvoid_12198476-1a75-4bd0-9546-e3024eaddd5d.ai",
-    "file_size": 381114,
-    "path": "877a3596-90e8-4f2c-835b-3c6a3f8fa63a",
-    "created": 1733356095313,
-    "modified": 1733360815274
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c7f64752-3187-467e-bfed-31ad08b87b23",
-    "element_name": "200mm",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "200mm_4dff9dbd-69ba-430b-a6ca-ee4a6d567264.ai",
-    "file_size": 382656,
-    "path": "c7f64752-3187-467e-bfed-31ad08b87b23",
-    "created": 1733354438200,
-    "modified": 1733360792773
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ee854152-4c31-417f-b2b0-58299b9ad4f9",
-    "element_name": "316.5mm",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "316.5mm_61ae4421-8e90-428b-b5a6-cc5e65b8f212.ai",
-    "file_size": 381044,
-    "path": "ee854152-4c31-417f-b2b0-58299b9ad4f9",
-    "created": 1733353660466,
-    "modified": 1733360771206
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f0cb3bc4-9fc9-4624-938a-3bdeacbb809a",
-    "element_name": "316.5mm slot void",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "316.5mmslotvoid_b8fcdf2c-60bc-4546-b9b9-7cd635d09fe5.ai",
-    "file_size": 381155,
-    "path": "f0cb3bc4-9fc9-4624-938a-3bdeacbb809a",
-    "created": 1733360848874,
-    "modified": 1733360848882
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2577b192-1f56-488c-9ca6-d719140e49f5",
-    "element_name": "PT105 130mm cover",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "b5f3fcfb-50b8-451c-91c4-04a2324c7b7b.ai",
-    "file_size": 380878,
-    "path": "2577b192-1f56-488c-9ca6-d719140e49f5",
-    "created": 1733814490016,
-    "modified": 1733814490028
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2ee08b78-9c94-4fcf-a82b-f2d42cf67243",
-    "element_name": "316.5mm slot void",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "316.5mmslotvoid_7cbf25e5-2fb6-4927-ace6-3d57c2b628a0.ai",
-    "file_size": 381134,
-    "path": "2ee08b78-9c94-4fcf-a82b-f2d42cf67243",
-    "created": 1733356463962,
-    "modified": 1733360834818
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0f280b08-2ef4-4474-adb1-cf36f0a3bfc7",
-    "element_name": "SL65 x5 with 5mm cutout",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "c39fc823-2d13-4267-a1ce-a3ea861d2db9.ai",
-    "file_size": 370716,
-    "path": "0f280b08-2ef4-4474-adb1-cf36f0a3bfc7",
-    "created": 1731467638711,
-    "modified": 1731467638748
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0a19ed44-dae1-4bdd-b07e-92d188f41032",
-    "element_name": "SL65 Overlayed",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "SL65Overlayed_a434c1b3-f7e8-4136-8f62-582684acbf1a.ai",
-    "file_size": 358771,
-    "path": "0a19ed44-dae1-4bdd-b07e-92d188f41032",
-    "created": 1731372151218,
-    "modified": 1731540678863
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c8172440-dcfe-4cfb-b4ee-492b8e1548ec",
-    "element_name": "SL65 x5 Overlayed",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "32ed2f51-aa47-4756-818e-dd05a5b460a4.ai",
-    "file_size": 1224732,
-    "path": "c8172440-dcfe-4cfb-b4ee-492b8e1548ec",
-    "created": 1731372241017,
-    "modified": 1731372241074
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "aee30ab2-a404-4503-808b-ba74691d3f80",
-    "element_name": "SL65 x5 Overlayed",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "SL65x5Overlayed_7c8f6f71-7717-45f2-902f-052ebce35209.ai",
-    "file_size": 1229583,
-    "path": "aee30ab2-a404-4503-808b-ba74691d3f80",
-    "created": 1731372241017,
-    "modified": 1731384380907
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "91d03cfe-a180-42a1-ab4c-2558857da21e",
-    "element_name": "SL65 M&F V2 TAB",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "SL65M&FV2TAB_5c1bee5b-ac42-4d3f-90ed-84c89e514b2b.ai",
-    "file_size": 368171,
-    "path": "91d03cfe-a180-42a1-ab4c-2558857da21e",
-    "created": 1732750689890,
-    "modified": 1732753609206
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "26d3358e-457a-467b-863a-387be32a5608",
-    "element_name": "1200mm (6x SL65)",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "1200mm6xSL65_0d401437-a192-4017-8319-2662a8dca7dc.ai",
-    "file_size": 1238326,
-    "path": "26d3358e-457a-467b-863a-387be32a5608",
-    "created": 1732751681878,
-    "modified": 1732753315340
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a78a1c83-834e-4005-8d47-8f0dd82628ec",
-    "element_name": "800mm (4x SL65)",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "800mm4xSL65_f09db47d-0b7d-41b6-954e-3f0f07c53279.ai",
-    "file_size": 1236343,
-    "path": "a78a1c83-834e-4005-8d47-8f0dd82628ec",
-    "created": 1732751726745,
-    "modified": 1732753551921
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "50fbc21e-4b42-4e7b-a045-b38135fae2f9",
-    "element_name": "1000mm (5x SL65)",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "1000mm5xSL65_9eb19bfd-23de-44bb-aa2c-0acdfb28f696.ai",
-    "file_size": 1237167,
-    "path": "50fbc21e-4b42-4e7b-a045-b38135fae2f9",
-    "created": 1732751360965,
-    "modified": 1732753640379
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "97a4de26-b841-414d-b3ea-d000d4cf1652",
-    "element_name": "840mm",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "840mm_faab7132-74a9-4af9-83ef-0932d9670a54.ai",
-    "file_size": 1237777,
-    "path": "97a4de26-b841-414d-b3ea-d000d4cf1652",
-    "created": 1733194725548,
-    "modified": 1733194883598
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "86fefff2-aee3-41ea-a4a2-3fc636ed70be",
-    "element_name": "835mm",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork396_8ff7fc67-3865-43d8-9ec1-8654fc0e5161.ai",
-    "file_size": 1238445,
-    "path": "86fefff2-aee3-41ea-a4a2-3fc636ed70be",
-    "created": 1733194166868,
-    "modified": 1733194564230
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5ba45d8a-ffbc-4dd4-b1e8-0fc54115b693",
-    "element_name": "130mm M",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork396_9960cd8d-3945-4bdf-beac-6a523217e1c3.ai",
-    "file_size": 381750,
-    "path": "5ba45d8a-ffbc-4dd4-b1e8-0fc54115b693",
-    "created": 1733356879009,
-    "modified": 1733357057943
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "557b60d3-ded7-44a9-9daf-0a155d8809c9",
-    "element_name": "200mm M",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "200mmM_93f936ac-a58d-4020-8f39-e4a1c99b52e8.ai",
-    "file_size": 350589,
-    "path": "557b60d3-ded7-44a9-9daf-0a155d8809c9",
-    "created": 1733285390236,
-    "modified": 1733286013355
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "31a561ba-25a6-4b5d-9145-cf3766abfe09",
-    "element_name": "200mm F",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "200mmF_927cb3a5-4e32-4e24-b389-8a910561f896.ai",
-    "file_size": 350922,
-    "path": "31a561ba-25a6-4b5d-9145-cf3766abfe09",
-    "created": 1733285421429,
-    "modified": 1733286959853
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b28aca25-acce-4d02-9d19-8ca646a3e925",
-    "element_name": "130mm F",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "130mmF_1f41cded-0094-4d02-a36a-d6c35bd4153a.ai",
-    "file_size": 381309,
-    "path": "b28aca25-acce-4d02-9d19-8ca646a3e925",
-    "created": 1733357150744,
-    "modified": 1733357243338
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "57db3260-99cb-4218-bf1d-3237d1757345",
-    "element_name": "200mm F CLEARANCE HALF CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "200mmFbhalfcuts_1b0f1675-08ee-4461-af28-5a31f63cfbbb.ai",
-    "file_size": 350966,
-    "path": "57db3260-99cb-4218-bf1d-3237d1757345",
-    "created": 1733285421429,
-    "modified": 1733792353395
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e4bb8607-cb9e-4ffc-917d-4543998b2e98",
-    "element_name": "200mm M LESS CUTS",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "200mmM_f475f04f-e3ee-4943-9ca7-ecbd802fc3a9.ai",
-    "file_size": 352033,
-    "path": "e4bb8607-cb9e-4ffc-917d-4543998b2e98",
-    "created": 1733285390236,
-    "modified": 1733792354831
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e70a8185-c688-43b6-9b40-e8d255067bb5",
-    "element_name": "SL65 F V2 tab Single CLOSED",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "SL65FV2tabSingleCLOSED_94615ba6-c29d-4d8e-8944-4cc9327ac332.ai",
-    "file_size": 340692,
-    "path": "e70a8185-c688-43b6-9b40-e8d255067bb5",
-    "created": 1731372151218,
-    "modified": 1734312126795
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c759c0d1-90a5-4116-8ef2-556761993527",
-    "element_name": "SL65 M V2 tab SINGLE CLOSED",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "SL65MV2tabSINGLECLOSED_0466a9d7-8467-4954-af2a-67c572bcf458.ai",
-    "file_size": 338761,
-    "path": "c759c0d1-90a5-4116-8ef2-556761993527",
-    "created": 1731372151218,
-    "modified": 1734311865155
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "35bde82f-5cc9-4c5d-b564-d95e942d4150",
-    "element_name": "SL65 FEMALE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "7939e3b2-8b3b-4cfc-aee3-0079f1cfa0f6.ai",
-    "file_size": 354715,
-    "path": "35bde82f-5cc9-4c5d-b564-d95e942d4150",
-    "created": 1730092398609,
-    "modified": 1730092398625
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "acf685e7-7af7-4edd-acef-ddf4243bdbc7",
-    "element_name": "SL65 MALE ENDCAP",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "b977f3f0-09a7-410c-b754-3735d6f4aa66.ai",
-    "file_size": 368640,
-    "path": "acf685e7-7af7-4edd-acef-ddf4243bdbc7",
-    "created": 1732163478157,
-    "modified": 1732163478179
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "20a8f133-d004-4e48-8fa4-a20f92f27250",
-    "element_name": "SL65 Male V1",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "8347b0ce-1264-46e5-aac0-a980b1165bc0.ai",
-    "file_size": 355471,
-    "path": "20a8f133-d004-4e48-8fa4-a20f92f27250",
-    "created": 1730092341122,
-    "modified": 1730092341139
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5227a20f-e0dc-4ad7-9953-6fc09d23e1d3",
-    "element_name": "Ziptie Fold Tab",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e6b4f1b6-f368-40ad-b825-18447c04f169.ai",
-    "file_size": 369603,
-    "path": "5227a20f-e0dc-4ad7-9953-6fc09d23e1d3",
-    "created": 1732073184517,
-    "modified": 1732073184553
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ee3cb91d-ab71-4a07-ad85-478387567a98",
-    "element_name": "2x sheet 75mm single side",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "1c127bb9-32e8-4c6a-9a8e-cef1d8c7a45b.ai",
-    "file_size": 357138,
-    "path": "ee3cb91d-ab71-4a07-ad85-478387567a98",
-    "created": 1720576418798,
-    "modified": 1720576418809
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "14fcccb5-5376-4d5f-a22f-95437783f34c",
-    "element_name": "Cut and fold indicator",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "fe5e021a-4f21-451e-bbc4-a099c6ccba76.ai",
-    "file_size": 354716,
-    "path": "14fcccb5-5376-4d5f-a22f-95437783f34c",
-    "created": 1721173659584,
-    "modified": 1721173659621
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "158d2867-ab28-4913-881c-c1ee6a4ab6fa",
-    "element_name": "Fold indicator",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "b4f0831c-6b43-4f61-b8db-33e40e61c07e.ai",
-    "file_size": 354592,
-    "path": "158d2867-ab28-4913-881c-c1ee6a4ab6fa",
-    "created": 1721008293459,
-    "modified": 1721008293494
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ac95803b-8777-42f1-95b5-29dbb6ae59eb",
-    "element_name": "Artwork 224",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "5572d48c-4685-4d7d-8353-8ef5854d2b7c.ai",
-    "file_size": 1222231,
-    "path": "ac95803b-8777-42f1-95b5-29dbb6ae59eb",
-    "created": 1725257825930,
-    "modified": 1725257825986
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "59c15446-732f-4e27-b310-e2af70344645",
-    "element_name": "Artwork 226",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "38186c33-ffcb-45fa-b9df-e65c61c888fb.ai",
-    "file_size": 371519,
-    "path": "59c15446-732f-4e27-b310-e2af70344645",
-    "created": 1725321002461,
-    "modified": 1725321002482
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0ee86d29-3b65-4667-89d0-31f964501d18",
-    "element_name": "Ziptie slot",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "0a3c8815-263e-480d-9f6e-b41779f71c99.ai",
-    "file_size": 1208576,
-    "path": "0ee86d29-3b65-4667-89d0-31f964501d18",
-    "created": 1724892294732,
-    "modified": 1724892294772
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "fe4e15f6-06f6-4b89-819d-ecee6c08a9c3",
-    "element_name": "Artwork 225",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "d57a1fa6-f932-414d-b1b5-0c41faed3e5a.ai",
-    "file_size": 1221900,
-    "path": "fe4e15f6-06f6-4b89-819d-ecee6c08a9c3",
-    "created": 1725257825934,
-    "modified": 1725257825988
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7080b0c4-fe86-4347-a587-5718455da893",
-    "element_name": "Left End",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "c7284a4a-68fa-4b2d-a2da-bea7d444c2f7.ai",
-    "file_size": 382677,
-    "path": "7080b0c4-fe86-4347-a587-5718455da893",
-    "created": 1725412806490,
-    "modified": 1725412806513
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "bd783e4a-dae7-4b31-af8c-2c4b4ef53451",
-    "element_name": "Artwork 237",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "449a9c47-13ea-40d9-a936-82427d84da5d.ai",
-    "file_size": 204760,
-    "path": "bd783e4a-dae7-4b31-af8c-2c4b4ef53451",
-    "created": 1726622299571,
-    "modified": 1726622299581
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "809f4f45-2930-48e1-adcd-de5b6177a6e9",
-    "element_name": "SPLINE",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "SPLINE_f429c091-485d-46b5-9b6c-b6dd13462e62.ai",
-    "file_size": 364815,
-    "path": "809f4f45-2930-48e1-adcd-de5b6177a6e9",
-    "created": 1726622845486,
-    "modified": 1726623513154
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "cd95dce9-24fd-4f41-ab78-5e4c2537db98",
-    "element_name": "Half Cut Contour",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "cd95dce9-24fd-4f41-ab78-5e4c2537db98",
-    "created": 1695784277732,
-    "modified": 1695784277734
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f1d9ebfc-f441-4940-9e56-9afea5097e9c",
-    "element_name": "REAR V-Cut 45 ",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "f1d9ebfc-f441-4940-9e56-9afea5097e9c",
-    "created": 1732147997051,
-    "modified": 1732147997052
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2be8b778-0f41-42c2-bd2d-3f2714f1065d",
-    "element_name": "Turret LHS BMP-2",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9223976d-1f8a-4cdf-96a6-8ac120af4df7.ai",
-    "file_size": 402162,
-    "path": "2be8b778-0f41-42c2-bd2d-3f2714f1065d",
-    "created": 1732079279479,
-    "modified": 1732079279507
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "121b5020-8349-43a2-ae49-c7b109f1464c",
-    "element_name": "Turret RHS BMP-2",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "29f6e485-8441-4b6d-810d-ac86c7274a1f.ai",
-    "file_size": 402688,
-    "path": "121b5020-8349-43a2-ae49-c7b109f1464c",
-    "created": 1732079340938,
-    "modified": 1732079340966
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d295308d-3773-4e1b-98e1-7f74fc36212c",
-    "element_name": "BMP-2 Track Bottom Cut",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BMP-2TrackBottomCut_a0612524-8e51-436b-b707-7133251dcd36.ai",
-    "file_size": 343102,
-    "path": "d295308d-3773-4e1b-98e1-7f74fc36212c",
-    "created": 1731979050406,
-    "modified": 1732149074400
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c1a572ca-46ed-4203-927d-2c9fa5cd2e32",
-    "element_name": "BMP-2 DECOY 2LEFT CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9eae6b37-fb2b-450e-b5ba-35c409b73779.ai",
-    "file_size": 401250,
-    "path": "c1a572ca-46ed-4203-927d-2c9fa5cd2e32",
-    "created": 1732086250168,
-    "modified": 1732086250186
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d7a60fe4-3ac7-4bcc-bca0-e8dea0c0ff8e",
-    "element_name": "RT007972 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007972CUT_191d1ca9-f13e-4ee3-8e2f-2fb96ae8147f.ai",
-    "file_size": 196311,
-    "path": "d7a60fe4-3ac7-4bcc-bca0-e8dea0c0ff8e",
-    "created": 1736803724110,
-    "modified": 1736803919053
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "8eb104ef-11f0-4e08-9917-2304f384571e",
-    "element_name": "Ful Print reg RT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "62b9cd08-d847-4055-ad50-c082e6b89f57.ai",
-    "file_size": 383156,
-    "path": "8eb104ef-11f0-4e08-9917-2304f384571e",
-    "created": 1736806511609,
-    "modified": 1736806511633
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "bfec1d7a-c6b2-4822-92c1-c3d7678efeb9",
-    "element_name": "RT007908",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007908_4b57b37d-760d-4268-9dbe-b3dbe0d4923e.ai",
-    "file_size": 1280667,
-    "path": "bfec1d7a-c6b2-4822-92c1-c3d7678efeb9",
-    "created": 1736896754293,
-    "modified": 1742179683842
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "32ecba68-de40-4d8b-a214-94e4b7447ceb",
-    "element_name": "RT007906",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007906_fbc6bb4d-43da-45b9-bab0-1b8f09b9513a.ai",
-    "file_size": 1268460,
-    "path": "32ecba68-de40-4d8b-a214-94e4b7447ceb",
-    "created": 1736896754293,
-    "modified": 1742179758993
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c0892cf8-5683-4d7e-9fc7-4b68ad3b57cc",
-    "element_name": "RT007910",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007910_52e98513-ad90-456f-bc67-da5a3718fc43.ai",
-    "file_size": 1270917,
-    "path": "c0892cf8-5683-4d7e-9fc7-4b68ad3b57cc",
-    "created": 1736896754293,
-    "modified": 1742179651658
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b891a5ac-c044-4417-b641-045927ed806e",
-    "element_name": "RT007909",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007909_bc6dbfd6-8931-4c07-89bf-6c820a199b92.ai",
-    "file_size": 1255946,
-    "path": "b891a5ac-c044-4417-b641-045927ed806e",
-    "created": 1736896754293,
-    "modified": 1742179719809
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9954f012-d603-4dc8-9021-5d377ef89e52",
-    "element_name": "RT007888",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007888_1761e97f-bef0-48bc-bbf1-ef0038c42819.ai",
-    "file_size": 1310130,
-    "path": "9954f012-d603-4dc8-9021-5d377ef89e52",
-    "created": 1736896754293,
-    "modified": 1738717349674
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f87c172e-b249-48b0-b53a-90b382b5a91a",
-    "element_name": "RT007889",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007889_d97fa24e-fcee-411e-b774-29d6e1dfaca1.ai",
-    "file_size": 1303733,
-    "path": "f87c172e-b249-48b0-b53a-90b382b5a91a",
-    "created": 1736896754293,
-    "modified": 1740361430514
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "142ea31e-fbdb-435c-843d-30da6a659e63",
-    "element_name": "RT007890",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007890_b10efea7-655c-47a4-983c-8f4914f62b0d.ai",
-    "file_size": 1300620,
-    "path": "142ea31e-fbdb-435c-843d-30da6a659e63",
-    "created": 1736896754293,
-    "modified": 1740357683546
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7f9f4c9b-690a-4c46-bebf-ed910539b0d8",
-    "element_name": "RT007891",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007891_4655722b-b629-4613-b90c-a63751d04c45.ai",
-    "file_size": 1271337,
-    "path": "7f9f4c9b-690a-4c46-bebf-ed910539b0d8",
-    "created": 1736896754293,
-    "modified": 1738120294826
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "fe5197a5-7051-4ea4-b6aa-45d1de2897b8",
-    "element_name": "RT007892",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007892_1df79ce5-4cd0-42c0-8870-d501608cb6c1.ai",
-    "file_size": 1266180,
-    "path": "fe5197a5-7051-4ea4-b6aa-45d1de2897b8",
-    "created": 1736896754293,
-    "modified": 1738717199204
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "98590095-754f-4270-9477-9bb26bbb5a2c",
-    "element_name": "RT007893",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007893_9f5cf227-f66b-4336-91a7-03085fd06425.ai",
-    "file_size": 1278852,
-    "path": "98590095-754f-4270-9477-9bb26bbb5a2c",
-    "created": 1736896754293,
-    "modified": 1738717227457
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "31cf5cfe-9ff2-4ab9-8a19-c4f67c8f6515",
-    "element_name": "RT007894",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007894_7f563e72-11cc-456e-bc22-b21a197863c3.ai",
-    "file_size": 1271316,
-    "path": "31cf5cfe-9ff2-4ab9-8a19-c4f67c8f6515",
-    "created": 1736896754293,
-    "modified": 1738717255497
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "511e4d38-58a5-44e5-a08b-a066d1a37af2",
-    "element_name": "RT007895",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007895_ab74591f-29e4-4919-9c40-9f47f00b21b7.ai",
-    "file_size": 1269550,
-    "path": "511e4d38-58a5-44e5-a08b-a066d1a37af2",
-    "created": 1736896754293,
-    "modified": 1738717175071
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "578eb882-c6bd-4302-97a3-bd870896eb18",
-    "element_name": "RT007896",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007896_7e7f5128-4ae6-4c1e-89b1-590a32ced4b4.ai",
-    "file_size": 1273369,
-    "path": "578eb882-c6bd-4302-97a3-bd870896eb18",
-    "created": 1736896754293,
-    "modified": 1738717114377
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3820dbdc-0ec5-4dff-9b58-7a90f8da1a89",
-    "element_name": "RT007915",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007915_eaf805a4-4e22-415f-a77a-f6923898646d.ai",
-    "file_size": 1214203,
-    "path": "3820dbdc-0ec5-4dff-9b58-7a90f8da1a89",
-    "created": 1736896754293,
-    "modified": 1738719667491
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a85b7a73-b256-41f6-9208-60fab5732709",
-    "element_name": "RT007868",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007868_922c2423-7c15-47b5-938a-59f7afade6f7.ai",
-    "file_size": 1308146,
-    "path": "a85b7a73-b256-41f6-9208-60fab5732709",
-    "created": 1736896754293,
-    "modified": 1738718713209
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "bd988f1d-420d-4833-a48b-d9002e1ba12a",
-    "element_name": "RT007871",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007871_c30068f4-a8f2-4fd1-8e00-0a1289f383e7.ai",
-    "file_size": 1355454,
-    "path": "bd988f1d-420d-4833-a48b-d9002e1ba12a",
-    "created": 1736896754293,
-    "modified": 1742186305525
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b5badb11-d636-44b0-962e-5d3ca1c1fb52",
-    "element_name": "RT007873",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007873_47332bf1-5ee6-4a79-afa2-644be0e77988.ai",
-    "file_size": 1305729,
-    "path": "b5badb11-d636-44b0-962e-5d3ca1c1fb52",
-    "created": 1736896754293,
-    "modified": 1742186269684
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b2eaff9b-f6fc-4a79-bb99-2e951234d4d7",
-    "element_name": "RT007881",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007881_76e3fc92-5e2c-4a84-90d4-5a00af7b4afb.ai",
-    "file_size": 1275252,
-    "path": "b2eaff9b-f6fc-4a79-bb99-2e951234d4d7",
-    "created": 1736896754293,
-    "modified": 1742253325546
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3be6d1ec-657d-490a-bec3-6507f217a482",
-    "element_name": "RT007883",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007883_1ee19bfa-0e80-411d-aa55-3acfca880b0c.ai",
-    "file_size": 1276682,
-    "path": "3be6d1ec-657d-490a-bec3-6507f217a482",
-    "created": 1736896754293,
-    "modified": 1738718463207
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "707d3e20-cd8e-45e8-a068-ddba57bcfa91",
-    "element_name": "RT007877",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007877_7902f8d4-e0cb-4372-9271-7c859d17ae31.ai",
-    "file_size": 1259686,
-    "path": "707d3e20-cd8e-45e8-a068-ddba57bcfa91",
-    "created": 1736896754293,
-    "modified": 1742253370895
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "60f750fa-2a32-4f54-ba29-ebdc6750d308",
-    "element_name": "RT007867",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007867_c516d0d7-ccbf-48ae-919f-f4c24dbc1c2e.ai",
-    "file_size": 1213152,
-    "path": "60f750fa-2a32-4f54-ba29-ebdc6750d308",
-    "created": 1736896754293,
-    "modified": 1738719651334
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3979e4d7-51c2-4983-a710-08581add033a",
-    "element_name": "RT007878",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007878_e80921f2-1de8-4da1-975e-54a1c30f8350.ai",
-    "file_size": 1274293,
-    "path": "3979e4d7-51c2-4983-a710-08581add033a",
-    "created": 1736896754293,
-    "modified": 1742253359608
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "35086207-2e9c-4acb-9eec-87065229a3f0",
-    "element_name": "RT007879",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007879_12d54ff3-e7df-43e5-a710-5e582da5d127.ai",
-    "file_size": 1292486,
-    "path": "35086207-2e9c-4acb-9eec-87065229a3f0",
-    "created": 1736896754293,
-    "modified": 1742253348645
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2b3ff55a-e6b8-4d86-a379-59fdcf426fc5",
-    "element_name": "RT007880",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007880_5408c89a-2ee3-4ecb-9c70-e4b13e7e2ff6.ai",
-    "file_size": 1319858,
-    "path": "2b3ff55a-e6b8-4d86-a379-59fdcf426fc5",
-    "created": 1736896754293,
-    "modified": 1742253336518
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e13d0d04-0dfc-4d54-953b-8c4999e5bf07",
-    "element_name": "RT007869",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007869_3d9156c9-1dc3-47e0-b37d-7ef083e66ea7.ai",
-    "file_size": 1226226,
-    "path": "e13d0d04-0dfc-4d54-953b-8c4999e5bf07",
-    "created": 1736896754293,
-    "modified": 1738719632281
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "64699471-ab56-4edb-811a-47f81363aa47",
-    "element_name": "RT007870",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007870_a86d89d0-1702-4648-9d08-f56481370ce3.ai",
-    "file_size": 1253613,
-    "path": "64699471-ab56-4edb-811a-47f81363aa47",
-    "created": 1736896754293,
-    "modified": 1742176489796
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "6b8fce08-6860-495b-8003-ef2dbd6d9996",
-    "element_name": "RT007872",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007872_aa5c7830-a4e2-4dbc-b9d8-e04d7f121805.ai",
-    "file_size": 1335290,
-    "path": "6b8fce08-6860-495b-8003-ef2dbd6d9996",
-    "created": 1736896754293,
-    "modified": 1742176523053
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "53c518a5-5c31-4957-b644-848281f8d4de",
-    "element_name": "RT007875",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007875_92b23d37-454e-441b-bea7-7acd6b7d8a0f.ai",
-    "file_size": 1263164,
-    "path": "53c518a5-5c31-4957-b644-848281f8d4de",
-    "created": 1736896754293,
-    "modified": 1742252968332
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "80032c29-6dbc-4d70-aa57-532ebe071038",
-    "element_name": "RT007882",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007882_505474c0-2978-4d7e-82f9-2911eee874ee.ai",
-    "file_size": 1266184,
-    "path": "80032c29-6dbc-4d70-aa57-532ebe071038",
-    "created": 1736896754293,
-    "modified": 1742252978958
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1aa6ef50-e1db-49d9-917e-a27fdd241c06",
-    "element_name": "RT007884",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007884_14102d60-e61c-439b-bf2b-32311e1f69fb.ai",
-    "file_size": 1279217,
-    "path": "1aa6ef50-e1db-49d9-917e-a27fdd241c06",
-    "created": 1736896754293,
-    "modified": 1742252958771
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1be1bfa7-9e60-4968-850d-670c286bb100",
-    "element_name": "RT007885",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007885_9f74397e-e362-4cc4-a5d1-06276e984f48.ai",
-    "file_size": 1293899,
-    "path": "1be1bfa7-9e60-4968-850d-670c286bb100",
-    "created": 1736896754293,
-    "modified": 1743026369272
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "90a492cc-c55e-4eff-b42c-6d3071633ece",
-    "element_name": "RT007886",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007886_c49e5aee-644a-42da-8313-4d12f2cec0ee.ai",
-    "file_size": 1256122,
-    "path": "90a492cc-c55e-4eff-b42c-6d3071633ece",
-    "created": 1736896754293,
-    "modified": 1742964921349
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "93d3e660-e31c-43a6-a566-c587ddbb122f",
-    "element_name": "RT007911",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007911_f13efc2f-520b-4e30-ad6b-4109d19ed66b.ai",
-    "file_size": 1199669,
-    "path": "93d3e660-e31c-43a6-a566-c587ddbb122f",
-    "created": 1736896754293,
-    "modified": 1741055440226
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a581e877-57db-4f14-8715-52e8597af45c",
-    "element_name": "RT007666",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007666_3e83638a-13d8-4a12-921c-84b1874fac27.ai",
-    "file_size": 1194727,
-    "path": "a581e877-57db-4f14-8715-52e8597af45c",
-    "created": 1736896754293,
-    "modified": 1736898614890
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "513accae-62be-4c8b-93f5-a2c24dcbdccb",
-    "element_name": "RT0007916",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT0007916_8911083e-5d96-42aa-ab06-be995299e22c.ai",
-    "file_size": 1194783,
-    "path": "513accae-62be-4c8b-93f5-a2c24dcbdccb",
-    "created": 1736896754293,
-    "modified": 1736898638957
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "dacfe722-5ae3-4160-b508-36c82fce7bb5",
-    "element_name": "RT007887",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007887_0a5c563d-cddd-43de-a3d6-eb4b0d97af26.ai",
-    "file_size": 1240239,
-    "path": "dacfe722-5ae3-4160-b508-36c82fce7bb5",
-    "created": 1736896754293,
-    "modified": 1738719491778
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "cc7e663a-b1f2-443e-b09e-ec35e06ca462",
-    "element_name": "RT007846",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT007846_48baef74-6e1a-4ed9-9d00-a14ee804763d.ai",
-    "file_size": 1203272,
-    "path": "cc7e663a-b1f2-443e-b09e-ec35e06ca462",
-    "created": 1736896754293,
-    "modified": 1742180493488
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1f1b6cb0-984d-48bf-9e1a-c1d13bd0b837",
-    "element_name": "Rectangle Pair",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RectanglePair_7141187f-afc9-4b97-add2-1b7f70b0ea42.ai",
-    "file_size": 1187051,
-    "path": "1f1b6cb0-984d-48bf-9e1a-c1d13bd0b837",
-    "created": 1736901868386,
-    "modified": 1736902247091
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "964ab222-0088-4c04-ae65-9b10e51c98ee",
-    "element_name": "RT008080 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "4c468b07-ab12-4dac-93dd-fdb8a34f3978.ai",
-    "file_size": 233309,
-    "path": "964ab222-0088-4c04-ae65-9b10e51c98ee",
-    "created": 1736944546264,
-    "modified": 1736944546284
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "43006912-675c-41f7-816a-da003b90c35f",
-    "element_name": "RT008082",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "2338ad1d-6d27-4130-b45c-5ff9545f531a.ai",
-    "file_size": 238755,
-    "path": "43006912-675c-41f7-816a-da003b90c35f",
-    "created": 1736944585363,
-    "modified": 1736944585382
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2ec07b8b-4348-4a31-abd0-78d57d5a80ee",
-    "element_name": "RT007972 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork400_e3583dc4-66dd-464f-a90c-553c9d41daad.ai",
-    "file_size": 219097,
-    "path": "2ec07b8b-4348-4a31-abd0-78d57d5a80ee",
-    "created": 1737201541944,
-    "modified": 1737201693284
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "02f8b557-05e0-4602-88ba-efc16f20b88c",
-    "element_name": "Ziptie clusters",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "7911d23d-4c4e-4cb7-b8be-393769b239ce.ai",
-    "file_size": 366922,
-    "path": "02f8b557-05e0-4602-88ba-efc16f20b88c",
-    "created": 1737512390625,
-    "modified": 1737512390643
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4062159f-6839-4aeb-87bb-dc7a65db59ba",
-    "element_name": "RAIDER DRAB OLIVE (Digital)",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "4062159f-6839-4aeb-87bb-dc7a65db59ba",
-    "created": 1737522535950,
-    "modified": 1737522535951
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b181c1f5-ed93-48d1-8318-d5b2733fc374",
-    "element_name": "Ziptie - 2 parts (1 & 4)",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "24c521f0-350e-40a3-97e3-76abbfa82668.ai",
-    "file_size": 1208400,
-    "path": "b181c1f5-ed93-48d1-8318-d5b2733fc374",
-    "created": 1737523917451,
-    "modified": 1737523917467
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b8d782da-b368-44eb-a3d3-c42cd6fafdb7",
-    "element_name": "Ziptie - 2 parts (2 & 3)",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "1056dd09-26b3-4bbd-801e-557edfd290c3.ai",
-    "file_size": 1208360,
-    "path": "b8d782da-b368-44eb-a3d3-c42cd6fafdb7",
-    "created": 1737523999546,
-    "modified": 1737523999565
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "599cd3d4-dc37-4b17-81f8-7a72f4ef7616",
-    "element_name": "ZIiptie - 4 parts (1 & 8)",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "4d28dbdf-8db8-4bd9-ac46-23467077cab7.ai",
-    "file_size": 1208460,
-    "path": "599cd3d4-dc37-4b17-81f8-7a72f4ef7616",
-    "created": 1737524014866,
-    "modified": 1737524014885
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2338e030-cc59-4c4e-9ce8-d8c8ec77418f",
-    "element_name": "ZIiptie - 4 parts (2 & 7)",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "883a40df-0b26-49e2-a3dd-8d46c047a9a1.ai",
-    "file_size": 1208446,
-    "path": "2338e030-cc59-4c4e-9ce8-d8c8ec77418f",
-    "created": 1737524051248,
-    "modified": 1737524051267
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "8239451e-469c-4261-8807-edb9e3d146ff",
-    "element_name": "ZIiptie - 4 parts (3 & 6)",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "1cebe4b7-2409-4d2a-9c1d-a97c35803cdb.ai",
-    "file_size": 1208444,
-    "path": "8239451e-469c-4261-8807-edb9e3d146ff",
-    "created": 1737524064821,
-    "modified": 1737524064839
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "87c85099-aece-4c8a-a903-ff6a06b9b43d",
-    "element_name": "ZIiptie - 4 parts (4 & 5)",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9d8200a4-dd79-433a-9a82-4d562d0bacc2.ai",
-    "file_size": 1208458,
-    "path": "87c85099-aece-4c8a-a903-ff6a06b9b43d",
-    "created": 1737524083356,
-    "modified": 1737524083375
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "226ef43f-2f2b-4944-8e5c-587b408249c0",
-    "element_name": "ZIiptie - 3 parts (1 & 6)",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "d8d0ef52-cc79-48fa-99db-2a67278d9797.ai",
-    "file_size": 1208425,
-    "path": "226ef43f-2f2b-4944-8e5c-587b408249c0",
-    "created": 1737524463837,
-    "modified": 1737524463872
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d322e35c-be1e-4fed-b58c-1b56d954acd9",
-    "element_name": "ZIiptie - 3 parts (2 & 5)",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "777eddd6-5ef7-41e0-8b59-2545cebb8b13.ai",
-    "file_size": 1208418,
-    "path": "d322e35c-be1e-4fed-b58c-1b56d954acd9",
-    "created": 1737524524685,
-    "modified": 1737524524703
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9b1d9a43-93ec-4ffa-a365-79ff322c4746",
-    "element_name": "ZIiptie - 3 parts (3 & 4)",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "fb686045-ec88-4369-a747-678fc5b871b4.ai",
-    "file_size": 1208409,
-    "path": "9b1d9a43-93ec-4ffa-a365-79ff322c4746",
-    "created": 1737524541895,
-    "modified": 1737524541914
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0e541a8f-52b0-422a-9948-820e744680a9",
-    "element_name": "Artwork 408",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "66fec3b5-a112-4157-8a60-5d24732b6d90.ai",
-    "file_size": 1208971,
-    "path": "0e541a8f-52b0-422a-9948-820e744680a9",
-    "created": 1737524767631,
-    "modified": 1737524767647
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3d1128a8-ad57-40aa-83c7-4494b53cc955",
-    "element_name": "Artwork 407",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "7aa1506c-2b2d-47b5-9642-00aaa52bff4a.ai",
-    "file_size": 1207284,
-    "path": "3d1128a8-ad57-40aa-83c7-4494b53cc955",
-    "created": 1737524795815,
-    "modified": 1737524795849
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "58c0ee0b-65ea-492e-9a68-503f27dcdc16",
-    "element_name": "Artwork 419",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "305a4e4a-2117-4982-a592-febef82a01e7.ai",
-    "file_size": 1208097,
-    "path": "58c0ee0b-65ea-492e-9a68-503f27dcdc16",
-    "created": 1737524839216,
-    "modified": 1737524839234
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "350764cd-20cf-4dc6-b692-16126cccb7cf",
-    "element_name": "Artwork 414",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "f4ed33e0-22e2-43ed-8b36-8158683a79aa.ai",
-    "file_size": 1207911,
-    "path": "350764cd-20cf-4dc6-b692-16126cccb7cf",
-    "created": 1737524856692,
-    "modified": 1737524856711
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "41880830-3222-4851-887d-8a91f82c1f9c",
-    "element_name": "Artwork 410",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9cffdb0e-2922-4285-b928-f1623019eefd.ai",
-    "file_size": 1207363,
-    "path": "41880830-3222-4851-887d-8a91f82c1f9c",
-    "created": 1737524869211,
-    "modified": 1737524869228
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3974347b-f99d-42f3-8a53-b3ab57db825e",
-    "element_name": "Artwork 418",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "05c95e7b-14ac-48ac-8325-280434276c10.ai",
-    "file_size": 1207596,
-    "path": "3974347b-f99d-42f3-8a53-b3ab57db825e",
-    "created": 1737524879005,
-    "modified": 1737524879025
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2ed42f83-199b-4c04-bed9-514b7ea169fd",
-    "element_name": "Artwork 415",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "f5f1a286-4384-47f7-a97f-c66ab3229fce.ai",
-    "file_size": 1207910,
-    "path": "2ed42f83-199b-4c04-bed9-514b7ea169fd",
-    "created": 1737524892289,
-    "modified": 1737524892309
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "bbd36ea0-eaa2-454a-9564-2fc5532a680c",
-    "element_name": "Artwork 412",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "c46c12d5-564d-44f9-8c48-a6a5e93857d0.ai",
-    "file_size": 1207721,
-    "path": "bbd36ea0-eaa2-454a-9564-2fc5532a680c",
-    "created": 1737524907149,
-    "modified": 1737524907166
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c522d40d-a720-4a32-97df-2e0730f75dfb",
-    "element_name": "Artwork 409",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "9461d14b-74cd-4443-b6b4-6b73d13abc30.ai",
-    "file_size": 1209004,
-    "path": "c522d40d-a720-4a32-97df-2e0730f75dfb",
-    "created": 1737524924618,
-    "modified": 1737524924633
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1fab6220-e75c-44a9-bd8f-8ace11ee4892",
-    "element_name": "Artwork 416",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "19e4319e-dc97-4cc4-a7c5-7ba303cb9baa.ai",
-    "file_size": 1208180,
-    "path": "1fab6220-e75c-44a9-bd8f-8ace11ee4892",
-    "created": 1737524937197,
-    "modified": 1737524937212
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "07b73e3d-8975-4b6c-addb-3c05551149bf",
-    "element_name": "Artwork 417",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "281b7012-0cc4-407c-8c66-8cab359a900e.ai",
-    "file_size": 1208163,
-    "path": "07b73e3d-8975-4b6c-addb-3c05551149bf",
-    "created": 1737524953469,
-    "modified": 1737524953488
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9fe77b8f-8d35-4ada-a1f3-064f8ca5f98c",
-    "element_name": "Artwork 413",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "f1a459e5-8140-4585-b66c-427b7de4874a.ai",
-    "file_size": 1207628,
-    "path": "9fe77b8f-8d35-4ada-a1f3-064f8ca5f98c",
-    "created": 1737524963389,
-    "modified": 1737524963409
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "76bc99de-86b1-4162-bcd1-8af32931ff2a",
-    "element_name": "Zip ties v2 compound pair",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Ziptiesv2_45d14e53-1afc-42eb-8a30-02898593d09a.ai",
-    "file_size": 1189881,
-    "path": "76bc99de-86b1-4162-bcd1-8af32931ff2a",
-    "created": 1738020082347,
-    "modified": 1738020127623
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "828d4d06-76d2-4a2a-9215-11db3c65daca",
-    "element_name": "Zipties v2 single",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "541702aa-8bff-426d-8cf3-feaa96258375.ai",
-    "file_size": 1215296,
-    "path": "828d4d06-76d2-4a2a-9215-11db3c65daca",
-    "created": 1738020148917,
-    "modified": 1738020148927
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "6d125253-7b5a-4be4-80a9-978223fb0614",
-    "element_name": "Artwork 406",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "5d8a75c3-5b86-4fbc-bf7e-c07bc66bcb72.ai",
-    "file_size": 1207607,
-    "path": "6d125253-7b5a-4be4-80a9-978223fb0614",
-    "created": 1738109925757,
-    "modified": 1738109925774
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e5b58547-09b0-4219-915d-93e6adc5c2f5",
-    "element_name": "Artwork 405",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "44652c97-6462-4dd4-8dc0-e51eb73ccb2c.ai",
-    "file_size": 1208963,
-    "path": "e5b58547-09b0-4219-915d-93e6adc5c2f5",
-    "created": 1738110022101,
-    "modified": 1738110022118
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b325622f-94ef-4149-aafa-07091fdd0edc",
-    "element_name": "Artwork 404",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "756194d2-f487-4a00-b3e0-5f55d48d71ef.ai",
-    "file_size": 1208251,
-    "path": "b325622f-94ef-4149-aafa-07091fdd0edc",
-    "created": 1738110067304,
-    "modified": 1738110067324
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "206035f2-2f74-4ef3-9fbe-f8a7a221fc79",
-    "element_name": "Artwork 402",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "a34b543d-d88f-4c50-bde8-c58e47476847.ai",
-    "file_size": 1207425,
-    "path": "206035f2-2f74-4ef3-9fbe-f8a7a221fc79",
-    "created": 1738110363079,
-    "modified": 1738110363112
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "63e00f83-7400-4985-bbf8-83c39021f63d",
-    "element_name": "Artwork 403",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "38db5562-abe5-473f-aec1-b0085b72940d.ai",
-    "file_size": 1207305,
-    "path": "63e00f83-7400-4985-bbf8-83c39021f63d",
-    "created": 1738110396962,
-    "modified": 1738110396982
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f9f110ea-6a51-49d8-a7d8-3a68ce1a3f93",
-    "element_name": "Artwork 400",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "3cb14826-059c-433c-b06b-9af3b20bf45e.ai",
-    "file_size": 1207800,
-    "path": "f9f110ea-6a51-49d8-a7d8-3a68ce1a3f93",
-    "created": 1738110724887,
-    "modified": 1738110724906
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "005c9b2e-f056-4d94-a1bf-d5d9599497ad",
-    "element_name": "Artwork 401",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "b548ed27-4a2e-410d-81fd-96ac93425f03.ai",
-    "file_size": 1207972,
-    "path": "005c9b2e-f056-4d94-a1bf-d5d9599497ad",
-    "created": 1738110746050,
-    "modified": 1738110746068
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "314a5fca-3e01-4051-8342-e9e622d1bbb4",
-    "element_name": "Artwork 420",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "896cd697-3cf9-4046-9448-fa7b670e3064.ai",
-    "file_size": 1208093,
-    "path": "314a5fca-3e01-4051-8342-e9e622d1bbb4",
-    "created": 1738110962044,
-    "modified": 1738110962072
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b7a9e9e6-e9a0-41d9-a3e0-3075ec87379f",
-    "element_name": "Artwork 421",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "93677d78-53e6-4fd4-baaf-85d8bf501fc3.ai",
-    "file_size": 1207400,
-    "path": "b7a9e9e6-e9a0-41d9-a3e0-3075ec87379f",
-    "created": 1738111004855,
-    "modified": 1738111004874
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e02ba4e2-e468-4f5f-8092-6af52301b5ac",
-    "element_name": "Artwork 422",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e261bc22-0089-4fb1-8247-c3388f04b918.ai",
-    "file_size": 1208337,
-    "path": "e02ba4e2-e468-4f5f-8092-6af52301b5ac",
-    "created": 1738111016923,
-    "modified": 1738111016948
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "76564cc3-1f7a-472b-9666-d829fa8762cd",
-    "element_name": "Artwork 423",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "af52f69b-8f6c-48ef-8a9c-b2d66ab8b878.ai",
-    "file_size": 1207625,
-    "path": "76564cc3-1f7a-472b-9666-d829fa8762cd",
-    "created": 1738111032680,
-    "modified": 1738111032699
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "44f778dc-1f06-43fb-8b09-e4a42568f96a",
-    "element_name": "Artwork 424",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "2fefe69a-5e52-49d1-a126-fb495972e41b.ai",
-    "file_size": 1207749,
-    "path": "44f778dc-1f06-43fb-8b09-e4a42568f96a",
-    "created": 1738111046339,
-    "modified": 1738111046361
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "735d1c65-eb5d-4b64-96db-3493002b9f98",
-    "element_name": "Artwork 425",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "8b824fdb-8b56-4284-ad50-acaa3c0df8ca.ai",
-    "file_size": 1207983,
-    "path": "735d1c65-eb5d-4b64-96db-3493002b9f98",
-    "created": 1738111063421,
-    "modified": 1738111063437
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1bfebe42-6fc7-4030-9a9d-c3ab5d0aedea",
-    "element_name": "Artwork 426",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "977cad81-fea3-449a-aab1-a404926c2196.ai",
-    "file_size": 1207652,
-    "path": "1bfebe42-6fc7-4030-9a9d-c3ab5d0aedea",
-    "created": 1738111079086,
-    "modified": 1738111079102
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "cdf82081-638e-4686-8f3f-8bb7e77d587b",
-    "element_name": "Artwork 427",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "f8df0132-201b-4fdf-9fc7-a68ba237cd09.ai",
-    "file_size": 1207654,
-    "path": "cdf82081-638e-4686-8f3f-8bb7e77d587b",
-    "created": 1738111091511,
-    "modified": 1738111091528
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "02aa8fb9-0b3e-433d-bf6d-63ff76615700",
-    "element_name": "Artwork 428",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "a4b44064-dc22-4031-92ce-d53316b951d1.ai",
-    "file_size": 1208392,
-    "path": "02aa8fb9-0b3e-433d-bf6d-63ff76615700",
-    "created": 1738111205836,
-    "modified": 1738111205861
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "94c73a95-6014-435e-88fa-851889c54c4e",
-    "element_name": "Artwork 429",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "de813196-499d-4363-8d70-84e777b357a0.ai",
-    "file_size": 1207520,
-    "path": "94c73a95-6014-435e-88fa-851889c54c4e",
-    "created": 1738111217027,
-    "modified": 1738111217059
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "964dec61-d148-4954-a71c-dbe17b9631bb",
-    "element_name": "RT002385",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002385_1df55a93-8bf1-46f7-ad27-31eecb74fabc.ai",
-    "file_size": 1209703,
-    "path": "964dec61-d148-4954-a71c-dbe17b9631bb",
-    "created": 1738121672631,
-    "modified": 1738283006441
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "427bf020-530c-4a72-8405-46e8f6d12a2a",
-    "element_name": "RT002388",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002388_ece7098e-2f75-436a-825c-eae8a6157987.ai",
-    "file_size": 1204659,
-    "path": "427bf020-530c-4a72-8405-46e8f6d12a2a",
-    "created": 1738121672631,
-    "modified": 1738282877213
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9f57573c-e2a3-47f2-9344-8785dc338e34",
-    "element_name": "RT002397",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002397_a14d94f7-e628-4a97-9179-b336a050d9ed.ai",
-    "file_size": 1209740,
-    "path": "9f57573c-e2a3-47f2-9344-8785dc338e34",
-    "created": 1738121672631,
-    "modified": 1738285181569
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "98c4fa1b-17a0-4343-bf3c-a4e6b4d121de",
-    "element_name": "RT002400",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002400_ed98b881-1686-4cbc-9795-9c9aa1f177b4.ai",
-    "file_size": 1207796,
-    "path": "98c4fa1b-17a0-4343-bf3c-a4e6b4d121de",
-    "created": 1738121672631,
-    "modified": 1738291682030
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "94a7714a-751b-457b-9e6c-f7b440e206eb",
-    "element_name": "RT002393",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002393_4afa37ad-5e24-42c6-91d3-11b2eb602955.ai",
-    "file_size": 1207815,
-    "path": "94a7714a-751b-457b-9e6c-f7b440e206eb",
-    "created": 1738121672631,
-    "modified": 1738292120843
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "19bea59a-3572-428b-9ef1-1985d0308a42",
-    "element_name": "RT002390",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002390_903b9553-1f42-4aaf-9bbf-022fd793f400.ai",
-    "file_size": 1207579,
-    "path": "19bea59a-3572-428b-9ef1-1985d0308a42",
-    "created": 1738121672631,
-    "modified": 1738291033086
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "362c91d3-3e05-4167-8737-383e2049675a",
-    "element_name": "RT002404",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002404_6889549f-8f5c-49f1-af29-128cfe0b0338.ai",
-    "file_size": 1211310,
-    "path": "362c91d3-3e05-4167-8737-383e2049675a",
-    "created": 1738121672631,
-    "modified": 1738291957325
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "629de6e2-b689-4aa6-88df-bdedc2856d7e",
-    "element_name": "RT002392",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002392_6413658c-1d49-4588-8f32-116b0c0051d4.ai",
-    "file_size": 1205121,
-    "path": "629de6e2-b689-4aa6-88df-bdedc2856d7e",
-    "created": 1738121672631,
-    "modified": 1738289225099
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e2869e78-8d62-40de-a7df-94c0b4e22dc9",
-    "element_name": "RT002386",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002386_09b8126f-01ff-4a24-a07b-bbf8ef7611bc.ai",
-    "file_size": 1207079,
-    "path": "e2869e78-8d62-40de-a7df-94c0b4e22dc9",
-    "created": 1738121672631,
-    "modified": 1738282724935
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d59a82aa-ebd7-4e00-9b33-43cc4c97551b",
-    "element_name": "RT002389",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002389_df43da60-e8a0-483c-9308-7a9a5e607237.ai",
-    "file_size": 1211497,
-    "path": "d59a82aa-ebd7-4e00-9b33-43cc4c97551b",
-    "created": 1738121672631,
-    "modified": 1738282835515
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d930f724-619f-4fc2-97d9-fb2db590833d",
-    "element_name": "RT002398",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002398_f6aef3b3-32a4-45de-85a3-74fa81def414.ai",
-    "file_size": 1212484,
-    "path": "d930f724-619f-4fc2-97d9-fb2db590833d",
-    "created": 1738121672631,
-    "modified": 1738460437638
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c3f57843-b94e-40fe-baca-7f70f4695a2d",
-    "element_name": "RT002399",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002399_6583eff5-0296-42c4-9200-b0e8bd5d9ccd.ai",
-    "file_size": 1208750,
-    "path": "c3f57843-b94e-40fe-baca-7f70f4695a2d",
-    "created": 1738121672631,
-    "modified": 1738290504677
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2445a696-6549-4795-9f8e-4694e351cb91",
-    "element_name": "RT002401",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002401_f74d1cb9-ff55-46df-bd40-60c13296e081.ai",
-    "file_size": 1209732,
-    "path": "2445a696-6549-4795-9f8e-4694e351cb91",
-    "created": 1738121672631,
-    "modified": 1738296081530
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9e9594b1-3866-4845-aeea-5e57799b5a75",
-    "element_name": "RT002403",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002403_102072fa-a130-419d-9c0d-f3b0024452e1.ai",
-    "file_size": 1198126,
-    "path": "9e9594b1-3866-4845-aeea-5e57799b5a75",
-    "created": 1738121672631,
-    "modified": 1738291717531
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1c50d408-f8c2-4ee8-821f-c78ecd9fbcca",
-    "element_name": "RT002391",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002391_1556e5d3-a543-4a81-bdb3-3eb290f68219.ai",
-    "file_size": 1205086,
-    "path": "1c50d408-f8c2-4ee8-821f-c78ecd9fbcca",
-    "created": 1738121672631,
-    "modified": 1738292014103
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "fb715f0c-ce5b-4a95-8d37-8c5b129eee9f",
-    "element_name": "RT002394",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002394_e151af92-84f0-4aa5-ba2c-e9e45ffca080.ai",
-    "file_size": 1200037,
-    "path": "fb715f0c-ce5b-4a95-8d37-8c5b129eee9f",
-    "created": 1738121672631,
-    "modified": 1738292081372
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "13b94af7-c113-4f32-9a9c-09053e747855",
-    "element_name": "RT002405",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002405_5224473e-af4c-4289-8339-aa43250172fa.ai",
-    "file_size": 1204548,
-    "path": "13b94af7-c113-4f32-9a9c-09053e747855",
-    "created": 1738121672631,
-    "modified": 1738291769834
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7c81601e-122c-4b1a-a264-957961449624",
-    "element_name": "RT002402",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT002402_3cd1647f-c171-4dd5-9146-193536ac3aaf.ai",
-    "file_size": 1197316,
-    "path": "7c81601e-122c-4b1a-a264-957961449624",
-    "created": 1738121672631,
-    "modified": 1738291748068
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a57e6130-ca68-4dfe-b78f-02ee2d8796ee",
-    "element_name": "Half Cut Contour",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "a57e6130-ca68-4dfe-b78f-02ee2d8796ee",
-    "created": 1738124212440,
-    "modified": 1738124212470
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "bf43d96d-67d6-47bc-ae2e-464fe46f10c4",
-    "element_name": "8mm D-F- to 5mm OUTER BLADECUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "8mmD-F-to5mmOUTERBLADECUT_c656b301-34a6-43ed-bdd7-4bf1d6961c3b.ai",
-    "file_size": 199564,
-    "path": "bf43d96d-67d6-47bc-ae2e-464fe46f10c4",
-    "created": 1694479471684,
-    "modified": 1738411534396
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1095b6bd-b00d-48b1-82ae-634c86f786fe",
-    "element_name": "01L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "01L_ea0f712c-6704-4d6d-918e-1420f4009475.ai",
-    "file_size": 1219127,
-    "path": "1095b6bd-b00d-48b1-82ae-634c86f786fe",
-    "created": 1738121672631,
-    "modified": 1738727904222
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1330b8b2-8359-44c2-94bd-3e667e521108",
-    "element_name": "02R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "02R_0fbbd383-3bcf-4df7-9f66-156f5b454900.ai",
-    "file_size": 1218212,
-    "path": "1330b8b2-8359-44c2-94bd-3e667e521108",
-    "created": 1738121672631,
-    "modified": 1738728226403
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ce55910a-9f78-45a6-9dbb-f36297142ff3",
-    "element_name": "04L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "04L_a45ca87c-225d-472e-93c9-d824c8896b57.ai",
-    "file_size": 1217920,
-    "path": "ce55910a-9f78-45a6-9dbb-f36297142ff3",
-    "created": 1738121672631,
-    "modified": 1738728295699
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "9a615e55-c504-4e67-8e98-30b68d393e63",
-    "element_name": "04R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "04R_a0b91d15-9aab-46e5-8892-d3003f956321.ai",
-    "file_size": 1222038,
-    "path": "9a615e55-c504-4e67-8e98-30b68d393e63",
-    "created": 1738121672631,
-    "modified": 1738728753677
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "29320c10-310d-401c-b7b8-faa76160759e",
-    "element_name": "09L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "09L_ce9eafc8-ad4e-4bf0-8ec2-211c2ad41fa0.ai",
-    "file_size": 1210553,
-    "path": "29320c10-310d-401c-b7b8-faa76160759e",
-    "created": 1738121672631,
-    "modified": 1738730541356
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "648fdc24-eebf-4d20-a4c6-7f191de6c816",
-    "element_name": "09R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "09R_e0722979-541a-4149-b624-93fe46308be6.ai",
-    "file_size": 1207548,
-    "path": "648fdc24-eebf-4d20-a4c6-7f191de6c816",
-    "created": 1738121672631,
-    "modified": 1738730683368
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "fcc82283-6d8c-437f-9759-9274b74e977f",
-    "element_name": "10L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "10L_315f07a3-79c6-4e02-a7ee-0d8bff2c66c3.ai",
-    "file_size": 1208647,
-    "path": "fcc82283-6d8c-437f-9759-9274b74e977f",
-    "created": 1738121672631,
-    "modified": 1738730774352
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "74c83051-8251-4108-8fa5-e8f72abe1764",
-    "element_name": "10R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "10R_525a8ca6-0584-4a1a-993b-a336f3da1e46.ai",
-    "file_size": 1212589,
-    "path": "74c83051-8251-4108-8fa5-e8f72abe1764",
-    "created": 1738121672631,
-    "modified": 1738730849155
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "6f5ea212-0597-4ac4-9d1a-aa0dd5a41df4",
-    "element_name": "11",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Blank_d948a1c0-93dc-4d03-a5d0-e0f677e83b30.ai",
-    "file_size": 1208764,
-    "path": "6f5ea212-0597-4ac4-9d1a-aa0dd5a41df4",
-    "created": 1738121672631,
-    "modified": 1738727604296
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "20d34a5e-1f7f-4d5c-8fb1-284861fa21d0",
-    "element_name": "12",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Blank_f8821707-727f-4b94-8323-0d34c4d58075.ai",
-    "file_size": 1212973,
-    "path": "20d34a5e-1f7f-4d5c-8fb1-284861fa21d0",
-    "created": 1738121672631,
-    "modified": 1738730926820
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b7b42418-f668-4ff1-a359-de334e6e7e5d",
-    "element_name": "13",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "13_648a6d8c-cd80-41c0-882c-52194ff17947.ai",
-    "file_size": 1225249,
-    "path": "b7b42418-f668-4ff1-a359-de334e6e7e5d",
-    "created": 1738121672631,
-    "modified": 1738731025565
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b6ee5de6-8123-4d4b-a7d2-5de7d104fe63",
-    "element_name": "Blank",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Blank_5230a584-a52b-42dc-9a37-70b5774b8b46.ai",
-    "file_size": 797997,
-    "path": "b6ee5de6-8123-4d4b-a7d2-5de7d104fe63",
-    "created": 1738121672631,
-    "modified": 1738538424875
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e9e4b877-e163-4f22-bd94-ec37f498b289",
-    "element_name": "Blank",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Blank_5230a584-a52b-42dc-9a37-70b5774b8b46.ai",
-    "file_size": 797997,
-    "path": "e9e4b877-e163-4f22-bd94-ec37f498b289",
-    "created": 1738121672631,
-    "modified": 1738538424875
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e49d4369-6016-4409-a133-2f70fb6c9b0a",
-    "element_name": "Blank",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Blank_5230a584-a52b-42dc-9a37-70b5774b8b46.ai",
-    "file_size": 797997,
-    "path": "e49d4369-6016-4409-a133-2f70fb6c9b0a",
-    "created": 1738121672631,
-    "modified": 1738538424875
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a5824f63-e25d-40ee-919a-9ad7c24085b9",
-    "element_name": "Blank",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Blank_5230a584-a52b-42dc-9a37-70b5774b8b46.ai",
-    "file_size": 797997,
-    "path": "a5824f63-e25d-40ee-919a-9ad7c24085b9",
-    "created": 1738121672631,
-    "modified": 1738538424875
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "4018619d-50fa-404f-a002-9bfea4cf557c",
-    "element_name": "Blank",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Blank_5230a584-a52b-42dc-9a37-70b5774b8b46.ai",
-    "file_size": 797997,
-    "path": "4018619d-50fa-404f-a002-9bfea4cf557c",
-    "created": 1738121672631,
-    "modified": 1738538424875
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a4824f71-34f9-4966-9951-987a6f3c9eb8",
-    "element_name": "07L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "07L_f0b93e2d-bc3d-4b0d-bf02-c9fb83498b55.ai",
-    "file_size": 1205330,
-    "path": "a4824f71-34f9-4966-9951-987a6f3c9eb8",
-    "created": 1738121672631,
-    "modified": 1738730052886
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "93d4795a-3256-4b62-930b-5d83205ef1ba",
-    "element_name": "07R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "07R_1a56f4d9-f8ea-4e12-aa9e-0aaaa547502e.ai",
-    "file_size": 1210703,
-    "path": "93d4795a-3256-4b62-930b-5d83205ef1ba",
-    "created": 1738121672631,
-    "modified": 1738730182468
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "88355cf8-6fbe-47a7-932f-182f632a5fa3",
-    "element_name": "08L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "08L_7eeba2ba-2cb6-4b3c-99ab-fa17df8b07e8.ai",
-    "file_size": 1215051,
-    "path": "88355cf8-6fbe-47a7-932f-182f632a5fa3",
-    "created": 1738121672631,
-    "modified": 1738730263088
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ab5c8b82-96d3-42fc-a94f-584b03f64ade",
-    "element_name": "08R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "08R_06ff3eff-3a6a-468a-9d99-12c34a64b92a.ai",
-    "file_size": 1213177,
-    "path": "ab5c8b82-96d3-42fc-a94f-584b03f64ade",
-    "created": 1738121672631,
-    "modified": 1738730390338
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5e0254c0-64ba-4537-88e2-47ea54ab2042",
-    "element_name": "05L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "05L_70e0ef38-5bc8-4760-b15c-f05388cba257.ai",
-    "file_size": 1211089,
-    "path": "5e0254c0-64ba-4537-88e2-47ea54ab2042",
-    "created": 1738121672631,
-    "modified": 1738728863452
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "aa097150-8ebb-4365-b561-802196bf7b84",
-    "element_name": "01R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "01R_3a972c1c-80f5-466f-b89a-3fb832ea152f.ai",
-    "file_size": 1216678,
-    "path": "aa097150-8ebb-4365-b561-802196bf7b84",
-    "created": 1738121672631,
-    "modified": 1738728051279
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "838fc3e7-1075-42b4-90c4-6d4176cb93e4",
-    "element_name": "02L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "02L_14b0dba7-0556-425b-85e6-90d09e3382e0.ai",
-    "file_size": 1217503,
-    "path": "838fc3e7-1075-42b4-90c4-6d4176cb93e4",
-    "created": 1738121672631,
-    "modified": 1738727738583
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "192fb4a8-22eb-4877-8ac4-cbc0c8d591b8",
-    "element_name": "05R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "05R_76f99857-93e9-45fa-902b-e97a188f4a15.ai",
-    "file_size": 1216339,
-    "path": "192fb4a8-22eb-4877-8ac4-cbc0c8d591b8",
-    "created": 1738121672631,
-    "modified": 1738728922475
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "46c0e6f8-697d-4b54-93e4-b3cd8027c72f",
-    "element_name": "03L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "03L_5b83b16c-ecf0-4296-bdc5-1ace24d9f56c.ai",
-    "file_size": 1206135,
-    "path": "46c0e6f8-697d-4b54-93e4-b3cd8027c72f",
-    "created": 1738121672631,
-    "modified": 1738728137070
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5988173f-fab9-4cd2-87be-a4f846f56132",
-    "element_name": "06L",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "06L_2f7d0d76-302e-46fb-ae0a-0c14705159ff.ai",
-    "file_size": 1206812,
-    "path": "5988173f-fab9-4cd2-87be-a4f846f56132",
-    "created": 1738121672631,
-    "modified": 1738729282251
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "afbb7a60-8ad7-422e-8348-552d5ec85db1",
-    "element_name": "06R",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "06R_db58a7a0-9d1e-4ab8-8476-c5981f48740f.ai",
-    "file_size": 1211185,
-    "path": "afbb7a60-8ad7-422e-8348-552d5ec85db1",
-    "created": 1738121672631,
-    "modified": 1738729519661
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "6779cfd6-f9d2-4ab0-868e-b49912583a45",
-    "element_name": "SL65 F v4 Closed",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "SL65Fv4Closed_0924896a-8fab-4a5a-aff3-d30db7b4ec0a.ai",
-    "file_size": 1217188,
-    "path": "6779cfd6-f9d2-4ab0-868e-b49912583a45",
-    "created": 1738626790082,
-    "modified": 1738626923176
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c010fe5d-8291-496f-bff1-d657936cdaea",
-    "element_name": "SL65 M v4 Closed",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "SL65Mv4Closed_34e0a6fd-5eed-47a9-a630-c34de64ba6b1.ai",
-    "file_size": 1218312,
-    "path": "c010fe5d-8291-496f-bff1-d657936cdaea",
-    "created": 1738626853421,
-    "modified": 1738626913582
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "16884336-9339-4b28-a4fc-cca5ee9783ec",
-    "element_name": "Artwork 430",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "a9e844f7-b77a-4f5e-ad27-a79b04862e99.ai",
-    "file_size": 1226486,
-    "path": "16884336-9339-4b28-a4fc-cca5ee9783ec",
-    "created": 1738728108827,
-    "modified": 1738728108884
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "af4e6574-0e96-4bfc-a561-6f828bdd3a44",
-    "element_name": "RT008167 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT008167CUT_229f4eb7-28db-4b0a-984f-7d2d753a237a.ai",
-    "file_size": 1267346,
-    "path": "af4e6574-0e96-4bfc-a561-6f828bdd3a44",
-    "created": 1739147003566,
-    "modified": 1742185573000
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a8d668e0-ed87-422c-9e56-ccda331e3797",
-    "element_name": "RT008168 CUT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT008168CUT_021d973d-2abd-474c-b099-3b0887e5a667.ai",
-    "file_size": 1221756,
-    "path": "a8d668e0-ed87-422c-9e56-ccda331e3797",
-    "created": 1739148538454,
-    "modified": 1742184952046
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "aa34d8e9-54e0-4005-b4ab-744df25bd0d4",
-    "element_name": "RT008171",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT008171_647ec18e-c278-4ae1-b9ea-aa4b4f96339e.ai",
-    "file_size": 1234890,
-    "path": "aa34d8e9-54e0-4005-b4ab-744df25bd0d4",
-    "created": 1739154246297,
-    "modified": 1742175405906
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "8d0e6537-eb00-468e-993b-85a3e961c9f7",
-    "element_name": "RT008178",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT008178_2447a532-1b3d-490d-bdcb-743e0c0fcf82.ai",
-    "file_size": 1262374,
-    "path": "8d0e6537-eb00-468e-993b-85a3e961c9f7",
-    "created": 1739161196486,
-    "modified": 1739323350329
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f66f80f7-5d2e-409f-81a9-4c10119d5125",
-    "element_name": "RT008170",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT008170_197642f4-97a7-4080-9efd-15db58f7773a.ai",
-    "file_size": 240958,
-    "path": "f66f80f7-5d2e-409f-81a9-4c10119d5125",
-    "created": 1739162331383,
-    "modified": 1742185091628
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2568a7dc-71a4-4938-b533-b3d01146ef90",
-    "element_name": "RT008169",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT008169_0b0eaeb5-0bb1-4d13-8846-5cfa2580dcd0.ai",
-    "file_size": 262362,
-    "path": "2568a7dc-71a4-4938-b533-b3d01146ef90",
-    "created": 1739162460527,
-    "modified": 1739772555156
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "eb38ed96-310e-42b1-8ee3-6bf9c7746f52",
-    "element_name": "Artwork 158",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "d0cb08b4-c8a7-4272-8958-5b05a6eac9e8.ai",
-    "file_size": 1210473,
-    "path": "3487ff83-231b-4ef0-a018-4f63d183251f",
-    "created": 1692593444410,
-    "modified": 1692593444435
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f0dda3f2-fac9-4cfa-a700-04d1d1af8249",
-    "element_name": "Artwork 181",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "74d9e07c-57e9-470a-a956-ddef3ab3dc28.ai",
-    "file_size": 1211590,
-    "path": "9073d2e9-0cce-4730-a39f-3ee95b3e3838",
-    "created": 1698204593669,
-    "modified": 1698204593695
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "86c140f7-0757-4463-89c2-eff411255785",
-    "element_name": "RT008178",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT008178_b77ac474-4d59-49d4-b74e-16a672601a26.ai",
-    "file_size": 1253877,
-    "path": "86c140f7-0757-4463-89c2-eff411255785",
-    "created": 1736896754293,
-    "modified": 1742252462265
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a6eb093b-7f14-4a8a-a782-2504d98a2454",
-    "element_name": "RT008180",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT008180_a623364e-e828-48d7-b8ab-85956cae1f53.ai",
-    "file_size": 1269954,
-    "path": "a6eb093b-7f14-4a8a-a782-2504d98a2454",
-    "created": 1736896754293,
-    "modified": 1742252453938
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c9c68472-6e86-44bb-b0e0-1ccc30fd9376",
-    "element_name": "RT008306",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT008306_23e9c0e0-ae2c-4623-9db6-8c50192e7263.ai",
-    "file_size": 430693,
-    "path": "c9c68472-6e86-44bb-b0e0-1ccc30fd9376",
-    "created": 1736903079714,
-    "modified": 1742180379078
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "6bd20883-e6ea-4f11-9738-294224e41295",
-    "element_name": "RT008179",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT008179_8a146538-6178-4421-b792-4df8235f0ca7.ai",
-    "file_size": 1241913,
-    "path": "6bd20883-e6ea-4f11-9738-294224e41295",
-    "created": 1736896754293,
-    "modified": 1740966637551
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7ad857e1-2657-40c5-b41e-e5883942192b",
-    "element_name": "RT008309",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT008309_1fa0edfd-26ec-4e46-ba26-2d0964da7c90.ai",
-    "file_size": 1205463,
-    "path": "7ad857e1-2657-40c5-b41e-e5883942192b",
-    "created": 1736896754293,
-    "modified": 1742180562379
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e68898b0-8195-4980-ab3e-54ecb797df4b",
-    "element_name": "RT008301",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT008301_fc0ef7ce-527c-48e1-b7c3-2465c92c6fcb.ai",
-    "file_size": 1200190,
-    "path": "e68898b0-8195-4980-ab3e-54ecb797df4b",
-    "created": 1736896754293,
-    "modified": 1743025679018
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a760ba5b-744d-4f76-947d-ec6f30968cef",
-    "element_name": "C=0 M=13 Y=76 K=8",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "a760ba5b-744d-4f76-947d-ec6f30968cef",
-    "created": 1741139369788,
-    "modified": 1741139369953
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "738020b1-2d0b-400b-b47a-a9e30360ca45",
-    "element_name": "OVERLAPS",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "738020b1-2d0b-400b-b47a-a9e30360ca45",
-    "created": 1741234565113,
-    "modified": 1741563931774
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "fccde7f3-638e-4a39-97eb-c99964a0cd60",
-    "element_name": "C=52 M=100 Y=33 K=21",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "fccde7f3-638e-4a39-97eb-c99964a0cd60",
-    "created": 1741318485191,
-    "modified": 1741318485192
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f805d477-11b2-4502-93ca-a2ca2fee5d89",
-    "element_name": "C=52 M=100 Y=33 K=21",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "f805d477-11b2-4502-93ca-a2ca2fee5d89",
-    "created": 1741318552609,
-    "modified": 1741318552610
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "03e28c97-61fb-4703-8a82-4d117c10d4fa",
-    "element_name": "OVERLAPS",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "03e28c97-61fb-4703-8a82-4d117c10d4fa",
-    "created": 1741559538915,
-    "modified": 1741559538916
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b9935e22-5e4f-415e-89d6-7ec2b03e0064",
-    "element_name": "OVERLAPS",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "b9935e22-5e4f-415e-89d6-7ec2b03e0064",
-    "created": 1741560685161,
-    "modified": 1741560685162
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1d16500f-38f3-41df-b247-8a3c74a27c79",
-    "element_name": "F",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "1d16500f-38f3-41df-b247-8a3c74a27c79",
-    "created": 1741561636763,
-    "modified": 1741561636764
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d3e32b75-87db-4466-91fb-9d09cd1ea824",
-    "element_name": "Artwork 431",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "dd818f04-416a-4bcf-9727-517c5054185c.ai",
-    "file_size": 1216768,
-    "path": "d3e32b75-87db-4466-91fb-9d09cd1ea824",
-    "created": 1741562161123,
-    "modified": 1741562161160
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7c84a747-27ad-4e7a-95d5-d5d6180439e0",
-    "element_name": "Artwork 432",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "46098e48-09e1-488e-b4c3-289afcacc7e1.ai",
-    "file_size": 1217068,
-    "path": "7c84a747-27ad-4e7a-95d5-d5d6180439e0",
-    "created": 1741562209142,
-    "modified": 1741562209149
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "7983cd74-5f58-4bc1-b448-ab86b3a89415",
-    "element_name": "In-Field C copy 3",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "7983cd74-5f58-4bc1-b448-ab86b3a89415",
-    "created": 1741562539080,
-    "modified": 1741562539081
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0155888b-23b5-48e5-bed2-e9aa0f7cd330",
-    "element_name": "Z - Internal part ties",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "0155888b-23b5-48e5-bed2-e9aa0f7cd330",
-    "created": 1741562556782,
-    "modified": 1741562556783
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e80afc94-db92-4081-a682-734c22fc19fd",
-    "element_name": "Artwork 433",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "a5b68b52-fc7d-41e9-b791-6362cb1988fd.ai",
-    "file_size": 1216629,
-    "path": "e80afc94-db92-4081-a682-734c22fc19fd",
-    "created": 1741562646124,
-    "modified": 1741562646158
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3ec6f6ff-e3b7-4eed-b772-6c26215cd279",
-    "element_name": "Ziptie Fill",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "8ff06735-0bb4-4738-9b7f-138ffaee9609.ai",
-    "file_size": 381768,
-    "path": "3ec6f6ff-e3b7-4eed-b772-6c26215cd279",
-    "created": 1741582953590,
-    "modified": 1741582953623
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "28163977-bdea-42e1-8209-4902cd705e73",
-    "element_name": "Ziptie Fill 2",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "50dd6f90-744b-4f8b-941d-f3ca9aa085df.ai",
-    "file_size": 380819,
-    "path": "28163977-bdea-42e1-8209-4902cd705e73",
-    "created": 1741583195763,
-    "modified": 1741583195793
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "326cc661-d3e2-4679-a2cb-e4f08e235ebc",
-    "element_name": "Ziptie Fill 3",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "6d952936-505a-4bbe-92c1-7ee7f9bd641b.ai",
-    "file_size": 381392,
-    "path": "326cc661-d3e2-4679-a2cb-e4f08e235ebc",
-    "created": 1741583469700,
-    "modified": 1741583469730
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "19d68398-1b52-4050-acd3-17d5f86e18e0",
-    "element_name": "R=189 G=178 B=157 copy",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "19d68398-1b52-4050-acd3-17d5f86e18e0",
-    "created": 1741585127312,
-    "modified": 1741585127316
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "28966f33-ab98-4ae4-bb72-e43b178fdb6a",
-    "element_name": "R=189 G=178 B=157 copy 2",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "28966f33-ab98-4ae4-bb72-e43b178fdb6a",
-    "created": 1741585153916,
-    "modified": 1741585153920
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "6cf8a44c-4086-4553-82fa-ea0e6292ca7e",
-    "element_name": "RT NEUTRAL GREY - MMTS copy 2",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "6cf8a44c-4086-4553-82fa-ea0e6292ca7e",
-    "created": 1741739113825,
-    "modified": 1741739113832
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "622fa8d6-74ad-4f6e-a5d2-5399df2d14b3",
-    "element_name": "RT NEUTRAL GREY - MMTS copy 6",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "622fa8d6-74ad-4f6e-a5d2-5399df2d14b3",
-    "created": 1741739136594,
-    "modified": 1741739136600
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "aee9a2da-7244-4940-ba07-661a7da37e89",
-    "element_name": "RT NEUTRAL GREY - MMTS copy 7",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "aee9a2da-7244-4940-ba07-661a7da37e89",
-    "created": 1741739328735,
-    "modified": 1741739328754
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ee762080-3b70-4b10-8c9a-ade3b992d551",
-    "element_name": "R=74 G=44 B=106",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "ee762080-3b70-4b10-8c9a-ade3b992d551",
-    "created": 1741747462757,
-    "modified": 1741747462778
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "dfbf1e43-1083-47e8-980f-46bace28afcb",
-    "element_name": "C=100 M=100 Y=100 K=100 copy 2",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "dfbf1e43-1083-47e8-980f-46bace28afcb",
-    "created": 1741747499148,
-    "modified": 1741747499153
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "0b87389b-85b3-4184-a766-f441dcb4ff1b",
-    "element_name": "C=100 M=100 Y=100 K=100 copy 4",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "0b87389b-85b3-4184-a766-f441dcb4ff1b",
-    "created": 1741747510661,
-    "modified": 1741747510663
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "c14a8417-4807-4ef2-a3ea-7d0133e0e63e",
-    "element_name": "RT GP Green copy 3",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "c14a8417-4807-4ef2-a3ea-7d0133e0e63e",
-    "created": 1741758013656,
-    "modified": 1741758013669
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1f90e579-6dee-42b2-9a49-3c23bb643edc",
-    "element_name": "RT GP Green copy 4",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "1f90e579-6dee-42b2-9a49-3c23bb643edc",
-    "created": 1741758026162,
-    "modified": 1741758026171
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "3b905220-8ab1-4045-bce8-d914011cb639",
-    "element_name": "RT GP Green copy 5",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "3b905220-8ab1-4045-bce8-d914011cb639",
-    "created": 1741758046073,
-    "modified": 1741758046077
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "d748d77e-a27c-475a-acab-075d8eead984",
-    "element_name": "RT GP Green copy 6",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "d748d77e-a27c-475a-acab-075d8eead984",
-    "created": 1741758070631,
-    "modified": 1741758070635
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5b77126a-9e64-441b-8b0d-5b97409651e9",
-    "element_name": "RT NEUTRAL GREY - MMTS copy 9",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "5b77126a-9e64-441b-8b0d-5b97409651e9",
-    "created": 1741759026050,
-    "modified": 1741759026059
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "8aef192d-ecc2-4df4-956c-db42b420b128",
-    "element_name": "RT NEUTRAL GREY - MMTS copy 10",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "8aef192d-ecc2-4df4-956c-db42b420b128",
-    "created": 1741759049647,
-    "modified": 1741759049650
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "a97176c4-7125-41c6-8f38-f68496307196",
-    "element_name": "RT NEUTRAL GREY - MMTS copy 11",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "a97176c4-7125-41c6-8f38-f68496307196",
-    "created": 1741759093168,
-    "modified": 1741759093170
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f645acba-071b-4553-9690-3a25400fc6d2",
-    "element_name": "RT NEUTRAL GREY - MMTS copy 12",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "f645acba-071b-4553-9690-3a25400fc6d2",
-    "created": 1741759105450,
-    "modified": 1741759105452
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "dd5b0751-0af7-44ce-bb7b-322830860c75",
-    "element_name": "RT NEUTRAL GREY - MMTS copy 13",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "dd5b0751-0af7-44ce-bb7b-322830860c75",
-    "created": 1741759120616,
-    "modified": 1741759120620
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "15a7482b-e1e8-4d55-a615-1e9480a0b1f9",
-    "element_name": "RT NEUTRAL GREY - MMTS copy 14",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "15a7482b-e1e8-4d55-a615-1e9480a0b1f9",
-    "created": 1741759154483,
-    "modified": 1741759154501
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e58beb84-26d6-4e88-a4c6-610cde6e6973",
-    "element_name": "RT NEUTRAL GREY - MMTS copy 15",
-    "element_type": "application/vnd.adobe.element.color+dcx",
-    "file_type": "unknown",
-    "file_name": "",
-    "file_size": 0,
-    "path": "e58beb84-26d6-4e88-a4c6-610cde6e6973",
-    "created": 1741759170261,
-    "modified": 1741759202945
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f16e3913-c743-4826-9a8a-5328a1cbf422",
-    "element_name": "Text 1",
-    "element_type": "application/vnd.adobe.element.text+dcx",
-    "file_type": "image/png",
-    "file_name": "TextPreview5187460060.png",
-    "file_size": 662,
-    "path": "f16e3913-c743-4826-9a8a-5328a1cbf422",
-    "created": 1742098622218,
-    "modified": 1742098622436
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "71f8facd-1559-45de-99f4-7b4eeecec5be",
-    "element_name": "2 Ziptie Cluster",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "177b7773-a2bf-42a0-b429-43a0be5481ff.ai",
-    "file_size": 1213689,
-    "path": "71f8facd-1559-45de-99f4-7b4eeecec5be",
-    "created": 1753749365896,
-    "modified": 1753749365913
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "51bb5cee-d0ea-42f5-9baf-d8e97ae0f8f1",
-    "element_name": "1 Ziptie Cluster",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "04f18f64-159f-4d65-92b8-9e84cfdef4dd.ai",
-    "file_size": 1213398,
-    "path": "51bb5cee-d0ea-42f5-9baf-d8e97ae0f8f1",
-    "created": 1753749578820,
-    "modified": 1753749578832
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "8f7ce89f-8c18-4ac3-b72b-3c23d1e384f9",
-    "element_name": "4 Ziptie diagonal cluster",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "b892f296-5785-49dd-a65a-d3a0cc874fde.ai",
-    "file_size": 366263,
-    "path": "8f7ce89f-8c18-4ac3-b72b-3c23d1e384f9",
-    "created": 1753935444531,
-    "modified": 1753935444538
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "1241d29f-6b24-4f83-90ca-b33defb04d22",
-    "element_name": "Cassette and 5Double Sheet Map",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Cassetteand5DoubleSheetMap_314293d9-00bf-4e8c-8619-8cd4e157c923.ai",
-    "file_size": 1232993,
-    "path": "1241d29f-6b24-4f83-90ca-b33defb04d22",
-    "created": 1754870985671,
-    "modified": 1754908273632
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "b06afd61-a909-4b4d-b05e-5c3987b5a3b2",
-    "element_name": "Double Sheet Map",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "DoubleSheetMap_ed4db14e-e346-4cb2-b55c-de44acf9e00d.ai",
-    "file_size": 1596627,
-    "path": "b06afd61-a909-4b4d-b05e-5c3987b5a3b2",
-    "created": 1754870985671,
-    "modified": 1759279585627
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ccf7457b-5167-4005-99d5-982ca3742963",
-    "element_name": "BMP-2 Double Sheet Map",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "BMP-2DoubleSheetMap_8b0fd379-7cde-4967-a5b1-ee17d17d6da7.ai",
-    "file_size": 1255863,
-    "path": "ccf7457b-5167-4005-99d5-982ca3742963",
-    "created": 1754870985671,
-    "modified": 1754908246354
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "32f1e472-16ed-4064-94ed-b67273a440d5",
-    "element_name": "Doubles Column",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "DoublesColumn_16424808-acd5-4a76-8ac5-c06271933456.ai",
-    "file_size": 1221299,
-    "path": "32f1e472-16ed-4064-94ed-b67273a440d5",
-    "created": 1754907876144,
-    "modified": 1754953576684
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5b30075b-24d1-4563-bbc0-1772b3f049ba",
-    "element_name": "Push Through slots 08.2025",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "75611084-da53-4aa5-9e37-45a6bdfe9ced.ai",
-    "file_size": 364800,
-    "path": "5b30075b-24d1-4563-bbc0-1772b3f049ba",
-    "created": 1755130454907,
-    "modified": 1755130454912
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f2b9fc89-d119-4a43-88aa-815920627b6a",
-    "element_name": "PUSH THRU TAB R1",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "e1897cc3-67e7-4e43-bec0-2025b78420dc.ai",
-    "file_size": 1213946,
-    "path": "f2b9fc89-d119-4a43-88aa-815920627b6a",
-    "created": 1755484434926,
-    "modified": 1755484434934
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "2e1c0520-e004-4ecc-89dd-1a5fce29c493",
-    "element_name": "Push Dart",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "ac792a48-2884-4f30-9775-a5fd8b9a2463.ai",
-    "file_size": 364754,
-    "path": "2e1c0520-e004-4ecc-89dd-1a5fce29c493",
-    "created": 1755487124843,
-    "modified": 1755487124880
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e0a6afd6-f8ca-4429-99b3-e3168526b92e",
-    "element_name": "Pull Through Tab",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "0f3eb4ee-943b-415c-b4ef-aff764d7bbe3.ai",
-    "file_size": 364821,
-    "path": "e0a6afd6-f8ca-4429-99b3-e3168526b92e",
-    "created": 1755487161222,
-    "modified": 1755487161226
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5dc11559-848f-487f-acd7-02821e3f8101",
-    "element_name": "Slide Lock Tabs",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "SlideLockTabs_38b4c74c-0188-4a18-a745-02923300f93c.ai",
-    "file_size": 369223,
-    "path": "5dc11559-848f-487f-acd7-02821e3f8101",
-    "created": 1755487211155,
-    "modified": 1755498786537
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "be26e666-0b11-4040-bef9-740d770f9ce2",
-    "element_name": "Slide Lock Slots",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "42041a49-a867-465e-a4e6-4bb342790e09.ai",
-    "file_size": 213142,
-    "path": "be26e666-0b11-4040-bef9-740d770f9ce2",
-    "created": 1755487257305,
-    "modified": 1755487257311
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ca9931ec-6dae-4c1b-8858-dc1add966100",
-    "element_name": "V-Spear Cutout",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "f2b071e6-36af-432c-9651-756fa4be6c57.ai",
-    "file_size": 212365,
-    "path": "ca9931ec-6dae-4c1b-8858-dc1add966100",
-    "created": 1755487271186,
-    "modified": 1755487271191
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "133adb0a-ab9c-4541-b3f3-45b071a7aaed",
-    "element_name": "Pull Through Tab Slots",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "PullThroughTabSlots_b45161a8-4d0f-48d6-bf1f-85466d0c8a73.ai",
-    "file_size": 368916,
-    "path": "133adb0a-ab9c-4541-b3f3-45b071a7aaed",
-    "created": 1755487321094,
-    "modified": 1756607436004
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f9c730bd-0a17-4340-836d-9c8a5b713fc9",
-    "element_name": "Push Dart Slot",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "5838ee0e-12d1-4a95-bdf9-002205881d13.ai",
-    "file_size": 1228175,
-    "path": "f9c730bd-0a17-4340-836d-9c8a5b713fc9",
-    "created": 1755487997155,
-    "modified": 1755487997172
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "6694813a-b40d-4aea-94f4-b472d86b2fca",
-    "element_name": "Slide Lock Tab A Individual",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "SlideLockAIndividual_5153d02e-58cb-45dd-9c35-ecec425030fc.ai",
-    "file_size": 371860,
-    "path": "6694813a-b40d-4aea-94f4-b472d86b2fca",
-    "created": 1755488442350,
-    "modified": 1755488613323
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "ca478ba0-eea3-4495-b890-ebd41d35354b",
-    "element_name": "Slide Lock Tab C Indiviual",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "62e53e3a-de74-4dd4-86bd-b62b2db6170b.ai",
-    "file_size": 365121,
-    "path": "ca478ba0-eea3-4495-b890-ebd41d35354b",
-    "created": 1755498820588,
-    "modified": 1755498820592
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "71a39a6c-2250-44a5-bb8c-e59befa6f2be",
-    "element_name": "Slide Lock Tab B Individual",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "SlideLockTabBIndividual_0027c8f9-45ea-45b1-9f46-25b8743fe70a.ai",
-    "file_size": 734606,
-    "path": "71a39a6c-2250-44a5-bb8c-e59befa6f2be",
-    "created": 1755668129793,
-    "modified": 1758272736499
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "5fe177d4-a1fa-46b7-a007-90de8b4b614e",
-    "element_name": "RT010321",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT010321_ca6f58db-c809-4acf-97cf-3ad3827e7bdb.ai",
-    "file_size": 267864,
-    "path": "5fe177d4-a1fa-46b7-a007-90de8b4b614e",
-    "created": 1756370626144,
-    "modified": 1756385173557
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "73403929-b376-4c34-9f5f-32c363ec965d",
-    "element_name": "RT010322 BMP-2 Mini PART B",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "RT010322BMP-2MiniPARTB_1757568c-30a2-4d4b-8190-51de02317350.ai",
-    "file_size": 260204,
-    "path": "73403929-b376-4c34-9f5f-32c363ec965d",
-    "created": 1756374743041,
-    "modified": 1756385998278
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "10165265-e657-4cbf-8b00-49a2cec95d1f",
-    "element_name": "Pull Through Tab ZT",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "PullThroughTabZT_248a234c-1201-4363-87ab-733902990ff3.ai",
-    "file_size": 737418,
-    "path": "10165265-e657-4cbf-8b00-49a2cec95d1f",
-    "created": 1755487161222,
-    "modified": 1757018008901
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "04c9c74a-15eb-4ecf-a9cd-6be8059eb0e8",
-    "element_name": "Pull Through Tab Slots",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "33869637-cbfb-49b4-b2c3-7155eac801ab.ai",
-    "file_size": 364739,
-    "path": "04c9c74a-15eb-4ecf-a9cd-6be8059eb0e8",
-    "created": 1755487321094,
-    "modified": 1755487321101
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "f9413031-6952-4211-b194-344e933543e9",
-    "element_name": "2 Ziptie Cluster r2 100 x 50",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "2ZiptieClusterr2100x50_44c80673-5f6d-403d-b55a-b009fb728273.ai",
-    "file_size": 1587814,
-    "path": "f9413031-6952-4211-b194-344e933543e9",
-    "created": 1753749365896,
-    "modified": 1757015090686
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "73e15ec4-fc5e-4af0-b2f0-9f58a4b1f1f1",
-    "element_name": "Pull Through Tab Slots ASYM 110 T-72B3 3D",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "PullThroughTabSlotsASYM110T-72B33D_f23a2422-97c5-42e0-bca7-5a755708a222.ai",
-    "file_size": 374436,
-    "path": "73e15ec4-fc5e-4af0-b2f0-9f58a4b1f1f1",
-    "created": 1755487321094,
-    "modified": 1756682249273
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "27d1c4d7-8374-43ac-b566-5ae7d06e7934",
-    "element_name": "Spearguide Inner Track",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Artwork434_96ddfe9c-15f4-485b-b1b5-0e24a6aac0af.ai",
-    "file_size": 385381,
-    "path": "27d1c4d7-8374-43ac-b566-5ae7d06e7934",
-    "created": 1756684891069,
-    "modified": 1756684971928
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "e17a66fe-3431-43fa-8660-e268874c74ce",
-    "element_name": "T-72 Slot",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "T-72Slot_1b1a81e9-d868-4006-a1dc-0f31a63fd3c0.ai",
-    "file_size": 368883,
-    "path": "e17a66fe-3431-43fa-8660-e268874c74ce",
-    "created": 1757471057140,
-    "modified": 1757471263785
-  },
-  {
-    "library_id": "394aa2ed-b6d7-4015-8c9c-600e5a98ef84",
-    "library_name": "RaD Mechanical Design Library",
-    "library_type": "shared",
-    "element_id": "81342b99-0da2-45c9-8f54-e1700e2cdc6e",
-    "element_name": "Preassembly with cutout",
-    "element_type": "application/vnd.adobe.element.image+dcx",
-    "file_type": "application/illustrator",
-    "file_name": "Preassemblywithcutout_988efe8a-aeb0-4c22-8afc-cca5e4235b75.ai",
-    "file_size": 216203,
-    "path": "81342b99-0da2-45c9-8f54-e1700e2cdc6e",
-    "created": 1762127316637,
-    "modified": 1762128028102
-  }
-];
@@ -0,0 +1 @@
+ccFeed.chunk("89544eeaeb3b6787",{"lib":[3,3,3,3,3,3,3,3,3,4,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6],"id":["d8f12a57-1e6c-4ac9-805d-3a2c4bd5792d","be9b7f74-e445-4934-8def-6e6dddbde634","c2630055-2011-44cd-a326-dcd7921a3156","989f028c-6ed2-45bf-a3fd-c75a0779f9b7","a98197cb-bfa5-4a70-8645-a52176472fda","90c35000-d9dd-41e1-81a1-11e9cf53e434","e18a8cd5-c638-4183-97d3-1632565f2c64","c9fd3b91-6d0f-43ed-a767-929062cf6f3c","8432fe2e-5937-48f0-9bfe-6ab86768381e","9c2da393-b74c-44a0-a28f-6c1dfe06aa79","7b8e5aef-17cb-4b67-823a-b20ec37fd039","301afcd4-7e30-43d6-8b0b-a98edb18a37c","3490942d-19a0-463c-bc68-f998902ee9cd","d2364bb7-3a73-4ed4-9bfb-fe5d6adbd95f","37c2e71a-6820-403a-9b7d-854b064c7ca4","2bbeb5a8-5d6c-4ec7-9b6c-8e3c949d0c4b","7c50b7bb-cb8d-43ee-8996-282f0c40850e","c71e273b-4ca2-4b96-a70c-c9317245ab9f","6f692235-89c0-441f-a50f-73e8ad849bbc","8427c619-49d4-4ba0-aeb0-15e11ab64d71","622c86fe-07f1-4a79-860a-9503aa1839d3","692fd656-3603-42c0-9557-62fdfba2c3b2","1a23c5c1-65e7-494b-ad12-1ebe947584f7","49dca1d5-f3e5-4bb4-aef4-f482d6bd98dd","4cefcdfd-626d-4811-9c2d-ddee07d909b3","711d977d-6ac9-4d15-a14b-620917cf71be","b14ea8da-9842-465f-85e8-c3ced09e86e2","2b8cd4cb-2008-44bd-819f-366ff65520bd","77cd1104-c5e3-40e7-a994-1c2288d0e934","3be4f807-39f3-4f7b-b6c7-f31bc13a0ba7","2c6cf6fd-fd67-4086-895c-fdcdae2e2c47","26a385f1-4ff8-4022-845f-569e239edee6","01cbb19a-0a28-4b51-bfad-0dd7134f668a","af6f06e6-9372-4b80-b38d-0edc9294342a","26c8f1d3-7977-405e-b727-a615349058c2","9ac7f4d9-12e0-443c-8b00-6c7da878be31","3f8f9e74-c52a-4a6d-a024-09e21afd1264","9474680c-77dc-4cb8-b54c-c25dbc04df7a","4248d86d-ae25-4c60-852b-3fbb203bf349","7bb3fdd4-ff3f-471a-af9c-cc9a309841df","15eb69d5-e1fe-4722-9c88-0a5a77252da7","3db803c4-e83d-4bef-97d8-4443e857accd","78c8f914-4f2f-4c02-ab23-e8ae2835dc42","ddaff62f-fb00-4db1-9e69-07a14b01ab5a","0bafc884-b5d9-46b2-b393-a1a6efc60723","6f7e3e10-82e9-4c9d-a8d2-7ccf99cced52","479da6ef-efa3-4bcc-b584-f6cddc96640a","23960762-afb4-4f04-9636-7cbb4d7aa780","7e1d1409-c660-4ff8-b444-3940265cdf9a","4bda7d67-fd32-45ed-a1fd-57bec9d830ac","33f0cc3c-17aa-40a4-85ba-de642d91cfef","4ef1d2aa-2214-46ea-89f0-9a33294ccf11","d28e55f2-7100-4c23-b9e4-4e5a57084d72","7335c0d9-db41-4fa4-93c8-6bdf9943a22e","b5ed9ca9-b5ae-4878-b4dc-e924fb630a45","d3c062a4-d37a-4b97-a904-be649e62a531","a87bfa50-20a9-4962-885b-71bbeb3afd02","00fc6916-2a7f-4b58-8a0d-fad994c51a63","4a724604-0a25-4ef3-962a-7b38e5cf1f42","8d5b345a-f6dc-4dfa-bf99-d406f4f5bb9f","0dfb084a-2246-4c26-8d3c-c4ef50a507f0","351035bf-9ec6-49b0-a673-ba738fee1792","45e56976-597a-4f69-ab15-312206fecdf5","43605ee4-9f68-45a6-aed7-d114d281d807","5f6ce3cc-6c01-42ea-8277-a7dde544de44","fc995a40-e650-45bf-9d85-f293bfdafe7a","49f61a46-f142-4a23-8217-144d1772b71a","1bec7dda-58e3-4815-8ef8-092d34640fa8","9522dffd-c060-4f95-b2d2-2b41e872a3c9","ee564dbd-81a7-4711-8401-1f8ba1dbd915","b8644cff-6a1a-4d19-b5ea-558bb23d1d68","a8dd19d3-c127-4884-83dc-2d1074afc936","7bfea5da-4814-4ed7-9dc7-a90a1fb9bfcf","a0a0a7c7-d7a7-490c-a2f7-8b3b7e77ded4","1731a3ff-bb26-4b17-9716-a12e5d2fbe5c","2cb3a9d0-da41-45f7-920c-516e680a4bd8","f02ab5b8-1c99-4062-8de3-44b88602e2a6","36338f4a-6e62-49e9-aea7-0edb3534946d","1ad94c93-40a9-406d-844f-3e19d114863d","0de8343c-04c8-45c6-adc5-558576e4a14a","795eb994-d134-4059-a76f-dcece9596997","c42cfb09-ece2-4cdc-baea-b675467fda1b","2a5c2a26-a853-49a6-a2de-fd90e7ed701d","3a9c3fb1-478c-4231-b028-d4e5fb04f90e","cc6ac299-e491-44f5-b2e6-dfcbb01da1dc","117db07f-0d2d-4fdc-bf04-bcd8186550f7","6db9a2b6-e82a-4ebc-857c-bcf8cfa4e911","650af434-761b-467f-bc87-ebe954840e69","abab261a-7c54-4d51-b0a7-33ed3a80f483","5d7edaba-9607-4931-b4a0-ccf95dc9405d","4b0369f3-2f39-4373-befd-350d3db473ee","50c69db4-b4e2-4633-a3d1-75efa9be71aa","0e55f049-4669-4c48-8ccc-bfafdc51ff0b","bbc6980e-2a02-4362-94b5-cee3971710bc","5832c9e4-6cdd-4a18-a82a-6fd3a8429fda","5d25cd92-3bd9-48ba-9050-c05dd0d1aa2c","b493cf18-bbb1-461d-a865-0611a66f5db2","b363db6e-d734-4a9a-b5ec-829a5cce022e","ee59b3b2-0fd2-4905-a828-13b90d45e84f","94405c22-4a22-4b76-8b17-1539df9ed784","1a11fead-f27f-40e4-875a-abaed6b5bdfc","2c60d980-f13a-4458-98b3-8aba27862105","1cc1f068-55a3-48b9-a8c3-1a35ab7014f0","5cbeb9a5-f1ea-4338-bdb8-b1f1f8911caf","54b404fb-b373-4c32-b5b1-471eb18cb59c","14ed47ca-28e9-4dbe-a8a3-1361e84165c8","9ae32e6e-1685-4838-b60b-610401ac478d","13e3a9c8-21aa-4b7e-8e3d-46926249544d","759d40ac-5ec5-4b45-b03e-3666e973b802","ac3ecd97-f194-45b6-b0f6-c4aae3cf16ac","b430f113-02b1-402a-bbe8-54defdcc6f55","85b9a526-78dc-48a3-b4d4-8de610c1b752","07b23f35-8bea-4105-b1ba-85ac22e36785","4a7bf80d-d2cb-4903-98f8-3522b30af1bd","a36f645d-242f-46af-b1e2-a88dfa412001","91ff86b6-993e-4e3e-94a9-8eddf867e1b5","a000f4ca-565d-499f-9833-5c8506a93332","d7a2f6f0-a323-4616-8f8c-17834519fd94","0a75a270-86a8-4f67-a5be-ed5209cddee0","b49729dc-bd09-4565-a0c8-1c094f09c7d7","4a8922ec-4026-42e6-b760-13fe16bdfe2b","7cef97a1-2314-4f23-a812-95956d676de8","b257f14b-4f80-49b6-9f52-f34efaedfbec","a6a1ea1b-787e-4879-80b6-b589f097202c","abb6a066-f837-44f2-b75a-d67707091b28","87bd2fe1-c2e8-4b10-a57b-bb7917735819","f967cc40-c06f-4be2-a01d-cf2cb8a901ba","28df4d96-4c91-4f6c-9f0b-d55c055769ef","44cc21dc-0ba7-4102-9ba8-9aeaf9f86afd","61b771c7-93e7-4401-93c5-2c54e1fb83ab","91f3dcf8-1300-40c1-9545-92bff99ee78b","7fa4774c-bf68-4eff-b2e1-f54a336ee268","32c0b65c-360e-4a08-a3e4-2aca82c727f8","f03e29b2-d9ef-4766-95ed-428e9491977e","7fbf881f-df9f-4e00-b5f5-71648d3f129d","d3cb82ce-9d30-4750-97c4-c78774a59d10","1551d03f-6e24-478c-8213-a83a627cafbc","83ac21f7-3f3f-4683-a815-d3d9cf1f422e","cd60f038-d971-4252-a50d-c2a18e9aabe7","66b1dae8-6c74-489b-ba57-591d5d19a06c","63169124-8878-4f6f-98cd-6b15c78df9bb","9130fef6-b348-4611-91e1-31fe2b611a5e","a233da5b-8b52-494e-9a5f-09427c03ae4c","01973739-4a2b-412e-83b2-e9c2e5a795ef","87f3b91b-7fc8-4fdf-9133-d70c2cde2e31","a2746f8d-851e-4057-a694-9593c2273f8c","e9934785-bc36-4ce1-81f3-65c99f9a8a21","6caee83c-d391-433f-a84b-a9c12074c5b5","d00bfe79-48cd-4ff3-866c-1496a5c0bd17","3e251a25-7d63-4183-820d-001a7630f01c","fc0f916a-4450-49a0-8467-810f4d594f86","934a4bbf-ea0d-49df-9d67-7038739f5bb9","0b873044-592b-4b94-83f5-b2e1964c2d96","6159660e-893e-4f75-aa5f-cdc63cdd2c12","702b5f10-9a68-4b48-a86d-848e6c232c25","5b2f1605-3e2d-4ac1-93a1-a1e85fe3541e","8c4e0917-7cb4-4d73-819b-c6d04d7d0318","491394bc-60c1-437a-b883-29e1dc8dc755","2e3c0345-72f2-498d-82a6-02f3bc314fdd","054080bf-7190-4612-b75b-2daa654e12ea","da09a297-310c-4e6f-836f-f78f72373317","ed5d853d-4054-4fac-bd9d-0d37474690e4","cecee876-0350-42fa-9e4f-02520751094b","fb5c88d8-d1b8-4b1a-b9d8-afb97423cdca","c1157350-6836-4478-ba0a-ca44f4364e15","e601db6a-ce9e-49d6-8033-a2bb94aa0620","c83eae98-1037-4b26-8954-9de6304c8abe","08d635f8-4313-41a8-9576-434b91f0f438","61cf270e-4ada-46ee-9a0c-277a69e811a3","d2c9e377-df93-4fdc-bebf-92d5bbe6c46c","f52bf513-4072-4107-90e0-a1cf7bf96d67","2b5478e9-5a4f-42f5-a9d0-6d48ac7031ef","4991d89f-c85b-427b-8963-786f60eb4f64","959e5d18-8c26-40b1-88e1-2b4543c5b84c","4fe991d6-90a4-4c47-9f79-aa5c03a74d79","391fd0c7-86a6-4eb5-9276-dd829d26c9b8","8649be3a-c2a6-4a47-afd7-08be8434af0c","74cec3bd-3406-4bcd-8d94-9dd25c691fe9","c404c7b2-1f4e-41d3-815c-1d418116dd1f","e4053f27-d219-4008-b53b-c04b7ff0c198","328cd7d3-1e33-4cce-bc18-5a55b7792470","c9649234-7d18-42f4-915b-895961c5fef0","2b411952-c29f-441c-a4c2-8c4172a67914","26ecfd04-c808-4298-a725-92f53cc2d998","7008639e-445d-4d0e-8745-5740a0635d7b","9dab3988-a274-4af2-9715-009b51d92bbb","c1039699-501f-4d01-93ad-2507c034b5f4","2ac753a2-c8e0-401f-9210-7e2418d70d6d","5d056b9f-9556-42b8-9d21-8f3e3ed27594","075b68e8-dab5-4a18-b49a-cdb23f29338d","a4cd3195-aa14-48f7-a2d3-705f87c2987a","80be2ca3-80d4-4afb-a2c6-6230d35f5a0d","67595059-9a10-4b5f-8738-066d9789532c","3d49d67b-d941-45e6-9a07-bcb4245eeaab","1752354b-85b7-4ee6-848d-39a839044147","af6dc40b-5df5-497c-9b9d-7cf29268f2c9","29510a8f-565a-4991-bddd-345113304d36","e81385a7-3324-4604-9fb6-87f1b846047e","3beed89c-85dc-49af-b364-99235af85a4f","0f0fea08-4fd4-4f8b-8243-781f36f71efd","5d03cf48-f579-4b20-b5d6-86d77e18b647","1a57b836-1f2d-4e37-aa49-c9530672c692","be5f7b8c-a080-4de4-823f-eddc002d220b","895bc4b2-39b5-4b34-9471-6cba14833714","c4189c63-96da-4aae-8fce-d97d79566c7c","f6042474-b6d4-468d-8bbd-9369c6a2a581","3dc024f7-88bf-4c3a-8753-646d0a28dd4e","e2f159b1-ae9f-41ab-b02d-4513e6c2e7b1","f5d6637d-2b83-44d8-8fe2-81a2abbdb452","9946deac-9e2b-462a-86a0-4a28d005410f","cbad9c1c-ef39-4481-8389-4d47998b96f0","e8ad13a7-1686-423b-9ebe-665ca17aec31","c7896fe6-b210-427f-9d4c-06a4ef4ebb1f","72d11ce1-266e-44b4-8dc5-64d6780f41ca","dc583d1d-4932-4b6c-99bc-9d3ba1cff876","4cef37cd-e17a-4e55-a246-77956daaf221","9fec3325-c8d7-422d-8866-47a6c87689b6","77fb00c0-1cf9-4a45-bfc7-782a6777768f","33edc667-968c-40bf-901f-de284e956e2b","9582d5c8-da0b-43d5-9372-1d1b1f62a0ec","afc2c656-78b7-47f7-af5e-f810c05231ca","d33ba23f-fd61-4bb9-987c-11bcc0b07633","fe255bc2-0af4-4bc3-ae9a-22eef5ac3de3","6259d722-8201-4ebd-ae78-9384a22697fa","8ef0070b-dc03-4c6f-9441-d181df3a73b5","fac0c783-f532-4912-a32a-834702a24903","a79ddf73-4292-4170-b7e5-0a82b6724117","ed9f3a11-5b56-4acd-b45a-0588c7a3ed47","4a0da64c-0817-4cac-b4d1-1ee201d0fa22","7f7f9bca-208d-4ead-b654-b6b45cc88f4a","e22f7ce0-c9ed-44b2-8699-a577b1d852bc","8df413c8-d299-4ff5-9d90-14f733240e78","0243c22c-11dd-4224-9508-40d117afdfd4","66ecd1db-51cc-43ac-b3c8-7276790b9f93","17b4d964-2e8d-4e7e-8c30-0ead936e6b8d","fab795dc-c8a6-4fcf-8c0e-e8529fd39552","782a4716-1f5d-4ca8-871f-50cffb3939f8","877a3596-90e8-4f2c-835b-3c6a3f8fa63a","c7f64752-3187-467e-bfed-31ad08b87b23","ee854152-4c31-417f-b2b0-58299b9ad4f9","f0cb3bc4-9fc9-4624-938a-3bdeacbb809a","2577b192-1f56-488c-9ca6-d719140e49f5","2ee08b78-9c94-4fcf-a82b-f2d42cf67243","0f280b08-2ef4-4474-adb1-cf36f0a3bfc7","0a19ed44-dae1-4bdd-b07e-92d188f41032","c8172440-dcfe-4cfb-b4ee-492b8e1548ec","aee30ab2-a404-4503-808b-ba74691d3f80","91d03cfe-a180-42a1-ab4c-2558857da21e","26d3358e-457a-467b-863a-387be32a5608","a78a1c83-834e-4005-8d47-8f0dd82628ec","50fbc21e-4b42-4e7b-a045-b38135fae2f9","97a4de26-b841-414d-b3ea-d000d4cf1652","86fefff2-aee3-41ea-a4a2-3fc636ed70be","5ba45d8a-ffbc-4dd4-b1e8-0fc54115b693","557b60d3-ded7-44a9-9daf-0a155d8809c9","31a561ba-25a6-4b5d-9145-cf3766abfe09","b28aca25-acce-4d02-9d19-8ca646a3e925","57db3260-99cb-4218-bf1d-3237d1757345","e4bb8607-cb9e-4ffc-917d-4543998b2e98","e70a8185-c688-43b6-9b40-e8d255067bb5","c759c0d1-90a5-4116-8ef2-556761993527","35bde82f-5cc9-4c5d-b564-d95e942d4150","acf685e7-7af7-4edd-acef-ddf4243bdbc7","20a8f133-d004-4e48-8fa4-a20f92f27250","5227a20f-e0dc-4ad7-9953-6fc09d23e1d3","ee3cb91d-ab71-4a07-ad85-478387567a98","14fcccb5-5376-4d5f-a22f-95437783f34c","158d2867-ab28-4913-881c-c1ee6a4ab6fa","ac95803b-8777-42f1-95b5-29dbb6ae59eb","59c15446-732f-4e27-b310-e2af70344645","0ee86d29-3b65-4667-89d0-31f964501d18","fe4e15f6-06f6-4b89-819d-ecee6c08a9c3","7080b0c4-fe86-4347-a587-5718455da893","bd783e4a-dae7-4b31-af8c-2c4b4ef53451","809f4f45-2930-48e1-adcd-de5b6177a6e9","cd95dce9-24fd-4f41-ab78-5e4c2537db98","f1d9ebfc-f441-4940-9e56-9afea5097e9c","2be8b778-0f41-42c2-bd2d-3f2714f1065d","121b5020-8349-43a2-ae49-c7b109f1464c","d295308d-3773-4e1b-98e1-7f74fc36212c","c1a572ca-46ed-4203-927d-2c9fa5cd2e32","d7a60fe4-3ac7-4bcc-bca0-e8dea0c0ff8e","8eb104ef-11f0-4e08-9917-2304f384571e","bfec1d7a-c6b2-4822-92c1-c3d7678efeb9","32ecba68-de40-4d8b-a214-94e4b7447ceb","c0892cf8-5683-4d7e-9fc7-4b68ad3b57cc","b891a5ac-c044-4417-b641-045927ed806e","9954f012-d603-4dc8-9021-5d377ef89e52","f87c172e-b249-48b0-b53a-90b382b5a91a","142ea31e-fbdb-435c-843d-30da6a659e63","7f9f4c9b-690a-4c46-bebf-ed910539b0d8","fe5197a5-7051-4ea4-b6aa-45d1de2897b8","98590095-754f-4270-9477-9bb26bbb5a2c","31cf5cfe-9ff2-4ab9-8a19-c4f67c8f6515","511e4d38-58a5-44e5-a08b-a066d1a37af2","578eb882-c6bd-4302-97a3-bd870896eb18","3820dbdc-0ec5-4dff-9b58-7a90f8da1a89","a85b7a73-b256-41f6-9208-60fab5732709","bd988f1d-420d-4833-a48b-d9002e1ba12a","b5badb11-d636-44b0-962e-5d3ca1c1fb52","b2eaff9b-f6fc-4a79-bb99-2e951234d4d7","3be6d1ec-657d-490a-bec3-6507f217a482","707d3e20-cd8e-45e8-a068-ddba57bcfa91","60f750fa-2a32-4f54-ba29-ebdc6750d308","3979e4d7-51c2-4983-a710-08581add033a","35086207-2e9c-4acb-9eec-87065229a3f0","2b3ff55a-e6b8-4d86-a379-59fdcf426fc5","e13d0d04-0dfc-4d54-953b-8c4999e5bf07","64699471-ab56-4edb-811a-47f81363aa47","6b8fce08-6860-495b-8003-ef2dbd6d9996","53c518a5-5c31-4957-b644-848281f8d4de","80032c29-6dbc-4d70-aa57-532ebe071038","1aa6ef50-e1db-49d9-917e-a27fdd241c06","1be1bfa7-9e60-4968-850d-670c286bb100","90a492cc-c55e-4eff-b42c-6d3071633ece","93d3e660-e31c-43a6-a566-c587ddbb122f","a581e877-57db-4f14-8715-52e8597af45c","513accae-62be-4c8b-93f5-a2c24dcbdccb","dacfe722-5ae3-4160-b508-36c82fce7bb5","cc7e663a-b1f2-443e-b09e-ec35e06ca462","1f1b6cb0-984d-48bf-9e1a-c1d13bd0b837","964ab222-0088-4c04-ae65-9b10e51c98ee","43006912-675c-41f7-816a-da003b90c35f","2ec07b8b-4348-4a31-abd0-78d57d5a80ee","02f8b557-05e0-4602-88ba-efc16f20b88c","4062159f-6839-4aeb-87bb-dc7a65db59ba","b181c1f5-ed93-48d1-8318-d5b2733fc374","b8d782da-b368-44eb-a3d3-c42cd6fafdb7","599cd3d4-dc37-4b17-81f8-7a72f4ef7616","2338e030-cc59-4c4e-9ce8-d8c8ec77418f","8239451e-469c-4261-8807-edb9e3d146ff","87c85099-aece-4c8a-a903-ff6a06b9b43d","226ef43f-2f2b-4944-8e5c-587b408249c0","d322e35c-be1e-4fed-b58c-1b56d954acd9","9b1d9a43-93ec-4ffa-a365-79ff322c4746","0e541a8f-52b0-422a-9948-820e744680a9","3d1128a8-ad57-40aa-83c7-4494b53cc955","58c0ee0b-65ea-492e-9a68-503f27dcdc16","350764cd-20cf-4dc6-b692-16126cccb7cf","41880830-3222-4851-887d-8a91f82c1f9c","3974347b-f99d-42f3-8a53-b3ab57db825e","2ed42f83-199b-4c04-bed9-514b7ea169fd","bbd36ea0-eaa2-454a-9564-2fc5532a680c","c522d40d-a720-4a32-97df-2e0730f75dfb","1fab6220-e75c-44a9-bd8f-8ace11ee4892","07b73e3d-8975-4b6c-addb-3c05551149bf","9fe77b8f-8d35-4ada-a1f3-064f8ca5f98c","76bc99de-86b1-4162-bcd1-8af32931ff2a","828d4d06-76d2-4a2a-9215-11db3c65daca","6d125253-7b5a-4be4-80a9-978223fb0614","e5b58547-09b0-4219-915d-93e6adc5c2f5","b325622f-94ef-4149-aafa-07091fdd0edc","206035f2-2f74-4ef3-9fbe-f8a7a221fc79","63e00f83-7400-4985-bbf8-83c39021f63d","f9f110ea-6a51-49d8-a7d8-3a68ce1a3f93","005c9b2e-f056-4d94-a1bf-d5d9599497ad","314a5fca-3e01-4051-8342-e9e622d1bbb4","b7a9e9e6-e9a0-41d9-a3e0-3075ec87379f","e02ba4e2-e468-4f5f-8092-6af52301b5ac","76564cc3-1f7a-472b-9666-d829fa8762cd","44f778dc-1f06-43fb-8b09-e4a42568f96a","735d1c65-eb5d-4b64-96db-3493002b9f98","1bfebe42-6fc7-4030-9a9d-c3ab5d0aedea","cdf82081-638e-4686-8f3f-8bb7e77d587b","02aa8fb9-0b3e-433d-bf6d-63ff76615700","94c73a95-6014-435e-88fa-851889c54c4e","964dec61-d148-4954-a71c-dbe17b9631bb","427bf020-530c-4a72-8405-46e8f6d12a2a","9f57573c-e2a3-47f2-9344-8785dc338e34","98c4fa1b-17a0-4343-bf3c-a4e6b4d121de","94a7714a-751b-457b-9e6c-f7b440e206eb","19bea59a-3572-428b-9ef1-1985d0308a42","362c91d3-3e05-4167-8737-383e2049675a","629de6e2-b689-4aa6-88df-bdedc2856d7e","e2869e78-8d62-40de-a7df-94c0b4e22dc9","d59a82aa-ebd7-4e00-9b33-43cc4c97551b","d930f724-619f-4fc2-97d9-fb2db590833d","c3f57843-b94e-40fe-baca-7f70f4695a2d","2445a696-6549-4795-9f8e-4694e351cb91","9e9594b1-3866-4845-aeea-5e57799b5a75","1c50d408-f8c2-4ee8-821f-c78ecd9fbcca","fb715f0c-ce5b-4a95-8d37-8c5b129eee9f","13b94af7-c113-4f32-9a9c-09053e747855","7c81601e-122c-4b1a-a264-957961449624","a57e6130-ca68-4dfe-b78f-02ee2d8796ee","bf43d96d-67d6-47bc-ae2e-464fe46f10c4","1095b6bd-b00d-48b1-82ae-634c86f786fe","1330b8b2-8359-44c2-94bd-3e667e521108","ce55910a-9f78-45a6-9dbb-f36297142ff3","9a615e55-c504-4e67-8e98-30b68d393e63","29320c10-310d-401c-b7b8-faa76160759e","648fdc24-eebf-4d20-a4c6-7f191de6c816","fcc82283-6d8c-437f-9759-9274b74e977f","74c83051-8251-4108-8fa5-e8f72abe1764","6f5ea212-0597-4ac4-9d1a-aa0dd5a41df4","20d34a5e-1f7f-4d5c-8fb1-284861fa21d0","b7b42418-f668-4ff1-a359-de334e6e7e5d","b6ee5de6-8123-4d4b-a7d2-5de7d104fe63","e9e4b877-e163-4f22-bd94-ec37f498b289","e49d4369-6016-4409-a133-2f70fb6c9b0a","a5824f63-e25d-40ee-919a-9ad7c24085b9","4018619d-50fa-404f-a002-9bfea4cf557c","a4824f71-34f9-4966-9951-987a6f3c9eb8","93d4795a-3256-4b62-930b-5d83205ef1ba","88355cf8-6fbe-47a7-932f-182f632a5fa3","ab5c8b82-96d3-42fc-a94f-584b03f64ade","5e0254c0-64ba-4537-88e2-47ea54ab2042","aa097150-8ebb-4365-b561-802196bf7b84","838fc3e7-1075-42b4-90c4-6d4176cb93e4","192fb4a8-22eb-4877-8ac4-cbc0c8d591b8","46c0e6f8-697d-4b54-93e4-b3cd8027c72f","5988173f-fab9-4cd2-87be-a4f846f56132","afbb7a60-8ad7-422e-8348-552d5ec85db1","6779cfd6-f9d2-4ab0-868e-b49912583a45","c010fe5d-8291-496f-bff1-d657936cdaea","16884336-9339-4b28-a4fc-cca5ee9783ec","af4e6574-0e96-4bfc-a561-6f828bdd3a44","a8d668e0-ed87-422c-9e56-ccda331e3797","aa34d8e9-54e0-4005-b4ab-744df25bd0d4","8d0e6537-eb00-468e-993b-85a3e961c9f7","f66f80f7-5d2e-409f-81a9-4c10119d5125","2568a7dc-71a4-4938-b533-b3d01146ef90","eb38ed96-310e-42b1-8ee3-6bf9c7746f52","f0dda3f2-fac9-4cfa-a700-04d1d1af8249","86c140f7-0757-4463-89c2-eff411255785","a6eb093b-7f14-4a8a-a782-2504d98a2454","c9c68472-6e86-44bb-b0e0-1ccc30fd9376","6bd20883-e6ea-4f11-9738-294224e41295","7ad857e1-2657-40c5-b41e-e5883942192b","e68898b0-8195-4980-ab3e-54ecb797df4b","a760ba5b-744d-4f76-947d-ec6f30968cef","738020b1-2d0b-400b-b47a-a9e30360ca45","fccde7f3-638e-4a39-97eb-c99964a0cd60","f805d477-11b2-4502-93ca-a2ca2fee5d89","03e28c97-61fb-4703-8a82-4d117c10d4fa","b9935e22-5e4f-415e-89d6-7ec2b03e0064","1d16500f-38f3-41df-b247-8a3c74a27c79","d3e32b75-87db-4466-91fb-9d09cd1ea824","7c84a747-27ad-4e7a-95d5-d5d6180439e0","7983cd74-5f58-4bc1-b448-ab86b3a89415","0155888b-23b5-48e5-bed2-e9aa0f7cd330","e80afc94-db92-4081-a682-734c22fc19fd","3ec6f6ff-e3b7-4eed-b772-6c26215cd279","28163977-bdea-42e1-8209-4902cd705e73","326cc661-d3e2-4679-a2cb-e4f08e235ebc","19d68398-1b52-4050-acd3-17d5f86e18e0","28966f33-ab98-4ae4-bb72-e43b178fdb6a","6cf8a44c-4086-4553-82fa-ea0e6292ca7e","622fa8d6-74ad-4f6e-a5d2-5399df2d14b3","aee9a2da-7244-4940-ba07-661a7da37e89","ee762080-3b70-4b10-8c9a-ade3b992d551","dfbf1e43-1083-47e8-980f-46bace28afcb","0b87389b-85b3-4184-a766-f441dcb4ff1b","c14a8417-4807-4ef2-a3ea-7d0133e0e63e","1f90e579-6dee-42b2-9a49-3c23bb643edc","3b905220-8ab1-4045-bce8-d914011cb639","d748d77e-a27c-475a-acab-075d8eead984","5b77126a-9e64-441b-8b0d-5b97409651e9","8aef192d-ecc2-4df4-956c-db42b420b128","a97176c4-7125-41c6-8f38-f68496307196","f645acba-071b-4553-9690-3a25400fc6d2","dd5b0751-0af7-44ce-bb7b-322830860c75","15a7482b-e1e8-4d55-a615-1e9480a0b1f9","e58beb84-26d6-4e88-a4c6-610cde6e6973","f16e3913-c743-4826-9a8a-5328a1cbf422","71f8facd-1559-45de-99f4-7b4eeecec5be","51bb5cee-d0ea-42f5-9baf-d8e97ae0f8f1","8f7ce89f-8c18-4ac3-b72b-3c23d1e384f9","1241d29f-6b24-4f83-90ca-b33defb04d22","b06afd61-a909-4b4d-b05e-5c3987b5a3b2","ccf7457b-5167-4005-99d5-982ca3742963","32f1e472-16ed-4064-94ed-b67273a440d5","5b30075b-24d1-4563-bbc0-1772b3f049ba","f2b9fc89-d119-4a43-88aa-815920627b6a","2e1c0520-e004-4ecc-89dd-1a5fce29c493","e0a6afd6-f8ca-4429-99b3-e3168526b92e","5dc11559-848f-487f-acd7-02821e3f8101","be26e666-0b11-4040-bef9-740d770f9ce2","ca9931ec-6dae-4c1b-8858-dc1add966100","133adb0a-ab9c-4541-b3f3-45b071a7aaed","f9c730bd-0a17-4340-836d-9c8a5b713fc9","6694813a-b40d-4aea-94f4-b472d86b2fca","ca478ba0-eea3-4495-b890-ebd41d35354b","71a39a6c-2250-44a5-bb8c-e59befa6f2be","5fe177d4-a1fa-46b7-a007-90de8b4b614e","73403929-b376-4c34-9f5f-32c363ec965d","10165265-e657-4cbf-8b00-49a2cec95d1f","04c9c74a-15eb-4ecf-a9cd-6be8059eb0e8","f9413031-6952-4211-b194-344e933543e9","73e15ec4-fc5e-4af0-b2f0-9f58a4b1f1f1","27d1c4d7-8374-43ac-b566-5ae7d06e7934","e17a66fe-3431-43fa-8660-e268874c74ce","81342b99-0da2-45c9-8f54-e1700e2cdc6e"],"name":["Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","RT007760-bkdxfya","Spot-Black copy","R=128 G=196 B=28","Artwork 291","Artwork 289","Artwork 290","Artwork 292","Artwork 296","Artwork 294","Artwork 295","Artwork 293","Artwork 288","Artwork 287","Artwork 299","Artwork 297","Artwork 300","Artwork 301","Artwork 302","Artwork 306","Artwork 304","Artwork 305","Artwork 307","Artwork 308","Artwork 310","Artwork 309","Artwork 311","Artwork 312","Artwork 313","Artwork 314","Artwork 315","Artwork 316","Artwork 317","Artwork 318","Artwork 319","Artwork 320","Artwork 321","Artwork 322","Artwork 323","Artwork 324","Artwork 325","Artwork 326","CNTR universal edge RT007544","Artwork 396","BMP-2 DECOY 9LEFT REAR CUT","P06 CUT","P06 CUT","Artwork 92","MBT_THERMAL_SIDE","Artwork 96","Artwork 93","MALE 5mm","Artwork 95","v4 MALE 5mm","FEMALE 5mm","v4 FEMALE 5mm","Little Female","8 MM F - dual 5mm MalePoplock","1-3 MINI SHEET CUT REG OVERLAY","LIttle","Big Male","Print Reg CUT PATH ONLY","Big Male Long","01R","Artwork 159","Plinth CC Taped","02L","Plinth Corner Cut","03C","13C","02R","12C","01L","5MM FEMALE FLAP","04L","5MM MALE FLAP","5MM MALE FLAP","05R","05L","04R","07R","08L","08R","07L","09R","09L","10R","06L","06R","10L","12R","12L","11R","11L","09L","06L","5R","06R","07R","07L","08L","08R","09R","03R","05L","04L","03R v2","04R","01L","02C cut path (no locks)","01L Path","02C","5mm double female","5mm double male","5MM FEMALE FLAP","5MM MALE FLAP","FML TOPLOCK","Bum Rear Spacer","Female CL","Column section Z","8MM DOUBLE F","8mm SINGLE MALE","C over 100","8mm SINGLE F","C Overlocker 180 200","C SINGLE Overlocker 180 200","ML TOPLOCKER","C over 75","C SINGLE Overlocker 180 200","03 COLUMN FACE","nOSE tRACK LOCKER","04L FRONT FACE","BLANK 75mm 1:10","BLANK Overlocker 180mm 1:10","02 ART MECH","C SINGLE 100mm 1:10","Tail offset spacer block","Blank Prod Title Cut Reg","01-02 poplock block","R2.2 M 8D5","R2.1 F 8D5","01l art mech","8MM DOUBLE MALE","R2.2 F 8D5","03L FRONT FACE","4L FRONT FACE","5L FRONT FACE","8MM D MALE","8mm D-F- to 5mm OUTER","CutContour","06-07 plock","8mm Half Cut Bruise profile BETA","REAR POP-BLOCK","HULL STRAIGHT 1:10","Herrignbone laserfold","8MM SS DOUBLE MALE","Artwork 193","cuntcunt why are you not a vector","SpearLocker Male (5mm) 8mm spear T-72B3 Double","Artwork 204","Artwork 195","5mm REG WITNESS PRINT","Artwork 153","REGO PRINT","REGO CUT","RT007846","RT007726","Artwork 397","RT007749","RT007974","RT007950","RT007831","RT007976","RT007975","RT007973","RT007977","RT007988","RT007985","RT007986","RT007983","RT007987","RT007989","RT007675","RT007716","RT007718","RT007719","RT007717","RT007803","RT007720","RT007840","RT007837","RT007798","RT007836","RT007713","RT007794","RT007793","RT007721","RT007762","RT007797","RT007795","RT007759","RT007760","RT007805","RT007802","RT007800","RT007801","RT007886","RT007984","RT007990","Artwork 398","Artwork 399","RT007991","RT007979","RT007980","RT007762","RT007710","RT007978","RT007760 master","RT008039 CUT","AS-90 Side Stitcher MALE","AS-90 Side Stitcher FEMALE","RT007721","RT007795","RT007793","RT007794 CUT","RT008040 CUT v2","CT9 F","CT9 M","200mm","200mm slot void","200mm","316.5mm","316.5mm slot void","PT105 130mm cover","316.5mm slot void","SL65 x5 with 5mm cutout","SL65 Overlayed","SL65 x5 Overlayed","SL65 x5 Overlayed","SL65 M&F V2 TAB","1200mm (6x SL65)","800mm (4x SL65)","1000mm (5x SL65)","840mm","835mm","130mm M","200mm M","200mm F","130mm F","200mm F CLEARANCE HALF CUT","200mm M LESS CUTS","SL65 F V2 tab Single CLOSED","SL65 M V2 tab SINGLE CLOSED","SL65 FEMALE","SL65 MALE ENDCAP","SL65 Male V1","Ziptie Fold Tab","2x sheet 75mm single side","Cut and fold indicator","Fold indicator","Artwork 224","Artwork 226","Ziptie slot","Artwork 225","Left End","Artwork 237","SPLINE","Half Cut Contour","REAR V-Cut 45 ","Turret LHS BMP-2","Turret RHS BMP-2","BMP-2 Track Bottom Cut","BMP-2 DECOY 2LEFT CUT","RT007972 CUT","Ful Print reg RT","RT007908","RT007906","RT007910","RT007909","RT007888","RT007889","RT007890","RT007891","RT007892","RT007893","RT007894","RT007895","RT007896","RT007915","RT007868","RT007871","RT007873","RT007881","RT007883","RT007877","RT007867","RT007878","RT007879","RT007880","RT007869","RT007870","RT007872","RT007875","RT007882","RT007884","RT007885","RT007886","RT007911","RT007666","RT0007916","RT007887","RT007846","Rectangle Pair","RT008080 CUT","RT008082","RT007972 CUT","Ziptie clusters","RAIDER DRAB OLIVE (Digital)","Ziptie - 2 parts (1 & 4)","Ziptie - 2 parts (2 & 3)","ZIiptie - 4 parts (1 & 8)","ZIiptie - 4 parts (2 & 7)","ZIiptie - 4 parts (3 & 6)","ZIiptie - 4 parts (4 & 5)","ZIiptie - 3 parts (1 & 6)","ZIiptie - 3 parts (2 & 5)","ZIiptie - 3 parts (3 & 4)","Artwork 408","Artwork 407","Artwork 419","Artwork 414","Artwork 410","Artwork 418","Artwork 415","Artwork 412","Artwork 409","Artwork 416","Artwork 417","Artwork 413","Zip ties v2 compound pair","Zipties v2 single","Artwork 406","Artwork 405","Artwork 404","Artwork 402","Artwork 403","Artwork 400","Artwork 401","Artwork 420","Artwork 421","Artwork 422","Artwork 423","Artwork 424","Artwork 425","Artwork 426","Artwork 427","Artwork 428","Artwork 429","RT002385","RT002388","RT002397","RT002400","RT002393","RT002390","RT002404","RT002392","RT002386","RT002389","RT002398","RT002399","RT002401","RT002403","RT002391","RT002394","RT002405","RT002402","Half Cut Contour","8mm D-F- to 5mm OUTER BLADECUT","01L","02R","04L","04R","09L","09R","10L","10R","11","12","13","Blank","Blank","Blank","Blank","Blank","07L","07R","08L","08R","05L","01R","02L","05R","03L","06L","06R","SL65 F v4 Closed","SL65 M v4 Closed","Artwork 430","RT008167 CUT","RT008168 CUT","RT008171","RT008178","RT008170","RT008169","Artwork 158","Artwork 181","RT008178","RT008180","RT008306","RT008179","RT008309","RT008301","C=0 M=13 Y=76 K=8","OVERLAPS","C=52 M=100 Y=33 K=21","C=52 M=100 Y=33 K=21","OVERLAPS","OVERLAPS","F","Artwork 431","Artwork 432","In-Field C copy 3","Z - Internal part ties","Artwork 433","Ziptie Fill","Ziptie Fill 2","Ziptie Fill 3","R=189 G=178 B=157 copy","R=189 G=178 B=157 copy 2","RT NEUTRAL GREY - MMTS copy 2","RT NEUTRAL GREY - MMTS copy 6","RT NEUTRAL GREY - MMTS copy 7","R=74 G=44 B=106","C=100 M=100 Y=100 K=100 copy 2","C=100 M=100 Y=100 K=100 copy 4","RT GP Green copy 3","RT GP Green copy 4","RT GP Green copy 5","RT GP Green copy 6","RT NEUTRAL GREY - MMTS copy 9","RT NEUTRAL GREY - MMTS copy 10","RT NEUTRAL GREY - MMTS copy 11","RT NEUTRAL GREY - MMTS copy 12","RT NEUTRAL GREY - MMTS copy 13","RT NEUTRAL GREY - MMTS copy 14","RT NEUTRAL GREY - MMTS copy 15","Text 1","2 Ziptie Cluster","1 Ziptie Cluster","4 Ziptie diagonal cluster","Cassette and 5Double Sheet Map","Double Sheet Map","BMP-2 Double Sheet Map","Doubles Column","Push Through slots 08.2025","PUSH THRU TAB R1","Push Dart","Pull Through Tab","Slide Lock Tabs","Slide Lock Slots","V-Spear Cutout","Pull Through Tab Slots","Push Dart Slot","Slide Lock Tab A Individual","Slide Lock Tab C Indiviual","Slide Lock Tab B Individual","RT010321","RT010322 BMP-2 Mini PART B","Pull Through Tab ZT","Pull Through Tab Slots","2 Ziptie Cluster r2 100 x 50","Pull Through Tab Slots ASYM 110 T-72B3 3D","Spearguide Inner Track","T-72 Slot","Preassembly with cutout"],"type":[1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,1,1,0,0,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"file_type":[1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,1,1,0,0,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"file_name":["Photoshop Temp715130014289.ai","Photoshop Temp715227414289.ai","Photoshop Temp715664314289.ai","Photoshop Temp857217123398.ai","Photoshop Temp857614423398.ai","Photoshop Temp866447923398.ai","Photoshop Temp866811723398.ai","Photoshop Temp869213223398.ai","Photoshop Temp877644223398.ai","RT007760-bkdxfya.ai","","","b6ce2951-1b38-4306-a6c3-10fab27ae56c.ai","831116d4-32f4-433a-8797-6de4df06c5d5.ai","50ba8a35-83e0-4992-8505-25a079bac10f.ai","3a3bdde5-14c1-4ba6-9eee-812fd4c602a5.ai","3a30c66d-5749-4c3c-8673-1b3613d2dc49.ai","e67c5a9c-e157-459d-a8f5-d864f657c5a8.ai","040eb722-e23b-40ea-9d8c-f2ab6aca1c36.ai","744b8793-aa64-4982-a08c-48f608060009.ai","72710203-b2fa-479d-9e45-4c7fcbd92748.ai","8ff1fc8f-0914-496e-b340-b3a338c40c77.ai","7f7ab615-dc2d-4cfe-926d-5e71357ce2d0.ai","4f0104ab-b3bb-407a-b7cb-f7c5c622bb80.ai","8e4104f4-d7ea-492d-8d27-67801b612741.ai","4c5c1968-e669-48fc-b16d-5da3a846fce0.ai","e779c43f-add5-4615-a28b-0579c280f259.ai","ec9ffe0a-cacf-4e7c-9947-672752d74906.ai","9c5f1699-d1e0-4fd3-86ff-569be97dcb39.ai","f7250fdd-364f-44e1-8e2a-d83c535ff884.ai","2ec285c6-b605-4b9a-befe-f4e974013ec9.ai","c8edc29a-9c3c-4907-a682-6c2fef9d9daa.ai","d4533232-f153-4294-a823-7ebc455c4a71.ai","e32daf28-d6b3-4f62-a478-e85a8e001b19.ai","3ce09359-281e-4ad6-bdc3-67fd193e9f30.ai","e7f2b77b-9e61-47cd-aaa4-1929bd1dd264.ai","dc2b9c90-b2da-4e81-bcd1-1e2ec6484105.ai","e7673582-3a9c-4c58-aa94-baa3254eca21.ai","f932606a-86e0-43a2-9d1b-b4ae788f9556.ai","2b3fd768-bbae-4a6a-b223-a3b033d4c9f8.ai","660d3a69-56f2-414a-a1ee-d60b7134c2d5.ai","a835156e-e7eb-4022-b955-f31d0272bd7f.ai","f69e4269-aa34-48ff-9628-e7d974f714fe.ai","a09ff93e-adaa-4678-a710-a603695b63d4.ai","adfd52f5-ad99-4420-91a8-77507e567a3c.ai","c9648c48-660b-4cd1-81bc-169a6efb50ad.ai","f130b4e0-86e1-4cb6-b856-55d5d5a0f945.ai","d6fe4dce-0b41-4201-bc97-35c8d8c41d71.ai","7a6ce1f1-8c6f-494a-8411-c30322ae6481.ai","ad9ea10b-e5d8-41ea-839e-06ca9a69d5f3.ai","CNTRuniversaledgeRT007544_029650b1-08d7-40a2-80a3-cae153057eaa.ai","6f60aade-9d91-40da-aa12-359747162b9c.ai","0f79be46-fca0-44fc-9628-edc95d1114b5.ai","c610323c-0328-4e99-bf2f-30ccdcf78625.ai","2c9ce915-eff1-423a-bcbe-4d061fdc75b0.ai","f14e3f09-d206-4e78-bd11-5e7f6478140e.ai","Artwork92_eb903cb7-78d5-426d-b282-5de032b38184.ai","4cdb9ff8-fe83-423b-9bee-18d87b34f5ca.ai","47ee4c0f-63f7-401a-b493-82b67b3ef52b.ai","Artwork150_426298ae-707c-4d9c-9313-7764470739c4.ai","8d5344d5-1477-4790-9e7c-935a15feba4f.ai","MALE5mm_e85906da-5652-4abe-82a7-b2a0a4ba6db5.ai","FEMALE5mm_65f7ff5e-b140-4461-b964-8d04483c5086.ai","v4FEMALE5mm_9b200b39-326d-4f2f-ad25-b8ff3702ffbe.ai","1a868a1a-540f-43ed-8d7e-01e77f9a5547.ai","0504f912-72da-4e5c-b6f7-ab426a2c0482.ai","e3cacae2-609c-4098-88d8-f0d5c7ce4ac4.ai","LIttle_b8774767-f2c5-4362-9a15-cd453b639434.ai","Artwork158_a5045187-4715-4173-a403-2b9d0f4f1ad3.ai","PrintRegCUTPATHONLY_a6c5ed86-b04f-4241-82bf-741a2be12e60.ai","BigMaleLong_f5dcf81c-16e9-48b9-80d4-8b1feb2c4c78.ai","01R_c93800db-a902-4285-b067-7e9638acb88f.ai","Artwork159_83367f55-361c-4a5d-8803-b8ad8891a1b9.ai","PlinthCornerCut_d4329b3d-da60-46f1-bfb4-51e025763eb6.ai","a095fd74-1759-407a-879f-f25bdf4165c1.ai","PlinthCornerCut_96f8940d-cd99-4a0a-8cd0-054b6ae17523.ai","03C_0eb7f10b-485c-41e5-b038-31884af909f1.ai","13C_c6145b59-e15d-4a1d-942a-6f93d843a8f9.ai","Artwork169_de354a5d-2dc5-45fe-9242-19f06c45e25d.ai","12C_4a8a2624-534f-4712-b154-0234c8b0e9e3.ai","01L_decdf1a9-23c8-4f85-846d-fd8ca001a558.ai","13a065b3-b9be-4221-b240-f7e8055b1346.ai","aced9af9-1ef5-47ca-8806-c7d5378679c8.ai","3bf2739a-b193-482b-96da-ce6cf0de690b.ai","3bf2739a-b193-482b-96da-ce6cf0de690b.ai","468ad048-dc84-49fc-9265-34de33da3aba.ai","a31ee486-3a98-46d9-8472-2144c791ec7e.ai","b350d2c0-9732-4b6d-8a2c-1ea028cd3520.ai","b7c26abe-d39e-419c-81fe-883d01fb1cd1.ai","68e64908-1d90-4481-b9b9-b7c52bb7e12d.ai","a6cd97d3-f085-4d6a-aefa-43ea0de36831.ai","c2a45643-ebdd-46c2-a80a-5aad3aa10b68.ai","1de4ac76-e0f5-4d82-9802-54718b930b96.ai","c413e7ad-c15f-498d-9c1a-9a36ecd55f2e.ai","0a2ec0b8-1750-4b3c-87ee-7b389624e668.ai","e809ffe8-36d2-4d77-b4b7-9e58b12a5857.ai","2e3c1eaa-402e-470b-8df5-07c83ce325cf.ai","afdfca2d-75f9-42b4-a9bc-44e62818bb36.ai","be946857-e737-4778-8cb2-d876599ee956.ai","fdd45290-99d9-4362-870a-8bfbdba7ca30.ai","32a58fe2-be6f-48bb-aea8-addbce67b493.ai","bcc93939-fa12-447a-8f2e-27a9ff28d0a8.ai","09L_70db6186-cf6b-4a59-9b80-ea1392621da4.ai","5dc7ce10-3b9b-4981-891c-07e6787527bd.ai","e90366a3-a9af-4a59-b5be-daead6f81c17.ai","40e0a1a2-be59-49a2-8a46-9089b7d9b505.ai","aeac08e1-4e60-443f-b113-fb30e0c1abb0.ai","24624284-df28-4423-84bd-e5a9672f8523.ai","1efa238a-0ae2-47cc-905e-7339a411e920.ai","e553c442-7842-4b85-857f-398327f86173.ai","09R_d614ad87-9c9d-48ba-8939-125eb962c939.ai","f062f3e0-a931-498f-a7ad-c4143d702003.ai","19efa6a7-12df-41ed-8793-2842ea79f3e0.ai","ddd42082-36b2-42d9-bf2d-82bc3e936d0f.ai","07dbfb8e-07bb-4765-8ba7-37e366bff2d9.ai","04R_25258308-c367-4a77-bd5d-2906a9cacf13.ai","Artwork171_43549222-43c4-45c8-99a0-1bcfb2111b45.ai","98c72b3a-8120-4a8c-b395-f6474e769680.ai","Artwork171_47766a89-b15a-4daa-9b3c-66cc65678071.ai","b780c194-b57b-4fd0-9d3f-11ce64763060.ai","5mmdoublefemale_0e51061f-f996-4c18-ba87-1889b6e20dc1.ai","5mmdoublemale_35ec9a7d-00bc-4e7e-8497-d2579c323d65.ai","5MMFEMALEFLAP_11dc66b7-a17b-4f6c-a85d-b90a7f6ce4a2.ai","5MMMALEFLAP_b9791a15-afee-4d1a-92c5-7d27ba70f14f.ai","FMLTOPLOCK_ec8a3aee-752e-4f43-8556-dfcb46ebeca8.ai","BumRearSpacer_7279db75-683f-41cd-930d-da8033947d9b.ai","85b4bff6-2e65-405a-80b6-6db5882ac197.ai","ColumnsectionZ_18d981df-1407-4f5a-80dc-e316006351e7.ai","8MMDOUBLEF_9ef3fe5e-59c0-4734-807d-290cd604f03b.ai","8mmSINGLEMALE_51e754db-4b6e-4060-8489-f65f2d614b9d.ai","Cover100_c735a673-8121-4958-ace7-5dffbdf4b852.ai","8mmSINGLEF_ae9905a5-e5c2-4ebc-9f88-24cf795832ec.ai","COverlocker180200_25cda7e1-982b-47e2-beff-a0c044ac8bb4.ai","COverlocker180200_25cda7e1-982b-47e2-beff-a0c044ac8bb4.ai","MLTOPLOCKER_0c6621c3-e854-4a5b-bd4c-6cfb58227b07.ai","Cover75_35089285-bca4-471c-bca9-cb030178c435.ai","COverlocker180200_25cda7e1-982b-47e2-beff-a0c044ac8bb4.ai","87caa501-00b4-4ca9-8518-73c1d61d0807.ai","e742e854-894d-45f5-bcce-5a95d3a8f419.ai","3ed1978c-10ca-46fe-a3a4-819f8bc33e80.ai","BLANK75mm110_df486482-7de8-4440-bc68-7701a8a19ddc.ai","BLANKOverlocker18010percent_1e4f0d64-ce2d-4457-9bbe-08060bad09f9.ai","02ARTMECH_d6767751-5e52-438b-af6d-dc9069a10443.ai","CSINGLE100mm110_4f8550e9-938e-49da-a9b6-b567143badbf.ai","Tailoffsetspacerblock_61a84139-5eb3-49cd-a31c-b64d00cc033d.ai","bb2986b1-8610-476c-ab2d-a6e6deb8e2ba.ai","01-02poplockblock_0d0520e1-e83c-4fef-ace8-42a395ed85e2.ai","R2.2M8D5_cb417903-1e24-4521-8d37-a8f6578d2bd4.ai","f2a0a4c6-1756-426f-9abe-17ccebc1de5b.ai","01lartmech_39749643-7dc2-493c-a218-e24ef71526b3.ai","8MMDOUBLEMALE_a34b79a7-1e00-4393-bc2c-b7db3272b66f.ai","4bd007de-3538-40bb-8715-07137ef80bff.ai","03LFRONTFACE_083d836d-da00-412b-a340-889f0aa0680b.ai","4LFRONTFACE_fb5e4410-6533-4c7d-a8bd-ad9960927706.ai","4LFRONTFACE_fb5e4410-6533-4c7d-a8bd-ad9960927706.ai","cec551a7-2ec6-47de-88d6-319a67c60006.ai","8mmD-F-to5mmOUTER_90b3b1f9-597a-4fad-a895-97f1862ce186.ai","","06-07plock_f62341e7-dc17-4c1a-9d66-e05c202a77dc.ai","b8febe37-add9-481e-9fea-063e7bf173ea.ai","48489563-8695-4d59-895a-fd41fc5a2ad5.ai","7b7c68b5-69a1-4379-90a8-a9d8e49414fe.ai","Herrignbonelaserfold_5b34530a-7c07-426e-91ae-386cd34914c2.ai","8MMSSDOUBLEMALE_d65ef8cc-2664-44f5-8d30-bcab23605ce3.ai","Artwork193_87197919-609d-4026-97e9-ad06195d9d1e.ai","c976ba00-43f2-4140-ada5-ef8391f98881.ai","040ed0dd-aeb3-4ac0-b467-8c9e8daf91d4.ai","17682fdc-e88b-470c-9da3-76de07e4eb8f.ai","ef7bdc6a-f032-467c-bee2-9a156860f099.ai","425c6826-130a-45d9-9130-d141b9bdb8dc.ai","e1b43a70-11ba-4b67-89b2-f1fa4b14b598.ai","809cca3f-bb2d-405d-a61e-351ed0fbb984.ai","e1b43a70-11ba-4b67-89b2-f1fa4b14b598.ai","BLANK_437e9656-802b-4293-84aa-79f2cb7dfe32.ai","RT007726_2fba725f-31d0-4306-a727-76dfe43e7471.ai","0b239668-0774-40ba-84a6-27321c0f8f75.ai","RT007749_96544c46-cc28-4a8e-a6a1-88e0846a07d9.ai","RT007974_96a4b005-3272-4d68-807b-7456f1ddd483.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","RT007973_ab7576de-cbe6-426b-9802-f8b1dd1af45a.ai","RT007977_de5144de-33d2-4b55-bc68-09a41b4c23e3.ai","RT007988_d49d20f6-3898-4a95-bf2c-a221726e6e01.ai","RT007985_3eacb7eb-a9c6-4997-af5c-7751680c3847.ai","RT007986_ee0b238d-322e-40de-acb8-a845425f93d2.ai","RT007983_b6ce1be3-dfbd-4f38-9145-9fc2b2edf258.ai","RT007987_59b93f29-1222-4ca9-9138-943bc9993e36.ai","RT007989_30683342-9ecb-47fb-834e-643af608e19a.ai","RT007675_398fae60-51a1-4d54-ae5f-064e91c530c5.ai","RT007716_a72663ad-3729-43a9-a5e0-3ff6e5436b4c.ai","RT007718_fd5e4fbe-4725-4d76-a250-3b14cf07069d.ai","RT007719_c237d09a-8364-40ca-b54a-a7d419469d3d.ai","RT007717_57fa2d69-ec3f-4461-9e24-d69a85312776.ai","RT007803_c149f393-433b-4f84-aef2-8cf83ab90c8a.ai","RT007720_3b8ab72d-4833-4af2-931d-00eae6b3d351.ai","RT007840_03112d15-0bbf-4993-8e6e-cbcc3bf3b83f.ai","RT007837_dc55fe5b-7b61-43b4-bba8-7447af80e44d.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","RT007836_94864cc0-0df8-4328-9838-fc1836ddf2da.ai","RT007713_e778b54d-0687-4194-a4cf-a6e5b614c1da.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","RT007762_ed3581d8-01ba-410f-b094-fa54c512729a.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","RT007759_d8f149f7-351c-4252-a532-afdd23238f21.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","RT007802_33510933-c7cf-43d2-bc42-404b97a40ce1.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","blank_47eea13b-7a17-48fa-b1fc-dddf98b05e6f.ai","RT007886_6e31620d-5f20-4cc6-9e10-13eea2d26ba2.ai","RT007984_39e94edb-1584-46f3-8c65-8c3d43464f96.ai","RT007990_bccc8689-1fe6-4c33-bbdf-e74a9cee1520.ai","3fdf364f-6a28-40d0-8eed-397cbc514476.ai","c9d7c60f-e3df-4721-9898-132882bf9b92.ai","RT007991_367eb8b9-7794-4836-ba14-436efaa3a976.ai","RT007979_b1ebcd47-6659-4255-bc1a-aa967110b6f6.ai","RT007980_4d4d3a82-dd58-478e-a74c-396b7f16a632.ai","RT007762_8977b437-a89c-4d55-9200-265561feef04.ai","RT007710_2b9307ca-4a2b-488c-a713-433170131511.ai","2e735ade-7d36-47f1-96c4-d6edcc3c9cd5.ai","RT007760master_4d0d3322-5c3a-49e5-8484-25ecb75025ee.ai","RT008039CUT_3d923578-ef23-4da6-9a86-1024c4a6631f.ai","AS-90SideStitcherMALE_13ad046a-4e89-44fc-b3a8-5b38a39fde71.ai","AS-90SideStitcherFEMALE_f43e4da7-9cf8-47f1-a432-6ddfa8f932cc.ai","Artwork400_4d2553b0-f9f7-4049-bedf-eb2355485623.ai","RT007795_9fc61968-3b65-4ae5-9465-2f332763151e.ai","RT007793_3d502208-5c94-4ec5-9dbc-2b6fed7b8536.ai","RT007794CUT_14895044-cc4e-4d5d-8ef7-259cb049a42e.ai","f3a4383e-7f71-4855-b964-efcad7d9f164.ai","CT9F_8f1d1157-a304-49cc-b0ed-adfffab90013.ai","CT9M_44b52c11-a6ff-48bd-af19-8a3d762318f7.ai","200mm_4dff9dbd-69ba-430b-a6ca-ee4a6d567264.ai","200mmslotvoid_12198476-1a75-4bd0-9546-e3024eaddd5d.ai","200mm_4dff9dbd-69ba-430b-a6ca-ee4a6d567264.ai","316.5mm_61ae4421-8e90-428b-b5a6-cc5e65b8f212.ai","316.5mmslotvoid_b8fcdf2c-60bc-4546-b9b9-7cd635d09fe5.ai","b5f3fcfb-50b8-451c-91c4-04a2324c7b7b.ai","316.5mmslotvoid_7cbf25e5-2fb6-4927-ace6-3d57c2b628a0.ai","c39fc823-2d13-4267-a1ce-a3ea861d2db9.ai","SL65Overlayed_a434c1b3-f7e8-4136-8f62-582684acbf1a.ai","32ed2f51-aa47-4756-818e-dd05a5b460a4.ai","SL65x5Overlayed_7c8f6f71-7717-45f2-902f-052ebce35209.ai","SL65M&FV2TAB_5c1bee5b-ac42-4d3f-90ed-84c89e514b2b.ai","1200mm6xSL65_0d401437-a192-4017-8319-2662a8dca7dc.ai","800mm4xSL65_f09db47d-0b7d-41b6-954e-3f0f07c53279.ai","1000mm5xSL65_9eb19bfd-23de-44bb-aa2c-0acdfb28f696.ai","840mm_faab7132-74a9-4af9-83ef-0932d9670a54.ai","Artwork396_8ff7fc67-3865-43d8-9ec1-8654fc0e5161.ai","Artwork396_9960cd8d-3945-4bdf-beac-6a523217e1c3.ai","200mmM_93f936ac-a58d-4020-8f39-e4a1c99b52e8.ai","200mmF_927cb3a5-4e32-4e24-b389-8a910561f896.ai","130mmF_1f41cded-0094-4d02-a36a-d6c35bd4153a.ai","200mmFbhalfcuts_1b0f1675-08ee-4461-af28-5a31f63cfbbb.ai","200mmM_f475f04f-e3ee-4943-9ca7-ecbd802fc3a9.ai","SL65FV2tabSingleCLOSED_94615ba6-c29d-4d8e-8944-4cc9327ac332.ai","SL65MV2tabSINGLECLOSED_0466a9d7-8467-4954-af2a-67c572bcf458.ai","7939e3b2-8b3b-4cfc-aee3-0079f1cfa0f6.ai","b977f3f0-09a7-410c-b754-3735d6f4aa66.ai","8347b0ce-1264-46e5-aac0-a980b1165bc0.ai","e6b4f1b6-f368-40ad-b825-18447c04f169.ai","1c127bb9-32e8-4c6a-9a8e-cef1d8c7a45b.ai","fe5e021a-4f21-451e-bbc4-a099c6ccba76.ai","b4f0831c-6b43-4f61-b8db-33e40e61c07e.ai","5572d48c-4685-4d7d-8353-8ef5854d2b7c.ai","38186c33-ffcb-45fa-b9df-e65c61c888fb.ai","0a3c8815-263e-480d-9f6e-b41779f71c99.ai","d57a1fa6-f932-414d-b1b5-0c41faed3e5a.ai","c7284a4a-68fa-4b2d-a2da-bea7d444c2f7.ai","449a9c47-13ea-40d9-a936-82427d84da5d.ai","SPLINE_f429c091-485d-46b5-9b6c-b6dd13462e62.ai","","","9223976d-1f8a-4cdf-96a6-8ac120af4df7.ai","29f6e485-8441-4b6d-810d-ac86c7274a1f.ai","BMP-2TrackBottomCut_a0612524-8e51-436b-b707-7133251dcd36.ai","9eae6b37-fb2b-450e-b5ba-35c409b73779.ai","RT007972CUT_191d1ca9-f13e-4ee3-8e2f-2fb96ae8147f.ai","62b9cd08-d847-4055-ad50-c082e6b89f57.ai","RT007908_4b57b37d-760d-4268-9dbe-b3dbe0d4923e.ai","RT007906_fbc6bb4d-43da-45b9-bab0-1b8f09b9513a.ai","RT007910_52e98513-ad90-456f-bc67-da5a3718fc43.ai","RT007909_bc6dbfd6-8931-4c07-89bf-6c820a199b92.ai","RT007888_1761e97f-bef0-48bc-bbf1-ef0038c42819.ai","RT007889_d97fa24e-fcee-411e-b774-29d6e1dfaca1.ai","RT007890_b10efea7-655c-47a4-983c-8f4914f62b0d.ai","RT007891_4655722b-b629-4613-b90c-a63751d04c45.ai","RT007892_1df79ce5-4cd0-42c0-8870-d501608cb6c1.ai","RT007893_9f5cf227-f66b-4336-91a7-03085fd06425.ai","RT007894_7f563e72-11cc-456e-bc22-b21a197863c3.ai","RT007895_ab74591f-29e4-4919-9c40-9f47f00b21b7.ai","RT007896_7e7f5128-4ae6-4c1e-89b1-590a32ced4b4.ai","RT007915_eaf805a4-4e22-415f-a77a-f6923898646d.ai","RT007868_922c2423-7c15-47b5-938a-59f7afade6f7.ai","RT007871_c30068f4-a8f2-4fd1-8e00-0a1289f383e7.ai","RT007873_47332bf1-5ee6-4a79-afa2-644be0e77988.ai","RT007881_76e3fc92-5e2c-4a84-90d4-5a00af7b4afb.ai","RT007883_1ee19bfa-0e80-411d-aa55-3acfca880b0c.ai","RT007877_7902f8d4-e0cb-4372-9271-7c859d17ae31.ai","RT007867_c516d0d7-ccbf-48ae-919f-f4c24dbc1c2e.ai","RT007878_e80921f2-1de8-4da1-975e-54a1c30f8350.ai","RT007879_12d54ff3-e7df-43e5-a710-5e582da5d127.ai","RT007880_5408c89a-2ee3-4ecb-9c70-e4b13e7e2ff6.ai","RT007869_3d9156c9-1dc3-47e0-b37d-7ef083e66ea7.ai","RT007870_a86d89d0-1702-4648-9d08-f56481370ce3.ai","RT007872_aa5c7830-a4e2-4dbc-b9d8-e04d7f121805.ai","RT007875_92b23d37-454e-441b-bea7-7acd6b7d8a0f.ai","RT007882_505474c0-2978-4d7e-82f9-2911eee874ee.ai","RT007884_14102d60-e61c-439b-bf2b-32311e1f69fb.ai","RT007885_9f74397e-e362-4cc4-a5d1-06276e984f48.ai","RT007886_c49e5aee-644a-42da-8313-4d12f2cec0ee.ai","RT007911_f13efc2f-520b-4e30-ad6b-4109d19ed66b.ai","RT007666_3e83638a-13d8-4a12-921c-84b1874fac27.ai","RT0007916_8911083e-5d96-42aa-ab06-be995299e22c.ai","RT007887_0a5c563d-cddd-43de-a3d6-eb4b0d97af26.ai","RT007846_48baef74-6e1a-4ed9-9d00-a14ee804763d.ai","RectanglePair_7141187f-afc9-4b97-add2-1b7f70b0ea42.ai","4c468b07-ab12-4dac-93dd-fdb8a34f3978.ai","2338ad1d-6d27-4130-b45c-5ff9545f531a.ai","Artwork400_e3583dc4-66dd-464f-a90c-553c9d41daad.ai","7911d23d-4c4e-4cb7-b8be-393769b239ce.ai","","24c521f0-350e-40a3-97e3-76abbfa82668.ai","1056dd09-26b3-4bbd-801e-557edfd290c3.ai","4d28dbdf-8db8-4bd9-ac46-23467077cab7.ai","883a40df-0b26-49e2-a3dd-8d46c047a9a1.ai","1cebe4b7-2409-4d2a-9c1d-a97c35803cdb.ai","9d8200a4-dd79-433a-9a82-4d562d0bacc2.ai","d8d0ef52-cc79-48fa-99db-2a67278d9797.ai","777eddd6-5ef7-41e0-8b59-2545cebb8b13.ai","fb686045-ec88-4369-a747-678fc5b871b4.ai","66fec3b5-a112-4157-8a60-5d24732b6d90.ai","7aa1506c-2b2d-47b5-9642-00aaa52bff4a.ai","305a4e4a-2117-4982-a592-febef82a01e7.ai","f4ed33e0-22e2-43ed-8b36-8158683a79aa.ai","9cffdb0e-2922-4285-b928-f1623019eefd.ai","05c95e7b-14ac-48ac-8325-280434276c10.ai","f5f1a286-4384-47f7-a97f-c66ab3229fce.ai","c46c12d5-564d-44f9-8c48-a6a5e93857d0.ai","9461d14b-74cd-4443-b6b4-6b73d13abc30.ai","19e4319e-dc97-4cc4-a7c5-7ba303cb9baa.ai","281b7012-0cc4-407c-8c66-8cab359a900e.ai","f1a459e5-8140-4585-b66c-427b7de4874a.ai","Ziptiesv2_45d14e53-1afc-42eb-8a30-02898593d09a.ai","541702aa-8bff-426d-8cf3-feaa96258375.ai","5d8a75c3-5b86-4fbc-bf7e-c07bc66bcb72.ai","44652c97-6462-4dd4-8dc0-e51eb73ccb2c.ai","756194d2-f487-4a00-b3e0-5f55d48d71ef.ai","a34b543d-d88f-4c50-bde8-c58e47476847.ai","38db5562-abe5-473f-aec1-b0085b72940d.ai","3cb14826-059c-433c-b06b-9af3b20bf45e.ai","b548ed27-4a2e-410d-81fd-96ac93425f03.ai","896cd697-3cf9-4046-9448-fa7b670e3064.ai","93677d78-53e6-4fd4-baaf-85d8bf501fc3.ai","e261bc22-0089-4fb1-8247-c3388f04b918.ai","af52f69b-8f6c-48ef-8a9c-b2d66ab8b878.ai","2fefe69a-5e52-49d1-a126-fb495972e41b.ai","8b824fdb-8b56-4284-ad50-acaa3c0df8ca.ai","977cad81-fea3-449a-aab1-a404926c2196.ai","f8df0132-201b-4fdf-9fc7-a68ba237cd09.ai","a4b44064-dc22-4031-92ce-d53316b951d1.ai","de813196-499d-4363-8d70-84e777b357a0.ai","RT002385_1df55a93-8bf1-46f7-ad27-31eecb74fabc.ai","RT002388_ece7098e-2f75-436a-825c-eae8a6157987.ai","RT002397_a14d94f7-e628-4a97-9179-b336a050d9ed.ai","RT002400_ed98b881-1686-4cbc-9795-9c9aa1f177b4.ai","RT002393_4afa37ad-5e24-42c6-91d3-11b2eb602955.ai","RT002390_903b9553-1f42-4aaf-9bbf-022fd793f400.ai","RT002404_6889549f-8f5c-49f1-af29-128cfe0b0338.ai","RT002392_6413658c-1d49-4588-8f32-116b0c0051d4.ai","RT002386_09b8126f-01ff-4a24-a07b-bbf8ef7611bc.ai","RT002389_df43da60-e8a0-483c-9308-7a9a5e607237.ai","RT002398_f6aef3b3-32a4-45de-85a3-74fa81def414.ai","RT002399_6583eff5-0296-42c4-9200-b0e8bd5d9ccd.ai","RT002401_f74d1cb9-ff55-46df-bd40-60c13296e081.ai","RT002403_102072fa-a130-419d-9c0d-f3b0024452e1.ai","RT002391_1556e5d3-a543-4a81-bdb3-3eb290f68219.ai","RT002394_e151af92-84f0-4aa5-ba2c-e9e45ffca080.ai","RT002405_5224473e-af4c-4289-8339-aa43250172fa.ai","RT002402_3cd1647f-c171-4dd5-9146-193536ac3aaf.ai","","8mmD-F-to5mmOUTERBLADECUT_c656b301-34a6-43ed-bdd7-4bf1d6961c3b.ai","01L_ea0f712c-6704-4d6d-918e-1420f4009475.ai","02R_0fbbd383-3bcf-4df7-9f66-156f5b454900.ai","04L_a45ca87c-225d-472e-93c9-d824c8896b57.ai","04R_a0b91d15-9aab-46e5-8892-d3003f956321.ai","09L_ce9eafc8-ad4e-4bf0-8ec2-211c2ad41fa0.ai","09R_e0722979-541a-4149-b624-93fe46308be6.ai","10L_315f07a3-79c6-4e02-a7ee-0d8bff2c66c3.ai","10R_525a8ca6-0584-4a1a-993b-a336f3da1e46.ai","Blank_d948a1c0-93dc-4d03-a5d0-e0f677e83b30.ai","Blank_f8821707-727f-4b94-8323-0d34c4d58075.ai","13_648a6d8c-cd80-41c0-882c-52194ff17947.ai","Blank_5230a584-a52b-42dc-9a37-70b5774b8b46.ai","Blank_5230a584-a52b-42dc-9a37-70b5774b8b46.ai","Blank_5230a584-a52b-42dc-9a37-70b5774b8b46.ai","Blank_5230a584-a52b-42dc-9a37-70b5774b8b46.ai","Blank_5230a584-a52b-42dc-9a37-70b5774b8b46.ai","07L_f0b93e2d-bc3d-4b0d-bf02-c9fb83498b55.ai","07R_1a56f4d9-f8ea-4e12-aa9e-0aaaa547502e.ai","08L_7eeba2ba-2cb6-4b3c-99ab-fa17df8b07e8.ai","08R_06ff3eff-3a6a-468a-9d99-12c34a64b92a.ai","05L_70e0ef38-5bc8-4760-b15c-f05388cba257.ai","01R_3a972c1c-80f5-466f-b89a-3fb832ea152f.ai","02L_14b0dba7-0556-425b-85e6-90d09e3382e0.ai","05R_76f99857-93e9-45fa-902b-e97a188f4a15.ai","03L_5b83b16c-ecf0-4296-bdc5-1ace24d9f56c.ai","06L_2f7d0d76-302e-46fb-ae0a-0c14705159ff.ai","06R_db58a7a0-9d1e-4ab8-8476-c5981f48740f.ai","SL65Fv4Closed_0924896a-8fab-4a5a-aff3-d30db7b4ec0a.ai","SL65Mv4Closed_34e0a6fd-5eed-47a9-a630-c34de64ba6b1.ai","a9e844f7-b77a-4f5e-ad27-a79b04862e99.ai","RT008167CUT_229f4eb7-28db-4b0a-984f-7d2d753a237a.ai","RT008168CUT_021d973d-2abd-474c-b099-3b0887e5a667.ai","RT008171_647ec18e-c278-4ae1-b9ea-aa4b4f96339e.ai","RT008178_2447a532-1b3d-490d-bdcb-743e0c0fcf82.ai","RT008170_197642f4-97a7-4080-9efd-15db58f7773a.ai","RT008169_0b0eaeb5-0bb1-4d13-8846-5cfa2580dcd0.ai","d0cb08b4-c8a7-4272-8958-5b05a6eac9e8.ai","74d9e07c-57e9-470a-a956-ddef3ab3dc28.ai","RT008178_b77ac474-4d59-49d4-b74e-16a672601a26.ai","RT008180_a623364e-e828-48d7-b8ab-85956cae1f53.ai","RT008306_23e9c0e0-ae2c-4623-9db6-8c50192e7263.ai","RT008179_8a146538-6178-4421-b792-4df8235f0ca7.ai","RT008309_1fa0edfd-26ec-4e46-ba26-2d0964da7c90.ai","RT008301_fc0ef7ce-527c-48e1-b7c3-2465c92c6fcb.ai","","","","","","","","dd818f04-416a-4bcf-9727-517c5054185c.ai","46098e48-09e1-488e-b4c3-289afcacc7e1.ai","","","a5b68b52-fc7d-41e9-b791-6362cb1988fd.ai","8ff06735-0bb4-4738-9b7f-138ffaee9609.ai","50dd6f90-744b-4f8b-941d-f3ca9aa085df.ai","6d952936-505a-4bbe-92c1-7ee7f9bd641b.ai","","","","","","","","","","","","","","","","","","","","TextPreview5187460060.png","177b7773-a2bf-42a0-b429-43a0be5481ff.ai","04f18f64-159f-4d65-92b8-9e84cfdef4dd.ai","b892f296-5785-49dd-a65a-d3a0cc874fde.ai","Cassetteand5DoubleSheetMap_314293d9-00bf-4e8c-8619-8cd4e157c923.ai","DoubleSheetMap_ed4db14e-e346-4cb2-b55c-de44acf9e00d.ai","BMP-2DoubleSheetMap_8b0fd379-7cde-4967-a5b1-ee17d17d6da7.ai","DoublesColumn_16424808-acd5-4a76-8ac5-c06271933456.ai","75611084-da53-4aa5-9e37-45a6bdfe9ced.ai","e1897cc3-67e7-4e43-bec0-2025b78420dc.ai","ac792a48-2884-4f30-9775-a5fd8b9a2463.ai","0f3eb4ee-943b-415c-b4ef-aff764d7bbe3.ai","SlideLockTabs_38b4c74c-0188-4a18-a745-02923300f93c.ai","42041a49-a867-465e-a4e6-4bb342790e09.ai","f2b071e6-36af-432c-9651-756fa4be6c57.ai","PullThroughTabSlots_b45161a8-4d0f-48d6-bf1f-85466d0c8a73.ai","5838ee0e-12d1-4a95-bdf9-002205881d13.ai","SlideLockAIndividual_5153d02e-58cb-45dd-9c35-ecec425030fc.ai","62e53e3a-de74-4dd4-86bd-b62b2db6170b.ai","SlideLockTabBIndividual_0027c8f9-45ea-45b1-9f46-25b8743fe70a.ai","RT010321_ca6f58db-c809-4acf-97cf-3ad3827e7bdb.ai","RT010322BMP-2MiniPARTB_1757568c-30a2-4d4b-8190-51de02317350.ai","PullThroughTabZT_248a234c-1201-4363-87ab-733902990ff3.ai","33869637-cbfb-49b4-b2c3-7155eac801ab.ai","2ZiptieClusterr2100x50_44c80673-5f6d-403d-b55a-b009fb728273.ai","PullThroughTabSlotsASYM110T-72B33D_f23a2422-97c5-42e0-bca7-5a755708a222.ai","Artwork434_96ddfe9c-15f4-485b-b1b5-0e24a6aac0af.ai","T-72Slot_1b1a81e9-d868-4006-a1dc-0f31a63fd3c0.ai","Preassemblywithcutout_988efe8a-aeb0-4c22-8afc-cca5e4235b75.ai"],"size":[63713,42305,93979,39865,61254,62757,87257,32700,39539,379485,0,0,1207370,1207654,1207120,1207291,1207437,1207219,1207403,1208164,1207761,1207096,1207251,1208740,1207473,1207047,1207336,1207759,1207753,1207479,1207333,1207560,1207387,1207305,1207462,1207626,1207838,1207343,1207946,1207050,1207800,1208051,1207153,1207230,1207302,1207700,1207923,1207071,1207305,1207061,205798,384294,399075,1223322,1222572,1222743,1229037,1221530,1224168,1211096,1224875,1213507,1212285,1212851,1207609,1210129,1750453,1212071,1213840,1216467,1215726,204660,1217210,1215269,227051,1215083,187293,212255,203070,187425,1211631,1211354,232597,1212129,1212129,228110,221303,240222,222621,229784,226496,213109,1225526,1229609,223162,1217187,1222315,225343,220303,226482,219389,219678,213227,216451,218274,217224,216749,217095,217102,216576,236486,238893,369600,212116,240078,191134,337118,200244,1210823,386749,182480,182267,1186524,1185427,1185225,1179229,1211596,1226235,178599,184184,1203297,185526,1210133,1210133,182685,1206173,1210133,1229233,1229560,1227805,1205539,1199908,1245249,1196551,1225178,1302252,1224433,224814,203433,1215383,183854,203429,1205885,1234856,1234856,1225342,182414,0,1224772,372859,1222065,1207881,479212,184710,1214039,367664,1224502,1221566,354753,354933,1207542,1208165,1207542,335631,1207618,362003,1197204,1204833,787399,787399,787399,787399,1200437,1221230,380864,378154,374667,395532,380508,1219136,1212177,1233555,1203877,1205503,1225493,1203256,1217442,1206408,1222017,787399,1227446,379370,787399,787399,787399,1197152,787399,787399,1224957,787399,787399,1197955,787399,787399,357724,1230127,1205941,213799,213813,1195885,1213224,1210853,1209170,426690,1235452,215765,199726,354820,352838,425494,385774,1238958,1207755,1218746,213137,216751,382656,381114,382656,381044,381155,380878,381134,370716,358771,1224732,1229583,368171,1238326,1236343,1237167,1237777,1238445,381750,350589,350922,381309,350966,352033,340692,338761,354715,368640,355471,369603,357138,354716,354592,1222231,371519,1208576,1221900,382677,204760,364815,0,0,402162,402688,343102,401250,196311,383156,1280667,1268460,1270917,1255946,1310130,1303733,1300620,1271337,1266180,1278852,1271316,1269550,1273369,1214203,1308146,1355454,1305729,1275252,1276682,1259686,1213152,1274293,1292486,1319858,1226226,1253613,1335290,1263164,1266184,1279217,1293899,1256122,1199669,1194727,1194783,1240239,1203272,1187051,233309,238755,219097,366922,0,1208400,1208360,1208460,1208446,1208444,1208458,1208425,1208418,1208409,1208971,1207284,1208097,1207911,1207363,1207596,1207910,1207721,1209004,1208180,1208163,1207628,1189881,1215296,1207607,1208963,1208251,1207425,1207305,1207800,1207972,1208093,1207400,1208337,1207625,1207749,1207983,1207652,1207654,1208392,1207520,1209703,1204659,1209740,1207796,1207815,1207579,1211310,1205121,1207079,1211497,1212484,1208750,1209732,1198126,1205086,1200037,1204548,1197316,0,199564,1219127,1218212,1217920,1222038,1210553,1207548,1208647,1212589,1208764,1212973,1225249,797997,797997,797997,797997,797997,1205330,1210703,1215051,1213177,1211089,1216678,1217503,1216339,1206135,1206812,1211185,1217188,1218312,1226486,1267346,1221756,1234890,1262374,240958,262362,1210473,1211590,1253877,1269954,430693,1241913,1205463,1200190,0,0,0,0,0,0,0,1216768,1217068,0,0,1216629,381768,380819,381392,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,662,1213689,1213398,366263,1232993,1596627,1255863,1221299,364800,1213946,364754,364821,369223,213142,212365,368916,1228175,371860,365121,734606,267864,260204,737418,364739,1587814,374436,385381,368883,216203],"path":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,"3487ff83-231b-4ef0-a018-4f63d183251f","9073d2e9-0cce-4730-a39f-3ee95b3e3838",null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],"created":[1517428544695,1517428560868,1517428633679,1517464473144,1517464539295,1517466011492,1517466072117,1517466472352,1517467877500,1762311928134,1526204902544,1527394323010,1730954227958,1730954208327,1730954211789,1730954231589,1730954276203,1730954260343,1730954260344,1730954247228,1730954197456,1730954178302,1730954290391,1730954286900,1730954318919,1730954330598,1730954341485,1730954390204,1730954360145,1730954374056,1730954401741,1730954413281,1730954491957,1730954423998,1731381041996,1731381062958,1731381078318,1731381090512,1731381098398,1731381119763,1731381131640,1731381144338,1731381157010,1731381160737,1731381176654,1731381190006,1731381200428,1731381211033,1731381225410,1731381263283,1724653291358,1733363206558,1732147660159,1682467360262,1682467330822,1682467438057,1682466786797,1682468475558,1682468259294,1690422735057,1682468281360,1690422735057,1690423237788,1690423237788,1692233182989,1690947661981,1692078317225,1692232100504,1692232100504,1691644153655,1692232100504,1695121299695,1693450166512,1693456301136,1695121488688,1693456301136,1695121011502,1695136561229,1695123014412,1695136443217,1695120826934,1695141759656,1695177123903,1695141799618,1695141799618,1695179408033,1695179639455,1695177300624,1695180768798,1695191843372,1695191887955,1695180858811,1695192393748,1695192504902,1695274959752,1695192920253,1695192754736,1695275498057,1695276404200,1695276440690,1695276480746,1695276506409,1695298329943,1695295906462,1695277091259,1695298871423,1695298970168,1695298931302,1695299020881,1695299056495,1695298122731,1695329038051,1695299645122,1695330863450,1695604745368,1695279424680,1695605902929,1695612729237,1695611289456,1695615318037,1695139081876,1695139104633,1695141759656,1695141759656,1695799372721,1698630639908,1698204601370,1698710387526,1694479471684,1698810599419,1698807435289,1698810557077,1698807435289,1698807435289,1695799901273,1698807435289,1698807435289,1698813008075,1698825360021,1698820723822,1698807435289,1698807435289,1698817070381,1698807435289,1699228374118,1699181532765,1698822367563,1699416142193,1699416180212,1698826316987,1694479517850,1699416353346,1698813143107,1699419054054,1699419054054,1699423637780,1694479471684,1695122291221,1698822367563,1699834769245,1699431018234,1700457525729,1699318974731,1694479517850,1700717262674,1720519827285,1719700338521,1719701194185,1708985748800,1708985859597,1693358240833,1693358197430,1693358240833,1733878697205,1733878697205,1734321698715,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1733878697205,1734478110417,1734478811200,1734479621891,1733878697205,1733878697205,1734497494930,1734499787611,1734500003714,1736421312969,1736471002120,1736482339732,1736482392389,1736665199353,1736666141313,1736668019978,1736671415905,1736674617338,1730173377678,1730173533434,1733354438200,1733356095313,1733354438200,1733353660466,1733360848874,1733814490016,1733356463962,1731467638711,1731372151218,1731372241017,1731372241017,1732750689890,1732751681878,1732751726745,1732751360965,1733194725548,1733194166868,1733356879009,1733285390236,1733285421429,1733357150744,1733285421429,1733285390236,1731372151218,1731372151218,1730092398609,1732163478157,1730092341122,1732073184517,1720576418798,1721173659584,1721008293459,1725257825930,1725321002461,1724892294732,1725257825934,1725412806490,1726622299571,1726622845486,1695784277732,1732147997051,1732079279479,1732079340938,1731979050406,1732086250168,1736803724110,1736806511609,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736896754293,1736901868386,1736944546264,1736944585363,1737201541944,1737512390625,1737522535950,1737523917451,1737523999546,1737524014866,1737524051248,1737524064821,1737524083356,1737524463837,1737524524685,1737524541895,1737524767631,1737524795815,1737524839216,1737524856692,1737524869211,1737524879005,1737524892289,1737524907149,1737524924618,1737524937197,1737524953469,1737524963389,1738020082347,1738020148917,1738109925757,1738110022101,1738110067304,1738110363079,1738110396962,1738110724887,1738110746050,1738110962044,1738111004855,1738111016923,1738111032680,1738111046339,1738111063421,1738111079086,1738111091511,1738111205836,1738111217027,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738124212440,1694479471684,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738121672631,1738626790082,1738626853421,1738728108827,1739147003566,1739148538454,1739154246297,1739161196486,1739162331383,1739162460527,1692593444410,1698204593669,1736896754293,1736896754293,1736903079714,1736896754293,1736896754293,1736896754293,1741139369788,1741234565113,1741318485191,1741318552609,1741559538915,1741560685161,1741561636763,1741562161123,1741562209142,1741562539080,1741562556782,1741562646124,1741582953590,1741583195763,1741583469700,1741585127312,1741585153916,1741739113825,1741739136594,1741739328735,1741747462757,1741747499148,1741747510661,1741758013656,1741758026162,1741758046073,1741758070631,1741759026050,1741759049647,1741759093168,1741759105450,1741759120616,1741759154483,1741759170261,1742098622218,1753749365896,1753749578820,1753935444531,1754870985671,1754870985671,1754870985671,1754907876144,1755130454907,1755484434926,1755487124843,1755487161222,1755487211155,1755487257305,1755487271186,1755487321094,1755487997155,1755488442350,1755498820588,1755668129793,1756370626144,1756374743041,1755487161222,1755487321094,1753749365896,1755487321094,1756684891069,1757471057140,1762127316637],"modified":[1517428545134,1517428560963,1517428633770,1517464473569,1517464539423,1517466012177,1517466072363,1517466472474,1517467877664,1762311928145,1526204902565,1527394323036,1730954228001,1730954208364,1730954211834,1730954231629,1730954276241,1730954260389,1730954260390,1730954247282,1730954197507,1730954178351,1730954290453,1730954286947,1730954318960,1730954330638,1730954341525,1730954390241,1730954360215,1730954374098,1730954401778,1730954413319,1730954492016,1730954424036,1731381042041,1731381063008,1731381078357,1731381090558,1731381098451,1731381119802,1731381131690,1731381144375,1731381157055,1731381160779,1731381176695,1731381190066,1731381200464,1731381211091,1731381225452,1731381263331,1724653474908,1733363206562,1732147660180,1682467360281,1682467330842,1682467438075,1682466853273,1682468475575,1682468259316,1690422837564,1682468281378,1690432576891,1690425053048,1690432851607,1692233183009,1690947662008,1692078317254,1692233827690,1692234822976,1692598476830,1692243780839,1695121401402,1693450201664,1693456897988,1695121488707,1693473653430,1695122553166,1695136591943,1695123117357,1695136603378,1695122694815,1695141759699,1695177123921,1695141799661,1695141799661,1695179408045,1695179639467,1695177300636,1695180768811,1695191843385,1695191887967,1695180858823,1695192393768,1695192504922,1695274959766,1695192920273,1695192754758,1695275498070,1695276404214,1695276440701,1695276480755,1695276506415,1695298737730,1695295906512,1695277091272,1695298871446,1695298970189,1695298931342,1695299020900,1695299056520,1695299181351,1695329038109,1695299645143,1695330863479,1695604745381,1695606497206,1695605923407,1695612729249,1695611321579,1695615318051,1695791955199,1695791997325,1695791713755,1695791717074,1695799423961,1698630777926,1698204601387,1698710560347,1698808633965,1698811079175,1698808742835,1698811095312,1698811422986,1698811422986,1698812196514,1698811430961,1698811422986,1698813008102,1698825360046,1698820723846,1698904190023,1698904479579,1698904492321,1698904594576,1699229901933,1699181532802,1699331059037,1738410101415,1699416180225,1699331231029,1699417608365,1699416353358,1699419118274,1699419952052,1699419952052,1699423637802,1699424018889,1719794464165,1699430918339,1699834769262,1699431018256,1700457525756,1701141001165,1701907535413,1700717392370,1720519827327,1719700338550,1719701194220,1708985748812,1708985859607,1693358240854,1693358197469,1693358240854,1734321823889,1734495050016,1734321698737,1734495169964,1734495491389,1734318904889,1734318904889,1734318904889,1734318904889,1734496310446,1734496878257,1736660234863,1736654014875,1736653299036,1736679069828,1736654285402,1736682348398,1734391622341,1736655572508,1736487443247,1734392737209,1736476350950,1736659028426,1736660528274,1736669383269,1736682352969,1734318904889,1736487313945,1736655604273,1734318904889,1734318904889,1734318904889,1734497791144,1734318904889,1734318904889,1736477864500,1734318904889,1734318904889,1734943142521,1734318904889,1734318904889,1734326836348,1736654804460,1736680172200,1734478110436,1734478811216,1734498051237,1734496172857,1734496275395,1734497558133,1736652429305,1734500003749,1736681297884,1736674164734,1736483163262,1736483222776,1736665928306,1736667481443,1736668148448,1736671817733,1736674617347,1733886000517,1733890720898,1733360792773,1733360815274,1733360792773,1733360771206,1733360848882,1733814490028,1733360834818,1731467638748,1731540678863,1731372241074,1731384380907,1732753609206,1732753315340,1732753551921,1732753640379,1733194883598,1733194564230,1733357057943,1733286013355,1733286959853,1733357243338,1733792353395,1733792354831,1734312126795,1734311865155,1730092398625,1732163478179,1730092341139,1732073184553,1720576418809,1721173659621,1721008293494,1725257825986,1725321002482,1724892294772,1725257825988,1725412806513,1726622299581,1726623513154,1695784277734,1732147997052,1732079279507,1732079340966,1732149074400,1732086250186,1736803919053,1736806511633,1742179683842,1742179758993,1742179651658,1742179719809,1738717349674,1740361430514,1740357683546,1738120294826,1738717199204,1738717227457,1738717255497,1738717175071,1738717114377,1738719667491,1738718713209,1742186305525,1742186269684,1742253325546,1738718463207,1742253370895,1738719651334,1742253359608,1742253348645,1742253336518,1738719632281,1742176489796,1742176523053,1742252968332,1742252978958,1742252958771,1743026369272,1742964921349,1741055440226,1736898614890,1736898638957,1738719491778,1742180493488,1736902247091,1736944546284,1736944585382,1737201693284,1737512390643,1737522535951,1737523917467,1737523999565,1737524014885,1737524051267,1737524064839,1737524083375,1737524463872,1737524524703,1737524541914,1737524767647,1737524795849,1737524839234,1737524856711,1737524869228,1737524879025,1737524892309,1737524907166,1737524924633,1737524937212,1737524953488,1737524963409,1738020127623,1738020148927,1738109925774,1738110022118,1738110067324,1738110363112,1738110396982,1738110724906,1738110746068,1738110962072,1738111004874,1738111016948,1738111032699,1738111046361,1738111063437,1738111079102,1738111091528,1738111205861,1738111217059,1738283006441,1738282877213,1738285181569,1738291682030,1738292120843,1738291033086,1738291957325,1738289225099,1738282724935,1738282835515,1738460437638,1738290504677,1738296081530,1738291717531,1738292014103,1738292081372,1738291769834,1738291748068,1738124212470,1738411534396,1738727904222,1738728226403,1738728295699,1738728753677,1738730541356,1738730683368,1738730774352,1738730849155,1738727604296,1738730926820,1738731025565,1738538424875,1738538424875,1738538424875,1738538424875,1738538424875,1738730052886,1738730182468,1738730263088,1738730390338,1738728863452,1738728051279,1738727738583,1738728922475,1738728137070,1738729282251,1738729519661,1738626923176,1738626913582,1738728108884,1742185573000,1742184952046,1742175405906,1739323350329,1742185091628,1739772555156,1692593444435,1698204593695,1742252462265,1742252453938,1742180379078,1740966637551,1742180562379,1743025679018,1741139369953,1741563931774,1741318485192,1741318552610,1741559538916,1741560685162,1741561636764,1741562161160,1741562209149,1741562539081,1741562556783,1741562646158,1741582953623,1741583195793,1741583469730,1741585127316,1741585153920,1741739113832,1741739136600,1741739328754,1741747462778,1741747499153,1741747510663,1741758013669,1741758026171,1741758046077,1741758070635,1741759026059,1741759049650,1741759093170,1741759105452,1741759120620,1741759154501,1741759202945,1742098622436,1753749365913,1753749578832,1753935444538,1754908273632,1759279585627,1754908246354,1754953576684,1755130454912,1755484434934,1755487124880,1755487161226,1755498786537,1755487257311,1755487271191,1756607436004,1755487997172,1755488613323,1755498820592,1758272736499,1756385173557,1756385998278,1757018008901,1755487321101,1757015090686,1756682249273,1756684971928,1757471263785,1762128028102]});
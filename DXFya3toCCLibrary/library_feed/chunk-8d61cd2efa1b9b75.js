@@ -0,0 +1 @@
+ccFeed.chunk("8d61cd2efa1b9b75",{"lib":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"id":["62e804f2-59df-4144-bc9e-7a199ce06328","1d51bc46-f219-40e4-b3a7-08dbee926682","74237d5b-be7a-4ade-9e40-282e3157c3e3","98a72920-06c6-4242-b191-eaa8f9542535","eb1c08fe-a53e-4f6e-a6ac-95606237c804","dd324e57-6a31-4a77-b3bc-aa235efea3ef","cc57436c-dbaf-4853-b47d-72a8c45c83ae","56856bd9-8118-44ee-8bb7-549b2b44912d","d776ad7b-53ff-4ff7-b6a2-0dd7fa26385b","a5c7f386-cfa3-4ee8-8591-8ee3fcb658ef","6eb02275-cba1-4213-a15d-cc4709b23cf1","38be9d0b-cacf-4769-a658-b4d49a6942c8","34771ff8-ac6b-413e-87d2-2d0891465531","a93a5325-fa58-448c-922f-7e306ffaecbf","bdb59717-f8cb-440e-8fd4-d07d92c43d68","f0f313bb-a03f-4ef4-8d88-d524b176a615","b47e1866-90dc-46da-8d7b-5dbf5c1eb368","a300180e-06b7-4162-88f9-d3723a8b6467","7e63725e-651f-4125-bec5-e7d5421ad53a","e0a9bac6-7f21-4521-a866-f0c16be1a32f","b222bd2b-eb22-4e89-a23d-a55e3f35a552","df576617-aef2-42b7-b2ed-718fdfdd933f","fe0f7d49-94e7-43d3-bf6e-5c3b6ec80777","902bebc5-5e84-4de0-b161-b9deb538aa79","42f42462-bc03-4d22-8580-7fb18ba7444d","2fa101a7-f4ad-4c89-af95-6b4b1f34e6f7","a343b97c-3cc9-40ae-8791-59929d2aa06b","b54993dd-3939-4cfa-9e28-3ebcfbd1c7e5","55527c3c-ffc6-4727-8634-bcfb95a5f820","c960b1db-a1cb-4dcc-9f77-77834651ba47","edc4bd6e-4928-4207-8da9-bb03d21e29aa","04cbef6c-f49f-4029-9846-561832fbf80e","a81c3689-be27-4404-9411-62ed4845c0b3","1aaa0ded-aabc-48bc-a338-8615d4efa7f0","195ee0fc-288d-450d-a553-330c4743420c","a2dd09c9-8827-45e9-a1c9-62fdf6a1b0e0","4ca25b6b-6bac-43d3-b5f4-798990f5aca3","d93f4f1c-69fd-4970-bcf7-0ae639a419f7","2e9fadf4-59b1-44f7-b02f-ad3edf3392a3","ca156636-9a63-4070-814e-52f94a743088","b48a51b1-f82e-46d2-99a0-a57108faa818","80b05de7-b41a-4e02-b85f-b6e71a97520f","ea8fd957-7873-4542-b307-23d75360cf77","4bbb1db3-36e9-4439-bc78-810f6c50a377","d0957152-c3e4-4648-a782-dd887453870d","01e7d3e1-eabc-4d14-ad53-44cd85f17859","69a3b824-24c4-4da8-be89-18a3972e344b","356147ab-28b4-4051-abab-f13cdae5cbfe","bb4b6c57-a462-48cf-9c82-83c617f5460a","46ed5d5e-cfe8-4f6c-9635-6e0cc28a1bfd","1424d46e-79fc-4dfd-8a5f-0ba73521ef72","23f7ee93-eaa8-4b94-8d30-3ce3afdad250","f30ccb8b-bfae-46be-8240-f8431ad220bd","9633aab1-9c87-49df-9774-f55afbb380c3","94067e9b-5168-46c7-867d-a6df21967769","38c76723-628d-459c-999b-45ae9ba53dc0","68d499f1-c58e-472d-9931-861b69034bb9","5860dff0-0779-43e4-8fc4-06981f4d03d0","b7b26fee-bfcf-4f37-aece-08f6431ec144","5f743e88-41a9-4386-b0f8-03ee930e0771","9fa79815-c6c2-42b0-917b-0c297227289e","2f72b8a7-4e8c-498c-b8b5-333307d59e7a","d72cf26f-f6b8-4cb1-b63b-784b593bfbbe","d65a6b09-749d-4455-bb7e-6960bff5518c","43a26517-cd22-43c1-8045-84119f22483c","4a86ff54-a444-43ab-a1b6-a15755c799e3","e447ef82-c751-4017-be78-09a084b77e01","f1f93c4b-12bd-432b-925c-a4ad57a83162","69c7fb3f-9aad-4aa6-803f-ef3839479161","b3ce556f-4dbb-47ee-8c21-a284dd9e6a1f","559da75a-9579-4021-9f7f-dd9397f595b5","d4526f9f-4210-4a67-9be2-4578c20b66c8","eff00405-2865-4359-afed-b63d66d01e79","58ba67f3-b647-4a91-96c5-7ac7be1840b5","ec98ec12-48b9-4bea-8056-a42551cc2263","9a10eb92-46e8-44cc-816f-bd489ce508e5","d75a59d4-f858-4782-b34d-f3fa87e42ad3","3f8d722c-14a8-4d9a-87f3-694f9ccb8ba8","251cb3c3-ba34-46e4-9a1a-47a0a15efdea","1ff66256-2a74-491b-9a8f-43a2e9bf901a","22860dcd-1690-4a1e-ba03-168dd1926dcc","8ccacf4d-8ad5-4f80-979e-bf8c5304a906","07571bea-6fa2-46f3-9f8c-923186ac23b0","eb851110-71d5-4f56-93ef-b2de91576380","7162d351-e8fa-4ed3-b439-f1f414481a36","228d4d27-fd59-49ca-971d-4a072de84042","96f8640d-c31a-4b95-8226-655cfd7a06cc","6568432a-22e7-4032-8228-bb73b4a57418","a55caf85-5b29-456d-ad90-50fe2e94d504","dc751dac-9803-4d84-8283-686fb010526f","bfb08370-a2e8-4235-8ae1-b6dac271685b","7bbac55d-9fb3-4ae2-b768-a28b1c317591","64b341e2-6f38-40ef-a17c-922e295eea22","6cd7482a-922e-4094-ba18-31734f2f9920","6f7a8575-a35e-4f7f-b869-a5b67bb8ad1c","e4544a7a-a57b-4b43-aee9-f6be8bb50a46","acdf0236-f9f8-438e-8484-df3bd6569cb2","b995c6f4-b0fe-466c-8104-140f99bca848","d74b0d45-e18d-46dc-a2a3-5309c3b9b7e1","fcbbbd36-8673-4488-a6bc-e3bf8ca57e1c","4d226377-fbfb-44ad-b8f2-eee1a77c298a","68dbff7f-be43-425b-bd7c-ceca0d175de6","fe8706c5-fd97-4ea7-961d-911536e98f59","e3c143ac-a396-4e88-b993-2ce2995c644c","0bfbd335-177e-4dc9-aff7-08f1dcb4ae36","53d17c01-39c0-4137-a0bc-768df4392a08","7f4ad751-505d-4e06-8d79-40567da8590c","773b3752-7b8d-4eee-b992-b0b8c3b2d47b","fb147ecd-e49e-4596-880f-1bd3a879b8ae","5f8b1fbe-5fb8-43c1-96df-13446d427ae8","b26945e9-c27a-4d72-8884-1f3c01162a71","786a5fc3-7fbb-44c3-8cc7-37a7599013ac","f5818533-2e0b-41da-9590-e3e775557647","d206afa4-9dd8-4700-87a8-0a6465725776","04c95f82-bab9-42cb-bacb-c5fd68bee7b2","1c0c6e3e-7a48-4afb-b412-8ff274fdcc89","90d13257-ce52-4fe7-9802-b5b549ce78f6","652bc745-e62e-42c5-9bdc-ec3dfc82ba2c","0fbb051f-0a1a-441a-8d6e-90650edbfb1e","8b739a3b-2f4e-4f0c-8100-9f1b69bfaaa8","ca29cdea-1c32-47c6-bdda-6c493cbaba86","70de1706-66b8-4146-93fb-cbe0d2f5368e","e94d46a0-304a-44e7-b2b9-501cd0250956","f12fcb8a-df0e-44fb-beb6-50f2937e3476","729d84ea-8895-4211-ad3d-0e65c7988b27","726c6dfd-371b-4da2-991f-b7225f90bd6f","b2ecdf02-f4f2-4fa2-84ee-753dec600db0","4a89c28a-3813-4e45-aebb-a21f50ac245b","100a9663-8d97-41c8-bc9d-f35ac4e3f6b4","f6e2145b-50b6-43ce-afc6-6eacbf1e2da4","2edddc89-4fd9-467b-8ea1-7c508a84d8a6","fea7a4fc-bf46-4a5c-94f5-4bca5afaae1d","6a4791a8-d19d-462e-9cd0-020de7963760","a65805f8-f4de-4bf4-a1a6-751c1a03e9fb","cbf56ecd-9fe5-462d-bd43-35592f12b447","4e23cc8b-2aa9-4460-9ffc-c2330741f19b","6cc13eca-2f9d-4b9c-9fd4-c55098e58e4f","6dff0eec-52a9-4c09-a3a5-4419e106cdc0","6f4aaf0c-da1d-495a-be17-93489a9f13ab","681c2497-258c-4211-b2a6-407bcb0ca1a0","c2e8b5e5-6b90-4634-ae23-21309d43ddef","7ca27257-cd46-4697-ba0f-2e0a1779a5f8","735385ef-a2b5-4ac6-8890-f45394e3112e","2f261a71-6a4e-4841-86d8-a7cddd0b6dd2","d07eeeaa-eb32-4576-8c24-0ea3d882e720","12888116-644e-4604-91ba-91b6a646add6","a65b007f-bc71-4112-9461-3317a9227be1","44847416-f56b-40bc-8602-30e0a8c6ebdb","f1f63967-6fdc-48a5-902c-07ed30d21eda","5c61ecdb-6b67-4b13-a720-cf969c4b0b39","c4a3e1ad-63cf-4b74-b788-4cf0361a2dd3","a23c5c65-0d93-4d91-8a6a-51cb4740f783","a0d07ab4-9503-47f7-ab57-0d35a009b41f","3d84881b-bb2a-480a-866f-12d77714e2a6","c180b665-343d-45a5-8b3a-912c220c52f0","df11089f-43f8-4b97-953a-b211be714274","9c5d5206-dbcd-41b8-a84d-c0911bb94863","49807b63-e922-4b3a-ab37-7bda8cddf64b","a227826c-dc38-4cf7-b419-a1885b34a58d","83b81c24-6fde-4915-b6aa-ee95caa3a0b3","b53791fb-4891-4721-be7b-078dcccff86d","c2625867-7eb1-4a91-b4d8-8339ad0498a8","5e0d8e5c-8dc5-4f06-99b1-7b58b69f18bb","2f46a6ed-e4b0-4571-bf9a-8db83957dc82","d2a4f401-84a1-4b81-9aaa-82f66ce8b143","0f79a830-ff50-494e-b2ab-e77314be31df","4f48266b-669c-46d3-aea9-f9c302d5c5f1","0f52b4ca-d5b9-461b-9aa7-849aba58f0fc","50751330-dbee-4888-abec-02f783dc7324","20a00064-e0b6-486c-afbb-80f923d28a87","b123d72d-5035-4e0b-a65c-6aaf9729901c","412a986f-257e-424d-8d78-da8bacb8ea7d","57fa4154-5386-43bf-8b07-16279af34f0f","1dcf3f1c-f704-45df-8fed-3569ad29e699","ab9099a6-f3ec-4b81-ac82-314e2c3d9e7c","516867d1-3473-4788-a866-205329581067","26a22bca-9743-4ef0-bbd2-c2ece3f16350","b336ebb6-3ebd-4504-b0b0-e696f7600711","327f8dd2-d30d-4575-afe5-030c24ede888","58127ab7-7eee-46ab-85e9-c8e9ac8063c4","1f9c7c8d-0cd7-4438-9410-c943ba8c5499","dfca05b1-0888-4208-b077-5eb689355e03","a997f9c6-af55-4898-ada2-2af4467d7a66","c853d0a3-21f7-4e9d-8e25-c2b3de49b32b","96c5dde4-9f3d-4a14-9250-4954dda64ab2","7e22ac87-cf06-41dd-9868-121d8a10dea9","1dac1f39-f3f6-4245-88e5-0d689dd60377","68d74240-b082-42e0-b3a9-a9834aeaa7b6","7f64890b-aeab-420c-a192-7cb007fa6567","4f8d2c4a-7a94-431c-baa6-90e368f3289a","461eff2a-7d46-45f3-87f5-11204095a5d2","219a2e40-0d63-4fd5-85de-4dd4bcaa4d51","50545347-2840-4933-b9c6-153f61ac8fbb","55ad70e8-b0a6-43c6-9f58-f481bc32c5cd","c7df34ce-7a58-4e2e-8661-e5b09e828044","53f6ae42-f950-43d1-9732-97b0592c3ea3","172a9d84-5afa-4722-873f-135b40d40b68","5687fdb5-9860-4ba4-b8ea-d2aad316944e","fe727ddd-d7b5-45ca-bbf7-48f75c32e4ed","8f9ea1d6-597a-4465-bfe1-baee99eebb96","893fc324-8ff7-4ed3-af41-3d9d8d14c7ab","27934b80-77d2-4c3b-a736-98f76b810b68","e82ce899-9197-4cbb-b42f-10a032e6c9e2","ae23a1b0-b270-498b-b3bf-573d025f6ccb","3b016cbf-5ad9-48ab-aacc-4dac7955b869","dc44232a-d15c-4e94-856f-9d12c4ee2ad8","7b206306-066e-4c98-a091-4d8da2e56711","e82493aa-32ff-40a9-8516-41fb8d0eb822","d571cc2a-b72f-4bc4-b136-bc80a03db848","6880a70e-66d9-41b1-8106-fa6636e4f0ed","26e2ed34-e5d7-40aa-9556-5cb7699a19c0","8978846e-ccb5-46f2-afa0-528456a0e2dc","5fb407c2-363e-4f0a-983f-f1f455454124","49a3759f-76ae-443b-ad11-470a5e43e7c9","8e927e38-797f-4fa0-8b5a-75876c50a868","52eb0883-44ee-4960-9f8c-bcec347f9129","e9877441-0931-4de9-9f0d-4aca5887c1e6","0e248238-1525-458c-a8d1-dc1bef9da9f9","bc696916-1580-473b-93b7-4887b85d5919","b494576e-d2b6-47d6-9540-654344ec12b0","a49b8417-db15-4918-870f-d9128e031cf0","8da08962-ab05-4ab3-b6be-12f14b96034f","fe8e3fd3-24e1-491e-a9dd-2e075efb7abc","5b436b1b-a35d-45cd-99c9-9b1b603be56c","69dc7a27-dcc0-4909-8eb0-a0243b839d00","9f0afba7-0169-4c19-9717-8621c56e7c66","c3bc29be-7130-482f-9aeb-3de028e7b35b","cb662535-8cfd-484f-9ab8-065577d7ba9d","6a8e3def-8a93-4a64-b12c-bd21a81810f4","f4d0de0d-f926-45cb-89db-ee38db4c5bfb","f68cf03a-6f9a-45bd-9194-51ee5a4abb41","f991213d-a7b2-4b29-b3ad-b129b8887cdf","a7697e9e-8d7b-4d92-bdbe-a4796e8fc03e","e6716166-f97f-4ba6-a7af-413cb08ba1a9","a810060b-68e7-41bc-863a-7437a6fa819a","a6245e99-a77e-4c20-b80f-1abf7858e6e1","143d10a5-b64e-41b0-8b26-23e77a517570","2e42463f-4b04-41e9-9aa5-c159bee6d810","c333d092-6d79-437c-b7be-65a5ad1fe5d5","6fd1afb8-4f2e-4c90-93b9-139fc382f088","17ba539c-e0e3-4734-8221-909ef37f2171","3bf36a95-3e5b-414e-b9fa-f51d57c23e7d","8a1e3d8a-3abb-44f5-8e7e-c0f3ca0dfa03","e4d869bd-29eb-45eb-81ac-d6eacf0515e6","90bc25a8-1a4e-4226-a386-340c7eb5e225","9c94a089-d40f-4ed1-87d7-53200cd2aa09","0849699b-2496-4015-93fd-5ac486cc4af1","276c19c9-422d-4a8f-b489-eb10792d5cc7","a22c0cee-6e90-41f9-b5d2-4fc279c5d390","08b148d6-8ce2-4309-bfcc-7511e3f8cf78","aa4a5694-37a3-4ed2-a170-7c66d01e22dc","04f8c58d-9277-43a1-8cb5-96280db3dd2f","a95013a1-8b4c-4a53-b269-327c8d1a73eb","62f4e650-84b0-4125-b5f6-710de01cde58","0c5552b2-b3a1-4429-821d-9616fd600110","37b93f31-2fd0-454a-8ce2-5fc181c26fb7","469983bd-5614-4ce3-b51b-2c8b6fba53d9","a5321f74-90ad-4fc6-9a1d-4a1f8837cc8e","42a57287-1306-4be2-9091-0cd0b6722c4d","7f8de8fc-7f1e-4be3-bed3-54abba9b0329","5c1fdddc-3d80-4e33-8089-e6f5f43551c5","ad238c28-87ad-40ad-8936-c9a5901b3eb5","c5b54919-29f5-464a-ac32-4894d6cf5038","fcca4272-f1c2-4f24-9e9a-cf08aff01198","cc10d08d-9623-4dfd-a9f1-22c212458e38","810c4ffd-eb28-426d-9292-ea65f49b5eee","5576356d-cb77-4f01-ad32-861f60c97ff0","5c9379de-2d71-43d1-890c-89f055cd22b4","0145f8f6-c1af-4a1f-ac31-6390c873edd3","5a861c9a-ff62-4d05-8e48-08393eecef94","02f8e937-4fbb-42db-9e49-6634fcea7ad9","fcad72ec-662e-447b-8131-5512e43c0f0a","61572c81-5a89-434e-b087-704b7aef4eec","4befb980-d2ea-4746-b0a9-b7622fb30ec6","ebd27d3c-3704-4970-9614-8b4261230f9a","78a321db-e87f-45e9-b82e-50950d524c30","42c32e76-e43f-4b57-9619-aee8b9d41fe7","f95b897e-23cc-4230-aa69-7ed5d25ece0e","5addf16e-eacd-41d0-a3f7-57edcfe6aaf3","9cd87f68-675d-460a-a2da-b254464fe4ab","7d36d325-a81e-47c7-82e2-42c52ff70097","906fae26-1f8e-4878-839f-7270c49ee491","a6f412ab-7ebb-4718-82d1-138ba7c68543","5e9adbe6-41b8-4092-a945-7e10fcb40bfd","0ed6909e-0223-4065-bc14-2768b8ae5d67","e44a70ee-7f89-4b49-a63e-fd8dc8b5673d","1607efb5-629e-4cb9-bf45-d16010ca549d","7e83f9bb-77c4-4a94-b4ee-be8cd0fa648c","f0ea948b-286e-4b17-91e0-c19243621c60","bf1a1f5d-29a0-455f-bee2-0b42fee563e4","e704390c-1f57-4fda-b495-2340f06db46a","7c967746-c1c9-47b4-ad72-fe43907c5859","650003d6-c9e3-4ab4-8686-5e9728148c1a","e7874af2-9d1b-4717-8a2f-8b63b325382f","066973f5-d38d-445d-91f1-f7f7f0b23915","240a930a-55b0-40c5-8bdf-9a9219b24ca3","00585e69-3a17-41a8-a9ff-1f1265694ed8","44f260c3-47e6-4221-9d5a-70ee7b8e7389","a87abf74-d855-4b93-b383-9b67bd54ecb0","151ce84e-7c09-4a4f-8d78-635d23864137","526e3585-cdb8-4117-bd0d-34349e977f6a","7b3b2aea-1d5c-41e3-a9fb-84494af80c43","698b3075-4bf9-4079-8063-5f4370892b8d","707b7231-54a4-41b5-9222-b2c66206f33d","449b37b0-f065-4689-8c7c-ed82b936d69a","352f9446-6ed3-4b56-ae4d-24077ca84e6d","3d32c825-2504-4eef-8ce9-5ac5d62937de","3c2a76f3-fd3a-4210-adaf-f0b072a202e7","01659d98-981a-4e8b-8554-3058c236d52c","2e05cba4-032a-46ed-ac6f-2b7d89684556","02f58d35-b98c-435d-813d-d7e3e39b6856","b3277426-cb13-4084-82be-d917f468a4ec","c1c5ca42-09b0-478f-a708-a11c1766c087","a61e5e8a-a6b4-4248-9e49-14d0dc8879f8","652d948a-31d9-45dd-bc7c-fa3ad4479e06","092ac9af-91a7-482e-af9e-862995dceba5","62555d36-a392-4c65-830c-1bcb54dbe4f8","805d5e4f-0167-4309-b2f2-683b50a85185","52483dad-0fa7-4296-ba80-c4bccf82e8be","2a5f452a-639e-4dfd-8cdd-0f47f7e098c1","024941e9-9288-4fd3-915d-5c3f1fa2185b","05df709a-a003-4f8f-b409-983eab8519d9","6741e059-4221-4880-8a1a-03e3ef86d0ec","595c0dc2-5702-4bae-b072-fa51656def0a","b4e1b62c-e552-48e2-a21a-5920ac7f49a6","4a355888-6315-453c-be57-7e792fd2ea34","4381fc5e-fdfc-4b1b-b03c-8498ca242b1f","ddf75a5c-800a-4f25-8448-ed09f688a55c","82120bd8-b375-4597-bf10-1b80c8c7bf0c","4bcc6893-b064-4b2b-92d4-46702cbb8f52","9f0b441d-ee45-4de1-82e5-7ad6c8f4062d","7c4c992f-f4cd-4b48-aeb7-0cb466dba413","f29c56b5-1c67-4d18-907c-6f2ce490d2a6","329cf5e4-3c07-44bd-b301-86daad6951c4","abdbdbce-914e-42b8-a2a0-0c36a5021391","2a35200d-c92e-4340-bb66-2050a2585ddf","926fdf48-6b27-4e50-b3af-0daab54484e8","08386219-0f9f-462f-a80a-c3d16b3629d9","c3e5fce5-b08a-49a7-bf9f-83d507931033","8af48eb7-7551-4926-82ec-1ffade07cce8","a98f9236-d85e-4927-9901-317243c2588e","dcd70e9c-a305-4167-a79b-7e4971cd19c2","d293225d-31c0-4a75-89c5-d83c53494be3","8517c5c9-2e45-43e5-974b-0f13bb2ded37","d4522767-d960-410b-a346-f4fd0522c879","cfc9b1c7-79b6-456e-b84f-9519848e213c","671be79b-a4bf-49d4-b40f-a01246e1374f","f89ccc91-98b0-4197-8ffe-3e1bd354fc43","9e6195b9-5d58-40c1-8c78-4b42fc1e0ce9","8368675a-fdea-42dc-b6f9-12c5849999cb","2371e147-2e37-485f-b693-1d75b480834d","290e52aa-2f97-402e-8031-931dc8dd8232","7d9311d2-2610-4834-8b89-afacfbb57d29","256ccc00-6301-4e35-9ffd-36762697fe41","37fc2988-349f-41f3-bba3-9ed31f7059da","9f496a59-3c71-4ca8-8e35-ac63f9c9368d","31172f8a-7ff1-42a1-ad61-6200b78d5dda","30bf68be-b144-490b-8b30-1501af8624ee","378ef015-4ce5-44c8-b3f2-9bc345f5445a","9eaa2218-0fcc-47a3-8d6f-6e26e793c0cf","99eb2cbc-f680-4e92-84f7-ec628a1b32e0","353ebe67-26ef-4bf6-835e-fb2f2476f1b4","18e29939-6635-4946-a15d-9dd3f3b64f25","3697d011-6166-4e81-915d-5fc342fd5de0","7d33d1a9-e3f7-4099-b86e-1d17fb6dd558","6ec4a871-4b3b-4882-abc5-5ff1850ee162","7d2add00-be22-456c-8de1-d2c9fb263cfe","6633bbca-e70a-4cb9-bdbd-515392a42bd2","d374650b-d4c8-40ca-98ec-e4f7878f2737","59bb8af2-55e3-4674-a910-1874a6edbc65","c8a35ea4-bd56-4ea7-bb16-eccb03f655b8","6e1ca6d4-ea0e-4475-8657-a9ab82249fe3","d19f531f-0158-4ded-9cd7-07f1d67d7818","c438fd3a-a08e-4a78-ab88-626ad12dacff","b81799d8-dc7c-4028-9eb0-17ab3533722e","b15be85a-29a0-4b0b-8e61-c27734ac6e1c","55fd9ec1-f2a8-46ca-8035-686a42bcb830","a8f1c541-1acc-4d0b-94ab-b6d7e8911899","ec7c5c1b-ae60-407d-81f6-77ed74f27f4a","35ebde4b-52fb-4b9b-9da4-bbf15f5d3fa2","0a7a5e56-66d8-44ea-ba51-9a1257d05f02","bfdf7630-43f4-44ff-b917-8ecb9a58596c","6edd0202-ed3f-493d-8dde-3cf2d242efcc","3ec0869b-a93f-40af-98f5-a9a4a0182653","ebc55338-94b8-427b-9548-7f8399559359","1746f253-5e5f-46ff-b140-81c7bf910686","a3cf9ada-7add-4c0b-9c02-498737783ffa","125e7770-a99c-458a-91dd-e029a5817422","c6bdd18a-c3c6-4301-8f11-fcc8c4b73845","638fdccd-968a-424d-96fe-4a1049cecdd5","3537d0ac-d2ee-4555-9651-8cbe21a20f2c","72ee9320-a7f9-495e-86f4-1e91a851b035","be908ca9-d67f-4509-a351-40db1f72052a","311ad7cb-b7b9-489d-944d-9c8568db5c37","50074ab6-0428-4f15-9ebc-d5f040caba74","0b435e7e-50e8-4311-9747-e4e4990e46a3","77600fed-d879-4aad-ba46-a7e50b9fa45f","800966b4-e226-4917-855a-5181a3ce4419","484f9a70-97a2-4d3f-b6c6-a3ed44cde8ef","aa385f79-f7f8-40d7-b98c-7580a6d45d58","b8b7cee7-2bb3-42c1-9b19-950e35bbc8d3","4e70f8bf-3346-49a5-bde2-6521ce652797","eb5c5bc8-c68a-405a-815d-eff3956cb371","182e7475-c488-47f8-996d-80cefca23751","f7b957c1-9879-41b8-85af-415598c3a3de","a6627650-9fe3-4482-b1aa-13fb887f173f","ee27a2d2-212a-406e-a62c-49ad071963bf","9f1c3f7f-9667-4ac4-8a12-476bfd6f92a6","af663635-92eb-478a-9706-b10af6170686","f62ab11e-6eb5-4089-9c20-f4106b4946b6","84ca792c-2476-4a75-9d4b-dcd3de4b4c0a","5e02b1fe-d52d-4d51-823d-64d138642c89","da510e0b-cf8a-4d8a-8b19-a2b8339da996","7f74abf5-4856-4a67-98cb-01f8b006b2eb","ecec33cc-153a-4cc5-9b4f-bfc428e2ccf9","6a82c7ce-785a-4c30-83b6-f9627eaf066c","e1d474e4-7364-49bf-8e4b-97956d0cc7b2","270e0783-3da0-429e-9a5c-b8c2858a4d67","e34ce870-9ac9-4578-b494-77c532ea4133","bc5d1c57-ea67-4a15-a0b8-fbd3bd7df397","a8f0ea17-a1e2-41a1-9edb-6ec0e2548dab","d34939cb-36a8-47be-8f0f-6010f3bf0f5a","1d1c37fe-e8aa-4ded-b6a9-fff9dc9572fe","60d0e4ef-d3e8-4ac7-b966-6556821a3aca","dd4d8725-e7f5-42bb-b8b4-0217c70d3e3d","ea4b02e6-07b5-426c-b71b-7d566ad1a322","9a20980a-f759-4a84-a0ec-1e6d30e3fc7e","d712ca61-9a9c-412a-93c1-4da48d83f360","32eaf427-b83f-4690-b49a-5ab339a67e00","73e63964-b54d-4b40-9fb0-f4cae1db6c95","572ce7b5-7d8d-4503-a7fe-1adfb990aac8","d3c5d669-1a21-41a0-9955-c04f099eb4b2","04350cd1-c938-4a5e-82ca-c4e7251a13c6","8facdabe-79ce-4825-9b95-2f558f945e77","7f9dc3b5-a48b-41d6-8a68-2b9a928b2110","7b99cd06-331b-4f18-b3ae-2fd1ebaed641","3963ed1c-a1df-48ae-bd19-6176337371dd","24755f58-af1b-4823-baf4-af4739fd0a08","a81bf0cf-6bd3-4a05-ad10-0cd70c03215f","9ec328d2-54a5-4889-a646-d069a5b5948e","5c31fdf1-9eba-456a-bc04-a896cdb7bf51","69c80378-4439-4448-85f0-da6ed02840a1","902f2266-6636-4d08-a610-81cf731b38eb","72b5f99c-e522-4169-8781-04ef8d1c3a45","5a7c6e43-cfed-456a-b0f4-1b2b765a7bfa","25f2ce40-1664-4bb1-b7ad-377bb5765c62","4a686d4d-51e2-4ff3-8286-0b882f88328b","77327134-de60-460a-9c77-bee238af9179","cb1c153c-0d2b-4d4c-bfac-1a92fe39f644","26060c93-8767-4bdf-a351-85b6b1c1b591","a440bd86-9ea9-42a7-9d67-82d2a7b5b573","110d8d13-a077-4a57-a1c3-eaf6b960963d","85ccd755-10d7-4498-982b-43a6520b24b2","5679ab03-4a74-4e4a-92c5-ff32bfa8c34b","13c1222a-def2-4dd7-b6c4-089167ff1602","e9ec37e5-9cdd-429e-8ce5-b98f32a5c450","aba5a64e-fca5-4443-ab13-b38b9ba08618","a8ae2bc4-6779-4e94-882d-94f95ffea530","ed9dc324-454d-4699-b53d-f7f1779e4c44","b70d2e6d-1914-4284-8cf6-81c0781ef974","766a31bf-b0af-4659-bab5-6c983b3dd4a0","6f25d1d6-82cb-46c8-a256-831e7d54f497","b89e0084-0348-412e-acf1-ce9135c35fe6","c12f2975-83da-411e-820a-2c226aa1b3cd","f3397285-da51-41f9-9ac6-0a2e3a51a5d6","7d53ab35-0fb8-4771-8cc8-1e14a87b6289","2ff7e312-b4cf-47c4-b994-53cfdaab82fc","001af4dc-879d-466e-a994-465ee57a9883","8d24e7ad-6207-44a4-acf7-14f03ed6e028","21aed0cb-443b-4e5c-8275-73310abd325c","81a9c631-38a9-4975-aa2b-22413f506126","0953cf56-e902-4da4-a522-fc5b18b37c32","47ad1e3d-cd72-48ca-8c36-f1ce51aba8dd","c3e0c75f-1818-400f-ac1a-3bda7b9f6989","9c13aa07-048d-474b-8d2c-aeecd733ed89","9f24690e-f074-478f-a398-30953a4c6008","1c566247-3e75-4153-9aba-b45da791dfba","2f7f5ae2-edbb-47bc-9b1c-6705784f3f90","0d3514a6-120d-41f1-be90-c56a51c2aabe","58a7782e-aeb4-471e-80c1-243060e401bf","f4d004d2-149a-4a7e-8d42-2bf5b2b486df","eb60fdde-c7c2-4b11-99d4-5ae0a16df73f","a6009d68-ac81-4859-9dcf-bf9430e5c3d8","43a6e36f-8b87-4785-bc7a-71d8751de90e","f5345fa8-3c48-4fe8-aa77-59127d70d96d","0d5e9bd3-14fd-40aa-8ad5-be96edb9b8e7","84481c23-6cfd-4c4b-b9b8-ab656e53a7d8","9f324d2d-2628-44b4-bef5-0b8bde768d94","26b374eb-41df-4ccc-8647-fd24f7b98053","e3a56567-6cdc-473e-bfc9-3b4236d97d34","7e4a67b5-fc4e-4cd1-8f83-b6b01f2d896a","3e10425d-2ae4-4672-a73c-f48670324fcc","494152cb-2be1-4fe3-973d-b386c46f72aa","85ef5eb3-3cff-4463-9a51-d1c728546b76","cdbbf929-2dfd-4f96-a8cc-48c883217a6f","50cca46d-3248-46d9-9f2b-123a46f99201","6066580f-0ff3-4beb-ab9f-72e397da4e64","82a552fc-2953-41b2-acfc-9bbeb049f8c1","29ed85f8-b65e-4e99-8acf-0c2542d5812a","2ec9704f-278a-40cf-88d7-23667531f265"],"name":["Untitled","Untitled","C=78 M=13 Y=38 K=0","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","R=13 G=85 B=128","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","C=88 M=60 Y=38 K=18","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","C=0 M=0 Y=0 K=0","R=3 G=147 B=71","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object"],"type":[0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"file_type":[0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"file_name":["","","","Photoshop Temp109280619487.ai","Photoshop Temp109527009487.ai","Photoshop Temp109602519487.ai","Photoshop Temp113487299487.ai","Photoshop Temp115430909487.ai","Photoshop Temp125502309487.ai","Photoshop Temp125526439487.ai","Photoshop Temp125534629487.ai","Photoshop Temp145901159487.ai","Photoshop Temp146367279487.ai","Photoshop Temp148522029487.ai","Photoshop Temp2037367143733.ai","Photoshop Temp2050575943733.ai","Photoshop Temp2050988143733.ai","Photoshop Temp31418691479.ai","Photoshop Temp33436243143.ai","Photoshop Temp36321223143.ai","Photoshop Temp36326583143.ai","Photoshop Temp36339233143.ai","Photoshop Temp979931229823.ai","","Photoshop Temp12824404083.ai","Photoshop Temp13156694083.ai","Photoshop Temp13243364083.ai","Photoshop Temp23267704083.ai","Photoshop Temp40487454083.ai","Photoshop Temp48491694083.ai","Photoshop Temp9831212762.ai","Photoshop Temp9902022762.ai","Photoshop Temp9913542762.ai","Photoshop Temp11753022762.ai","Photoshop Temp11770682762.ai","Photoshop Temp13392632762.ai","Photoshop Temp22036444661.ai","Photoshop Temp22302824661.ai","Photoshop Temp22389784661.ai","Photoshop Temp22445144661.ai","Photoshop Temp22500274661.ai","Photoshop Temp22593204661.ai","Photoshop Temp22632614661.ai","Photoshop Temp2021791236570.ai","Photoshop Temp2145769536570.ai","Photoshop Temp2146429736570.ai","Photoshop Temp2148993136570.ai","Photoshop Temp2150087536570.ai","Photoshop Temp2151695836570.ai","Photoshop Temp2152069036570.ai","Photoshop Temp3619193036570.ai","Photoshop Temp3689275836570.ai","Photoshop Temp4720742093944.ai","Photoshop Temp4721836293944.ai","Photoshop Temp5005056093944.ai","Photoshop Temp7506861380.ai","Photoshop Temp228368305825.ai","Photoshop Temp228374785825.ai","Photoshop Temp228380845825.ai","Photoshop Temp228450475825.ai","Photoshop Temp228521955825.ai","Photoshop Temp283376695825.ai","Photoshop Temp3755460520325.ai","Photoshop Temp4553352020325.ai","Photoshop Temp2720873224307.ai","Photoshop Temp2720953924307.ai","Photoshop Temp2796812724307.ai","Photoshop Temp4399817460555.ai","Photoshop Temp4401682560555.ai","Photoshop Temp4414272260555.ai","Photoshop Temp4415866760555.ai","Photoshop Temp4416478360555.ai","Photoshop Temp4419734360555.ai","Photoshop Temp4428026660555.ai","Photoshop Temp4463944260555.ai","Photoshop Temp236514006807.ai","Photoshop Temp236517036807.ai","Photoshop Temp236575556807.ai","Photoshop Temp239068546807.ai","Photoshop Temp239361986807.ai","Photoshop Temp239762076807.ai","Photoshop Temp247834856807.ai","Photoshop Temp247878286807.ai","Photoshop Temp247899866807.ai","Photoshop Temp253406516807.ai","","Photoshop Temp86441424672.ai","Photoshop Temp86739594672.ai","Photoshop Temp86781594672.ai","Photoshop Temp96315374672.ai","Photoshop Temp96372134672.ai","Photoshop Temp96420444672.ai","","","Photoshop Temp8224300466397.ai","Photoshop Temp31071896226.ai","Photoshop Temp31105396226.ai","Photoshop Temp31132786226.ai","Photoshop Temp536251041823.ai","Photoshop Temp29198704113.ai","Photoshop Temp31629234113.ai","Photoshop Temp31702944113.ai","Photoshop Temp31726024113.ai","Photoshop Temp31847294113.ai","Photoshop Temp31917004113.ai","Photoshop Temp31928024113.ai","Photoshop Temp64774879324.ai","Photoshop Temp64794099324.ai","Photoshop Temp67748019324.ai","Photoshop Temp67998369324.ai","Photoshop Temp68007149324.ai","Photoshop Temp68012419324.ai","Photoshop Temp68066949324.ai","Photoshop Temp68726829324.ai","Photoshop Temp2354875639983.ai","Photoshop Temp2394049739983.ai","Photoshop Temp2408996139983.ai","Photoshop Temp2409127739983.ai","Photoshop Temp2409290939983.ai","Photoshop Temp2416341939983.ai","Photoshop Temp2487476439983.ai","Photoshop Temp2487854239983.ai","Photoshop Temp2490897539983.ai","Photoshop Temp2492317139983.ai","Photoshop Temp76402002900.ai","Photoshop Temp930629614370.ai","Photoshop Temp1083903816046.ai","Photoshop Temp1084011216046.ai","Photoshop Temp1084119416046.ai","Photoshop Temp1085064216046.ai","Photoshop Temp1085748516046.ai","Photoshop Temp1088580616046.ai","Photoshop Temp1089329416046.ai","Photoshop Temp52704264.ai","Photoshop Temp70629264.ai","Photoshop Temp2621842264.ai","Photoshop Temp3598237264.ai","Photoshop Temp3635260264.ai","Photoshop Temp3659669264.ai","Photoshop Temp3831841264.ai","Photoshop Temp4381889323.ai","Photoshop Temp1228373614113.ai","Photoshop Temp1228496514113.ai","Photoshop Temp1229099814113.ai","Photoshop Temp1250936714113.ai","Photoshop Temp1279048314113.ai","Photoshop Temp1285862214113.ai","Photoshop Temp1286240714113.ai","Photoshop Temp1286287514113.ai","Photoshop Temp1286501714113.ai","Photoshop Temp1294614014113.ai","Photoshop Temp1297142114113.ai","Photoshop Temp1530082314113.ai","Photoshop Temp1538516414113.ai","Photoshop Temp1541196014113.ai","Photoshop Temp1576025614113.ai","Photoshop Temp1584892514113.ai","Photoshop Temp1587203914113.ai","Photoshop Temp1768805124179.ai","Photoshop Temp1770361924179.ai","Photoshop Temp1770510924179.ai","Photoshop Temp1770616824179.ai","Photoshop Temp1770640024179.ai","Photoshop Temp1771268224179.ai","Photoshop Temp1771435524179.ai","Photoshop Temp1785145424179.ai","Photoshop Temp1785219724179.ai","Photoshop Temp2198321130250.ai","Photoshop Temp2352552030250.ai","Photoshop Temp2352865630250.ai","Photoshop Temp2386090230250.ai","Photoshop Temp2508630030250.ai","Photoshop Temp2512476930250.ai","Photoshop Temp2686617930250.ai","Photoshop Temp511668210032.ai","Photoshop Temp512093410032.ai","Photoshop Temp512167910032.ai","Photoshop Temp512229210032.ai","Photoshop Temp556911810032.ai","Photoshop Temp633883510032.ai","Photoshop Temp633947410032.ai","Photoshop Temp874398216218.ai","Photoshop Temp874730016218.ai","Photoshop Temp874870716218.ai","Photoshop Temp876011316218.ai","Photoshop Temp877595016218.ai","Photoshop Temp877652916218.ai","Photoshop Temp877757616218.ai","Photoshop Temp877871816218.ai","Photoshop Temp887875516218.ai","Photoshop Temp40629758446.ai","Photoshop Temp931624915156.ai","Photoshop Temp954842215156.ai","Photoshop Temp954876515156.ai","Photoshop Temp956925415156.ai","Photoshop Temp1150922115156.ai","Photoshop Temp1150964615156.ai","Photoshop Temp1155615215156.ai","Photoshop Temp1156621915156.ai","Photoshop Temp1157631615156.ai","Photoshop Temp1157667615156.ai","Photoshop Temp2527116315156.ai","Photoshop Temp2533608415156.ai","Photoshop Temp2663003815156.ai","Photoshop Temp337459014699.ai","Photoshop Temp1119340414699.ai","Photoshop Temp1120129414699.ai","Photoshop Temp2301128626497.ai","Photoshop Temp2302949826497.ai","Photoshop Temp2303178526497.ai","Photoshop Temp2303472426497.ai","Photoshop Temp2304024226497.ai","Photoshop Temp2306110026497.ai","Photoshop Temp2383220626497.ai","Photoshop Temp2493616026497.ai","Photoshop Temp2493925426497.ai","Photoshop Temp2811126643577.ai","Photoshop Temp2944792943577.ai","Photoshop Temp2944863443577.ai","Photoshop Temp2945632843577.ai","Photoshop Temp2945988243577.ai","Photoshop Temp126339073182.ai","Photoshop Temp126347613182.ai","Photoshop Temp1927416520194.ai","Photoshop Temp3236158823795.ai","Photoshop Temp18190234560.ai","Photoshop Temp18201034560.ai","Photoshop Temp18289434560.ai","Photoshop Temp49395644560.ai","Photoshop Temp88815247605.ai","Photoshop Temp89994967605.ai","Photoshop Temp107978447605.ai","Photoshop Temp111809827605.ai","Photoshop Temp112131787605.ai","Photoshop Temp123143267605.ai","Photoshop Temp123179187605.ai","Photoshop Temp123425177605.ai","Photoshop Temp123456027605.ai","Photoshop Temp2421511426641.ai","Photoshop Temp2421587626641.ai","Photoshop Temp2421671626641.ai","Photoshop Temp2421763726641.ai","Photoshop Temp2421873326641.ai","Photoshop Temp2766512726641.ai","Photoshop Temp2766653226641.ai","Photoshop Temp2766763826641.ai","Photoshop Temp2766843226641.ai","Photoshop Temp37086269.ai","Photoshop Temp15268823301.ai","Photoshop Temp36289473301.ai","Photoshop Temp231945713301.ai","Photoshop Temp231999603301.ai","Photoshop Temp232023013301.ai","Photoshop Temp234849583301.ai","Photoshop Temp234855213301.ai","Photoshop Temp234861383301.ai","Photoshop Temp234865033301.ai","Photoshop Temp234867873301.ai","Photoshop Temp234870743301.ai","Photoshop Temp234874153301.ai","Photoshop Temp234880213301.ai","Photoshop Temp234883103301.ai","Photoshop Temp234888433301.ai","Photoshop Temp234891533301.ai","Photoshop Temp234894683301.ai","Photoshop Temp234897433301.ai","Photoshop Temp234901423301.ai","Photoshop Temp234904103301.ai","Photoshop Temp234907633301.ai","Photoshop Temp234910513301.ai","Photoshop Temp234913383301.ai","Photoshop Temp234929533301.ai","Photoshop Temp235290653301.ai","Photoshop Temp262429283301.ai","Photoshop Temp2937186531083.ai","Photoshop Temp2966996331083.ai","Photoshop Temp2967065631083.ai","Photoshop Temp2967192131083.ai","Photoshop Temp2967254031083.ai","Photoshop Temp2967589731083.ai","Photoshop Temp4425394440936.ai","Photoshop Temp4768132540936.ai","Photoshop Temp4768297440936.ai","Photoshop Temp5356277340936.ai","Photoshop Temp6175220240936.ai","Photoshop Temp6175367840936.ai","Photoshop Temp6175482740936.ai","Photoshop Temp6175783240936.ai","Photoshop Temp6176527140936.ai","Photoshop Temp6178465540936.ai","Photoshop Temp6178681740936.ai","Photoshop Temp6179441140936.ai","Photoshop Temp6179642340936.ai","Photoshop Temp6179799340936.ai","Photoshop Temp6179958940936.ai","Photoshop Temp6180106640936.ai","Photoshop Temp6180273440936.ai","Photoshop Temp6180408840936.ai","Photoshop Temp6180563940936.ai","Photoshop Temp6180702940936.ai","Photoshop Temp6182923840936.ai","Photoshop Temp6184957140936.ai","Photoshop Temp6191230740936.ai","Photoshop Temp6191599540936.ai","Photoshop Temp6191817440936.ai","Photoshop Temp6191980540936.ai","Photoshop Temp6192148140936.ai","Photoshop Temp6192429740936.ai","Photoshop Temp6192690440936.ai","Photoshop Temp6192911440936.ai","Photoshop Temp6193215240936.ai","Photoshop Temp6193370240936.ai","Photoshop Temp6194488640936.ai","Photoshop Temp6194621240936.ai","Photoshop Temp6195256340936.ai","Photoshop Temp6195923940936.ai","Photoshop Temp6196077840936.ai","Photoshop Temp6196390240936.ai","Photoshop Temp6196528540936.ai","Photoshop Temp6196858240936.ai","Photoshop Temp6197164540936.ai","Photoshop Temp6197306740936.ai","Photoshop Temp6197433040936.ai","Photoshop Temp6197679340936.ai","Photoshop Temp700264626148.ai","Photoshop Temp723482646148.ai","Photoshop Temp723492166148.ai","Photoshop Temp7866033178047.ai","Photoshop Temp7895760878047.ai","Photoshop Temp8036529578047.ai","Photoshop Temp8036680778047.ai","Photoshop Temp21401488374.ai","Photoshop Temp21401954374.ai","Photoshop Temp21405602374.ai","Photoshop Temp21406297374.ai","Photoshop Temp21491996374.ai","Photoshop Temp21493668374.ai","Photoshop Temp4768132540936.ai","Photoshop Temp4768297440936.ai","Photoshop Temp5356277340936.ai","Photoshop Temp6175220240936.ai","Photoshop Temp6175367840936.ai","Photoshop Temp6175482740936.ai","Photoshop Temp6175783240936.ai","Photoshop Temp6176527140936.ai","Photoshop Temp6178465540936.ai","Photoshop Temp6178681740936.ai","Photoshop Temp6179441140936.ai","Photoshop Temp6179642340936.ai","Photoshop Temp6179799340936.ai","Photoshop Temp6179958940936.ai","Photoshop Temp6180106640936.ai","Photoshop Temp6180273440936.ai","Photoshop Temp6180408840936.ai","Photoshop Temp6180563940936.ai","Photoshop Temp6180702940936.ai","Photoshop Temp6182923840936.ai","Photoshop Temp6184957140936.ai","Photoshop Temp6191230740936.ai","Photoshop Temp6191599540936.ai","Photoshop Temp6191817440936.ai","Photoshop Temp6191980540936.ai","Photoshop Temp6192148140936.ai","Photoshop Temp6192429740936.ai","Photoshop Temp6192690440936.ai","Photoshop Temp6192911440936.ai","Photoshop Temp6193215240936.ai","Photoshop Temp6193370240936.ai","Photoshop Temp6194488640936.ai","Photoshop Temp6194621240936.ai","Photoshop Temp6195256340936.ai","Photoshop Temp6195923940936.ai","Photoshop Temp6196077840936.ai","Photoshop Temp6196390240936.ai","Photoshop Temp6196528540936.ai","Photoshop Temp6196858240936.ai","Photoshop Temp6197164540936.ai","Photoshop Temp6197306740936.ai","Photoshop Temp6197433040936.ai","Photoshop Temp6197679340936.ai","Photoshop Temp700264626148.ai","Photoshop Temp723482646148.ai","Photoshop Temp723492166148.ai","Photoshop Temp7866033178047.ai","Photoshop Temp7895760878047.ai","Photoshop Temp8036529578047.ai","Photoshop Temp8036680778047.ai","Photoshop Temp21401488374.ai","Photoshop Temp21401954374.ai","Photoshop Temp21405602374.ai","Photoshop Temp21406297374.ai","Photoshop Temp21491996374.ai","Photoshop Temp21493668374.ai","Photoshop Temp7418042024743.ai","Photoshop Temp7418084724743.ai","Photoshop Temp7418141824743.ai","Photoshop Temp7418173724743.ai","Photoshop Temp7418201924743.ai","Photoshop Temp7422037824743.ai","Photoshop Temp7424379124743.ai","Photoshop Temp7424472124743.ai","Photoshop Temp7426919024743.ai","Photoshop Temp7427920524743.ai","Photoshop Temp7428835024743.ai","Photoshop Temp7429121224743.ai","Photoshop Temp8859642424743.ai","Photoshop Temp8859853624743.ai","Photoshop Temp8860049824743.ai","Photoshop Temp8860268324743.ai","Photoshop Temp8941428224743.ai","Photoshop Temp9194422124743.ai","Photoshop Temp9201399424743.ai","Photoshop Temp9202370224743.ai","Photoshop Temp21307800503.ai","Photoshop Temp24191210503.ai","Photoshop Temp24530026503.ai","Photoshop Temp24544619503.ai","Photoshop Temp24549378503.ai","Photoshop Temp24670591503.ai","Photoshop Temp24703904503.ai","Photoshop Temp24725052503.ai","Photoshop Temp24796987503.ai","Photoshop Temp24800473503.ai","Photoshop Temp7097123400.ai","Photoshop Temp7098853400.ai","Photoshop Temp8668659400.ai","Photoshop Temp8672178400.ai","Photoshop Temp8688250400.ai","Photoshop Temp10326000400.ai","Photoshop Temp10720277400.ai","Photoshop Temp10720867400.ai","Photoshop Temp10928361400.ai","Photoshop Temp10995035400.ai","Photoshop Temp11045546400.ai","Photoshop Temp140235094859.ai","Photoshop Temp150871434859.ai","Photoshop Temp150878374859.ai","Photoshop Temp150886114859.ai","Photoshop Temp150891274859.ai","Photoshop Temp150901634859.ai","Photoshop Temp150908034859.ai","Photoshop Temp150915024859.ai","Photoshop Temp161661274859.ai","Photoshop Temp69103797359.ai","Photoshop Temp1108808713079.ai","Photoshop Temp1108976213079.ai","Photoshop Temp1140435513079.ai","Photoshop Temp1146516413079.ai","Photoshop Temp1154692013079.ai","Photoshop Temp1906628613079.ai","Photoshop Temp1908043213079.ai","Photoshop Temp1923379413079.ai","Photoshop Temp1942302713079.ai","Photoshop Temp1942748113079.ai","Photoshop Temp1943828313079.ai","Photoshop Temp2898796927880.ai","Photoshop Temp2900583927880.ai","Photoshop Temp88863091505.ai","Photoshop Temp175665007392.ai","Photoshop Temp91055677348.ai","Photoshop Temp91116487348.ai","Photoshop Temp91695977348.ai","Photoshop Temp95557417348.ai","Photoshop Temp95566517348.ai","Photoshop Temp95814517348.ai","Photoshop Temp95839437348.ai","Photoshop Temp95845627348.ai","Photoshop Temp95886567348.ai","Photoshop Temp95911997348.ai","Photoshop Temp95957237348.ai","Photoshop Temp99389367348.ai","Photoshop Temp100825097348.ai","Photoshop Temp122660137348.ai","Photoshop Temp122689107348.ai","Photoshop Temp122723767348.ai","Photoshop Temp270884287348.ai","Photoshop Temp30067167728.ai","Photoshop Temp35818817728.ai","Photoshop Temp114131827728.ai","Photoshop Temp114137317728.ai","Photoshop Temp114140637728.ai","Photoshop Temp117159177728.ai","Photoshop Temp117167347728.ai","Photoshop Temp117169767728.ai","Photoshop Temp117172167728.ai","Photoshop Temp117174277728.ai","Photoshop Temp426442987728.ai","Photoshop Temp426447047728.ai","Photoshop Temp4381459776722.ai","Photoshop Temp4381486376722.ai","Photoshop Temp7086171140190.ai","Photoshop Temp7086677840190.ai","Photoshop Temp7087224140190.ai","Photoshop Temp7087281940190.ai","Photoshop Temp7948113665144.ai","Photoshop Temp7948140765144.ai","Photoshop Temp7948177365144.ai","Photoshop Temp7966866665144.ai","Photoshop Temp7966896065144.ai","Photoshop Temp7966937765144.ai"],"size":[0,0,0,892220,34736,886869,34820,34449,10065376,895192,883808,35395,893257,897792,36947,38459,41536,915921,15284137,891124,886299,892461,35607,0,909466,911302,914024,889027,891262,919299,920395,912801,912460,920728,903566,58039,55734,54972,56068,57295,55506,56676,56085,888907,3255118,889071,908179,57784,3304838,892674,1303326,2513897,885240,886288,886302,48521,894001,878821,3960086,908248,904786,907910,915453,890308,24623994,914508,889699,881233,886120,915026,912610,912610,884915,976371,969787,899564,905665,891109,897997,888341,888338,1116343,1071392,909012,895124,0,57111,93063,58194,899840,894065,906239,0,0,952397,1134864,3529580,38670,4459096,50971,43033,42658,49159,38816,48458,52422,1366410,895640,1454419,908250,1824723,1824723,2214298,1421980,885513,889115,882322,880890,880161,919954,911013,894506,6510619,904894,42831,53342,1261389,1181365,1138083,842997,57482,857803,3510795,48233,48233,367611,38673,38674,956093,38673,38696,906526,906526,894747,890486,891080,1029371,892290,885672,885358,1015526,945074,894197,904587,908549,890995,905347,905347,942226,952069,883621,883625,883625,942226,884633,941333,943216,889792,888405,888709,888396,928973,928973,911472,76714912,1214682,910448,883692,76714920,912655,882308,907083,907055,883786,884691,907043,892832,886043,907082,889534,883656,1010397,882712,930452,6562677,976066,976066,6533058,2265799,882600,882250,884491,882695,908322,2064362,886930,2291948,911148,911217,910647,911225,883428,883428,2334524,904955,2356774,888977,2345131,882030,878676,915499,885534,885534,5484253,1105890,951494,969087,884676,921807,915975,915997,910888,885468,885467,2356661,886571,886571,886591,893434,895376,909198,895583,895233,4256049,908661,882839,929287,48119,53986,878425,1286751,803023,938461,68090,69798,74176,68730,71558,71697,74919,73459,74454,53197,78284,77015,74199,65630,72366,74790,75931,54725,69684,82376,1094507,189716,883786,887636,885656,884219,891104,52357,15723135,884282,884953,894677,898229,927060,894525,66652,129553,70227,96720,85725,81262,96384,106866,109048,112916,93630,111699,979382,90309,82874,98139,103065,75540,376785,76558,89507,86936,91692,74752,80081,121892,78804,93903,83463,98680,90585,973012,102741,88120,77205,98117,881103,881656,881308,884713,881656,879453,879094,2185760,2186173,2185747,2186155,884892,884810,15723135,884282,884953,894677,898229,927060,894525,66652,129553,70227,96720,85725,81262,96384,106866,109048,112916,93630,111699,979382,90309,82874,98139,103065,75540,376785,76558,89507,86936,91692,74752,80081,121892,78804,93903,83463,98680,90585,973012,102741,88120,77205,98117,881103,881656,881308,884713,881656,879453,879094,2185760,2186173,2185747,2186155,884892,884810,884021,888245,886062,884500,892530,913408,15722754,883906,881244,878155,2175386,881290,2185490,2185273,2185545,2185538,2185437,35124,34918,34701,908349,2185566,1749300,896383,881160,884083,887955,881609,884564,884575,40012,40475,906047,1083025,1085065,906139,44286,40014,880331,880313,40947,35976,881397,883839,886411,880138,881008,882925,880097,1377879,3415316,3415181,890833,18153132,878230,879152,1072151,18148210,17962306,17964181,17966020,1005483,884817,43869,920445,880901,881811,881762,916475,948289,923278,909004,880427,916953,907518,908214,882507,886790,932005,880147,880157,881268,881696,909967,910026,894130,894130,894381,882458,880565,879653,880222,879612,894330,894140,38486,38359,892455,896608,893437,884151,883556,883523,880622,885388,882984,883318],"path":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],"created":[1443748595133,1443748680577,1460603902491,1478735869755,1478736280420,1478736406175,1478746962533,1478750201760,1478815614490,1478815653923,1478815667509,1479169566319,1479170343143,1479173934273,1479345674114,1479347873410,1479347942115,1481085482230,1481088842990,1481093649346,1481093658257,1481093679353,1486607295410,1487881387207,1491287120326,1491287672231,1491287816684,1491304523211,1491448731019,1491464249574,1491544866999,1491544984907,1491545004108,1491548069856,1491548099270,1491805268312,1491875996650,1491876440567,1491876585529,1491876677820,1491876769676,1491876924552,1491876990217,1492667550345,1492741344497,1492741453902,1492741881207,1492742063551,1492742332433,1492742393769,1493161533173,1493176418024,1493671385838,1493671567547,1493763594350,1494220840942,1494979503556,1494979514333,1494979524593,1494979640496,1494979759618,1495083435527,1495413652650,1495601017256,1498445358270,1498445368854,1498460837148,1498958631528,1498958942263,1498961040602,1498961306321,1498961408305,1498961950760,1498963333080,1499055985242,1500386591378,1500386596400,1500386693883,1500409528424,1500410017520,1500410684308,1500424138939,1500424211251,1500424247202,1500441396423,1501030984559,1510018898754,1510019395552,1510019465522,1510035354775,1510035449185,1510035529683,1525838678445,1527578898621,1554293379850,1555456869338,1555456925587,1555456970474,1556542338702,1557432405746,1557436456579,1557436579418,1557436617843,1557436820010,1557436936177,1557436954563,1557891710214,1557891742156,1557896665518,1557897082684,1557897097431,1557897106269,1557897197159,1557898296891,1559127661188,1559192398864,1559197592790,1559197614719,1559197641948,1559198817147,1559249092018,1559249154723,1559249662606,1559249898601,1559621478597,1559649247487,1559714690913,1559714708791,1559714726821,1559714884239,1559714998228,1559715471419,1559715595373,1559765062057,1559765360679,1559823878175,1559878848572,1559879465554,1559879872401,1559882741946,1560474723590,1562710296366,1562710316815,1562710417398,1562714056839,1562718742234,1562719877954,1562719940916,1562719948709,1562719984419,1562721336595,1562721757870,1562877822667,1562879228434,1562879674977,1562893202766,1562894680649,1562895065886,1563162192183,1563162451672,1563162476458,1563162494090,1563162497958,1563162602716,1563162630572,1563164915522,1563164927933,1563240791929,1563307870634,1563307922944,1563313460431,1563344024852,1563344665978,1563411281579,1563914043043,1563914113099,1563914125243,1563914135448,1563921583484,1563947750724,1563947761391,1564099950434,1564100005754,1564100029179,1564100219226,1564100483173,1564100492821,1564100510323,1564100529355,1564102196589,1564923552869,1565092286097,1565096155547,1565096161018,1565096503977,1565152907683,1565152914751,1565153690929,1565153857802,1565154026103,1565154031805,1565728517849,1565729599576,1565830203407,1566246506046,1566703260505,1566703392444,1567111205246,1567111508518,1567111546656,1567111595628,1567111687259,1567112034915,1567130727032,1567154498047,1567154549651,1567287398745,1567311965763,1567311977124,1567312105337,1567312164593,1567986124331,1567986138498,1568101281456,1568757078276,1569189553305,1569189571451,1569189718340,1569280400221,1569755349706,1569757315874,1569787322710,1569793708329,1569794244952,1569824874603,1569824934310,1569825344312,1569825395754,1570415755177,1570415767840,1570415781821,1570415797201,1570415815432,1570519921149,1570519944561,1570519962995,1570519976242,1570712617861,1571722746438,1571785577914,1572323757578,1572323847367,1572323886399,1572328597316,1572328606717,1572328617014,1572328623080,1572328627814,1572328632594,1572328638293,1572328648384,1572328653182,1572328662068,1572328667235,1572328672484,1572328677091,1572328683740,1572328688200,1572328694084,1572328698893,1572328703680,1572328730586,1572329332453,1572393248128,1572494858955,1572499867009,1572499878508,1572499899625,1572499909958,1572499965893,1572929151862,1573020832841,1573020860094,1573383683361,1573559165962,1573559190525,1573559209700,1573559259766,1573559383728,1573559706847,1573559742852,1573559869430,1573559902939,1573559929116,1573559955703,1573559980376,1573560008153,1573560030750,1573560056538,1573560079765,1573560449908,1573560788800,1573561834381,1573561895849,1573561932188,1573561959350,1573561987319,1573562034208,1573562077690,1573562114514,1573562165161,1573562190996,1573562377363,1573562399480,1573562505355,1573562616593,1573562642300,1573562694347,1573562717374,1573562772392,1573562823383,1573562847077,1573562868160,1573562909213,1574049278489,1574113122036,1574113137934,1574302001262,1574306955897,1574379822589,1574379847685,1576448252673,1576448260313,1576448321136,1576448332688,1576449761072,1576449788861,1573020832841,1573020860094,1573383683361,1573559165962,1573559190525,1573559209700,1573559259766,1573559383728,1573559706847,1573559742852,1573559869430,1573559902939,1573559929116,1573559955703,1573559980376,1573560008153,1573560030750,1573560056538,1573560079765,1573560449908,1573560788800,1573561834381,1573561895849,1573561932188,1573561959350,1573561987319,1573562034208,1573562077690,1573562114514,1573562165161,1573562190996,1573562377363,1573562399480,1573562505355,1573562616593,1573562642300,1573562694347,1573562717374,1573562772392,1573562823383,1573562847077,1573562868160,1573562909213,1574049278489,1574113122036,1574113137934,1574302001262,1574306955897,1574379822589,1574379847685,1576448252673,1576448260313,1576448321136,1576448332688,1576449761072,1576449788861,1579657478032,1579657485043,1579657494568,1579657499906,1579657504593,1579658143912,1579658534501,1579658549637,1579658957479,1579659124521,1579659276953,1579659324575,1580124114795,1580124149920,1580124182595,1580124219010,1580137745835,1580179911936,1580181074827,1580181236631,1580848066298,1580956127781,1580968888890,1580969132066,1580969211411,1580971231564,1580971786810,1580972139262,1580973338199,1580973396299,1581372013873,1581372042696,1581450432552,1581450491199,1581450759071,1581560171378,1581569932703,1581569942534,1581573400805,1581574512076,1581578339001,1583140151531,1583157878918,1583157890460,1583157903362,1583157911953,1583157929264,1583157939897,1583157951546,1583200616679,1588895673382,1589243386619,1589243414232,1589248657987,1589249670944,1589251033630,1589411570375,1589411806334,1589414362296,1589417516134,1589417590363,1589417770269,1589926230398,1589926528244,1591233616573,1593516243939,1594162050934,1594162152245,1594163118141,1594169554085,1594169569295,1594169982584,1594170024118,1594170034492,1594170102683,1594170144918,1594170220400,1594188248147,1594190641145,1594344818632,1594344866839,1594344924608,1594761709034,1596064491124,1596076698842,1596518277760,1596518286872,1596518292421,1596523359787,1596523373380,1596523377427,1596523381410,1596523384928,1597694294237,1597694300933,1597713801787,1597713803909,1598773766014,1598773850337,1598773941451,1598773951059,1598996146140,1598996150610,1598996156715,1598999271672,1598999276554,1598999283485],"modified":[1443748679661,1443748680607,1460603902493,1478735869800,1478736280462,1478736406197,1478746962562,1478750201800,1478815614584,1478815653979,1478815667533,1479169566416,1479170343185,1479173934327,1479345674184,1479347873451,1479347942156,1481085482282,1481088843054,1481093649381,1481093658279,1481093679371,1486607295448,1487881387208,1491287120370,1491287672271,1491287816701,1491304523244,1491448731082,1491464249648,1491544867052,1491544984959,1491545004165,1491548069889,1491548099305,1491805268351,1491875996703,1491876440606,1491876585575,1491876677865,1491876769691,1491876924584,1491876990256,1492667550382,1492741344600,1492741453936,1492741881243,1492742063587,1492742332487,1492742393799,1493161533350,1493176418163,1493671385899,1493671567574,1493763594432,1494220840972,1494979503623,1494979514362,1494979524639,1494979640536,1494979759642,1495083435581,1495413652733,1495601017324,1498445358407,1498445368882,1498460837192,1498958631631,1498958942297,1498961040650,1498961306353,1498961408334,1498961950802,1498963333135,1499055985334,1500386591428,1500386596440,1500386693948,1500409528478,1500410017566,1500410684365,1500424138992,1500424211314,1500424247265,1500441396465,1501030984586,1510018898845,1510019395582,1510019465559,1510035354834,1510035449238,1510035529724,1525838678449,1527578898624,1554293379896,1555456869371,1555456925622,1555456970500,1556542338732,1557432405771,1557436456593,1557436579447,1557436617865,1557436820033,1557436936200,1557436954571,1557891710249,1557891742184,1557896665543,1557897082710,1557897097457,1557897106299,1557897197193,1557898296901,1559127661215,1559192398907,1559197592806,1559197614744,1559197641978,1559198817159,1559249092050,1559249154753,1559249662649,1559249898629,1559621478626,1559649247519,1559714690935,1559714708799,1559714726828,1559714884246,1559714998242,1559715471431,1559715595386,1559765062072,1559765360684,1559823878203,1559878848595,1559879465560,1559879872409,1559882741968,1560474723694,1562710296394,1562710316845,1562710417421,1562714056846,1562718742267,1562719877971,1562719940924,1562719948733,1562719984446,1562721336603,1562721757893,1562877822757,1562879228444,1562879674992,1562893202801,1562894680662,1562895065922,1563162192198,1563162451697,1563162476487,1563162494117,1563162497986,1563162602723,1563162630599,1563164915552,1563164927960,1563240791956,1563307870644,1563307922950,1563313460448,1563344024867,1563344665984,1563411281593,1563914043189,1563914113125,1563914125266,1563914135474,1563921583634,1563947750735,1563947761423,1564099950459,1564100005794,1564100029209,1564100219254,1564100483186,1564100492845,1564100510331,1564100529368,1564102196611,1564923552896,1565092286126,1565096155573,1565096161043,1565096504015,1565152907711,1565152914788,1565153690949,1565153857835,1565154026120,1565154031828,1565728517896,1565729599599,1565830203452,1566246506075,1566703260602,1566703392456,1567111205348,1567111508580,1567111546664,1567111595637,1567111687267,1567112034972,1567130727049,1567154498123,1567154549733,1567287398798,1567311965801,1567311977159,1567312105390,1567312164647,1567986124376,1567986138518,1568101281512,1568757078333,1569189553339,1569189571478,1569189718387,1569280400254,1569755349749,1569757315906,1569787322726,1569793708370,1569794244979,1569824874668,1569824934353,1569825344330,1569825395784,1570415755210,1570415767878,1570415781857,1570415797237,1570415815469,1570519921186,1570519944581,1570519963014,1570519976270,1570712617949,1571722746488,1571785577934,1572323757650,1572323847395,1572323886428,1572328597335,1572328606743,1572328617039,1572328623109,1572328627847,1572328632618,1572328638319,1572328648412,1572328653211,1572328662075,1572328667240,1572328672488,1572328677122,1572328683778,1572328688232,1572328694095,1572328698924,1572328703707,1572328730620,1572329332479,1572393248138,1572494859057,1572499867038,1572499878534,1572499899651,1572499909983,1572499965919,1572929151916,1573020832921,1573020860127,1573383683425,1573559165996,1573559190540,1573559209707,1573559259774,1573559383734,1573559706854,1573559742860,1573559869435,1573559902946,1573559929121,1573559955708,1573559980384,1573560008160,1573560030760,1573560056545,1573560079771,1573560449916,1573560788807,1573561834392,1573561895855,1573561932194,1573561959357,1573561987326,1573562034214,1573562077701,1573562114520,1573562165168,1573562191003,1573562377373,1573562399491,1573562505365,1573562616600,1573562642308,1573562694354,1573562717379,1573562772400,1573562823389,1573562847084,1573562868167,1573562909219,1574049278556,1574113122075,1574113137947,1574302001325,1574306955945,1574379822650,1574379847709,1576448252804,1576448260349,1576448321148,1576448332718,1576449761107,1576449788890,1573020832921,1573020860127,1573383683425,1573559165996,1573559190540,1573559209707,1573559259774,1573559383734,1573559706854,1573559742860,1573559869435,1573559902946,1573559929121,1573559955708,1573559980384,1573560008160,1573560030760,1573560056545,1573560079771,1573560449916,1573560788807,1573561834392,1573561895855,1573561932194,1573561959357,1573561987326,1573562034214,1573562077701,1573562114520,1573562165168,1573562191003,1573562377373,1573562399491,1573562505365,1573562616600,1573562642308,1573562694354,1573562717379,1573562772400,1573562823389,1573562847084,1573562868167,1573562909219,1574049278556,1574113122075,1574113137947,1574302001325,1574306955945,1574379822650,1574379847709,1576448252804,1576448260349,1576448321148,1576448332718,1576449761107,1576449788890,1579657478168,1579657485078,1579657494602,1579657499937,1579657504625,1579658143940,1579658534633,1579658549667,1579658957509,1579659124554,1579659276992,1579659324610,1580124114855,1580124149964,1580124182639,1580124219049,1580137745869,1580179911948,1580181074860,1580181236671,1580848066358,1580956127833,1580968888940,1580969132077,1580969211455,1580971231600,1580971786847,1580972139303,1580973338245,1580973396330,1581372013909,1581372042732,1581450432563,1581450491213,1581450759098,1581560171419,1581569932714,1581569942560,1581573400817,1581574512098,1581578339051,1583140151608,1583157878939,1583157890490,1583157903378,1583157911968,1583157929277,1583157939910,1583157951560,1583200616706,1588895673490,1589243386654,1589243414247,1589248658092,1589249670955,1589251033645,1589411570409,1589411806482,1589414362437,1589417516255,1589417590484,1589417770284,1589926230429,1589926528257,1591233616634,1593516243988,1594162050971,1594162152267,1594163118159,1594169554106,1594169569304,1594169982605,1594170024133,1594170034508,1594170102697,1594170144932,1594170220421,1594188248186,1594190641176,1594344818723,1594344866854,1594344924620,1594761709054,1596064491154,1596076698858,1596518277790,1596518286898,1596518292436,1596523359804,1596523373401,1596523377449,1596523381420,1596523384951,1597694294299,1597694300972,1597713801813,1597713803920,1598773766099,1598773850349,1598773941463,1598773951068,1598996146186,1598996150632,1598996156737,1598999271683,1598999276578,1598999283502]});
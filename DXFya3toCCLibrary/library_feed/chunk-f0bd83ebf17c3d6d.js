@@ -0,0 +1 @@
+ccFeed.chunk("f0bd83ebf17c3d6d",{"lib":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3],"id":["8b2e9324-b15b-48b2-9133-06f76f1f9ff8","720a4a6d-3c38-419a-9604-f646caed2023","9cbb0e5f-f43c-4c65-bd4b-de65654742d4","166591b4-ba26-4560-bcf5-55ce3ff8464a","092b5b12-f609-4769-a938-25a91d57c9e9","2124e85e-2355-4e81-a9bf-ddf82a149652","ef6ba0c1-08a7-48e9-a432-7936c7a4edf0","ed8d311b-8688-4079-ac03-0f25a4044115","cb33dfa3-22a2-4537-924f-1912cf24e59a","78a33145-c6b2-472d-8fe0-88a3e28d7fc3","4afb99d4-3f87-4324-a150-7eb2375dafd2","4ae7ef10-714a-4003-be91-50d4cc8e07d4","fdf8e46f-18f3-4441-b63b-b987eb0d82ab","b64b687e-9bf4-4241-b9d1-3e51ec7bff0e","c435700c-634f-4acb-9c84-2b8eb46b2697","708d9791-b0c9-454e-aa43-772acaff44f6","8e68cda9-84d1-474a-9325-ac73b65f83a1","df15180f-06b3-4772-8e99-0075f28a9a3e","75c38407-8483-4df9-85bf-290de54772a6","843d6361-a020-4f25-a2c6-91785d100a18","d58bf94c-6857-497b-a610-f8784580bc9c","a94867c3-fbff-43ff-b6d2-feb945ebd2d5","41293456-03b3-48f0-861e-9201b9a71886","46a97251-6869-428b-b07a-9de19f02056c","4c9f1702-fdbe-47a0-b864-8126afdc39d5","d77b665e-af01-4dc4-a0d0-d154e75d1514","43aa2f22-1e50-4b96-b4cc-23ed6ea402d1","13a9f3bf-c0d8-407a-b2d9-f9b0dc26e391","d0a88226-cb13-417e-9c39-12826485321d","974a47b4-d1b6-4e6f-97d8-8d930a7784af","9843ec80-5afa-446d-9d56-3109b19f32a2","218ccf9a-fd7a-4e9e-95cd-3cdc6541e9fc","2defec67-f4cd-4ca6-ba7f-985c3ccae2eb","702a7a00-4a46-43b7-af3f-9f3065419490","3a57eaea-e818-48c6-9caf-2e4665185b33","bae25fcf-dcbc-422c-a401-9ab4dbb0e998","a20cd5bd-cbc9-4841-b0ac-0d608cd732cb","1188e2bc-5d37-4866-9b3d-c4cfa72513c0","47433744-e82a-47f6-8631-23458bc787fa","d31de0ab-2131-406e-aab7-348f9e982c0f","fcae0aa3-3d90-4cae-b5ce-b346ae023b1b","8b199426-9c1f-48a1-8993-d7c813914951","3e7b98c8-a1b4-4fd5-95ae-ddcf8a657f73","4e9981ee-c127-4377-b70c-855ba985bf65","e1c12079-e344-4117-abae-6870b4271d6a","60dfa196-3468-4cb0-aadc-acbd775f1332","1d9cf6dc-2b51-457c-96cd-25d0777ffd6b","8c076c6d-cf0d-4092-b391-2b8a31be118e","7f5d16af-8834-4428-8fbb-bf6427515085","ebfcb2a3-efb7-431e-8838-6e1cfc634888","469f1e75-2a7f-4dae-8385-f4b74564bb6a","736add80-29e1-424e-b01d-7692260394d7","bcfe9442-8bcd-4499-a3fa-d269b6b7a664","9d617c50-5c74-41c3-a1ff-0f9e3b351636","3cdd5479-7e56-4f9b-a893-ee936ab0a083","da16fa3b-a861-4078-8b74-fbda6a55d298","a5387be3-9a2c-4d3a-8784-aa37684fa6eb","950a7e82-dc79-4b53-9bad-c064604c629d","a61dee56-3701-45c2-aff8-e9648404dd71","a56bf597-1fed-42c6-b0b0-c78523c90d51","90011e86-3b39-48aa-b085-2cb84455b571","b7ca0c04-07d7-4578-8545-729a12d9d29e","bc7a0df9-a53d-48c7-adb4-c747121d0b6d","596fb68e-c712-4c7c-9cba-825ce97cb595","c6ed2751-d038-405a-9c28-eb5bf31d33fd","180b0593-950f-4b80-a8f5-ef317bbcc5f0","446acceb-1517-4c12-9d40-96d6bbba65e0","f8ec55e5-fdd6-40b4-a533-dc3d44b83ee7","9aa086a8-660f-44d5-999f-6eb963220b14","adb513b9-ccf1-428e-bc60-446ed26c1f38","82d47772-5997-4bed-b00f-9522a52e5c1d","8f72d625-e3ff-41b9-b28b-012a0d673cf7","d4b02648-c706-4d9c-aaa1-92fcad2e4208","9dfc597b-9f79-4bab-9cc9-d82191f609a9","83b2cfdd-da5b-43a7-8cdf-58968f72cfa1","970fe094-fa50-460e-9d28-51438c06aa5d","f75ebd47-f2bd-4a5b-8fdd-a68f8d5dd667","dea36daf-b21d-4539-a777-f8e07f41134a","bff9d9f2-6541-4b4d-9183-9a0efbc3a0c1","ee3072db-34a5-486a-8663-1d0e884dde66","7144c136-5220-41eb-b2fc-a63b2e1765b8","874a8b9d-1112-4e65-907c-cf5101b76869","b5bba9e7-9d67-49e6-84dc-1aa19bfbbdf4","210ab1aa-7821-40de-83d9-a2b2ed9a8e4c","8005919a-9f82-4593-9419-568dca5e57d2","e1206014-ac5a-4ea7-9ed4-c105d34427f2","34ea23ab-875f-4dc3-89c1-f0a68645028b","01220341-3a64-4f48-a5a2-d8541e9abf90","67eb1e21-42cf-4d98-8bfd-049aae4adecd","9f5a33f4-0440-477e-814f-0e86fd337f7f","3bd5f8cf-4538-4a9a-8783-bc759f9783ed","02ba4064-c38a-44c0-adaf-0b3018e6473d","9a26a895-69e1-4152-8d0d-adb73e7b7cfb","a29a2f26-dd2c-4ddd-91f2-73dc46b3f6c9","53594e0c-9fe8-47eb-b80c-43d22d65e9eb","337f271a-bfb0-48d8-b7d6-7c8b329cff88","aa413b53-ae55-401b-ad47-388f8ce5770b","f76930ad-1084-483f-8ea6-c1e246adb561","dfe2a7a1-aa99-4493-94ae-ed1e3cd40672","b64e9c72-cd9d-4fd0-849a-dc73f9763693","39abef13-dd1c-4c0c-b86e-04b9041c6357","b4407f81-fe2c-4a4a-b957-33446fcce770","e83d0a34-f334-4c42-bf58-728403539533","7401de7b-8e9a-4b7e-a022-26480167986a","91ffb3c9-4b30-420e-afd1-758230166838","53dd16a5-e7b9-4a1d-93ff-a4a05d288954","0f9c5703-72a1-493c-bbc0-0f0a2a09dcb1","cbec0fa0-2416-411b-b998-6447e023bdd5","88f58b89-7f39-4e96-9a7a-d11fa21616e9","35d63279-6096-439c-b0f1-6effbf7a6030","79baac6c-001e-459f-ab95-3ee85d0e722e","97ba7aea-94e9-4685-bafe-dcc5875a610f","7d30d2eb-48cd-4c6e-93d0-06244e6800ae","2d947f3d-20ce-42c4-ad88-2bf051716389","db4be107-92e1-4814-a3d1-840303a4862e","2af2ef76-7f7b-4bb8-9058-47fa2edc4fc6","e81d99a9-0c06-4375-b3a2-a548d193c178","7fbdf7fc-b811-4d83-8469-29ac875f6b1a","714d3ebd-0cdb-4a46-93ab-ba0875aa44b7","6ff513d2-0164-4fa3-860c-67b42efef7a9","2606fd0c-36e2-45dd-86cc-e18f9b2fec58","4ffc3d9e-3130-49dc-a499-3b91dd08cd6a","8318a340-708c-4271-bc2b-21f219ee0583","60b18dab-519a-4fdb-9351-137f106c1080","60a6dc22-758f-408b-883a-a1ce34be6f90","17e8612d-621d-48b9-8579-28e4300db28a","b476194a-393c-4848-9bb8-1fe6bd3417e9","d35736f5-7b0a-4e9f-9645-d63dcbdb827c","5176ab47-6f64-46f7-a44b-baf6d5abb0a8","0e52f612-50b0-40ac-b22f-803570985af8","2df72eef-7c7e-48a4-8f35-742b879fc918","2f81eeb3-adb8-4077-b338-234b84382b1c","e04cad16-acd4-463d-ba8a-5fc5e5b807ff","35a60b5d-2974-4755-92d8-89c1779d45f0","3eb242fb-edce-457e-943a-6a71db946a21","305f921d-662b-4270-9ee4-ca2991789a6f","5f37a0f3-4b71-4ba2-b37c-8f0e3124ef48","fc6f2d17-586d-4a4c-b759-501e85bc812e","11668382-bf68-4190-8eb8-1dd2fe5dd5c8","a3ea4d59-084d-48cf-b937-47abe107fafc","9ee3cb01-abca-43b8-aed0-6a269f6da7e0","2951d4f9-8d22-4c8f-8583-654f40346022","2ccbfbfb-2db2-4aac-a56f-b4898682a2a3","95ef21c9-b317-48b5-aa76-d7351c27117c","186851f9-abca-447b-9164-d40fead6856a","c92fb5c9-a929-4f1e-8e63-1b384572c8d3","f0325e27-bf56-4fd5-bd34-3822f9cd40b2","09814146-266e-406a-a978-4f4767ef793c","1c10501f-c44d-4c56-8a58-c7cbf3309b50","1f83ea38-eb0f-48ce-aa39-84e4ca534521","d018b553-1a12-4945-b06d-594085d2b1ad","7f6e180c-574c-4cc2-b9d2-09bb32262a6c","c524ab2d-6dcb-4a44-8176-f0b4ad41863f","b2ad0ebd-78bb-4bbb-8add-4f4efd4b36ca","9d014cf4-c447-4f95-9ca3-226beef8ebb4","e0f6a1a9-fca5-4800-8149-7451f900d300","1a78635a-b3fc-41c8-b255-b873ebe8850f","df15139d-f482-40a2-977a-cc3aad084792","865f1e99-87b5-4d04-ab55-32b566f6c04d","85b92327-3d42-4a7e-a98b-254a8b296c9d","b9cfc253-fdae-4199-86cd-734eb47770b4","f689591a-9522-4594-8476-95cff523582d","f055f518-cb7a-4b8d-b836-5d1cd5e2b387","d5e31709-cbc4-4095-ac5f-c42bce46fc52","387dcf91-3571-4c25-b136-77a96f3f2e47","94a5bff6-4a67-49d3-b43b-bd006a921b9c","7a0a7ce0-62fb-42de-94ee-fcf2494e3e15","36b94688-25fa-4c0f-83b7-9eb4260cbedb","a517559a-0095-4fec-9846-5f8bd8a38921","8d802b25-81e1-4551-a136-7c20b27e301f","8e0cc105-f4d1-4985-93cd-a1cd29b85c8e","9ffa7b78-c2c6-4513-9980-de5e3408adb0","2388bd46-fe92-4afb-8230-761386cc4f54","ff9b9c5e-ea77-4caf-af24-01ef8603ad55","129f5200-e93b-4fe7-998d-711466721796","d1552519-5957-402d-afe6-53da72689558","7a40c511-438f-4366-bd80-20b56bb6e09a","3652af17-d688-4e5e-ac58-0ff9e13b3174","1a7548d1-c243-4e6c-983a-a4711def3cb8","64ff2247-a143-4153-9a37-bc55b44a6427","2a497802-1411-4929-ac43-0b2bb9f93248","ef7cac0c-97d1-4cbb-aad3-41a2620230c6","32fbc59d-8223-438f-ad81-06417d645a30","f821b8f9-3246-441a-acfd-df1e578c489f","ade0ea1b-a287-4ebf-9c1b-5842e3dd9a94","6075fd64-09b1-464d-a756-ffdc43677c10","d1f45ae1-5379-4f3a-b706-c3786dece6ea","8502b0e2-3621-42de-9917-bf9a561d38ae","39d7da68-8868-4bab-ba50-089e9fb8c46f","4d19fc16-c6aa-41ae-b479-a92a47cb822d","67a924c0-9854-4070-8fd9-3f19f96b0d73","880f46a0-d71a-4964-a695-a609ae42e415","9b838d85-f6e2-471b-84d8-54fad85678c2","533c2b45-027e-4c0b-802c-3c0a5070855f","1313c7b0-3230-4b70-b23e-321ff05857b4","2ed8defb-c75f-4db7-a7c3-d22ca2ba2077","bf1ad4a7-c9f5-4369-a295-a5b2c2722ecc","9c8ed8ab-689a-4241-956a-97929727be7f","304705f0-b4cb-45f8-8fe9-a701f1c76e8d","0617642a-9bff-4437-ad76-7d1f6744f124","f8abdd3c-710f-4d2e-adf6-f6185d526fcd","d0ca6ed4-478c-46e3-9853-b9a425c4cfd5","490d81fe-e424-43ef-960e-a39528636f61","e59621f2-bb0e-46a3-a539-fc0d7818aa1b","a2ec6de7-53d1-4bf5-99d6-52362530a134","593c508f-1760-41a9-b119-1f6ed3ab2113","519aab42-1951-4c72-b8fc-6e016aaf635f","f28f3a77-e5a9-41f5-a729-f164dc1b07bd","67d04c91-9ed9-47ed-ae43-184dc55450a5","c17db602-310f-4184-b2f8-a48d43d177ab","3f9211ba-f4b8-4c3d-a1a0-52f852b8a36c","a7f4b2ba-95b7-4fc5-82a7-e1d800c99a6d","a1a5333b-7761-45db-83b8-90b9217f270e","b924a547-0636-4327-ab45-d2ddd5581e54","fbb634a9-ff16-4f10-b5c4-12aa2a16295b","e9b40aa9-dcc4-4e6d-b996-7cd302641b8d","5fd35309-0684-4a86-ad33-8ab381702702","253dee8e-94a1-4ee5-bda5-4b17f9e13afe","d9d0e0d6-9eff-4206-85cc-abd91d461d39","1fb06246-a013-4371-8334-80a04c9d26bb","f5f0590b-d78e-44cc-9958-d40583630d31","c15701cb-d357-47ba-a74a-a0bc8e2db7da","de58055f-d6f8-470c-84af-25199a611290","c5f2873f-6774-474e-b34b-7f87970639a0","f29103ad-c58b-4890-b7aa-0d61c48d3669","aa180381-d8c4-4270-a848-bcd8702ba84c","6a551ef7-d4df-4db4-858e-8c052e93bcde","eef6c5f2-4073-41b0-92bf-a48bb22832aa","86871d75-cd0f-4210-bb14-1ab0a3fc6f70","3807748f-a38b-4325-a59a-fc8245113fe2","f205a51d-4bbd-489e-b743-9d10c3cf9a8f","eaa0c836-b249-49bd-a562-f7e6250aaf63","10e6a00b-e87d-4888-b1e7-140ea47c9b8a","a5dd0a8d-f952-412d-9c1b-c5022cceb3eb","e855e42a-8484-4c91-879f-af3ddc55e3c8","44f3691d-b714-4d6e-9d88-cc53a7161595","986f0594-1c39-426e-9a58-b1ab6c967ee9","2a82f44e-b8a3-417f-bfb0-81749d5463f5","cfa11ac2-49dc-43ff-8ce4-85893767e54b","8c404d25-acb8-4e92-97e8-6c58d6094316","67406a57-9807-4ed7-b581-806bb55345b1","4423ee1f-8d3b-41df-8ff2-7d9623ff4e2c","f16bed9f-e0e5-4ac8-bd8f-b0bc65075b28","ee618f57-c821-49a1-9499-784c7622d426","3a5567c4-00d3-4f63-8519-68117ca82c03","6206a183-f27b-49c8-ad01-ba994283fd7f","29510cf2-fb2d-495c-93d9-58bf5fcb630c","d84b85b5-d5ba-4d66-af03-1603fdbeb515","c2f5e082-74ba-47b7-9ef2-7e42aea5ecc1","c99222e3-baf2-46fa-b909-1078146e71a8","47cc2978-4298-4912-be7e-042b0a2b5a01","248fcbdd-1a94-41ac-9742-34d79b4e21b4","7210ec10-bbe2-414e-a352-5d83a3bb7c8c","a58a56ab-d49d-4f6b-a470-dda73b7875c8","c8da24e0-b961-43dd-8a76-a5cd90a60a04","dad5bf1e-7205-4368-b9a6-cd6bda31b75b","7929a139-7576-4709-ab83-243148bf170c","28dc7547-9969-41d2-b962-25ae82328f09","e608bd0b-744f-481a-9b6f-37ea80920bfa","19402acc-807b-4402-9eeb-851268928288","2330d10e-914b-4a03-acff-fec3ee76a20b","06cf5eef-2a59-472d-b7e3-32a50402d672","d895d8f8-7577-41ee-9f7d-e7dccd45b329","ecc2e077-01eb-4a0d-b7b9-bdc576da9209","a5efb67a-aaec-49b1-a305-a39d95b4224a","b68f46f2-98c8-4d13-b391-8c2a501de487","f3ebaef5-f53d-41c1-9ae8-4bd8765ff8d5","d3002da3-35d0-4c7d-bd45-b0db9e4ef1cd","fb90a50c-206a-4e0f-bf36-91707ff0b0b7","ed015159-a331-496b-bbfc-2264acd281f6","98871ed3-5d20-4468-a1fa-560dcdd11811","05481075-eea8-4101-b753-45785d2aae1f","bd51dab7-2d75-40b0-9e1f-331f6de5b539","fce3ddd6-5b46-4df5-8787-d76fce9388fe","ff306ae2-00c2-4219-84d6-7f34369a15b4","bd349504-b388-4b30-9404-4d0b2d3b9aea","c3f05076-da55-4d5b-8152-0d6e70dee599","fea0abea-d29c-4567-90ff-f570fe666eb8","9754f8c0-f28e-482c-a4c6-08548d0fbf68","45d77f8b-27fe-42b8-9fc2-6c7e7bf0efc8","16f5887c-9a70-4563-90e6-b46369a029b3","3e68ea4c-2752-450a-a68a-e1b5eb182616","05fb6362-3ae1-483b-a38d-dc8fabfaa3d7","527392c7-5323-40f0-bfb4-478d3e16b8db","d1582ed1-4365-40a1-9ab7-e7bd260052f1","e2c683e6-7ba3-4a3f-b78e-35defec62746","4b0c8988-0760-4f2a-abd9-f6b2447c4a00","39e5b12c-1e2a-4f5c-8201-89d57c3f227a","2b35b4d9-40fe-43a8-87f7-0e882ab19d71","6d4c68c9-ca50-4516-ad65-a4922388a29f","0962cace-d068-4db4-a60c-89d6cb704508","d4719d18-6f7d-44da-9608-c93c0ee72602","911b3254-786d-4e92-8a7e-39b109e63cf5","20b9ffbb-815c-4bcc-9d06-3f3bffa09dfe","255b51ba-7311-491e-9b4c-5378c93d9cab","e961a2b6-97a6-41df-8e16-ceb3c2267cbb","1f663bde-53d0-404e-aeb2-e9928f506d8e","d1197868-3e1e-4fa7-bcf3-6dff39aac4f8","7791e13d-f5d9-4864-98d6-3525a1ac413e","550ba964-88b8-4d9c-bdf5-7122e036a8d2","27093fc6-6ddf-454b-85c7-0db398ad5d24","3b31f97b-2111-4b83-9913-3f8e0732a881","23a2e6b5-4e4d-452d-8f74-ef6125012ee2","8b0df648-778d-4cae-a229-dcc456449e38","c3525be3-7737-42e8-9d53-a16f9dda1918","78b1ae00-4b30-4ca5-a5ab-c8bf6bfb2268","766af891-fe30-46cf-8ccf-a6474bca5c46","2891b322-204e-4151-a52e-755177785221","5ca822e8-f3a2-40b1-bdf4-07d5cbba8132","a3a3a87b-39cd-4092-9743-04cf14066107","5be203ae-5813-486c-8073-1c1910d614d7","adbf76f6-517d-4269-995f-dec1703fb2e8","0949c03e-4d56-4c72-b6d4-c7b0adf80dd1","d1f99ac8-29c6-4a8a-b019-feff7b44ff64","03efce05-9753-4fe8-b8cb-4ada41d73d08","9910b9a4-e688-494c-abfb-306ec89b4afe","fc54bc47-c5af-430e-afd6-19da2b8c09ec","e0162695-d912-4e7b-a3ed-9c12fbbae336","d2079a9a-cc51-4da5-a3a7-151a2eef182c","dd0eaaf5-8bda-4d17-a090-1991d3eace71","3e1d422a-4235-49f1-a0dc-17534f16808c","2f5ef844-4dd7-4574-b00c-5133289c63c8","7599bac1-8297-47c0-9841-91ad3974f862","aef60c94-c2ce-40c6-863c-5e4853e9252e","ff703304-c684-467b-b2e6-022b0fb9611a","c151474d-a9b9-46da-a08c-e29ae3a0272d","41e6c48b-667a-4789-b96b-334b3d0d693c","b08c097d-fe1f-47a7-b947-fc8610e73a0b","fb3e4894-bbe7-41bd-9463-5e948ec5b1e4","3ab84bc4-9b72-4724-9e27-e8a4b745ec79","b4ffbead-85ed-472d-8356-0c7c106c0294","bee9fd53-c0d6-461d-b598-91efe65146a2","7740a785-94e8-4862-9a1c-1cf4d541f0dc","83f3bb22-8572-41bf-96af-ded36e01d49e","dbc4a632-45a0-4afd-ab1b-3ccb514d47aa","c85ac98c-3851-4d82-89bd-4d1b294843d4","8d2d0f8b-e192-49fd-828b-d24230c7991e","6ab06290-5fd3-4f61-bd04-b4fffd586b0e","9bb625a7-8cfc-46a3-a4e5-120caeb08934","c51a5a88-e213-45bb-a3c4-8e30c813fa2e","6f7c166f-0fa8-4de6-a2ba-f6c6d8a7cc12","0ad65d38-99f8-457d-9f47-68a8438de0d8","8421afc0-9d61-4bc9-afb9-b0253061ee72","89af27ca-b59d-4902-86ae-3936bb296585","7f5a8523-c9ac-4285-81ea-11701bd7ccc7","37dd918b-1978-4b46-96cc-b318786b4775","efdcced6-2f37-4ed9-a501-964190026aed","c529945d-3039-4267-899a-88b05d34c84b","b94b09f5-dc8d-42c7-8b1d-cc7dc3ae828d","93ad458c-0a7d-4cd5-a6e8-3b43969d6778","7b83990c-d55c-4228-8c6e-2a21759ff9ee","46a12b82-081f-4deb-abb0-f60085d81cbe","641e27e9-b6c8-4baa-8f01-2a26f4e42c00","0683bcc2-f2bb-4e0f-912a-dd305d4dc587","9655d48d-9169-40a0-a43e-719b2adc0ab1","8b133a31-b64a-4553-89db-9d465b203a39","9bfc0d3e-9da6-4a22-a4be-41facd6b699a","bcfc1038-869d-4715-aa23-d4971e8f9525","17bc001e-c26a-4bf7-83ad-30e3f584dd04","128004cd-4dd5-4086-a456-24b8619281ae","0f86cdd3-b3f5-4832-baed-e1b25ee1fd0a","bdc7a37e-227c-49ba-b060-70dfbf6670fe","32772ff3-b2ce-4c3a-9981-76cf509fc424","5b5c6562-402a-4f6e-87cc-45dda183768b","f94efa16-dba9-4e06-b38e-464a257281a2","0ee401f1-7745-46ee-8b1b-df454c42f42b","06041986-02fd-4a4b-aaeb-c26237833e5d","f2ffc4f6-2ff2-45b0-9944-3c856c852a8d","6d9a4faa-f2a1-4bec-8da5-054ddf93f6a4","026b591a-2390-48f5-990b-981c31a60d73","46421ff7-ffb5-4b1c-b374-34c5c615841d","30c2b4dd-2845-4bf4-ae2b-83954a717b2d","da7523f5-448f-4587-bb42-5892edf24af5","5b416251-c812-4ed7-8fd6-5bacd659c398","cc9e2a34-67a1-4059-bf86-f03e13429088","5f2d86c3-cf3e-475c-a77d-7b1b9e523bda","ff6eb9dd-c4c7-4404-9ad7-8736597bc1d0","f8a79be2-61c6-4d46-8593-615506bd8b56","112020c8-7541-47fc-b28f-6fd259910e18","6fcc7b39-6da6-4987-af1e-4b86049e87f6","49c987a2-ec8a-4d37-a8c2-d8b921da8202","35864708-474c-42b2-b224-8c26a4544749","57e8a9bf-6326-4f5f-ba9f-98247bd196da","29c2ac43-7b9a-42c4-b478-8b9e18c8230c","39c21881-88e5-4d08-a8b4-8c5668eb2d0a","1da38114-3857-4558-99db-5b91cba78211","eb7e36bf-9074-4f5a-8a20-6757f5201d2f","751eddcb-c8da-4f94-80fe-4480ba02baaa","9ebdb4f4-be97-450f-8c99-1c6512e5f240","61e99ae9-01d5-4e89-a2b0-325a9fdb059c","5ef57e21-dc30-49e3-a420-20fd12db4f28","7ba840f4-0d3a-486c-9482-e10e8eed0d20","fe5384e0-ece3-4578-ba5f-1f9362a00795","a5951186-e63e-48cb-98b2-c9d6948a9996","712c800a-237d-478e-ba8a-185cd60d8eac","6c6603a6-2c67-4d58-9870-f7a2659ee9e4","2be767c9-f493-4f6b-ba8c-dcd2e18af948","d6e6aa5a-c7bc-4f22-93b3-b41077117e90","8a0b1a4d-dea1-4d2c-9cf9-963e89d28307","357db7f7-1c60-414e-9afc-88bac17d01a6","6be3c725-46e2-438b-978d-0bee292ddc3c","8d700c48-a232-4eca-9e30-649eef217a6d","63d2c4e8-699d-4c94-ac21-ae5eaa11ca0a","9ea2a0e3-1cc5-4bce-bd1e-274920f1a332","4a8d781d-ce67-4d00-926d-1644886df9c4","985da233-554d-4b13-a2cb-c0fb5b558c3f","36e58606-4b5f-4317-9b04-9193fd0a6124","35f59a62-5a88-42b4-83c9-7ed97b2c186c","c46c3277-8a37-42c6-b9e4-70ff5d39fd32","6dd0c08b-06f8-4975-9a57-fb8c496c225d","1364846d-2bbb-4ef7-bc24-9b3861108a5a","5c0c140a-5f10-49a9-b2c7-e215a023ceef","2a46e54c-5756-40ea-bf49-1d55bf283afc","19e65766-7b00-4264-9e37-e89a84a40a7c","15e1921c-b264-4f77-abc8-8138c4ea778c","b66b5160-4c93-4be7-8f66-817734f482c9","aa28f402-b9bf-4f4e-89aa-f1ede5f70e62","c25e3cf8-fb93-439c-9b97-559faf293a39","6c67d6a8-039e-4028-b6f4-d5dfc0cbcb61","e3871101-7389-419e-a8f4-19b009d08492","e36de139-550a-4c43-bdba-79d3acabe299","75e9d55c-d15d-41f4-b1a4-be9e4d3255a0","5cbdbe3c-e706-4881-b3ca-5ca2333f3595","65f329f0-fc44-40a0-b823-a51d213e8cc3","1f229636-dde2-4906-b9a0-8bb46d4b4dde","834e8608-d449-42be-812c-5c929dfbe7c3","4da8259f-0dfc-41e3-b163-588350a1a1f1","bd8d9c4a-b1ff-4f75-9f62-02858025b98f","bbe70a1e-8f51-4afd-9f3c-a686cb8467a2","0e9d33a0-460d-4cf4-81b1-64d347f4cf0f","2ae2a510-d0b0-4f2a-9525-e21299508409","f1ec4fa9-5a36-4997-870a-0d7a397c3775","1768de6a-8591-4c23-a5b8-154d90248186","20f33cd1-1bb2-4ec9-a678-c5ae24a40cdd","c639dabf-7ddf-4849-b55b-1202d07f0af0","461b7260-aa58-42fc-950f-16e818af3d44","eb5ca811-efec-40a6-999c-6af32022d690","1490e2ef-54c9-4a26-8462-bbcf6a0f3cbf","8560762d-3afc-47a0-95d3-ab5160e52f8e","fd002bef-f57e-4bc7-99db-6fb433317d43","74ad2ce3-a3e0-4cd1-8ece-42f021178472","f0a2a826-09e7-45f6-92dd-b7f3a5b06039","8adfa272-0299-497b-85bf-9d22f27ce82b","10ab83c1-9199-4637-b106-832ad4a1a69a","ae9789df-a2ba-4e4e-a1cc-7ab7b0c0967d","db34ad1e-0f7c-4afd-ab25-d5eb1ed01549","d126e37a-a6de-4168-abc2-7ed6c0db079e","a74ace90-0f79-4279-9ad8-8e40056cbef2","e10a27f2-c624-40c7-89a3-a551f17a6448","06bbbddf-60ac-4c5a-b576-3b4a22985158","a8a1d75f-57aa-4500-bed2-6b0bf2ef8ff3","86cb6857-6471-41e7-9cb5-7f49324bd6fd","42094cad-bc2f-4c8d-b60d-9cf300a458ec","0015f1b0-a1c1-4b66-ad7f-f745729f88ee","647e627a-a333-481d-a771-12e00d9aff89","4e063a94-89fc-49ee-9621-9d668bca9c6a","11929721-bfb6-4e09-85ef-78a7bda6af22","10213668-23e8-451d-a9c7-7ed76cb13f1e","01e1a2a6-3691-49cf-acab-342baf069673","18616827-e952-4e13-9c21-c57e5e5719af","5044a77b-3157-4224-8e8c-38408ecba50b","2d310362-a785-43e2-9c2c-b636cb912380","95bc41a1-146c-46d4-92e3-f6736ffc4f89","9f99d748-e6ea-4839-b62a-57530cb26b63","c425de6f-ef0f-434f-845e-72268bb3f34c","118f125e-9dfe-44d9-9729-1cb3898b5754","607e5f8f-72de-465f-b2b3-c8d823230380","714fed36-e5cd-46ce-880b-7122830ccdc7","fc7577dc-4f73-4620-aade-8d434973f0ba","83c6faa3-604b-43c0-83ef-2cb9156808d6","23c84e39-4a20-47de-bc50-b99e5bd31c30","fe9acdf4-f09a-4a7d-8a92-21880ea06f4f","3df5c01d-b910-416e-bccc-2a74eccccf95","a261ce24-bfb2-4a53-ac17-960ee927462d","a195c056-c5ee-4162-9369-398e08552f56","b8047075-d08c-4921-90fd-26ef5db5dc24","219f1d75-e66f-4cac-8ed9-581873a36c09","c20c96da-aeee-4ad9-b9c6-e8e483785332","ff104c9d-9f0a-4152-b7c3-0e6caabe62c3","544ef260-f138-4e6a-b8fc-cfa256d04618","69d442f0-8907-49db-8b66-3233f9278d81","3b4f933d-f110-4748-90c0-2621af2c9907","81feec91-6557-42ff-8dd8-856f8aa952eb","3165d363-652d-4026-94de-5322d8af281b","fac66d98-b837-42a8-81c9-bb3fdba6780c","a4fb24bf-6dd5-4749-b67b-48f410f1f694","0549b039-2c90-4881-9268-49cb9b63fa39","2efc5332-c70a-4f0f-8e8d-ed5860c7f7da","0fc0053b-2916-4814-a6f1-8127b8e821b2","3724f152-20ca-401b-a232-47151e11250f","f4a7d36a-6582-44e2-be0c-44350fabe25f","303a4540-5b87-4819-9790-14f47f901202","63f92160-3e7f-4101-97dc-272750e7ebba","53a97e21-52f0-41c8-946e-cb61259b1773","1da9b221-485c-47ce-9b1c-a862f902a005","d0ea19d9-7888-420c-8adc-ff59fda125d5","4d3cc599-dc69-46f1-a541-319617791cfd","1161a5b1-c611-4e25-b3a8-fab59efe4347","25e36476-bd1b-45f0-93d0-edf229495ee3","6476fa0e-ee10-40a2-ad89-6ec5bf0ed4d5"],"name":["Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Garden swimming pool","My Color Theme","Fluro scheme","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","9424","9425","9431","9432","9434","9435","9436","9437","9483","9423","9442","9462","9440","9443","9441","9439","9438","9469","9468","9467","9489","9466","9464","9510","9444","9518","9351","9389","9399","9461","9470","9473","9474","9475","9476","9477","9478","9479","9480","9484","9485","9486","9488","9496","9482","9498","9491","9493","9494","9495","9487","9497","9490","9515 CUT","9465","9445 CUT","9581","9585","9587","9600","9501","9576","9410","9593","9594","9577 CUT","9580 CUT","9520","9590","9601","9463","9513","9583","9609","9647","9508 CUT","9499","9500","9506","9507","9492","9809 CUT","9614","ID Stencils","9582","9589","9511 CUT","9591 CUT","9522","9686 CUT","9521","9523","9603","9604","9602","9512 CUT","9514 CUT","9610","9611","9612","Blank Cut","9740 CUT multi part","9689 CUT","9508 Art","9691 CUT","9799","9687","9681","9821","9679","9814 CUT","9807 CUT","9815 CUT","9819 CUT","9815","BLANK Art","9689 CUT","9686 CUT","Blank Cut","Blank Cut","Wedding Invitation Set","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","R=0 G=174 B=239","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object","Vector Smart Object"],"type":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"file_type":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"file_name":["Photoshop Temp7966969965144.ai","Photoshop Temp69103797359.ai","Photoshop Temp1108808713079.ai","Photoshop Temp1108976213079.ai","Photoshop Temp1140435513079.ai","Photoshop Temp1146516413079.ai","Photoshop Temp1154692013079.ai","Photoshop Temp1906628613079.ai","Photoshop Temp1908043213079.ai","Photoshop Temp1923379413079.ai","Photoshop Temp1942302713079.ai","Photoshop Temp1942748113079.ai","Photoshop Temp1943828313079.ai","Photoshop Temp2898796927880.ai","Photoshop Temp2900583927880.ai","Photoshop Temp88863091505.ai","Photoshop Temp175665007392.ai","Photoshop Temp91055677348.ai","Photoshop Temp91116487348.ai","Photoshop Temp91695977348.ai","Photoshop Temp95557417348.ai","Photoshop Temp95566517348.ai","Photoshop Temp95814517348.ai","Photoshop Temp95839437348.ai","Photoshop Temp95845627348.ai","Photoshop Temp95886567348.ai","Photoshop Temp95911997348.ai","Photoshop Temp95957237348.ai","Photoshop Temp99389367348.ai","Photoshop Temp100825097348.ai","Photoshop Temp122660137348.ai","Photoshop Temp122689107348.ai","Photoshop Temp122723767348.ai","Photoshop Temp270884287348.ai","Photoshop Temp30067167728.ai","Photoshop Temp35818817728.ai","Photoshop Temp114131827728.ai","Photoshop Temp114137317728.ai","Photoshop Temp114140637728.ai","Photoshop Temp117159177728.ai","Photoshop Temp117167347728.ai","Photoshop Temp117169767728.ai","Photoshop Temp117172167728.ai","Photoshop Temp117174277728.ai","Photoshop Temp426442987728.ai","Photoshop Temp426447047728.ai","Photoshop Temp4381459776722.ai","Photoshop Temp4381486376722.ai","Photoshop Temp7086171140190.ai","Photoshop Temp7086677840190.ai","Photoshop Temp7087224140190.ai","Photoshop Temp7087281940190.ai","Photoshop Temp7948113665144.ai","Photoshop Temp7948140765144.ai","Photoshop Temp7948177365144.ai","Photoshop Temp7966866665144.ai","Photoshop Temp7966896065144.ai","Photoshop Temp7966937765144.ai","Photoshop Temp7966969965144.ai","Photoshop Temp1298585525381.ai","Photoshop Temp1298840725381.ai","Photoshop Temp18885214095.ai","Photoshop Temp19045294095.ai","Photoshop Temp20514114095.ai","Photoshop Temp20958884095.ai","Photoshop Temp60790084095.ai","Photoshop Temp61146034095.ai","Photoshop Temp61254374095.ai","Photoshop Temp69177724095.ai","Photoshop Temp69188514095.ai","Photoshop Temp69347064095.ai","Photoshop Temp77737034095.ai","Photoshop Temp77741434095.ai","Photoshop Temp77744654095.ai","Photoshop Temp78071334095.ai","Photoshop Temp86515024095.ai","Photoshop Temp86520214095.ai","Photoshop Temp88290754095.ai","Photoshop Temp1302067724356.ai","Photoshop Temp15474863658.ai","Photoshop Temp15542773658.ai","Photoshop Temp15877923658.ai","Photoshop Temp17925773658.ai","Photoshop Temp30458873658.ai","Photoshop Temp35688183658.ai","Photoshop Temp62614917921.ai","Photoshop Temp20883122384.ai","Photoshop Temp20891922384.ai","Photoshop Temp20923620384.ai","Photoshop Temp20947101384.ai","Photoshop Temp20948677384.ai","Photoshop Temp33812785487.ai","Photoshop Temp735989711667.ai","Photoshop Temp4205613399.ai","Photoshop Temp32173893616.ai","Photoshop Temp32212113616.ai","Photoshop Temp167352373616.ai","Photoshop Temp167843533616.ai","Photoshop Temp170337213616.ai","Photoshop Temp171876913616.ai","Photoshop Temp172257693616.ai","Photoshop Temp10803491086.ai","Photoshop Temp10902821086.ai","Photoshop Temp10931051086.ai","Photoshop Temp28610433235.ai","Photoshop Temp28664073235.ai","Photoshop Temp31017863235.ai","Photoshop Temp59020963235.ai","Photoshop Temp59054373235.ai","Photoshop Temp59062863235.ai","Photoshop Temp195426503235.ai","Photoshop Temp195432413235.ai","Photoshop Temp195745273235.ai","Photoshop Temp7692284474.ai","Photoshop Temp8033254474.ai","Photoshop Temp102300114474.ai","Photoshop Temp102320194474.ai","Photoshop Temp124403624474.ai","Photoshop Temp126678584474.ai","Photoshop Temp127875404474.ai","Photoshop Temp127949694474.ai","Photoshop Temp3133629447421.ai","Photoshop Temp3253957547421.ai","Photoshop Temp3270107947421.ai","Photoshop Temp3270610847421.ai","Photoshop Temp1648784762297.ai","Photoshop Temp1748774962297.ai","Photoshop Temp17860247380.ai","Photoshop Temp17975557380.ai","Photoshop Temp18054747380.ai","Photoshop Temp18109497380.ai","Photoshop Temp18181137380.ai","Photoshop Temp18219857380.ai","Photoshop Temp18285197380.ai","Photoshop Temp18325627380.ai","Photoshop Temp18380817380.ai","Photoshop Temp19804937380.ai","Photoshop Temp853148346840.ai","Photoshop Temp1691126646840.ai","Photoshop Temp1691865246840.ai","Photoshop Temp1693544946840.ai","Photoshop Temp1698894646840.ai","Photoshop Temp1707118946840.ai","Photoshop Temp1707636446840.ai","Photoshop Temp1708072246840.ai","Photoshop Temp1709260646840.ai","Photoshop Temp1731487346840.ai","Photoshop Temp1813208146840.ai","Photoshop Temp1813504546840.ai","Photoshop Temp1813845146840.ai","Photoshop Temp1836799646840.ai","Photoshop Temp1845989746840.ai","Photoshop Temp1847099246840.ai","Photoshop Temp2145547446840.ai","Photoshop Temp2145773846840.ai","Photoshop Temp2145859746840.ai","Photoshop Temp2145993446840.ai","Photoshop Temp2146098946840.ai","Photoshop Temp2146243246840.ai","Photoshop Temp3423273746840.ai","Photoshop Temp4801964846840.ai","Photoshop Temp4847655146840.ai","Photoshop Temp4847815046840.ai","Photoshop Temp6045758298044.ai","Photoshop Temp6047267398044.ai","Photoshop Temp6047468598044.ai","Photoshop Temp6047569298044.ai","Photoshop Temp6049203698044.ai","Photoshop Temp5623871482.ai","Photoshop Temp5671878482.ai","Photoshop Temp5706782482.ai","Photoshop Temp5908598482.ai","Photoshop Temp5911184482.ai","Photoshop Temp5916560482.ai","Photoshop Temp5919772482.ai","Photoshop Temp5924085482.ai","Photoshop Temp5935537482.ai","Photoshop Temp5936761482.ai","Photoshop Temp5937993482.ai","Photoshop Temp5940806482.ai","Photoshop Temp5943679482.ai","Photoshop Temp5965532482.ai","Photoshop Temp7325051482.ai","Photoshop Temp9366540482.ai","Photoshop Temp9804760482.ai","Photoshop Temp9903071482.ai","Photoshop Temp9908086482.ai","Photoshop Temp10091748482.ai","Photoshop Temp10132970482.ai","Photoshop Temp11559750482.ai","Photoshop Temp12417451482.ai","Photoshop Temp12475077482.ai","Photoshop Temp1420662344831.ai","Photoshop Temp1447014344831.ai","Photoshop Temp1488598444831.ai","Photoshop Temp1779638994953.ai","Photoshop Temp3002820270463.ai","Photoshop Temp3008819870463.ai","Photoshop Temp6323816457.ai","Photoshop Temp6329048457.ai","Photoshop Temp6332563457.ai","Photoshop Temp6336214457.ai","Photoshop Temp6345925457.ai","Photoshop Temp2127536943683.ai","Photoshop Temp2160524943683.ai","Photoshop Temp2184652043683.ai","Photoshop Temp2200497743683.ai","Photoshop Temp2201047543683.ai","Photoshop Temp2201133343683.ai","Photoshop Temp2201193843683.ai","Photoshop Temp2846776243683.ai","Photoshop Temp2874820943683.ai","Photoshop Temp3036525443683.ai","Photoshop Temp3047180643683.ai","Photoshop Temp3340025676340.ai","Photoshop Temp384920436.ai","Photoshop Temp384920436.ai","Photoshop Temp1444822536749.ai","Photoshop Temp1444967936749.ai","Photoshop Temp1455649453569.ai","Photoshop Temp1455769853569.ai","Photoshop Temp1746434456471.ai","Photoshop Temp3820921298.ai","Photoshop Temp261577210687.ai","Photoshop Temp261712610687.ai","Photoshop Temp265840710687.ai","Photoshop Temp265879510687.ai","Photoshop Temp282922610687.ai","Photoshop Temp303396210687.ai","Photoshop Temp303518710687.ai","Photoshop Temp303553310687.ai","Photoshop Temp303599410687.ai","Photoshop Temp350534110687.ai","Photoshop Temp360845010687.ai","Photoshop Temp362221910687.ai","Photoshop Temp375312110687.ai","Photoshop Temp375622410687.ai","Photoshop Temp2896551593438.ai","Photoshop Temp2896703493438.ai","Photoshop Temp2896551593438.ai","Photoshop Temp2896703493438.ai","Photoshop Temp2896551593438.ai","Photoshop Temp2896703493438.ai","Photoshop Temp1761601115402.ai","Photoshop Temp5460110510.ai","Photoshop Temp550216527175.ai","Photoshop Temp555766427175.ai","","","","Photoshop Temp1215035396.ai","Photoshop Temp1216641396.ai","Photoshop Temp1220005396.ai","Photoshop Temp1220984396.ai","Photoshop Temp1357100396.ai","Photoshop Temp1659463396.ai","Photoshop Temp77217893449.ai","Photoshop Temp77224183449.ai","Photoshop Temp77464153449.ai","Photoshop Temp77583423449.ai","Photoshop Temp77619653449.ai","Photoshop Temp77902173449.ai","Photoshop Temp77906283449.ai","Photoshop Temp77910803449.ai","Photoshop Temp1057797403.ai","Photoshop Temp102396714588.ai","Photoshop Temp103228194588.ai","Photoshop Temp186903159932.ai","Photoshop Temp208323429932.ai","Photoshop Temp98176785.ai","Photoshop Temp891864785.ai","Photoshop Temp894904785.ai","Photoshop Temp895780785.ai","Photoshop Temp902167785.ai","Photoshop Temp529310613998.ai","Photoshop Temp530005513998.ai","Photoshop Temp530477413998.ai","Photoshop Temp530915913998.ai","Photoshop Temp531120413998.ai","Photoshop Temp531457213998.ai","Photoshop Temp532393013998.ai","Photoshop Temp591773013998.ai","Photoshop Temp603941213998.ai","Photoshop Temp604315113998.ai","Photoshop Temp893569813998.ai","Photoshop Temp895939313998.ai","Photoshop Temp1361282838775.ai","Photoshop Temp1684232748970.ai","Photoshop Temp1684682648970.ai","Photoshop Temp1684789048970.ai","Photoshop Temp1684940748970.ai","Photoshop Temp1685436048970.ai","Photoshop Temp1685686248970.ai","Photoshop Temp1687688548970.ai","Photoshop Temp1688147848970.ai","Photoshop Temp1688795548970.ai","Photoshop Temp1690716948970.ai","Photoshop Temp1691212748970.ai","Photoshop Temp1692118948970.ai","Photoshop Temp1692289248970.ai","Photoshop Temp1692430148970.ai","Photoshop Temp1692565748970.ai","Photoshop Temp1693051648970.ai","Photoshop Temp1693300048970.ai","Photoshop Temp1693423948970.ai","Photoshop Temp1694252748970.ai","Photoshop Temp2840917166156.ai","Photoshop Temp2849884666156.ai","Photoshop Temp2866117766156.ai","Photoshop Temp2867971266156.ai","Photoshop Temp2868393566156.ai","Photoshop Temp25331491462.ai","Photoshop Temp569212933192.ai","Photoshop Temp569394833192.ai","Photoshop Temp569531533192.ai","Photoshop Temp583542033192.ai","Photoshop Temp893951433192.ai","Photoshop Temp894035733192.ai","Photoshop Temp934507233192.ai","Photoshop Temp935771733192.ai","Photoshop Temp272901803050.ai","Photoshop Temp272915223050.ai","9424_18232f81-c635-4d07-b367-8790684636a5.ai","9425_4db9afeb-37d0-42f1-a153-0f0cd7cb3a95.ai","9431_b3731139-6547-43f1-b934-3bd94b2f2d7c.ai","9432_cd7e1043-a008-49f7-9b9d-6230626ef8f1.ai","9434_4ce1131b-9490-409f-916b-1656d033cebe.ai","9435_7acef958-46c6-4b81-96b6-167e9bf58a92.ai","9436_d1892dc0-ad12-4aa9-bfaf-5164b719c843.ai","9437_a73507bf-e6a7-46cd-97ab-61b565c5b46c.ai","9483_fb6c5b4e-ff72-4210-bd67-1406264f20c3.ai","9423_dbf8469f-7381-42ee-bf51-5ec7c170d50c.ai","9442_5a75b63f-5cb5-4d7d-a497-6fa4de4995d9.ai","9462_aca0876f-2a04-46af-8103-d88e8886fe93.ai","9440_1cab8943-768f-4fcd-ae5a-41e3a1303fcf.ai","9443_d00e24ed-8943-4e3c-8f85-a08573966ecb.ai","9441_9cdc7b2c-88cd-498c-ba83-f90abc917b26.ai","9439_4f949eed-2f37-4eae-a7bb-a1748aa1aac0.ai","9438_252975f6-21b7-4652-b686-b59d74a40f2f.ai","9469_40cfed3c-b1eb-4c75-a0b1-b09c0d675c24.ai","9468_efb2721d-7185-4d83-b192-c5926309e023.ai","9467_a6cd7fb7-b928-4d3a-9bee-9c2ca79dae05.ai","9489_5d49cd58-1a56-476c-981f-f8d53d8a4164.ai","9466_5d95920c-68db-436f-bea2-d8a1540f2744.ai","9464_be353b28-05e0-4715-a738-b002e7ac39a2.ai","9510_4f2aab49-7d40-4a39-9253-bb92ec63b2d8.ai","9444_e9b3a9b6-a317-4410-b654-8ef24a58c27a.ai","9518_d40fb61a-84b8-4cad-82d5-c1178c1563c8.ai","9351_33055de3-8ef9-4b8d-93f6-049fb89c5b43.ai","9389_c28a3d77-89f8-4412-82ef-b8d0d5f0a24d.ai","9399_2ef56fe7-96ac-43bf-b323-64a599f64657.ai","9461_db83c94c-3e9a-49af-99b3-bc6bf36d0a64.ai","9470_4bac7eb1-8243-44da-a17a-2eb10945d275.ai","9473_d8d5f605-44f1-47d4-8218-b22c8a0ea8b7.ai","9474_62fbc344-21d5-49d1-a72e-a02f77904020.ai","9475_6f739428-1552-4773-a73f-8809a36ea284.ai","9476_c03a26f6-5602-4fdd-aca7-653e9f41f0b8.ai","9477_f231fd6f-2345-4f67-ae78-d695bc6f850e.ai","9478_eb7f2b6a-8d90-42b9-af9e-2e4cc822aa14.ai","9479_9c4a842f-09be-490b-a6c2-efc74b0641d3.ai","9480_b5dfaea8-aafe-4a4a-8c0a-bbc517dfb4d1.ai","9484_ac7e2d05-eac8-4644-b0fd-89dfb7b4a6fd.ai","9485_185a26be-595a-4c05-be58-21cf3eddaee0.ai","9486_ab1fb04e-2915-442f-9f5d-73bcd75c6643.ai","9488_d241b4cb-860c-440c-a0a9-aa71abca3b6c.ai","9496_d6e48c8e-5c2e-4a5d-9421-f0de216630ab.ai","9482_a2402550-c23e-43a9-87d3-edc1d8c7e42d.ai","9498_a85ce5f6-37d1-41f6-8a4b-34a4681b492f.ai","9491_03d5206d-0cab-4afe-b571-700c43282e27.ai","9493_2531fe6a-17b8-434c-a7d5-86faf29c98e1.ai","9494_088ab849-80e3-421b-a696-29d6a7791567.ai","9495_291d7d6b-5fa2-4e99-9d92-4dd8b8914e55.ai","9487_2b611933-316f-4869-9800-20afeae32266.ai","9497_690d0436-94aa-4331-9560-3b89bcf2cdfd.ai","9490_4d3f1f0b-d0c2-42cf-8582-90974e1af47a.ai","9515CUT_78669197-a428-49bd-a409-603101cf99c5.ai","9465_ac92b61a-9180-4e5e-93f5-ca24afc131f5.ai","9445CUT_88679a42-5c43-4af3-96c5-0e5e275e2d02.ai","9581_3f79a32e-251a-4cf0-943a-1c731cc8ff7b.ai","9585_c708c70b-5387-4524-8c4c-687d347964bb.ai","9587_5a5182db-f1a8-4c48-b81d-0bc31dd4c437.ai","9600_dde682e9-c677-4b38-9a82-4b24d5bdddb6.ai","9501_6169e751-b132-4989-adce-17ed53bfe70c.ai","9576_3651313a-338b-4404-a498-b76a35ca35ec.ai","9410_167da325-b3ad-4554-9460-7ed7ca4b6ca4.ai","9593_4b31325e-d502-4b41-a30c-1a57dcddab3b.ai","9594_38d666bb-59da-4618-a301-85681a93c403.ai","9577CUT_372e6f00-5e85-4d52-beb7-1abae126e3ae.ai","9580CUT_396a93b9-6a6c-4c8b-8cbf-218343165e2b.ai","9520_264c916d-a119-437d-9288-fb2ce3be2e2e.ai","9590_449c5370-e402-4440-b579-3c8bb979bd98.ai","9601_80c16701-5a48-4c16-9207-1707f8b72f2d.ai","9463_896944b4-6812-401d-9a1a-c0e9037e8cb8.ai","9513_ffa26340-44e8-403a-8f12-cb7420a5b588.ai","9583_68c9453f-b8bf-4e5e-a3f2-03d541d086c6.ai","9609_d8e64345-5fc6-48bf-b005-f8aedaad9e3f.ai","9647_4f7b1bbf-b606-4170-b2b2-e3d8e1ac1310.ai","9508CUT_e60137fe-c43e-4b98-9b6f-78b9b696e4ec.ai","9499_36c94a4f-9a65-42b6-a7f2-0e61b52ec76f.ai","9500_32dd1a85-a5dc-4138-8cee-be4a1aba6cd7.ai","9506_3fe4a6a2-4349-4249-b7df-9d931a754cbf.ai","9507_ee175b11-20cf-45c0-89b3-5bbfc4e0240b.ai","9492_cf760fee-e1b8-495e-9249-a0355035cd8f.ai","9809CUT_26fd75bc-8517-408e-8da9-4591862fa64a.ai","9614_84d5af8b-7862-463f-bf3f-1a8369746e81.ai","Artwork1_f339ec94-33ad-4ac9-98fc-2ff1fafe8080.ai","9582_adb196c9-4f81-4408-8ac4-e4b650ff4449.ai","9589_277fc9ac-9821-4e9a-8ab1-ac1eca56b653.ai","9511CUT_30756e05-2dbc-4596-92a1-ae0427f62aaa.ai","9591CUT_6bf88a25-c4db-4560-90c4-4f43a0f05b35.ai","9522_c72d0ff9-0724-46c9-a782-2b608894cd8b.ai","9686CUT_6b00284c-f2db-49e9-a761-0c9b9981ffbc.ai","9521_42f9adf3-2226-48f3-870c-3f0982171a21.ai","9523_cfd8e9ce-0817-48b0-8a67-060378f25252.ai","9603_c542668d-1463-4189-9f50-bbbfd0bc5ef4.ai","9604_b6b9526e-731f-4a81-be96-aa04b21e9adc.ai","9602_ff93052a-ae94-460f-872f-f6b6df9620ae.ai","9512CUT_597ee63a-bd64-4495-b1f1-17064bdffb87.ai","9514CUT_b443a99f-61d5-4216-a80e-a059195ab3b9.ai","9610_72249039-4430-47c1-a7ed-baf4d1851e77.ai","9611_d30ded8b-9c30-4048-96c3-6b264ba91eea.ai","9612_079720be-e218-454c-8983-89c677d9c95f.ai","BlankCut_7a10b531-027e-4bcc-9937-f81f581f2681.ai","9740CUTmultipart_ad306bf1-8567-42eb-b079-e8770c673b47.ai","9689CUT_b4af2f87-80f1-480f-8da4-b140acf8a5e7.ai","9432Art_94926df5-1e4c-48f1-b9d6-66ae3318e467.ai","9691CUT_ccb6863f-a5bb-4dfd-968f-df16a3c958b6.ai","9799_70fd4a4a-a854-4e0d-b3a5-1d8e4fe89119.ai","BlankCut_7a10b531-027e-4bcc-9937-f81f581f2681.ai","BlankCut_7a10b531-027e-4bcc-9937-f81f581f2681.ai","BlankCut_7a10b531-027e-4bcc-9937-f81f581f2681.ai","9679_1cb39cdb-faff-4d75-b7e7-f38f2864840a.ai","9814CUT_15c0adbc-2322-40ea-8f7d-a9b73e5ce76e.ai","9807CUT_139a899d-160d-42e8-a5e2-24b109072051.ai","9815CUT_fde5b348-275f-43c1-a1f5-44384130e9c4.ai","9819CUT_9a8184b7-11d7-4943-829f-133ce16d267a.ai","BLANKArt_f022cea7-05b6-4da0-85ee-334136529a58.ai","BLANKArt_f022cea7-05b6-4da0-85ee-334136529a58.ai","BlankCut_48167394-2852-4f1f-901d-c34ad6d23df2.ai","BlankCut_f785632c-4c8a-476a-a89f-49eaa7150130.ai","BlankCut_7a10b531-027e-4bcc-9937-f81f581f2681.ai","BlankCut_7a10b531-027e-4bcc-9937-f81f581f2681.ai","5a11d5f8-a4e7-43b7-95e6-1922d5ed5b80.jpeg","Photoshop Temp59748169018.ai","Photoshop Temp750344711578.ai","Photoshop Temp1513278411.ai","Photoshop Temp1513612411.ai","Photoshop Temp1514664411.ai","","Photoshop Temp15070612051.ai","Photoshop Temp1191862413223.ai","Photoshop Temp1236984613223.ai","Photoshop Temp1238174213223.ai","Photoshop Temp1240276613643.ai","Photoshop Temp1241171113643.ai","Photoshop Temp1246370313643.ai","Photoshop Temp1672012913643.ai","Photoshop Temp1672174313643.ai","Photoshop Temp1705532313643.ai","Photoshop Temp1708235013643.ai","Photoshop Temp1708466013643.ai","Photoshop Temp1709853013643.ai","Photoshop Temp1710061213643.ai","Photoshop Temp1712161013643.ai","Photoshop Temp1712705713643.ai","Photoshop Temp1712956313643.ai","Photoshop Temp2166514621013.ai","Photoshop Temp2166653121013.ai","Photoshop Temp2168804921013.ai","Photoshop Temp2173739421013.ai","Photoshop Temp2173905921013.ai","Photoshop Temp2174053721013.ai","Photoshop Temp1451991165.ai","Photoshop Temp1543111165.ai","Photoshop Temp1615821165.ai","Photoshop Temp19957381999.ai","Photoshop Temp131453945418.ai","Photoshop Temp208695118793.ai","Photoshop Temp208940318793.ai","Photoshop Temp208956708793.ai","Photoshop Temp209294618793.ai","Photoshop Temp209298798793.ai","Photoshop Temp209311768793.ai","Photoshop Temp209797238793.ai","Photoshop Temp90792973529.ai","Photoshop Temp91058183529.ai","Photoshop Temp93047173529.ai","Photoshop Temp57197003576.ai","Photoshop Temp84343505674.ai","Photoshop Temp84357515674.ai","Photoshop Temp1855102717992.ai","Photoshop Temp208388470.ai","Photoshop Temp550061470.ai","Photoshop Temp1950724716147.ai","Photoshop Temp142857838.ai","Photoshop Temp24274436416.ai","Photoshop Temp291532935.ai","Photoshop Temp293143935.ai","Photoshop Temp740642935.ai","Photoshop Temp866270935.ai"],"size":[884136,3415316,3415181,890833,18153132,878230,879152,1072151,18148210,17962306,17964181,17966020,1005483,884817,43869,920445,880901,881811,881762,916475,948289,923278,909004,880427,916953,907518,908214,882507,886790,932005,880147,880157,881268,881696,909967,910026,894130,894130,894381,882458,880565,879653,880222,879612,894330,894140,38486,38359,892455,896608,893437,884151,883556,883523,880622,885388,882984,883318,884136,891024,890725,886786,887424,886893,892966,886866,885424,885992,886023,887526,52622,884273,883047,885537,885275,885031,884935,885040,883256,887286,887429,886010,894111,890134,38785,903824,893383,893314,894133,882982,879903,883829,880785,882709,880263,880379,878453,878408,880258,878449,878184,884738,35790,35311,878412,878435,880126,882279,882289,882068,880469,881820,880479,882879,883458,883358,882973,887695,883703,887706,887953,48382,883580,880064,880052,34987,887061,35399,37304,36447,37595,36619,36649,36658,37334,35371,887200,887038,908541,881235,909236,909446,908601,908588,879446,908357,7831136,36991282,909757,882821,882396,888381,888466,880398,880434,880414,880273,881446,883847,881446,914228,899495,894800,36671,37260,38143,37073,35988,79242,78759,96161,36022,35928,37294,37303,37654,37720,37397,37366,36000,35623,36317,68652,78779,104672,96123,96134,78779,106552,39637,35845,94582,35396,37330,35429,77824,109906,112024,60346,43566,60326,60402,105635,882884,881110,887079,37279,37348,36075,38241,887142,880713,881600,35773,879680,42061,42061,884480,884417,884341,884270,44705,378045,40292,40534,35984,40122,42507,911559,911562,912111,920985,913767,888849,888834,880702,882965,2140702,2140663,2140702,2140663,2140702,2140663,884041,44350,886496,36132,0,0,0,2069727,891074,1601285,2215692,880004,1473197,904608,3201414,2160351,36412,883030,905721,3190612,879393,1088631,891389,897189,884922,6471192,282960,882450,886394,891321,882450,888946,883240,879507,882221,888947,879507,883261,898206,896424,892062,891274,896075,884059,895646,885273,893488,883919,893982,883120,892340,891590,883724,895237,893985,41072,897886,891685,897687,892053,891684,895602,894771,40917,5587500,40257,40840,40863,889882,890865,903406,3180617,892138,922060,922060,45420,35502,891899,890344,1266721,1243842,1196338,1223867,1219803,1218599,1210535,1198164,1223019,1233998,1215463,1211959,1251939,1204416,1213293,1275343,1251318,1237238,1202042,1259478,1221159,1200428,1205945,1228753,1222339,1264220,1208000,1251286,1206638,1220778,1218898,1228717,1223104,1221902,1212819,1216307,1209560,1227467,1221942,1223022,1223002,1223491,1220043,1221861,1223069,1209693,1219887,1227282,1225859,1221389,1219849,1212233,1219822,1246961,1198998,1195928,1196234,1201959,1211414,1201533,1229739,1189391,1244485,1204499,1205183,1201452,1198123,1222493,1195032,1192558,1199570,1208021,1193818,1198214,1203056,1215435,1212842,1211342,1208145,1192829,1219737,1195818,1193629,1215833,1207223,1207123,1210915,1203932,1220562,1216224,1218090,1216534,1201451,1185275,1213219,347855,348157,1194731,1191003,1188740,793129,1207774,1220116,203621055,1201807,1210683,793129,793129,793129,1204724,1206317,1207402,1217447,1193065,1199331,1199331,358763,362735,793129,793129,23873,954983,954738,906308,900207,887610,0,886332,42910,885726,885726,885728,885728,1029920,1006902,17419579,962058,24592245,20644646,885643,885712,962088,26474707,26159432,22696095,903482,927988,96208,96208,43187,888986,4361840,883827,887928,163671,899624,36460606,900833,36463750,959694,899614,900833,38726,38725,900458,888073,58928,34793,55773,891650,891306,2504006,42586,38932,115698,116066,263536,79959],"path":[null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null,null],"created":[1598999288868,1588895673382,1589243386619,1589243414232,1589248657987,1589249670944,1589251033630,1589411570375,1589411806334,1589414362296,1589417516134,1589417590363,1589417770269,1589926230398,1589926528244,1591233616573,1593516243939,1594162050934,1594162152245,1594163118141,1594169554085,1594169569295,1594169982584,1594170024118,1594170034492,1594170102683,1594170144918,1594170220400,1594188248147,1594190641145,1594344818632,1594344866839,1594344924608,1594761709034,1596064491124,1596076698842,1596518277760,1596518286872,1596518292421,1596523359787,1596523373380,1596523377427,1596523381410,1596523384928,1597694294237,1597694300933,1597713801787,1597713803909,1598773766014,1598773850337,1598773941451,1598773951059,1598996146140,1598996150610,1598996156715,1598999271672,1598999276554,1598999283485,1598999288868,1600043212876,1600043255325,1600207807195,1600208074035,1600210522298,1600211263389,1600379044254,1600379637469,1600379818006,1600393023844,1600393041896,1600393306094,1600567744175,1600567751459,1600567756844,1600568301323,1600582374445,1600582383085,1600585334101,1600655195162,1600724941061,1600725054271,1600725612844,1600733332194,1600754220927,1600762936548,1600822173797,1602130518299,1602130663249,1602131191695,1602131582892,1602131609076,1602568585712,1602636743346,1603155191255,1603262163285,1603262226800,1603804031989,1603804850572,1603829057584,1603831623960,1603832258580,1604642904863,1604643070052,1604643117101,1605937129625,1605937217626,1605941140780,1606049933399,1606049989093,1606050003238,1606334155944,1606334165858,1606334687213,1606961287328,1606961854150,1607398994058,1607399027481,1607575790597,1607579582156,1607581576883,1607581700683,1611811677928,1611881456922,1611884148678,1611884232489,1613456492594,1613475655327,1613511853635,1613512044235,1613512176214,1613512267454,1613512386845,1613512451415,1613512560309,1613512627669,1613512719661,1613515093209,1613786825579,1613970832547,1613970955492,1613971235415,1613972126998,1613973497591,1613973583862,1613973656523,1613973854567,1613977559321,1613991180468,1613991229010,1613991285924,1613995111618,1613996643255,1613996828157,1614046570386,1614046607980,1614046622347,1614046644635,1614046662167,1614046686176,1614482076824,1614935055626,1614942671024,1614942697071,1615271296719,1615271541758,1615271575124,1615271591935,1615271864454,1615781191234,1615781984994,1615782566743,1615785930408,1615785973511,1615786063142,1615786116650,1615786188559,1615786379445,1615786399847,1615786420382,1615786467254,1615786515146,1615786879444,1615809538389,1615843563753,1615850867358,1615852505998,1615852589550,1615855650645,1615856337652,1615880117714,1615894412903,1615895373686,1615924237161,1615928625368,1615935556159,1616105440700,1616389682326,1616390681754,1618107506449,1618107587517,1618107646109,1618107706961,1618107868842,1618631083346,1618636580806,1618640602058,1618643243005,1618643334618,1618643348924,1618643359002,1618751671629,1618756345846,1618783296979,1618785072769,1618836080535,1619392412295,1619392412295,1620348590467,1620348610085,1620350390373,1620350410224,1620796982726,1621301354232,1621385875896,1621385893880,1621386581878,1621386588323,1621389428725,1621392841385,1621392861786,1621392867541,1621392875218,1621401896110,1621403614581,1621403844044,1621406025892,1621406077731,1622614653640,1622614674257,1622614653640,1622614674257,1622614653640,1622614674257,1624931558523,1626267966119,1626268661842,1626269586475,1446069639165,1446069651808,1465700681635,1479700493696,1479700520357,1479700576502,1479700592818,1479702861253,1479707900664,1480651324972,1480651335565,1480651735298,1480651933966,1480651994464,1480652465270,1480652472400,1480652479654,1481509952584,1482450120670,1482451505736,1483507067705,1483665201511,1487557672975,1487570900562,1487570951227,1487570965837,1487571072263,1487651097218,1487651212979,1487651291626,1487651364727,1487651398804,1487651454899,1487651610937,1487662787150,1487664815126,1487664877380,1487719977506,1487720373035,1487912683679,1487980325716,1487980400487,1487980418263,1487980443605,1487980526041,1487980567726,1487980901444,1487980977969,1487981085936,1487981406159,1487981488783,1487981639730,1487981668159,1487981691629,1487981714236,1487981795211,1487981836594,1487981857261,1487981995395,1488240672827,1488242176326,1488244872723,1488245181626,1488245252021,1489715824802,1490068222747,1490068253121,1490068276048,1490070610789,1490225488511,1490225502536,1490232247193,1490232458224,1490674711243,1490674733482,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747898352726,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1748928147993,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1747005496974,1748928147993,1748928147993,1747005496974,1747005496974,1747005496974,1747005496974,1501018400609,1502073000450,1502098477092,1502163354827,1502163360069,1502163377704,1502413306622,1502423846389,1502673422078,1502680942274,1502681140565,1502681490968,1502681640004,1502682507651,1502753446841,1502753472846,1502759032093,1502759483208,1502759521480,1502759752053,1502759786757,1502760136782,1502760228068,1502760269962,1503028193666,1503028213331,1503028572845,1503029393906,1503029421567,1503029446098,1502330596289,1502330748490,1502330869434,1502408199009,1503625056849,1503961098255,1503961507595,1503961534060,1503962098303,1503962104314,1503962125917,1503962934847,1504587412033,1504587853861,1504591168759,1505265640080,1505371260459,1505371283762,1505732146016,1508294103993,1508299798358,1511928150886,1515561351007,1515974919663,1516743414439,1516743438749,1516750896508,1516752990235],"modified":[1598999288893,1588895673490,1589243386654,1589243414247,1589248658092,1589249670955,1589251033645,1589411570409,1589411806482,1589414362437,1589417516255,1589417590484,1589417770284,1589926230429,1589926528257,1591233616634,1593516243988,1594162050971,1594162152267,1594163118159,1594169554106,1594169569304,1594169982605,1594170024133,1594170034508,1594170102697,1594170144932,1594170220421,1594188248186,1594190641176,1594344818723,1594344866854,1594344924620,1594761709054,1596064491154,1596076698858,1596518277790,1596518286898,1596518292436,1596523359804,1596523373401,1596523377449,1596523381420,1596523384951,1597694294299,1597694300972,1597713801813,1597713803920,1598773766099,1598773850349,1598773941463,1598773951068,1598996146186,1598996150632,1598996156737,1598999271683,1598999276578,1598999283502,1598999288893,1600043212922,1600043255344,1600207807222,1600208074052,1600210522317,1600211263399,1600379044351,1600379637492,1600379818023,1600393023867,1600393041932,1600393306106,1600567744220,1600567751488,1600567756861,1600568301362,1600582374530,1600582383108,1600585334124,1600655195215,1600724941099,1600725054308,1600725612920,1600733332299,1600754221001,1600762936566,1600822173855,1602130518353,1602130663280,1602131191738,1602131582932,1602131609109,1602568585772,1602636743401,1603155191326,1603262163349,1603262226834,1603804032054,1603804850598,1603829057619,1603831623997,1603832258611,1604642904949,1604643070077,1604643117127,1605937129681,1605937217637,1605941140790,1606049933415,1606049989105,1606050003284,1606334156027,1606334165899,1606334687254,1606961287385,1606961854183,1607398994147,1607399027524,1607575790729,1607579582172,1607581576927,1607581700695,1611811677987,1611881457040,1611884148703,1611884232499,1613456492658,1613475655346,1613511853711,1613512044254,1613512176232,1613512267463,1613512386862,1613512451435,1613512560328,1613512627690,1613512719680,1613515093223,1613786825626,1613970832601,1613970955534,1613971235459,1613972127039,1613973497611,1613973583900,1613973656592,1613973854604,1613977559427,1613991180864,1613991229065,1613991285976,1613995111665,1613996643305,1613996828213,1614046570465,1614046607991,1614046622398,1614046644685,1614046662215,1614046686222,1614482076917,1614935055744,1614942671037,1614942697123,1615271296901,1615271541783,1615271575147,1615271591957,1615271864467,1615781191309,1615781985025,1615782566771,1615785930433,1615785973533,1615786063177,1615786116676,1615786188581,1615786379470,1615786399870,1615786420405,1615786467277,1615786515168,1615786879478,1615809538417,1615843563791,1615850867386,1615852506024,1615852589574,1615855650671,1615856337677,1615880117756,1615894412935,1615895373717,1615924237308,1615928625395,1615935556185,1616105440781,1616389682400,1616390681784,1618107506530,1618107587545,1618107646129,1618107706985,1618107868863,1618631083461,1618636580850,1618640602118,1618643243054,1618643334666,1618643348975,1618643359053,1618751671707,1618756345902,1618783297038,1618785072780,1618836080607,1619392412362,1619392412362,1620348590550,1620348610119,1620350390441,1620350410260,1620796982793,1621301354338,1621385875951,1621385893912,1621386581906,1621386588347,1621389428738,1621392841427,1621392861831,1621392867580,1621392875243,1621401896161,1621403614624,1621403844089,1621406025951,1621406077782,1622614653713,1622614674309,1622614653713,1622614674309,1622614653713,1622614674309,1624931558626,1626267966210,1626268661933,1626269586509,1446069800294,1446069651808,1465700681635,1479700493773,1479700520408,1479700576544,1479700592877,1479702861297,1479707900727,1480651325081,1480651335608,1480651735336,1480651933997,1480651994491,1480652465308,1480652472456,1480652479686,1481509952639,1482450120748,1482451505779,1483507067754,1483665201583,1487557673019,1487570900607,1487570951261,1487570965864,1487571072288,1487651097289,1487651213033,1487651291665,1487651364773,1487651398850,1487651454931,1487651611009,1487662787212,1487664815215,1487664877417,1487719977548,1487720373077,1487912683728,1487980325910,1487980400536,1487980418332,1487980443665,1487980526088,1487980567793,1487980901504,1487980978016,1487981086020,1487981406211,1487981488827,1487981639764,1487981668194,1487981691663,1487981714266,1487981795246,1487981836633,1487981857301,1487981995439,1488240672862,1488242176369,1488244872761,1488245181661,1488245252053,1489715824880,1490068222799,1490068253157,1490068276097,1490070610827,1490225488582,1490225502582,1490232247223,1490232458261,1490674711402,1490674733529,1748313595681,1748305738791,1748924561977,1748574397295,1748318902882,1748305763100,1748301562320,1748301765066,1747701564948,1748566799924,1749007829641,1748493775388,1748499444293,1747627683034,1748498792298,1748499371039,1749002781249,1749002784933,1748493832657,1748483830682,1748589297160,1748493884699,1748811360296,1747627947352,1748831113810,1748474480590,1748809003526,1747893247929,1747698456713,1747898380006,1747699666483,1747699649026,1747699928893,1747805669614,1747806033392,1747805688195,1747807105663,1747700498214,1747700538295,1747701593111,1747701619653,1747701642963,1747701756584,1747701943404,1747701533668,1747807719138,1747701801279,1747701860200,1747812182168,1747701911992,1747701699568,1747807661663,1747701780302,1749447628757,1749007834262,1748223206138,1748799555460,1748303867215,1748808940275,1748808962887,1747887886164,1747887929767,1750212145600,1747895980306,1747895728565,1749524433344,1749524446891,1748474512835,1748832675370,1748832475361,1748811201401,1748302951375,1748303645933,1748808985147,1748490000949,1748800865861,1747812161306,1747808429169,1747702367983,1747702435726,1747701826858,1749490081439,1748917471710,1747898371546,1748798032979,1748832612482,1748802827907,1748832483020,1749003489622,1749181302598,1748391978107,1748392024899,1748392950982,1748392776062,1748393042092,1748809737059,1748924336296,1748474783603,1748492277705,1748474882777,1747109445852,1748928250031,1749181251098,1749449834344,1749178623136,1749426180875,1747109445852,1747109445852,1747109445852,1749435368474,1749528701217,1749490042799,1749513244132,1749512559951,1749088370868,1749088370868,1748827536864,1748827611964,1747109445852,1747109445852,1699771499730,1502073000502,1502098477137,1502163354965,1502163360165,1502163377889,1502413306624,1502423846439,1502673422129,1502680942319,1502681140583,1502681491017,1502681640048,1502682507699,1502753446985,1502753473003,1502759032142,1502759483370,1502759521578,1502759752097,1502759786796,1502760136824,1502760228187,1502760270110,1503028193863,1503028213447,1503028572963,1503029394014,1503029421584,1503029446204,1502330596325,1502330748526,1502330869462,1502408199067,1503625056888,1503961098299,1503961507722,1503961534097,1503962098421,1503962104340,1503962125964,1503962934892,1504587412113,1504587853885,1504591168813,1505265640175,1505371260538,1505371283865,1505732146172,1508294104036,1508299798403,1511928150945,1515561351077,1515974920063,1516743414537,1516743438873,1516750896531,1516752990260]});
@@ -0,0 +1 @@
+ccFeed.index({"version":1,"generated_at":1792390964043,"total":1493,"bloom_hashes":2,"libraries":[{"id":"db1fccc0-d43f-11e4-b86e-c1b9bb90ed5d","name":"My Library","type":"private"},{"id":"606ca72e-8e3e-4f2d-beb3-6305ef654adc","name":"my colours","type":"private"},{"id":"5face365-482a-4a38-8d02-3238b4694c70","name":"M-142 HIMARS Cut Files","type":"private"},{"id":"034378ca-4501-4f50-a4c5-e481418dbec6","name":"Stock Templates","type":"private"},{"id":"12cbb2ec-a147-4fb1-9f18-ef10175cd994","name":"librarytest","type":"private"},{"id":"1fcdbea3-fe37-4589-adf8-ccec8a1acaf4","name":"My Library","type":"private"},{"id":"394aa2ed-b6d7-4015-8c9c-600e5a98ef84","name":"RaD Mechanical Design Library","type":"shared"}],"element_types":["application/vnd.adobe.element.color+dcx","application/vnd.adobe.element.image+dcx","application/vnd.adobe.element.colortheme+dcx","application/vnd.adobe.element.template+dcx","application/vnd.adobe.element.text+dcx"],"file_types":["unknown","application/illustrator","image/jpeg","image/png"],"chunks":[{"hash":"8d61cd2efa1b9b75","file":"chunk-8d61cd2efa1b9b75.js","count":500,"libraries":[0],"bloom":"B1SCqgQHgMoAgCpIQwEsACIGCCORATUgAAQPkxTMDwAY4VLADNbPyGqAAHI5FEeIQoABBgAUIeEm0AaDCBF4ogMiEQhBAPAQSIoSAIIQOMUUQhjElEQYgJxIQCYhFAAAaKwEFgogMSRMAgEMsOoKuQHJggKRBFMAoGkBWBVwBIlSKAQYUYhOtx6QYDMFtAuYIxOAAgAgaIAirIaBChgAIBCYBjAMXHIJfQBARGkNxgVQIIlcAgIEZB0YJEsIYBE+IVmhA4OAFhCAiCQQDgDAEoLLMQLABYUHBhIraAwAEQilAyEAgmHQD4YAx4gYsQATSFoIgAAShQgxIlAFKIAEiwEUXRIBIAEMiAAYkUUKhwAiHAiEABANY6iQA3GhLABGJxSAwyAiB3BABIAkEwKMJSVyWCAxFQQYGYRQABDkcECGAqFWbFE9AhCCAiU+ApQgYwMzCAIIA4MCC+AQSTKjADAEQIoUYAQEiCgUCGcACACIAayywGiEkgopEFgGZKqDAAgiiiQagBAQQRgwYMEAJcmLBKBQCADxCROBAoCYQbAKoMDKKziKgwBKtxINQBGHICACAAKrZghAAQ0ASIRBBwAESDERAtISABgDBHoQDCCQAoQADMh5ChUKQNAYgFoKDSGCr0gN+DWWZmcBgQBJQBkBKENQMBAIoICSBCkIoBpQwAiMRAkAAOBI8UeAOAFChHBLGGUlOlqRwhAmA5mIVxBBMIEAACnZ9oIIigFgyIiAlAIAIQZHHggY5KYEypGSUGQoLVAwCPhytWQQZJggHLgAvBwQCEKAAAUCtAQCIGAA8EkgMAiF8BpwFAkQZIEQ/ChIAjRSiAyAMUIAgCAAgCHi5EAAAy2ZSiWUAoYQngQ4CQsjxUQUEQSAMEmlQoAGUOTECUAgOFSBYSMCGUBDAKoqAE0hhRBgOIy8QDiUgBQQOITUG4mBgASQhqBAjmKAxECBRRiQEkAUEaFVOIAWuhTaCYAADAOYCkkAopCgwJIk1hRIaQCFEI9sYIhKhQkgJyI5w2ZYUQLFDkApC5SRCRCAOgnuhCTECG8IFkJOAYAEDNAAQLFyBWHUAABwsJQRAgCEfTDLAISyUmyDAAIis6kEYqqAgohAE3BEEFAMAgwFPDYlUmIgApCOJ4BQIIRCSbwoCgGKnWGIAYMBNUNlQhAQD0kGMRIcCGeAiRfBSFIqAJjyAUBgEE5MiZBViogK8cBJCiQiLSUSI1aAQECoBE0BgEAAVSccSBBJGCgQQMxR"},{"hash":"f0bd83ebf17c3d6d","file":"chunk-f0bd83ebf17c3d6d.js","count":500,"libraries":[0,1,2,3],"bloom":"paQgKEIsiGFGDWgkIFEZPQoRHrBkNSoAzAwDLAAgIIQGEbRBQhAEgC1IMwAAQJARIAk2BkAAIQgFINAIIyIiUCiAgeEAQFiCRPhvIMhCQCAJQANLAxYQHiqAEUOUGABoBHQLCAUQiBICEAMaAFPJEVQVwVIQTEAOBSEmAoYYC6kZBqDgxRBaigABESg6DTRSBKNBkBeNAKBeJQqIQCYGiIiQAEIiyjkAcL0hQABQIGWAyoBcwYJw2iokAVrJIgBFEAgYB0KLAQCJSpgKZUA6muASCCACNAYBAkmCg6SIABHJAyBLEoEyvGIZAghDAA3xTFASCRgAiKAZADTQJheKgAWpDlC8kAEiCqAAIKBCARAAQYUYwoRGIVAEIix1BVQBAKXQLIkAcYCQgoIkmwAAJUiAZBdOCAQAESiSgAUhCgQLgUIw6ILkVIDINACDEB4UQABUSIIhpG6jVDEAEYFUBMACkIBEAVIsRgQgggCUQRoRRAPSGAFyACINFA4SqUIPIADEEFA4ggFBMKFCJBBwLSSgkJB4URifAECSAMBEQEKLVAYCIKUc0A5eOgEJEWIMAAwBLTAJNgUFsxFMZsJk1BQXUKBQNYUIooEA2wCEgGlAAgEDAOECVABBDUABBpwsISYkEQhGpTGQr5EDBUABALEKQABwDggmJQJnX4BOeBZcUODkEIQIOkQWDyQAQRhgThJIklBgKsWRBLAAAAAMAiSUChBE8BACtECATQgVzklI0gSDliiAT4A5IJNECtoiUShAUMAQoIbPUBWIxAQhGlQFgAgYCICFBBJCU1BNEsk7kAShEmQAAJQEIIB4cIBQYCUIE62STVBgkCABCpgQgEyJA2gQBQEaIQkIIIAIFDDaipRFDc1DUEQEYAJEGCABmaOAVAahQFgFENAjhDfQGUKR6lAAEABAAgDBU0NWHFaCzAAcgCWQgAZIIIwgNKDEGAgAGHnqB6IjaqQ4HCgEqgmeIwKASQYBEHjQIMDCerIDg6A5BhxBBFLIQRgOjEAQjQMRQhJENpVIwYgBZCUNBBkCwdAApC4EEAbQQ0CgiSggRJkcIi4JApUAoE5iFFFASRYRCIohAegFo4CAAS1kQQ2JSQdCAFKIUgkiDUCiVQAVCXBGEA0IEYoAoAYEIABUwEIBKOCMEgyRpJEAKAKFQkBaBCu0EAUIpEjwqYyqoBCwgAAATCKsAqa6w4UBCYIRUhFI4AS4siBA+Bg8CCIpQgAJgoFMGGAAyQyAFFBBcQAKAASRABMuGINqDAEADDPjiIqlySIgSAgsDdABQKIDmFUEsVAUQTFACBcEwRYEAAIJkEAQQBMwKQESUZCF2AqIEIEYbqBSIiABkAIISQsEyEwDtgYjBlQSqYRRIjQqAAQXcANOwMEAQMHGlAQL0GUJDgSpBAuAIRFZwMTBAMgAmBwRIAlGEIGEABElkoQQggQKABkoGICRIZBYBgAijAwRCRIwgA4WBaMQGiEhECARk4ABCiCwCkIJIJDSEBCZRDBACFnL0AioPJIGAF6BxWSL0gKgCKZNQEBITK0KAkOYJUmKqVggEQAUoMWEhAABGCGQAIEEMYQIYlAIAIQggCACACAQNkgVAAbGGAAcN0EaQWKKqEByFCCNC0QSAOACEAJIeIKQw0CChQAmBlEhgECQwAIBgaRRDyHBhohEASKKyJAQU2ApOpWAlSCACRgCeERwAQJYACABKESEWALIJmkEK5AAyJiJChW8GJiBjRKERQAOAAkAIUCkgMGiCI+wAEWMQob1AlAwI0oQKQIICkRAFTQYkwABAF5MD5n2AcNgrpg6KCQIopgMhYCQLgAMigzBsFGBwGAQAgaJAYEYAJBBQFEMCOwk4ACSVEAR4iUQ3AQQJVHckC05QbIComFBECJhBhVixAAwCwgyICaBwBKokNAAhgLmBDCPD4IBBV5IASDAAAsRACB6JkgEgBEBD0wFjksRBZIAsTkHE1RQykq0JiC0EFYJSgASBJrpQ4AEAAmCYCwAhwIBIEIFAKDBUARIkFyaFzIgoCAIgCcLyHqEhQBOALGAiYGgUcAE1gDDByVAoVG6YMIwkYIgQCESWCEAS0QAMBiEhgAoUEXpMECCWBMcQIAIBLghABQMAqSoCBQIcCgoKhcAgiUQgIAgDQgxABjYKRkJkhEOgQuoAEAKBoAYQoIQRVgFGClRRDEQAMjkgBNnKeQAAAtjKAFsJQhCC50IaCYQgAphgAAkFAaSIRBCQ4BBknwQRmECVAqwxAAACWkIoSaAwgaDQAgTh/CFBAOEoCJCBNQAQGA0iAwwDpjCIAYRmgpBMgWAJoiPWWQJSABDEZJXQAkYEQAyiJuKKogdwCgUogFDAxgQoJnJbEASAE4QEeQkKKQEECAxCAJAEAUgDioGBkS84ZCUDOOENAaaoQ2CcTHAiQiAITBEKQYIABgBoBAbBgAjIARpsQkGEGkIGwishBAKgJCTIAxAmHNT7gCdYDkgAkzQ6c0MCkhgAAEFQ3BAZVFxgCFhYHmSECmCJAEQoSRAiQJECQQl1CbBAhIBIRCACBIBANCMBgqQAoQAQFGgYAECEWAcOKJTQiDQQCAyAISjAkAYECAGAEkSMGoOQQWQAsbm3EIwOE5CZBsFApAAOKgEiYVlpCqGBcEVJAIAHwAQmx1WECAE0agviTAAAghFjAiAhdJBJBoahCGFICNFYKEY4aJFIEi0guSZgJACQIxwEk9SKAEcYBEGA1BSGA6EJiAjCApAAKAQQABIsCIBCCBpBYbAQmwbER1ALghUB2CjVoAAhQsABCCAgx6pGEQA9LhwIMi4cJUAQSKkhYBgBCCVAQgSwQgYyYYm4qLiAQChCKgAQREaYAhMxtBQoBjHQCICgEpSgTnAAAQDGwjEAymgBCMQQMhoImCEKFQIBtoDhJAiFEBrBQwYEg4LGApDBCCgJICSoBAACgYCkRgKCEMCSCLgQBCiNnAAkABggGYoBXYAQgxISAUMILNkEEgE1OECAgqKgINVAAqgQEYwCxCkQYAmgEIwCowsWGALY5JLQZk0BQAuASgwY40DQwAYJI/AIRpQCYgkgKUE4gJFAARyDRAWAKUxWggCTaUiVACSADAlIDZIAEEAcEtVoQBQJCESRCMheISjEEAgaSUjIgBRqojCNgGugCABEIIGgAAG6xEwKGAlSSsG8MCC5IodkAIHaKAggmkAikUZCGWE6XA9idJEEBoBgGACQAEHQYpBlAUQmMCFBoGgAACSJEEhCAOT24IDWWkRQEAgLD6SSIKDIMCISSpCKIAWEwUEgUYkcAQNZKaMAoAQQDIIxAjiEaWIHKig0kgBBEBAFdGDJIsyEESkgiKcAnGAAQNRgSFgEUCiqUGAGIqCYCkAJAaAgAQiEai6IAAAQXMGIJCyF0NSEqrgEHEoggADIwDA4kYQSxABIAvT7VwpJWUBGSwDSeXyKQDAOAjCVagj7ACApQ4AJdRAARDsBQAkEzHLRVhAKIBxecqCUAwARokgB0EokxMoEKgjhpIgjwQRISQDnMS5CARAgAdVEEBAAhkCBwBACEgyACEFlBDMNlCGAxEIFOEhgi46QCEApYmMBKAgGSyxDAAQEw2IGQRQbkSAFgAwLDiLhNBOhsCgEiAiUAABKAgASQv0DmYjJgKSiPFBDLoUBCcCQmBAQ9GIiAgBDEqIBAgYBQYBBNCwBggJFGWgKZhSQwKgPUEWEKGEiEBCIjOoRYgoEahIBo0AAoiSLpB0EYBQCENLRgQiDGEAMR8I2oKIESkAUmsAQlGghQ=="},{"hash":"89544eeaeb3b6787","file":"chunk-89544eeaeb3b6787.js","count":493,"libraries":[3,4,5,6],"bloom":"bCEAGiSbQAWxomwC8BAsYATQK1mQlIHykBJAAgXRCMDNLQBCUFgCA6Ak1AJBACcEBgRCGGiWZAAWJkq2CBcJyISSkAEIkPT8PAIZSRIYAAQAFTAkAAFASakoAgQGCgAKBgDEoZXdAQAZAARuLA5InUUlRIBgBUSEcACBQl1YAEibhrRBFgWFMAgEb5AAmCJBQRBxgLowMhIpANAECCFGEAH+ERINQ2KREJY+SkWCECi4UdQFCiAIEIFJghAkASANzCQlGBMbAT2OgKRByxIGEQUBBggkA6BAEpMJgKGIbGI0EQAQEokhAYkQMUAJiIYioDBCiCXABAPrFwwAAI6CDJCiNpCgIiE74dNgYREgAEBCGICENSHBxIECBUAOQQ1QhCKCsu0uXANDmQKoKYAlS4oAcEoD0GAKACwUaBVIkQeYiGGi1gJCDRkABKcBBUwIJMeRghGDWgBAgQIEyEIVCOgiQBBKEIJwxAgIMH0AOXm7JhWikoICAAwwCwBPJCigHIoABQYCWxBQgGAQoAExUoAw0DvssKIJTEDQIQJGDEYRIK4wUSCjZAMAiCQRiIgAwnwAAgkKADTcKQAQgUAwaEICUIUBERCAcAMwZCPAGCCIIIZMACRjGHURi2gI0AMQAlikxiQC/JUGDJChMAW3BAg2JwotLHMQj5gFECQ6AMQDAAICUooEpjlAAfx5QQRPiAFGoosCYoAEQICGUJEAFBMSAwBKADCSAAKSUBxBdCFBcWghIxEAESZIMCJQxgHgIDEyhv0MAggoCFEYABQGAEDIIuiIAKGAqgLDIFRnaUDkJR4AkGAAq6aIBnIwSACQDAhARCEkJIcBhAnADZWBYFBoIBoTmMHsAkQgAAQE4BhTEjsEQQVOAYCglCUhAcFQIFCBQDVt6iCQgEIxjQAACllcI9ACJh6EAZDCGQYQAIARQBDDA6BAEgbCAKAgIFQFqxJ0CXlYCAYAwstkQQJAQpgFKRJEJWagGKSIEAOQwwkEIuVagTUBAogiAgLQWMkYBAgLglKEAiDJxFACwhDYwGSUESCBQzKqBVnijIgAAsUgBMiBWCAAFegBAJIYUYA1CEICTwCADAcAHP1AEAKCYOQABwhAABkEEBRIGywUMIAEyAQBUBQAEKEHrgEgBCAADBAAlC0PmABAEg2ALQdwIHGIAdABY0AbEEoQpgTPMBMQUIyeQAoKgVwRUBhFEKECyvAt+CVy8UluQEPHAPAEGqjhohMPiC3AQsFIQFABEnFnPIxFIGJBRCBwmWjMACeoBFhIIGAQAjUDJQQEGBQIMQCEAzIBAITNQQBEBAFMJECrODQqGrCAAcSkEwBBAgQiTCAGHQAAADIAwJEgCYFoSYiCAEkKiAx6DAVXkx0Ed4JUBKCBIgIwAACg4ZQTEAQAUgLBCAZgCB9LRGJgCRAEAhCFqaQaAwAqSgI3wBItINWwBwAgCgzNShFBAQGMMAEZQtxgABQEYAMbYQFQ0rACIMCYIJj0UDwLJMCIARSyBgCJh5CCIKGMMCgCBqLEEKUEIAIEAFAAjNwAEhEQEVrEEBAwtUuKwg5UoSAROBtsKgtggQYIshw6ADsRpEIEgQv1RJAgQUlVIRoLKJMA5gYlmEEISFW7gkIahEsIEhiRAAYgIzOEBWgEhYRRABxSxIggCFCABmEiiUAgEgEAEEKkRNgdiOhR4XgCIEFREAkQBJIMJQvBEAKQrAiICAgS2FMERghACUOWwFSiALM0BBRqOOoAw5CJMKSBsm8daQYAD0ehQYpxExDggmI0mE0BPFbERExwAKF/BsIUIqIZRBCLAGRIIklIeAADAqCFzQFgAYAABvIAEAwITQb0mEwASPGllSJVxEhAQvhcgCwLAQTiMgQQREgIZQVPgBDBOjAxEoAaSB8ECYkGxigCBAyAjAHAlBICgRlAAHAUJsQB6IoFgACQjBPAgEEUgATDCAUCmwEowJAoWTAcAGQp7KhSwUKCsQIKySQDCQSA0tCNBgRAAAUIKIARg+C8QggqJRYQC2AAgAKJASAS0misAGZoMppEQAiRMQyRYZAEsUJXQAchACQsMZIMgN64bAAQAA6ECKgJoQAhicBKGAQEcCMiEL4AIBqmBRREgADYU0hDCIaAC+qwAHIkwQco0hmAwodgJCAhTjAAAEagAHEBBOw6GIgjCdK4BRQCggLQAkDEMwAA04owYYYDSBEo4VAlFSGBNMGmAVYDQEAgBBAaAACILWggCYIqGgbpQCmIBFITQAkHgAGAoAkArBZzQGSkBAEAICAiEDBiIAkBhpDCEJYkA1AJDwAmJBJWACxgAABQsKUGnZ1FgBohjISYBlmgQQIAAkokAJQYICSLEEmE8hBAFQIcSISQEKAlOBBEwMiAAniAhMISR4IAYmBhYUAJwAiSEFEEkpRMAFyMFgTBM6AAQlCjkjBGOCiAAUPISIEEa0BOBiCXQpsQgbPkEAnghAFgC3GAG0QCA4BkGRAQUdIMAgeFhT1SmACjAwaMIDABCBYnjUEPEqMGCEAAgiQUpUKgJABpLKRICDFoAkGwSMGEJFDAIlCgEOEiQERMBWgQQiABlACxnIgAAIgoILACA9BGEg0cZEGoYAhsSCAIxqAIOEgICAHEGGYDJCCQFTRhiIwSEKlREAIQAwCpOIag1KQsM8AgNBKEpiBcAQtqpoAjei7NcJAUgACAAAEAACShCqARgQDhd4KHP1AAmJQjCKAsghRDA1iMQaAiQgIACgAWBCOCkGLARABQg1GBCgCAsgSDYhdIgQwJyBCNig9MIyUAJANjAgCiIHxjAQCIEJCEykKAmgADCHMiQRBYBgWRCACiAABUmdUUIBUxi0ApGAFg2UqGK4TqEaoIFQEAAQDghIsQC4ErIGOGhwQFAGQlAIB56TICpDSAAURBOsQoQcEICAwQcgIMQRBwFxQEFKmAcmuWCJzIQA4AIjJnCgIJBgOSaRASOUkiQhEgxcQYoqAGCBLgAwc7GTQg/ABQmUAUBAZYBwFoIJgQCqARcAECBLWmIAAUOBBJUxUcEiNEjIE4RyAxDnAqSCAIDCGIAVAhCKGUgEsShSReEurArSiIMQExkqhQFAvfkYKgRhABARAiAEAOKYKAE0IoMDwsRZEA0yoAIBKKDZpABgFYACSBABCQSYwEgUUCCCAQAiUYKkWApCARxQGAAhCSCIEcgFCMVEiEEwAggQrKNABCigHARghukEWFIFjkgI5hZQKGMqAWFwBg5TQVCTAbASwiRiqq2AQYoACTswCJDACJACkwQAAxhQEStAEg7AghBioYY4swlnREudBQBgjIohE+iAQAAEAlYQRAAgSQCAAcLEmMxFBIcRZAhEAJgGABmoGKoEZCBJMMCADEiWaOAWYvEAgIUCkBcwRzwAGBSARSooGSoISAYuBFklAScVSJCACGILSgkBEEIEBoYA5CiA4RKlRIDQktBhArLghCRDgpAZSCEAgEzASiwE+JwiAADg+hCARkSpIwVACQUAQRIWAAXqZIASDTgSEVAjBjCTCoACkQKYgKoMkRQFTIShwhqEGoMAJWkNoEIIX+aAM5mAEIJMk9AgUidiEcKhogcACRACI4IOAMBASIchBQUrxggQGTLEQgLHEgkYRgEQEBFEFgMC8CWACACAgADdKlhAERCxoCFgxQAELQAtBJAQBAGBkCSMGDCiBA9EBECEIAAHpQgIOSAxQCDIIIwggMQwTIkDiAYUIRahkKCCsQoRZEofg5IhgIRkwSgJKgARZJGoMBhJmQkWB1A4Y2MZaLBmk4nSJIGRCDhiBKSoRIAAEiDEEamRCS2DqalorKgGgxUF4CCASKBQkBKKEDCggGgAGnEABAApetJAgLQkioOcoUgdCAIZlA0JjK4AhASlIvVZBAGEBOBgqJFAIAPAFIGSoBCgBUOJAUUtOJCQMAbAAlFUU4yBMBAAiCkEAjIhGMCEBEQExqUAtAcUDREE4Igfi5aBQCDUEBQFIQi5CGpgEEIABUNVgQSUIYKCTAABIFOQg4gZmQJwjAnEAgNCyCgbWUIAAgBmFkYHgAAjEagAGCkgFggkEFWAgA6YIAwYgQIODIIIKARCURiqHhBOJFRadKA2dTAtAAAiQoIREmEQTNgxQSR+AoIKURAITlgQV4Aq1AnhBQiMEAKCAAEEQAMXwIJk5DAIQegBCwEVKHhACOMSKMyAEIjBAQIiFAAwClAaRKQCIgASgaDMATKQGGABC4AwwoABUNBlUMAEHQjYgrBqCCgRRBGQ6QQW8IACDGjwCUARgAYWiM4YWQwVhgREYCgYsFZKi6CIBwsGIMIBbIEgECEBAQqyECSUF0QUwABBKSMCoSSAEwLJhQBcEpAQtCkkDAgogE2KIxDFAACAYDkIAixgKYI4IwRhkofiQAJD1IsFZDHAvFIkiQABRSH4AAlikhIZMFUgQFpEQUAghITSaMWl+KBWskAwiUBQJUAGuSKACBAigIGcAAkEAQ4gEPMlGlTiyIewSIosoUABCq7gBYHzKABwYIAJEAEQBIAEREJyogIRCAI4JokgkNQkEEAgQBiYAQAiijWQlgREisWAAQRARggFAOAJAFQEAUCAEDZRRBZAOCJsAQCSAjBUxxMEFlBYJEiZZyKAihyKAgJ0E2QfCAAIEAZIGm6IhyEbAFgYDBF8IBghpQAKEZCoSwAQCBDARaEIYSIsQAYIIETUABZ0IINJiABjgCIAKSQQQMMQGWiIBEJKZEJOrQWBVIEg0BZBCwCiPgSGjEyIRmBEGYZAAzCRMJwSTBIAABigECMgAEwSARGEQBAEAms4FhAUhogRQXgME5ICmigBOQYEEACDBUAWbwkMESDDtpYABLATaSQgTAVUSbIkakojIIKAACUhrvLgCGgHAoGcQQBCyoDABA2AoSEFiQBKpgsBqABLRKJ+QAST5RwlGAOxIUQGWUEThDgENGSQIAEigBhEQSJQGgKB/QwNShQeQAgBQEjlIQ0AIQUMEhEA0YKIoTUMA2opGwhEmRGgkyYOEYKAJs1DiICMhh0gFKpCgAUkBCViQBggwwkiAhwEPATC9SUAMooaLwxscRGAaDJxwHBkADACgBEEA4kEaQAjQSBSCJaUEAQIGABEyRAILAgOoCjEcBgghjEAErWBMCjlCBtkCDwCEQBGrWgAhQiAgQlAFAQIsEAKQisExATKQMWlANABAItAskqBAhAgSgGgARkABglNggMGCIKM0AERgZgHKSxACqQIAMAAEPAiQJwQjqgQMHLAFwguAAggGKDTERYRSOVbCxAoSBAIREmUTsoUKBgEAAAEgBOgAAgAURGSQRYixiQLvzBSUUAxCBo5wNUAwhAGKgAIAApGEVOEhE2ggIJAgMhEoAsgIJSHSBsQYayiRUYgUhCKsCwIrDhWItEIUAIBWMlBEIAAYx3AZUMUCSwGoIECcBIGsQAEJ0QBwgMNQAJiimIApsECAiIlREByWYBECDBAiSJpAiAQwQgWSARKHAkMAgPDSCALMAaQRMi4hhRCQIxgA6JzY8OEAHYkqI0IhQLQooOC6C0EM9QAhEkAAOFFIKQXgQOsACosYAwRsITEEiQZKKAJA2hABaXSQjgkEgAI1kBYmKIAYAIsY4iSDAFIQ4mULCM4YIKBgCATAiSEElSjqBDAwBABtOEYgCkEAQCgEAY4iICi4A4IhshIToQAISTUBAsCQgIQ8BUAQyCNECKGQOhEWQYMqAg0WIcaBAWCSQJEgkueYLmgAGvAUBASYUTIjmBSAg0UlkKshECxoRQFjCnABDBDIughsQEEPBURlAlRR0iiA2YDAgASqUGEMaSzQACkhJKQVQgVCG3GqBHBBiBNYSIAHEFAzkJEAQUgTEBAKBPQAEIAAGgiAJMgAwGAgCIIiKCpEaFFCkMhseTMwIIScAeFQySsIqGAAHMSwgERQOKAQhABQPUdBCoLIRN4CAABPABBAiEU4Ig4SSAhFCtiGAAQAIqACAgkgwgKAwmiUWgmEBAACShhACAHAAA4FEAqykJgEFERQBJyETIEAVIrAMUiENAgEAQZCIMRBKAVgWEAAAxQRRAEQw5RgqCIAAHpoKRbsMoCjXAlAAUVgIACGAzEaP9zOuDBgIDWwAvBEAwJEqAQiUwCJBCgAAiBIyIIEkiBFAHJKAuRAGiAswGCGgdAiRREGBQDEghFAKEVgAAwYBQQgIhVBgogEfFgAhFgMgwceQPBEBITbAxAapoqYvEFiBGQwQYI4AIAQaAhgAESxQIEmMB4kADABIDyhBssAhEBQ270FARMRokBoIcwCwArKgBAQZCRgJJGiggUBBIASYMU5QwQROAGCABCAI1hBQWDMAhzY3gIWQcqCBEEgQGEHS0tJUwBYYCCTEKNQgQCFoMgKgLAgAKQwoAiBBqSgAMQJBQFGZCQAgECEFoIjIRaoywlSao8VgJDBKECRQAQYB24RoiAABYWCBBpBAxAzDKCimK0VwQBM5ARQEIyBAoUABALoAA4AUSSSBQ4h8CAAIIhikAI6xihRQDEBILJQoA8OyDcmEhiwIEkNgACCDPMlCBTApwIIFCQQJJYpCgkoSIWwkDBIcIxRJDQBBCQxjiEOq4hECJAQ1RUJVKEIJECyqO0mCCkREBikBZwDHnIKBC7jGTH4AFADGiboVUEGADI0UiOAgCQEgtRG9AMCEiiECCjSaJLHBBBdAWBADECjIiLwlEAIqIIKTAGBEVFGCIIgogBnB4O2SFFIrZmx6ZBItgYAg0sA5AVAoDBM5EQgpSPIiAoAgGZiFAADDKAwISBgiBggwPAIYRhvYVXZIAAUAEiCaiCM4DYA4hAYb"}]});
@@ -3,37 +3,147 @@
 Simple Flask server for searching Creative Cloud Libraries via web interface.
 """
 
-from flask import Flask, render_template_string, jsonify, request
-import sqlite3
+from flask import Flask, Response, render_template_string, jsonify, request
 import json
+import base64
+import csv
+import functools
+import io
+import math
+import sqlite3
+import sys
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 
+from duplicates import DEFAULT_LIMIT as DUPLICATES_LIMIT, MAX_LIMIT as MAX_DUPLICATES_LIMIT, duplicate_groups, duplicate_totals
+from index_generation import ReaderPool, connect_read_only, read_generation, read_geometry
+from part_geometry import geometry_dict, geometry_match, parse_ranges
+from response_cache import MAX_BYTES, CachedResponse, ResponseCache, accepts_gzip, etag_matches
+from shape_index import DEFAULT_K as SIMILAR_K, MAX_K as MAX_SIMILAR_K, ShapeIndex
+from suggest_index import DEFAULT_LIMIT as SUGGEST_LIMIT, MAX_LIMIT as MAX_SUGGEST_LIMIT, SuggestIndex
+from substring_search import count_matches, fuzzy_rowids, substring_filter, substring_match
+from user_directory import users
+
 app = Flask(__name__)
 
 DB_PATH = Path(__file__).parent / "cc_libraries_enhanced.db"
-USER_MAP_PATH = Path(__file__).parent / "user_map.json"
 
-def load_user_map():
-    """Load user ID to name mapping."""
-    if not USER_MAP_PATH.exists():
-        return {}
-    try:
-        with open(USER_MAP_PATH) as f:
-            data = json.load(f)
-            return data.get('users', {})
-    except:
-        return {}
+# Read-only connections, one per request thread, reopened when the indexer publishes
+readers = ReaderPool(DB_PATH)
+
+# Encoded responses of the current index generation (--cache-mb sets the size)
+responses = ResponseCache(DB_PATH, MAX_BYTES)
+
+# Type-ahead prefix index, rebuilt for each new index generation
+suggestions = SuggestIndex(DB_PATH)
+
+# Shape descriptors of the measured parts, reloaded for each new index generation
+shapes = ShapeIndex(DB_PATH)
+
+# Search results per page, and the most a client may ask for
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Versions returned by /api/versions/<name>
+MAX_VERSIONS = 500
+
+# Seconds a request may spend in SQLite before it is interrupted (--timeout)
+REQUEST_TIMEOUT = 10.0
+
+# Production serving (--serve): worker threads, and the socket timeout for slow clients
+SERVE_WORKERS = 8
+CLIENT_TIMEOUT = 30.0
+
+# Result filters of /api/search and /api/export
+FILTERS = {
+    'illustrator': 'e.file_type LIKE "%illustrator%"',
+    'color': 'e.element_type LIKE "%color%"',
+    'shared': 'l.library_type = "shared"',
+    'private': 'l.library_type = "private"'
+}
+
+# Rows fetched and written at a time by /api/export
+EXPORT_BATCH = 1000
+
+# Fields of each exported element, in CSV column order
+EXPORT_COLUMNS = ['element_id', 'element_name', 'element_type', 'library_name', 'library_type',
+                  'file_name', 'file_type', 'file_size', 'component_path', 'part_key',
+                  'component_sha256', 'created_at', 'modified_at', 'created_by_user',
+                  'created_by', 'modified_by_user', 'modified_by']
+
+STARTED_AT = time.time()
+
+# Deadline of the request being handled on this thread
+_request = threading.local()
+
+def _past_deadline():
+    deadline = getattr(_request, 'deadline', None)
+    return 1 if deadline is not None and time.monotonic() > deadline else 0
+
+def connection():
+    """The request thread's pooled connection; queries are interrupted past the request deadline."""
+    conn = readers.connection()
+    conn.set_progress_handler(_past_deadline, 10000)
+    return conn
+
+@app.before_request
+def start_request_clock():
+    _request.deadline = time.monotonic() + app.config.get('REQUEST_TIMEOUT', REQUEST_TIMEOUT)
+
+@app.errorhandler(sqlite3.OperationalError)
+def database_error(e):
+    """Timed-out queries answer 503 so clients can retry; other database errors 500."""
+    if 'interrupted' in str(e):
+        return jsonify({'error': 'Request timed out'}), 503
+    return jsonify({'error': f'Database error: {e}'}), 500
+
+def cached(view=None, geometry=False):
+    """Serve a view's 200 responses from the response cache, with ETags and gzip.
+    
+    Entries are keyed by path and query string (and the user map, which names appear in)
+    and dropped when a new index generation is published. Views that show part geometry
+    are decorated with @cached(geometry=True), so a recorded part drops their entries too.
+    """
+    if view is None:
+        return functools.partial(cached, geometry=geometry)
+    
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        users.refresh()
+        key = (request.path, tuple(sorted(request.args.items(multi=True))), users.loads)
+        version = responses.sync()
+        entry = responses.get(key)
+        hit = entry is not None
+        if not hit:
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            entry = CachedResponse(response.get_data(), response.mimetype)
+            responses.put(key, entry, version, geometry)
+        
+        gzipped = entry.gzipped is not None and accepts_gzip(request.headers.get('Accept-Encoding'))
+        etag = entry.gzip_etag if gzipped else entry.etag
+        # no-cache: browsers keep the body but revalidate, so a new generation shows at once
+        headers = {'ETag': etag, 'Vary': 'Accept-Encoding', 'Cache-Control': 'no-cache',
+                   'X-Cache': 'HIT' if hit else 'MISS'}
+        if etag_matches(request.headers.get('If-None-Match'), etag):
+            return Response(status=304, headers=headers)
+        if gzipped:
+            headers['Content-Encoding'] = 'gzip'
+        return Response(entry.gzipped if gzipped else entry.body, mimetype=entry.mimetype, headers=headers)
+    return wrapper
 
 def get_user_name(user_id):
     """Get human-readable name for a user ID."""
     if not user_id:
         return "Unknown"
     
-    user_map = load_user_map()
+    user_info = users.get(user_id)
     
-    if user_id in user_map:
-        return user_map[user_id].get('name', user_id)
+    if user_info:
+        return user_info.get('name', user_id)
     
     short_id = user_id.split('@')[0]
     return f"{short_id}..."
@@ -47,6 +157,23 @@ def timestamp_to_date(ts):
     except:
         return "N/A"
 
+def encode_cursor(modified_at, element_name):
+    """Opaque keyset cursor for the result after (modified_at, element_name)."""
+    raw = json.dumps([modified_at, element_name]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """Return (modified_at, element_name) from a cursor, or None; ValueError when malformed."""
+    if not cursor:
+        return None
+    try:
+        modified_at, element_name = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(modified_at, int) or not isinstance(element_name, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return modified_at, element_name
+
 @app.route('/')
 def index():
     """Serve the main search interface."""
@@ -107,8 +234,13 @@ def index():
             margin-bottom: 15px;
         }
         
-        .search-input {
+        .search-field {
             flex: 1;
+            position: relative;
+        }
+        
+        .search-input {
+            width: 100%;
             padding: 15px 20px;
             font-size: 16px;
             border: 2px solid #e0e0e0;
@@ -121,6 +253,41 @@ def index():
             border-color: #667eea;
         }
         
+        .suggestions {
+            display: none;
+            position: absolute;
+            top: 100%;
+            left: 0;
+            right: 0;
+            z-index: 10;
+            margin-top: 4px;
+            background: white;
+            border: 2px solid #e0e0e0;
+            border-radius: 10px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.15);
+            overflow: hidden;
+        }
+        
+        .suggestions.visible {
+            display: block;
+        }
+        
+        .suggestion {
+            display: flex;
+            justify-content: space-between;
+            padding: 10px 20px;
+            cursor: pointer;
+        }
+        
+        .suggestion.active, .suggestion:hover {
+            background: #f0f2ff;
+        }
+        
+        .suggestion-kind {
+            color: #999;
+            font-size: 0.85em;
+        }
+        
         .search-button {
             padding: 15px 40px;
             font-size: 16px;
@@ -338,6 +505,23 @@ def index():
             display: block;
         }
         
+        .load-more {
+            display: block;
+            margin: 20px auto;
+            padding: 12px 30px;
+            background: white;
+            color: #667eea;
+            border: 2px solid #667eea;
+            border-radius: 10px;
+            font-size: 1em;
+            cursor: pointer;
+        }
+        
+        .load-more:hover {
+            background: #667eea;
+            color: white;
+        }
+        
         .version-item {
             padding: 10px;
             margin: 5px 0;
@@ -409,9 +593,12 @@ def index():
         
         <div class="search-box">
             <div class="search-input-group">
-                <input type="text" id="searchInput" class="search-input" 
-                       placeholder="Search for files, elements, or libraries..." 
-                       autofocus>
+                <div class="search-field">
+                    <input type="text" id="searchInput" class="search-input" 
+                           placeholder="Search for files, elements, or libraries..." 
+                           autocomplete="off" autofocus>
+                    <div id="suggestions" class="suggestions"></div>
+                </div>
                 <button class="search-button" onclick="performSearch()">Search</button>
             </div>
             
@@ -436,14 +623,84 @@ def index():
     
     <script>
         let currentFilter = 'all';
+        let currentQuery = '';
+        let nextCursor = null;
+        let resultItems = [];
+        
+        let suggestionItems = [];
+        let activeSuggestion = -1;
+        let suggestSeq = 0;
         
-        // Search on Enter key
+        // Search on Enter key (with the highlighted suggestion, if any)
         document.getElementById('searchInput').addEventListener('keypress', function(e) {
             if (e.key === 'Enter') {
+                if (activeSuggestion >= 0) {
+                    this.value = suggestionItems[activeSuggestion].text;
+                }
+                hideSuggestions();
                 performSearch();
             }
         });
         
+        // Type-ahead from /api/suggest; only the latest response is shown
+        document.getElementById('searchInput').addEventListener('input', function() {
+            const prefix = this.value.trim();
+            const seq = ++suggestSeq;
+            if (!prefix) {
+                hideSuggestions();
+                return;
+            }
+            fetch(`/api/suggest?prefix=${encodeURIComponent(prefix)}`)
+                .then(response => response.json())
+                .then(data => {
+                    if (seq === suggestSeq) {
+                        showSuggestions(data.suggestions || []);
+                    }
+                })
+                .catch(() => hideSuggestions());
+        });
+        
+        document.getElementById('searchInput').addEventListener('keydown', function(e) {
+            if (!suggestionItems.length) return;
+            if (e.key === 'ArrowDown' || e.key === 'ArrowUp') {
+                e.preventDefault();
+                const step = e.key === 'ArrowDown' ? 1 : -1;
+                activeSuggestion = (activeSuggestion + 1 + step + suggestionItems.length + 1) % (suggestionItems.length + 1) - 1;
+                showSuggestions(suggestionItems, activeSuggestion);
+            } else if (e.key === 'Escape') {
+                hideSuggestions();
+            }
+        });
+        
+        document.getElementById('searchInput').addEventListener('blur', () => setTimeout(hideSuggestions, 150));
+        
+        function showSuggestions(items, active = -1) {
+            suggestionItems = items;
+            activeSuggestion = active;
+            const box = document.getElementById('suggestions');
+            box.innerHTML = items.map((item, i) => `
+                <div class="suggestion ${i === active ? 'active' : ''}" onmousedown="pickSuggestion(${i})">
+                    <span>${escapeHtml(item.text)}</span>
+                    <span class="suggestion-kind">${item.kind}</span>
+                </div>
+            `).join('');
+            box.classList.toggle('visible', items.length > 0);
+        }
+        
+        function hideSuggestions() {
+            // Drop responses still in flight
+            suggestSeq++;
+            suggestionItems = [];
+            activeSuggestion = -1;
+            document.getElementById('suggestions').classList.remove('visible');
+        }
+        
+        function pickSuggestion(index) {
+            document.getElementById('searchInput').value = suggestionItems[index].text;
+            hideSuggestions();
+            performSearch();
+        }
+        
         // Load stats on page load
         window.addEventListener('load', loadStats);
         
@@ -503,7 +760,24 @@ def index():
             document.getElementById('error').classList.remove('visible');
             
             // Perform search
-            fetch(`/api/search?q=${encodeURIComponent(query)}&filter=${currentFilter}`)
+            currentQuery = query;
+            resultItems = [];
+            fetchPage(null);
+        }
+        
+        function loadMore() {
+            if (nextCursor) {
+                document.getElementById('loading').classList.add('visible');
+                fetchPage(nextCursor);
+            }
+        }
+        
+        function fetchPage(after) {
+            let url = `/api/search?q=${encodeURIComponent(currentQuery)}&filter=${currentFilter}`;
+            if (after) {
+                url += `&after=${encodeURIComponent(after)}`;
+            }
+            fetch(url)
                 .then(response => response.json())
                 .then(data => {
                     document.getElementById('loading').classList.remove('visible');
@@ -514,12 +788,14 @@ def index():
                         return;
                     }
                     
-                    if (data.results.length === 0) {
+                    if (data.results.length === 0 && !after) {
                         document.getElementById('noResults').classList.add('visible');
                         return;
                     }
                     
-                    displayResults(data.results);
+                    nextCursor = data.next;
+                    resultItems = resultItems.concat(data.results);
+                    displayResults(resultItems);
                 })
                 .catch(error => {
                     document.getElementById('loading').classList.remove('visible');
@@ -573,18 +849,21 @@ def index():
                             ${item.component_path ? `<button class="action-button secondary" onclick="copyPath('${escapeHtml(item.component_path)}')">Copy Path</button>` : ''}
                         </div>
                         
-                        ${item.version_count > 1 ? createVersionList(item.versions, index) : ''}
+                        ${item.version_count > 1 ? `<div class="version-list" id="versions-${index}"></div>` : ''}
                     </div>
                 `;
             });
             
+            if (nextCursor) {
+                html += '<button class="load-more" onclick="loadMore()">Load more results</button>';
+            }
+            
             resultsContainer.innerHTML = html;
             resultsContainer.classList.add('visible');
         }
         
-        function createVersionList(versions, cardIndex) {
-            let html = `<div class="version-list" id="versions-${cardIndex}">`;
-            html += `<strong>Version History:</strong>`;
+        function createVersionList(versions) {
+            let html = `<strong>Version History:</strong>`;
             
             versions.forEach((version, idx) => {
                 const isCurrent = idx === 0;
@@ -607,15 +886,27 @@ def index():
                 `;
             });
             
-            html += '</div>';
             return html;
         }
         
         function toggleVersions(index) {
             const versionList = document.getElementById(`versions-${index}`);
-            if (versionList) {
+            if (!versionList) {
+                return;
+            }
+            if (versionList.dataset.loaded) {
                 versionList.classList.toggle('expanded');
+                return;
             }
+            
+            // Versions are fetched the first time a card is expanded
+            fetch(`/api/versions/${encodeURIComponent(resultItems[index].element_name)}`)
+                .then(response => response.json())
+                .then(data => {
+                    versionList.innerHTML = createVersionList(data.versions || []);
+                    versionList.dataset.loaded = 'true';
+                    versionList.classList.add('expanded');
+                });
         }
         
         function escapeHtml(text) {
@@ -654,13 +945,28 @@ def index():
     '''
     return render_template_string(html)
 
+@app.route('/health')
+def health():
+    """Readiness check for load balancers, process supervisors and the load test."""
+    if not DB_PATH.exists():
+        return jsonify({'status': 'unavailable', 'error': 'Database not found'}), 503
+    connection().execute('SELECT 1 FROM elements LIMIT 1').fetchall()
+    return jsonify({
+        'status': 'ok',
+        'generation': read_generation(DB_PATH).get('generation', 0),
+        'geometry': read_geometry(DB_PATH).get('geometry', 0),
+        'uptime': round(time.time() - STARTED_AT, 1),
+        'cache': responses.stats()
+    })
+
 @app.route('/api/stats')
+@cached
 def get_stats():
     """Get database statistics."""
     if not DB_PATH.exists():
         return jsonify({'error': 'Database not found'}), 404
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = connection()
     cursor = conn.cursor()
     
     # Total elements
@@ -679,7 +985,6 @@ def get_stats():
     cursor.execute('SELECT COUNT(DISTINCT created_by_user) FROM elements WHERE created_by_user IS NOT NULL')
     unique_users = cursor.fetchone()[0]
     
-    conn.close()
     
     return jsonify({
         'total_elements': total_elements,
@@ -688,115 +993,369 @@ def get_stats():
         'unique_users': unique_users
     })
 
+@app.route('/api/suggest')
+def suggest():
+    """Type-ahead: element names, part numbers and libraries starting with prefix, newest first."""
+    prefix = request.args.get('prefix', '')
+    try:
+        limit = min(max(int(request.args.get('limit', SUGGEST_LIMIT)), 1), MAX_SUGGEST_LIMIT)
+    except ValueError:
+        return jsonify({'error': 'Invalid limit'}), 400
+    
+    if not DB_PATH.exists():
+        return jsonify({'error': 'Database not found'}), 404
+    
+    suggestions.refresh()
+    return jsonify({'prefix': prefix, 'suggestions': suggestions.suggest(prefix, limit),
+                    'generation': suggestions.generation})
+
 @app.route('/api/search')
+@cached(geometry=True)
 def search():
-    """Search the database with version grouping."""
+    """Search the database, one result per element name, newest first.
+    
+    Results come a page at a time: pass the returned `next` cursor as `after` for the
+    following page. Versions of a result are loaded from /api/versions/<name>.
+    Size ranges (min_w, max_w, min_h, max_h, min_area, max_area; inches) keep parts the
+    converter measured within them, and may be used without a query.
+    """
     query = request.args.get('q', '')
     filter_type = request.args.get('filter', 'all')
     
-    if not query:
+    try:
+        ranges = parse_ranges(request.args)
+    except ValueError:
+        return jsonify({'error': 'Size ranges must be numbers'}), 400
+    
+    if not query and not ranges:
         return jsonify({'error': 'No search query provided'}), 400
     
+    try:
+        limit = min(max(int(request.args.get('limit', DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+        after = decode_cursor(request.args.get('after'))
+    except ValueError:
+        return jsonify({'error': 'Invalid limit or cursor'}), 400
+    
     if not DB_PATH.exists():
         return jsonify({'error': 'Database not found'}), 404
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = connection()
     cursor = conn.cursor()
     
-    # Build query based on filter
-    sql = '''
-        SELECT e.element_id, e.element_name, e.file_name, e.file_type, e.file_size,
-               e.modified_at, e.modified_by_user, e.component_path, e.created_at,
-               l.library_name, l.library_type
+    # One result per element name: its newest version among those matching the query and
+    # filters (alias r), with the number of matching versions
+    def versions(where):
+        return f'''
+            FROM elements e JOIN libraries l ON e.library_id = l.library_id
+            WHERE e.element_name = r.element_name AND {where}
+        '''
+    
+    def results_sql(where, candidates=None):
+        newest = f'''r.rowid = (SELECT e.rowid {versions(where)}
+                                ORDER BY COALESCE(e.modified_at, 0) DESC, e.rowid DESC LIMIT 1)'''
+        return f'''
+            SELECT r.element_id, r.element_name, r.file_name, r.file_type, r.file_size,
+                   r.modified_at, r.modified_by_user, r.component_path,
+                   rl.library_name, rl.library_type, (SELECT COUNT(*) {versions(where)}),
+                   COALESCE(r.modified_at, 0), g.width, g.height, g.area, g.perimeter, g.hole_count
+            FROM elements r
+            JOIN libraries rl ON r.library_id = rl.library_id
+            LEFT JOIN part_geometry g ON g.part_key = r.part_key
+            WHERE {f'r.rowid IN ({candidates}) AND ' if candidates else ''}{newest}
+        '''
+    
+    # Filters and size ranges apply to each version, like the query
+    extra = f' AND {FILTERS[filter_type]}' if filter_type in FILTERS else ''
+    extra_params = []
+    if ranges:
+        parts, extra_params = geometry_match(ranges)
+        extra += f' AND e.part_key IN ({parts})'
+    
+    # Keyset pagination: continue strictly after the last result of the previous page
+    page = ''
+    page_params = []
+    if after:
+        page += ' AND (COALESCE(r.modified_at, 0), r.element_name) < (?, ?)'
+        page_params += list(after)
+    page += ' ORDER BY COALESCE(r.modified_at, 0) DESC, r.element_name DESC LIMIT ?'
+    page_params.append(limit + 1)
+    
+    def run(match, params, candidates=None, candidate_params=()):
+        where = f'{match}{extra}'
+        where_params = params + extra_params
+        # Placeholders in text order: the version count, the candidates, the newest version
+        sql = results_sql(where, candidates) + page
+        cursor.execute(sql, where_params + list(candidate_params) + where_params + page_params)
+        return cursor.fetchall()
+    
+    # Broad queries walk the elements newest first (idx_recent) and stop after a page;
+    # selective ones start from the matching rows. Below sqrt(page size * elements) matches,
+    # that is cheaper.
+    total = cursor.execute('SELECT MAX(rowid) FROM elements').fetchone()[0] or 0
+    broad_at = max(math.isqrt(limit * total), limit)
+    if not query:
+        # Size ranges alone: the R-tree's parts, through the part_key index
+        results = run('1', [], f'SELECT rowid FROM elements WHERE part_key IN ({parts})', extra_params)
+    elif count_matches(conn, query, broad_at) >= broad_at:
+        condition, params = substring_filter(query)
+        results = run(condition, params)
+    else:
+        subquery, params = substring_match(query)
+        # Unary + keeps the version lookups on idx_element_name, testing rowids against the list
+        results = run(f'+e.rowid IN ({subquery})', params, subquery, params)
+    
+    # No substring match: fall back to names within a typo or two of the query
+    fuzzy = False
+    if query and not results and not after:
+        rowids = fuzzy_rowids(conn, query)
+        if rowids:
+            fuzzy = True
+            marks = ', '.join('?' for _ in rowids)
+            results = run(f'+e.rowid IN ({marks})', rowids, marks, rowids)
+    
+    
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        next_cursor = encode_cursor(results[-1][11], results[-1][1])
+    
+    formatted_results = [{
+        'element_id': row[0],
+        'element_name': row[1],
+        'file_name': row[2],
+        'file_type': row[3],
+        'file_size': row[4],
+        'modified_at': timestamp_to_date(row[5]),
+        'modified_by': get_user_name(row[6]),
+        'component_path': row[7],
+        'library_name': row[8],
+        'library_type': row[9],
+        'version_count': row[10],
+        'geometry': geometry_dict(row[12:17])
+    } for row in results]
+    
+    return jsonify({'results': formatted_results, 'count': len(formatted_results),
+                    'next': next_cursor, 'fuzzy': fuzzy})
+
+@app.route('/api/export')
+def export():
+    """Every element version matching the filters, streamed as NDJSON or CSV, oldest change first.
+    
+    changed_since keeps elements the indexer wrote after that point of its change sequence.
+    The X-Export-Cursor header holds the sequence's latest point, to pass as changed_since
+    next time. modified_since (milliseconds) keeps elements modified in CC after it.
+    """
+    export_format = request.args.get('format', 'ndjson')
+    filter_type = request.args.get('filter', 'all')
+    query = request.args.get('q', '').strip()
+    
+    if export_format not in ('ndjson', 'csv'):
+        return jsonify({'error': 'format must be ndjson or csv'}), 400
+    try:
+        since = {name: int(request.args[name]) for name in ('changed_since', 'modified_since')
+                 if request.args.get(name)}
+    except ValueError:
+        return jsonify({'error': 'Invalid changed_since or modified_since'}), 400
+    
+    if not DB_PATH.exists():
+        return jsonify({'error': 'Database not found'}), 404
+    
+    conditions = []
+    params = []
+    if 'changed_since' in since:
+        conditions.append('e.change_seq > ?')
+        params.append(since['changed_since'])
+    if 'modified_since' in since:
+        conditions.append('e.modified_at > ?')
+        params.append(since['modified_since'])
+    if filter_type in FILTERS:
+        conditions.append(FILTERS[filter_type])
+    if query:
+        subquery, query_params = substring_match(query)
+        conditions.append(f'e.rowid IN ({subquery})')
+        params += query_params
+    
+    # Its own connection, outside the request timeout: an export may run for minutes. One
+    # read transaction keeps the cursor header and the rows on the same snapshot.
+    conn = connect_read_only(DB_PATH)
+    conn.execute('BEGIN')
+    cursor_value = conn.execute('SELECT MAX(change_seq) FROM elements').fetchone()[0]
+    rows = conn.execute(f'''
+        SELECT e.element_id, e.element_name, e.element_type, l.library_name, l.library_type,
+               e.file_name, e.file_type, e.file_size, e.component_path, e.part_key,
+               e.component_sha256, e.created_at, e.modified_at, e.created_by_user,
+               e.modified_by_user
         FROM elements e
         JOIN libraries l ON e.library_id = l.library_id
-        WHERE (e.element_name LIKE ? OR e.file_name LIKE ? OR l.library_name LIKE ?)
-    '''
+        WHERE {' AND '.join(conditions) or 1}
+        ORDER BY e.change_seq
+    ''', params)
     
-    params = [f'%{query}%', f'%{query}%', f'%{query}%']
-    
-    # Apply filters
-    if filter_type == 'illustrator':
-        sql += ' AND e.file_type LIKE "%illustrator%"'
-    elif filter_type == 'color':
-        sql += ' AND e.element_type LIKE "%color%"'
-    elif filter_type == 'shared':
-        sql += ' AND l.library_type = "shared"'
-    elif filter_type == 'private':
-        sql += ' AND l.library_type = "private"'
-    
-    sql += ' ORDER BY e.modified_at DESC'
-    
-    cursor.execute(sql, params)
-    results = cursor.fetchall()
-    
-    conn.close()
-    
-    # Group results by element_name
-    grouped = {}
-    for row in results:
-        element_name = row[1]
-        
-        version_data = {
-            'element_id': row[0],
-            'element_name': row[1],
-            'file_name': row[2],
-            'file_type': row[3],
-            'file_size': row[4],
-            'modified_at': row[5],
-            'modified_at_formatted': timestamp_to_date(row[5]),
-            'modified_by': get_user_name(row[6]),
-            'component_path': row[7],
-            'created_at': row[8],
-            'library_name': row[9],
-            'library_type': row[10]
-        }
-        
-        if element_name not in grouped:
-            grouped[element_name] = {
-                'versions': [],
-                'latest': None
-            }
-        
-        grouped[element_name]['versions'].append(version_data)
-    
-    # Format results - take the most recent version as the main item
-    formatted_results = []
-    for element_name, data in grouped.items():
-        # Sort versions by modified_at descending
-        data['versions'].sort(key=lambda x: x['modified_at'], reverse=True)
-        latest = data['versions'][0]
-        
-        formatted_results.append({
-            'element_id': latest['element_id'],
-            'element_name': latest['element_name'],
-            'file_name': latest['file_name'],
-            'file_type': latest['file_type'],
-            'file_size': latest['file_size'],
-            'modified_at': latest['modified_at_formatted'],
-            'modified_by': latest['modified_by'],
-            'component_path': latest['component_path'],
-            'library_name': latest['library_name'],
-            'library_type': latest['library_type'],
-            'version_count': len(data['versions']),
-            'versions': data['versions']  # Include all versions for expansion
+    def records(batch):
+        for row in batch:
+            yield row[:13] + (row[13], users.name(row[13]), row[14], users.name(row[14]))
+    
+    def generate():
+        out = io.StringIO()
+        writer = csv.writer(out)
+        if export_format == 'csv':
+            writer.writerow(EXPORT_COLUMNS)
+        while True:
+            batch = rows.fetchmany(EXPORT_BATCH)
+            if not batch:
+                break
+            if export_format == 'csv':
+                writer.writerows(records(batch))
+            else:
+                out.writelines(json.dumps(dict(zip(EXPORT_COLUMNS, record))) + '\n' for record in records(batch))
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+        if out.tell():
+            yield out.getvalue()
+    
+    headers = {'X-Export-Cursor': str(cursor_value or 0), 'Cache-Control': 'no-store'}
+    if export_format == 'csv':
+        headers['Content-Disposition'] = 'attachment; filename="cc_elements.csv"'
+    response = Response(generate(), mimetype='text/csv' if export_format == 'csv' else 'application/x-ndjson',
+                        headers=headers)
+    # Also runs when the client disconnects mid-stream
+    response.call_on_close(conn.close)
+    return response
+
+@app.route('/api/similar/<element_id>')
+@cached(geometry=True)
+def similar(element_id):
+    """Measured parts shaped most like the element's part, nearest first.
+    
+    Each neighbour lists its newest element, when one is in the libraries, so the same part
+    drawn under another number in another library shows up.
+    """
+    try:
+        k = min(max(int(request.args.get('k', SIMILAR_K)), 1), MAX_SIMILAR_K)
+    except ValueError:
+        return jsonify({'error': 'Invalid k'}), 400
+    
+    if not DB_PATH.exists():
+        return jsonify({'error': 'Database not found'}), 404
+    
+    conn = connection()
+    cursor = conn.cursor()
+    row = cursor.execute('SELECT part_key FROM elements WHERE element_id = ?', (element_id,)).fetchone()
+    if not row:
+        return jsonify({'error': 'Element not found'}), 404
+    part_key = row[0]
+    
+    shapes.refresh()
+    vector = shapes.vector(part_key)
+    if vector is None:
+        return jsonify({'error': f'Part {part_key} has not been measured'}), 404
+    
+    neighbours = []
+    for key, distance in shapes.nearest(vector, k, exclude=(part_key,)):
+        geometry = cursor.execute('''
+            SELECT dxf_name, width, height, area, perimeter, hole_count
+            FROM part_geometry WHERE part_key = ?
+        ''', (key,)).fetchone()
+        element = cursor.execute('''
+            SELECT e.element_id, e.element_name, e.component_path, l.library_name, l.library_type
+            FROM elements e
+            JOIN libraries l ON e.library_id = l.library_id
+            WHERE e.part_key = ?
+            ORDER BY e.modified_at DESC
+            LIMIT 1
+        ''', (key,)).fetchone()
+        neighbours.append({
+            'part_key': key,
+            'distance': round(distance, 4),
+            'dxf_name': geometry[0] if geometry else None,
+            'geometry': geometry_dict(geometry[1:]) if geometry else None,
+            'element': dict(zip(('element_id', 'element_name', 'component_path', 'library_name',
+                                 'library_type'), element)) if element else None
         })
     
-    # Sort by most recent modification
-    formatted_results.sort(key=lambda x: x['versions'][0]['modified_at'], reverse=True)
+    return jsonify({'element_id': element_id, 'part_key': part_key, 'similar': neighbours,
+                    'count': len(neighbours), 'generation': shapes.generation})
+
+@app.route('/api/duplicates')
+@cached
+def duplicates():
+    """Components stored more than once, grouped by content hash, most wasted bytes first.
+    
+    across=1 keeps only copies spread over more than one library.
+    """
+    try:
+        limit = min(max(int(request.args.get('limit', DUPLICATES_LIMIT)), 1), MAX_DUPLICATES_LIMIT)
+        offset = max(int(request.args.get('offset', 0)), 0)
+    except ValueError:
+        return jsonify({'error': 'Invalid limit or offset'}), 400
+    across = request.args.get('across', '').lower() in ('1', 'true', 'yes')
     
-    # Limit to top 50 groups
-    formatted_results = formatted_results[:50]
+    if not DB_PATH.exists():
+        return jsonify({'error': 'Database not found'}), 404
     
-    return jsonify({'results': formatted_results, 'count': len(formatted_results)})
+    conn = connection()
+    groups, copies, wasted = duplicate_totals(conn, across)
+    return jsonify({
+        'groups': groups,
+        'copies': copies,
+        'wasted_bytes': wasted,
+        'duplicates': duplicate_groups(conn, across, limit, offset),
+        'limit': limit,
+        'offset': offset
+    })
+
+@app.route('/api/versions/<path:element_name>')
+@cached
+def get_versions(element_name):
+    """Every version of one element name, newest first."""
+    try:
+        limit = min(max(int(request.args.get('limit', MAX_VERSIONS)), 1), MAX_VERSIONS)
+    except ValueError:
+        return jsonify({'error': 'Invalid limit'}), 400
+    
+    if not DB_PATH.exists():
+        return jsonify({'error': 'Database not found'}), 404
+    
+    conn = connection()
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT e.element_id, e.element_name, e.file_name, e.file_type, e.file_size,
+               e.modified_at, e.modified_by_user, e.component_path, e.created_at,
+               l.library_name, l.library_type
+        FROM elements e
+        JOIN libraries l ON e.library_id = l.library_id
+        WHERE e.element_name = ?
+        ORDER BY e.modified_at DESC
+        LIMIT ?
+    ''', (element_name, limit))
+    rows = cursor.fetchall()
+    
+    versions = [{
+        'element_id': row[0],
+        'element_name': row[1],
+        'file_name': row[2],
+        'file_type': row[3],
+        'file_size': row[4],
+        'modified_at': row[5],
+        'modified_at_formatted': timestamp_to_date(row[5]),
+        'modified_by': get_user_name(row[6]),
+        'component_path': row[7],
+        'created_at': row[8],
+        'library_name': row[9],
+        'library_type': row[10]
+    } for row in rows]
+    
+    return jsonify({'element_name': element_name, 'versions': versions, 'count': len(versions)})
 
 @app.route('/api/details/<element_id>')
+@cached
 def get_details(element_id):
     """Get detailed information about an element."""
     if not DB_PATH.exists():
         return "Database not found", 404
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = connection()
     cursor = conn.cursor()
     
     cursor.execute('''
@@ -809,7 +1368,6 @@ def get_details(element_id):
     result = cursor.fetchone()
     
     if not result:
-        conn.close()
         return "Element not found", 404
     
     columns = [desc[0] for desc in cursor.description]
@@ -825,7 +1383,6 @@ def get_details(element_id):
     versions = cursor.fetchall()
     version_cols = [desc[0] for desc in cursor.description]
     
-    conn.close()
     
     # Build HTML response
     html = f'''
@@ -887,16 +1444,48 @@ def get_details(element_id):
     
     return html
 
+def option(name, default, convert=str):
+    """Value following --name on the command line, or default."""
+    flag = f"--{name}"
+    if flag in sys.argv:
+        return convert(sys.argv[sys.argv.index(flag) + 1])
+    return default
+
+def prepare_database(db_path):
+    """Point the server at db_path, first adding tables and triggers an older index lacks."""
+    global DB_PATH, readers, responses, suggestions, shapes
+    from build_library_index_enhanced import create_database
+    DB_PATH = Path(db_path)
+    if DB_PATH.exists():
+        create_database(DB_PATH).close()
+    readers = ReaderPool(DB_PATH)
+    responses = ResponseCache(DB_PATH, option('cache-mb', MAX_BYTES // 2**20, int) * 2**20)
+    suggestions = SuggestIndex(DB_PATH)
+    shapes = ShapeIndex(DB_PATH)
+    if DB_PATH.exists():
+        suggestions.refresh()
+
 if __name__ == '__main__':
+    prepare_database(option('db', DB_PATH))
+    
+    if '--serve' in sys.argv:
+        # Production: pooled worker threads, no reloader or debugger
+        from wsgi_server import serve
+        app.config['REQUEST_TIMEOUT'] = option('timeout', REQUEST_TIMEOUT, float)
+        serve(app, host=option('host', '127.0.0.1'), port=option('port', 5001, int),
+              workers=option('workers', SERVE_WORKERS, int), client_timeout=CLIENT_TIMEOUT,
+              on_stop=readers.close)
+        sys.exit(0)
+    
     print("=" * 60)
     print("🎨 Creative Cloud Library Search Server")
     print("=" * 60)
     print()
     print("Starting server...")
     print("Open your browser to: http://localhost:5001")
+    print("(use --serve for the production server)")
     print()
     print("Press Ctrl+C to stop")
     print("=" * 60)
     
     app.run(debug=True, port=5001)
-
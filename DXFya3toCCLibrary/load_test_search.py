@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Load test for the library search server.
+Fires concurrent /api/search requests built from element names in the index and reports
+requests per second and latency percentiles. With --start it launches
+`library_search_server.py --serve` against the bundled database, waits for /health,
+runs the test and stops the server with SIGTERM.
+"""
+
+import json
+import random
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+# Database the queries are drawn from
+DB_PATH = Path(__file__).parent / "cc_libraries_enhanced.db"
+
+DEFAULT_SETTINGS = {
+    'url': 'http://127.0.0.1:5001',
+    'concurrency': 16,
+    'requests': 2000,
+    'workers': 8,
+    'seed': 1
+}
+
+def sample_queries(db_path, count=200, seed=1):
+    """Search terms like users type: whole names, part numbers and short fragments."""
+    rnd = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    names = [row[0] for row in conn.execute('SELECT DISTINCT element_name FROM elements')]
+    conn.close()
+    queries = []
+    for name in rnd.sample(names, min(count, len(names))):
+        kind = rnd.random()
+        if kind < 0.4 or len(name) < 5:
+            queries.append(name)
+        elif kind < 0.8:
+            start = rnd.randrange(len(name) - 3)
+            queries.append(name[start:start + rnd.randint(3, 6)])
+        else:
+            queries.append(name[:2])
+    return queries
+
+def wait_for_health(url, timeout=15.0):
+    """Poll /health until the server answers; returns True when it is ready."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{url}/health", timeout=2) as response:
+                if json.load(response).get('status') == 'ok':
+                    return True
+        except (OSError, ValueError):
+            pass
+        time.sleep(0.2)
+    return False
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def run_load(url, queries, concurrency, total, seed=1):
+    """Send total requests from concurrency threads; returns (latencies, errors, cache hits, elapsed)."""
+    latencies = []
+    errors = {}
+    hits = []
+    lock = threading.Lock()
+    counter = iter(range(total))
+
+    def worker(worker_seed):
+        rnd = random.Random(worker_seed)
+        while True:
+            with lock:
+                if next(counter, None) is None:
+                    return
+            query = urllib.parse.quote(rnd.choice(queries))
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(f"{url}/api/search?q={query}", timeout=30) as response:
+                    response.read()
+                    hit = response.headers.get('X-Cache') == 'HIT'
+                outcome = None
+            except urllib.error.HTTPError as e:
+                outcome = f"HTTP {e.code}"
+            except OSError as e:
+                outcome = type(e).__name__
+            elapsed = time.perf_counter() - started
+            with lock:
+                if outcome:
+                    errors[outcome] = errors.get(outcome, 0) + 1
+                else:
+                    latencies.append(elapsed)
+                    if hit:
+                        hits.append(elapsed)
+
+    threads = [threading.Thread(target=worker, args=(seed + i,)) for i in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(latencies), errors, len(hits), time.perf_counter() - started
+
+def report(latencies, errors, hits, elapsed, concurrency):
+    print()
+    print("=" * 60)
+    print(f"📈 {len(latencies):,} requests in {elapsed:.2f}s with {concurrency} clients")
+    if latencies:
+        print(f"   Throughput: {len(latencies) / elapsed:,.0f} requests/s")
+        print(f"   Latency:    p50 {percentile(latencies, 0.50) * 1000:.1f}ms"
+              f"  p90 {percentile(latencies, 0.90) * 1000:.1f}ms"
+              f"  p99 {percentile(latencies, 0.99) * 1000:.1f}ms"
+              f"  max {latencies[-1] * 1000:.1f}ms")
+        print(f"   Cache hits: {hits / len(latencies):.0%}")
+    if errors:
+        print(f"   ❌ Errors: {', '.join(f'{kind} × {n}' for kind, n in sorted(errors.items()))}")
+    print("=" * 60)
+
+def main():
+    """Command-line interface."""
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print("Usage:")
+        print("  python3 load_test_search.py [--url URL] [--concurrency N] [--requests N] [--db PATH]")
+        print("  python3 load_test_search.py --start [--workers N] ...   # Start the server with --serve first")
+        return
+
+    settings = dict(DEFAULT_SETTINGS)
+    for name in ('url', 'concurrency', 'requests', 'workers', 'seed'):
+        flag = f"--{name}"
+        if flag in args:
+            value = args[args.index(flag) + 1]
+            settings[name] = value if name == 'url' else int(value)
+    db_path = Path(args[args.index('--db') + 1]) if '--db' in args else DB_PATH
+
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        sys.exit(1)
+    queries = sample_queries(db_path, seed=settings['seed'])
+    print(f"🔎 {len(queries)} sample queries from {db_path.name}")
+
+    server = None
+    if '--start' in args:
+        port = urllib.parse.urlparse(settings['url']).port or 5001
+        server = subprocess.Popen([sys.executable, str(Path(__file__).parent / "library_search_server.py"),
+                                   '--serve', '--port', str(port), '--workers', str(settings['workers']),
+                                   '--db', str(db_path)])
+    try:
+        if not wait_for_health(settings['url']):
+            print(f"❌ No healthy server at {settings['url']} (start it with --serve, or pass --start)")
+            sys.exit(1)
+        latencies, errors, hits, elapsed = run_load(settings['url'], queries, settings['concurrency'],
+                                                    settings['requests'], settings['seed'])
+        report(latencies, errors, hits, elapsed, settings['concurrency'])
+    finally:
+        if server:
+            server.terminate()
+            server.wait(timeout=30)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Manifest change detection shared by the library indexers.
+Each library's manifest mtime, size and SHA-256 are kept in the libraries table so an
+update only re-reads libraries whose manifest changed and diffs out removed elements.
+"""
+
+import hashlib
+import json
+
+# orjson decodes large manifests faster when installed; the stdlib decoder is the fallback
+try:
+    import orjson
+    _loads = orjson.loads
+    _DECODE_ERRORS = (orjson.JSONDecodeError, UnicodeDecodeError)
+except ImportError:
+    _loads = json.loads
+    _DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+
+# Columns added to the libraries table by both indexers
+MANIFEST_COLUMNS = [
+    ('manifest_mtime', 'INTEGER'),
+    ('manifest_size', 'INTEGER'),
+    ('manifest_sha256', 'TEXT')
+]
+
+def add_manifest_columns(cursor):
+    """Add the manifest signature columns to an existing libraries table."""
+    existing = {row[1] for row in cursor.execute('PRAGMA table_info(libraries)')}
+    for name, column_type in MANIFEST_COLUMNS:
+        if name not in existing:
+            cursor.execute(f'ALTER TABLE libraries ADD COLUMN {name} {column_type}')
+
+def library_dirs(base_path):
+    """Yield (library_dir, library_type) for private and shared libraries."""
+    for sub_path, library_type in (("creative_cloud/dcx", 'private'), ("collaborated/dcx", 'shared')):
+        root = base_path / sub_path
+        if not root.exists():
+            continue
+        for library_dir in sorted(root.iterdir()):
+            if library_dir.is_dir():
+                yield library_dir, library_type
+
+def stored_signatures(conn):
+    """Return {library_path: (library_id, mtime, size, sha256)} from the index."""
+    cursor = conn.execute('''
+        SELECT library_path, library_id, manifest_mtime, manifest_size, manifest_sha256
+        FROM libraries
+    ''')
+    return {row[0]: row[1:] for row in cursor}
+
+def manifest_stat(manifest_file):
+    """Return (mtime_ns, size) of a manifest, or None when it is missing."""
+    try:
+        st = manifest_file.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def read_manifest(manifest_file):
+    """Read a manifest once; returns (data, sha256), with data None when it is not valid JSON."""
+    with open(manifest_file, 'rb') as f:
+        raw = f.read()
+    sha256 = hashlib.sha256(raw).hexdigest()
+    try:
+        return _loads(raw), sha256
+    except _DECODE_ERRORS:
+        return None, sha256
+
+def prune_elements(cursor, library_id, keep_ids, child_tables=()):
+    """Delete a library's elements that are no longer in its manifest; returns how many."""
+    cursor.execute('SELECT element_id FROM elements WHERE library_id = ?', (library_id,))
+    gone = [(row[0],) for row in cursor.fetchall() if row[0] not in keep_ids]
+    for table in child_tables:
+        cursor.executemany(f'DELETE FROM {table} WHERE element_id = ?', gone)
+    cursor.executemany('DELETE FROM elements WHERE element_id = ?', gone)
+    return len(gone)
+
+def remove_library(cursor, library_id, child_tables=()):
+    """Delete a library that disappeared from disk, with its elements."""
+    prune_elements(cursor, library_id, set(), child_tables)
+    cursor.execute('DELETE FROM libraries WHERE library_id = ?', (library_id,))
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Part geometry in the enhanced index.
+The converter's preflight stats (dxf_stats.py) are kept in part_geometry, one row per part
+key, and mirrored by triggers into the part_extents R-tree over width, height and area, so
+size ranges ("wider than 40 inches") are answered without scanning every part. Lengths are
+in inches and areas in square inches.
+"""
+
+import json
+import math
+import os
+import sqlite3
+import sys
+import time
+from array import array
+from pathlib import Path
+
+from index_generation import connect_read_only, publish_geometry
+from part_keys import normalize_part_key
+
+# Database path
+DB_PATH = Path(__file__).parent / "cc_libraries_enhanced.db"
+
+# Range parameters accepted by /api/search: name → (column, comparison)
+RANGE_FILTERS = {
+    'min_w': ('width', '>='),
+    'max_w': ('width', '<='),
+    'min_h': ('height', '>='),
+    'max_h': ('height', '<='),
+    'min_area': ('area', '>='),
+    'max_area': ('area', '<=')
+}
+
+# R-tree bounds holding each column; parts are stored as points (min = max). The R-tree
+# keeps 32-bit floats rounded outwards, so its answer is narrowed on the exact columns.
+_RTREE_BOUNDS = {
+    ('width', '>='): 'x.max_w', ('width', '<='): 'x.min_w',
+    ('height', '>='): 'x.max_h', ('height', '<='): 'x.min_h',
+    ('area', '>='): 'x.max_area', ('area', '<='): 'x.min_area'
+}
+
+GEOMETRY_COLUMNS = [
+    'part_key', 'dxf_name', 'width', 'height', 'min_x', 'min_y', 'max_x', 'max_y',
+    'area', 'perimeter', 'cut_length', 'entity_count', 'entity_counts', 'node_count',
+    'contour_count', 'open_count', 'hole_count', 'units', 'measured_at', 'shape'
+]
+
+GEOMETRY_INSERT = f'''
+    INSERT INTO part_geometry ({', '.join(GEOMETRY_COLUMNS)})
+    VALUES ({', '.join('?' for _ in GEOMETRY_COLUMNS)})
+    ON CONFLICT(part_key) DO UPDATE SET
+    {', '.join(f"{c} = excluded.{c}" for c in GEOMETRY_COLUMNS[1:])}
+'''
+
+def create_part_geometry(cursor):
+    """Create part_geometry, the part_extents R-tree and the triggers joining them."""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS part_geometry (
+            id INTEGER PRIMARY KEY,
+            part_key TEXT NOT NULL UNIQUE,
+            dxf_name TEXT NOT NULL,
+            width REAL NOT NULL,
+            height REAL NOT NULL,
+            min_x REAL,
+            min_y REAL,
+            max_x REAL,
+            max_y REAL,
+            area REAL NOT NULL,
+            perimeter REAL,
+            cut_length REAL,
+            entity_count INTEGER,
+            entity_counts TEXT,
+            node_count INTEGER,
+            contour_count INTEGER,
+            open_count INTEGER,
+            hole_count INTEGER,
+            units INTEGER,
+            measured_at INTEGER NOT NULL,
+            -- Shape descriptor as float32 (dxf_shape.py, shape_index.py)
+            shape BLOB
+        )
+    ''')
+    if 'shape' not in {row[1] for row in cursor.execute('PRAGMA table_info(part_geometry)')}:
+        cursor.execute('ALTER TABLE part_geometry ADD COLUMN shape BLOB')
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS part_extents
+        USING rtree(id, min_w, max_w, min_h, max_h, min_area, max_area)
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS part_extents_insert AFTER INSERT ON part_geometry BEGIN
+            INSERT INTO part_extents VALUES (new.id, new.width, new.width, new.height, new.height,
+                                             new.area, new.area);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS part_extents_update AFTER UPDATE ON part_geometry BEGIN
+            DELETE FROM part_extents WHERE id = old.id;
+            INSERT INTO part_extents VALUES (new.id, new.width, new.width, new.height, new.height,
+                                             new.area, new.area);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS part_extents_delete AFTER DELETE ON part_geometry BEGIN
+            DELETE FROM part_extents WHERE id = old.id;
+        END
+    ''')
+
+def copy_part_geometry(conn, source_path):
+    """Carry the measured parts of source_path into conn's database (full rebuilds).
+
+    Geometry comes from the converter, not the manifests, so a rebuilt index starts empty.
+    Returns the number of parts copied.
+    """
+    if not Path(source_path).exists():
+        return 0
+    conn.execute('ATTACH DATABASE ? AS live', (str(source_path),))
+    try:
+        if not conn.execute("SELECT 1 FROM live.sqlite_master WHERE name = 'part_geometry'").fetchone():
+            return 0
+        with conn:
+            conn.execute(f'''
+                INSERT OR REPLACE INTO part_geometry (id, {', '.join(GEOMETRY_COLUMNS)})
+                SELECT id, {', '.join(GEOMETRY_COLUMNS)} FROM live.part_geometry
+            ''')
+        return conn.execute('SELECT COUNT(*) FROM part_geometry').fetchone()[0]
+    finally:
+        conn.execute('DETACH DATABASE live')
+
+def open_retiring(db_path):
+    """Open the live file before a swap so it can still be read once the swap retires it.
+
+    The first full rebuild replaces a plain file, which unlinks it together with its
+    write-ahead log; a connection that has already read from it keeps both open.
+    Returns None when there is no live file.
+    """
+    if not Path(db_path).exists():
+        return None
+    conn = sqlite3.connect(db_path)
+    conn.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()
+    return conn
+
+def copy_late_geometry(old_conn, db_path, since):
+    """Upsert the parts measured in old_conn's file since `since` (milliseconds) into db_path.
+
+    The catch-up after a swap, for parts recorded in the old file while the rebuild was
+    finished; old_conn comes from open_retiring(). Returns the number of parts copied.
+    """
+    if not old_conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'part_geometry'").fetchone():
+        return 0
+    old_conn.execute('ATTACH DATABASE ? AS live', (str(db_path),))
+    try:
+        with old_conn:
+            old_conn.execute(f'''
+                INSERT INTO live.part_geometry ({', '.join(GEOMETRY_COLUMNS)})
+                SELECT {', '.join(GEOMETRY_COLUMNS)} FROM main.part_geometry WHERE measured_at >= ?
+                ON CONFLICT(part_key) DO UPDATE SET
+                {', '.join(f"{c} = excluded.{c}" for c in GEOMETRY_COLUMNS[1:])}
+            ''', (since,))
+        return old_conn.execute('SELECT COUNT(*) FROM main.part_geometry WHERE measured_at >= ?',
+                                (since,)).fetchone()[0]
+    finally:
+        old_conn.execute('DETACH DATABASE live')
+
+def _upsert_geometry(db_path, row):
+    """Write one part_geometry row into the existing index; False when it has no such table."""
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=rw", uri=True)
+    conn.execute('PRAGMA busy_timeout = 10000')
+    try:
+        if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'part_geometry'").fetchone():
+            return False
+        with conn:
+            conn.execute(GEOMETRY_INSERT, row)
+        return True
+    finally:
+        conn.close()
+
+def record_part_geometry(stats, dxf_name, db_path=None):
+    """Store dxf_stats.part_stats() output under the part key of dxf_name; returns the key.
+
+    Only upserts into an existing index (the indexers own its schema); raises
+    FileNotFoundError when there is no index with a part_geometry table. When a full rebuild
+    swapped in a new file during the write, the row is written again to the new file. The
+    geometry number is bumped so servers drop cached size searches and shapes.
+    """
+    db_path = db_path or DB_PATH
+    key = normalize_part_key(dxf_name)
+    min_x, min_y, max_x, max_y = stats['extents']
+    row = (key, dxf_name, stats['width'], stats['height'], min_x, min_y, max_x, max_y,
+           stats['area'], stats['perimeter'], stats['cut_length'], stats['entities'],
+           json.dumps(stats['entity_counts'], sort_keys=True), stats['nodes'],
+           stats['contours'], stats['open_contours'], stats['holes'], stats['units'],
+           int(time.time() * 1000), array('f', stats['shape']).tobytes() if stats.get('shape') else None)
+
+    missing = FileNotFoundError(f"No CC Library index with part_geometry at {db_path} (run cclib update)")
+    if not Path(db_path).exists():
+        raise missing
+    written = None
+    while written != os.path.realpath(db_path):
+        written = os.path.realpath(db_path)
+        if not _upsert_geometry(written, row):
+            raise missing
+    publish_geometry(db_path)
+    return key
+
+def parse_ranges(args):
+    """{parameter: value} of the range filters present in a mapping of request arguments.
+
+    Raises ValueError for a value that is not a finite number.
+    """
+    ranges = {}
+    for name in RANGE_FILTERS:
+        value = args.get(name)
+        if value in (None, ''):
+            continue
+        number = float(value)
+        if not math.isfinite(number):
+            raise ValueError(f"Invalid {name}: {value}")
+        ranges[name] = number
+    return ranges
+
+def geometry_match(ranges):
+    """(SQL, params) selecting the part keys whose geometry lies within ranges.
+
+    The R-tree picks the candidates; the same bounds on part_geometry drop the few that
+    only matched through float32 rounding.
+    """
+    conditions = []
+    params = []
+    for name, value in ranges.items():
+        column, op = RANGE_FILTERS[name]
+        conditions.append(f'{_RTREE_BOUNDS[column, op]} {op} ?')
+        params.append(value)
+    for name, value in ranges.items():
+        column, op = RANGE_FILTERS[name]
+        conditions.append(f'g.{column} {op} ?')
+        params.append(value)
+    sql = f'''
+        SELECT g.part_key FROM part_extents x
+        JOIN part_geometry g ON g.id = x.id
+        WHERE {' AND '.join(conditions) or 1}
+    '''
+    return sql, params
+
+def geometry_dict(row):
+    """API form of (width, height, area, perimeter, hole_count), or None for an unmeasured part."""
+    if row[0] is None:
+        return None
+    width, height, area, perimeter, holes = row
+    return {'width': round(width, 3), 'height': round(height, 3), 'area': round(area, 3),
+            'perimeter': round(perimeter or 0, 3), 'holes': holes}
+
+def find_parts(conn, ranges, limit=50):
+    """Measured parts within ranges, largest area first."""
+    sql, params = geometry_match(ranges)
+    rows = conn.execute(f'''
+        SELECT part_key, dxf_name, width, height, area, perimeter, hole_count
+        FROM part_geometry WHERE part_key IN ({sql})
+        ORDER BY area DESC LIMIT ?
+    ''', params + [limit]).fetchall()
+    return rows
+
+def main():
+    """Command-line interface."""
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print("Usage:")
+        print("  python3 part_geometry.py [--min_w N] [--max_w N] [--min_h N] [--max_h N]")
+        print("                           [--min_area N] [--max_area N] [--limit N] [--db PATH]")
+        print()
+        print("Lists measured parts within the ranges (inches, square inches).")
+        print("Parts are measured and recorded by the converter, or by `python3 dxf_stats.py <file.dxf>... --record`.")
+        return
+    db_path = Path(args[args.index('--db') + 1]) if '--db' in args else DB_PATH
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        sys.exit(1)
+
+    options = {args[i][2:]: args[i + 1] for i in range(len(args) - 1) if args[i].startswith('--')}
+    try:
+        ranges = parse_ranges(options)
+        limit = int(options.get('limit', 50))
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    conn = connect_read_only(db_path)
+    try:
+        total = conn.execute('SELECT COUNT(*) FROM part_geometry').fetchone()[0]
+        started = time.perf_counter()
+        rows = find_parts(conn, ranges, limit)
+        elapsed = time.perf_counter() - started
+    except sqlite3.OperationalError:
+        print("ℹ️  No parts measured yet (run the converter, or dxf_stats.py --record)")
+        return
+    finally:
+        conn.close()
+    print(f"📏 {len(rows)} of {total:,} measured parts in {elapsed * 1000:.1f}ms")
+    for part_key, dxf_name, width, height, area, perimeter, holes in rows:
+        print(f"  {part_key:<16} {width:8.2f} x {height:<8.2f} in  {area:10.2f} sq in  "
+              f"{holes:3} holes  {dxf_name}")
+
+if __name__ == '__main__':
+    main()
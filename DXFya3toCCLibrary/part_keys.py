@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Normalized part keys for matching DXF file names to CC Library elements.
+"RT004127_cut", "Flat-Pattern1 - RT004127 copy" and "rt004127-bkdxfya (2)" all map to
+RT004127; names without a part number fall back to the lowercased name without
+extension or copy markers. The indexers store the key in an indexed elements column.
+"""
+
+import re
+import sys
+
+# Our part numbers: RT plus exactly six digits, anywhere in the name
+PART_NUMBER = re.compile(r'(?<!\d)RT\d{6}(?!\d)', re.IGNORECASE)
+
+# Re-export and duplicate markers ("copy", "copy 2", "(1)"); the converter's job journal
+# groups revisions of a part with the same pattern
+COPY_MARKERS = re.compile(r'(\s+copy(\s+\d+)?|\s*\(\d+\))+$', re.IGNORECASE)
+
+# File extensions that may be left on a name
+EXTENSIONS = re.compile(r'\.(ai|dxf|pdf|svg)$', re.IGNORECASE)
+
+def normalize_part_key(name):
+    """Return the part key for an element or file name (None for an empty name)."""
+    if not name:
+        return None
+    match = PART_NUMBER.search(name)
+    if match:
+        return match.group(0).upper()
+    stem = EXTENSIONS.sub('', name.strip())
+    return COPY_MARKERS.sub('', stem).strip().lower() or None
+
+def add_part_key_column(cursor):
+    """Add and backfill elements.part_key on a database indexed before it existed."""
+    existing = {row[1] for row in cursor.execute('PRAGMA table_info(elements)')}
+    if 'part_key' in existing:
+        return
+    cursor.execute('ALTER TABLE elements ADD COLUMN part_key TEXT')
+    cursor.connection.create_function('normalize_part_key', 1, normalize_part_key, deterministic=True)
+    cursor.execute('UPDATE elements SET part_key = normalize_part_key(element_name)')
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  python3 part_keys.py <name>...   # Show the part key of each name")
+        return
+    for name in sys.argv[1:]:
+        print(f"{name}  →  {normalize_part_key(name)}")
+
+if __name__ == '__main__':
+    main()
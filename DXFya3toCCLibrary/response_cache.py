@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Response cache for the library search server.
+Encoded responses are kept in an LRU bounded by total bytes and keyed by the request; the
+whole cache is dropped as soon as the indexer publishes a new generation, and responses that
+show part geometry as soon as the converter records a part. Each entry carries a strong ETag
+(for If-None-Match → 304) and, when large enough, a gzip copy made once.
+"""
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from index_generation import generation_path, geometry_path, read_generation, read_geometry
+
+# Total size of cached bodies (plain and gzip)
+MAX_BYTES = 64 * 1024 * 1024
+
+# Bodies smaller than this are sent uncompressed
+GZIP_MIN_BYTES = 1024
+
+# Rough per-entry cost of the key and bookkeeping
+ENTRY_OVERHEAD = 256
+
+class CachedResponse:
+    """An encoded 200 response: body, optional gzip body and their ETags."""
+    __slots__ = ('body', 'gzipped', 'mimetype', 'etag', 'gzip_etag', 'size')
+
+    def __init__(self, body, mimetype):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        self.gzipped = None
+        self.gzip_etag = None
+        if len(body) >= GZIP_MIN_BYTES:
+            gzipped = gzip.compress(body, compresslevel=6, mtime=0)
+            if len(gzipped) < len(body):
+                self.gzipped = gzipped
+                # Strong ETags identify one representation, so the gzip body gets its own
+                self.gzip_etag = self.etag[:-1] + '-gzip"'
+        self.size = len(body) + len(self.gzipped or b'') + ENTRY_OVERHEAD
+
+def accepts_gzip(accept_encoding):
+    """True when an Accept-Encoding header allows gzip."""
+    for part in (accept_encoding or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        if coding.strip().lower() in ('gzip', '*'):
+            q = params.strip()
+            return not (q.startswith('q=') and q[2:].strip('0.') == '')
+    return False
+
+def etag_matches(if_none_match, etag):
+    """True when an If-None-Match header names etag (weak comparison, as RFC 9110 asks)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    tags = (tag.strip() for tag in if_none_match.split(','))
+    return etag in (tag[2:] if tag.startswith('W/') else tag for tag in tags)
+
+class ResponseCache:
+    """Thread-safe LRU of CachedResponse entries for the current index generation."""
+
+    def __init__(self, db_path, max_bytes=MAX_BYTES):
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.generation = None
+        self.geometry = None
+        # Keys of entries that show part geometry
+        self.geometry_keys = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def _sidecar_stamp(self):
+        stamp = []
+        for path in (generation_path(self.db_path), geometry_path(self.db_path)):
+            try:
+                st = path.stat()
+            except OSError:
+                stamp.append(None)
+                continue
+            stamp.append((st.st_mtime_ns, st.st_size))
+        return tuple(stamp)
+
+    def _drop(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+        self.geometry_keys.discard(key)
+
+    def _sync(self):
+        """Current (generation, geometry) numbers, dropping what they outdate; call with _lock held.
+
+        A new generation empties the cache, a new geometry number the entries in geometry_keys.
+        The sidecars are re-read only when their stat changes. The stamp is taken before the
+        numbers are read and all are stored together, so a stamp is never paired with older
+        numbers.
+        """
+        stamp = self._sidecar_stamp()
+        if stamp != self._stamp or self.generation is None:
+            generation = read_generation(self.db_path).get('generation', 0)
+            geometry = read_geometry(self.db_path).get('geometry', 0)
+            if generation != self.generation:
+                self.entries.clear()
+                self.geometry_keys.clear()
+                self.size = 0
+            elif geometry != self.geometry:
+                for key in list(self.geometry_keys):
+                    self._drop(key)
+            self.generation = generation
+            self.geometry = geometry
+            self._stamp = stamp
+        return self.generation, self.geometry
+
+    def sync(self):
+        """Current (generation, geometry) numbers, for put() with the response computed after."""
+        with self._lock:
+            return self._sync()
+
+    def get(self, key):
+        """Cached entry for key, or None; a new index generation empties the cache first."""
+        with self._lock:
+            self._sync()
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry, version, geometry=False):
+        """Store entry, evicting least recently used entries beyond max_bytes.
+
+        version is sync() from before the response was computed; the entry is dropped when
+        either number has moved on since. geometry marks a response that shows part geometry.
+        """
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if self._sync() != version:
+                return
+            self._drop(key)
+            self.entries[key] = entry
+            self.size += entry.size
+            if geometry:
+                self.geometry_keys.add(key)
+            while self.size > self.max_bytes:
+                self._drop(next(iter(self.entries)))
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.geometry_keys.clear()
+            self.size = 0
+
+    def stats(self):
+        """Counters for /health."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self.entries),
+                'bytes': self.size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else None
+            }
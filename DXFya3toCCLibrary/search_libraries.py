@@ -3,20 +3,25 @@
 Search Creative Cloud Libraries using the indexed database.
 """
 
-import sqlite3
 import sys
 import json
 from pathlib import Path
 
+from index_generation import IndexReader
+from part_keys import normalize_part_key
+
 DB_PATH = Path(__file__).parent / "cc_libraries.db"
 
+# Reused across calls; reopened when the indexer swaps in a new generation
+_reader = IndexReader(DB_PATH)
+
 def search_elements(query, library_name=None, limit=50):
     """Search for elements by name or file name."""
     if not DB_PATH.exists():
         print("❌ Database not found. Run build_library_index.py first.")
         return []
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = _reader.connection()
     cursor = conn.cursor()
     
     if library_name:
@@ -37,7 +42,7 @@ def search_elements(query, library_name=None, limit=50):
             SELECT e.element_id, e.element_name, e.file_name, e.file_type,
                    e.component_path, l.library_name, l.library_type
             FROM elements_fts fts
-            JOIN elements e ON fts.element_id = e.element_id
+            JOIN elements e ON e.rowid = fts.rowid
             JOIN libraries l ON e.library_id = l.library_id
             WHERE elements_fts MATCH ?
             ORDER BY rank
@@ -45,7 +50,6 @@ def search_elements(query, library_name=None, limit=50):
         ''', (query, limit))
     
     results = cursor.fetchall()
-    conn.close()
     
     return results
 
@@ -55,7 +59,7 @@ def get_element_by_name(element_name, library_name=None):
         print("❌ Database not found. Run build_library_index.py first.")
         return None
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = _reader.connection()
     cursor = conn.cursor()
     
     if library_name:
@@ -79,7 +83,6 @@ def get_element_by_name(element_name, library_name=None):
         ''', (element_name,))
     
     result = cursor.fetchone()
-    conn.close()
     
     if result:
         return {
@@ -96,13 +99,56 @@ def get_element_by_name(element_name, library_name=None):
         }
     return None
 
+def get_element_by_part_key(name, library_name=None):
+    """Match a file name to an element through its normalized part key.
+    
+    "RT004127_cut copy" finds the element named "RT004127_cut" or "RT004127-bkdxfya".
+    An element with exactly this name wins, then the most recently modified, then the
+    library name.
+    """
+    part_key = normalize_part_key(name)
+    if not part_key or not DB_PATH.exists():
+        return None
+    
+    conn = _reader.connection()
+    cursor = conn.cursor()
+    
+    cursor.execute('''
+        SELECT e.element_id, e.element_name, e.file_name, e.file_type,
+               e.component_path, e.file_size, l.library_name, l.library_type,
+               l.library_path, e.element_path, e.part_key
+        FROM elements e
+        JOIN libraries l ON e.library_id = l.library_id
+        WHERE e.part_key = ? AND (? IS NULL OR l.library_name = ?)
+        ORDER BY e.element_name = ? DESC, e.modified_at DESC, l.library_name
+        LIMIT 1
+    ''', (part_key, library_name, library_name, name))
+    
+    result = cursor.fetchone()
+    
+    if result:
+        return {
+            'element_id': result[0],
+            'element_name': result[1],
+            'file_name': result[2],
+            'file_type': result[3],
+            'component_path': result[4],
+            'file_size': result[5],
+            'library_name': result[6],
+            'library_type': result[7],
+            'library_path': result[8],
+            'element_path': result[9],
+            'part_key': result[10]
+        }
+    return None
+
 def list_libraries():
     """List all indexed libraries."""
     if not DB_PATH.exists():
         print("❌ Database not found. Run build_library_index.py first.")
         return []
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = _reader.connection()
     cursor = conn.cursor()
     
     cursor.execute('''
@@ -114,7 +160,6 @@ def list_libraries():
     ''')
     
     results = cursor.fetchall()
-    conn.close()
     
     return results
 
@@ -125,7 +170,7 @@ def main():
         print("  python3 search_libraries.py list                    # List all libraries")
         print("  python3 search_libraries.py search <query>          # Search all libraries")
         print("  python3 search_libraries.py search <query> <library> # Search specific library")
-        print("  python3 search_libraries.py get <name> [<library>]  # Get exact match")
+        print("  python3 search_libraries.py get <name> [<library>]  # Get exact match (else by part number)")
         print()
         print("Examples:")
         print("  python3 search_libraries.py search RT007760")
@@ -178,6 +223,10 @@ def main():
         library = sys.argv[3] if len(sys.argv) > 3 else None
         
         result = get_element_by_name(element_name, library)
+        if not result:
+            result = get_element_by_part_key(element_name, library)
+            if result:
+                print(f"🔑 No exact match; matched part number {result['part_key']}")
         
         if not result:
             print(f"❌ Element not found: {element_name}")
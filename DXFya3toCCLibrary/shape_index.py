@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Shape-similarity search over the parts measured by the converter.
+The shape descriptors in part_geometry (dxf_shape.py) are loaded into one float32 matrix
+and a part's nearest neighbours found by Euclidean distance, vectorized with numpy when it
+is installed and a loop over the packed array otherwise. From COARSE_MIN_PARTS parts a
+coarse k-means quantizer limits the scan to the cells nearest the query. The matrix is
+reloaded when the indexer publishes a new generation or the converter records a part.
+"""
+
+import heapq
+import math
+import random
+import sys
+import threading
+import time
+from array import array
+from pathlib import Path
+
+from index_generation import connect_read_only, generation_path, geometry_path, read_generation
+from part_keys import normalize_part_key
+
+# numpy vectorizes the distance computation when installed; the stdlib loop is the fallback
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Database path
+DB_PATH = Path(__file__).parent / "cc_libraries_enhanced.db"
+
+# Floats per descriptor (dxf_shape.DESCRIPTOR_SIZE); rows of another length are skipped
+SHAPE_DIMENSIONS = 25
+
+# Neighbours returned by default, and the most a request may ask for
+DEFAULT_K = 10
+MAX_K = 50
+
+# Parts from which the coarse quantizer is built (numpy only), the cells searched per
+# query and the k-means passes that place the cells
+COARSE_MIN_PARTS = 20000
+COARSE_PROBES = 8
+KMEANS_ITERATIONS = 8
+
+# Rows per block when assigning parts to cells, to bound the distance matrix
+ASSIGN_BLOCK = 8192
+
+def kmeans(matrix, cells, iterations=KMEANS_ITERATIONS, seed=1):
+    """Centroids of cells k-means clusters of the matrix rows, and each row's cell."""
+    rng = numpy.random.default_rng(seed)
+    centroids = matrix[rng.choice(len(matrix), cells, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = nearest_centroids(matrix, centroids)
+        sums = numpy.stack([numpy.bincount(assignment, weights=matrix[:, d], minlength=cells)
+                            for d in range(matrix.shape[1])], axis=1)
+        counts = numpy.bincount(assignment, minlength=cells)
+        filled = counts > 0
+        centroids[filled] = (sums[filled] / counts[filled, None]).astype(numpy.float32)
+    return centroids, nearest_centroids(matrix, centroids)
+
+def nearest_centroids(matrix, centroids):
+    """Index of the nearest centroid of every row, a block of rows at a time."""
+    centroid_norms = (centroids * centroids).sum(axis=1)
+    assignment = numpy.empty(len(matrix), dtype=numpy.int64)
+    for start in range(0, len(matrix), ASSIGN_BLOCK):
+        block = matrix[start:start + ASSIGN_BLOCK]
+        # |x - c|² without the |x|² term, which is the same for every centroid
+        distances = centroid_norms[None, :] - 2 * block @ centroids.T
+        assignment[start:start + len(block)] = distances.argmin(axis=1)
+    return assignment
+
+class ShapeIndex:
+    """float32 descriptor matrix of the measured parts with a k-nearest-neighbour search."""
+
+    def __init__(self, db_path=None):
+        self.db_path = Path(db_path or DB_PATH)
+        self.generation = None
+        self.loaded_in = 0.0
+        # (part keys, {part key: row}, matrix, coarse cells or None), swapped in whole
+        self._data = None
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def _sidecar_stamp(self):
+        stamp = []
+        for path in (generation_path(self.db_path), geometry_path(self.db_path)):
+            try:
+                st = path.stat()
+            except OSError:
+                stamp.append(None)
+                continue
+            stamp.append((st.st_mtime_ns, st.st_size))
+        return tuple(stamp)
+
+    def load(self):
+        """Read the descriptors from the index and rebuild the matrix."""
+        started = time.perf_counter()
+        stamp = self._sidecar_stamp()
+        generation = read_generation(self.db_path).get('generation', 0)
+        conn = connect_read_only(self.db_path)
+        try:
+            rows = conn.execute('''
+                SELECT part_key, shape FROM part_geometry
+                WHERE length(shape) = ?
+                ORDER BY id
+            ''', (SHAPE_DIMENSIONS * 4,)).fetchall()
+        finally:
+            conn.close()
+        self.set_vectors([key for key, _ in rows], b''.join(shape for _, shape in rows))
+        self.generation = generation
+        self._stamp = stamp
+        self.loaded_in = time.perf_counter() - started
+
+    def set_vectors(self, keys, packed):
+        """Replace the index with keys and their descriptors packed as float32 rows."""
+        if numpy is not None:
+            matrix = numpy.frombuffer(packed, dtype=numpy.float32).reshape(len(keys), SHAPE_DIMENSIONS)
+        else:
+            matrix = array('f')
+            matrix.frombytes(packed)
+        coarse = None
+        if numpy is not None and len(keys) >= COARSE_MIN_PARTS:
+            centroids, assignment = kmeans(matrix, math.isqrt(len(keys)))
+            order = numpy.argsort(assignment, kind='stable')
+            bounds = numpy.searchsorted(assignment[order], numpy.arange(len(centroids) + 1))
+            coarse = (centroids, order, bounds)
+        self._data = (keys, {key: row for row, key in enumerate(keys)}, matrix, coarse)
+
+    def refresh(self):
+        """Reload after a new generation or recorded part; requests keep the old matrix meanwhile."""
+        if self._data is not None and self._sidecar_stamp() == self._stamp:
+            return
+        if not self._lock.acquire(blocking=self._data is None):
+            return
+        try:
+            if self._data is None or self._sidecar_stamp() != self._stamp:
+                self.load()
+        finally:
+            self._lock.release()
+
+    def size(self):
+        return len(self._data[0]) if self._data else 0
+
+    def vector(self, part_key):
+        """Descriptor of a measured part as a list of floats, or None."""
+        if not self._data:
+            return None
+        keys, rows, matrix, _ = self._data
+        row = rows.get(part_key)
+        if row is None:
+            return None
+        if numpy is not None:
+            return matrix[row].tolist()
+        return matrix[row * SHAPE_DIMENSIONS:(row + 1) * SHAPE_DIMENSIONS].tolist()
+
+    def nearest(self, vector, k=DEFAULT_K, exclude=(), exact=False):
+        """[(part key, distance)] of the k parts closest to vector, nearest first.
+
+        exact=True scans every part even when the coarse quantizer is built.
+        """
+        if not self._data:
+            return []
+        keys, rows, matrix, coarse = self._data
+        skip = {rows[key] for key in exclude if key in rows}
+        wanted = min(k + len(skip), len(keys))
+        if not wanted:
+            return []
+
+        if numpy is None:
+            width = SHAPE_DIMENSIONS
+            scored = ((sum((a - b) * (a - b) for a, b in zip(matrix[row * width:(row + 1) * width], vector)), row)
+                      for row in range(len(keys)))
+            picks = heapq.nsmallest(wanted, scored)
+        else:
+            query = numpy.asarray(vector, dtype=numpy.float32)
+            candidates = None
+            if coarse is not None and not exact:
+                centroids, order, bounds = coarse
+                probes = numpy.argsort(((centroids - query) ** 2).sum(axis=1))[:COARSE_PROBES]
+                candidates = numpy.concatenate([order[bounds[c]:bounds[c + 1]] for c in probes])
+            block = matrix if candidates is None else matrix[candidates]
+            distances = ((block - query) ** 2).sum(axis=1)
+            wanted = min(wanted, len(distances))
+            nearest = numpy.argpartition(distances, wanted - 1)[:wanted]
+            nearest = nearest[numpy.argsort(distances[nearest])]
+            picked_rows = nearest if candidates is None else candidates[nearest]
+            picks = zip(distances[nearest].tolist(), picked_rows.tolist())
+
+        results = [(keys[row], math.sqrt(distance)) for distance, row in picks if row not in skip]
+        return results[:k]
+
+def benchmark(parts=100000, queries=200, k=DEFAULT_K):
+    """Time exact and coarse searches over random clustered descriptors."""
+    rnd = random.Random(1)
+    centres = [[rnd.random() for _ in range(SHAPE_DIMENSIONS)] for _ in range(500)]
+    packed = array('f')
+    for _ in range(parts):
+        centre = rnd.choice(centres)
+        packed.extend(value + rnd.gauss(0, 0.03) for value in centre)
+    index = ShapeIndex()
+    started = time.perf_counter()
+    index.set_vectors([f"P{i}" for i in range(parts)], packed.tobytes())
+    print(f"🔷 {parts:,} descriptors loaded in {(time.perf_counter() - started) * 1000:.0f}ms"
+          f" ({'numpy' if numpy is not None else 'no numpy'}, coarse cells: "
+          f"{len(index._data[3][0]) if index._data[3] is not None else 'none'})")
+
+    samples = [index.vector(f"P{rnd.randrange(parts)}") for _ in range(queries)]
+    modes = [('exact', True)] + ([('coarse', False)] if index._data[3] is not None else [])
+    found = {}
+    for name, exact in modes:
+        started = time.perf_counter()
+        found[name] = [{key for key, _ in index.nearest(vector, k, exact=exact)} for vector in samples]
+        elapsed = time.perf_counter() - started
+        print(f"   {name:<6} {elapsed / queries * 1000:.2f}ms per query")
+    if 'coarse' in found:
+        recall = sum(len(a & b) for a, b in zip(found['exact'], found['coarse'])) / (k * queries)
+        print(f"   coarse recall@{k}: {recall:.1%}")
+
+def main():
+    """Command-line interface."""
+    args = sys.argv[1:]
+    if not args or args[0] in ('-h', '--help'):
+        print("Usage:")
+        print("  python3 shape_index.py <name> [--k N] [--db PATH]    # Parts shaped like a part")
+        print("  python3 shape_index.py benchmark [--parts N]          # Time the search on random descriptors")
+        return
+    if args[0] == 'benchmark':
+        benchmark(int(args[args.index('--parts') + 1]) if '--parts' in args else 100000)
+        return
+
+    db_path = Path(args[args.index('--db') + 1]) if '--db' in args else DB_PATH
+    k = int(args[args.index('--k') + 1]) if '--k' in args else DEFAULT_K
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        sys.exit(1)
+
+    index = ShapeIndex(db_path)
+    index.refresh()
+    key = normalize_part_key(args[0])
+    vector = index.vector(key)
+    if vector is None:
+        print(f"❌ {key} has not been measured (convert it, or run dxf_stats.py <file.dxf> --record)")
+        sys.exit(1)
+    started = time.perf_counter()
+    neighbours = index.nearest(vector, min(k, MAX_K), exclude=(key,))
+    elapsed = time.perf_counter() - started
+
+    conn = connect_read_only(db_path)
+    print(f"🔷 Parts shaped like {key} ({index.size():,} measured, {elapsed * 1000:.1f}ms)")
+    for part_key, distance in neighbours:
+        width, height, dxf_name = conn.execute(
+            'SELECT width, height, dxf_name FROM part_geometry WHERE part_key = ?', (part_key,)).fetchone()
+        names = [row[0] for row in conn.execute('''
+            SELECT e.element_name || ' (' || l.library_name || ')' FROM elements e
+            JOIN libraries l ON e.library_id = l.library_id
+            WHERE e.part_key = ?
+            GROUP BY e.element_name, l.library_name
+            ORDER BY MAX(e.modified_at) DESC LIMIT 3
+        ''', (part_key,))]
+        print(f"  {distance:7.4f}  {part_key:<16} {width:8.2f} x {height:<8.2f} in  "
+              f"{', '.join(names) or dxf_name}")
+    conn.close()
+
+if __name__ == '__main__':
+    main()
@@ -9,29 +9,18 @@ import json
 from pathlib import Path
 from datetime import datetime
 
-DB_PATH = Path(__file__).parent / "cc_libraries_enhanced.db"
-USER_MAP_PATH = Path(__file__).parent / "user_map.json"
+from user_directory import users
 
-def load_user_map():
-    """Load user ID to name mapping."""
-    if not USER_MAP_PATH.exists():
-        return {}
-    try:
-        with open(USER_MAP_PATH) as f:
-            data = json.load(f)
-            return data.get('users', {})
-    except:
-        return {}
+DB_PATH = Path(__file__).parent / "cc_libraries_enhanced.db"
 
 def get_user_name(user_id):
     """Get human-readable name for a user ID."""
     if not user_id:
         return "N/A"
     
-    user_map = load_user_map()
+    user_info = users.get(user_id)
     
-    if user_id in user_map:
-        user_info = user_map[user_id]
+    if user_info:
         name = user_info.get('name', user_id)
         email = user_info.get('email', '')
         if email:
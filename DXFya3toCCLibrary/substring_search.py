@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Substring and typo-tolerant search over the enhanced index.
+Substrings of three or more characters resolve through the elements_trigram FTS5 index,
+shorter ones (too short for trigrams) with a LIKE scan. When nothing matches, the rarest
+trigrams of the query pick candidates that are ranked by edit distance.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+# Database path
+DB_PATH = Path(__file__).parent / "cc_libraries_enhanced.db"
+
+# Columns searched, as indexed by build_library_index_enhanced.TRIGRAM_COLUMNS
+SEARCH_COLUMNS = ['element_name', 'file_name', 'library_name']
+
+# Typo fallback: trigrams used to find candidates, and how many candidates are scored
+FUZZY_TRIGRAMS = 4
+FUZZY_CANDIDATES = 200
+
+# Trigram frequencies are only counted up to this many elements
+FUZZY_COUNT_CAP = 5000
+
+def fts_phrase(text):
+    """Quote text as one FTS5 phrase."""
+    return '"' + text.replace('"', '""') + '"'
+
+def like_pattern(text):
+    """LIKE pattern matching text anywhere (use with ESCAPE '\\')."""
+    escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+def substring_filter(query):
+    """Return (sql, params) for a per-row condition on aliases e (elements) and l (libraries)."""
+    columns = [f"l.{c}" if c == 'library_name' else f"e.{c}" for c in SEARCH_COLUMNS]
+    sql = ' OR '.join(f"{c} LIKE ? ESCAPE '\\'" for c in columns)
+    return f"({sql})", [like_pattern(query.strip())] * len(columns)
+
+def substring_match(query):
+    """Return (sql, params) for a subquery selecting the rowids of matching elements."""
+    query = query.strip()
+    if len(query) >= 3:
+        return 'SELECT rowid FROM elements_trigram WHERE elements_trigram MATCH ?', [fts_phrase(query)]
+    # Too short for trigrams: scan
+    condition, params = substring_filter(query)
+    return (f'SELECT e.rowid FROM elements e JOIN libraries l ON e.library_id = l.library_id '
+            f'WHERE {condition}', params)
+
+def count_matches(conn, query, cap):
+    """Number of elements matching query, counting no further than cap."""
+    subquery, params = substring_match(query)
+    return conn.execute(f'SELECT COUNT(*) FROM ({subquery} LIMIT ?)', params + [cap]).fetchone()[0]
+
+def substring_distance(pattern, text, limit=None):
+    """Fewest edits turning pattern into some substring of text (case-insensitive).
+
+    With limit, stops early and returns limit + 1 once the distance must exceed it.
+    """
+    pattern = pattern.lower()
+    text = (text or '').lower()
+    previous = [0] * (len(text) + 1)
+    for i, p in enumerate(pattern, 1):
+        current = [i]
+        left = i
+        for j, t in enumerate(text, 1):
+            best = previous[j - 1] + (p != t)
+            if previous[j] + 1 < best:
+                best = previous[j] + 1
+            if left + 1 < best:
+                best = left + 1
+            current.append(best)
+            left = best
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous)
+
+def trigrams(text):
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def max_typos(query):
+    """Edits tolerated for a query; short queries must match exactly."""
+    if len(query) < 5:
+        return 0
+    return 1 if len(query) < 9 else 2
+
+def fuzzy_rowids(conn, query, limit=50):
+    """Rowids of elements within max_typos of the query, closest first."""
+    query = query.strip().lower()
+    allowed = max_typos(query)
+    grams = trigrams(query)
+    if not allowed or not grams:
+        return []
+
+    # The rarest trigrams keep the candidate set small on large libraries; bm25 ranks
+    # the candidates sharing the most of them first
+    counts = {}
+    for gram in grams:
+        counts[gram] = conn.execute('''
+            SELECT COUNT(*) FROM (SELECT 1 FROM elements_trigram WHERE elements_trigram MATCH ? LIMIT ?)
+        ''', (fts_phrase(gram), FUZZY_COUNT_CAP)).fetchone()[0]
+    rare = sorted((g for g in grams if counts[g]), key=counts.get)[:FUZZY_TRIGRAMS]
+    if not rare or counts[rare[0]] >= FUZZY_COUNT_CAP:
+        # Nothing selective to go on
+        return []
+
+    cursor = conn.execute(f'''
+        SELECT rowid, {', '.join(SEARCH_COLUMNS)} FROM elements_trigram
+        WHERE elements_trigram MATCH ?
+        ORDER BY rank
+        LIMIT ?
+    ''', (' OR '.join(fts_phrase(g) for g in rare), FUZZY_CANDIDATES))
+    # q-gram lemma: within `allowed` edits a text keeps all but 3 * allowed of the query's trigrams
+    needed = len(grams) - 3 * allowed
+    scored = []
+    for rowid, *texts in cursor:
+        texts = [t for t in set(texts) if t and len(grams & trigrams(t)) >= needed]
+        if not texts:
+            continue
+        distance = min(substring_distance(query, text, allowed) for text in texts)
+        if distance <= allowed:
+            scored.append((distance, rowid))
+    scored.sort()
+    return [rowid for _, rowid in scored[:limit]]
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  python3 substring_search.py <query>   # Substring search, with typo fallback")
+        return
+    query = sys.argv[1]
+    conn = sqlite3.connect(DB_PATH)
+    subquery, params = substring_match(query)
+    rows = conn.execute(f'''
+        SELECT e.element_name, l.library_name FROM elements e
+        JOIN libraries l ON e.library_id = l.library_id
+        WHERE e.rowid IN ({subquery})
+        ORDER BY e.modified_at DESC LIMIT 20
+    ''', params).fetchall()
+    if not rows:
+        rowids = fuzzy_rowids(conn, query, limit=20)
+        if rowids:
+            print("🔤 No substring match; closest names:")
+        rows = [conn.execute('''
+            SELECT e.element_name, l.library_name FROM elements e
+            JOIN libraries l ON e.library_id = l.library_id WHERE e.rowid = ?
+        ''', (rowid,)).fetchone() for rowid in rowids]
+    for element_name, library_name in rows:
+        print(f"  {element_name:<40} {library_name}")
+    if not rows:
+        print(f"❌ No results found for: {query}")
+    conn.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+In-memory prefix index for search type-ahead.
+Element names, part numbers and library names are kept in one array sorted by their
+lowercased text, so the entries starting with a prefix are a contiguous range found by
+binary search. The most recently modified entries of the range are returned; the index is
+rebuilt when the indexer publishes a new generation.
+"""
+
+import heapq
+import random
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+from index_generation import connect_read_only, generation_path, read_generation
+from part_keys import PART_NUMBER
+
+# Database path
+DB_PATH = Path(__file__).parent / "cc_libraries_enhanced.db"
+
+# Suggestions returned by default, and the most a request may ask for
+DEFAULT_LIMIT = 8
+MAX_LIMIT = 20
+
+# Prefixes matching up to this many entries are ranked on request; the top MAX_LIMIT of
+# broader prefixes are computed when the index loads
+SCAN_LIMIT = 2000
+
+# Past every character a suggestion can continue with
+_PREFIX_END = '\U0010ffff'
+
+def normalize(text):
+    return ' '.join((text or '').lower().split())
+
+def broad_prefixes(keys, recency):
+    """{prefix: newest MAX_LIMIT positions} for every prefix matching more than SCAN_LIMIT keys."""
+    # Broad prefixes nest, so only children of a broad prefix can be broad
+    broad = {}
+    pending = [('', 0, len(keys))] if len(keys) > SCAN_LIMIT else []
+    while pending:
+        prefix, lo, hi = pending.pop()
+        depth = len(prefix)
+        # Keys equal to the prefix sort first
+        j = bisect_left(keys, prefix + '\0', lo, hi)
+        while j < hi:
+            child = keys[j][:depth + 1]
+            end = bisect_left(keys, child + _PREFIX_END, j, hi)
+            if end - j > SCAN_LIMIT:
+                broad[child] = []
+                pending.append((child, j, end))
+            j = end
+    if not broad:
+        return broad
+
+    # One pass newest first fills every list; each key belongs to its broad prefixes
+    open_lists = len(broad)
+    for i in sorted(range(len(keys)), key=recency.__getitem__, reverse=True):
+        key = keys[i]
+        for depth in range(1, len(key) + 1):
+            top = broad.get(key[:depth])
+            if top is None:
+                break
+            if len(top) < MAX_LIMIT:
+                top.append(i)
+                if len(top) == MAX_LIMIT:
+                    open_lists -= 1
+        if not open_lists:
+            break
+    return broad
+
+class SuggestIndex:
+    """Sorted prefix array of element names, part numbers and libraries with their recency."""
+
+    def __init__(self, db_path=None):
+        self.db_path = Path(db_path or DB_PATH)
+        self.generation = None
+        self.loaded_in = 0.0
+        # (keys, texts, kinds, recency, {broad prefix: top positions}), swapped in whole
+        self._data = None
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def _sidecar_stamp(self):
+        try:
+            st = generation_path(self.db_path).stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def load(self):
+        """Read names, part numbers and libraries from the index and rebuild the arrays."""
+        started = time.perf_counter()
+        stamp = self._sidecar_stamp()
+        generation = read_generation(self.db_path).get('generation', 0)
+        conn = connect_read_only(self.db_path)
+        try:
+            names = conn.execute('SELECT element_name, modified_at FROM latest_by_name').fetchall()
+            part_keys = conn.execute('''
+                SELECT part_key, MAX(COALESCE(modified_at, 0)) FROM elements
+                WHERE part_key IS NOT NULL
+                GROUP BY part_key
+            ''').fetchall()
+            libraries = conn.execute('SELECT library_name, COALESCE(modified_at, 0) FROM libraries').fetchall()
+        finally:
+            conn.close()
+
+        entries = [(normalize(name), name, 'element', modified_at) for name, modified_at in names]
+        seen = {entry[0] for entry in entries}
+        # Part numbers found inside longer names ("Flat-Pattern1 - RT004127"); other part
+        # keys are just the lowercased name
+        for key, modified_at in part_keys:
+            normalized = key.lower()
+            if normalized not in seen and PART_NUMBER.fullmatch(key):
+                entries.append((normalized, key, 'part', modified_at))
+        entries.extend((normalize(name), name, 'library', modified_at) for name, modified_at in libraries)
+        entries = [entry for entry in entries if entry[0]]
+        entries.sort(key=lambda entry: (entry[0], -entry[3]))
+
+        keys = [entry[0] for entry in entries]
+        texts = [entry[1] for entry in entries]
+        kinds = [entry[2] for entry in entries]
+        recency = array('q', (entry[3] for entry in entries))
+        self._data = (keys, texts, kinds, recency, broad_prefixes(keys, recency))
+        self.generation = generation
+        self._stamp = stamp
+        self.loaded_in = time.perf_counter() - started
+
+    def refresh(self):
+        """Rebuild after a new generation; requests keep the old arrays while one thread rebuilds."""
+        if self._data is not None and self._sidecar_stamp() == self._stamp:
+            return
+        if not self._lock.acquire(blocking=self._data is None):
+            return
+        try:
+            if self._data is None or self._sidecar_stamp() != self._stamp:
+                self.load()
+        finally:
+            self._lock.release()
+
+    def size(self):
+        return len(self._data[0]) if self._data else 0
+
+    def suggest(self, prefix, limit=DEFAULT_LIMIT):
+        """Entries starting with prefix (case-insensitive), most recently modified first."""
+        prefix = normalize(prefix)
+        if not prefix or not self._data:
+            return []
+        keys, texts, kinds, recency, broad = self._data
+        limit = min(limit, MAX_LIMIT)
+        if prefix in broad:
+            picks = broad[prefix][:limit]
+        else:
+            lo = bisect_left(keys, prefix)
+            hi = bisect_left(keys, prefix + _PREFIX_END, lo)
+            picks = heapq.nlargest(limit, range(lo, hi), key=recency.__getitem__)
+        return [{'text': texts[i], 'kind': kinds[i], 'modified_at': recency[i]} for i in picks]
+
+def benchmark(index, samples=2000, limit=DEFAULT_LIMIT):
+    """Time suggestions for prefixes of random element names, as they are typed."""
+    keys = index._data[0]
+    rnd = random.Random(1)
+    prefixes = []
+    for _ in range(samples):
+        key = rnd.choice(keys)
+        prefixes.append(key[:rnd.randint(1, min(len(key), 8))])
+    timings = []
+    for prefix in prefixes:
+        started = time.perf_counter()
+        index.suggest(prefix, limit)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    print(f"⏱️  {samples:,} prefixes: p50 {timings[len(timings) // 2] * 1e6:.0f}µs"
+          f"  p99 {timings[int(len(timings) * 0.99)] * 1e6:.0f}µs  max {timings[-1] * 1e6:.0f}µs")
+
+def main():
+    """Command-line interface."""
+    args = sys.argv[1:]
+    if not args or args[0] in ('-h', '--help'):
+        print("Usage:")
+        print("  python3 suggest_index.py <prefix> [--db PATH]     # Show suggestions")
+        print("  python3 suggest_index.py benchmark [--db PATH]    # Time typed prefixes")
+        return
+    db_path = Path(args[args.index('--db') + 1]) if '--db' in args else DB_PATH
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        sys.exit(1)
+
+    index = SuggestIndex(db_path)
+    index.refresh()
+    print(f"🔤 {index.size():,} entries loaded in {index.loaded_in * 1000:.0f}ms")
+    if args[0] == 'benchmark':
+        benchmark(index)
+        return
+    for suggestion in index.suggest(args[0]):
+        print(f"  {suggestion['text']:<40} {suggestion['kind']}")
+
+if __name__ == '__main__':
+    main()
@@ -4,16 +4,21 @@ Update a Creative Cloud Library file with a timestamped layer from a local AI fi
 Integrates DXFya3 with DXFya3toCCLibrary database.
 """
 
+import json
 import sys
 import subprocess
 from pathlib import Path
 
-# Add parent directory to path to import search_libraries
+# Add parent directory to path to import element_lookup
 sys.path.insert(0, str(Path(__file__).parent))
-from search_libraries import get_element_by_name
+from element_lookup import find_element
 
-def copy_layer_to_cc_file(local_ai_path, cc_file_path):
-    """Copy timestamped layer from local AI file to CC Library file using ExtendScript."""
+def copy_layer_to_cc_file(local_ai_path, cc_file_path, layer_note=None):
+    """Copy timestamped layer from local AI file to CC Library file using ExtendScript.
+
+    layer_note (e.g. a revision diff summary) is appended to the new layer's name.
+    """
+    layer_suffix = json.dumps(f" ({layer_note})" if layer_note else "")
     
     # Create ExtendScript that will be executed in Illustrator
     extendscript_path = Path(__file__).parent / "copy_layer_to_cc.jsx"
@@ -100,7 +105,7 @@ try {{
                     // Switch to CC document and create new layer
                     app.activeDocument = ccDoc;
                     var newLayer = ccDoc.layers.add();
-                    newLayer.name = sourceLayerName;
+                    newLayer.name = sourceLayerName + {layer_suffix};
                     newLayer.locked = false;
                     ccDoc.activeLayer = newLayer;
                     ccDoc.selection = null;
@@ -173,13 +178,14 @@ try {{
     except Exception as e:
         return f"ERROR: {e}"
 
-def update_cc_library_file(local_ai_path, base_filename):
+def update_cc_library_file(local_ai_path, base_filename, diff_summary=None):
     """
     Find matching CC Library file and update it with timestamped layer.
     
     Args:
         local_ai_path: Path to the locally created AI file
         base_filename: Base name to search for (e.g., "RT004127_cut")
+        diff_summary: Optional revision diff summary, added to the new layer name
     
     Returns:
         bool: True if successful, False otherwise
@@ -187,8 +193,8 @@ def update_cc_library_file(local_ai_path, base_filename):
     
     print(f"🔍 Searching CC Libraries for: {base_filename}")
     
-    # Search database for matching element
-    result = get_element_by_name(base_filename)
+    # Ask the lookup service (or the database) for the matching element
+    result = find_element(base_filename)
     
     if not result:
         print(f"ℹ️  No matching file found in CC Libraries")
@@ -197,6 +203,8 @@ def update_cc_library_file(local_ai_path, base_filename):
     
     print(f"✅ Found in CC Library: {result['library_name']}")
     print(f"   Element: {result['element_name']}")
+    if result['element_name'] != base_filename and result.get('part_key'):
+        print(f"   Matched by part number: {result['part_key']}")
     
     # Check if component path exists
     if not result['component_path']:
@@ -212,9 +220,11 @@ def update_cc_library_file(local_ai_path, base_filename):
     
     print(f"📂 CC File: {cc_file_path.name}")
     print(f"🔄 Copying timestamped layer to CC Library file...")
+    if diff_summary:
+        print(f"🧮 Changes {diff_summary}")
     
     # Copy the layer
-    result_msg = copy_layer_to_cc_file(str(local_ai_path), str(cc_file_path))
+    result_msg = copy_layer_to_cc_file(str(local_ai_path), str(cc_file_path), diff_summary)
     
     if "SUCCESS:" in result_msg:
         print(f"✅ {result_msg}")
@@ -228,7 +238,7 @@ def main():
     """Command-line interface."""
     if len(sys.argv) < 3:
         print("Usage:")
-        print("  python3 update_cc_library_file.py <local_ai_file> <base_filename>")
+        print("  python3 update_cc_library_file.py <local_ai_file> <base_filename> [<diff_summary>]")
         print()
         print("Example:")
         print("  python3 update_cc_library_file.py ../AI/RT004127_cut.ai RT004127_cut")
@@ -242,12 +252,13 @@ def main():
     
     local_ai_path = sys.argv[1]
     base_filename = sys.argv[2]
+    diff_summary = sys.argv[3] if len(sys.argv) > 3 else None
     
     if not Path(local_ai_path).exists():
         print(f"❌ Local AI file not found: {local_ai_path}")
         return
     
-    success = update_cc_library_file(local_ai_path, base_filename)
+    success = update_cc_library_file(local_ai_path, base_filename, diff_summary)
     sys.exit(0 if success else 1)
 
 if __name__ == '__main__':
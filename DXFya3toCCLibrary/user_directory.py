@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Cached user directory: Adobe user ID → name, email and notes from user_map.json.
+The map is parsed once and re-read only when the file's mtime or size changes (checked at
+most once per CHECK_INTERVAL), so resolving a name per result row is a dict lookup.
+Names learned from other sources, such as the index, fill in IDs the map does not cover.
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Default map, edited by hand (see USER_MAPPING.md)
+USER_MAP_PATH = Path(__file__).parent / "user_map.json"
+
+# Seconds between checks of the map file for edits
+CHECK_INTERVAL = 1.0
+
+class UserDirectory:
+    """User ID → entry dict ({'name', 'email', 'notes'}), reloaded when user_map.json changes."""
+
+    def __init__(self, path=None, check_interval=CHECK_INTERVAL):
+        self.path = Path(path or USER_MAP_PATH)
+        self.check_interval = check_interval
+        self.users = {}
+        self.learned = {}
+        self.loads = 0
+        self._entries = {}
+        self._stamp = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def _file_stamp(self):
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _merge(self):
+        # Hand-edited map entries win over learned names
+        entries = {user_id: {'name': name} for user_id, name in self.learned.items()}
+        entries.update(self.users)
+        self._entries = entries
+
+    def load(self):
+        """Parse the map file; a missing file leaves only learned names.
+
+        A file that does not parse (say, half-saved) keeps the previous names and is
+        retried at the next check.
+        """
+        stamp = self._file_stamp()
+        users = {}
+        if stamp is not None:
+            try:
+                with open(self.path) as f:
+                    users = json.load(f).get('users', {})
+            except (OSError, ValueError, AttributeError):
+                if self.loads:
+                    return
+        with self._lock:
+            self.users = users
+            self._stamp = stamp
+            self._checked_at = time.monotonic()
+            self.loads += 1
+            self._merge()
+
+    def refresh(self):
+        """Reload when the file changed since the last load (stat at most once per interval)."""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        if self.loads == 0 or self._file_stamp() != self._stamp:
+            self.load()
+
+    def learn(self, names):
+        """Add {user_id: name} learned elsewhere; entries in the map file take precedence."""
+        with self._lock:
+            self.learned.update((user_id, name) for user_id, name in names.items() if user_id and name)
+            self._merge()
+
+    def get(self, user_id):
+        """Entry for user_id, or None when it is neither mapped nor learned."""
+        self.refresh()
+        return self._entries.get(user_id)
+
+    def name(self, user_id):
+        """Display name for user_id, or None when unknown."""
+        entry = self.get(user_id)
+        return entry.get('name') if entry else None
+
+# Shared by the web server and the metadata viewer
+users = UserDirectory()
+
+def benchmark(rows=10000):
+    """Compare re-reading the map per row (the old behaviour) with the cached directory."""
+    directory = UserDirectory()
+    with open(directory.path) as f:
+        ids = list(json.load(f).get('users', {}))
+    ids.append('unmapped@AdobeID')
+
+    started = time.perf_counter()
+    for i in range(rows):
+        with open(directory.path) as f:
+            json.load(f).get('users', {}).get(ids[i % len(ids)])
+    per_read = (time.perf_counter() - started) / rows
+
+    started = time.perf_counter()
+    for i in range(rows):
+        directory.get(ids[i % len(ids)])
+    per_lookup = (time.perf_counter() - started) / rows
+
+    print(f"👥 {len(ids)} user IDs, {rows:,} rows")
+    print(f"   Re-reading user_map.json: {per_read * 1e6:8.2f}µs per row")
+    print(f"   Cached directory:         {per_lookup * 1e6:8.2f}µs per row ({directory.loads} load)")
+    print(f"   ⚡ {per_read / per_lookup:,.0f}x faster")
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) < 2 or sys.argv[1] not in ('list', 'benchmark'):
+        print("Usage:")
+        print("  python3 user_directory.py list              # Show mapped users")
+        print("  python3 user_directory.py benchmark [rows]  # Time per-row name lookups")
+        return
+
+    if sys.argv[1] == 'benchmark':
+        if not USER_MAP_PATH.exists():
+            print(f"❌ {USER_MAP_PATH} not found")
+            return
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 10000)
+        return
+
+    users.refresh()
+    for user_id, entry in users.users.items():
+        print(f"  {entry.get('name', '?'):<20} {user_id}")
+    print(f"👥 {len(users.users)} mapped users")
+
+if __name__ == '__main__':
+    main()
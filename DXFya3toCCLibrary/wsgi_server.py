@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Threaded WSGI server for running the library search UI in production.
+A fixed pool of worker threads handles requests (so pooled database connections are reused),
+each connection is closed after its response, idle or slow clients time out, and SIGINT or
+SIGTERM stops accepting connections while requests already received are finished.
+"""
+
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+class RequestHandler(WSGIRequestHandler):
+    """Werkzeug's handler with one request per connection and no access log."""
+
+    # Keep-alive would tie a worker thread to an idle browser connection
+    protocol_version = 'HTTP/1.0'
+
+    def log_request(self, code='-', size='-'):
+        pass
+
+class PooledWSGIServer(BaseWSGIServer):
+    """Accepts on the main thread and hands each connection to a fixed pool of workers."""
+
+    multithread = True
+
+    def __init__(self, host, port, app, workers=8, client_timeout=30.0):
+        # Socket timeout for reading a request and writing its response
+        handler = type('TimedRequestHandler', (RequestHandler,), {'timeout': client_timeout})
+        super().__init__(host, port, app, handler=handler)
+        self.workers = workers
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='search-worker')
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def drain(self):
+        """Wait for every accepted request to finish."""
+        self.pool.shutdown(wait=True)
+
+def serve(app, host='127.0.0.1', port=5001, workers=8, client_timeout=30.0, on_stop=None):
+    """Serve app until SIGINT or SIGTERM, then finish in-flight requests and call on_stop()."""
+    server = PooledWSGIServer(host, port, app, workers, client_timeout)
+    stopping = threading.Event()
+
+    def stop(signum, frame):
+        if not stopping.is_set():
+            stopping.set()
+            print("\n🛑 Stopping: finishing in-flight requests...")
+            # shutdown() waits for serve_forever(), which runs on this (the main) thread
+            threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    print(f"🚀 Serving on http://{host}:{server.port} ({workers} workers)")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        server.drain()
+        if on_stop:
+            on_stop()
+        print("👋 Server stopped")
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Cut-order optimization for laser output.
+Orders contours so inner contours are cut before the contour that contains them, then
+minimizes rapid travel with nearest-neighbour seeding and time-boxed 2-opt.
+"""
+
+import math
+import sys
+import time
+from pathlib import Path
+
+from dxf_geometry import (GridIndex, chain_entities, chain_polylines, format_unsupported,
+                          point_in_polygon, read_dxf, reverse_polyline, write_dxf)
+from pipeline_profile import load_profile
+
+def _distance(a, b):
+    return math.hypot(b[0] - a[0], b[1] - a[1])
+
+def _bbox(vertices):
+    xs = [v[0] for v in vertices]
+    ys = [v[1] for v in vertices]
+    return min(xs), min(ys), max(xs), max(ys)
+
+def nesting_parents(polylines):
+    """Return the index of the smallest closed polyline containing each polyline (or None)."""
+    boxes = [_bbox(v) for _, v, _ in polylines]
+    areas = [(b[2] - b[0]) * (b[3] - b[1]) for b in boxes]
+    closed = [i for i, (_, _, is_closed) in enumerate(polylines) if is_closed]
+    # Smallest candidates first so the first hit is the direct parent
+    closed.sort(key=lambda i: areas[i])
+
+    parents = []
+    for i, (_, vertices, _) in enumerate(polylines):
+        box = boxes[i]
+        probe = vertices[0]
+        parent = None
+        for j in closed:
+            if j == i or areas[j] <= areas[i]:
+                continue
+            outer = boxes[j]
+            if box[0] < outer[0] or box[1] < outer[1] or box[2] > outer[2] or box[3] > outer[3]:
+                continue
+            if point_in_polygon(probe[0], probe[1], polylines[j][1]):
+                parent = j
+                break
+        parents.append(parent)
+    return parents
+
+def travel_distance(polylines, start):
+    """Rapid travel from start through every polyline in order (cut lengths excluded)."""
+    position = start
+    total = 0.0
+    for _, vertices, closed in polylines:
+        total += _distance(position, vertices[0])
+        position = vertices[0] if closed else vertices[-1]
+    return total
+
+def _nearest_neighbour(polylines, parents, start):
+    """Greedy order honouring inner-before-outer; returns [(index, entry_vertex, reversed)]."""
+    pending_children = [0] * len(polylines)
+    for parent in parents:
+        if parent is not None:
+            pending_children[parent] += 1
+
+    # Roughly one candidate entry vertex per grid cell
+    every_vertex = [v for _, vertices, _ in polylines for v in vertices]
+    min_x, min_y, max_x, max_y = _bbox(every_vertex)
+    span = max(max_x - min_x, max_y - min_y, 1e-6)
+    grid = GridIndex(span / max(1.0, math.sqrt(len(every_vertex))))
+    keys = {}
+
+    def make_available(i):
+        _, vertices, closed = polylines[i]
+        # Closed contours can be entered at any vertex; open ones at either end
+        if closed:
+            entries = [(i, k) for k in range(len(vertices))]
+        else:
+            entries = [(i, 0), (i, len(vertices) - 1)]
+        keys[i] = entries
+        for key in entries:
+            x, y = vertices[key[1]][:2]
+            grid.insert(key, x, y)
+
+    for i in range(len(polylines)):
+        if pending_children[i] == 0:
+            make_available(i)
+
+    order = []
+    position = start
+    while grid:
+        _, (i, k) = grid.nearest(*position)
+        for key in keys.pop(i):
+            grid.remove(key)
+        _, vertices, closed = polylines[i]
+        if closed:
+            order.append((i, k, False))
+            position = vertices[k][:2]
+        else:
+            flipped = k != 0
+            order.append((i, k, flipped))
+            position = vertices[0 if flipped else -1][:2]
+        parent = parents[i]
+        if parent is not None:
+            pending_children[parent] -= 1
+            if pending_children[parent] == 0:
+                make_available(parent)
+    return order
+
+def _two_opt(entries, exits, owners, parents, start, deadline):
+    """Improve an open tour by segment reversal until no gain or the deadline passes.
+
+    Reversing a segment swaps each member's entry and exit. A reversal is rejected when
+    it would put a parent before one of its children.
+    """
+    n = len(entries)
+    flips = [False] * n
+    improved = True
+    passes = 0
+    while improved and time.monotonic() < deadline:
+        improved = False
+        passes += 1
+        position = {owner: p for p, owner in enumerate(owners)}
+        for i in range(n - 1):
+            if time.monotonic() >= deadline:
+                break
+            before = exits[i - 1] if i > 0 else start
+            for j in range(i + 1, n):
+                after = entries[j + 1] if j + 1 < n else None
+                old = _distance(before, entries[i]) + (_distance(exits[j], after) if after else 0.0)
+                new = _distance(before, exits[j]) + (_distance(entries[i], after) if after else 0.0)
+                if new >= old - 1e-9:
+                    continue
+                if any(parents[owners[p]] is not None and i <= position.get(parents[owners[p]], -1) <= j
+                       for p in range(i, j + 1)):
+                    continue
+                entries[i:j + 1], exits[i:j + 1] = exits[i:j + 1][::-1], entries[i:j + 1][::-1]
+                owners[i:j + 1] = owners[i:j + 1][::-1]
+                flips[i:j + 1] = [not f for f in flips[i:j + 1][::-1]]
+                for p in range(i, j + 1):
+                    position[owners[p]] = p
+                improved = True
+    return flips, passes
+
+def order_polylines(polylines, profile):
+    """Order (layer, vertices, closed) polylines for cutting; returns (ordered, report)."""
+    settings = profile['cut_order']
+    start = tuple(settings['start_point'])
+    started = time.monotonic()
+
+    if not polylines:
+        return [], {'paths': 0, 'travel_before': 0.0, 'travel_nearest': 0.0,
+                    'travel_after': 0.0, 'two_opt_passes': 0, 'seconds': 0.0}
+
+    if settings['inner_first']:
+        parents = nesting_parents(polylines)
+    else:
+        parents = [None] * len(polylines)
+
+    # Nearest-neighbour seed, with closed contours rotated to their chosen entry vertex
+    seeded = []
+    for i, k, flipped in _nearest_neighbour(polylines, parents, start):
+        layer, vertices, closed = polylines[i]
+        if closed:
+            vertices = vertices[k:] + vertices[:k]
+        elif flipped:
+            vertices = reverse_polyline(vertices, False)
+        seeded.append((i, (layer, vertices, closed)))
+
+    owners = [i for i, _ in seeded]
+    entries = [p[1][0][:2] for _, p in seeded]
+    exits = [p[1][0][:2] if p[2] else p[1][-1][:2] for _, p in seeded]
+    travel_nearest = travel_distance([p for _, p in seeded], start)
+
+    deadline = started + settings['time_budget']
+    seeded_by_owner = dict(seeded)
+    flips, passes = _two_opt(entries, exits, owners, parents, start, deadline)
+
+    ordered = []
+    for owner, flipped in zip(owners, flips):
+        layer, vertices, closed = seeded_by_owner[owner]
+        if flipped:
+            vertices = reverse_polyline(vertices, closed)
+        ordered.append((layer, vertices, closed))
+
+    report = {
+        'paths': len(ordered),
+        'nested': sum(1 for p in parents if p is not None),
+        'travel_before': travel_distance(polylines, start),
+        'travel_nearest': travel_nearest,
+        'travel_after': travel_distance(ordered, start),
+        'two_opt_passes': passes,
+        'seconds': time.monotonic() - started
+    }
+    return ordered, report
+
+def format_report(report):
+    """One-line summary of a cut-order report."""
+    before, after = report['travel_before'], report['travel_after']
+    saved = (1 - after / before) * 100 if before else 0.0
+    return (f"travel {before:.1f} → {after:.1f} ({saved:.1f}% shorter; nearest-neighbour "
+            f"{report['travel_nearest']:.1f}), {report['paths']} paths, "
+            f"{report.get('nested', 0)} nested, {report['two_opt_passes']} 2-opt passes "
+            f"in {report['seconds']:.2f}s")
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  python3 dxf_cut_order.py <input.dxf> [<output.dxf>]")
+        print()
+        print("Start point and 2-opt time budget come from pipeline_profile.json ('cut_order' section).")
+        return
+
+    dxf_path = Path(sys.argv[1])
+    output_path = Path(sys.argv[2]) if len(sys.argv) > 2 else dxf_path.with_name(f"{dxf_path.stem}_ordered.dxf")
+
+    profile = load_profile()
+    store = read_dxf(dxf_path, profile['geometry'])
+    polylines = chain_polylines(chain_entities(store, profile['geometry']['join_tolerance']))
+    ordered, report = order_polylines(polylines, profile)
+    write_dxf(output_path, ordered, store.units)
+
+    print(f"🔀 {dxf_path.name}: {format_report(report)}")
+    if store.unsupported:
+        print(f"⚠️  Not carried into the output: {format_unsupported(store.unsupported)}")
+    print(f"💾 Output: {output_path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Entity-level diff between two revisions of a DXF part.
+Entities are matched by geometry hash first, then by a spatial index for near-matches
+(re-export jitter within tolerance) and by translation-invariant shape for moved features.
+Whatever is left over is reported as added or removed. Entities that are not flattened
+(text, hatches) are compared by their raw tags.
+"""
+
+import json
+import math
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from dxf_fingerprint import entity_hash, entity_segments, segments_digest
+from dxf_geometry import GridIndex, read_dxf
+from pipeline_profile import load_profile
+
+def _bbox(store, index):
+    points = store.points(index)
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+def _close_enough(old, i, new, j, tolerance):
+    """True when two entities trace the same vertices (either direction) within tolerance."""
+    a = old.points(i)
+    b = new.points(j)
+    if old.kind[i] != new.kind[j] or len(a) != len(b):
+        return False
+    for candidate in (b, b[::-1]):
+        if all(math.hypot(p[0] - q[0], p[1] - q[1]) <= tolerance for p, q in zip(a, candidate)):
+            return True
+    return False
+
+def _describe(store, index):
+    box = _bbox(store, index)
+    return {
+        'kind': store.kind[index],
+        'layer': store.layer[index],
+        'handle': store.handle[index],
+        'extents': [round(v, 4) for v in box]
+    }
+
+def diff_stores(old, new, settings, quantum):
+    """Match the entities of two EntityStores; returns the diff document."""
+    started = time.monotonic()
+    tolerance = settings['tolerance']
+
+    # 1. Identical geometry (any order, any direction)
+    by_hash = {}
+    for i in range(len(old)):
+        by_hash.setdefault(entity_hash(old, i, quantum), []).append(i)
+    unchanged = 0
+    pending_new = []
+    for j in range(len(new)):
+        matches = by_hash.get(entity_hash(new, j, quantum))
+        if matches:
+            matches.pop()
+            unchanged += 1
+        else:
+            pending_new.append(j)
+    pending_old = [i for matches in by_hash.values() for i in matches]
+
+    # 2. Near-matches: same entity within tolerance of where it was
+    boxes_old = {i: _bbox(old, i) for i in pending_old}
+    grid = GridIndex(max(tolerance * 4, quantum))
+    for i in pending_old:
+        grid.insert(i, boxes_old[i][0], boxes_old[i][1])
+    still_new = []
+    for j in pending_new:
+        box = _bbox(new, j)
+        hit = None
+        for _, i in grid.near(box[0], box[1], tolerance * 2):
+            if _close_enough(old, i, new, j, tolerance):
+                hit = i
+                break
+        if hit is None:
+            still_new.append(j)
+        else:
+            grid.remove(hit)
+            unchanged += 1
+    remaining_old = {i for i in pending_old if i in grid.items}
+
+    # 3. Moved: same shape relative to its own bounding box, nearest old position wins
+    shapes = {}
+    for i in remaining_old:
+        origin = boxes_old[i][:2]
+        key = (old.kind[i], segments_digest(entity_segments(old, i, quantum, origin), old.units))
+        shapes.setdefault(key, []).append(i)
+    moved = []
+    added = []
+    for j in still_new:
+        box = _bbox(new, j)
+        key = (new.kind[j], segments_digest(entity_segments(new, j, quantum, box[:2]), new.units))
+        candidates = shapes.get(key)
+        if not candidates:
+            added.append(j)
+            continue
+        i = min(candidates, key=lambda c: math.hypot(boxes_old[c][0] - box[0], boxes_old[c][1] - box[1]))
+        candidates.remove(i)
+        remaining_old.discard(i)
+        moved.append((i, j, box[0] - boxes_old[i][0], box[1] - boxes_old[i][1]))
+    removed = sorted(remaining_old)
+
+    # 4. Unsupported entities: an edited one is reported as removed and added again
+    old_records = Counter(old.unsupported_records)
+    new_records = Counter(new.unsupported_records)
+    records_added = sorted((new_records - old_records).elements())
+    records_removed = sorted((old_records - new_records).elements())
+
+    limit = settings['max_reported']
+    return {
+        'units': new.units,
+        'counts': {
+            'unchanged': unchanged,
+            'moved': len(moved),
+            'added': len(added),
+            'removed': len(removed),
+            'unsupported_added': len(records_added),
+            'unsupported_removed': len(records_removed)
+        },
+        'empty': not (moved or added or removed or records_added or records_removed),
+        'moved': [{
+            'kind': new.kind[j],
+            'layer': new.layer[j],
+            'old_handle': old.handle[i],
+            'new_handle': new.handle[j],
+            'offset': [round(dx, 4), round(dy, 4)]
+        } for i, j, dx, dy in moved[:limit]],
+        'added': [_describe(new, j) for j in added[:limit]],
+        'removed': [_describe(old, i) for i in removed[:limit]],
+        'unsupported_added': [text.split('\n', 1)[0] for text in records_added[:limit]],
+        'unsupported_removed': [text.split('\n', 1)[0] for text in records_removed[:limit]],
+        'seconds': round(time.monotonic() - started, 4)
+    }
+
+def diff_dxf_files(old_path, new_path, profile=None):
+    """Parse two DXF files and return the diff document."""
+    if profile is None:
+        profile = load_profile()
+    old = read_dxf(old_path, profile['geometry'])
+    new = read_dxf(new_path, profile['geometry'])
+    diff = diff_stores(old, new, profile['diff'], profile['journal']['quantum'])
+    diff['old'] = Path(old_path).name
+    diff['new'] = Path(new_path).name
+    return diff
+
+def format_summary(diff):
+    """Short human-readable diff summary."""
+    counts = diff['counts']
+    if diff['empty']:
+        return f"no geometry changes ({counts['unchanged']} entities unchanged)"
+    summary = f"{counts['moved']} moved, {counts['added']} added, {counts['removed']} removed"
+    if counts['unsupported_added'] or counts['unsupported_removed']:
+        summary += (f", {counts['unsupported_added']} unsupported added, "
+                    f"{counts['unsupported_removed']} unsupported removed")
+    return f"{summary} ({counts['unchanged']} unchanged)"
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) < 3:
+        print("Usage:")
+        print("  python3 dxf_diff.py <old.dxf> <new.dxf> [--json]")
+        print()
+        print("Exits with status 1 when the geometry differs.")
+        return
+
+    diff = diff_dxf_files(sys.argv[1], sys.argv[2])
+    if '--json' in sys.argv:
+        print(json.dumps(diff, indent=2))
+    else:
+        print(f"🧮 {diff['old']} → {diff['new']}: {format_summary(diff)}")
+        for entry in diff['moved']:
+            print(f"   moved   {entry['kind']:<10} {entry['layer']:<20} by ({entry['offset'][0]}, {entry['offset'][1]})")
+        for label in ('added', 'removed'):
+            for entry in diff[label]:
+                print(f"   {label:<7} {entry['kind']:<10} {entry['layer']:<20} at {entry['extents'][:2]}")
+            for kind in diff[f'unsupported_{label}']:
+                print(f"   {label:<7} {kind:<10} (unsupported)")
+    sys.exit(0 if diff['empty'] else 1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Order-invariant geometry fingerprint for DXF files.
+Entities are broken into segments with quantized coordinates and a canonical direction,
+and the sorted multiset of segments is hashed, so entity order, handles, header
+timestamps, segment direction and LINE-vs-polyline encoding do not change the result.
+"""
+
+import hashlib
+import struct
+import sys
+from pathlib import Path
+
+from dxf_geometry import read_dxf
+from pipeline_profile import load_profile
+
+# Bump when the normalization changes so old journal entries stop matching
+FINGERPRINT_VERSION = 1
+
+def entity_segments(store, index, quantum, origin=(0.0, 0.0)):
+    """Return the quantized, direction-independent segments of one entity.
+
+    Coordinates are taken relative to origin before quantizing.
+    """
+    ox, oy = origin
+    points = [(round((x - ox) / quantum), round((y - oy) / quantum)) for x, y in store.points(index)]
+    if store.closed[index] and points[0] != points[-1]:
+        points.append(points[0])
+    segments = []
+    for p0, p1 in zip(points, points[1:]):
+        if p0 == p1:
+            continue
+        segments.append((p0, p1) if p0 < p1 else (p1, p0))
+    return segments
+
+def segments_digest(segments, units, records=()):
+    """Hash a sorted segment multiset, then any unsupported records in sorted order."""
+    h = hashlib.sha256()
+    h.update(struct.pack('<ii', FINGERPRINT_VERSION, units))
+    for (x0, y0), (x1, y1) in sorted(segments):
+        h.update(struct.pack('<qqqq', x0, y0, x1, y1))
+    for text in sorted(records):
+        h.update(text.encode('utf-8') + b'\0')
+    return h.hexdigest()
+
+def entity_hash(store, index, quantum):
+    """Fingerprint of a single entity (direction-independent)."""
+    return segments_digest(entity_segments(store, index, quantum), store.units)
+
+def fingerprint_store(store, quantum):
+    """Fingerprint of every entity in an EntityStore.
+
+    Layer names are left out: re-exports often rename timestamped layers. Unsupported
+    entities (text, hatches) are hashed from their raw tags, since they still reach the .ai.
+    """
+    segments = []
+    for i in range(len(store)):
+        segments.extend(entity_segments(store, i, quantum))
+    return segments_digest(segments, store.units, store.unsupported_records)
+
+def fingerprint_dxf(dxf_path, profile=None):
+    """Parse a DXF file and return its geometry fingerprint."""
+    if profile is None:
+        profile = load_profile()
+    store = read_dxf(dxf_path, profile['geometry'])
+    return fingerprint_store(store, profile['journal']['quantum'])
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  python3 dxf_fingerprint.py <file.dxf> [<file.dxf> ...]")
+        return
+
+    profile = load_profile()
+    for path in sys.argv[1:]:
+        print(f"{fingerprint_dxf(path, profile)}  {Path(path).name}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,796 @@
+#!/usr/bin/env python3
+"""
+Read DXF geometry into a columnar entity store for the Python pipeline stages.
+Every supported entity is flattened to a polyline; coordinates live in shared arrays.
+"""
+
+import math
+import sys
+from array import array
+from pathlib import Path
+
+SUPPORTED_ENTITIES = ('LINE', 'ARC', 'CIRCLE', 'ELLIPSE', 'LWPOLYLINE', 'POLYLINE', 'SPLINE', 'INSERT')
+
+# Records that draw nothing in the part; any other unsupported entity is counted in
+# EntityStore.unsupported so stages that rewrite the file know it would be lost
+NON_DRAWING_RECORDS = ('SEQEND', 'ATTDEF', 'VIEWPORT')
+
+# POLYLINE flags of polygon meshes and polyface meshes, which are not 2D outlines and are
+# counted as unsupported ('POLYLINE mesh')
+MESH_FLAGS = 16 | 64
+
+# Group codes left out of unsupported records when they are compared: handles, owners and
+# layer names change on every re-export without changing the drawing
+VOLATILE_CODES = (5, 8, 330, 360)
+
+# Nested INSERTs deeper than this are ignored (guards against recursive blocks)
+MAX_BLOCK_DEPTH = 8
+
+# Limit on halving a spline sample interval while flattening
+MAX_SPLINE_DEPTH = 10
+
+# Points of each chain checked against the other when testing chains for coincidence, and
+# the grid (cells per side) bucketing the other chain's segments for those checks
+COINCIDENT_SAMPLES = 64
+COINCIDENT_GRID = 32
+
+class EntityStore:
+    """Columnar store of flattened DXF entities.
+
+    Entity i owns points xs/ys[start[i]:start[i] + count[i]].
+    """
+
+    def __init__(self):
+        self.kind = []
+        self.layer = []
+        self.handle = []
+        self.closed = array('b')
+        self.start = array('l')
+        self.count = array('l')
+        self.xs = array('d')
+        self.ys = array('d')
+        self.units = 0
+        # Vertices as drawn, before arcs, bulges and splines were flattened
+        self.source_nodes = 0
+        # {entity type: count} of entities that could not be flattened
+        self.unsupported = {}
+        # Canonical text of each unsupported record, so fingerprints and diffs see edits to them
+        self.unsupported_records = []
+
+    def __len__(self):
+        return len(self.kind)
+
+    def add(self, kind, layer, handle, points, closed=False):
+        """Append one flattened entity."""
+        if len(points) < 2:
+            return
+        self.kind.append(kind)
+        self.layer.append(layer)
+        self.handle.append(handle)
+        self.closed.append(1 if closed else 0)
+        self.start.append(len(self.xs))
+        self.count.append(len(points))
+        for x, y in points:
+            self.xs.append(x)
+            self.ys.append(y)
+
+    def points(self, index):
+        """Return the points of one entity as (x, y) tuples."""
+        begin = self.start[index]
+        end = begin + self.count[index]
+        return list(zip(self.xs[begin:end], self.ys[begin:end]))
+
+    def endpoints(self, index):
+        """Return the first and last point of one entity."""
+        begin = self.start[index]
+        end = begin + self.count[index] - 1
+        return (self.xs[begin], self.ys[begin]), (self.xs[end], self.ys[end])
+
+    def node_count(self):
+        """Total number of stored vertices."""
+        return len(self.xs)
+
+    def extents(self):
+        """Return (min_x, min_y, max_x, max_y), or None for an empty store."""
+        if not self.xs:
+            return None
+        return min(self.xs), min(self.ys), max(self.xs), max(self.ys)
+
+class Chain:
+    """A run of entities joined end to end."""
+
+    __slots__ = ('points', 'closed', 'entities', 'layer')
+
+    def __init__(self, points, closed, entities, layer):
+        self.points = points
+        self.closed = closed
+        self.entities = entities
+        self.layer = layer
+
+    def length(self):
+        """Path length, including the closing segment of closed chains."""
+        pts = self.points + self.points[:1] if self.closed else self.points
+        return sum(math.hypot(b[0] - a[0], b[1] - a[1]) for a, b in zip(pts, pts[1:]))
+
+class GridIndex:
+    """Uniform-grid spatial hash of keyed points."""
+
+    def __init__(self, cell_size):
+        self.cell = cell_size if cell_size > 0 else 1e-9
+        self.buckets = {}
+        self.items = {}
+
+    def _cell(self, x, y):
+        return (math.floor(x / self.cell), math.floor(y / self.cell))
+
+    def insert(self, key, x, y):
+        self.items[key] = (x, y)
+        self.buckets.setdefault(self._cell(x, y), []).append(key)
+
+    def remove(self, key):
+        x, y = self.items.pop(key)
+        bucket = self.buckets[self._cell(x, y)]
+        bucket.remove(key)
+        if not bucket:
+            del self.buckets[self._cell(x, y)]
+
+    def __len__(self):
+        return len(self.items)
+
+    def nearest(self, x, y):
+        """Return (distance, key) of the nearest item, or None when empty."""
+        if not self.items:
+            return None
+        radius = self.cell
+        while True:
+            best = min(self.near(x, y, radius), default=None)
+            if best is not None:
+                return best
+            radius *= 2
+
+    def near(self, x, y, radius):
+        """Yield (distance, key) for items within radius of (x, y)."""
+        cx0, cy0 = self._cell(x - radius, y - radius)
+        cx1, cy1 = self._cell(x + radius, y + radius)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self.buckets):
+            # Wide query over a sparse grid: walk the occupied buckets instead
+            cells = [c for c in self.buckets if cx0 <= c[0] <= cx1 and cy0 <= c[1] <= cy1]
+        else:
+            cells = [(cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)]
+        for cell in cells:
+            for key in self.buckets.get(cell, ()):
+                px, py = self.items[key]
+                dist = math.hypot(px - x, py - y)
+                if dist <= radius:
+                    yield dist, key
+
+class KDTree:
+    """Static 2-D tree over keyed points for nearest-neighbour queries."""
+
+    def __init__(self, points):
+        """Build from an iterable of (x, y, key)."""
+        self.root = self._build(list(points), 0)
+
+    def _build(self, points, depth):
+        if not points:
+            return None
+        axis = depth % 2
+        points.sort(key=lambda p: p[axis])
+        mid = len(points) // 2
+        # Node layout: (point, axis, left, right)
+        return (points[mid], axis,
+                self._build(points[:mid], depth + 1),
+                self._build(points[mid + 1:], depth + 1))
+
+    def nearest(self, x, y, exclude=()):
+        """Return (distance, (px, py, key)) of the nearest point whose key is not excluded."""
+        best = [math.inf, None]
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            point, axis, left, right = node
+            if point[2] not in exclude:
+                dist = math.hypot(point[0] - x, point[1] - y)
+                if dist < best[0]:
+                    best[0], best[1] = dist, point
+            diff = (x, y)[axis] - point[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            # Far side is only worth visiting if the splitting line is closer than the best hit
+            if abs(diff) < best[0]:
+                stack.append(far)
+            stack.append(near)
+        return (best[0], best[1]) if best[1] is not None else None
+
+    def within(self, x, y, radius):
+        """Return [(distance, (px, py, key))] for points within radius."""
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            point, axis, left, right = node
+            dist = math.hypot(point[0] - x, point[1] - y)
+            if dist <= radius:
+                found.append((dist, point))
+            diff = (x, y)[axis] - point[axis]
+            if diff - radius <= 0:
+                stack.append(left)
+            if diff + radius >= 0:
+                stack.append(right)
+        return found
+
+def _read_pairs(dxf_path):
+    """Yield (group_code, value) pairs from an ASCII DXF file."""
+    with open(dxf_path, 'r', errors='replace') as f:
+        lines = f.read().splitlines()
+    for i in range(0, len(lines) - 1, 2):
+        try:
+            code = int(lines[i].strip())
+        except ValueError:
+            raise ValueError(f"Not an ASCII DXF file (bad group code at line {i + 1})")
+        yield code, lines[i + 1].strip()
+
+def _split_records(pairs):
+    """Split the pair stream into (record_type, tags) at every group code 0."""
+    records = []
+    for code, value in pairs:
+        if code == 0:
+            records.append((value, []))
+        elif records:
+            records[-1][1].append((code, value))
+    return records
+
+def _first(tags, code, default=None, cast=float):
+    """Return the first value for a group code."""
+    for c, v in tags:
+        if c == code:
+            try:
+                return cast(v)
+            except ValueError:
+                return default
+    return default
+
+def _all(tags, code, cast=float):
+    """Return every value for a group code."""
+    return [cast(v) for c, v in tags if c == code]
+
+def _arc_points(cx, cy, radius, start, sweep, chord_tolerance):
+    """Flatten a circular arc (angles in radians, positive sweep is CCW)."""
+    if radius <= 0:
+        return []
+    ratio = 1 - min(chord_tolerance / radius, 1.0)
+    step = 2 * math.acos(ratio) if ratio < 1 else math.pi / 16
+    segments = max(2, min(720, int(math.ceil(abs(sweep) / step))))
+    return [(cx + radius * math.cos(start + sweep * i / segments),
+             cy + radius * math.sin(start + sweep * i / segments))
+            for i in range(segments + 1)]
+
+def bulge_points(p0, p1, bulge, chord_tolerance):
+    """Flatten a polyline bulge segment; returns points after p0 up to and including p1."""
+    if not bulge:
+        return [p1]
+    chord = math.hypot(p1[0] - p0[0], p1[1] - p0[1])
+    if chord == 0:
+        return [p1]
+    sweep = 4 * math.atan(bulge)
+    radius = chord / (2 * math.sin(abs(sweep) / 2))
+    # Center sits on the chord's perpendicular bisector
+    mx, my = (p0[0] + p1[0]) / 2, (p0[1] + p1[1]) / 2
+    offset = radius * math.cos(sweep / 2) * (1 if bulge > 0 else -1)
+    nx, ny = -(p1[1] - p0[1]) / chord, (p1[0] - p0[0]) / chord
+    cx, cy = mx + nx * offset, my + ny * offset
+    start = math.atan2(p0[1] - cy, p0[0] - cx)
+    points = _arc_points(cx, cy, radius, start, sweep, chord_tolerance)
+    return points[1:-1] + [p1]
+
+def _bulge_path(vertices, closed, chord_tolerance):
+    """Flatten [(x, y, bulge)] vertices into points."""
+    if not vertices:
+        return []
+    points = [vertices[0][:2]]
+    pairs = list(zip(vertices, vertices[1:]))
+    if closed:
+        pairs.append((vertices[-1], vertices[0]))
+    for (x0, y0, bulge), (x1, y1, _) in pairs:
+        points.extend(bulge_points((x0, y0), (x1, y1), bulge, chord_tolerance))
+    if closed and len(points) > 1 and points[-1] == points[0]:
+        points.pop()
+    return points
+
+def _lwpolyline_vertices(tags):
+    """Read LWPOLYLINE vertices in order, attaching bulges to their vertex."""
+    vertices = []
+    x = None
+    for code, value in tags:
+        if code == 10:
+            x = float(value)
+        elif code == 20 and x is not None:
+            vertices.append([x, float(value), 0.0])
+            x = None
+        elif code == 42 and vertices:
+            vertices[-1][2] = float(value)
+    return [tuple(v) for v in vertices]
+
+def _de_boor(span, u, knots, ctrl, degree):
+    """Evaluate one homogeneous B-spline point with de Boor's algorithm."""
+    d = [ctrl[j + span - degree] for j in range(degree + 1)]
+    for r in range(1, degree + 1):
+        for j in range(degree, r - 1, -1):
+            left = knots[j + span - degree]
+            denom = knots[j + 1 + span - r] - left
+            alpha = (u - left) / denom if denom else 0.0
+            d[j] = tuple((1 - alpha) * a + alpha * b for a, b in zip(d[j - 1], d[j]))
+    return d[degree]
+
+def _spline_points(tags, segments, chord_tolerance):
+    """Sample a (rational) SPLINE; falls back to fit points, then control points.
+
+    Each knot span starts with `segments` samples, subdivided until every chord
+    midpoint is within chord_tolerance of the curve.
+    """
+    degree = _first(tags, 71, 3, int)
+    knots = _all(tags, 40)
+    weights = _all(tags, 41)
+    xs, ys = _all(tags, 10), _all(tags, 20)
+    ctrl = list(zip(xs, ys))
+    if len(ctrl) < degree + 1 or len(knots) != len(ctrl) + degree + 1:
+        fit = list(zip(_all(tags, 11), _all(tags, 21)))
+        return fit if len(fit) >= 2 else ctrl
+    if len(weights) != len(ctrl):
+        weights = [1.0] * len(ctrl)
+    homogeneous = [(x * w, y * w, w) for (x, y), w in zip(ctrl, weights)]
+
+    def evaluate(span, u):
+        wx, wy, w = _de_boor(span, u, knots, homogeneous, degree)
+        return wx / w, wy / w
+
+    def refine(span, u0, p0, u1, p1, depth):
+        # Points strictly after p0 up to and including p1
+        um = (u0 + u1) / 2
+        pm = evaluate(span, um)
+        chord = math.hypot(p1[0] - p0[0], p1[1] - p0[1])
+        if chord:
+            sag = abs((p1[0] - p0[0]) * (pm[1] - p0[1]) - (p1[1] - p0[1]) * (pm[0] - p0[0])) / chord
+        else:
+            sag = math.hypot(pm[0] - p0[0], pm[1] - p0[1])
+        if sag <= chord_tolerance or depth >= MAX_SPLINE_DEPTH:
+            return [p1]
+        return refine(span, u0, p0, um, pm, depth + 1) + refine(span, um, pm, u1, p1, depth + 1)
+
+    points = []
+    for span in range(degree, len(ctrl)):
+        u0, u1 = knots[span], knots[span + 1]
+        if u1 <= u0:
+            continue
+        params = [u0 + (u1 - u0) * s / segments for s in range(segments)] + [u1]
+        samples = [evaluate(span, u) for u in params]
+        if not points:
+            points.append(samples[0])
+        for k in range(segments):
+            points.extend(refine(span, params[k], samples[k], params[k + 1], samples[k + 1], 0))
+    return points or ctrl
+
+def _entity_geometry(etype, tags, vertices, profile):
+    """Return (points, closed) for a supported non-INSERT entity, or None."""
+    chord = profile['chord_tolerance']
+    # Arbitrary-axis flip for entities drawn with a -Z extrusion
+    flip = -1.0 if _first(tags, 230, 1.0) < 0 else 1.0
+
+    if etype == 'LINE':
+        return [(_first(tags, 10, 0.0), _first(tags, 20, 0.0)),
+                (_first(tags, 11, 0.0), _first(tags, 21, 0.0))], False
+
+    if etype in ('CIRCLE', 'ARC'):
+        cx, cy = _first(tags, 10, 0.0), _first(tags, 20, 0.0)
+        radius = _first(tags, 40, 0.0)
+        if etype == 'CIRCLE':
+            points = _arc_points(cx, cy, radius, 0.0, 2 * math.pi, chord)[:-1]
+            closed = True
+        else:
+            start = math.radians(_first(tags, 50, 0.0))
+            end = math.radians(_first(tags, 51, 360.0))
+            sweep = (end - start) % (2 * math.pi) or 2 * math.pi
+            points = _arc_points(cx, cy, radius, start, sweep, chord)
+            closed = False
+        return [(x * flip, y) for x, y in points], closed
+
+    if etype == 'ELLIPSE':
+        cx, cy = _first(tags, 10, 0.0), _first(tags, 20, 0.0)
+        mx, my = _first(tags, 11, 1.0), _first(tags, 21, 0.0)
+        ratio = _first(tags, 40, 1.0)
+        t0, t1 = _first(tags, 41, 0.0), _first(tags, 42, 2 * math.pi)
+        sweep = (t1 - t0) % (2 * math.pi) or 2 * math.pi
+        major = math.hypot(mx, my)
+        steps = _arc_points(0.0, 0.0, major, t0, sweep, chord)
+        points = []
+        for px, py in steps:
+            cos_t, sin_t = px / major, py / major
+            points.append((cx + mx * cos_t - my * ratio * sin_t,
+                           cy + my * cos_t + mx * ratio * sin_t))
+        closed = abs(sweep - 2 * math.pi) < 1e-9
+        if closed:
+            points.pop()
+        return [(x * flip, y) for x, y in points], closed
+
+    if etype == 'LWPOLYLINE':
+        closed = bool(_first(tags, 70, 0, int) & 1)
+        points = _bulge_path(_lwpolyline_vertices(tags), closed, chord)
+        return [(x * flip, y) for x, y in points], closed
+
+    if etype == 'POLYLINE':
+        closed = bool(_first(tags, 70, 0, int) & 1)
+        verts = [(_first(v, 10, 0.0), _first(v, 20, 0.0), _first(v, 42, 0.0)) for v in vertices]
+        points = _bulge_path(verts, closed, chord)
+        return [(x * flip, y) for x, y in points], closed
+
+    if etype == 'SPLINE':
+        points = _spline_points(tags, profile['spline_segments'], chord)
+        closed = bool(_first(tags, 70, 0, int) & 1)
+        if closed and len(points) > 2 and points[0] == points[-1]:
+            points.pop()
+        return points, closed
+
+    return None
+
+def _source_vertex_count(etype, tags, vertices, points):
+    """Vertices of an entity as drawn: a bulge polyline's vertices, a spline's control points.
+
+    Lines, arcs and circles count as the two vertices of their bulge-polyline form; ellipses
+    have none, so their flattened points are counted.
+    """
+    if etype in ('LINE', 'ARC', 'CIRCLE'):
+        return 2
+    if etype == 'LWPOLYLINE':
+        return len(_lwpolyline_vertices(tags))
+    if etype == 'POLYLINE':
+        return len(vertices)
+    if etype == 'SPLINE':
+        return len(_all(tags, 10)) or len(points)
+    return len(points)
+
+def _insert_transform(tags, base):
+    """Build the point transform for an INSERT of a block with the given base point."""
+    ix, iy = _first(tags, 10, 0.0), _first(tags, 20, 0.0)
+    sx, sy = _first(tags, 41, 1.0), _first(tags, 42, 1.0)
+    angle = math.radians(_first(tags, 50, 0.0))
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    bx, by = base
+
+    def transform(x, y):
+        x, y = (x - bx) * sx, (y - by) * sy
+        return ix + x * cos_a - y * sin_a, iy + x * sin_a + y * cos_a
+    return transform
+
+def _record_text(kind, tags, vertices, transform=None):
+    """Canonical text of an unsupported record, without its volatile group codes.
+
+    A record drawn through a block reference carries the placement of that reference.
+    """
+    lines = [kind]
+    if transform:
+        corners = [transform(x, y) for x, y in ((0.0, 0.0), (1.0, 0.0), (0.0, 1.0))]
+        lines.append(' '.join(f"{round(v, 6) + 0.0:.6f}" for corner in corners for v in corner))
+    for record in [tags] + vertices:
+        lines.extend(f"{code} {value}" for code, value in record if code not in VOLATILE_CODES)
+    return '\n'.join(lines)
+
+def _collect(store, entities, blocks, profile, transform=None, depth=0):
+    """Flatten entity records into the store, expanding block references."""
+    for etype, tags, vertices in entities:
+        layer = _first(tags, 8, '0', str)
+        handle = _first(tags, 5, '', str)
+        if etype == 'INSERT':
+            block = blocks.get(_first(tags, 2, '', str))
+            if not block or depth >= MAX_BLOCK_DEPTH:
+                continue
+            inner = _insert_transform(tags, block['base'])
+            if transform:
+                outer = transform
+                combined = lambda x, y, inner=inner, outer=outer: outer(*inner(x, y))
+            else:
+                combined = inner
+            _collect(store, block['entities'], blocks, profile, combined, depth + 1)
+            continue
+        kind = etype
+        if etype == 'POLYLINE' and _first(tags, 70, 0, int) & MESH_FLAGS:
+            kind = 'POLYLINE mesh'
+        if kind not in SUPPORTED_ENTITIES:
+            store.unsupported[kind] = store.unsupported.get(kind, 0) + 1
+            store.unsupported_records.append(_record_text(kind, tags, vertices, transform))
+            continue
+        geometry = _entity_geometry(etype, tags, vertices, profile)
+        if not geometry:
+            continue
+        points, closed = geometry
+        if len(points) < 2:
+            continue
+        if transform:
+            points = [transform(x, y) for x, y in points]
+        store.add(etype, layer, handle, points, closed)
+        store.source_nodes += _source_vertex_count(etype, tags, vertices, points)
+
+def read_dxf(dxf_path, profile=None):
+    """Parse an ASCII DXF file into an EntityStore.
+
+    Args:
+        dxf_path: Path to the DXF file
+        profile: The 'geometry' section of the pipeline profile (defaults if omitted)
+    """
+    if profile is None:
+        from pipeline_profile import DEFAULT_PROFILE
+        profile = DEFAULT_PROFILE['geometry']
+
+    records = _split_records(_read_pairs(dxf_path))
+
+    header = {}
+    blocks = {}
+    entities = []
+    section = None
+    target = None
+    for rtype, tags in records:
+        if rtype == 'SECTION':
+            section = _first(tags, 2, None, str)
+            if section == 'HEADER':
+                variable = None
+                for code, value in tags[1:]:
+                    if code == 9:
+                        variable = value
+                    elif variable:
+                        header.setdefault(variable, value)
+            target = entities if section == 'ENTITIES' else None
+            continue
+        if rtype == 'ENDSEC':
+            section, target = None, None
+            continue
+        if section == 'BLOCKS':
+            if rtype == 'BLOCK':
+                block = {'base': (_first(tags, 10, 0.0), _first(tags, 20, 0.0)), 'entities': []}
+                blocks[_first(tags, 2, '', str)] = block
+                target = block['entities']
+                continue
+            if rtype == 'ENDBLK':
+                target = None
+                continue
+        if target is None:
+            continue
+        if rtype == 'VERTEX':
+            if target and target[-1][0] == 'POLYLINE':
+                target[-1][2].append(tags)
+        elif rtype not in NON_DRAWING_RECORDS:
+            target.append((rtype, tags, []))
+
+    store = EntityStore()
+    try:
+        store.units = int(header.get('$INSUNITS', 0))
+    except ValueError:
+        store.units = 0
+    _collect(store, entities, blocks, profile)
+    return store
+
+def chain_entities(store, tolerance, skip=()):
+    """Join open entities whose endpoints touch into chains.
+
+    Closed entities become single closed chains. Chains whose ends meet are marked closed.
+    Entities whose index is in skip are left out.
+    """
+    chains = []
+    grid = GridIndex(tolerance * 4)
+    for i in range(len(store)):
+        if i in skip:
+            continue
+        if store.closed[i]:
+            chains.append(Chain(store.points(i), True, [i], store.layer[i]))
+            continue
+        (sx, sy), (ex, ey) = store.endpoints(i)
+        grid.insert((i, 0), sx, sy)
+        grid.insert((i, 1), ex, ey)
+
+    def take_neighbour(x, y):
+        """Remove and return the nearest unused entity touching (x, y) as (index, reversed)."""
+        best = min(grid.near(x, y, tolerance), default=None)
+        if best is None:
+            return None
+        index, end = best[1]
+        grid.remove((index, 0))
+        grid.remove((index, 1))
+        return index, end == 1
+
+    for i in range(len(store)):
+        if store.closed[i] or (i, 0) not in grid.items:
+            continue
+        grid.remove((i, 0))
+        grid.remove((i, 1))
+        points = store.points(i)
+        members = [i]
+
+        # Grow forward from the tail, then backward from the head
+        while True:
+            found = take_neighbour(*points[-1])
+            if not found:
+                break
+            index, flipped = found
+            extra = store.points(index)
+            if flipped:
+                extra.reverse()
+            points.extend(extra[1:])
+            members.append(index)
+        while True:
+            found = take_neighbour(*points[0])
+            if not found:
+                break
+            index, flipped = found
+            extra = store.points(index)
+            if not flipped:
+                extra.reverse()
+            points[:0] = extra[:-1]
+            members.insert(0, index)
+
+        closed = len(points) > 2 and math.hypot(points[-1][0] - points[0][0],
+                                                points[-1][1] - points[0][1]) <= tolerance
+        if closed:
+            points.pop()
+        chains.append(Chain(points, closed, members, store.layer[i]))
+    return chains
+
+def duplicate_entities(store, tolerance):
+    """{index: earlier index} of entities retracing an earlier one, either way round.
+
+    Points are compared on a grid of tolerance; a closed entity may start anywhere along it.
+    """
+    seen = {}
+    duplicates = {}
+    for i in range(len(store)):
+        points = [(round(x / tolerance), round(y / tolerance)) for x, y in store.points(i)]
+        if store.closed[i]:
+            start = points.index(min(points))
+            points = points[start:] + points[:start]
+            backward = points[:1] + points[:0:-1]
+        else:
+            backward = points[::-1]
+        key = (store.closed[i], min(tuple(points), tuple(backward)))
+        if key in seen:
+            duplicates[i] = seen[key]
+        else:
+            seen[key] = i
+    return duplicates
+
+def _segment_distance(x, y, a, b):
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length2 = dx * dx + dy * dy
+    t = max(0.0, min(1.0, ((x - a[0]) * dx + (y - a[1]) * dy) / length2)) if length2 else 0.0
+    return math.hypot(x - a[0] - t * dx, y - a[1] - t * dy)
+
+def _follows(chain, other, tolerance):
+    """True if sampled points of chain all lie within tolerance of other's path."""
+    path = other.points + other.points[:1] if other.closed else other.points
+    segments = list(zip(path, path[1:])) or [(path[0], path[0])]
+    xs, ys = [x for x, _ in path], [y for _, y in path]
+    cell = max(max(xs) - min(xs), max(ys) - min(ys)) / COINCIDENT_GRID or 1.0
+    buckets = {}
+    for a, b in segments:
+        x0, x1 = sorted((a[0], b[0]))
+        y0, y1 = sorted((a[1], b[1]))
+        for cx in range(math.floor((x0 - tolerance) / cell), math.floor((x1 + tolerance) / cell) + 1):
+            for cy in range(math.floor((y0 - tolerance) / cell), math.floor((y1 + tolerance) / cell) + 1):
+                buckets.setdefault((cx, cy), []).append((a, b))
+    step = max(1, len(chain.points) // COINCIDENT_SAMPLES)
+    for x, y in chain.points[::step]:
+        nearby = buckets.get((math.floor(x / cell), math.floor(y / cell)), ())
+        if min((_segment_distance(x, y, a, b) for a, b in nearby), default=math.inf) > tolerance:
+            return False
+    return True
+
+def coincident_chains(chains, tolerance):
+    """{index: earlier index} of chains tracing the same path as an earlier chain.
+
+    The copies may be split into different entities and flattened differently, so chains
+    with the same closure and extents (within tolerance) are compared point by point.
+    """
+    boxes = [(min(x for x, _ in c.points), min(y for _, y in c.points),
+              max(x for x, _ in c.points), max(y for _, y in c.points)) for c in chains]
+    order = sorted(range(len(chains)), key=lambda k: boxes[k][0])
+    coincident = {}
+    for position, i in enumerate(order):
+        back = position - 1
+        while back >= 0 and boxes[i][0] - boxes[order[back]][0] <= tolerance:
+            j = order[back]
+            back -= 1
+            if j in coincident or chains[i].closed != chains[j].closed:
+                continue
+            if all(abs(p - q) <= tolerance for p, q in zip(boxes[i], boxes[j])) \
+                    and _follows(chains[i], chains[j], tolerance) and _follows(chains[j], chains[i], tolerance):
+                coincident[max(i, j)] = min(i, j)
+                break
+    return coincident
+
+def chain_polylines(chains):
+    """Convert chains to (layer, [(x, y, bulge)], closed) polylines with straight segments."""
+    return [(chain.layer, [(x, y, 0.0) for x, y in chain.points], chain.closed) for chain in chains]
+
+def reverse_polyline(vertices, closed):
+    """Reverse a bulge polyline; each bulge moves to the segment's new start vertex and flips sign."""
+    if closed:
+        # Keep the same start vertex; segment k (v[k] -> v[k+1]) is walked backwards
+        count = len(vertices)
+        order = [0] + list(range(count - 1, 0, -1))
+        return [(vertices[k][0], vertices[k][1], -vertices[(k - 1) % count][2]) for k in order]
+    reversed_vertices = []
+    for k in range(len(vertices) - 1, -1, -1):
+        bulge = -vertices[k - 1][2] if k > 0 else 0.0
+        reversed_vertices.append((vertices[k][0], vertices[k][1], bulge))
+    return reversed_vertices
+
+def point_in_polygon(x, y, polygon):
+    """Even-odd test of a point against a closed list of (x, y) vertices."""
+    inside = False
+    j = len(polygon) - 1
+    for i in range(len(polygon)):
+        xi, yi = polygon[i][0], polygon[i][1]
+        xj, yj = polygon[j][0], polygon[j][1]
+        if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+def format_unsupported(unsupported):
+    """'2 HATCH, 1 MTEXT' for EntityStore.unsupported."""
+    return ', '.join(f"{count} {etype}" for etype, count in sorted(unsupported.items()))
+
+def _fmt(value):
+    return repr(float(value))
+
+def write_dxf(dxf_path, polylines, units=0):
+    """Write polylines as a minimal R12 DXF.
+
+    Args:
+        dxf_path: Output path
+        polylines: Iterable of (layer, [(x, y, bulge), ...], closed)
+        units: $INSUNITS value to carry over
+    """
+    out = ['0', 'SECTION', '2', 'HEADER',
+           '9', '$ACADVER', '1', 'AC1009',
+           '9', '$INSUNITS', '70', str(units),
+           '0', 'ENDSEC',
+           '0', 'SECTION', '2', 'ENTITIES']
+    for layer, vertices, closed in polylines:
+        if len(vertices) == 2 and not closed and not vertices[0][2]:
+            (x0, y0, _), (x1, y1, _) = vertices
+            out += ['0', 'LINE', '8', layer,
+                    '10', _fmt(x0), '20', _fmt(y0), '30', '0.0',
+                    '11', _fmt(x1), '21', _fmt(y1), '31', '0.0']
+            continue
+        out += ['0', 'POLYLINE', '8', layer, '66', '1',
+                '10', '0.0', '20', '0.0', '30', '0.0', '70', '1' if closed else '0']
+        for x, y, bulge in vertices:
+            out += ['0', 'VERTEX', '8', layer, '10', _fmt(x), '20', _fmt(y), '30', '0.0']
+            if bulge:
+                out += ['42', _fmt(bulge)]
+        out += ['0', 'SEQEND', '8', layer]
+    out += ['0', 'ENDSEC', '0', 'EOF']
+    with open(dxf_path, 'w') as f:
+        f.write('\n'.join(out) + '\n')
+
+def main():
+    """Print a summary of the geometry in a DXF file."""
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  python3 dxf_geometry.py <file.dxf>")
+        return
+
+    store = read_dxf(sys.argv[1])
+    kinds = {}
+    for kind in store.kind:
+        kinds[kind] = kinds.get(kind, 0) + 1
+    print(f"\n📐 {Path(sys.argv[1]).name}")
+    print(f"   Entities: {len(store)}  {kinds}")
+    print(f"   Nodes:    {store.node_count()}")
+    extents = store.extents()
+    if extents:
+        print(f"   Extents:  ({extents[0]:.4f}, {extents[1]:.4f}) - ({extents[2]:.4f}, {extents[3]:.4f})")
+    print()
+
+if __name__ == '__main__':
+    main()
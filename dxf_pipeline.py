@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Run the enabled Python geometry stages on a DXF before it is opened in Illustrator.
+Stages are switched on and tuned in the pipeline profile.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from dxf_geometry import chain_entities, chain_polylines, format_unsupported, read_dxf, write_dxf
+from dxf_qa import QARejected
+from pipeline_profile import load_profile
+
+def record_part_stats(dxf_path, profile, store=None):
+    """Measure a part and record its stats in the CC Library index, if stats are enabled.
+
+    The DXF is read unless its store is passed in. Failures to record are printed, not raised.
+    """
+    if not profile['stats']['enabled']:
+        return
+    from dxf_stats import part_stats, format_stats, record_stats
+    if store is None:
+        store = read_dxf(dxf_path, profile['geometry'])
+    stats = part_stats(store, profile)
+    print(f"📏 PART STATS: {format_stats(stats)}")
+    try:
+        record_stats(stats, dxf_path)
+    except Exception as e:
+        print(f"⚠️  Part stats not recorded: {e}")
+
+def prepare_dxf(dxf_path, work_dir, profile=None):
+    """Run the enabled stages and return the DXF path Illustrator should open.
+
+    The original file is returned untouched when no stage rewrites geometry, or when it holds
+    entities the rewritten R12 file could not carry (text, dimensions, hatches).
+    Rewritten geometry is saved under work_dir with the original file name.
+    Stats of parts that pass QA are recorded in the CC Library index (dxf_stats.py).
+    Raises dxf_qa.QARejected when QA fails and the profile rejects failing parts.
+    """
+    if profile is None:
+        profile = load_profile()
+    rewrite = profile['simplify']['enabled'] or profile['cut_order']['enabled']
+    if not (rewrite or profile['qa']['enabled'] or profile['stats']['enabled']):
+        return dxf_path
+
+    store = read_dxf(dxf_path, profile['geometry'])
+    polylines = None
+
+    if profile['qa']['enabled']:
+        from dxf_qa import check_store, format_report, write_report
+        report = check_store(store, profile)
+        report['file'] = os.path.basename(dxf_path)
+        report_path = write_report(report, work_dir, dxf_path)
+        print(f"🔍 GEOMETRY QA: {format_report(report)}")
+        if report['verdict'] == 'fail' and profile['qa']['reject']:
+            raise QARejected(report, report_path)
+
+    record_part_stats(dxf_path, profile, store)
+
+    if not rewrite:
+        return dxf_path
+    if store.unsupported:
+        print(f"⚠️  Node reduction and cut order skipped: the rewrite would drop "
+              f"{format_unsupported(store.unsupported)}")
+        return dxf_path
+
+    if profile['simplify']['enabled']:
+        from dxf_simplify import simplify_store, format_report
+        polylines, report = simplify_store(store, profile)
+        print(f"✂️  NODE REDUCTION: {format_report(report)}")
+
+    if profile['cut_order']['enabled']:
+        from dxf_cut_order import order_polylines, format_report
+        if polylines is None:
+            polylines = chain_polylines(chain_entities(store, profile['geometry']['join_tolerance']))
+        polylines, report = order_polylines(polylines, profile)
+        print(f"🔀 CUT ORDER: {format_report(report)}")
+
+    os.makedirs(work_dir, exist_ok=True)
+    output_path = Path(work_dir) / os.path.basename(dxf_path)
+    write_dxf(output_path, polylines, store.units)
+    return str(output_path)
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  python3 dxf_pipeline.py <input.dxf> [<work_dir>]")
+        return
+
+    work_dir = sys.argv[2] if len(sys.argv) > 2 else Path(__file__).parent / "temp"
+    try:
+        output_path = prepare_dxf(sys.argv[1], work_dir)
+    except QARejected as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"💾 Illustrator input: {output_path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Geometry QA for DXF files, computed in Python before conversion.
+Finds duplicated entities, gaps between dangling contour ends (KD-tree over endpoints) and
+self-intersections or contour crossings and overlaps (x-sweep with a y-binned active set), and
+returns a machine-readable report with coordinates and a pass/fail verdict. Duplicates are
+reported on their own and left out of the other checks, where every segment of a copy
+would otherwise count as an overlap.
+"""
+
+import heapq
+import json
+import sys
+import time
+from pathlib import Path
+
+from dxf_geometry import KDTree, chain_entities, coincident_chains, duplicate_entities, read_dxf
+from pipeline_profile import load_profile
+
+class QARejected(Exception):
+    """Raised when a DXF fails QA and the profile rejects failing parts."""
+
+    def __init__(self, report, report_path):
+        super().__init__(f"geometry QA failed ({format_report(report)}); see {report_path}")
+        self.report = report
+        self.report_path = report_path
+
+def find_gaps(chains, settings):
+    """Pair up dangling endpoints of open chains.
+
+    Returns (gaps, open_ends); a gap joins two endpoints within settings['max_gap'].
+    """
+    endpoints = []
+    for index, chain in enumerate(chains):
+        if chain.closed:
+            continue
+        endpoints.append((chain.points[0][0], chain.points[0][1], (index, 0)))
+        endpoints.append((chain.points[-1][0], chain.points[-1][1], (index, 1)))
+    if not endpoints:
+        return [], []
+
+    tree = KDTree(endpoints)
+    gaps = {}
+    open_ends = []
+    for x, y, key in endpoints:
+        hit = tree.nearest(x, y, exclude=(key,))
+        if hit is None or hit[0] > settings['max_gap']:
+            open_ends.append({'point': [x, y], 'chain': key[0]})
+            continue
+        distance, (px, py, other) = hit
+        pair = tuple(sorted((key, other)))
+        if pair in gaps:
+            continue
+        gaps[pair] = {
+            'from': [x, y],
+            'to': [px, py],
+            'distance': distance,
+            'chains': [key[0], other[0]],
+            'severity': 'warning' if distance <= settings['gap_tolerance'] else 'error'
+        }
+    return sorted(gaps.values(), key=lambda g: -g['distance']), open_ends
+
+def _cross(ax, ay, bx, by):
+    return ax * by - ay * bx
+
+def segment_intersection(a, b, c, d):
+    """Return (point, collinear) where segments ab and cd meet, or None."""
+    rx, ry = b[0] - a[0], b[1] - a[1]
+    sx, sy = d[0] - c[0], d[1] - c[1]
+    qx, qy = c[0] - a[0], c[1] - a[1]
+    denom = _cross(rx, ry, sx, sy)
+    eps = 1e-9
+    if abs(denom) < 1e-15:
+        # Parallel: only collinear overlaps count
+        if abs(_cross(qx, qy, rx, ry)) > 1e-12:
+            return None
+        length2 = rx * rx + ry * ry
+        if length2 == 0:
+            return None
+        t0 = (qx * rx + qy * ry) / length2
+        t1 = t0 + (sx * rx + sy * ry) / length2
+        lo, hi = max(0.0, min(t0, t1)), min(1.0, max(t0, t1))
+        if lo > hi + eps:
+            return None
+        t = (lo + hi) / 2
+        return (a[0] + t * rx, a[1] + t * ry), True
+    t = _cross(qx, qy, sx, sy) / denom
+    u = _cross(qx, qy, rx, ry) / denom
+    if -eps <= t <= 1 + eps and -eps <= u <= 1 + eps:
+        return (a[0] + t * rx, a[1] + t * ry), False
+    return None
+
+def _segments(chains):
+    """Flatten chains into segments as (chain, position, count, closed, p0, p1)."""
+    segments = []
+    for index, chain in enumerate(chains):
+        points = [p for k, p in enumerate(chain.points) if k == 0 or p != chain.points[k - 1]]
+        if chain.closed:
+            if len(points) > 1 and points[-1] == points[0]:
+                points.pop()
+            pairs = list(zip(points, points[1:] + points[:1]))
+        else:
+            pairs = list(zip(points, points[1:]))
+        for position, (p0, p1) in enumerate(pairs):
+            segments.append((index, position, len(pairs), chain.closed, p0, p1))
+    return segments
+
+def _adjacent(s, t):
+    """Consecutive segments of one chain share a vertex by construction."""
+    if s[0] != t[0]:
+        return False
+    gap = abs(s[1] - t[1])
+    return gap <= 1 or (s[3] and gap == s[2] - 1)
+
+def find_intersections(chains, tolerance):
+    """Sweep segments left to right and report crossings between non-adjacent segments."""
+    segments = _segments(chains)
+    if not segments:
+        return []
+    min_x = [min(s[4][0], s[5][0]) for s in segments]
+    max_x = [max(s[4][0], s[5][0]) for s in segments]
+    min_y = [min(s[4][1], s[5][1]) for s in segments]
+    max_y = [max(s[4][1], s[5][1]) for s in segments]
+
+    # Active segments are binned by y so each insertion only meets nearby segments
+    lengths = sorted(max(max_x[i] - min_x[i], max_y[i] - min_y[i]) for i in range(len(segments)))
+    span = max(max_y) - min(min_y)
+    bin_size = max(lengths[len(lengths) // 2], span / 4096, 1e-9)
+
+    active_bins = {}
+    expiry = []
+    found = {}
+    for i in sorted(range(len(segments)), key=lambda k: min_x[k]):
+        while expiry and expiry[0][0] < min_x[i]:
+            _, j = heapq.heappop(expiry)
+            for b in range(int(min_y[j] // bin_size), int(max_y[j] // bin_size) + 1):
+                active_bins[b].discard(j)
+
+        bins = range(int(min_y[i] // bin_size), int(max_y[i] // bin_size) + 1)
+        candidates = set()
+        for b in bins:
+            candidates.update(active_bins.get(b, ()))
+        s = segments[i]
+        for j in candidates:
+            t = segments[j]
+            if max_y[j] < min_y[i] or min_y[j] > max_y[i] or _adjacent(s, t):
+                continue
+            hit = segment_intersection(s[4], s[5], t[4], t[5])
+            if hit is None:
+                continue
+            point, collinear = hit
+            chain_pair = tuple(sorted((s[0], t[0])))
+            if collinear:
+                # Overlapping (e.g. duplicated) contours: one finding per pair
+                key = (chain_pair, 'overlap')
+                kind = 'overlap'
+            else:
+                # Several segments meeting at one vertex collapse into one finding
+                key = (chain_pair, round(point[0] / tolerance), round(point[1] / tolerance))
+                kind = 'self' if s[0] == t[0] else 'crossing'
+            found.setdefault(key, {
+                'point': [point[0], point[1]],
+                'kind': kind,
+                'chains': list(chain_pair)
+            })
+
+        for b in bins:
+            active_bins.setdefault(b, set()).add(i)
+        heapq.heappush(expiry, (max_x[i], i))
+    return list(found.values())
+
+def check_store(store, profile):
+    """Run geometry QA on an EntityStore; returns the report dict."""
+    started = time.monotonic()
+    settings = profile['qa']
+    join_tolerance = profile['geometry']['join_tolerance']
+
+    # Entities and contours drawn twice are reported once here, not as thousands of overlaps
+    copies = duplicate_entities(store, join_tolerance)
+    duplicates = [{'kind': store.kind[i], 'entities': [i], 'duplicate_of': [original],
+                   'point': list(store.endpoints(i)[0])} for i, original in copies.items()]
+    chains = chain_entities(store, join_tolerance, skip=copies)
+    retraced = coincident_chains(chains, join_tolerance + 2 * profile['geometry']['chord_tolerance'])
+    duplicates += [{'kind': 'contour', 'entities': chains[i].entities,
+                    'duplicate_of': chains[original].entities, 'point': list(chains[i].points[0])}
+                   for i, original in retraced.items()]
+    chains = [chain for k, chain in enumerate(chains) if k not in retraced]
+
+    gaps, open_ends = find_gaps(chains, settings)
+    intersections = find_intersections(chains, join_tolerance)
+
+    # An open end landing on another contour is a junction (e.g. a bend line), not a defect
+    junctions = []
+    if open_ends:
+        ends = KDTree((e['point'][0], e['point'][1], k) for k, e in enumerate(open_ends))
+        joined = set()
+        for hit in intersections:
+            if hit['kind'] != 'crossing':
+                continue
+            nearest = ends.nearest(*hit['point'])
+            if nearest and nearest[0] <= join_tolerance and open_ends[nearest[1][2]]['chain'] in hit['chains']:
+                hit['kind'] = 'junction'
+                joined.add(nearest[1][2])
+        junctions = [h for h in intersections if h['kind'] == 'junction']
+        intersections = [h for h in intersections if h['kind'] != 'junction']
+        open_ends = [e for k, e in enumerate(open_ends) if k not in joined]
+
+    gap_errors = sum(1 for g in gaps if g['severity'] == 'error')
+    failures = gap_errors + len(intersections)
+    if settings['fail_on_open']:
+        failures += len(open_ends)
+    if settings['fail_on_duplicates']:
+        failures += len(duplicates)
+    limit = settings['max_reported']
+
+    return {
+        'verdict': 'fail' if failures else 'pass',
+        'units': store.units,
+        'entities': len(store),
+        'chains': len(chains),
+        'closed_chains': sum(1 for c in chains if c.closed),
+        'open_chains': sum(1 for c in chains if not c.closed),
+        'counts': {
+            'gap_errors': gap_errors,
+            'gap_warnings': len(gaps) - gap_errors,
+            'open_ends': len(open_ends),
+            'junctions': len(junctions),
+            'intersections': len(intersections),
+            'duplicates': len(duplicates)
+        },
+        'gaps': gaps[:limit],
+        'open_ends': open_ends[:limit],
+        'intersections': intersections[:limit],
+        'junctions': junctions[:limit],
+        'duplicates': duplicates[:limit],
+        'seconds': round(time.monotonic() - started, 4)
+    }
+
+def write_report(report, work_dir, dxf_path):
+    """Save a report as <work_dir>/<name>.qa.json and return the path."""
+    work_dir = Path(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    report_path = work_dir / f"{Path(dxf_path).stem}.qa.json"
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    return report_path
+
+def check_dxf_file(dxf_path, profile=None):
+    """Parse a DXF file and return its QA report."""
+    if profile is None:
+        profile = load_profile()
+    report = check_store(read_dxf(dxf_path, profile['geometry']), profile)
+    report['file'] = Path(dxf_path).name
+    return report
+
+def format_report(report):
+    """One-line summary of a QA report."""
+    counts = report['counts']
+    icon = "✅" if report['verdict'] == 'pass' else "❌"
+    return (f"{icon} {report['verdict'].upper()}: {report['closed_chains']} closed / "
+            f"{report['open_chains']} open contours, {counts['gap_errors']} gaps "
+            f"(+{counts['gap_warnings']} within tolerance), {counts['open_ends']} open ends, "
+            f"{counts['intersections']} intersections, {counts['junctions']} junctions, "
+            f"{counts['duplicates']} duplicate entities in {report['seconds'] * 1000:.0f}ms")
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  python3 dxf_qa.py <file.dxf> [--json]")
+        print()
+        print("Exits with status 1 when the file fails QA.")
+        return
+
+    report = check_dxf_file(sys.argv[1])
+    if '--json' in sys.argv:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"🔍 {report['file']}: {format_report(report)}")
+        for gap in report['gaps']:
+            print(f"   gap {gap['distance']:.4f} [{gap['severity']}] "
+                  f"({gap['from'][0]:.4f}, {gap['from'][1]:.4f}) → ({gap['to'][0]:.4f}, {gap['to'][1]:.4f})")
+        for end in report['open_ends']:
+            print(f"   open end at ({end['point'][0]:.4f}, {end['point'][1]:.4f})")
+        for hit in report['intersections']:
+            print(f"   {hit['kind']} intersection at ({hit['point'][0]:.4f}, {hit['point'][1]:.4f})")
+        for duplicate in report['duplicates']:
+            print(f"   duplicate {duplicate['kind']} at ({duplicate['point'][0]:.4f}, {duplicate['point'][1]:.4f})")
+    sys.exit(0 if report['verdict'] == 'pass' else 1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Shape descriptor of a DXF part for finding near-duplicates.
+The part's material region (closed contours, holes subtracted) gives Hu's seven moment
+invariants; points spaced evenly along every contour give a histogram of distances from
+the centroid; the hole count and size complete the vector. Moving, rotating or mirroring a
+part leaves its descriptor unchanged, so redrawn copies of a part land close together.
+"""
+
+import math
+import sys
+from pathlib import Path
+
+from pipeline_profile import load_profile
+
+# Bins of the radial histogram
+RADIAL_BINS = 16
+
+# Points sampled along the contours for the radial histogram
+RADIAL_SAMPLES = 512
+
+# Hu invariants below 10^-HU_FLOOR are treated as zero (symmetric parts)
+HU_FLOOR = 20
+
+# Weights of each feature group in the Euclidean distance
+HU_WEIGHT = 1.0
+RADIAL_WEIGHT = 2.0
+HOLES_WEIGHT = 0.5
+SIZE_WEIGHT = 0.25
+
+# 7 Hu invariants, the radial histogram, holes and size (SHAPE_DIMENSIONS in shape_index.py)
+DESCRIPTOR_SIZE = 7 + RADIAL_BINS + 2
+
+def region_moments(contours, depths):
+    """Raw area moments m[p, q] (p + q <= 3) of the region inside the contours.
+
+    Contours at an even nesting depth add material and those at an odd depth remove it,
+    whichever way they wind.
+    """
+    m = dict.fromkeys(((0, 0), (1, 0), (0, 1), (2, 0), (1, 1), (0, 2),
+                       (3, 0), (2, 1), (1, 2), (0, 3)), 0.0)
+    for points, depth in zip(contours, depths):
+        # Green's theorem over each edge
+        s = dict.fromkeys(m, 0.0)
+        x0, y0 = points[-1]
+        for x1, y1 in points:
+            a = x0 * y1 - x1 * y0
+            s[0, 0] += a
+            s[1, 0] += a * (x0 + x1)
+            s[0, 1] += a * (y0 + y1)
+            s[2, 0] += a * (x0 * x0 + x0 * x1 + x1 * x1)
+            s[0, 2] += a * (y0 * y0 + y0 * y1 + y1 * y1)
+            s[1, 1] += a * (x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0)
+            s[3, 0] += a * (x0 + x1) * (x0 * x0 + x1 * x1)
+            s[0, 3] += a * (y0 + y1) * (y0 * y0 + y1 * y1)
+            s[2, 1] += a * (x0 * x0 * (3 * y0 + y1) + 2 * x0 * x1 * (y0 + y1) + x1 * x1 * (y0 + 3 * y1))
+            s[1, 2] += a * (y0 * y0 * (3 * x0 + x1) + 2 * y0 * y1 * (x0 + x1) + y1 * y1 * (x0 + 3 * x1))
+            x0, y0 = x1, y1
+        if not s[0, 0]:
+            continue
+        sign = (1 if s[0, 0] > 0 else -1) * (1 if depth % 2 == 0 else -1)
+        scale = {(0, 0): 2, (1, 0): 6, (0, 1): 6, (2, 0): 12, (0, 2): 12, (1, 1): 24,
+                 (3, 0): 20, (0, 3): 20, (2, 1): 60, (1, 2): 60}
+        for key in m:
+            m[key] += sign * s[key] / scale[key]
+    return m
+
+def hu_invariants(m):
+    """Hu's seven invariants from raw moments, or None for an empty region."""
+    area = m[0, 0]
+    if area <= 0:
+        return None
+    xc, yc = m[1, 0] / area, m[0, 1] / area
+    mu20 = m[2, 0] - xc * m[1, 0]
+    mu02 = m[0, 2] - yc * m[0, 1]
+    mu11 = m[1, 1] - xc * m[0, 1]
+    mu30 = m[3, 0] - 3 * xc * m[2, 0] + 2 * xc * xc * m[1, 0]
+    mu03 = m[0, 3] - 3 * yc * m[0, 2] + 2 * yc * yc * m[0, 1]
+    mu21 = m[2, 1] - 2 * xc * m[1, 1] - yc * m[2, 0] + 2 * xc * xc * m[0, 1]
+    mu12 = m[1, 2] - 2 * yc * m[1, 1] - xc * m[0, 2] + 2 * yc * yc * m[1, 0]
+
+    # Scale-normalized central moments
+    n2, n3 = area ** 2, area ** 2.5
+    e20, e02, e11 = mu20 / n2, mu02 / n2, mu11 / n2
+    e30, e03, e21, e12 = mu30 / n3, mu03 / n3, mu21 / n3, mu12 / n3
+
+    a, b = e30 + e12, e21 + e03
+    c, d = e30 - 3 * e12, 3 * e21 - e03
+    return [
+        e20 + e02,
+        (e20 - e02) ** 2 + 4 * e11 ** 2,
+        c ** 2 + d ** 2,
+        a ** 2 + b ** 2,
+        c * a * (a * a - 3 * b * b) + d * b * (3 * a * a - b * b),
+        (e20 - e02) * (a * a - b * b) + 4 * e11 * a * b,
+        d * a * (a * a - 3 * b * b) - c * b * (3 * a * a - b * b)
+    ]
+
+def radial_histogram(chains, centre):
+    """Share of points, spaced evenly along every chain, in each band of distance from centre.
+
+    Distances are divided by the largest, so the histogram does not depend on size.
+    """
+    paths = [chain.points + chain.points[:1] if chain.closed else chain.points for chain in chains]
+    total = sum(math.hypot(q[0] - p[0], q[1] - p[1]) for path in paths for p, q in zip(path, path[1:]))
+    histogram = [0.0] * RADIAL_BINS
+    if not total:
+        return histogram
+    step = total / RADIAL_SAMPLES
+    cx, cy = centre
+    distances = []
+    carry = 0.0
+    for path in paths:
+        for (x0, y0), (x1, y1) in zip(path, path[1:]):
+            length = math.hypot(x1 - x0, y1 - y0)
+            t = carry
+            while t < length:
+                f = t / length
+                distances.append(math.hypot(x0 + f * (x1 - x0) - cx, y0 + f * (y1 - y0) - cy))
+                t += step
+            carry = t - length
+    farthest = max(distances, default=0.0)
+    if not farthest:
+        return histogram
+    for distance in distances:
+        histogram[min(int(distance / farthest * RADIAL_BINS), RADIAL_BINS - 1)] += 1
+    return [count / len(distances) for count in histogram]
+
+def shape_descriptor(chains, contours, depths, scale=1.0):
+    """Descriptor of a part as a list of DESCRIPTOR_SIZE floats.
+
+    chains are all of the part's chains, contours the points of its closed chains with
+    their nesting depths (dxf_stats.nest_depths); scale converts drawing units to inches.
+    """
+    # Moments about a point inside the part keep third-order terms accurate
+    xs = [x for points in contours for x, _ in points] or [0.0]
+    ys = [y for points in contours for _, y in points] or [0.0]
+    ox, oy = (min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2
+    m = region_moments([[(x - ox, y - oy) for x, y in points] for points in contours], depths)
+    hu = hu_invariants(m) if contours else None
+    if hu is None:
+        # No closed region: the centroid of the outline's points stands in
+        points = [p for chain in chains for p in chain.points] or [(0.0, 0.0)]
+        centre = (sum(p[0] for p in points) / len(points), sum(p[1] for p in points) / len(points))
+        hu = [0.0] * 7
+        area = 0.0
+    else:
+        centre = (ox + m[1, 0] / m[0, 0], oy + m[0, 1] / m[0, 0])
+        area = m[0, 0] * scale * scale
+
+    # Orders of magnitude, so every invariant counts; mirroring flips only the sign of h7
+    features = [HU_WEIGHT * max(0.0, HU_FLOOR + math.log10(abs(h))) / HU_FLOOR if h else 0.0 for h in hu]
+    features += [RADIAL_WEIGHT * share for share in radial_histogram(chains, centre)]
+    holes = sum(1 for depth in depths if depth % 2 == 1)
+    features.append(HOLES_WEIGHT * math.log2(1 + holes) / 8)
+    features.append(SIZE_WEIGHT * math.log10(1 + math.sqrt(area)))
+    return features
+
+def descriptor_distance(a, b):
+    """Euclidean distance between two descriptors."""
+    return math.sqrt(sum((x - y) ** 2 for x, y in zip(a, b)))
+
+def describe_dxf(dxf_path, profile=None):
+    """Parse a DXF file and return its shape descriptor."""
+    from dxf_stats import measure_dxf
+    return measure_dxf(dxf_path, profile)['shape']
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  python3 dxf_shape.py <file.dxf>              # Print the shape descriptor")
+        print("  python3 dxf_shape.py <a.dxf> <b.dxf>...      # Distance of each file from the first")
+        return
+
+    profile = load_profile()
+    first = describe_dxf(sys.argv[1], profile)
+    if len(sys.argv) == 2:
+        print(f"🔷 {Path(sys.argv[1]).name}")
+        print("   " + " ".join(f"{value:.4f}" for value in first))
+        return
+    for other in sys.argv[2:]:
+        distance = descriptor_distance(first, describe_dxf(other, profile))
+        print(f"🔷 {distance:.4f}  {Path(other).name}")
+
+if __name__ == '__main__':
+    main()
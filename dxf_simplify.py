@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Node-count reduction stage for tessellated DXF geometry.
+Chains touching entities, then replaces runs of short segments with arcs (as polyline
+bulges) and thins the remaining vertices with Douglas-Peucker within a max deviation.
+"""
+
+import math
+import sys
+from pathlib import Path
+
+from dxf_geometry import chain_entities, format_unsupported, read_dxf, write_dxf
+from pipeline_profile import load_profile
+
+# Circles fitted through nearly collinear points are treated as straight runs
+MAX_ARC_RADIUS_RATIO = 1000.0
+
+def douglas_peucker(points, tolerance):
+    """Thin an open polyline so no removed vertex deviates more than tolerance."""
+    n = len(points)
+    if n < 3:
+        return list(points)
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        i, j = stack.pop()
+        ax, ay = points[i]
+        bx, by = points[j]
+        dx, dy = bx - ax, by - ay
+        seg = math.hypot(dx, dy)
+        worst, worst_index = -1.0, -1
+        for k in range(i + 1, j):
+            px, py = points[k]
+            if seg:
+                dist = abs(dx * (py - ay) - dy * (px - ax)) / seg
+            else:
+                dist = math.hypot(px - ax, py - ay)
+            if dist > worst:
+                worst, worst_index = dist, k
+        if worst > tolerance:
+            keep[worst_index] = True
+            stack.append((i, worst_index))
+            stack.append((worst_index, j))
+    return [p for p, k in zip(points, keep) if k]
+
+def _circle(a, b, c):
+    """Circle through three points as (cx, cy, r), or None if collinear."""
+    ax, ay = a
+    bx, by = b
+    cx, cy = c
+    d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    if abs(d) < 1e-12:
+        return None
+    a2, b2, c2 = ax * ax + ay * ay, bx * bx + by * by, cx * cx + cy * cy
+    ux = (a2 * (by - cy) + b2 * (cy - ay) + c2 * (ay - by)) / d
+    uy = (a2 * (cx - bx) + b2 * (ax - cx) + c2 * (bx - ax)) / d
+    return ux, uy, math.hypot(ax - ux, ay - uy)
+
+def _arc_bulge(points, i, j, tolerance):
+    """Return the bulge of an arc through points[i..j], or None if they do not fit one."""
+    circle = _circle(points[i], points[(i + j) // 2], points[j])
+    if circle is None:
+        return None
+    cx, cy, radius = circle
+    chord = math.hypot(points[j][0] - points[i][0], points[j][1] - points[i][1])
+    if chord == 0 or radius > MAX_ARC_RADIUS_RATIO * chord:
+        return None
+
+    # Every vertex must sit on the circle and the run must turn one way only
+    sweep = 0.0
+    direction = 0
+    prev = math.atan2(points[i][1] - cy, points[i][0] - cx)
+    for k in range(i + 1, j + 1):
+        px, py = points[k]
+        if abs(math.hypot(px - cx, py - cy) - radius) > tolerance:
+            return None
+        angle = math.atan2(py - cy, px - cx)
+        step = (angle - prev + math.pi) % (2 * math.pi) - math.pi
+        sign = 1 if step > 0 else -1
+        if direction and sign != direction:
+            return None
+        direction = sign
+        # A chord's midpoint must also stay within tolerance of the arc
+        if radius * (1 - math.cos(step / 2)) > tolerance:
+            return None
+        sweep += step
+        prev = angle
+    if abs(sweep) >= 2 * math.pi - 1e-6:
+        return None
+    return math.tan(sweep / 4)
+
+def _longest_arc(points, i, tolerance, min_points):
+    """Find the furthest j so points[i..j] fit one arc; returns (j, bulge) or None."""
+    last = len(points) - 1
+    j = i + min_points - 1
+    if j > last:
+        return None
+    bulge = _arc_bulge(points, i, j, tolerance)
+    if bulge is None:
+        return None
+    best = (j, bulge)
+
+    # Gallop forward, then binary-search the boundary
+    step = min_points
+    lo, hi = j, None
+    while hi is None:
+        probe = min(lo + step, last)
+        if probe == lo:
+            break
+        fitted = _arc_bulge(points, i, probe, tolerance)
+        if fitted is None:
+            hi = probe
+        else:
+            lo, best = probe, (probe, fitted)
+            step *= 2
+    while hi is not None and hi - lo > 1:
+        mid = (lo + hi) // 2
+        fitted = _arc_bulge(points, i, mid, tolerance)
+        if fitted is None:
+            hi = mid
+        else:
+            lo, best = mid, (mid, fitted)
+    return best
+
+def fit_arcs(points, tolerance, min_points):
+    """Convert an open polyline into [(x, y, bulge)] vertices using arcs where they fit."""
+    vertices = []
+
+    def flush(begin, end):
+        # Straight stretch between arcs: Douglas-Peucker, without the final vertex
+        for x, y in douglas_peucker(points[begin:end + 1], tolerance)[:-1]:
+            vertices.append((x, y, 0.0))
+
+    run_start = 0
+    i = 0
+    last = len(points) - 1
+    while i < last:
+        arc = _longest_arc(points, i, tolerance, min_points)
+        if arc is None:
+            i += 1
+            continue
+        j, bulge = arc
+        flush(run_start, i)
+        vertices.append((points[i][0], points[i][1], bulge))
+        i = run_start = j
+    flush(run_start, last)
+    vertices.append((points[last][0], points[last][1], 0.0))
+    return vertices
+
+def simplify_chain(chain, method, tolerance, min_arc_points):
+    """Simplify one chain; returns [(x, y, bulge)] vertices (no repeated closing vertex)."""
+    points = chain.points + chain.points[:1] if chain.closed else list(chain.points)
+    if method == 'arcs':
+        vertices = fit_arcs(points, tolerance, min_arc_points)
+    else:
+        vertices = [(x, y, 0.0) for x, y in douglas_peucker(points, tolerance)]
+    if chain.closed and len(vertices) > 1:
+        # The closing vertex duplicates the first; its outgoing bulge is unused
+        vertices.pop()
+    return vertices
+
+def simplify_store(store, profile):
+    """Simplify an EntityStore using the profile; returns (polylines, report)."""
+    settings = profile['simplify']
+    method = settings['method']
+    tolerance = settings['tolerance']
+    chains = chain_entities(store, profile['geometry']['join_tolerance'])
+
+    polylines = []
+    arcs = 0
+    for chain in chains:
+        vertices = simplify_chain(chain, method, tolerance, settings['min_arc_points'])
+        arcs += sum(1 for v in (vertices if chain.closed else vertices[:-1]) if v[2])
+        polylines.append((chain.layer, vertices, chain.closed))
+
+    report = {
+        'method': method,
+        'tolerance': tolerance,
+        'entities_before': len(store),
+        'paths_after': len(polylines),
+        'nodes_before': store.source_nodes,
+        'nodes_after': sum(len(v) for _, v, _ in polylines),
+        'arcs': arcs,
+        # Entities write_dxf cannot carry into the simplified file
+        'unsupported': dict(store.unsupported)
+    }
+    return polylines, report
+
+def simplify_dxf_file(dxf_path, output_path, profile=None):
+    """Write a simplified copy of a DXF file and return the node-count report."""
+    if profile is None:
+        profile = load_profile()
+    store = read_dxf(dxf_path, profile['geometry'])
+    polylines, report = simplify_store(store, profile)
+    write_dxf(output_path, polylines, store.units)
+    report['output'] = str(output_path)
+    return report
+
+def format_report(report):
+    """One-line summary of a simplification report."""
+    before, after = report['nodes_before'], report['nodes_after']
+    saved = (1 - after / before) * 100 if before else 0.0
+    return (f"{before} → {after} nodes ({saved:.1f}% fewer), "
+            f"{report['entities_before']} entities → {report['paths_after']} paths, "
+            f"{report['arcs']} arcs fitted [{report['method']}, tol {report['tolerance']}]")
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  python3 dxf_simplify.py <input.dxf> [<output.dxf>]")
+        print()
+        print("Tolerance and method come from pipeline_profile.json ('simplify' section).")
+        return
+
+    dxf_path = Path(sys.argv[1])
+    output_path = Path(sys.argv[2]) if len(sys.argv) > 2 else dxf_path.with_name(f"{dxf_path.stem}_simplified.dxf")
+
+    report = simplify_dxf_file(dxf_path, output_path)
+    print(f"✂️  {dxf_path.name}: {format_report(report)}")
+    if report['unsupported']:
+        print(f"⚠️  Not carried into the output: {format_unsupported(report['unsupported'])}")
+    print(f"💾 Output: {output_path}")
+
+if __name__ == '__main__':
+    main()
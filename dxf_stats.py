@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Preflight stats of a DXF part: extents, area, perimeter, entity counts, holes and shape.
+Geometry drawn twice is counted once, then closed contours are nested by containment;
+contours at an even depth are material and those at an odd depth are holes. Lengths are
+converted to inches from $INSUNITS so parts drawn in different units compare, and can be
+recorded in the CC Library index.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from dxf_geometry import chain_entities, coincident_chains, duplicate_entities, point_in_polygon, read_dxf
+from dxf_shape import shape_descriptor
+from pipeline_profile import load_profile
+
+# Inches per drawing unit for the $INSUNITS codes we expect
+INCHES_PER_UNIT = {
+    1: 1.0,             # Inches
+    2: 12.0,            # Feet
+    4: 1 / 25.4,        # Millimetres
+    5: 1 / 2.54,        # Centimetres
+    6: 1000 / 25.4      # Metres
+}
+
+def contour_area(points):
+    """Unsigned shoelace area of a closed contour."""
+    twice = 0.0
+    x0, y0 = points[-1]
+    for x1, y1 in points:
+        twice += x0 * y1 - x1 * y0
+        x0, y0 = x1, y1
+    return abs(twice) / 2
+
+def contour_box(points):
+    return (min(x for x, _ in points), min(y for _, y in points),
+            max(x for x, _ in points), max(y for _, y in points))
+
+def outline_copies(contours, areas, fraction):
+    """{index: kept index} of closed contours repeating the outline of a larger one.
+
+    An outline drawn a second time, say with rounded instead of square corners, is not
+    exactly coincident; contours whose extents agree within fraction of their size and
+    whose areas agree within fraction of the larger are counted once.
+    """
+    boxes = [contour_box(points) for points in contours]
+    kept = []
+    copies = {}
+    for i in sorted(range(len(contours)), key=lambda k: -areas[k]):
+        box = boxes[i]
+        slack = fraction * max(box[2] - box[0], box[3] - box[1])
+        # kept is largest first; only the tail is within fraction of this area
+        for j in reversed(kept):
+            if areas[j] - areas[i] > fraction * areas[j]:
+                break
+            if all(abs(p - q) <= slack for p, q in zip(box, boxes[j])):
+                copies[i] = j
+                break
+        else:
+            kept.append(i)
+    return copies
+
+def nest_depths(contours, areas, tolerance=0.0):
+    """Number of other closed contours enclosing each contour.
+
+    A contour can only lie inside a larger one whose bounding box covers its own (within
+    tolerance, for contours touching their parent), so a single point-in-polygon test per
+    such candidate decides containment.
+    """
+    boxes = [contour_box(points) for points in contours]
+    depths = [0] * len(contours)
+    for i, contour in enumerate(contours):
+        x, y = contour[0]
+        box = boxes[i]
+        for j, other in enumerate(contours):
+            if j == i or areas[j] <= areas[i]:
+                continue
+            outer = boxes[j]
+            if outer[0] - tolerance <= box[0] and outer[1] - tolerance <= box[1] \
+                    and outer[2] + tolerance >= box[2] and outer[3] + tolerance >= box[3] \
+                    and point_in_polygon(x, y, other):
+                depths[i] += 1
+    return depths
+
+def part_stats(store, profile):
+    """Measure an EntityStore; returns the stats dict (lengths in inches)."""
+    units = store.units if store.units in INCHES_PER_UNIT else profile['stats']['default_units']
+    scale = INCHES_PER_UNIT[units]
+    join_tolerance = profile['geometry']['join_tolerance']
+    tolerance = join_tolerance + 2 * profile['geometry']['chord_tolerance']
+
+    # Entities and chains drawn twice (as dxf_qa.py reports them), then doubled outlines
+    copies = duplicate_entities(store, join_tolerance)
+    chains = chain_entities(store, join_tolerance, skip=copies)
+    retraced = coincident_chains(chains, tolerance)
+    chains = [chain for k, chain in enumerate(chains) if k not in retraced]
+    closed = [chain for chain in chains if chain.closed and len(chain.points) > 2]
+    contours = [chain.points for chain in closed]
+    areas = [contour_area(points) for points in contours]
+    doubled = outline_copies(contours, areas, profile['stats']['outline_match'])
+    if doubled:
+        chains = [chain for chain in chains if not any(chain is closed[k] for k in doubled)]
+        closed = [chain for k, chain in enumerate(closed) if k not in doubled]
+        contours = [chain.points for chain in closed]
+        areas = [area for k, area in enumerate(areas) if k not in doubled]
+    depths = nest_depths(contours, areas, tolerance)
+    outer = [k for k, depth in enumerate(depths) if depth == 0]
+
+    kinds = {}
+    for kind in store.kind:
+        kinds[kind] = kinds.get(kind, 0) + 1
+    extents = store.extents() or (0.0, 0.0, 0.0, 0.0)
+    min_x, min_y, max_x, max_y = (value * scale for value in extents)
+    # Material: outlines minus holes plus islands inside holes
+    area = sum(areas[k] if depth % 2 == 0 else -areas[k] for k, depth in enumerate(depths)) * scale ** 2
+
+    return {
+        'units': store.units,
+        'width': max_x - min_x,
+        'height': max_y - min_y,
+        'extents': [min_x, min_y, max_x, max_y],
+        'area': area,
+        # Overlapping outlines the dedupe missed can make the area exceed the extents
+        'area_ok': area <= (max_x - min_x) * (max_y - min_y) * (1 + 1e-9),
+        'perimeter': sum(closed[k].length() for k in outer) * scale,
+        'cut_length': sum(chain.length() for chain in chains) * scale,
+        'entities': len(store),
+        'entity_counts': kinds,
+        'nodes': store.node_count(),
+        'contours': len(contours),
+        'open_contours': len(chains) - len(contours),
+        'holes': sum(1 for depth in depths if depth % 2 == 1),
+        'duplicates': len(copies) + len(retraced) + len(doubled),
+        # Descriptor for near-duplicate search (dxf_shape.py)
+        'shape': shape_descriptor(chains, contours, depths, scale)
+    }
+
+def measure_dxf(dxf_path, profile=None):
+    """Parse a DXF file and return its stats."""
+    if profile is None:
+        profile = load_profile()
+    return part_stats(read_dxf(dxf_path, profile['geometry']), profile)
+
+def record_stats(stats, dxf_path, db_path=None):
+    """Store stats for the part in the CC Library index; returns its part key.
+
+    Raises ValueError for stats whose area exceeds the extents, which would mislead area searches.
+    """
+    if not stats['area_ok']:
+        raise ValueError(f"area {stats['area']:.2f} sq in exceeds the {stats['width']:.2f} x "
+                         f"{stats['height']:.2f} in extents")
+    sys.path.insert(0, str(Path(__file__).parent / "DXFya3toCCLibrary"))
+    from part_geometry import record_part_geometry
+    return record_part_geometry(stats, Path(dxf_path).name, db_path)
+
+def format_stats(stats):
+    """One-line summary of part stats."""
+    summary = (f"{stats['width']:.2f} x {stats['height']:.2f} in, area {stats['area']:.2f} sq in, "
+               f"perimeter {stats['perimeter']:.2f} in, {stats['contours']} contours "
+               f"({stats['holes']} holes, {stats['open_contours']} open), {stats['entities']} entities")
+    if stats['duplicates']:
+        summary += f", {stats['duplicates']} drawn twice"
+    if not stats['area_ok']:
+        summary += " ⚠️ area exceeds extents"
+    return summary
+
+def main():
+    """Command-line interface."""
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if not args:
+        print("Usage:")
+        print("  python3 dxf_stats.py <file.dxf>... [--json]   # Measure parts")
+        print("  python3 dxf_stats.py <file.dxf>... --record   # Measure and store in the CC Library index")
+        return
+
+    profile = load_profile()
+    for dxf_path in args:
+        stats = measure_dxf(dxf_path, profile)
+        if '--json' in sys.argv:
+            stats['shape'] = [round(value, 5) for value in stats['shape']]
+            print(json.dumps({'file': Path(dxf_path).name, **stats}, indent=2))
+        else:
+            print(f"📏 {Path(dxf_path).name}: {format_stats(stats)}")
+        if '--record' in sys.argv:
+            try:
+                print(f"   💾 Recorded as {record_stats(stats, dxf_path)}")
+            except (ValueError, OSError) as e:
+                print(f"   ⚠️  Not recorded: {e}")
+
+if __name__ == '__main__':
+    main()
@@ -6,12 +6,25 @@ Uses AppleScript to control Illustrator, run canvas size checks, and perform lay
 Version 3.1: All alerts and prompts removed - fully automated workflow.
 """
 
+import json
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 import time
 
+from dxf_diff import diff_dxf_files, format_summary
+from dxf_fingerprint import fingerprint_dxf
+from dxf_pipeline import prepare_dxf, record_part_stats
+from dxf_qa import QARejected
+from job_journal import find_previous_revision, find_reusable, open_journal, record_job
+from pipeline_profile import load_profile, output_key
+
+# CC Library lookup service client (answers from memory when element_lookup.py is serving)
+sys.path.insert(0, str(Path(__file__).parent / "DXFya3toCCLibrary"))
+from element_lookup import lookup_elements
+
 def check_illustrator_running():
     """Check if Adobe Illustrator is running."""
     try:
@@ -32,14 +45,197 @@ def launch_illustrator():
         print(f"Error launching Illustrator: {e}")
         return False
 
-def convert_dxf_to_ai(dxf_path, ai_path):
-    """Convert a DXF file to AI format using AppleScript."""
+def wait_for_index_watcher(cclib_dir, max_wait=10):
+    """Return the CC Library index generation when index_watcher.py is keeping it current.
+    
+    Waits up to max_wait seconds for changes the watcher is still debouncing. Returns None
+    when no watcher is running (or it stays busy), in which case `cclib update` is run instead;
+    that waits on the index writer lock, so it never runs alongside the watcher's update.
+    """
+    state_file = cclib_dir / "index_watcher.json"
+    deadline = time.time() + max_wait
+    while True:
+        try:
+            with open(state_file) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() * 1000 - state.get('heartbeat_at', 0) > state.get('stale_after_ms', 0):
+            return None
+        if not state.get('pending'):
+            return state.get('generation')
+        if time.time() >= deadline:
+            return None
+        time.sleep(0.5)
+
+def update_cc_library(dxf_path, ai_path, diff_summary=None, cc_lookup=None):
+    """Push a converted .ai to the matching CC Library file, if there is one.
+
+    Runs after every successful conversion, including reused ones. cc_lookup is this file's
+    lookup_elements() result when the batch already looked it up; None looks it up here.
+    """
+    script_dir = Path(__file__).parent
+    
+    print("🔍 Checking for matching Creative Cloud Library file...")
+    
+    # First, make sure the CC Library database is current
+    cclib_dir = script_dir / "DXFya3toCCLibrary"
+    cclib_cmd = cclib_dir / "cclib"
+    watcher_generation = wait_for_index_watcher(cclib_dir)
+    
+    if watcher_generation is not None:
+        print(f"📊 CC Library database kept current by index watcher (generation {watcher_generation})")
+    elif cclib_cmd.exists():
+        print("📊 Updating CC Library database...")
+        try:
+            update_result = subprocess.run([
+                str(cclib_cmd), 'update'
+            ], capture_output=True, text=True, timeout=60, cwd=str(cclib_dir))
+            
+            if update_result.returncode == 0:
+                # Extract just the summary line
+                output_lines = update_result.stdout.strip().split('\n')
+                for line in output_lines:
+                    if 'Total libraries:' in line or 'Total elements:' in line:
+                        print(f"   {line.strip()}")
+                print("✅ CC Library database updated")
+            else:
+                print("⚠️  CC Library database update had issues (continuing anyway)")
+        except subprocess.TimeoutExpired:
+            print("⚠️  CC Library database update timed out (continuing anyway)")
+        except Exception as e:
+            print(f"⚠️  CC Library database update failed: {e} (continuing anyway)")
+    
+    # Extract base filename (without extension)
+    base_filename = os.path.splitext(os.path.basename(dxf_path))[0]
+    
+    # Path to the CC Library update script
+    cc_update_script = script_dir / "DXFya3toCCLibrary" / "update_cc_library_file.py"
+    
+    # A running lookup service can rule out a match without starting the update script
+    if cc_lookup is None:
+        cc_lookup = lookup_elements([base_filename])
+    if cc_lookup == [None]:
+        print("ℹ️  No matching CC Library file found (this is normal if file isn't in CC)")
+    elif cc_update_script.exists():
+        try:
+            cc_args = ['python3', str(cc_update_script), str(ai_path), base_filename]
+            if diff_summary:
+                cc_args.append(diff_summary)
+            cc_result = subprocess.run(cc_args, capture_output=True, text=True, timeout=120)
+            
+            # Display output
+            if cc_result.stdout.strip():
+                for line in cc_result.stdout.strip().split('\n'):
+                    print(f"   {line}")
+            
+            if cc_result.returncode == 0 and "SUCCESS:" in cc_result.stdout:
+                print("☁️  CC Library file updated successfully")
+            elif "No matching file found" in cc_result.stdout:
+                print("ℹ️  No matching CC Library file found (this is normal if file isn't in CC)")
+            else:
+                print("⚠️  CC Library update had issues (continuing anyway)")
+                
+        except subprocess.TimeoutExpired:
+            print("⚠️  CC Library update timed out (continuing anyway)")
+        except Exception as e:
+            print(f"⚠️  CC Library update failed: {e} (continuing anyway)")
+    else:
+        print("ℹ️  CC Library integration not installed (skipping)")
+
+def reuse_conversion(prior_ai, dxf_path, ai_path, profile, cc_lookup=None):
+    """Copy a prior .ai into place and run the steps a fresh conversion runs after it."""
+    if os.path.abspath(prior_ai) != os.path.abspath(ai_path):
+        os.makedirs(os.path.dirname(ai_path), exist_ok=True)
+        shutil.copy2(prior_ai, ai_path)
+    record_part_stats(dxf_path, profile)
+    update_cc_library(dxf_path, ai_path, cc_lookup=cc_lookup)
+
+def convert_dxf_to_ai(dxf_path, ai_path, cc_lookup=None):
+    """Convert a DXF file to AI format, reusing a prior .ai for equivalent geometry.
+
+    cc_lookup is passed on to update_cc_library().
+    """
+    profile = load_profile()
+    settings = profile['journal']
+    if not settings['enabled']:
+        return convert_with_illustrator(dxf_path, ai_path, profile, cc_lookup=cc_lookup)
+    
+    # Re-exported parts (new handles, entity order, timestamps) keep the same fingerprint
+    journal = None
+    fingerprint = None
+    # A prior .ai is only equivalent if the same rewrite settings produced it
+    profile_key = output_key(profile)
+    try:
+        journal = open_journal()
+        fingerprint = fingerprint_dxf(dxf_path, profile)
+        print(f"🔑 Geometry fingerprint: {fingerprint[:16]}")
+    except Exception as e:
+        print(f"⚠️  Job journal unavailable: {e} (converting without it)")
+    
+    if journal and fingerprint and settings['reuse']:
+        prior_ai = find_reusable(journal, fingerprint, profile_key)
+        if prior_ai:
+            print(f"♻️  Equivalent geometry already converted, reusing: {prior_ai}")
+            reuse_conversion(prior_ai, dxf_path, ai_path, profile, cc_lookup)
+            record_job(journal, dxf_path, fingerprint, ai_path, 'reused', prior_ai, profile_key)
+            journal.close()
+            return True, "Reused prior conversion"
+    
+    # Revised copies of a part ("copy 2") are diffed against the last converted revision
+    diff_summary = None
+    if journal and fingerprint and profile['diff']['enabled']:
+        try:
+            previous = find_previous_revision(journal, dxf_path)
+            if previous:
+                diff = diff_dxf_files(previous['snapshot'], dxf_path, profile)
+                diff['old'] = previous['dxf_name']
+                diff_path = Path(__file__).parent / "temp" / f"{Path(dxf_path).stem}.diff.json"
+                os.makedirs(diff_path.parent, exist_ok=True)
+                with open(diff_path, 'w') as f:
+                    json.dump(diff, f, indent=2)
+                print(f"🧮 DIFF vs {previous['dxf_name']}: {format_summary(diff)}")
+                prior_ai = previous['ai_path']
+                if diff['empty'] and prior_ai and os.path.exists(prior_ai) \
+                        and previous['profile_key'] == profile_key:
+                    print(f"♻️  No geometry changes, reusing: {prior_ai}")
+                    reuse_conversion(prior_ai, dxf_path, ai_path, profile, cc_lookup)
+                    record_job(journal, dxf_path, fingerprint, ai_path, 'reused', prior_ai, profile_key)
+                    journal.close()
+                    return True, "No geometry changes since previous revision"
+                diff_summary = f"vs {previous['dxf_name']}: {format_summary(diff)}"
+        except Exception as e:
+            print(f"⚠️  Revision diff failed: {e} (converting anyway)")
+    
+    success, message = convert_with_illustrator(dxf_path, ai_path, profile, diff_summary, cc_lookup)
+    if journal:
+        record_job(journal, dxf_path, fingerprint, ai_path if success else None,
+                   'converted' if success else 'failed', message, profile_key)
+        journal.close()
+    return success, message
+
+def convert_with_illustrator(dxf_path, ai_path, profile, diff_summary=None, cc_lookup=None):
+    """Convert a DXF file to AI format using AppleScript.
+
+    diff_summary, when given, and cc_lookup are passed on to the CC Library update.
+    """
     
     # Ensure AI directory exists
     os.makedirs(os.path.dirname(ai_path), exist_ok=True)
     
+    script_dir = Path(__file__).parent
+    
+    # Python geometry stages (QA, node reduction, cut order) may hand Illustrator a rewritten copy
+    open_path = dxf_path
+    try:
+        open_path = prepare_dxf(dxf_path, script_dir / "temp", profile)
+    except QARejected as e:
+        return False, f"Rejected by {e}"
+    except Exception as e:
+        print(f"⚠️  Geometry stages failed: {e} (opening original DXF)")
+    
     # Use a single-line AppleScript approach
-    applescript = f'tell application "Adobe Illustrator" to set doc to open POSIX file "{dxf_path}"'
+    applescript = f'tell application "Adobe Illustrator" to set doc to open POSIX file "{open_path}"'
     
     try:
         # First, open the DXF file
@@ -108,7 +304,6 @@ def convert_dxf_to_ai(dxf_path, ai_path):
             print("Canvas check timed out, but continuing with conversion")
         
         # Second action: Move objects directly to new timestamped layer
-        script_dir = Path(__file__).parent
         test_script_path = script_dir / "test_move_objects.jsx"
         
         layer_duplication_script = f'''
@@ -449,65 +644,7 @@ def convert_dxf_to_ai(dxf_path, ai_path):
         # Check if the AI file was actually created
         if os.path.exists(ai_path):
             # Ninth action: Update Creative Cloud Library file if it exists
-            print("🔍 Checking for matching Creative Cloud Library file...")
-            
-            # First, update the CC Library database to ensure we have the latest
-            cclib_dir = script_dir / "DXFya3toCCLibrary"
-            cclib_cmd = cclib_dir / "cclib"
-            
-            if cclib_cmd.exists():
-                print("📊 Updating CC Library database...")
-                try:
-                    update_result = subprocess.run([
-                        str(cclib_cmd), 'update'
-                    ], capture_output=True, text=True, timeout=60, cwd=str(cclib_dir))
-                    
-                    if update_result.returncode == 0:
-                        # Extract just the summary line
-                        output_lines = update_result.stdout.strip().split('\n')
-                        for line in output_lines:
-                            if 'Total libraries:' in line or 'Total elements:' in line:
-                                print(f"   {line.strip()}")
-                        print("✅ CC Library database updated")
-                    else:
-                        print("⚠️  CC Library database update had issues (continuing anyway)")
-                except subprocess.TimeoutExpired:
-                    print("⚠️  CC Library database update timed out (continuing anyway)")
-                except Exception as e:
-                    print(f"⚠️  CC Library database update failed: {e} (continuing anyway)")
-            
-            # Extract base filename (without extension)
-            base_filename = os.path.splitext(os.path.basename(dxf_path))[0]
-            
-            # Path to the CC Library update script
-            cc_update_script = script_dir / "DXFya3toCCLibrary" / "update_cc_library_file.py"
-            
-            if cc_update_script.exists():
-                try:
-                    cc_result = subprocess.run([
-                        'python3', str(cc_update_script), 
-                        str(ai_path), 
-                        base_filename
-                    ], capture_output=True, text=True, timeout=120)
-                    
-                    # Display output
-                    if cc_result.stdout.strip():
-                        for line in cc_result.stdout.strip().split('\n'):
-                            print(f"   {line}")
-                    
-                    if cc_result.returncode == 0 and "SUCCESS:" in cc_result.stdout:
-                        print("☁️  CC Library file updated successfully")
-                    elif "No matching file found" in cc_result.stdout:
-                        print("ℹ️  No matching CC Library file found (this is normal if file isn't in CC)")
-                    else:
-                        print("⚠️  CC Library update had issues (continuing anyway)")
-                        
-                except subprocess.TimeoutExpired:
-                    print("⚠️  CC Library update timed out (continuing anyway)")
-                except Exception as e:
-                    print(f"⚠️  CC Library update failed: {e} (continuing anyway)")
-            else:
-                print("ℹ️  CC Library integration not installed (skipping)")
+            update_cc_library(dxf_path, ai_path, diff_summary, cc_lookup)
             
             return True, "Success"
         else:
@@ -612,11 +749,17 @@ def main():
             print("Failed to launch Adobe Illustrator. Please launch it manually and try again.")
             return
     
+    # One batched lookup for the whole queue when the lookup service is running; each file's
+    # CC Library step reuses its entry
+    cc_matches = lookup_elements([os.path.splitext(os.path.basename(f))[0] for f in dxf_files])
+    if cc_matches is not None:
+        print(f"☁️  {sum(1 for m in cc_matches if m)} of {len(dxf_files)} file(s) have a CC Library match")
+    
     # Process each DXF file
     successful_conversions = 0
     failed_conversions = 0
     
-    for dxf_file in dxf_files:
+    for i, dxf_file in enumerate(dxf_files):
         filename = os.path.basename(dxf_file)
         name_without_ext = os.path.splitext(filename)[0]
         ai_file = ai_folder / f"{name_without_ext}.ai"
@@ -624,7 +767,8 @@ def main():
         print(f"\nProcessing: {filename}")
         print(f"Output: {ai_file}")
         
-        success, message = convert_dxf_to_ai(str(dxf_file), str(ai_file))
+        cc_lookup = [cc_matches[i]] if cc_matches is not None else None
+        success, message = convert_dxf_to_ai(str(dxf_file), str(ai_file), cc_lookup)
         
         if success:
             print(f"✓ Successfully converted: {filename}")
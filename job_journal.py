@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Job journal for DXF conversions.
+Records every conversion with its geometry fingerprint so a re-exported part can reuse
+the .ai produced for an equivalent file instead of going through Illustrator again. A .ai is
+only reused when it was made with the same rewrite settings (pipeline_profile.output_key).
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Re-export suffixes that do not change which part a file is ("RT003002_cut copy 2"),
+# shared with the CC Library part keys
+sys.path.insert(0, str(Path(__file__).parent / "DXFya3toCCLibrary"))
+from part_keys import COPY_MARKERS
+
+# Journal database path
+JOURNAL_PATH = Path(__file__).parent / "job_journal.db"
+
+# Copies of converted DXFs, named by fingerprint, for diffing later revisions
+SNAPSHOT_DIR = Path(__file__).parent / "temp" / "journal"
+
+def part_key(dxf_name):
+    """Name shared by every revision of a part."""
+    stem = os.path.splitext(os.path.basename(dxf_name))[0]
+    return COPY_MARKERS.sub('', stem).strip().lower()
+
+def snapshot_path(fingerprint):
+    """Where the DXF converted for a fingerprint is kept."""
+    return SNAPSHOT_DIR / f"{fingerprint}.dxf"
+
+def open_journal(path=None):
+    """Open the journal database, creating the schema if needed."""
+    conn = sqlite3.connect(path or JOURNAL_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            dxf_name TEXT NOT NULL,
+            dxf_path TEXT NOT NULL,
+            part_key TEXT,
+            fingerprint TEXT,
+            -- pipeline_profile.output_key() of the settings the .ai was made with
+            profile_key TEXT,
+            ai_path TEXT,
+            status TEXT NOT NULL,
+            message TEXT,
+            finished_at INTEGER NOT NULL
+        )
+    ''')
+    columns = {row[1] for row in cursor.execute('PRAGMA table_info(jobs)')}
+    if 'part_key' not in columns:
+        cursor.execute('ALTER TABLE jobs ADD COLUMN part_key TEXT')
+    if 'profile_key' not in columns:
+        cursor.execute('ALTER TABLE jobs ADD COLUMN profile_key TEXT')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_fingerprint ON jobs(fingerprint, finished_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_name ON jobs(dxf_name, finished_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_part ON jobs(part_key, finished_at)')
+
+    conn.commit()
+    return conn
+
+def record_job(conn, dxf_path, fingerprint, ai_path, status, message='', profile_key=None):
+    """Append one job outcome ('converted', 'reused' or 'failed').
+
+    Converted DXFs are snapshotted so the next revision of the part can be diffed.
+    """
+    if status == 'converted' and fingerprint and not snapshot_path(fingerprint).exists():
+        SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(dxf_path, snapshot_path(fingerprint))
+    conn.execute('''
+        INSERT INTO jobs (dxf_name, dxf_path, part_key, fingerprint, profile_key, ai_path, status,
+                          message, finished_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (os.path.basename(dxf_path), str(dxf_path), part_key(dxf_path), fingerprint, profile_key,
+          str(ai_path) if ai_path else None, status, message, int(time.time() * 1000)))
+    conn.commit()
+
+def find_reusable(conn, fingerprint, profile_key):
+    """Return the newest .ai converted from equivalent geometry with the same settings, or None.
+
+    Jobs recorded before settings were keyed are never reused.
+    """
+    cursor = conn.execute('''
+        SELECT ai_path FROM jobs
+        WHERE fingerprint = ? AND profile_key = ? AND status IN ('converted', 'reused')
+        ORDER BY finished_at DESC
+    ''', (fingerprint, profile_key))
+    for (ai_path,) in cursor:
+        if ai_path and os.path.exists(ai_path):
+            return ai_path
+    return None
+
+def find_previous_revision(conn, dxf_path):
+    """Return the newest successful job for the same part that has a snapshot, or None.
+
+    The result is a dict with dxf_name, fingerprint, profile_key, ai_path and snapshot.
+    """
+    cursor = conn.execute('''
+        SELECT dxf_name, fingerprint, profile_key, ai_path FROM jobs
+        WHERE part_key = ? AND status IN ('converted', 'reused') AND fingerprint IS NOT NULL
+        ORDER BY finished_at DESC
+    ''', (part_key(dxf_path),))
+    for dxf_name, fingerprint, profile_key, ai_path in cursor:
+        snapshot = snapshot_path(fingerprint)
+        if snapshot.exists():
+            return {'dxf_name': dxf_name, 'fingerprint': fingerprint, 'profile_key': profile_key,
+                    'ai_path': ai_path, 'snapshot': str(snapshot)}
+    return None
+
+def recent_jobs(conn, limit=20):
+    """Return the newest journal rows as dicts."""
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute('SELECT * FROM jobs ORDER BY finished_at DESC LIMIT ?', (limit,)).fetchall()
+    conn.row_factory = None
+    return [dict(row) for row in rows]
+
+def main():
+    """Command-line interface."""
+    if len(sys.argv) < 2 or sys.argv[1] not in ('list', 'find'):
+        print("Usage:")
+        print("  python3 job_journal.py list [<count>]   # Recent conversions")
+        print("  python3 job_journal.py find <file.dxf>  # Prior .ai for equivalent geometry")
+        return
+
+    conn = open_journal()
+    if sys.argv[1] == 'list':
+        limit = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+        for job in recent_jobs(conn, limit):
+            when = datetime.fromtimestamp(job['finished_at'] / 1000).strftime('%Y-%m-%d %H:%M:%S')
+            fingerprint = (job['fingerprint'] or '-')[:12]
+            print(f"{when}  {job['status']:<9} {fingerprint:<12}  {job['dxf_name']}")
+    else:
+        if len(sys.argv) < 3:
+            print("❌ Error: find requires a DXF path")
+            sys.exit(1)
+        from dxf_fingerprint import fingerprint_dxf
+        from pipeline_profile import load_profile, output_key
+        profile = load_profile()
+        fingerprint = fingerprint_dxf(sys.argv[2], profile)
+        ai_path = find_reusable(conn, fingerprint, output_key(profile))
+        print(f"🔑 Fingerprint: {fingerprint}")
+        print(f"♻️  Reusable AI: {ai_path}" if ai_path else "ℹ️  No prior conversion of this geometry")
+    conn.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Pipeline profile for the Python-side DXF stages.
+Defaults live here; overrides are read from pipeline_profile.json next to this script.
+"""
+
+import copy
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+# Profile overrides path
+PROFILE_PATH = Path(__file__).parent / "pipeline_profile.json"
+
+# All lengths are in DXF drawing units
+DEFAULT_PROFILE = {
+    'geometry': {
+        'chord_tolerance': 0.001,    # Max deviation when flattening arcs/splines
+        'join_tolerance': 0.001,     # Endpoints closer than this are chained
+        'spline_segments': 4         # Initial samples per spline knot span before refinement
+    },
+    'simplify': {
+        'enabled': False,
+        'method': 'arcs',            # 'arcs' (arc fitting + Douglas-Peucker) or 'douglas-peucker'
+        'tolerance': 0.002,          # Max deviation from the original geometry
+        'min_arc_points': 5          # Shortest vertex run replaced by a single arc
+    },
+    'cut_order': {
+        'enabled': False,
+        'start_point': [0.0, 0.0],   # Laser head position before the first cut
+        'inner_first': True,         # Cut contours before the contour that contains them
+        'time_budget': 2.0           # Seconds allowed for 2-opt improvement
+    },
+    'qa': {
+        'enabled': False,
+        'reject': True,              # Skip conversion when the verdict is 'fail'
+        'gap_tolerance': 0.01,       # Gaps up to this size are warnings, larger ones errors
+        'max_gap': 1.0,              # Search radius for a dangling end's partner
+        'fail_on_open': True,        # Dangling ends with no partner fail the part
+        'fail_on_duplicates': False, # Entities drawn twice fail the part (else they are only reported)
+        'max_reported': 100          # Findings listed per category (counts are always complete)
+    },
+    'journal': {
+        'enabled': True,             # Record conversions with their geometry fingerprint
+        'reuse': True,               # Copy the prior .ai when equivalent geometry was converted before
+        'quantum': 0.001             # Coordinate grid used by the fingerprint
+    },
+    'stats': {
+        'enabled': True,             # Measure each part and record it in the CC Library index
+        'default_units': 4,          # $INSUNITS assumed for unitless drawings (1 = inches, 4 = millimetres)
+        'outline_match': 0.01        # Closed contours with extents and area this close (fraction) are one outline drawn twice
+    },
+    'diff': {
+        'enabled': True,             # Diff against the previous revision of the same part
+        'tolerance': 0.002,          # Entities within this distance of their old position are unchanged
+        'max_reported': 100          # Entities listed per category (counts are always complete)
+    }
+}
+
+# Stages that rewrite the DXF Illustrator opens, so their settings shape the .ai
+REWRITE_SECTIONS = ('simplify', 'cut_order')
+
+def output_key(profile):
+    """Digest of the settings that change the converted .ai for the same input geometry.
+
+    Only enabled rewrite stages count, with the flattening settings they work from.
+    """
+    sections = {name: profile[name] for name in REWRITE_SECTIONS if profile[name]['enabled']}
+    if sections:
+        sections['geometry'] = profile['geometry']
+    return hashlib.sha256(json.dumps(sections, sort_keys=True).encode()).hexdigest()[:16]
+
+def _merge(base, overrides):
+    """Recursively merge override values into a copy of base."""
+    merged = copy.deepcopy(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def load_profile(path=None):
+    """Load the pipeline profile, falling back to defaults."""
+    profile_path = Path(path) if path else PROFILE_PATH
+    if not profile_path.exists():
+        return copy.deepcopy(DEFAULT_PROFILE)
+    try:
+        with open(profile_path) as f:
+            overrides = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"⚠️  Could not read {profile_path.name}: {e} (using defaults)")
+        return copy.deepcopy(DEFAULT_PROFILE)
+    return _merge(DEFAULT_PROFILE, overrides)
+
+def main():
+    """Print the effective profile."""
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    print(json.dumps(load_profile(path), indent=2))
+
+if __name__ == '__main__':
+    main()